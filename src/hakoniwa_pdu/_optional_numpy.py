@@ -0,0 +1,25 @@
+"""Optional numpy loader.
+
+numpy is only needed for the opt-in array views of the PDU converters, so the
+package must stay importable without it. It is also imported lazily: importing
+numpy takes longer than importing the rest of the package, and most CLI tools
+never touch an array view. Call :func:`require_numpy` where it is needed.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+
+_numpy = None
+
+
+def require_numpy():
+    global _numpy
+    if _numpy is None:
+        try:
+            _numpy = import_module("numpy")
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "No module named 'numpy'. Install numpy (pip install hakoniwa-pdu[numpy]) to use numpy array views."
+            ) from None
+    return _numpy
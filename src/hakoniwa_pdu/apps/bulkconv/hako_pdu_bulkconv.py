@@ -0,0 +1,411 @@
+"""
+Offline bulk conversion of binary PDU dumps to JSON Lines or NumPy ``.npz``.
+
+Inputs are PDU files or directories of them. A file may hold one PDU or a
+concatenated dump: records are split by the ``total_size`` of their meta
+header, or by a fixed ``--record-size`` for dumps of shared-memory channels.
+Each file is mapped to a PDU type with ``--type`` or a ``--map`` JSON file of
+``{"glob": "pkg/Type" | "robot/pdu"}`` entries (channel names need
+``--pdu-config``).
+
+Files are cut into batches of records that are converted by a process pool.
+At most ``2 * jobs`` batches are in flight and results are written in input
+order as they arrive, so memory stays bounded by the batch size.
+
+    python -m hakoniwa_pdu.apps.bulkconv.hako_pdu_bulkconv \\
+        --offset-path /usr/local/lib/hakoniwa/hako_binary/offset \\
+        --type sensor_msgs/PointCloud2 -o points.jsonl dumps/
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import fnmatch
+import json
+import mmap
+import multiprocessing
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from hakoniwa_pdu._optional_numpy import require_numpy
+from hakoniwa_pdu.impl.hako_binary import binary_io
+from hakoniwa_pdu.impl.hako_binary import json_writer
+from hakoniwa_pdu.impl.hako_binary import offset_map
+from hakoniwa_pdu.impl.hako_binary import record_view
+from hakoniwa_pdu.impl.pdu_channel_config import PduChannelConfig
+
+FORMAT_JSONL = "jsonl"
+FORMAT_NPZ = "npz"
+
+_META = binary_io.PduMetaData.PDU_META_DATA_STRUCT
+_META_SIZE = binary_io.PduMetaData.PDU_META_DATA_SIZE
+_ZERO_META = bytes(_META_SIZE)
+_VARRAY_REF = struct.Struct("<ii")
+_DEFAULT_BATCH_BYTES = 4 * 1024 * 1024
+
+# set in every worker process by _init_worker
+_worker_offmap = None
+_worker_options = None
+_worker_refs = {}
+
+
+class BulkConvertError(Exception):
+    pass
+
+
+def iter_records(buffer, start: int, end: int, record_size: Optional[int] = None,
+                 base_size: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """
+    Yield ``(offset, size)`` of the PDUs stored in ``buffer[start:end]``.
+
+    Without record_size the records are split by the ``total_size`` of their
+    meta header. With record_size the records have a fixed stride and records
+    with an all-zero header (never written) are skipped. When base_size is
+    given, the base area of every record must hold at least that many bytes,
+    so that a dump of a smaller PDU type is rejected.
+    """
+    pos = start
+    while pos < end:
+        if record_size is not None:
+            size = min(record_size, end - pos)
+            if buffer[pos:pos + _META_SIZE] != _ZERO_META:
+                _check_meta(buffer, pos, pos + size, base_size)
+                yield pos, size
+            pos += size
+            continue
+        total_size = _check_meta(buffer, pos, end, base_size)
+        yield pos, total_size
+        pos += total_size
+
+
+def _check_meta(buffer, pos: int, end: int, base_size: Optional[int] = None) -> int:
+    if end - pos < _META_SIZE:
+        raise BulkConvertError(f"truncated PDU at offset {pos}")
+    magicno, version, base_off, heap_off, total_size = _META.unpack_from(buffer, pos)
+    if magicno != binary_io.PduMetaData.PDU_META_DATA_MAGICNO or version != binary_io.PduMetaData.PDU_META_DATA_VERSION:
+        raise BulkConvertError(f"invalid PDU meta header at offset {pos}")
+    # writers may pad the base area (e.g. to the struct alignment); reads go through base_off/heap_off
+    if base_size is not None and (base_off != _META_SIZE or heap_off - base_off < base_size):
+        raise BulkConvertError(f"PDU at offset {pos} has a base area of {heap_off - base_off} bytes, "
+                               f"expected at least {base_size} bytes of the PDU type")
+    if total_size < heap_off or pos + total_size > end:
+        raise BulkConvertError(f"invalid total_size {total_size} at offset {pos}")
+    return total_size
+
+
+def varray_refs(offmap, type_name: str) -> tuple:
+    """
+    Compile the varray references of type_name to check against a record:
+    ``(name, offset, elm_size, count, inner)`` where count is None for a varray
+    (whose count is read from the record) and inner holds the references of a
+    struct element, or is empty.
+    """
+    refs = []
+    for member in offmap.get_layout(type_name).members:
+        inner = () if member.is_primitive else varray_refs(offmap, member.type_name)
+        if member.is_varray:
+            refs.append((member.name, member.offset, member.elm_size, None, inner))
+        elif inner:
+            count = member.array_len if member.is_array else 1
+            refs.append((member.name, member.offset, member.elm_size, count, inner))
+    return tuple(refs)
+
+
+def check_varrays(refs, buffer, off: int, heap_off: int, end: int) -> None:
+    """
+    Check that every varray of the struct at off lies inside ``buffer[heap_off:end]``.
+
+    Raises:
+        BulkConvertError: If a varray reference is negative or points outside the record.
+    """
+    for name, offset, elm_size, count, inner in refs:
+        if count is not None:
+            for i in range(count):
+                check_varrays(inner, buffer, off + offset + i * elm_size, heap_off, end)
+            continue
+        count, offset_from_heap = _VARRAY_REF.unpack_from(buffer, off + offset)
+        start = heap_off + offset_from_heap
+        if count < 0 or offset_from_heap < 0 or start + count * elm_size > end:
+            raise BulkConvertError(f"varray {name} ({count}, {offset_from_heap}) is outside the PDU")
+        for i in range(count if inner else 0):
+            check_varrays(inner, buffer, start + i * elm_size, heap_off, end)
+
+
+def _iter_checked(buffer, unit) -> Iterator[Tuple[int, int, int, int]]:
+    # (index, offset, base_off, heap_off) of the records of a unit whose varrays lie inside the record
+    path, source, type_name, start, end, first_index, record_size = unit
+    refs = _worker_refs.get(type_name)
+    if refs is None:
+        refs = _worker_refs[type_name] = varray_refs(_worker_offmap, type_name)
+    base_size = _worker_offmap.get_layout(type_name).base_size
+    for index, (pos, size) in enumerate(iter_records(buffer, start, end, record_size, base_size), first_index):
+        _, _, base_off, heap_off, total_size = _META.unpack_from(buffer, pos)
+        try:
+            check_varrays(refs, buffer, pos + base_off, pos + heap_off, pos + total_size)
+        except BulkConvertError as exc:
+            raise BulkConvertError(f"{path}: PDU {index} at offset {pos}: {exc}") from None
+        yield index, pos, base_off, heap_off
+
+
+class TypeResolver:
+    """Maps input files to PDU types from --type, or from --map glob entries."""
+
+    def __init__(self, offmap, type_name: Optional[str] = None, mapping: Optional[dict] = None,
+                 pdu_config: Optional[PduChannelConfig] = None) -> None:
+        self.offmap = offmap
+        self.pdu_config = pdu_config
+        self.default = self._resolve(type_name) if type_name else None
+        self.entries = [(pattern, self._resolve(name)) for pattern, name in (mapping or {}).items()]
+
+    def _resolve(self, name: str) -> str:
+        if self.pdu_config is not None and name.count("/") == 1:
+            robot_name, pdu_name = name.split("/")
+            pdu_type = self.pdu_config.get_pdu_type(robot_name, pdu_name)
+            if pdu_type is not None:
+                return pdu_type
+        try:
+            self.offmap.get_layout(name)
+        except FileNotFoundError as exc:
+            raise BulkConvertError(f"unknown PDU type or channel: {name}") from exc
+        return name
+
+    def type_of(self, source: str) -> str:
+        for pattern, type_name in self.entries:
+            if fnmatch.fnmatch(source, pattern):
+                return type_name
+        if self.default is None:
+            raise BulkConvertError(f"no PDU type for {source}; use --type or add it to --map")
+        return self.default
+
+
+def collect_files(inputs: List[str], pattern: str) -> List[Tuple[str, str]]:
+    """Return ``(path, source)`` of every input file; source is the name used in the output."""
+    files = []
+    for name in inputs:
+        path = Path(name)
+        if path.is_dir():
+            for child in sorted(path.rglob(pattern)):
+                if child.is_file():
+                    files.append((str(child), child.relative_to(path).as_posix()))
+        elif path.is_file():
+            files.append((str(path), path.name))
+        else:
+            raise BulkConvertError(f"input not found: {name}")
+    return files
+
+
+def plan_units(files, resolver: TypeResolver, record_size: Optional[int], batch_bytes: int):
+    """
+    Cut the input files into work units ``(path, source, type, start, end, first_index, record_size)``
+    of whole records and at most about batch_bytes each.
+    """
+    for path, source in files:
+        type_name = resolver.type_of(source)
+        base_size = resolver.offmap.get_layout(type_name).base_size
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                continue
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                start = None
+                first_index = 0
+                index = 0
+                try:
+                    for pos, size in iter_records(buffer, 0, len(buffer), record_size, base_size):
+                        if start is None:
+                            start = pos
+                            first_index = index
+                        index += 1
+                        if pos + size - start >= batch_bytes:
+                            yield (path, source, type_name, start, pos + size, first_index, record_size)
+                            start = None
+                except BulkConvertError as exc:
+                    raise BulkConvertError(f"{path}: {exc}") from exc
+                if start is not None:
+                    yield (path, source, type_name, start, len(buffer), first_index, record_size)
+
+
+def _init_worker(offset_path: str, cache_path: Optional[str], options) -> None:
+    global _worker_offmap, _worker_options
+    _worker_offmap = offset_map.create_offmap(offset_path, cache_path)
+    _worker_options = options
+    _worker_refs.clear()
+
+
+def convert_unit_jsonl(unit) -> bytes:
+    path, source, type_name, start, end, first_index, record_size = unit
+    plan = json_writer.compile_json_plan(_worker_offmap, type_name, _worker_options)
+    prefix = '{"source":' + json.dumps(source) + ',"type":' + json.dumps(type_name) + ',"index":'
+    lines = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        for index, pos, base_off, heap_off in _iter_checked(buffer, unit):
+            lines.append(prefix + str(index) + ',"pdu":' + plan.render(buffer, pos + base_off, pos + heap_off) + "}\n")
+    return "".join(lines).encode("utf-8")
+
+
+def npz_varray_members(offmap, type_name: str):
+    """Top-level numeric varrays, which are exported as flat value arrays plus per-record counts."""
+    return [member for member in offmap.get_layout(type_name).members
+            if member.is_varray and member.is_primitive and member.type_name != "string"]
+
+
+def convert_unit_npz(unit):
+    path, source, type_name, start, end, first_index, record_size = unit
+    base_size = _worker_offmap.get_layout(type_name).base_size
+    members = npz_varray_members(_worker_offmap, type_name)
+    base = bytearray()
+    values = [bytearray() for _ in members]
+    counts = [bytearray() for _ in members]
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        for index, pos, base_off, heap_off in _iter_checked(buffer, unit):
+            base += buffer[pos + base_off:pos + base_off + base_size]
+            for i, member in enumerate(members):
+                count, offset_from_heap = _VARRAY_REF.unpack_from(buffer, pos + base_off + member.offset)
+                heap_pos = pos + heap_off + offset_from_heap
+                values[i] += buffer[heap_pos:heap_pos + count * member.elm_size]
+                counts[i] += count.to_bytes(4, "little")
+    return type_name, bytes(base), [(member.name, bytes(v), bytes(c)) for member, v, c in zip(members, values, counts)]
+
+
+class JsonLinesSink:
+    def __init__(self, out) -> None:
+        self.out = out
+        self.records = 0
+
+    def write(self, result: bytes) -> None:
+        self.out.write(result)
+        self.records += result.count(b"\n")
+
+    def close(self) -> None:
+        self.out.flush()
+
+
+class NpzSink:
+    """
+    Spools every array to a temporary file while the units arrive and writes
+    the ``.npz`` (a zip of ``.npy`` files) at the end.
+
+    Keys are ``<type>`` (structured records of the base area, see
+    ``PduConvertor.as_record``), ``<type>.<member>`` (values of all records
+    concatenated) and ``<type>.<member>.count`` (int32 element count per record).
+    """
+
+    def __init__(self, offmap, out_path: str, compress: bool = False) -> None:
+        self.numpy = require_numpy()
+        self.offmap = offmap
+        self.out_path = out_path
+        self.compress = compress
+        self.arrays = {}
+        self.records = 0
+
+    def _append(self, key: str, dtype, data: bytes) -> None:
+        entry = self.arrays.get(key)
+        if entry is None:
+            entry = self.arrays[key] = [dtype, tempfile.TemporaryFile(), 0]
+        entry[1].write(data)
+        entry[2] += len(data) // dtype.itemsize
+
+    def write(self, result) -> None:
+        type_name, base, varrays = result
+        dtype = self.offmap.get_dtype(type_name)
+        self.records += len(base) // dtype.itemsize
+        self._append(type_name, dtype, base)
+        layout = self.offmap.get_layout(type_name)
+        for name, values, counts in varrays:
+            element = record_view.element_dtype(self.offmap, layout.by_name[name])
+            self._append(f"{type_name}.{name}", element, values)
+            self._append(f"{type_name}.{name}.count", self.numpy.dtype("<i4"), counts)
+
+    def close(self) -> None:
+        fmt = self.numpy.lib.format
+        compression = zipfile.ZIP_DEFLATED if self.compress else zipfile.ZIP_STORED
+        with zipfile.ZipFile(self.out_path, "w", compression=compression, allowZip64=True) as archive:
+            for key, (dtype, spool, count) in self.arrays.items():
+                header = {"descr": fmt.dtype_to_descr(dtype), "fortran_order": False, "shape": (count,)}
+                spool.seek(0)
+                with archive.open(key + ".npy", "w", force_zip64=True) as entry:
+                    fmt.write_array_header_2_0(entry, header)
+                    shutil.copyfileobj(spool, entry)
+                spool.close()
+
+
+def run(units, worker, sink, offset_path: str, cache_path: Optional[str], options, jobs: int) -> None:
+    """Convert units with worker and hand the results to sink in input order."""
+    if jobs <= 1:
+        _init_worker(offset_path, cache_path, options)
+        for unit in units:
+            sink.write(worker(unit))
+        return
+    with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(offset_path, cache_path, options)) as pool:
+        pending = collections.deque()
+        for unit in units:
+            pending.append(pool.apply_async(worker, (unit,)))
+            if len(pending) >= 2 * jobs:
+                sink.write(pending.popleft().get())
+        while pending:
+            sink.write(pending.popleft().get())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Hakoniwa PDU bulk converter (binary dumps to JSON Lines / .npz)")
+    parser.add_argument("inputs", nargs="+", help="PDU files, concatenated dumps or directories")
+    parser.add_argument("-o", "--output", required=True, help="output file (.jsonl or .npz, '-' for JSON Lines on stdout)")
+    parser.add_argument("--format", choices=[FORMAT_JSONL, FORMAT_NPZ], help="default: from the output extension")
+    parser.add_argument("--offset-path", default=os.environ.get("HAKO_BINARY_PATH", "/usr/local/lib/hakoniwa/hako_binary/offset"))
+    parser.add_argument("--offset-cache", default=os.environ.get("HAKO_OFFSET_CACHE_PATH"))
+    parser.add_argument("--type", help="PDU type (or robot/pdu with --pdu-config) of all inputs")
+    parser.add_argument("--map", type=Path, help='JSON file {"glob": "pkg/Type" or "robot/pdu"} matched against input names')
+    parser.add_argument("--pdu-config", help="PDU channel config used to resolve robot/pdu names")
+    parser.add_argument("--pattern", default="*", help="file pattern used inside input directories")
+    parser.add_argument("--record-size", type=int, help="fixed record stride of the dumps (default: meta total_size)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-bytes", type=int, default=_DEFAULT_BATCH_BYTES)
+    parser.add_argument("--include-raw", action="store_true", help="JSON Lines: add name__raw base64 members")
+    parser.add_argument("--array-encoding", choices=json_writer.ARRAY_ENCODINGS, default=json_writer.ARRAY_ENCODING_LIST)
+    parser.add_argument("--max-array-len", type=int)
+    parser.add_argument("--compress", action="store_true", help=".npz: deflate the arrays")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or (FORMAT_NPZ if args.output.endswith(".npz") else FORMAT_JSONL)
+    if fmt == FORMAT_NPZ and args.output == "-":
+        parser.error(".npz output needs a file name")
+    if args.record_size is not None and args.record_size < _META_SIZE:
+        parser.error(f"--record-size must be at least {_META_SIZE}")
+
+    try:
+        offmap = offset_map.create_offmap(args.offset_path, args.offset_cache)
+        mapping = json.loads(args.map.read_text(encoding="utf-8")) if args.map else None
+        pdu_config = PduChannelConfig(args.pdu_config) if args.pdu_config else None
+        resolver = TypeResolver(offmap, args.type, mapping, pdu_config)
+        options = json_writer.JsonOptions(args.include_raw, args.array_encoding, args.max_array_len)
+        units = plan_units(collect_files(args.inputs, args.pattern), resolver, args.record_size, args.batch_bytes)
+        if fmt == FORMAT_NPZ:
+            sink = NpzSink(offmap, args.output, args.compress)
+            worker = convert_unit_npz
+            out = None
+        else:
+            out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+            sink = JsonLinesSink(out)
+            worker = convert_unit_jsonl
+        try:
+            run(units, worker, sink, args.offset_path, args.offset_cache, options, args.jobs)
+            sink.close()
+        finally:
+            if out is not None and out is not sys.stdout.buffer:
+                out.close()
+    except (BulkConvertError, ValueError, OSError) as exc:
+        print(f"[bulkconv] {exc}", file=sys.stderr)
+        return 1
+
+    print(f"[bulkconv] {sink.records} PDUs -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
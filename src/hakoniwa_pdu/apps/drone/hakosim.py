@@ -1,40 +1,10 @@
+from typing import TYPE_CHECKING
+
 from hakoniwa_pdu._optional_hakopy import hakopy
 from hakoniwa_pdu.pdu_manager import PduManager
 from hakoniwa_pdu.impl.shm_communication_service import ShmCommunicationService
 from hakoniwa_pdu.impl.pdu_channel_config import PduChannelConfig
-from hakoniwa_pdu.pdu_msgs.geometry_msgs.pdu_pytype_Twist import Twist
-from hakoniwa_pdu.pdu_msgs.geometry_msgs.pdu_conv_Twist import pdu_to_py_Twist 
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_GameControllerOperation import GameControllerOperation
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_GameControllerOperation import py_to_pdu_GameControllerOperation, pdu_to_py_GameControllerOperation
-
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_HakoDroneCmdTakeoff import HakoDroneCmdTakeoff
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_HakoDroneCmdTakeoff import py_to_pdu_HakoDroneCmdTakeoff, pdu_to_py_HakoDroneCmdTakeoff
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_HakoDroneCmdLand import HakoDroneCmdLand
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_HakoDroneCmdLand import py_to_pdu_HakoDroneCmdLand, pdu_to_py_HakoDroneCmdLand
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_HakoDroneCmdMove import HakoDroneCmdMove
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_HakoDroneCmdMove import py_to_pdu_HakoDroneCmdMove, pdu_to_py_HakoDroneCmdMove
-
-# hako_msgs/HakoCmdCamera
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_HakoCmdCamera import HakoCmdCamera
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_HakoCmdCamera import py_to_pdu_HakoCmdCamera, pdu_to_py_HakoCmdCamera
-# hako_msgs/HakoCmdCameraMove
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_HakoCmdCameraMove import HakoCmdCameraMove
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_HakoCmdCameraMove import py_to_pdu_HakoCmdCameraMove, pdu_to_py_HakoCmdCameraMove
-# hako_msgs/HakoCameraData
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_HakoCameraData import HakoCameraData
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_HakoCameraData import py_to_pdu_HakoCameraData, pdu_to_py_HakoCameraData
-# hako_msgs/HakoCameraInfo
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_HakoCameraInfo import HakoCameraInfo
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_HakoCameraInfo import py_to_pdu_HakoCameraInfo, pdu_to_py_HakoCameraInfo
-# hako_msgs/HakoStatusMagnetHolder
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_HakoStatusMagnetHolder import HakoStatusMagnetHolder
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_HakoStatusMagnetHolder import py_to_pdu_HakoStatusMagnetHolder, pdu_to_py_HakoStatusMagnetHolder
-# hako_msgs/HakoCmdMagnetHolder
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_HakoCmdMagnetHolder import HakoCmdMagnetHolder
-from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_HakoCmdMagnetHolder import py_to_pdu_HakoCmdMagnetHolder, pdu_to_py_HakoCmdMagnetHolder
-# sensor_msgs/PointCloud2
-from hakoniwa_pdu.pdu_msgs.sensor_msgs.pdu_pytype_PointCloud2 import PointCloud2
-from hakoniwa_pdu.pdu_msgs.sensor_msgs.pdu_conv_PointCloud2 import pdu_to_py_PointCloud2, py_to_pdu_PointCloud2
+from hakoniwa_pdu.pdu_msgs import pdu_registry
 
 import hakoniwa_pdu.apps.drone.hakosim_types as hakosim_types
 import hakoniwa_pdu.apps.drone.hakosim_lidar as hakosim_lidar
@@ -43,6 +13,45 @@ import json
 import os
 import time
 
+if TYPE_CHECKING:
+    from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_GameControllerOperation import GameControllerOperation
+
+# generated message modules are imported on first use
+_TWIST = pdu_registry.get_type("geometry_msgs/Twist")
+_GAME_CONTROLLER_OPERATION = pdu_registry.get_type("hako_msgs/GameControllerOperation")
+_HAKO_DRONE_CMD_TAKEOFF = pdu_registry.get_type("hako_msgs/HakoDroneCmdTakeoff")
+_HAKO_DRONE_CMD_LAND = pdu_registry.get_type("hako_msgs/HakoDroneCmdLand")
+_HAKO_DRONE_CMD_MOVE = pdu_registry.get_type("hako_msgs/HakoDroneCmdMove")
+_HAKO_CMD_CAMERA = pdu_registry.get_type("hako_msgs/HakoCmdCamera")
+_HAKO_CMD_CAMERA_MOVE = pdu_registry.get_type("hako_msgs/HakoCmdCameraMove")
+_HAKO_CAMERA_DATA = pdu_registry.get_type("hako_msgs/HakoCameraData")
+_HAKO_CAMERA_INFO = pdu_registry.get_type("hako_msgs/HakoCameraInfo")
+_HAKO_STATUS_MAGNET_HOLDER = pdu_registry.get_type("hako_msgs/HakoStatusMagnetHolder")
+_HAKO_CMD_MAGNET_HOLDER = pdu_registry.get_type("hako_msgs/HakoCmdMagnetHolder")
+_POINT_CLOUD2 = pdu_registry.get_type("sensor_msgs/PointCloud2")
+
+# names this module used to import from the generated modules, kept for scripts
+# that import them from here ("from hakoniwa_pdu.apps.drone.hakosim import Twist")
+_LAZY_ATTRS = {"Twist": (_TWIST, "pytype"), "pdu_to_py_Twist": (_TWIST, "pdu_to_py")}
+for _entry in (_GAME_CONTROLLER_OPERATION, _HAKO_DRONE_CMD_TAKEOFF, _HAKO_DRONE_CMD_LAND, _HAKO_DRONE_CMD_MOVE,
+               _HAKO_CMD_CAMERA, _HAKO_CMD_CAMERA_MOVE, _HAKO_CAMERA_DATA, _HAKO_CAMERA_INFO,
+               _HAKO_STATUS_MAGNET_HOLDER, _HAKO_CMD_MAGNET_HOLDER, _POINT_CLOUD2):
+    _LAZY_ATTRS[_entry.name] = (_entry, "pytype")
+    _LAZY_ATTRS[f"pdu_to_py_{_entry.name}"] = (_entry, "pdu_to_py")
+    _LAZY_ATTRS[f"py_to_pdu_{_entry.name}"] = (_entry, "py_to_pdu")
+del _entry
+
+def __getattr__(name):
+    lazy = _LAZY_ATTRS.get(name)
+    if lazy is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(*lazy)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 class ImageType:
     Scene = "png"
 
@@ -156,7 +165,7 @@ class MultirotorClient:
         if raw_data is None or len(raw_data) == 0:
             print(f"ERROR: Failed to read pose data for vehicle '{name}'")
             return None
-        pose: Twist = pdu_to_py_Twist(raw_data)
+        pose = _TWIST.pdu_to_py(raw_data)
         pos = hakosim_types.Vector3r(pose.linear.x, pose.linear.y, pose.linear.z)
         orientation = hakosim_types.Quaternionr.euler_to_quaternion(pose.angular.x, pose.angular.y, pose.angular.z)
         return hakosim_types.Pose(pos, orientation)
@@ -167,7 +176,7 @@ class MultirotorClient:
         if raw_data is None or len(raw_data) == 0:
             print(f"ERROR: Failed to read pose data for vehicle '{name}'")
             return None
-        pose: Twist = pdu_to_py_Twist(raw_data)
+        pose = _TWIST.pdu_to_py(raw_data)
         pos = hakosim_types.Vector3r(
             -pose.linear.y, 
             pose.linear.z, 
@@ -232,17 +241,17 @@ class MultirotorClient:
     def takeoff(self, height, vehicle_name=None):
         if self.get_vehicle_name(vehicle_name) != None:
             print(f"INFO: takeoff: height={height}")
-            pdu_cmd: HakoDroneCmdTakeoff = HakoDroneCmdTakeoff()
+            pdu_cmd = _HAKO_DRONE_CMD_TAKEOFF.pytype()
             self._initialize_header(pdu_cmd.header)
             pdu_cmd.height = height
             pdu_cmd.speed = 5
             pdu_cmd.yaw_deg = self._get_yaw_degree(vehicle_name)
-            if not self._send_request('drone_cmd_takeoff', pdu_cmd, py_to_pdu_HakoDroneCmdTakeoff):
+            if not self._send_request('drone_cmd_takeoff', pdu_cmd, _HAKO_DRONE_CMD_TAKEOFF.py_to_pdu):
                 return False
             print("takeoff request sent")
             # Wait for response
             print("Waiting for takeoff response...")
-            return self._wait_res('drone_cmd_takeoff', pdu_to_py_HakoDroneCmdTakeoff, py_to_pdu_HakoDroneCmdTakeoff)
+            return self._wait_res('drone_cmd_takeoff', _HAKO_DRONE_CMD_TAKEOFF.pdu_to_py, _HAKO_DRONE_CMD_TAKEOFF.py_to_pdu)
         else:
             return False
 
@@ -259,7 +268,7 @@ class MultirotorClient:
     def moveToPosition(self, x, y, z, speed, yaw_deg=None, timeout_sec=-1, vehicle_name=None):
         if self.get_vehicle_name(vehicle_name) != None:
             print("INFO: moveToPosition")
-            pdu_cmd: HakoDroneCmdMove = HakoDroneCmdMove()
+            pdu_cmd = _HAKO_DRONE_CMD_MOVE.pytype()
             self._initialize_header(pdu_cmd.header)
             pdu_cmd.x = x
             pdu_cmd.y = y
@@ -268,29 +277,29 @@ class MultirotorClient:
             if yaw_deg is None:
                 yaw_deg = self._get_yaw_degree(vehicle_name)
             pdu_cmd.yaw_deg = yaw_deg
-            if not self._send_request('drone_cmd_move', pdu_cmd, py_to_pdu_HakoDroneCmdMove):
+            if not self._send_request('drone_cmd_move', pdu_cmd, _HAKO_DRONE_CMD_MOVE.py_to_pdu):
                 return False
             print("move request sent")            
             # Wait for response
             print("Waiting for move response...")
-            return self._wait_res('drone_cmd_move', pdu_to_py_HakoDroneCmdMove, py_to_pdu_HakoDroneCmdMove, timeout_sec)
+            return self._wait_res('drone_cmd_move', _HAKO_DRONE_CMD_MOVE.pdu_to_py, _HAKO_DRONE_CMD_MOVE.py_to_pdu, timeout_sec)
         else:
             return False
 
     def land(self, vehicle_name=None):
         if self.get_vehicle_name(vehicle_name) != None:
             print("INFO: Landing")
-            py_obj = HakoDroneCmdLand()
+            py_obj = _HAKO_DRONE_CMD_LAND.pytype()
             self._initialize_header(py_obj.header)
             py_obj.height = 0
             py_obj.speed = 5
             py_obj.yaw_deg = self._get_yaw_degree(vehicle_name)
-            if not self._send_request('drone_cmd_land', py_obj, py_to_pdu_HakoDroneCmdLand):
+            if not self._send_request('drone_cmd_land', py_obj, _HAKO_DRONE_CMD_LAND.py_to_pdu):
                 return False
             print("land request sent")
             # Wait for response
             print("Waiting for land response...")
-            return self._wait_res('drone_cmd_land', pdu_to_py_HakoDroneCmdLand, py_to_pdu_HakoDroneCmdLand)
+            return self._wait_res('drone_cmd_land', _HAKO_DRONE_CMD_LAND.pdu_to_py, _HAKO_DRONE_CMD_LAND.py_to_pdu)
         else:
             return False
 
@@ -303,7 +312,7 @@ class MultirotorClient:
             if raw_data is None or len(raw_data) == 0:
                 time.sleep(0.1)
                 continue
-            pdu_cmd = pdu_to_py_HakoStatusMagnetHolder(raw_data)
+            pdu_cmd = _HAKO_STATUS_MAGNET_HOLDER.pdu_to_py(raw_data)
             if grab:
                 if pdu_cmd.magnet_on == 1 and pdu_cmd.contact_on == 1:
                     ret = True
@@ -324,10 +333,10 @@ class MultirotorClient:
     def grab_baggage(self, grab, timeout_sec=-1, vehicle_name=None):
         if self.get_vehicle_name(vehicle_name) != None:
             print("INFO: grab baggage: ", grab)
-            pdu_cmd = HakoCmdMagnetHolder()
+            pdu_cmd = _HAKO_CMD_MAGNET_HOLDER.pytype()
             self._initialize_header(pdu_cmd.header)
             pdu_cmd.magnet_on = grab
-            raw_data = py_to_pdu_HakoCmdMagnetHolder(pdu_cmd)
+            raw_data = _HAKO_CMD_MAGNET_HOLDER.py_to_pdu(pdu_cmd)
             ret = self.pdu_manager.flush_pdu_raw_data_nowait(self.get_vehicle_name(vehicle_name), 'hako_cmd_magnet_holder', raw_data)
             if not ret:
                 print(f"ERROR: Failed to send grab command for vehicle '{vehicle_name}'")
@@ -340,7 +349,7 @@ class MultirotorClient:
 
             pdu_cmd.header.request = 0
             pdu_cmd.header.result = 0
-            raw_data = py_to_pdu_HakoCmdMagnetHolder(pdu_cmd)
+            raw_data = _HAKO_CMD_MAGNET_HOLDER.py_to_pdu(pdu_cmd)
             self.pdu_manager.flush_pdu_raw_data_nowait(self.get_vehicle_name(vehicle_name), 'hako_cmd_magnet_holder', raw_data)
             print("grab command reset")
             return ret
@@ -354,7 +363,7 @@ class MultirotorClient:
                 time.sleep(0.1)
                 continue
             try:
-                pdu_data = pdu_to_py_HakoCameraData(raw_data)
+                pdu_data = _HAKO_CAMERA_DATA.pdu_to_py(raw_data)
                 if pdu_data.request_id == vehicle.camera_cmd_request_id:
                 #print("request_id", pdu_data['request_id'])
                     print(f"INFO: get camera data len={len(pdu_data.image.data)}")
@@ -375,7 +384,7 @@ class MultirotorClient:
                 self.sleep(0.1)
                 continue
             try:
-                pdu_data = pdu_to_py_HakoCameraInfo(raw_data)
+                pdu_data = _HAKO_CAMERA_INFO.pdu_to_py(raw_data)
                 if pdu_data.request_id == vehicle.camera_move_cmd_request_id:
                     vehicle.camera_move_cmd_request_id += 1
                     return pdu_data.angle
@@ -394,11 +403,11 @@ class MultirotorClient:
         if vehicle_name != None:
             vehicle = self.vehicles[vehicle_name]
             #print("INFO: get image ")
-            pdu_cmd = HakoCmdCamera()
+            pdu_cmd = _HAKO_CMD_CAMERA.pytype()
             self._initialize_header(pdu_cmd.header)
             pdu_cmd.request_id = vehicle.camera_cmd_request_id
             pdu_cmd.encode_type = 0
-            raw_data = py_to_pdu_HakoCmdCamera(pdu_cmd)
+            raw_data = _HAKO_CMD_CAMERA.py_to_pdu(pdu_cmd)
             ret = self.pdu_manager.flush_pdu_raw_data_nowait(vehicle.name, 'hako_cmd_camera', raw_data)
             if not ret:
                 print(f"ERROR: Failed to send camera command for vehicle '{vehicle_name}'")
@@ -406,7 +415,7 @@ class MultirotorClient:
             img = self._get_camera_data(vehicle)
             pdu_cmd.header.request = 0
             pdu_cmd.header.result = 0
-            ret = self.pdu_manager.flush_pdu_raw_data_nowait(vehicle.name, 'hako_cmd_camera', py_to_pdu_HakoCmdCamera(pdu_cmd))
+            ret = self.pdu_manager.flush_pdu_raw_data_nowait(vehicle.name, 'hako_cmd_camera', _HAKO_CMD_CAMERA.py_to_pdu(pdu_cmd))
             if not ret:
                 print(f"ERROR: Failed to reset camera command for vehicle '{vehicle_name}'")
                 return None
@@ -419,13 +428,13 @@ class MultirotorClient:
         vehicle_name = self.get_vehicle_name(vehicle_name)
         if vehicle_name != None:
             vehicle = self.vehicles[vehicle_name]
-            pdu_cmd = HakoCmdCameraMove()
+            pdu_cmd = _HAKO_CMD_CAMERA_MOVE.pytype()
             self._initialize_header(pdu_cmd.header)
             pdu_cmd.request_id = vehicle.camera_move_cmd_request_id
             pdu_cmd.angle.x = 0
             pdu_cmd.angle.y = degree
             pdu_cmd.angle.z = 0
-            ret = self.pdu_manager.flush_pdu_raw_data_nowait(vehicle.name, 'hako_cmd_camera_move', py_to_pdu_HakoCmdCameraMove(pdu_cmd))
+            ret = self.pdu_manager.flush_pdu_raw_data_nowait(vehicle.name, 'hako_cmd_camera_move', _HAKO_CMD_CAMERA_MOVE.py_to_pdu(pdu_cmd))
             if not ret:
                 print(f"ERROR: Failed to send camera move command for vehicle '{vehicle_name}'")
                 return None
@@ -433,7 +442,7 @@ class MultirotorClient:
             info = self._get_camera_info(vehicle)
             pdu_cmd.header.request = 0
             pdu_cmd.header.result = 0
-            ret = self.pdu_manager.flush_pdu_raw_data_nowait(vehicle.name, 'hako_cmd_camera_move', py_to_pdu_HakoCmdCameraMove(pdu_cmd))
+            ret = self.pdu_manager.flush_pdu_raw_data_nowait(vehicle.name, 'hako_cmd_camera_move', _HAKO_CMD_CAMERA_MOVE.py_to_pdu(pdu_cmd))
             if not ret:
                 print(f"ERROR: Failed to reset camera move command for vehicle '{vehicle_name}'")
                 return None
@@ -459,12 +468,12 @@ class MultirotorClient:
             if raw_data is None or len(raw_data) == 0:
                 print(f"ERROR: Failed to read Lidar data for vehicle '{vehicle_name}'")
                 return None
-            lidar_pdu_data = pdu_to_py_PointCloud2(raw_data)
+            lidar_pdu_data = _POINT_CLOUD2.pdu_to_py(raw_data)
             raw_data = self._read_carefully(vehicle.name, 'lidar_pos')
             if raw_data is None or len(raw_data) == 0:
                 print(f"ERROR: Failed to read Lidar pose for vehicle '{vehicle_name}'")
                 return None
-            lidar_pos_pdu_data = pdu_to_py_Twist(raw_data)
+            lidar_pos_pdu_data = _TWIST.pdu_to_py(raw_data)
             time_stamp = lidar_pdu_data.header.stamp.sec
             # Generated PDU converters currently deserialize uint8[] as a tuple.
             # Normalize to bytes here because downstream LiDAR parsing expects
@@ -483,7 +492,7 @@ class MultirotorClient:
         else:
             return None
 
-    def getGameJoystickData(self, vehicle_name=None) -> GameControllerOperation:
+    def getGameJoystickData(self, vehicle_name=None) -> "GameControllerOperation":
         vehicle_name = self.get_vehicle_name(vehicle_name)
         if vehicle_name != None:
             vehicle = self.vehicles[vehicle_name]
@@ -492,19 +501,19 @@ class MultirotorClient:
                 print(f"ERROR: Failed to read game joystick data for vehicle '{vehicle_name}'")
                 return None
             try:
-                game_pdu_data: GameControllerOperation = pdu_to_py_GameControllerOperation(raw_data)
+                game_pdu_data = _GAME_CONTROLLER_OPERATION.pdu_to_py(raw_data)
                 return game_pdu_data
             except Exception as e:
                 print(f"WARNING: Failed to convert PDU to GameControllerOperation for vehicle '{vehicle_name}': {e}")
-                return GameControllerOperation()
+                return _GAME_CONTROLLER_OPERATION.pytype()
         else:
             return None
 
-    def putGameJoystickData(self, data: GameControllerOperation, vehicle_name=None):
+    def putGameJoystickData(self, data: "GameControllerOperation", vehicle_name=None):
         vehicle_name = self.get_vehicle_name(vehicle_name)
         if vehicle_name != None:
             vehicle = self.vehicles[vehicle_name]
-            ret = self.pdu_manager.flush_pdu_raw_data_nowait(vehicle.name, 'hako_cmd_game', py_to_pdu_GameControllerOperation(data))
+            ret = self.pdu_manager.flush_pdu_raw_data_nowait(vehicle.name, 'hako_cmd_game', _GAME_CONTROLLER_OPERATION.py_to_pdu(data))
             return ret
         else:
             return False
@@ -1,8 +1,8 @@
 import threading
 import logging
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 from .pdu_channel_config import PduChannelConfig
-from .data_packet import DataPacket
+from .data_packet import DataPacket, PacketView
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +43,13 @@ class CommunicationBuffer:
     def get_pdu_channel_id(self, robot_name: str, pdu_name: str) -> int:
         return self.pdu_channel_config.get_pdu_channel_id(robot_name, pdu_name)
 
-    def put_packet(self, packet: DataPacket):
+    def put_packet(self, packet: Union[DataPacket, PacketView]):
+        """
+        Buffer the body of a received packet under its PDU name.
+
+        The body is stored as is: for a PacketView it is the read-only memoryview
+        over the received frame, so get_buffer returns it without any copy.
+        """
         robot_name = packet.get_robot_name()
         channel_id = packet.get_channel_id()
         pdu_name = self.get_pdu_name(robot_name, channel_id)
@@ -1,5 +1,6 @@
 import struct
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_pytype_MetaPdu import MetaPdu
 
 # 固定値（必要に応じて既存定義と統合）
@@ -20,6 +21,155 @@ REGISTER_RPC_CLIENT    = 0x43505244   # "DRPC"
 PDU_DATA_RPC_REQUEST     = 0x43505243   # "CRPC"
 PDU_DATA_RPC_REPLY       = 0x43505253   # "SRPC"
 
+# v2 ヘッダ: ロボット名(128B) + MetaPdu 固定部(176B, channel_id 以降は予約領域)を一つの Struct で書く
+V2_HEADER_STRUCT = struct.Struct(f"<{ROBOT_NAME_FIXED_SIZE}sIHHIIIIQQQi{META_FIXED_SIZE - 52}x")
+assert V2_HEADER_STRUCT.size == TOTAL_PDU_META_SIZE
+
+
+@lru_cache(maxsize=1024)
+def _robot_name_field(robot_name: str) -> bytes:
+    # 終端 NUL を残すため最大 127 バイト（残りは Struct が 0 で埋める）
+    return (robot_name or "").encode("utf-8")[:ROBOT_NAME_FIXED_SIZE - 1]
+
+
+def pack_v2_header_into(buf, offset: int, robot_name: str, channel_id: int, body_len: int,
+                        meta_request_type: int = 0, hako_time_us: int = 0, asset_time_us: int = 0,
+                        real_time_us: int = 0) -> None:
+    """Write the 304-byte v2 header (robot name and MetaPdu) into buf at offset with one pack_into."""
+    V2_HEADER_STRUCT.pack_into(
+        buf, offset, _robot_name_field(robot_name), HAKO_META_MAGIC, HAKO_META_VER, 0, 0,
+        meta_request_type, (META_FIXED_SIZE - 4) + body_len, body_len,
+        hako_time_us, asset_time_us, real_time_us, channel_id)
+
+
+def encode_v2(robot_name: str, channel_id: int, body, meta_request_type: int = 0, *,
+              hako_time_us: int = 0, asset_time_us: int = 0, real_time_us: int = 0) -> bytearray:
+    """Encode a v2 frame (header followed by body) into a new bytearray."""
+    frame = bytearray(TOTAL_PDU_META_SIZE + len(body))
+    pack_v2_header_into(frame, 0, robot_name, channel_id, len(body), meta_request_type,
+                        hako_time_us, asset_time_us, real_time_us)
+    frame[TOTAL_PDU_META_SIZE:] = body
+    return frame
+
+
+def encode_v2_into(out, robot_name: str, channel_id: int, body, meta_request_type: int = 0, *,
+                   hako_time_us: int = 0, asset_time_us: int = 0, real_time_us: int = 0) -> int:
+    """
+    Encode a v2 frame into out (a reused bytearray or writable memoryview) from offset 0.
+
+    Returns the frame size; the bytes after it are left untouched.
+
+    Raises:
+        ValueError: If out is smaller than the header plus body.
+    """
+    size = TOTAL_PDU_META_SIZE + len(body)
+    if len(out) < size:
+        raise ValueError(f"output buffer too small: {len(out)} < {size}")
+    pack_v2_header_into(out, 0, robot_name, channel_id, len(body), meta_request_type,
+                        hako_time_us, asset_time_us, real_time_us)
+    out[TOTAL_PDU_META_SIZE:size] = body
+    return size
+
+
+def encode_v2_parts(robot_name: str, channel_id: int, body, meta_request_type: int = 0, *,
+                    hako_time_us: int = 0, asset_time_us: int = 0, real_time_us: int = 0) -> Tuple[bytearray, object]:
+    """Return the v2 header and the body (not copied) for scatter-gather sends such as socket.sendmsg."""
+    header = bytearray(TOTAL_PDU_META_SIZE)
+    pack_v2_header_into(header, 0, robot_name, channel_id, len(body), meta_request_type,
+                        hako_time_us, asset_time_us, real_time_us)
+    return header, body
+
+
+@lru_cache(maxsize=1024)
+def _robot_name_from_field(raw: bytes) -> str:
+    nul = raw.find(b"\x00")
+    if nul >= 0:
+        raw = raw[:nul]
+    return raw.decode("utf-8", errors="ignore")
+
+
+class PacketView:
+    """
+    Zero-copy view of a received v2 frame.
+
+    The header is parsed with one unpack_from and ``body`` is a memoryview over
+    the frame, so a received message is not copied. The read accessors of
+    DataPacket (get_robot_name, get_channel_id, get_pdu_data, body_data and
+    meta_pdu, which is built on first access) are provided, so a view can be
+    handed to CommunicationBuffer and packet handlers in place of a DataPacket.
+    The frame must not be modified while the view or its body is in use; the
+    ``bytes`` delivered by a WebSocket are immutable.
+    """
+    __slots__ = ("robot_name", "channel_id", "meta_request_type", "flags", "total_len",
+                 "hako_time_us", "asset_time_us", "real_time_us", "body", "_meta_pdu")
+
+    def __init__(self, robot_name: str, channel_id: int, meta_request_type: int, flags: int, total_len: int,
+                 hako_time_us: int, asset_time_us: int, real_time_us: int, body: memoryview):
+        self.robot_name = robot_name
+        self.channel_id = channel_id
+        self.meta_request_type = meta_request_type
+        self.flags = flags
+        self.total_len = total_len
+        self.hako_time_us = hako_time_us
+        self.asset_time_us = asset_time_us
+        self.real_time_us = real_time_us
+        self.body = body
+        self._meta_pdu = None
+
+    @classmethod
+    def parse(cls, frame) -> Optional['PacketView']:
+        """Returns the view of a v2 frame, or None if the header is invalid or the body is truncated."""
+        if frame is None or len(frame) < TOTAL_PDU_META_SIZE:
+            return None
+        (name, magicno, version, flags, _reserved, meta_request_type, total_len, body_len,
+         hako_time_us, asset_time_us, real_time_us, channel_id) = V2_HEADER_STRUCT.unpack_from(frame, 0)
+        if version != HAKO_META_VER or magicno != HAKO_META_MAGIC:
+            return None
+        end = TOTAL_PDU_META_SIZE + body_len
+        if len(frame) < end:
+            return None
+        return cls(_robot_name_from_field(name), channel_id, meta_request_type, flags, total_len,
+                   hako_time_us, asset_time_us, real_time_us, memoryview(frame)[TOTAL_PDU_META_SIZE:end])
+
+    @property
+    def meta_pdu(self) -> MetaPdu:
+        if self._meta_pdu is None:
+            self._meta_pdu = self._new_meta_pdu()
+        return self._meta_pdu
+
+    def _new_meta_pdu(self) -> MetaPdu:
+        meta = MetaPdu()
+        meta.robot_name = self.robot_name
+        meta.channel_id = self.channel_id
+        meta.magicno = HAKO_META_MAGIC
+        meta.version = HAKO_META_VER
+        meta.flags = self.flags
+        meta.meta_request_type = self.meta_request_type
+        meta.total_len = self.total_len
+        meta.body_len = len(self.body)
+        meta.hako_time_us = self.hako_time_us
+        meta.asset_time_us = self.asset_time_us
+        meta.real_time_us = self.real_time_us
+        return meta
+
+    def get_robot_name(self) -> str:
+        return self.robot_name
+
+    def get_channel_id(self) -> int:
+        return self.channel_id
+
+    def get_pdu_data(self) -> memoryview:
+        return self.body
+
+    @property
+    def body_data(self) -> memoryview:
+        return self.body
+
+    def to_packet(self) -> 'DataPacket':
+        """Returns a DataPacket with its own copy of the body."""
+        return DataPacket(meta=self._new_meta_pdu(), body_data=bytearray(self.body))
+
+
 class DataPacket:
     def __init__(self, robot_name: str = "", channel_id: int = 0, body_data: bytearray | None = None,
                  *, meta: MetaPdu | None = None):
@@ -79,34 +229,11 @@ class DataPacket:
             return self._encode_v2(meta_request_type)
 
     def _encode_v2(self, meta_request_type: int) -> bytearray:
-        # setter経由の値ズレを防ぐため、送信直前に同期
-        self.meta_pdu.robot_name = self.robot_name
-        self.meta_pdu.channel_id = self.channel_id
-
-        body_len = len(self.body_data)  # = [HakoMeta24 + Base+Heap] の総長
-        self.meta_pdu.magicno = HAKO_META_MAGIC
-        self.meta_pdu.version = HAKO_META_VER
-        self.meta_pdu.flags = 0
-        self.meta_pdu.meta_request_type = meta_request_type if meta_request_type is not None else 0
-        self.meta_pdu.body_len = body_len
-        # 「自分（4B）を除く残り」
-        self.meta_pdu.total_len = (META_FIXED_SIZE - 4) + body_len
-        header = bytearray(TOTAL_PDU_META_SIZE)
-        self._write_fixed_string(header, 0, ROBOT_NAME_FIXED_SIZE, self.meta_pdu.robot_name)
-        base_off = ROBOT_NAME_FIXED_SIZE
-        struct.pack_into("<I", header, base_off + 0, self.meta_pdu.magicno)
-        struct.pack_into("<H", header, base_off + 4, self.meta_pdu.version)
-        struct.pack_into("<H", header, base_off + 6, self.meta_pdu.flags)
-        struct.pack_into("<I", header, base_off + 8, 0)  # reserved
-        struct.pack_into("<I", header, base_off + 12, self.meta_pdu.meta_request_type)
-        struct.pack_into("<I", header, base_off + 16, self.meta_pdu.total_len)
-        struct.pack_into("<I", header, base_off + 20, self.meta_pdu.body_len)
-        struct.pack_into("<Q", header, base_off + 24, self.meta_pdu.hako_time_us)
-        struct.pack_into("<Q", header, base_off + 32, self.meta_pdu.asset_time_us)
-        struct.pack_into("<Q", header, base_off + 40, self.meta_pdu.real_time_us)
-        struct.pack_into("<i", header, base_off + 48, self.meta_pdu.channel_id)
-        header.extend(self.body_data)
-        return header
+        meta = self.meta_pdu
+        return encode_v2(self.robot_name, self.channel_id, self.body_data,
+                         meta_request_type if meta_request_type is not None else 0,
+                         hako_time_us=meta.hako_time_us, asset_time_us=meta.asset_time_us,
+                         real_time_us=meta.real_time_us)
 
 
     def _encode_v1(self) -> bytearray:
@@ -144,30 +271,10 @@ class DataPacket:
 
     @classmethod
     def _decode_v2(cls, frame: bytes) -> Optional['DataPacket']:
-        if frame is None or len(frame) < TOTAL_PDU_META_SIZE:
-            return None
-
-        base_off = ROBOT_NAME_FIXED_SIZE
-        meta = MetaPdu()
-        meta.robot_name = cls._read_fixed_string(frame, 0, ROBOT_NAME_FIXED_SIZE)
-        meta.magicno = struct.unpack_from("<I", frame, base_off + 0)[0]
-        meta.version = struct.unpack_from("<H", frame, base_off + 4)[0]
-        meta.flags = struct.unpack_from("<H", frame, base_off + 6)[0]
-        meta.meta_request_type = struct.unpack_from("<I", frame, base_off + 12)[0]
-        meta.total_len = struct.unpack_from("<I", frame, base_off + 16)[0]
-        meta.body_len = struct.unpack_from("<I", frame, base_off + 20)[0]
-        meta.hako_time_us = struct.unpack_from("<Q", frame, base_off + 24)[0]
-        meta.asset_time_us = struct.unpack_from("<Q", frame, base_off + 32)[0]
-        meta.real_time_us = struct.unpack_from("<Q", frame, base_off + 40)[0]
-        meta.channel_id = struct.unpack_from("<i", frame, base_off + 48)[0]
-        if meta.version != HAKO_META_VER or meta.magicno != HAKO_META_MAGIC:
+        view = PacketView.parse(frame)
+        if view is None:
             return None
-        end = TOTAL_PDU_META_SIZE + meta.body_len
-        if len(frame) < end:
-            return None
-
-        pkt = cls(meta=meta, body_data=bytearray(frame[TOTAL_PDU_META_SIZE:end]))
-        return pkt
+        return cls(meta=view._new_meta_pdu(), body_data=bytearray(view.body))
 
     @staticmethod
     def _decode_v1(data: bytearray) -> Optional['DataPacket']:
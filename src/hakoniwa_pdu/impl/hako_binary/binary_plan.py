@@ -0,0 +1,353 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import pickle
+import struct
+
+from hakoniwa_pdu._optional_numpy import require_numpy
+from . import binary_io
+
+# node kinds of a compiled plan
+_VALUE = 0          # single primitive with a struct format
+_STRING = 1         # single string
+_ARRAY = 2          # fixed-length primitive array
+_VARRAY = 3         # variable-length primitive array
+_STRUCT = 4         # single nested struct
+_STRUCT_ARRAY = 5   # fixed-length struct array
+_STRUCT_VARRAY = 6  # variable-length struct array
+_RAW_VALUE = 7      # single primitive without a struct format
+_RAW_ARRAY = 8      # primitive array without a struct format (e.g. string[N])
+_ARRAY_VIEW = 9     # fixed-length primitive array decoded as a numpy view
+_VARRAY_VIEW = 10   # variable-length primitive array decoded as a numpy view
+
+# how primitive arrays are returned by decode
+ARRAY_MODE_TUPLE = "tuple"
+ARRAY_MODE_NUMPY = "numpy"
+ARRAY_MODES = (ARRAY_MODE_TUPLE, ARRAY_MODE_NUMPY)
+
+_META_SIZE = binary_io.PduMetaData.PDU_META_DATA_SIZE
+
+class BinaryPlan:
+    """
+    Compiled binary layout of one PDU type.
+
+    Every fixed-offset primitive of the type, including the members of nested
+    structs and fixed-length struct arrays, is merged into a single
+    ``struct.Struct`` covering the whole base area, so that one ``unpack_from``
+    reads it and one ``pack_into`` writes it. ``nodes`` describes how the flat
+    value tuple maps to the JSON structure.
+
+    With ``ARRAY_MODE_NUMPY`` numeric arrays are left out of the Struct and are
+    decoded as ``numpy.frombuffer`` views over the original buffer.
+    """
+    __slots__ = ("type_name", "struct", "nodes", "defaults", "has_heap", "template")
+
+    def __init__(self, type_name, struct_obj, nodes, defaults, has_heap):
+        self.type_name = type_name
+        self.struct = struct_obj
+        self.nodes = nodes
+        self.defaults = defaults
+        self.has_heap = has_heap
+        self.template = None
+
+    def decode(self, binary_data, base_off, heap_off) -> dict:
+        values = self.struct.unpack_from(binary_data, base_off)
+        return _decode_nodes(self.nodes, values, binary_data, base_off, heap_off)
+
+    def empty_json(self) -> dict:
+        """
+        Return a zero-initialized JSON structure.
+
+        The structure is decoded once from a zeroed buffer and kept as a pickle
+        blob; each call unpickles an independent copy, which is much cheaper
+        than decoding again or deep-copying the nested dicts.
+        """
+        if self.template is None:
+            empty = self.decode(bytearray(_META_SIZE + self.struct.size), _META_SIZE, 0)
+            self.template = pickle.dumps(empty, pickle.HIGHEST_PROTOCOL)
+        return pickle.loads(self.template)
+
+    def heap_size(self, json_data) -> int:
+        if not self.has_heap:
+            return 0
+        return _heap_size(self.nodes, json_data)
+
+    def encoded_size(self, json_data) -> int:
+        """Return the total PDU size (meta + base + heap) needed to encode json_data."""
+        return _META_SIZE + self.struct.size + self.heap_size(json_data)
+
+    def encode(self, json_data) -> bytearray:
+        binary_data = bytearray(self.encoded_size(json_data))
+        self.write(json_data, binary_data)
+        return binary_data
+
+    def write(self, json_data, binary_data) -> int:
+        """
+        Encode json_data into binary_data, which must hold at least encoded_size() bytes.
+
+        Every byte in [0, total_size) is written, so a buffer can be reused.
+        Returns total_size.
+        """
+        values, raw_writes, total_size = self.fill(json_data, binary_data)
+        self.struct.pack_into(binary_data, _META_SIZE, *values)
+        for off, binary in raw_writes:
+            binary_data[off:off + len(binary)] = binary
+        binary_io.PduMetaData.PDU_META_DATA_STRUCT.pack_into(
+            binary_data, 0,
+            binary_io.PduMetaData.PDU_META_DATA_MAGICNO,
+            binary_io.PduMetaData.PDU_META_DATA_VERSION,
+            _META_SIZE, _META_SIZE + self.struct.size, total_size)
+        return total_size
+
+    def fill(self, json_data, binary_data, chunks=None):
+        """
+        Write the heap of json_data into binary_data without packing the base area.
+
+        When chunks is a list, the heap is not written: one ``(offset, bytes)``
+        chunk is appended to it per primitive varray (its data) and per struct
+        varray (its element block), in heap order. DeltaEncoder compares these
+        with the chunks of the last call.
+
+        Returns the flat base-area values, the deferred ``(offset, bytes)`` writes
+        of members without a struct format, and the total PDU size.
+        """
+        context = _EncodeContext(_META_SIZE + self.struct.size, chunks)
+        values = list(self.defaults)
+        _encode_nodes(self.nodes, json_data, values, binary_data, _META_SIZE, context)
+        return values, context.raw_writes, context.heap_pos
+
+    def write_at(self, json_data, binary_data, base_off, context):
+        values = list(self.defaults)
+        _encode_nodes(self.nodes, json_data, values, binary_data, base_off, context)
+        self.struct.pack_into(binary_data, base_off, *values)
+
+class _EncodeContext:
+    __slots__ = ("heap_off", "heap_pos", "raw_writes", "chunks")
+
+    def __init__(self, heap_off, chunks=None):
+        self.heap_off = heap_off
+        self.heap_pos = heap_off
+        # primitives without a struct format are written after the base area is packed
+        self.raw_writes = []
+        # heap chunks collected instead of written, see BinaryPlan.fill
+        self.chunks = chunks
+
+class _PlanBuilder:
+    def __init__(self, offmap, array_mode):
+        self.offmap = offmap
+        self.array_mode = array_mode
+        self.fmt = ["<"]
+        self.defaults = []
+        self.pos = 0
+        self.has_heap = False
+
+    def add_padding(self, off):
+        if off < self.pos:
+            raise ValueError(f"overlapping member at offset {off}")
+        if off > self.pos:
+            self.fmt.append(f"{off - self.pos}x")
+            self.pos = off
+
+    def add_field(self, off, fmt, count, default=0):
+        self.add_padding(off)
+        self.fmt.append(fmt)
+        self.pos = off + struct.calcsize("<" + fmt)
+        index = len(self.defaults)
+        self.defaults.extend([default] * count)
+        return index
+
+    def build_nodes(self, typename, base_off):
+        layout = self.offmap.get_layout(typename)
+        nodes = []
+        for member in layout.members:
+            off = base_off + member.offset
+            name = member.name
+            type = member.type_name
+            if member.is_primitive:
+                fmt = binary_io.PRIMITIVE_FORMATS.get(type)
+                if member.is_single:
+                    if fmt is not None:
+                        nodes.append((_VALUE, name, self.add_field(off, fmt, 1), fmt))
+                    elif type == "string":
+                        nodes.append((_STRING, name, self.add_field(off, f"{member.size}s", 1, b""), member.size))
+                    else:
+                        nodes.append((_RAW_VALUE, name, None, (type, off, member.size)))
+                elif member.is_array:
+                    if fmt is not None and self.array_mode == ARRAY_MODE_NUMPY:
+                        dtype = require_numpy().dtype("<" + fmt)
+                        nodes.append((_ARRAY_VIEW, name, None, (type, off, member.size, member.array_len, dtype)))
+                    elif fmt is not None:
+                        index = self.add_field(off, f"{member.array_len}{fmt}", member.array_len)
+                        nodes.append((_ARRAY, name, index, (type, off, member.size, member.array_len)))
+                    else:
+                        nodes.append((_RAW_ARRAY, name, None, (type, off, member.size, member.elm_size)))
+                else:
+                    self.has_heap = True
+                    index = self.add_field(off, "ii", 2)
+                    if fmt is not None and self.array_mode == ARRAY_MODE_NUMPY:
+                        nodes.append((_VARRAY_VIEW, name, index, (type, member.elm_size, require_numpy().dtype("<" + fmt))))
+                    else:
+                        nodes.append((_VARRAY, name, index, (type, member.elm_size)))
+            else:
+                if member.is_single:
+                    nodes.append((_STRUCT, name, None, self.build_nodes(type, off)))
+                elif member.is_array:
+                    elements = tuple(self.build_nodes(type, off + i * member.elm_size) for i in range(member.array_len))
+                    nodes.append((_STRUCT_ARRAY, name, None, elements))
+                else:
+                    self.has_heap = True
+                    element_plan = self.offmap.get_plan(type, self.array_mode)
+                    nodes.append((_STRUCT_VARRAY, name, self.add_field(off, "ii", 2), (element_plan, member.elm_size)))
+        return tuple(nodes)
+
+def compile_plan(offmap, typename, array_mode=ARRAY_MODE_TUPLE) -> BinaryPlan:
+    if array_mode not in ARRAY_MODES:
+        raise ValueError(f"unknown array_mode: {array_mode}")
+    if array_mode == ARRAY_MODE_NUMPY:
+        require_numpy()
+    builder = _PlanBuilder(offmap, array_mode)
+    nodes = builder.build_nodes(typename, 0)
+    builder.add_padding(offmap.get_layout(typename).base_size)
+    return BinaryPlan(typename, struct.Struct("".join(builder.fmt)), nodes, tuple(builder.defaults), builder.has_heap)
+
+def _decode_nodes(nodes, values, binary_data, base_off, heap_off):
+    json_data = {}
+    for kind, name, index, arg in nodes:
+        if kind == _VALUE:
+            json_data[name] = values[index]
+        elif kind == _STRUCT:
+            json_data[name] = _decode_nodes(arg, values, binary_data, base_off, heap_off)
+        elif kind == _STRING:
+            json_data[name] = binary_io.binTostring(values[index])
+        elif kind == _ARRAY:
+            type, off, size, array_len = arg
+            json_data[name + '__raw'] = binary_data[base_off + off:base_off + off + size]
+            json_data[name] = values[index:index + array_len]
+        elif kind == _VARRAY:
+            type, elm_size = arg
+            start = heap_off + values[index + 1]
+            array_value = binary_data[start:start + elm_size * values[index]]
+            json_data[name + '__raw'] = array_value
+            json_data[name] = binary_io.binToArrayValues(type, array_value)
+        elif kind == _STRUCT_ARRAY:
+            json_data[name] = [_decode_nodes(element, values, binary_data, base_off, heap_off) for element in arg]
+        elif kind == _STRUCT_VARRAY:
+            element_plan, elm_size = arg
+            start = heap_off + values[index + 1]
+            json_data[name] = [element_plan.decode(binary_data, start + i * elm_size, heap_off) for i in range(values[index])]
+        elif kind == _VARRAY_VIEW:
+            type, elm_size, dtype = arg
+            start = heap_off + values[index + 1]
+            json_data[name + '__raw'] = memoryview(binary_data)[start:start + elm_size * values[index]]
+            json_data[name] = require_numpy().frombuffer(binary_data, dtype, values[index], start)
+        elif kind == _ARRAY_VIEW:
+            type, off, size, array_len, dtype = arg
+            start = base_off + off
+            json_data[name + '__raw'] = memoryview(binary_data)[start:start + size]
+            json_data[name] = require_numpy().frombuffer(binary_data, dtype, array_len, start)
+        elif kind == _RAW_VALUE:
+            type, off, size = arg
+            json_data[name] = binary_io.binTovalue(type, binary_data[base_off + off:base_off + off + size])
+        else:
+            type, off, size, elm_size = arg
+            array_value = binary_data[base_off + off:base_off + off + size]
+            json_data[name + '__raw'] = array_value
+            json_data[name] = binary_io.binToArrayValues(type, array_value)
+    return json_data
+
+def _encode_nodes(nodes, json_data, values, binary_data, base_off, context):
+    for kind, name, index, arg in nodes:
+        if name not in json_data:
+            continue
+        value = json_data[name]
+        if kind == _VALUE:
+            values[index] = value
+        elif kind == _STRUCT:
+            _encode_nodes(arg, value, values, binary_data, base_off, context)
+        elif kind == _STRING:
+            # keep the terminating NUL inside the member
+            values[index] = value.encode('utf-8')[:arg - 1]
+        elif kind == _ARRAY:
+            type, off, size, array_len = arg
+            count = min(len(value), array_len)
+            values[index:index + count] = value[:count]
+        elif kind == _VARRAY or kind == _VARRAY_VIEW:
+            type, elm_size = arg[0], arg[1]
+            binary = binary_io.typeTobin_array(type, value, elm_size)
+            start = context.heap_pos
+            if context.chunks is None:
+                binary_data[start:start + len(binary)] = binary
+            else:
+                # a view of the caller's buffer is copied: the chunk outlives this call
+                context.chunks.append((start, bytes(binary)))
+            context.heap_pos = start + len(binary)
+            values[index] = len(value)
+            values[index + 1] = start - context.heap_off
+        elif kind == _STRUCT_ARRAY:
+            for element_nodes, element in zip(arg, value):
+                _encode_nodes(element_nodes, element, values, binary_data, base_off, context)
+        elif kind == _STRUCT_VARRAY:
+            element_plan, elm_size = arg
+            start = context.heap_pos
+            context.heap_pos = start + len(value) * elm_size
+            values[index] = len(value)
+            values[index + 1] = start - context.heap_off
+            if context.chunks is not None:
+                _encode_block(element_plan, elm_size, value, start, context)
+                continue
+            tail = elm_size - element_plan.struct.size
+            for i, element in enumerate(value):
+                elm_off = start + i * elm_size
+                element_plan.write_at(element, binary_data, elm_off, context)
+                if tail > 0:
+                    binary_data[elm_off + elm_size - tail:elm_off + elm_size] = bytes(tail)
+        elif kind == _RAW_VALUE:
+            type, off, size = arg
+            binary = binary_io.typeTobin(type, value)
+            if binary is not None:
+                context.raw_writes.append((base_off + off, binary[:size]))
+        elif kind == _ARRAY_VIEW:
+            type, off, size, array_len, dtype = arg
+            binary = binary_io.typeTobin_array(type, value, size // array_len)
+            context.raw_writes.append((base_off + off, _fit(binary, size)))
+        else:
+            type, off, size, elm_size = arg
+            binary = binary_io.typeTobin_array(type, value, elm_size)
+            context.raw_writes.append((base_off + off, _fit(binary, size)))
+
+def _encode_block(element_plan, elm_size, value, start, context):
+    # the elements of a struct varray are packed into a zero-filled chunk of their own
+    block = bytearray(len(value) * elm_size)
+    context.chunks.append((start, block))
+    mark = len(context.raw_writes)
+    for i, element in enumerate(value):
+        element_plan.write_at(element, block, i * elm_size, context)
+    # members without a struct format of the elements belong to the block
+    for off, binary in context.raw_writes[mark:]:
+        block[off:off + len(binary)] = binary
+    del context.raw_writes[mark:]
+
+def _fit(binary, size):
+    # short arrays are zero-filled so that a reused buffer keeps no stale bytes
+    if len(binary) >= size:
+        return binary[:size]
+    return bytes(binary) + bytes(size - len(binary))
+
+def _heap_size(nodes, json_data):
+    size = 0
+    for kind, name, index, arg in nodes:
+        if name not in json_data:
+            continue
+        value = json_data[name]
+        if kind == _VARRAY or kind == _VARRAY_VIEW:
+            size += len(value) * arg[1]
+        elif kind == _STRUCT:
+            size += _heap_size(arg, value)
+        elif kind == _STRUCT_ARRAY:
+            for element_nodes, element in zip(arg, value):
+                size += _heap_size(element_nodes, element)
+        elif kind == _STRUCT_VARRAY:
+            element_plan, elm_size = arg
+            size += len(value) * elm_size
+            for element in value:
+                size += element_plan.heap_size(element)
+    return size
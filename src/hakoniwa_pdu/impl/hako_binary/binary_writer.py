@@ -43,14 +43,8 @@ class BinaryWriterContainer:
         self.meta.set_empty()
 
 def binary_write(offmap, binary_data, json_data, typename):
-    base_allocator = DynamicAllocator(False)
-    bw_container = BinaryWriterContainer()
-    binary_write_recursive(0, bw_container, offmap, base_allocator, json_data, typename)
-
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
+    plan = offmap.get_plan(typename)
+    total_size = plan.encoded_size(json_data)
 
     # binary_data のサイズを total_size に調整
     if len(binary_data) < total_size:
@@ -58,14 +52,22 @@ def binary_write(offmap, binary_data, json_data, typename):
     elif len(binary_data) > total_size:
         del binary_data[total_size:]
 
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
+    plan.write(json_data, binary_data)
 
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
+def binary_encode(offmap, json_data, typename) -> bytearray:
+    """Encode json_data into a newly allocated bytearray of exactly total_size bytes."""
+    return offmap.get_plan(typename).encode(json_data)
 
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
+def binary_encode_into(offmap, json_data, typename, out) -> int:
+    """
+    Encode json_data into out (a bytearray or writable memoryview) and
+    return the number of bytes written. Bytes of out past total_size are left untouched.
+    """
+    plan = offmap.get_plan(typename)
+    total_size = plan.encoded_size(json_data)
+    if len(out) < total_size:
+        raise ValueError(f"output buffer too small for {typename}: {len(out)} < {total_size}")
+    return plan.write(json_data, out)
 
 def get_binary(type, bin, elm_size):
     if type == "string":
@@ -76,59 +78,40 @@ def get_binary(type, bin, elm_size):
         return bin
 
 def binary_write_recursive(parent_off: int, bw_container: BinaryWriterContainer, offmap, allocator, json_data, typename):
-    lines = offmap.get(typename)
+    layout = offmap.get_layout(typename)
     for key in json_data:
-        line = offset_parser.select_by_name(lines, key)
-        if line is None:
+        member = layout.by_name.get(key)
+        if member is None:
             continue
-        type = offset_parser.member_type(line)
-        off = offset_parser.member_off(line)
-        #print(f"key: {key} type: {type} off: {off} line: {line}")
-        if offset_parser.is_primitive(line):
-            if offset_parser.is_single(line):
+        type = member.type_name
+        off = member.offset
+        if member.is_primitive:
+            if member.is_single:
                 bin = binary_io.typeTobin(type, json_data[key])
-                bin = get_binary(type, bin, offset_parser.member_size(line))
-                # print(f"{type} {key} = {json_data[key]} : bin: {bin} size: {offset_parser.member_size(line)} bin_size: {len(bin)}")
+                bin = get_binary(type, bin, member.size)
                 allocator.add(bin, expected_offset=parent_off + off)
-            elif offset_parser.is_array(line):
-                elm_size = offset_parser.member_size(line)
-                array_size = offset_parser.array_size(line)
-                one_elm_size = int(elm_size / array_size)
-                #for i, elm in enumerate(json_data[key]):
-                #    bin = binary_io.typeTobin(type, elm)
-                #    bin = get_binary(type, bin, one_elm_size)
-                #    allocator.add(bin, expected_offset=(parent_off + off + i * one_elm_size))
-                binary = binary_io.typeTobin_array(type, json_data[key], one_elm_size)
+            elif member.is_array:
+                binary = binary_io.typeTobin_array(type, json_data[key], member.elm_size)
                 allocator.add(binary, expected_offset=(parent_off + off))
             else:  # varray
                 offset_from_heap = bw_container.heap_allocator.size()
                 array_size = len(json_data[key])
-                #print(f"varray: {key} array_size: {array_size} offset_from_heap: {offset_from_heap}")
-                #for i, elm in enumerate(json_data[key]):
-                #    bin = binary_io.typeTobin(type, elm)
-                #    bin = get_binary(type, bin, offset_parser.member_size(line))
-                #    bw_container.heap_allocator.add(bin, expected_offset=0)
-                binary = binary_io.typeTobin_array(type, json_data[key], offset_parser.member_size(line))
+                binary = binary_io.typeTobin_array(type, json_data[key], member.elm_size)
                 bw_container.heap_allocator.add(binary, expected_offset=0)
                 a_b = array_size.to_bytes(4, byteorder='little')
                 o_b = offset_from_heap.to_bytes(4, byteorder='little')
                 allocator.add(a_b + o_b, expected_offset=parent_off + off)
         else:
-            if offset_parser.is_single(line):
+            if member.is_single:
                 binary_write_recursive(parent_off + off, bw_container, offmap, allocator, json_data[key], type)
-            elif offset_parser.is_array(line):
+            elif member.is_array:
                 for i, elm in enumerate(json_data[key]):
-                    elm_size = offset_parser.member_size(line)
-                    array_size = offset_parser.array_size(line)
-                    one_elm_size = int(elm_size / array_size)
-                    binary_write_recursive((parent_off + off + i * one_elm_size), bw_container, offmap, allocator, elm, type)
+                    binary_write_recursive((parent_off + off + i * member.elm_size), bw_container, offmap, allocator, elm, type)
             else:  # varray
                 offset_from_heap = bw_container.heap_allocator.size()
                 array_size = len(json_data[key])
                 for i, elm in enumerate(json_data[key]):
-                    one_elm_size = offset_parser.member_size(line)
-                    #binary_write_recursive(0, bw_container, offmap, bw_container.heap_allocator, elm, type)
-                    binary_write_recursive(parent_off + i * one_elm_size, bw_container, offmap, bw_container.heap_allocator, elm, type)
+                    binary_write_recursive(parent_off + i * member.elm_size, bw_container, offmap, bw_container.heap_allocator, elm, type)
                 a_b = array_size.to_bytes(4, byteorder='little')
                 o_b = offset_from_heap.to_bytes(4, byteorder='little')
                 allocator.add(a_b + o_b, expected_offset=parent_off + off)
@@ -0,0 +1,274 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import struct
+
+from hakoniwa_pdu.pdu_msgs.pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from . import binary_io
+
+_META = binary_io.PduMetaData.PDU_META_DATA_STRUCT
+_META_SIZE = binary_io.PduMetaData.PDU_META_DATA_SIZE
+_VARRAY_REF = struct.Struct("<ii")
+
+# CDR format of the hako primitives whose binary layout differs (bool is an int32 in a PDU)
+_CDR_FORMATS = {"bool": "?"}
+
+# op kinds of a compiled transcode plan
+_RUN = 0            # consecutive single primitives (nested fixed-size structs are flattened)
+_ARRAY = 1          # fixed-length primitive array, copied in bulk
+_BOOL_ARRAY = 2     # fixed-length bool array (int32 elements in the PDU, one byte in CDR)
+_STRING = 3         # single fixed-size string member
+_VARRAY = 4         # primitive varray, copied in bulk
+_BOOL_VARRAY = 5
+_STRING_VARRAY = 6
+_STRUCT_VARRAY = 7
+
+class CdrTranscodePlan:
+    """
+    Compiled hako binary <-> CDR transcoder of one PDU type.
+
+    Fields are streamed between the PDU buffer and a CdrWriter / CdrReader
+    without building the Python object (or dictionary) of the message.
+    Consecutive primitive members, including those of nested structs and
+    fixed-size struct arrays, are moved with one precompiled struct on each
+    side; primitive arrays and varrays are copied as bytes. The hako binary
+    written by from_cdr has the same layout as PduConvertor.convert_json_to_binary.
+    """
+    __slots__ = ("type_name", "ops", "base_size")
+
+    def __init__(self, type_name, ops, base_size):
+        self.type_name = type_name
+        self.ops = ops
+        self.base_size = base_size
+
+    def to_cdr(self, binary_data) -> bytes:
+        """Return the CDR payload (with encapsulation header) of the hako PDU binary_data."""
+        if len(binary_data) < _META_SIZE:
+            raise ValueError(f"Invalid PDU binary data for {self.type_name}: MetaData not found or corrupted")
+        magicno, version, base_off, heap_off, total_size = _META.unpack_from(binary_data, 0)
+        if magicno != binary_io.PduMetaData.PDU_META_DATA_MAGICNO or version != binary_io.PduMetaData.PDU_META_DATA_VERSION:
+            raise ValueError(f"Invalid PDU binary data for {self.type_name}: MetaData not found or corrupted")
+        # the PDU size is nearly always enough for the CDR payload; the writer grows otherwise
+        writer = CdrWriter(total_size)
+        writer.write_encapsulation()
+        self.write_cdr(writer, memoryview(binary_data).cast("B"), base_off, heap_off)
+        return writer.bytes()
+
+    def from_cdr(self, cdr_payload, out=None):
+        """
+        Decode a CDR payload into a hako PDU.
+
+        Returns a new bytearray, or, when out (a bytearray or writable memoryview)
+        is given, writes the PDU into it from offset 0 and returns the total size.
+
+        Raises:
+            ValueError: If out is too small for the PDU.
+            CdrError: If the payload is malformed or truncated.
+        """
+        reader = CdrReader(cdr_payload)
+        reader.read_encapsulation()
+        heap_off = _META_SIZE + self.base_size
+        if out is None:
+            context = _HeapContext(bytearray(heap_off), heap_off, True)
+        else:
+            if len(out) < heap_off:
+                raise ValueError(f"output buffer too small: {len(out)} < {heap_off}")
+            # padding between members is not written by the ops
+            out[:heap_off] = bytes(heap_off)
+            context = _HeapContext(out, heap_off, False)
+        self.read_cdr(reader, context, _META_SIZE)
+        _META.pack_into(
+            context.binary_data, 0,
+            binary_io.PduMetaData.PDU_META_DATA_MAGICNO,
+            binary_io.PduMetaData.PDU_META_DATA_VERSION,
+            _META_SIZE, heap_off, context.heap_pos)
+        if out is None:
+            return context.binary_data
+        return context.heap_pos
+
+    def write_cdr(self, writer, view, base_off, heap_off):
+        for kind, off, arg in self.ops:
+            pos = base_off + off
+            if kind == _RUN:
+                hako_struct, run = arg
+                writer.write_run(run, hako_struct.unpack_from(view, pos))
+            elif kind == _ARRAY:
+                fmt, size, array_len = arg
+                writer.write_sequence_bytes(fmt, view[pos:pos + size])
+            elif kind == _STRING:
+                raw = view[pos:pos + arg]
+                end = raw.tobytes().find(b"\x00")
+                writer.write_string_bytes(raw if end < 0 else raw[:end])
+            elif kind == _BOOL_ARRAY:
+                writer.write_sequence("?", struct.unpack_from(f"<{arg}i", view, pos))
+            else:
+                count, offset_from_heap = _VARRAY_REF.unpack_from(view, pos)
+                start = heap_off + offset_from_heap
+                writer.write_uint32(count)
+                if kind == _VARRAY:
+                    fmt, elm_size = arg
+                    writer.write_sequence_bytes(fmt, view[start:start + count * elm_size])
+                elif kind == _STRUCT_VARRAY:
+                    element_plan, elm_size = arg
+                    for i in range(count):
+                        element_plan.write_cdr(writer, view, start + i * elm_size, heap_off)
+                elif kind == _STRING_VARRAY:
+                    for i in range(count):
+                        raw = view[start + i * arg:start + (i + 1) * arg]
+                        end = raw.tobytes().find(b"\x00")
+                        writer.write_string_bytes(raw if end < 0 else raw[:end])
+                else:
+                    writer.write_sequence("?", struct.unpack_from(f"<{count}i", view, start))
+
+    def read_cdr(self, reader, context, base_off):
+        # a growable output is extended in place, so binary_data stays valid
+        binary_data = context.binary_data
+        for kind, off, arg in self.ops:
+            pos = base_off + off
+            if kind == _RUN:
+                hako_struct, run = arg
+                hako_struct.pack_into(binary_data, pos, *reader.read_run(run))
+            elif kind == _ARRAY:
+                fmt, size, array_len = arg
+                binary_data[pos:pos + size] = reader.read_sequence_bytes(fmt, array_len)
+            elif kind == _STRING:
+                # keep the terminating NUL inside the member
+                raw = reader.read_string_bytes()[:arg - 1]
+                binary_data[pos:pos + len(raw)] = raw
+            elif kind == _BOOL_ARRAY:
+                struct.pack_into(f"<{arg}i", binary_data, pos, *reader.read_sequence("?", arg))
+            else:
+                count = reader.read_uint32()
+                if kind == _VARRAY:
+                    fmt, elm_size = arg
+                    start = context.append(reader.read_sequence_bytes(fmt, count))
+                elif kind == _STRUCT_VARRAY:
+                    element_plan, elm_size = arg
+                    start = context.reserve(count * elm_size)
+                    for i in range(count):
+                        element_plan.read_cdr(reader, context, start + i * elm_size)
+                elif kind == _STRING_VARRAY:
+                    start = context.reserve(count * arg)
+                    for i in range(count):
+                        raw = reader.read_string_bytes()[:arg - 1]
+                        binary_data[start + i * arg:start + i * arg + len(raw)] = raw
+                else:
+                    values = reader.read_sequence("?", count)
+                    start = context.append(struct.pack(f"<{count}i", *values))
+                _VARRAY_REF.pack_into(binary_data, pos, count, start - context.heap_off)
+
+class _HeapContext:
+    """Output buffer of from_cdr; varray data is appended to the heap in member order."""
+    __slots__ = ("binary_data", "heap_off", "heap_pos", "growable")
+
+    def __init__(self, binary_data, heap_off, growable):
+        self.binary_data = binary_data
+        self.heap_off = heap_off
+        self.heap_pos = heap_off
+        self.growable = growable
+
+    def reserve(self, size) -> int:
+        """Zero-fill size bytes at the end of the heap and return their offset."""
+        start = self.heap_pos
+        end = start + size
+        if self.growable:
+            self.binary_data += bytes(size)
+        elif end > len(self.binary_data):
+            raise ValueError(f"output buffer too small: {len(self.binary_data)} < {end}")
+        else:
+            self.binary_data[start:end] = bytes(size)
+        self.heap_pos = end
+        return start
+
+    def append(self, raw) -> int:
+        start = self.heap_pos
+        end = start + len(raw)
+        if self.growable:
+            self.binary_data += raw
+        elif end > len(self.binary_data):
+            raise ValueError(f"output buffer too small: {len(self.binary_data)} < {end}")
+        else:
+            self.binary_data[start:end] = raw
+        self.heap_pos = end
+        return start
+
+class _PlanBuilder:
+    def __init__(self, offmap):
+        self.offmap = offmap
+        self.ops = []
+        # pending run: start offset, hako struct format, CDR formats
+        self.run_start = None
+        self.run_fmt = []
+        self.run_end = 0
+        self.run_cdr = []
+
+    def add_run_member(self, off, fmt, cdr_fmt):
+        if self.run_start is None:
+            self.run_start = off
+            self.run_end = off
+        if off > self.run_end:
+            self.run_fmt.append(f"{off - self.run_end}x")
+        self.run_fmt.append(fmt)
+        self.run_cdr.append(cdr_fmt)
+        self.run_end = off + struct.calcsize("<" + fmt)
+
+    def flush_run(self):
+        if self.run_start is not None:
+            self.ops.append((_RUN, self.run_start,
+                             (struct.Struct("<" + "".join(self.run_fmt)), CdrRun("".join(self.run_cdr)))))
+            self.run_start = None
+            self.run_fmt = []
+            self.run_cdr = []
+
+    def add_op(self, kind, off, arg):
+        self.flush_run()
+        self.ops.append((kind, off, arg))
+
+    def build(self, typename, base_off):
+        layout = self.offmap.get_layout(typename)
+        for member in layout.members:
+            off = base_off + member.offset
+            type = member.type_name
+            if not member.is_primitive:
+                if member.is_single:
+                    self.build(type, off)
+                elif member.is_array:
+                    for i in range(member.array_len):
+                        self.build(type, off + i * member.elm_size)
+                else:
+                    element_plan = compile_cdr_plan(self.offmap, type)
+                    self.add_op(_STRUCT_VARRAY, off, (element_plan, member.elm_size))
+                continue
+            if type == "string":
+                if member.is_single:
+                    self.add_op(_STRING, off, member.size)
+                elif member.is_array:
+                    for i in range(member.array_len):
+                        self.add_op(_STRING, off + i * member.elm_size, member.elm_size)
+                else:
+                    self.add_op(_STRING_VARRAY, off, member.elm_size)
+                continue
+            fmt = binary_io.PRIMITIVE_FORMATS.get(type)
+            if fmt is None:
+                raise ValueError(f"{typename}.{member.name}: type {type} has no CDR mapping")
+            cdr_fmt = _CDR_FORMATS.get(type, fmt)
+            if member.is_single:
+                self.add_run_member(off, fmt, cdr_fmt)
+            elif member.is_array:
+                if cdr_fmt != fmt:
+                    self.add_op(_BOOL_ARRAY, off, member.array_len)
+                else:
+                    self.add_op(_ARRAY, off, (fmt, member.size, member.array_len))
+            elif cdr_fmt != fmt:
+                self.add_op(_BOOL_VARRAY, off, None)
+            else:
+                self.add_op(_VARRAY, off, (fmt, member.elm_size))
+
+def compile_cdr_plan(offmap, typename) -> CdrTranscodePlan:
+    plan = offmap.cdr_plans.get(typename)
+    if plan is None:
+        builder = _PlanBuilder(offmap)
+        builder.build(typename, 0)
+        builder.flush_run()
+        plan = CdrTranscodePlan(typename, tuple(builder.ops), offmap.get_layout(typename).base_size)
+        offmap.cdr_plans[typename] = plan
+    return plan
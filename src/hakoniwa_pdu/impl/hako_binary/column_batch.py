@@ -0,0 +1,318 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import struct
+
+from hakoniwa_pdu._optional_numpy import require_numpy
+from . import binary_io
+from . import record_view
+
+_META = binary_io.PduMetaData.PDU_META_DATA_STRUCT
+_META_SIZE = binary_io.PduMetaData.PDU_META_DATA_SIZE
+_VARRAY_REF = struct.Struct("<ii")
+
+class ColumnBatchLayout:
+    """
+    Struct-of-arrays layout of one struct varray member (e.g. ``drones`` of
+    DroneVisualStateArray), compiled from the offset files.
+
+    A batch is a dict of columns keyed by the dotted path of an element field
+    ("x", "time_from_start.sec", "transforms.translation.x"). Fixed fields are
+    arrays of shape (n, ...), a primitive varray of the elements is an (n, k)
+    array (or a sequence of n 1-D arrays when the lengths differ) and the fields
+    of a struct varray of the elements are (n, k, ...) arrays.
+
+    The elements are written as one structured array over the PDU heap and the
+    varray data of the elements as a second one, each filled column by column.
+    Inside a batch the order is that of PduConvertor.convert_json_to_binary: the
+    element block, then the varray data of element 0, 1, ... in member order.
+    encode_columns places the batches after the heap data of the other members,
+    so the bytes equal convert_json_to_binary only when the batched members are
+    the last varrays of the type (as ``drones`` of DroneVisualStateArray); the
+    PDU decodes the same either way.
+    """
+    __slots__ = ("type_name", "name", "member", "elm_dtype", "fields", "varrays", "varray_keys")
+
+    def __init__(self, type_name, name, member, elm_dtype, fields, varrays):
+        self.type_name = type_name
+        self.name = name
+        self.member = member
+        self.elm_dtype = elm_dtype
+        # (key, path, size of a single string or 0) of every fixed field of an element
+        self.fields = fields
+        # (key, path, element dtype, inner fields or None) of every varray of an element
+        self.varrays = varrays
+        # column key -> (varray index, field path inside a struct varray element)
+        self.varray_keys = {}
+        for index, (key, path, dtype, inner) in enumerate(varrays):
+            if inner is None:
+                self.varray_keys[key] = (index, ())
+            else:
+                for inner_key, inner_path, size in inner:
+                    self.varray_keys[f"{key}.{inner_key}"] = (index, inner_path)
+
+    def prepare(self, columns) -> "_ColumnBatch":
+        """
+        Check the columns of a batch and compute the heap size they need.
+
+        Raises:
+            ValueError: If a column is unknown or the columns differ in length.
+        """
+        numpy = require_numpy()
+        field_keys = {key: (path, size) for key, path, size in self.fields}
+        count = None
+        fixed = []
+        varray_columns = [[] for _ in self.varrays]
+        for key, value in columns.items():
+            if key in field_keys:
+                path, size = field_keys[key]
+                if size:
+                    # keep the terminating NUL inside a single string member
+                    value = numpy.asarray(value, dtype=f"S{size - 1}")
+                fixed.append((path, value))
+            elif key in self.varray_keys:
+                index, inner_path = self.varray_keys[key]
+                varray_columns[index].append((inner_path, value))
+            else:
+                raise ValueError(f"{self.type_name}.{self.name}: unknown column {key}")
+            if count is None:
+                count = len(value)
+            elif len(value) != count:
+                raise ValueError(f"{self.type_name}.{self.name}: column {key} has {len(value)} elements, expected {count}")
+        if count is None:
+            count = 0
+        varrays = tuple(self._prepare_varray(index, values, count) for index, values in enumerate(varray_columns))
+        size = count * self.member.elm_size
+        for (k, lengths, values), (key, path, dtype, inner) in zip(varrays, self.varrays):
+            size += (count * k if lengths is None else int(lengths.sum())) * dtype.itemsize
+        return _ColumnBatch(count, fixed, varrays, size)
+
+    def _prepare_varray(self, index, values, count):
+        """
+        Returns (k, None, [(inner path, column)]) when every element has k items,
+        or (0, lengths, rows) for a primitive varray with different lengths.
+        """
+        numpy = require_numpy()
+        key, path, dtype, inner = self.varrays[index]
+        if not values:
+            return 0, None, values
+        if inner is not None:
+            lengths = {numpy.shape(value)[1] if numpy.ndim(value) > 1 else -1 for inner_path, value in values}
+            if len(lengths) != 1 or -1 in lengths:
+                raise ValueError(f"{self.type_name}.{self.name}.{key}: struct varray columns must share one (n, k) shape")
+            return lengths.pop(), None, values
+        inner_path, value = values[0]
+        if isinstance(value, numpy.ndarray) and value.ndim == 2:
+            return value.shape[1], None, values
+        rows = [numpy.asarray(row, dtype=dtype) for row in value]
+        lengths = numpy.array([len(row) for row in rows], dtype=numpy.int64)
+        if count == 0 or (lengths == lengths[0]).all():
+            k = int(lengths[0]) if count else 0
+            return k, None, [((), numpy.array(rows, dtype=dtype).reshape(count, k))]
+        return 0, lengths, rows
+
+    def write(self, batch, binary_data, start, heap_off) -> int:
+        """Write a prepared batch at start (inside the zero-filled heap) and return its offset from heap_off."""
+        numpy = require_numpy()
+        elements = numpy.ndarray(batch.count, self.elm_dtype, buffer=binary_data, offset=start)
+        for path, value in batch.fixed:
+            _parent(elements, path)[path[-1]] = value
+        data_start = start + batch.count * self.member.elm_size
+        if all(lengths is None for k, lengths, values in batch.varrays):
+            self._write_records(batch, elements, binary_data, data_start, heap_off)
+        else:
+            self._write_rows(batch, elements, binary_data, data_start, heap_off)
+        return start - heap_off
+
+    def _write_records(self, batch, elements, binary_data, data_start, heap_off):
+        # the varray data of every element has the same size: one structured record per element
+        numpy = require_numpy()
+        names, formats, offsets = [], [], []
+        record_size = 0
+        for index, ((k, lengths, values), (key, path, dtype, inner)) in enumerate(zip(batch.varrays, self.varrays)):
+            refs = _parent(elements, path)[path[-1]]
+            refs["count"] = k
+            refs["offset"] = data_start - heap_off + record_size
+            if k:
+                names.append(f"f{index}")
+                formats.append((dtype, (k,)))
+                offsets.append(record_size)
+                record_size += k * dtype.itemsize
+        if not names or batch.count == 0:
+            return
+        steps = numpy.arange(batch.count, dtype=numpy.int32) * record_size
+        for key, path, dtype, inner in self.varrays:
+            _parent(elements, path)[path[-1]]["offset"] += steps
+        record_dtype = numpy.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": record_size})
+        records = numpy.ndarray(batch.count, record_dtype, buffer=binary_data, offset=data_start)
+        for index, (k, lengths, values) in enumerate(batch.varrays):
+            if k:
+                _assign(records[f"f{index}"], values)
+
+    def _write_rows(self, batch, elements, binary_data, data_start, heap_off):
+        # a primitive varray has elements of different lengths: the data is copied element by element
+        numpy = require_numpy()
+        counts = [numpy.full(batch.count, k, dtype=numpy.int64) if lengths is None else lengths
+                  for k, lengths, values in batch.varrays]
+        sizes = [n * dtype.itemsize for n, (key, path, dtype, inner) in zip(counts, self.varrays)]
+        element_sizes = numpy.sum(sizes, axis=0)
+        pos = data_start + numpy.concatenate(([0], numpy.cumsum(element_sizes)[:-1]))
+        for (k, lengths, values), n, size, (key, path, dtype, inner) in zip(batch.varrays, counts, sizes, self.varrays):
+            refs = _parent(elements, path)[path[-1]]
+            refs["count"] = n
+            refs["offset"] = pos - heap_off
+            if lengths is None:
+                rows = numpy.zeros((batch.count, k), dtype=dtype)
+                _assign(rows, values)
+            else:
+                rows = values
+            for begin, row in zip(pos.tolist(), rows):
+                if len(row):
+                    raw = memoryview(numpy.ascontiguousarray(row)).cast("B")
+                    binary_data[begin:begin + len(raw)] = raw
+            pos = pos + size
+
+    def read(self, binary_data, heap_off, count, offset) -> dict:
+        """Return the columns of count elements at offset (from heap_off) as views over binary_data."""
+        numpy = require_numpy()
+        elements = numpy.ndarray(count, self.elm_dtype, buffer=binary_data, offset=heap_off + offset)
+        columns = {}
+        for key, path, size in self.fields:
+            columns[key] = _parent(elements, path)[path[-1]]
+        for key, path, dtype, inner in self.varrays:
+            refs = _parent(elements, path)[path[-1]]
+            data = _varray_view(binary_data, heap_off, refs["count"], refs["offset"], dtype)
+            if inner is None:
+                columns[key] = data
+            elif isinstance(data, list):
+                for inner_key, inner_path, size in inner:
+                    columns[f"{key}.{inner_key}"] = [_parent(row, inner_path)[inner_path[-1]] for row in data]
+            else:
+                for inner_key, inner_path, size in inner:
+                    columns[f"{key}.{inner_key}"] = _parent(data, inner_path)[inner_path[-1]]
+        return columns
+
+class _ColumnBatch:
+    """Checked columns of one struct varray and the heap size they need."""
+    __slots__ = ("count", "fixed", "varrays", "size")
+
+    def __init__(self, count, fixed, varrays, size):
+        self.count = count
+        self.fixed = fixed
+        self.varrays = varrays
+        self.size = size
+
+def _parent(array, path):
+    for name in path[:-1]:
+        array = array[name]
+    return array
+
+def _assign(array, values):
+    for inner_path, value in values:
+        if inner_path:
+            _parent(array, inner_path)[inner_path[-1]] = value
+        else:
+            array[...] = value
+
+def _varray_view(binary_data, heap_off, counts, offsets, dtype):
+    """One (n, k) view when every element has k items at a constant stride, otherwise a list of views."""
+    numpy = require_numpy()
+    count = len(counts)
+    if count == 0:
+        return numpy.zeros((0, 0), dtype=dtype)
+    k = int(counts[0])
+    steps = numpy.diff(offsets)
+    if (counts == k).all() and (count == 1 or ((steps == steps[0]).all() and steps[0] >= k * dtype.itemsize)):
+        if k == 0:
+            return numpy.zeros((count, 0), dtype=dtype)
+        step = int(steps[0]) if count > 1 else k * dtype.itemsize
+        return numpy.ndarray((count, k), dtype, buffer=binary_data, offset=heap_off + int(offsets[0]),
+                             strides=(step, dtype.itemsize))
+    return [numpy.frombuffer(binary_data, dtype, int(n), heap_off + int(off)) for n, off in zip(counts, offsets)]
+
+def _collect_fields(offmap, typename, prefix, fields, varrays, in_array):
+    layout = offmap.get_layout(typename)
+    for member in layout.members:
+        path = prefix + (member.name,)
+        key = ".".join(path)
+        if member.is_varray:
+            if in_array or varrays is None:
+                raise ValueError(f"{typename}.{member.name}: this varray cannot be written as a column")
+            dtype = record_view.element_dtype(offmap, member)
+            if member.is_primitive:
+                varrays.append((key, path, dtype, None))
+            else:
+                inner = []
+                _collect_fields(offmap, member.type_name, (), inner, None, False)
+                varrays.append((key, path, dtype, tuple(inner)))
+        elif member.is_primitive:
+            fields.append((key, path, member.size if member.type_name == "string" and member.is_single else 0))
+        else:
+            _collect_fields(offmap, member.type_name, path, fields, varrays, in_array or member.is_array)
+
+def compile_column_layout(offmap, typename, name) -> ColumnBatchLayout:
+    """
+    Compile the column layout of the struct varray member name of typename.
+
+    Raises:
+        ValueError: If name is not a struct varray, or its elements have varrays
+            inside struct arrays or nested struct varrays with varrays of their own.
+    """
+    key = (typename, name)
+    layout = offmap.column_layouts.get(key)
+    if layout is None:
+        member = offmap.get_layout(typename).by_name.get(name)
+        if member is None or member.is_primitive or not member.is_varray:
+            raise ValueError(f"{typename}.{name} is not a struct varray")
+        fields = []
+        varrays = []
+        _collect_fields(offmap, member.type_name, (), fields, varrays, False)
+        layout = ColumnBatchLayout(typename, name, member, record_view.element_dtype(offmap, member),
+                                   tuple(fields), tuple(varrays))
+        offmap.column_layouts[key] = layout
+    return layout
+
+def encode_columns(offmap, typename, json_data, columns) -> bytearray:
+    """
+    Encode a PDU whose struct varray members are given as column batches.
+
+    columns maps member names to batches (dicts of columns); the other members
+    are taken from json_data as in BinaryPlan.encode. The batches are written
+    after the heap data of the other members, in the order of columns.
+    """
+    require_numpy()
+    batches = []
+    json_data = dict(json_data)
+    for name, columns_of_member in columns.items():
+        layout = compile_column_layout(offmap, typename, name)
+        batches.append((layout, layout.prepare(columns_of_member)))
+        json_data[name] = ()
+    plan = offmap.get_plan(typename)
+    binary_data = bytearray(plan.encoded_size(json_data) + sum(batch.size for layout, batch in batches))
+    pos = plan.write(json_data, binary_data)
+    heap_off = _META_SIZE + plan.struct.size
+    for layout, batch in batches:
+        offset = layout.write(batch, binary_data, pos, heap_off)
+        _VARRAY_REF.pack_into(binary_data, _META_SIZE + layout.member.offset, batch.count, offset)
+        pos += batch.size
+    _META.pack_into(binary_data, 0,
+                    binary_io.PduMetaData.PDU_META_DATA_MAGICNO,
+                    binary_io.PduMetaData.PDU_META_DATA_VERSION,
+                    _META_SIZE, heap_off, pos)
+    return binary_data
+
+def decode_columns(offmap, typename, binary_data, name) -> dict:
+    """
+    Return the columns of the struct varray member name of a PDU.
+
+    Fixed fields are views over binary_data; a varray of the elements is one
+    (n, k) view when all elements have k items (as written by encode_columns),
+    otherwise a list of per-element views.
+    """
+    layout = compile_column_layout(offmap, typename, name)
+    if len(binary_data) < _META_SIZE:
+        raise ValueError(f"Invalid PDU binary data for {typename}: MetaData not found or corrupted")
+    magicno, version, base_off, heap_off, total_size = _META.unpack_from(binary_data, 0)
+    if magicno != binary_io.PduMetaData.PDU_META_DATA_MAGICNO or version != binary_io.PduMetaData.PDU_META_DATA_VERSION:
+        raise ValueError(f"Invalid PDU binary data for {typename}: MetaData not found or corrupted")
+    count, offset = _VARRAY_REF.unpack_from(binary_data, base_off + layout.member.offset)
+    return layout.read(binary_data, heap_off, count, offset)
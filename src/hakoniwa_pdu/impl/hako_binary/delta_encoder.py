@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import operator
+import re
+import struct
+
+from . import binary_io
+
+_META_SIZE = binary_io.PduMetaData.PDU_META_DATA_SIZE
+_FORMAT_TOKEN = re.compile(r"(\d*)([xcbB?hHiIlLqQnNefdspP])")
+
+def value_slots(struct_obj):
+    """
+    Return ``(offset, size, Struct)`` for every value of a compiled plan Struct,
+    with offsets relative to the start of the base area.
+    """
+    slots = []
+    pos = 0
+    for count, code in _FORMAT_TOKEN.findall(struct_obj.format):
+        count = int(count) if count else 1
+        if code == "x":
+            pos += count
+        elif code == "s":
+            slots.append((pos, count, struct.Struct(f"<{count}s")))
+            pos += count
+        else:
+            field = struct.Struct("<" + code)
+            for _ in range(count):
+                slots.append((pos, field.size, field))
+                pos += field.size
+    return tuple(slots)
+
+class DeltaEncoder:
+    """
+    Stateful encoder for one PDU channel that re-packs only the fields that changed.
+
+    The last encoded buffer, the last flat base-area values and the last bytes
+    of every heap chunk (the data of a primitive varray, or the element block
+    of a struct varray) are kept. On the next ``encode`` the new values are
+    compared with the previous ones and only the differing fields and heap
+    chunks are written into the buffer. When the total size changes (a varray
+    length changed) the PDU is encoded in full into a new buffer.
+
+    ``encode`` returns the buffer together with the sorted ``(offset, length)``
+    byte ranges that changed, so a transport may send patches instead of the
+    whole PDU. The returned buffer is reused by the next call.
+    """
+    def __init__(self, offmap, typename):
+        self.type_name = typename
+        self.plan = offmap.get_plan(typename)
+        self.slots = value_slots(self.plan.struct)
+        self.heap_off = _META_SIZE + self.plan.struct.size
+        self.buffer = None
+        self.values = None
+        self.chunks = None
+
+    def reset(self):
+        """Forget the last encoded PDU; the next encode is a full encode."""
+        self.buffer = None
+        self.values = None
+        self.chunks = None
+
+    def encode(self, json_data):
+        plan = self.plan
+        total_size = plan.encoded_size(json_data)
+        if self.buffer is None or len(self.buffer) != total_size:
+            return self._encode_full(json_data, total_size)
+        buffer = self.buffer
+        chunks = []
+        values, raw_writes, _ = plan.fill(json_data, buffer, chunks)
+        last_values = self.values
+        changed = []
+        if values != last_values:
+            # element-wise comparison in C; list.index then jumps between the changed fields
+            flags = list(map(operator.ne, values, last_values))
+            slots = self.slots
+            index = flags.index(True)
+            while True:
+                off, size, field = slots[index]
+                field.pack_into(buffer, _META_SIZE + off, values[index])
+                changed.append((_META_SIZE + off, size))
+                try:
+                    index = flags.index(True, index + 1)
+                except ValueError:
+                    break
+            self.values = values
+        for off, binary in raw_writes:
+            size = len(binary)
+            if buffer[off:off + size] != binary:
+                buffer[off:off + size] = binary
+                changed.append((off, size))
+        last_chunks = self.chunks
+        for index, (start, binary) in enumerate(chunks):
+            if index < len(last_chunks):
+                last_start, last_binary = last_chunks[index]
+                if last_start == start and last_binary == binary:
+                    continue
+            buffer[start:start + len(binary)] = binary
+            if binary:
+                changed.append((start, len(binary)))
+        self.chunks = chunks
+        return buffer, _merge_ranges(changed)
+
+    def _encode_full(self, json_data, total_size):
+        buffer = bytearray(total_size)
+        chunks = []
+        values, raw_writes, _ = self.plan.fill(json_data, buffer, chunks)
+        self.plan.struct.pack_into(buffer, _META_SIZE, *values)
+        for off, binary in raw_writes:
+            buffer[off:off + len(binary)] = binary
+        for start, binary in chunks:
+            buffer[start:start + len(binary)] = binary
+        binary_io.PduMetaData.PDU_META_DATA_STRUCT.pack_into(
+            buffer, 0,
+            binary_io.PduMetaData.PDU_META_DATA_MAGICNO,
+            binary_io.PduMetaData.PDU_META_DATA_VERSION,
+            _META_SIZE, self.heap_off, total_size)
+        self.buffer = buffer
+        self.values = values
+        self.chunks = chunks
+        return buffer, [(0, total_size)]
+
+def _merge_ranges(ranges):
+    if len(ranges) < 2:
+        return ranges
+    ranges.sort()
+    merged = [ranges[0]]
+    for off, size in ranges[1:]:
+        last_off, last_size = merged[-1]
+        if off <= last_off + last_size:
+            merged[-1] = (last_off, max(last_size, off + size - last_off))
+        else:
+            merged.append((off, size))
+    return merged
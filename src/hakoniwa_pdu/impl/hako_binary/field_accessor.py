@@ -0,0 +1,213 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import re
+import struct
+
+from . import binary_io
+
+_VARRAY_REF = struct.Struct("<ii")
+_SEGMENT = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)(?:\[(\d+)\])?$")
+
+# steps of a compiled field path
+_OFFSET = 0   # move by a fixed number of bytes
+_HEAP = 1     # follow a varray reference into the heap
+
+class FieldAccessor:
+    """
+    Compiled field path such as ``header.stamp.sec`` or ``fields[1].name``.
+
+    Static offsets of nested structs and fixed arrays are folded together when
+    the path is compiled, so reading a field costs one ``unpack_from`` per
+    varray crossed plus the unpack of the requested bytes.
+    """
+    __slots__ = ("type_name", "path", "steps", "member", "indexed", "reader")
+
+    def __init__(self, type_name, path, steps, member, indexed, reader):
+        self.type_name = type_name
+        self.path = path
+        self.steps = steps
+        self.member = member
+        self.indexed = indexed
+        self.reader = reader
+
+    def offset(self, binary_data, base_off, heap_off) -> int:
+        """Return the absolute byte offset of the field (of the varray reference for whole varrays)."""
+        pos = base_off
+        for kind, arg, index in self.steps:
+            if kind == _OFFSET:
+                pos += arg
+            else:
+                count, offset_from_heap = _VARRAY_REF.unpack_from(binary_data, pos)
+                if index >= count:
+                    raise IndexError(f"{self.type_name}.{self.path}: index {index} out of range (length {count})")
+                pos = heap_off + offset_from_heap + index * arg
+        return pos
+
+    def read(self, binary_data, base_off, heap_off):
+        return self.reader(binary_data, self.offset(binary_data, base_off, heap_off), heap_off)
+
+def compile_accessor(offmap, typename, path) -> FieldAccessor:
+    steps = []
+    pending = 0
+    current = typename
+    member = None
+    indexed = False
+    segments = path.split(".")
+    for i, segment in enumerate(segments):
+        match = _SEGMENT.match(segment)
+        if match is None:
+            raise ValueError(f"Invalid field path: {path}")
+        if member is not None and member.is_primitive:
+            raise ValueError(f"{typename}.{path}: {member.name} is not a struct")
+        name, index = match.group(1), match.group(2)
+        member = offmap.get_layout(current).by_name.get(name)
+        if member is None:
+            raise ValueError(f"{typename}.{path}: {current} has no member {name}")
+        pending += member.offset
+        indexed = index is not None
+        if indexed:
+            index = int(index)
+            if member.is_single:
+                raise ValueError(f"{typename}.{path}: {name} is not an array")
+            if member.is_array:
+                if index >= member.array_len:
+                    raise IndexError(f"{typename}.{path}: index {index} out of range (length {member.array_len})")
+                pending += index * member.elm_size
+            else:
+                steps.append((_OFFSET, pending, 0))
+                steps.append((_HEAP, member.elm_size, index))
+                pending = 0
+        elif not member.is_single and i < len(segments) - 1:
+            raise ValueError(f"{typename}.{path}: {name} is an array and needs an index")
+        current = member.type_name
+    if pending:
+        steps.append((_OFFSET, pending, 0))
+    reader = _make_reader(offmap, member, indexed)
+    return FieldAccessor(typename, path, tuple(steps), member, indexed, reader)
+
+def _make_reader(offmap, member, indexed):
+    type = member.type_name
+    if member.is_single or indexed:
+        size = member.elm_size
+        if not member.is_primitive:
+            plan = offmap.get_plan(type)
+            return lambda binary_data, pos, heap_off: plan.decode(binary_data, pos, heap_off)
+        if type == "string":
+            return lambda binary_data, pos, heap_off: binary_io.binTostring(binary_data[pos:pos + size], size)
+        unpack_from = struct.Struct("<" + binary_io.PRIMITIVE_FORMATS[type]).unpack_from
+        return lambda binary_data, pos, heap_off: unpack_from(binary_data, pos)[0]
+    if member.is_array:
+        array_len = member.array_len
+        return lambda binary_data, pos, heap_off: _read_elements(offmap, member, binary_data, pos, array_len, heap_off)
+    def read_varray(binary_data, pos, heap_off):
+        count, offset_from_heap = _VARRAY_REF.unpack_from(binary_data, pos)
+        return _read_elements(offmap, member, binary_data, heap_off + offset_from_heap, count, heap_off)
+    return read_varray
+
+def _read_elements(offmap, member, binary_data, start, count, heap_off):
+    elm_size = member.elm_size
+    if not member.is_primitive:
+        plan = offmap.get_plan(member.type_name)
+        return [plan.decode(binary_data, start + i * elm_size, heap_off) for i in range(count)]
+    if member.type_name == "string":
+        return [binary_io.binTostring(binary_data[start + i * elm_size:start + (i + 1) * elm_size], elm_size)
+                for i in range(count)]
+    return binary_io.binToArrayValues(member.type_name, binary_data[start:start + count * elm_size])
+
+class PduProxy:
+    """
+    Lazy attribute view over a raw PDU buffer.
+
+    ``proxy.header.stamp.sec`` resolves offsets through the cached layout and
+    unpacks only the requested member. Nested structs and elements of struct
+    arrays are returned as ``PduProxy``; other members are decoded on access.
+    """
+    __slots__ = ("_offmap", "_layout", "_binary_data", "_base_off", "_heap_off")
+
+    def __init__(self, offmap, typename, binary_data, base_off, heap_off):
+        self._offmap = offmap
+        self._layout = offmap.get_layout(typename)
+        self._binary_data = binary_data
+        self._base_off = base_off
+        self._heap_off = heap_off
+
+    def __getattr__(self, name):
+        member = self._layout.by_name.get(name)
+        if member is None:
+            raise AttributeError(f"{self._layout.type_name} has no member {name}")
+        pos = self._base_off + member.offset
+        if member.is_primitive:
+            return self._offmap.get_accessor(self._layout.type_name, name).reader(self._binary_data, pos, self._heap_off)
+        if member.is_single:
+            return PduProxy(self._offmap, member.type_name, self._binary_data, pos, self._heap_off)
+        if member.is_array:
+            count = member.array_len
+        else:
+            count, offset_from_heap = _VARRAY_REF.unpack_from(self._binary_data, pos)
+            pos = self._heap_off + offset_from_heap
+        return [PduProxy(self._offmap, member.type_name, self._binary_data, pos + i * member.elm_size, self._heap_off)
+                for i in range(count)]
+
+    def get(self, path):
+        return self._offmap.get_accessor(self._layout.type_name, path).read(self._binary_data, self._base_off, self._heap_off)
+
+    def to_json(self) -> dict:
+        return self._offmap.get_plan(self._layout.type_name).decode(self._binary_data, self._base_off, self._heap_off)
+
+    def __dir__(self):
+        return [member.name for member in self._layout.members]
+
+    def __repr__(self):
+        return f"PduProxy(type_name={self._layout.type_name}, base_off={self._base_off})"
+
+def _load_offsets(typename, binary_data):
+    meta = binary_io.PduMetaDataParser().load_pdu_meta(binary_data)
+    if meta is None:
+        raise ValueError(f"Invalid PDU binary data for {typename}: MetaData not found or corrupted")
+    return meta.base_off, meta.heap_off
+
+def get_field(offmap, typename, binary_data, path):
+    base_off, heap_off = _load_offsets(typename, binary_data)
+    return offmap.get_accessor(typename, path).read(binary_data, base_off, heap_off)
+
+def get_proxy(offmap, typename, binary_data) -> PduProxy:
+    base_off, heap_off = _load_offsets(typename, binary_data)
+    return PduProxy(offmap, typename, binary_data, base_off, heap_off)
+
+def array_span(offmap, typename, binary_data, path):
+    """
+    Return ``(start, size, elm_size)`` of the bytes of the array member at path.
+
+    Varrays are resolved through their heap reference; nothing is copied.
+
+    Raises:
+        ValueError: If path does not name a whole array or varray, or the
+            varray reference points outside binary_data.
+    """
+    accessor = offmap.get_accessor(typename, path)
+    member = accessor.member
+    if member.is_single or accessor.indexed:
+        raise ValueError(f"{typename}.{path} is not an array")
+    base_off, heap_off = _load_offsets(typename, binary_data)
+    pos = accessor.offset(binary_data, base_off, heap_off)
+    if member.is_array:
+        return pos, member.size, member.elm_size
+    count, offset_from_heap = _VARRAY_REF.unpack_from(binary_data, pos)
+    start = heap_off + offset_from_heap
+    size = count * member.elm_size
+    if count < 0 or offset_from_heap < 0 or start + size > len(binary_data):
+        raise ValueError(f"{typename}.{path}: varray reference out of range (count {count}, offset {offset_from_heap})")
+    return start, size, member.elm_size
+
+def iter_array_chunks(binary_data, start, size, elm_size, chunk_bytes):
+    """
+    Yield memoryview slices of at most chunk_bytes over ``binary_data[start:start + size]``.
+
+    chunk_bytes is rounded down to whole elements (at least one element per chunk).
+    The slices are writable when binary_data is.
+    """
+    chunk_bytes = max(elm_size, chunk_bytes - chunk_bytes % elm_size)
+    view = memoryview(binary_data)
+    end = start + size
+    for pos in range(start, end, chunk_bytes):
+        yield view[pos:min(pos + chunk_bytes, end)]
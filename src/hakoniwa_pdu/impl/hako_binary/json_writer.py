@@ -0,0 +1,212 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import base64
+import json
+import operator
+
+from . import binary_io
+from . import binary_plan
+
+# how primitive arrays are written
+ARRAY_ENCODING_LIST = "list"
+ARRAY_ENCODING_BASE64 = "base64"
+ARRAY_ENCODINGS = (ARRAY_ENCODING_LIST, ARRAY_ENCODING_BASE64)
+
+_ARRAY_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_encode_string = json.encoder.encode_basestring
+# arrays up to this length are joined directly; longer ones go through the C JSON encoder
+_SMALL_ARRAY_LEN = 64
+_NON_FINITE = {float("nan"): "NaN", float("inf"): "Infinity", float("-inf"): "-Infinity"}
+
+class JsonOptions:
+    """Output options of a compiled JSON plan; part of the plan cache key."""
+    __slots__ = ("include_raw", "array_encoding", "max_array_len")
+
+    def __init__(self, include_raw=False, array_encoding=ARRAY_ENCODING_LIST, max_array_len=None):
+        if array_encoding not in ARRAY_ENCODINGS:
+            raise ValueError(f"Unknown array_encoding: {array_encoding}")
+        if max_array_len is not None and max_array_len < 0:
+            raise ValueError(f"max_array_len must not be negative: {max_array_len}")
+        self.include_raw = include_raw
+        self.array_encoding = array_encoding
+        self.max_array_len = max_array_len
+
+    def key(self):
+        return (self.include_raw, self.array_encoding, self.max_array_len)
+
+class JsonPlan:
+    """
+    Compiled JSON writer of one PDU type.
+
+    The keys and punctuation of the fixed-size part of the layout are baked
+    into a single ``%`` template. Scalars are taken from the ``unpack_from``
+    tuple of the compiled binary plan in one ``itemgetter`` call; strings,
+    arrays and varrays are rendered by per-slot functions. No intermediate
+    dictionary is built.
+    """
+    __slots__ = ("plan", "template", "getter", "dynamic", "float_slots")
+
+    def __init__(self, plan, template, indexes, dynamic, float_slots):
+        self.plan = plan
+        self.template = template
+        if not indexes:
+            self.getter = None
+        elif len(indexes) == 1:
+            # itemgetter with a single index returns a bare value instead of a tuple
+            index = indexes[0]
+            self.getter = lambda values: (values[index],)
+        else:
+            self.getter = operator.itemgetter(*indexes)
+        self.dynamic = dynamic
+        self.float_slots = float_slots
+
+    def render(self, binary_data, base_off, heap_off) -> str:
+        values = self.plan.struct.unpack_from(binary_data, base_off)
+        if self.getter is None:
+            return self.template
+        fill = list(self.getter(values))
+        for slot, render in self.dynamic:
+            fill[slot] = render(values, binary_data, base_off, heap_off)
+        if self.float_slots:
+            floats = [fill[slot] for slot in self.float_slots]
+            total = sum(floats)
+            if total - total != 0:
+                # NaN or +-Infinity: written like json.dumps does
+                for slot, value in zip(self.float_slots, floats):
+                    if value - value != 0:
+                        fill[slot] = _NON_FINITE.get(value, "NaN")
+        return self.template % tuple(fill)
+
+class _JsonBuilder:
+    def __init__(self, offmap, options):
+        self.offmap = offmap
+        self.options = options
+        self.parts = []
+        self.indexes = []
+        self.dynamic = []
+        self.float_slots = []
+
+    def add_text(self, text):
+        self.parts.append(text.replace("%", "%%"))
+
+    def add_value(self, index, is_float):
+        if is_float:
+            self.float_slots.append(len(self.indexes))
+        self.indexes.append(index)
+        self.parts.append("%s")
+
+    def add_dynamic(self, render):
+        self.dynamic.append((len(self.indexes), render))
+        self.indexes.append(0)
+        self.parts.append("%s")
+
+    def build_object(self, nodes):
+        self.add_text("{")
+        first = True
+        for kind, name, index, arg in nodes:
+            if self.options.include_raw and kind in _RAW_KINDS:
+                self.add_text(("" if first else ",") + _encode_string(name + "__raw") + ":")
+                self.add_dynamic(_make_raw_render(kind, index, arg))
+                first = False
+            self.add_text(("" if first else ",") + _encode_string(name) + ":")
+            first = False
+            self.build_member(kind, index, arg)
+        self.add_text("}")
+
+    def build_member(self, kind, index, arg):
+        options = self.options
+        if kind == binary_plan._VALUE:
+            self.add_value(index, arg in ("f", "d"))
+        elif kind == binary_plan._STRUCT:
+            self.build_object(arg)
+        elif kind == binary_plan._STRING:
+            self.add_dynamic(lambda values, binary_data, base_off, heap_off:
+                             _encode_string(binary_io.binTostring(values[index])))
+        elif kind == binary_plan._STRUCT_ARRAY:
+            self.add_text("[")
+            elements = arg if options.max_array_len is None else arg[:options.max_array_len]
+            for i, element_nodes in enumerate(elements):
+                if i > 0:
+                    self.add_text(",")
+                self.build_object(element_nodes)
+            self.add_text("]")
+        elif kind == binary_plan._STRUCT_VARRAY:
+            element_plan, elm_size = arg
+            element_json = compile_json_plan(self.offmap, element_plan.type_name, options)
+            self.add_dynamic(_make_struct_varray_render(element_json, index, elm_size, options.max_array_len))
+        elif kind == binary_plan._RAW_VALUE:
+            type, off, size = arg
+            self.add_dynamic(lambda values, binary_data, base_off, heap_off:
+                             _ARRAY_ENCODER.encode(binary_io.binTovalue(type, binary_data[base_off + off:base_off + off + size])))
+        else:
+            self.add_dynamic(_make_array_render(kind, index, arg, options))
+
+_RAW_KINDS = (binary_plan._ARRAY, binary_plan._VARRAY, binary_plan._RAW_ARRAY)
+
+def _array_span(kind, index, arg, values, base_off, heap_off):
+    # (start, size) of the bytes of a primitive array
+    if kind == binary_plan._VARRAY:
+        return heap_off + values[index + 1], arg[1] * values[index]
+    return base_off + arg[1], arg[2]
+
+def _make_raw_render(kind, index, arg):
+    def render(values, binary_data, base_off, heap_off):
+        start, size = _array_span(kind, index, arg, values, base_off, heap_off)
+        return '"' + base64.b64encode(binary_data[start:start + size]).decode("ascii") + '"'
+    return render
+
+def _make_array_render(kind, index, arg, options):
+    type = arg[0]
+    max_len = options.max_array_len
+    if kind == binary_plan._VARRAY:
+        elm_size = arg[1]
+    elif kind == binary_plan._ARRAY:
+        elm_size = arg[2] // arg[3]
+    else:
+        elm_size = arg[3]
+    use_base64 = options.array_encoding == ARRAY_ENCODING_BASE64 and type != "string"
+
+    def render(values, binary_data, base_off, heap_off):
+        start, size = _array_span(kind, index, arg, values, base_off, heap_off)
+        if max_len is not None:
+            size = min(size, max_len * elm_size)
+        if kind == binary_plan._ARRAY and not use_base64:
+            # already unpacked together with the scalars
+            return _encode_items(values[index:index + size // elm_size])
+        raw = binary_data[start:start + size]
+        if use_base64:
+            return '"' + base64.b64encode(raw).decode("ascii") + '"'
+        if type == "string":
+            return _ARRAY_ENCODER.encode(
+                [binary_io.binTostring(raw[i:i + elm_size], elm_size) for i in range(0, len(raw), elm_size)])
+        return _encode_items(binary_io.binToArrayValues(type, raw))
+    return render
+
+def _encode_items(items):
+    if len(items) > _SMALL_ARRAY_LEN:
+        return _ARRAY_ENCODER.encode(items)
+    # short numeric arrays: str() matches the JSON number text of ints and finite floats
+    total = sum(items)
+    if total - total != 0:
+        return _ARRAY_ENCODER.encode(items)
+    return "[" + ",".join(map(str, items)) + "]"
+
+def _make_struct_varray_render(element_json, index, elm_size, max_len):
+    def render(values, binary_data, base_off, heap_off):
+        count = values[index]
+        if max_len is not None:
+            count = min(count, max_len)
+        start = heap_off + values[index + 1]
+        return "[" + ",".join(element_json.render(binary_data, start + i * elm_size, heap_off) for i in range(count)) + "]"
+    return render
+
+def compile_json_plan(offmap, typename, options) -> JsonPlan:
+    key = (typename,) + options.key()
+    json_plan = offmap.json_plans.get(key)
+    if json_plan is None:
+        plan = offmap.get_plan(typename)
+        builder = _JsonBuilder(offmap, options)
+        builder.build_object(plan.nodes)
+        json_plan = JsonPlan(plan, "".join(builder.parts), builder.indexes, builder.dynamic, builder.float_slots)
+        offmap.json_plans[key] = json_plan
+    return json_plan
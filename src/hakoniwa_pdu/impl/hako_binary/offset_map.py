@@ -1,51 +1,163 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 import glob
+import hashlib
 import json
+import marshal
+import os
 import sys
 from . import offset_parser
+from . import binary_plan
+from . import record_view
+from . import field_accessor
+
+OFFSET_FILE_SUFFIX = ".offset"
+# bump when the layout of the cache blob changes
+OFFSET_CACHE_VERSION = 1
 
 class OffsetMap:
-    def __init__(self, offset_path):
+    """
+    Offset definitions of every PDU type under ``offset_path/<package>/<Type>.offset``.
+
+    The directory is scanned once into an index on the first lookup. When
+    ``cache_path`` is given, the lines of all offset files are also kept in a
+    marshal blob keyed by a fingerprint (names, sizes and mtimes) of the offset
+    files, so that later processes load every type with a single read.
+    """
+    def __init__(self, offset_path, cache_path=None):
         self.off_path = offset_path
+        self.cache_path = cache_path
         self.map = {}
+        self.plans = {}
+        self.dtypes = {}
+        self.accessors = {}
+        self.json_plans = {}
+        self.cdr_plans = {}
+        self.column_layouts = {}
+        self.index = None
+        self.cached_lines = {}
 
     def get(self, typename):
-        if (typename in self.map) == False:
-            filepath = self.find_filepath(self.off_path +"/*/", typename + ".offset")
-            lines = offset_parser.parse_offset(filepath)
-            self.map[typename] =  lines
-        return self.map[typename]
+        return self.get_layout(typename).lines
+
+    def get_layout(self, typename) -> offset_parser.OffsetLayout:
+        layout = self.map.get(typename)
+        if layout is None:
+            filepath = self.find_offset_file(typename)
+            lines = self.cached_lines.get(filepath)
+            if lines is None:
+                lines = offset_parser.parse_offset(filepath)
+            layout = offset_parser.parse_layout(typename, lines)
+            self.map[typename] = layout
+        return layout
+
+    def find_offset_file(self, typename) -> str:
+        """
+        Return the offset file of typename (``pkg/Type`` or ``Type``).
+
+        Raises:
+            FileNotFoundError: If no offset file is defined for typename.
+        """
+        if self.index is None:
+            self.load_index()
+        filepath = self.index.get(typename)
+        if filepath is None:
+            # legacy lookup by the bare type name, whatever the package
+            filepath = self.index.get(typename.split('/')[-1])
+        if filepath is None:
+            raise FileNotFoundError(f"Offset file for {typename} not found under {self.off_path}")
+        return filepath
+
+    def load_index(self):
+        """Scan the offset directory once and, if enabled, load the persistent cache."""
+        index = {}
+        for package in sorted(os.scandir(self.off_path), key=lambda entry: entry.name):
+            if package.name.startswith('.') or not package.is_dir():
+                continue
+            for entry in sorted(os.scandir(package.path), key=lambda entry: entry.name):
+                if not entry.name.endswith(OFFSET_FILE_SUFFIX) or not entry.is_file():
+                    continue
+                name = entry.name[:-len(OFFSET_FILE_SUFFIX)]
+                index[package.name + '/' + name] = entry.path
+                index.setdefault(name, entry.path)
+        self.index = index
+        if self.cache_path:
+            self.cached_lines = self._load_cache()
+
+    def _fingerprint(self, filepaths):
+        digest = hashlib.sha256()
+        for filepath in filepaths:
+            stat = os.stat(filepath)
+            digest.update(f"{filepath}:{stat.st_size}:{stat.st_mtime_ns}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _load_cache(self):
+        filepaths = sorted(set(self.index.values()))
+        key = self._fingerprint(filepaths)
+        try:
+            with open(self.cache_path, 'rb') as f:
+                blob = marshal.load(f)
+            if blob.get("version") == OFFSET_CACHE_VERSION and blob.get("key") == key:
+                return blob["lines"]
+        except (OSError, EOFError, ValueError, TypeError, AttributeError):
+            pass
+        lines = {filepath: offset_parser.parse_offset(filepath) for filepath in filepaths}
+        blob = {"version": OFFSET_CACHE_VERSION, "key": key, "lines": lines}
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                marshal.dump(blob, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # the cache is only an optimization; a read-only location just disables it
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return lines
+
+    def get_plan(self, typename, array_mode=binary_plan.ARRAY_MODE_TUPLE) -> binary_plan.BinaryPlan:
+        key = (typename, array_mode)
+        plan = self.plans.get(key)
+        if plan is None:
+            plan = binary_plan.compile_plan(self, typename, array_mode)
+            self.plans[key] = plan
+        return plan
+
+    def get_dtype(self, typename):
+        dtype = self.dtypes.get(typename)
+        if dtype is None:
+            dtype = record_view.compile_dtype(self, typename)
+            self.dtypes[typename] = dtype
+        return dtype
+
+    def get_accessor(self, typename, path) -> field_accessor.FieldAccessor:
+        key = (typename, path)
+        accessor = self.accessors.get(key)
+        if accessor is None:
+            accessor = field_accessor.compile_accessor(self, typename, path)
+            self.accessors[key] = accessor
+        return accessor
 
     def align8(self, value):
         return ((value + 7) // 8) * 8
 
     def get_pdu_size(self, typename):
-        lines = self.get(typename)
-        size = 0
-        last_line = lines[-1]
-        last_offset = offset_parser.member_off(last_line)
-        if (offset_parser.is_varray(last_line)):
-            last_size = 8  # len + off
-        else:
-            last_size = offset_parser.member_size(last_line)
-
-        size = self.align8(last_offset + last_size + 8)
+        layout = self.get_layout(typename)
+        last_member = layout.members[-1]
+        size = self.align8(last_member.offset + last_member.slot_size() + 8)
         return size
 
     def find_filepath(self, path, filename):
         f_array = filename.split('/')
         if (len(f_array) > 1):
             filename = f_array[len(f_array) - 1]
-        #print("path=" + path)
-        #print("filename=" + filename)
         tmp = glob.glob(path + filename, recursive=True)
         if (len(tmp) == 0):
-            print("ERROR: find_filepath(" + path + " ," + filename +")" )
-            exit(1)
+            raise FileNotFoundError(f"find_filepath({path}, {filename}): not found")
         return tmp[0]
 
-def create_offmap(offset_path):
-    return OffsetMap(offset_path)
-
-
+def create_offmap(offset_path, cache_path=None):
+    if cache_path is None:
+        cache_path = os.getenv('HAKO_OFFSET_CACHE_PATH')
+    return OffsetMap(offset_path, cache_path)
@@ -46,3 +46,55 @@ def member_off(data):
 
 def member_size(data):
     return int(data.split(":")[5])
+
+
+# size of a varray reference (int32 length + int32 offset from heap)
+VARRAY_REF_SIZE = 8
+
+class OffsetMember:
+    """One pre-parsed line of an .offset file."""
+    __slots__ = ("name", "type_name", "is_primitive", "is_single", "is_array", "is_varray",
+                 "offset", "size", "array_len", "elm_size")
+
+    def __init__(self, line):
+        fields = line.strip().split(":")
+        self.name = fields[2]
+        self.type_name = fields[3]
+        self.is_primitive = fields[1] == "primitive"
+        self.is_single = fields[0] == "single"
+        self.is_array = fields[0] == "array"
+        self.is_varray = fields[0] == "varray"
+        self.offset = int(fields[4])
+        self.size = int(fields[5])
+        if self.is_array:
+            self.array_len = int(fields[6])
+            self.elm_size = self.size // self.array_len
+        elif self.is_varray:
+            self.array_len = -1
+            self.elm_size = self.size
+        else:
+            self.array_len = 0
+            self.elm_size = self.size
+
+    def slot_size(self):
+        # bytes occupied in the base area: a varray only stores its (len, off) reference there
+        if self.is_varray:
+            return VARRAY_REF_SIZE
+        return self.size
+
+    def __repr__(self):
+        return f"OffsetMember(name={self.name}, type_name={self.type_name}, offset={self.offset}, size={self.size})"
+
+class OffsetLayout:
+    """Parsed layout of one PDU type: members in file order plus a name index."""
+    __slots__ = ("type_name", "members", "by_name", "base_size", "lines")
+
+    def __init__(self, type_name, lines):
+        self.type_name = type_name
+        self.lines = lines
+        self.members = tuple(OffsetMember(line) for line in lines if line.strip())
+        self.by_name = {m.name: m for m in self.members}
+        self.base_size = max((m.offset + m.slot_size() for m in self.members), default=0)
+
+def parse_layout(type_name, lines):
+    return OffsetLayout(type_name, lines)
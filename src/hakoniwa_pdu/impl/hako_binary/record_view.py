@@ -0,0 +1,105 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+from hakoniwa_pdu._optional_numpy import require_numpy
+from . import binary_io
+
+# base-area representation of a varray: element count and offset from heap_off
+VARRAY_REF_FIELDS = (("count", "<i4"), ("offset", "<i4"))
+
+def compile_dtype(offmap, typename):
+    """
+    Build a NumPy structured dtype with explicit offsets from the .offset layout
+    of typename. The dtype covers the base area only; varray members are
+    represented by their (count, offset) reference.
+    """
+    numpy = require_numpy()
+    layout = offmap.get_layout(typename)
+    names = []
+    formats = []
+    offsets = []
+    for member in layout.members:
+        if member.is_varray:
+            dtype = numpy.dtype(list(VARRAY_REF_FIELDS))
+        elif member.is_array:
+            dtype = (element_dtype(offmap, member), (member.array_len,))
+        else:
+            dtype = element_dtype(offmap, member)
+        names.append(member.name)
+        formats.append(dtype)
+        offsets.append(member.offset)
+    return numpy.dtype({
+        "names": names,
+        "formats": formats,
+        "offsets": offsets,
+        "itemsize": layout.base_size,
+    })
+
+def element_dtype(offmap, member):
+    numpy = require_numpy()
+    if member.is_primitive:
+        if member.type_name == "string":
+            return numpy.dtype(f"S{member.elm_size}")
+        return numpy.dtype("<" + binary_io.PRIMITIVE_FORMATS[member.type_name])
+    dtype = offmap.get_dtype(member.type_name)
+    if dtype.itemsize == member.elm_size:
+        return dtype
+    # arrays of structs are strided by the aligned element size, not by the last member end
+    return numpy.dtype({
+        "names": dtype.names,
+        "formats": [dtype.fields[name][0] for name in dtype.names],
+        "offsets": [dtype.fields[name][1] for name in dtype.names],
+        "itemsize": member.elm_size,
+    })
+
+class PduRecord:
+    """
+    Zero-copy record view of a PDU (or of one nested struct of it).
+
+    ``record[name]`` reads only the bytes of that member: primitives come back
+    as NumPy scalars, fixed arrays and fixed struct arrays as arrays over the
+    buffer, nested structs as ``PduRecord`` and varrays as arrays over the heap.
+    Strings are returned as ``bytes``. Assigning a member, or writing through
+    the returned arrays, modifies the buffer in place.
+    """
+    __slots__ = ("offmap", "layout", "record", "binary_data", "heap_off")
+
+    def __init__(self, offmap, typename, record, binary_data, heap_off):
+        self.offmap = offmap
+        self.layout = offmap.get_layout(typename)
+        self.record = record
+        self.binary_data = binary_data
+        self.heap_off = heap_off
+
+    def __getitem__(self, name):
+        member = self.layout.by_name[name]
+        value = self.record[name]
+        if member.is_varray:
+            numpy = require_numpy()
+            return numpy.frombuffer(self.binary_data, element_dtype(self.offmap, member),
+                                    int(value["count"]), self.heap_off + int(value["offset"]))
+        if member.is_single and not member.is_primitive:
+            return PduRecord(self.offmap, member.type_name, value, self.binary_data, self.heap_off)
+        return value
+
+    def __setitem__(self, name, value):
+        if self.layout.by_name[name].is_varray:
+            raise ValueError(f"{self.layout.type_name}.{name}: varray length cannot be changed through a record view")
+        self.record[name] = value
+
+    def __contains__(self, name):
+        return name in self.layout.by_name
+
+    def keys(self):
+        return [member.name for member in self.layout.members]
+
+    def __repr__(self):
+        return f"PduRecord(type_name={self.layout.type_name})"
+
+def as_record(offmap, typename, binary_data) -> PduRecord:
+    numpy = require_numpy()
+    meta = binary_io.PduMetaDataParser().load_pdu_meta(binary_data)
+    if meta is None:
+        raise ValueError(f"Invalid PDU binary data for {typename}: MetaData not found or corrupted")
+    dtype = offmap.get_dtype(typename)
+    record = numpy.ndarray((), dtype, buffer=binary_data, offset=meta.base_off)[()]
+    return PduRecord(offmap, typename, record, binary_data, meta.heap_off)
@@ -1,8 +1,17 @@
 import logging
+from typing import Iterable, List, Tuple, Union
 from .pdu_channel_config import PduChannelConfig
 from .hako_binary import offset_map
 from .hako_binary import binary_writer
 from .hako_binary import binary_reader
+from .hako_binary import binary_plan
+from .hako_binary import binary_io
+from .hako_binary import record_view
+from .hako_binary import field_accessor
+from .hako_binary import delta_encoder
+from .hako_binary import json_writer
+from .hako_binary import cdr_transcoder
+from .hako_binary import column_batch
 
 logger = logging.getLogger(__name__)
 
@@ -16,17 +25,28 @@ class PduConvertor:
     Args:
         offset_path (str): Path to the offset files used for binary layout.
         pdu_channel_config (PduChannelConfig): PDU channel definition configuration.
+        array_mode (str): "tuple" (default) or "numpy" for zero-copy numpy array views.
     """    
-    def __init__(self, offset_path: str, pdu_channel_config: PduChannelConfig):
+    def __init__(self, offset_path: str, pdu_channel_config: PduChannelConfig, *, array_mode: str = binary_plan.ARRAY_MODE_TUPLE):
         """
         Initialize the PduConvertor.
 
         Args:
             offset_path (str): Directory path to the offset map files (.offset).
             pdu_channel_config (PduChannelConfig): Configuration object describing PDU layout.
+            array_mode (str): How convert_binary_to_json returns primitive arrays.
+                "tuple" returns tuples plus a ``name__raw`` bytes copy.
+                "numpy" returns ``numpy.frombuffer`` views over the given buffer and
+                a ``name__raw`` memoryview; requires numpy.
+
+        Raises:
+            ValueError: If array_mode is unknown.
         """
+        if array_mode not in binary_plan.ARRAY_MODES:
+            raise ValueError(f"Unknown array_mode: {array_mode}")
         self.pdu_channel_config = pdu_channel_config
         self.offmap = offset_map.create_offmap(offset_path)
+        self.array_mode = array_mode
 
     def create_empty_pdu_json(self, robot_name: str, pdu_name: str) -> dict:
         """
@@ -50,9 +70,8 @@ class PduConvertor:
         pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
         if pdu_type is None:
             raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
-        binary_data = bytearray(pdu_size)
-        value = binary_reader.binary_read(self.offmap, pdu_type, binary_data)
-        return value
+        # built once per type from a zeroed buffer, then copied
+        return self.offmap.get_plan(pdu_type).empty_json()
 
     def convert_json_to_binary(self, robot_name: str, pdu_name: str, json_data: dict) -> bytearray:
         """
@@ -75,11 +94,131 @@ class PduConvertor:
         pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
         if pdu_type is None:
             raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
-        
-        binary_data = bytearray(pdu_size)
-        binary_writer.binary_write(self.offmap, binary_data, json_data, pdu_type)
-        return binary_data
+
+        # the output is allocated once, sized from the compiled layout and the varray lengths
+        return binary_writer.binary_encode(self.offmap, json_data, pdu_type)
     
+    def convert_many_to_binary(self, items: Iterable[Tuple[str, str, dict]], *, pack: bool = False
+                               ) -> Union[List[bytearray], Tuple[bytearray, List[Tuple[int, int]]]]:
+        """
+        Convert many JSON dictionaries into binary PDUs in one call.
+
+        Channel metadata is resolved once per (robot, PDU) and the compiled plan once per
+        PDU type, which saves the repeated lookups of per-item convert_json_to_binary calls.
+
+        Args:
+            items: Iterable of ``(robot_name, pdu_name, json_data)``.
+            pack (bool): If True, encode every PDU into one contiguous buffer. Each PDU
+                starts at an 8-byte aligned offset.
+
+        Returns:
+            A list of bytearrays in item order or, with ``pack=True``, a tuple of the
+            contiguous buffer and the ``(offset, size)`` of each PDU in item order.
+
+        Raises:
+            ValueError: If the PDU size or type of an item is not defined.
+        """
+        plans = self._resolve_plans(items, check_size=True)
+        if not pack:
+            return [plan.encode(json_data) for plan, json_data in plans]
+        offsets = []
+        pos = 0
+        for plan, json_data in plans:
+            size = plan.encoded_size(json_data)
+            offsets.append((pos, size))
+            pos = self.offmap.align8(pos + size)
+        buffer = bytearray(pos)
+        view = memoryview(buffer)
+        for (plan, json_data), (off, size) in zip(plans, offsets):
+            plan.write(json_data, view[off:off + size])
+        return buffer, offsets
+
+    def convert_many_to_json(self, items: Iterable[Tuple[str, str, bytearray]]) -> List[dict]:
+        """
+        Convert many binary PDUs into JSON dictionaries in one call.
+
+        Args:
+            items: Iterable of ``(robot_name, pdu_name, binary_data)``.
+
+        Returns:
+            list[dict]: The decoded PDUs in item order.
+
+        Raises:
+            ValueError: If the PDU type of an item is not defined.
+        """
+        plans = self._resolve_plans(items, check_size=False, array_mode=self.array_mode)
+        results = []
+        for plan, binary_data in plans:
+            meta = binary_reader.load_meta(binary_data)
+            results.append(plan.decode(binary_data, binary_io.PduMetaData.PDU_META_DATA_SIZE, meta.heap_off))
+        return results
+
+    def _resolve_plans(self, items, check_size, array_mode=binary_plan.ARRAY_MODE_TUPLE):
+        # channel metadata and compiled plans are looked up once per channel
+        channel_plans = {}
+        plans = []
+        for robot_name, pdu_name, data in items:
+            key = (robot_name, pdu_name)
+            plan = channel_plans.get(key)
+            if plan is None:
+                if check_size and self.pdu_channel_config.get_pdu_size(robot_name, pdu_name) < 0:
+                    raise ValueError(f"PDU size for {robot_name}/{pdu_name} is not defined.")
+                pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+                if pdu_type is None:
+                    raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+                plan = self.offmap.get_plan(pdu_type, array_mode)
+                channel_plans[key] = plan
+            plans.append((plan, data))
+        return plans
+
+    def encode_into(self, robot_name: str, pdu_name: str, json_data: dict, out) -> int:
+        """
+        Convert JSON data into binary PDU representation inside a caller-supplied buffer.
+
+        This lets a publisher reuse one send buffer (or a shared-memory segment) per channel
+        instead of allocating a new bytearray for every cycle.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            json_data (dict): A dictionary containing the data to serialize.
+            out (bytearray | memoryview): Writable buffer that receives the PDU from offset 0.
+
+        Returns:
+            int: The number of bytes written (the PDU total size).
+
+        Raises:
+            ValueError: If the PDU type is not defined or the buffer is too small.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        return binary_writer.binary_encode_into(self.offmap, json_data, pdu_type, out)
+
+    def create_delta_encoder(self, robot_name: str, pdu_name: str) -> delta_encoder.DeltaEncoder:
+        """
+        Create a stateful encoder for one PDU channel that re-packs only changed fields.
+
+        ``encoder.encode(json_data)`` returns ``(binary_data, changed_ranges)``, where
+        changed_ranges lists the ``(offset, length)`` byte ranges that differ from the
+        previous call. The whole PDU is re-encoded when a varray length changes.
+        The returned binary_data is reused by the next call.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+
+        Returns:
+            DeltaEncoder: An encoder bound to the PDU type of the channel.
+
+        Raises:
+            ValueError: If the PDU type is not defined.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        return delta_encoder.DeltaEncoder(self.offmap, pdu_type)
+
     def convert_binary_to_json(self, robot_name: str, pdu_name: str, binary_data: bytearray) -> dict:
         """
         Convert binary PDU data into a JSON dictionary representation.
@@ -91,6 +230,8 @@ class PduConvertor:
 
         Returns:
             dict: A dictionary representing the deserialized PDU content.
+                In "numpy" array mode, primitive arrays are views that share memory
+                with binary_data.
 
         Raises:
             ValueError: If the PDU type is not defined.
@@ -101,5 +242,258 @@ class PduConvertor:
         if pdu_type is None:
             raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
         
-        json_data = binary_reader.binary_read(self.offmap, pdu_type, binary_data)
-        return json_data
\ No newline at end of file
+        json_data = binary_reader.binary_read(self.offmap, pdu_type, binary_data, self.array_mode)
+        return json_data
+
+    def as_record(self, robot_name: str, pdu_name: str, binary_data) -> record_view.PduRecord:
+        """
+        Return a zero-copy record view of binary PDU data without decoding it.
+
+        The view is built on a NumPy structured dtype generated from the offset file,
+        so ``record["linear"]["x"]`` touches only that field, and fixed-size struct arrays
+        and struct varrays are returned as structured arrays instead of lists of dicts.
+        Requires numpy.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            binary_data (bytearray | bytes | memoryview): The binary PDU data.
+
+        Returns:
+            PduRecord: A view that shares memory with binary_data.
+
+        Raises:
+            ValueError: If the PDU type is not defined or the binary data has no valid MetaData.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        return record_view.as_record(self.offmap, pdu_type, binary_data)
+
+    def get_field(self, robot_name: str, pdu_name: str, binary_data, path: str):
+        """
+        Read a single field of binary PDU data without decoding the rest of it.
+
+        The path is resolved through the offset layout once per PDU type and cached;
+        varray references are followed into the heap.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            binary_data (bytearray | bytes | memoryview): The binary PDU data.
+            path (str): Dotted member path, with ``[i]`` for array elements,
+                e.g. ``"header.stamp.sec"`` or ``"fields[1].name"``.
+
+        Returns:
+            The decoded value: a primitive, a string, a tuple for primitive arrays,
+            or a dictionary (or list of dictionaries) for structs.
+
+        Raises:
+            ValueError: If the PDU type is not defined, the path is invalid or the binary data has no valid MetaData.
+            IndexError: If an array index is out of range.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        return field_accessor.get_field(self.offmap, pdu_type, binary_data, path)
+
+    def get_proxy(self, robot_name: str, pdu_name: str, binary_data) -> field_accessor.PduProxy:
+        """
+        Return a lazy proxy over binary PDU data.
+
+        Members are decoded only when accessed, e.g. ``proxy.header.stamp.sec``.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            binary_data (bytearray | bytes | memoryview): The binary PDU data.
+
+        Returns:
+            PduProxy: A proxy that reads from binary_data on attribute access.
+
+        Raises:
+            ValueError: If the PDU type is not defined or the binary data has no valid MetaData.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        return field_accessor.get_proxy(self.offmap, pdu_type, binary_data)
+
+    def convert_binary_to_json_bytes(self, robot_name: str, pdu_name: str, binary_data, *,
+                                     include_raw: bool = False,
+                                     array_encoding: str = json_writer.ARRAY_ENCODING_LIST,
+                                     max_array_len: int = None,
+                                     out: bytearray = None) -> Union[bytes, int]:
+        """
+        Convert binary PDU data straight into UTF-8 encoded JSON.
+
+        The JSON text is written from a per-type template compiled from the offset layout,
+        without building the intermediate dictionary of convert_binary_to_json.
+        The output is compact (no whitespace), and string arrays are written as lists of strings.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            binary_data (bytearray): The binary PDU data.
+            include_raw (bool): Also write the ``name__raw`` entries, base64 encoded.
+            array_encoding (str): "list" (default) writes primitive arrays as JSON lists;
+                "base64" writes their little-endian bytes as a base64 string.
+            max_array_len (int): If set, arrays are truncated to this many elements.
+            out (bytearray): If given, the JSON is appended to out and its length is returned.
+
+        Returns:
+            bytes | int: The UTF-8 JSON, or the number of bytes appended to out.
+
+        Raises:
+            ValueError: If the PDU type is not defined or an option is invalid.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        options = json_writer.JsonOptions(include_raw, array_encoding, max_array_len)
+        meta = binary_reader.load_meta(binary_data)
+        text = json_writer.compile_json_plan(self.offmap, pdu_type, options).render(
+            binary_data, binary_io.PduMetaData.PDU_META_DATA_SIZE, meta.heap_off)
+        encoded = text.encode("utf-8")
+        if out is None:
+            return encoded
+        out += encoded
+        return len(encoded)
+
+    def iter_varray(self, robot_name: str, pdu_name: str, binary_data, path: str, chunk_bytes: int = 65536):
+        """
+        Iterate over the bytes of a large array member in chunks without copying it.
+
+        This lets large payloads such as PointCloud2 ``data`` or Image ``data`` be hashed,
+        compressed or written to disk chunk by chunk.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            binary_data (bytearray | bytes | memoryview): The binary PDU data.
+            path (str): Field path of a varray or fixed array, e.g. ``"data"``.
+            chunk_bytes (int): Maximum chunk size, rounded down to whole elements.
+
+        Returns:
+            Iterator[memoryview]: Views into binary_data, in order. They are writable
+            when binary_data is (e.g. a bytearray), so writes go to the PDU.
+
+        Raises:
+            ValueError: If the PDU type is not defined, path is not an array member,
+                or chunk_bytes is not positive.
+        """
+        if chunk_bytes <= 0:
+            raise ValueError(f"chunk_bytes must be positive: {chunk_bytes}")
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        start, size, elm_size = field_accessor.array_span(self.offmap, pdu_type, binary_data, path)
+        # resolved before iterating so that errors are raised here, not on the first next()
+        return field_accessor.iter_array_chunks(binary_data, start, size, elm_size, chunk_bytes)
+
+    def convert_binary_to_cdr(self, robot_name: str, pdu_name: str, binary_data) -> bytes:
+        """
+        Transcode binary PDU data into a ROS 2 CDR payload without decoding it into Python objects.
+
+        The fields are copied from binary_data into the CDR stream by a per-type plan
+        compiled from the offset layout; primitive arrays are copied in bulk.
+        The result is the same as ``py_to_cdr_<Type>(pdu_to_py_<Type>(binary_data))``.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            binary_data (bytearray | bytes | memoryview): The binary PDU data.
+
+        Returns:
+            bytes: The CDR payload including the 4-byte encapsulation header.
+
+        Raises:
+            ValueError: If the PDU type is not defined or binary_data has no valid MetaData.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        return cdr_transcoder.compile_cdr_plan(self.offmap, pdu_type).to_cdr(binary_data)
+
+    def convert_cdr_to_binary(self, robot_name: str, pdu_name: str, cdr_payload, out=None) -> Union[bytearray, int]:
+        """
+        Transcode a ROS 2 CDR payload into binary PDU data without building Python objects.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            cdr_payload (bytes | bytearray | memoryview): The CDR payload including the encapsulation header.
+            out (bytearray | memoryview): If given, the PDU is written into out from offset 0
+                (e.g. a reused send buffer) and its total size is returned.
+
+        Returns:
+            bytearray | int: The binary PDU data, or the number of bytes written to out.
+
+        Raises:
+            ValueError: If the PDU type is not defined or out is too small.
+            CdrError: If the CDR payload is malformed or truncated.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        return cdr_transcoder.compile_cdr_plan(self.offmap, pdu_type).from_cdr(cdr_payload, out)
+
+    def convert_columns_to_binary(self, robot_name: str, pdu_name: str, json_data: dict, columns: dict) -> bytearray:
+        """
+        Convert a PDU whose struct varrays are given as NumPy columns (struct-of-arrays) into binary data.
+
+        Each struct varray in columns is written to the heap with one vectorized
+        assignment per column instead of one dict per element, e.g.::
+
+            convertor.convert_columns_to_binary("Fleet", "visual_state", {"valid_count": n},
+                {"drones": {"x": xs, "y": ys, "z": zs, "pwm_duty": duties}})
+
+        Columns are keyed by the dotted path of an element field and have one row per
+        element; a varray of the elements is an (n, k) array, or a sequence of n arrays
+        when the lengths differ. The result is the same as convert_json_to_binary with
+        the elements as a list of dicts. Requires numpy.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            json_data (dict): The other members of the PDU.
+            columns (dict): Struct varray member name -> {column key: array}.
+
+        Returns:
+            bytearray: The binary PDU data.
+
+        Raises:
+            ValueError: If the PDU type is not defined, a member is not a struct varray,
+                or a column is unknown or has the wrong length.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        return column_batch.encode_columns(self.offmap, pdu_type, json_data, columns)
+
+    def convert_binary_to_columns(self, robot_name: str, pdu_name: str, binary_data, name: str) -> dict:
+        """
+        Decode the struct varray member name of binary PDU data into NumPy columns.
+
+        The columns have the keys accepted by convert_columns_to_binary and are views
+        over binary_data (no copy). A varray of the elements is returned as one (n, k)
+        array when every element has k items, otherwise as a list of arrays.
+        Requires numpy.
+
+        Args:
+            robot_name (str): The name of the robot.
+            pdu_name (str): The name of the PDU.
+            binary_data (bytearray | bytes | memoryview): The binary PDU data.
+            name (str): The struct varray member, e.g. "drones".
+
+        Returns:
+            dict: Column key -> array.
+
+        Raises:
+            ValueError: If the PDU type is not defined, name is not a struct varray
+                or binary_data has no valid MetaData.
+        """
+        pdu_type = self.pdu_channel_config.get_pdu_type(robot_name, pdu_name)
+        if pdu_type is None:
+            raise ValueError(f"PDU type for {robot_name}/{pdu_name} is not defined.")
+        return column_batch.decode_columns(self.offmap, pdu_type, binary_data, name)
@@ -5,7 +5,7 @@ from typing import Optional, Callable, Union, Awaitable
 from websockets import WebSocketClientProtocol, WebSocketServerProtocol
 
 from .communication_buffer import CommunicationBuffer
-from .data_packet import DataPacket, PDU_DATA, PDU_DATA_RPC_REQUEST, PDU_DATA_RPC_REPLY, DECLARE_PDU_FOR_READ, DECLARE_PDU_FOR_WRITE, REQUEST_PDU_READ, REGISTER_RPC_CLIENT
+from .data_packet import DataPacket, PacketView, encode_v2, PDU_DATA, PDU_DATA_RPC_REQUEST, PDU_DATA_RPC_REPLY, DECLARE_PDU_FOR_READ, DECLARE_PDU_FOR_WRITE, REQUEST_PDU_READ, REGISTER_RPC_CLIENT
 from .icommunication_service import ICommunicationService
 from .pdu_channel_config import PduChannelConfig
 from hakoniwa_pdu.pdu_msgs.hako_srv_msgs.pdu_pytype_ServiceRequestHeader import (
@@ -66,8 +66,10 @@ class WebSocketBaseCommunicationService(ICommunicationService):
         self, robot_name: str, channel_id: int, pdu_data: bytearray
     ) -> bytearray:
         """Pack PDU data into wire format."""
+        if self.version != "v1":
+            return encode_v2(robot_name, channel_id, pdu_data, PDU_DATA)
         packet = DataPacket(robot_name, channel_id, pdu_data)
-        return packet.encode(self.version, meta_request_type=PDU_DATA)
+        return packet.encode(self.version)
 
     async def send_data(self, robot_name: str, channel_id: int, pdu_data: bytearray) -> bool:
         if not self.service_enabled or not self.websocket:
@@ -121,8 +123,9 @@ class WebSocketBaseCommunicationService(ICommunicationService):
             async for message in ws:
                 logger.debug(f"_receive_loop_v2: received message")
                 if isinstance(message, bytes):
-                    packet = DataPacket.decode(bytearray(message), version=self.version)
-                    if packet and self.comm_buffer and packet.meta_pdu.meta_request_type in [PDU_DATA]:
+                    # bytes are immutable: the view and the buffered body share the message without copying
+                    packet = PacketView.parse(message)
+                    if packet and self.comm_buffer and packet.meta_request_type in [PDU_DATA]:
                         self.comm_buffer.put_packet(packet)
                         if self.data_handler is not None:
                             try:
@@ -133,8 +136,8 @@ class WebSocketBaseCommunicationService(ICommunicationService):
                             except Exception as e:
                                 logger.error(f"scheduling data_handler failed: {e}")
                         continue
-                    elif packet and packet.meta_pdu.meta_request_type in [PDU_DATA_RPC_REQUEST]:
-                        logger.debug(f'handling RPC request: meta={packet.meta_pdu.robot_name}')
+                    elif packet and packet.meta_request_type in [PDU_DATA_RPC_REQUEST]:
+                        logger.debug(f'handling RPC request: meta={packet.robot_name}')
                         header: ServiceRequestHeader = pdu_to_py_ServiceRequestHeader(
                             packet.get_pdu_data()
                         )
@@ -142,7 +145,7 @@ class WebSocketBaseCommunicationService(ICommunicationService):
                         self.comm_buffer.put_rpc_packet(
                             header.service_name, header.client_name, packet.get_pdu_data()
                         )
-                    elif packet and packet.meta_pdu.meta_request_type in [PDU_DATA_RPC_REPLY]:
+                    elif packet and packet.meta_request_type in [PDU_DATA_RPC_REPLY]:
                         header: ServiceResponseHeader = pdu_to_py_ServiceResponseHeader(
                             packet.get_pdu_data()
                         )
@@ -151,10 +154,10 @@ class WebSocketBaseCommunicationService(ICommunicationService):
                         )
                     elif (
                         packet
-                        and packet.meta_pdu.meta_request_type
+                        and packet.meta_request_type
                         in [DECLARE_PDU_FOR_READ, DECLARE_PDU_FOR_WRITE, REQUEST_PDU_READ, REGISTER_RPC_CLIENT]
                     ):
-                        logger.debug(f"handling packet {packet.meta_pdu.meta_request_type}")
+                        logger.debug(f"handling packet {packet.meta_request_type}")
                         if self.handler is None:
                             raise RuntimeError("handler not registered")
                         # 受信ループをブロックしない：コルーチンなら create_task、同期関数なら to_thread
@@ -168,7 +171,7 @@ class WebSocketBaseCommunicationService(ICommunicationService):
                             logger.error(f"scheduling handler failed: {e}")
                     else:
                         raise ValueError(
-                            f"Unknown message type: {packet.meta_pdu.meta_request_type if packet else 'None'}"
+                            f"Unknown message type: {packet.meta_request_type if packet else 'None'}"
                         )
                 else:
                     logger.warning(f"Unexpected message type: {type(message)}")
@@ -183,5 +186,5 @@ class WebSocketBaseCommunicationService(ICommunicationService):
         self.handler = handler
 
     def register_data_event_handler(self, handler: Callable[[DataPacket], Awaitable[None]]):
-        """Called for every PDU_DATA after it is buffered."""
+        """Called for every PDU_DATA after it is buffered; v2 frames are passed as a PacketView."""
         self.data_handler = handler
\ No newline at end of file
@@ -9,7 +9,8 @@ from hakoniwa_pdu.impl.data_packet import (
     DECLARE_PDU_FOR_READ,
     DECLARE_PDU_FOR_WRITE,
     REQUEST_PDU_READ,
-    PDU_DATA
+    PDU_DATA,
+    encode_v2
 )
 from hakoniwa_pdu.impl.pdu_channel_config import PduChannelConfig
 from hakoniwa_pdu.impl.pdu_convertor import PduConvertor
@@ -292,7 +293,9 @@ class PduManager:
             pdu_name (str): The name of the PDU.
 
         Returns:
-            Optional[bytearray]: Raw binary data, or None if not available.
+            Optional[bytearray]: Raw binary data, or None if not available. PDUs received
+            as v2 frames over WebSocket are a read-only memoryview over the frame (no copy);
+            use bytearray(data) for a modifiable copy.
         """        
         if not self.is_service_enabled():
             return None
@@ -422,12 +425,9 @@ class PduManager:
 
 
     def _build_binary(self, meta_request_type: int, robot_name: str, channel_id: int, pdu_data: bytearray) -> bytearray:
-        packet = DataPacket(
-            robot_name=robot_name,
-            channel_id=channel_id,
-            body_data=pdu_data
-        )
-        return packet.encode(version = "v2", meta_request_type=meta_request_type)
+        return encode_v2(robot_name, channel_id,
+                         pdu_data if pdu_data is not None else b"",
+                         meta_request_type if meta_request_type is not None else 0)
 
     def _build_binary_v1(self, robot_name: str, channel_id: int, pdu_data: bytearray) -> bytearray:
         #print("byte: hex", pdu_data.hex())
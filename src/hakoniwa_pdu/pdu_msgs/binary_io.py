@@ -44,6 +44,9 @@ def binTofloat64(binary):
 def binTostring(binary, max_len=128):
     try:
         sub = binary[:max_len]
+        if isinstance(sub, memoryview):
+            # PDUs received without copying are memoryviews over the frame
+            sub = sub.tobytes()
         end = sub.find(b'\0')
         if end == -1:
             end = max_len
@@ -93,6 +96,23 @@ def float64Tobin(arg):
 def stringTobin(arg):
     return arg.encode(encoding='utf-8') + b'\x00'
 
+# struct format characters of the fixed-size primitive types (little endian)
+PRIMITIVE_FORMATS = {
+    "int8": "b",
+    "uint8": "B",
+    "byte": "B",
+    "char": "B",
+    "int16": "h",
+    "uint16": "H",
+    "int32": "i",
+    "bool": "i",
+    "uint32": "I",
+    "int64": "q",
+    "uint64": "Q",
+    "float32": "f",
+    "float64": "d",
+}
+
 def typeTobin(type, arg):
     if type in ("byte", "char"):
         type = "uint8"
@@ -194,9 +214,36 @@ def binToArrayValues(type, arg, array_len=None, elm_size=None):
     else:
         return None
 
+def bufferTobin_array(type, values):
+    """
+    Returns numpy arrays and other buffer-protocol objects (bytes, array.array,
+    memoryview) as a flat byte view without expanding them into struct.pack
+    arguments, or None when values has to go through the element-wise path.
+    """
+    if isinstance(values, (list, tuple)):
+        return None
+    fmt = PRIMITIVE_FORMATS.get(type)
+    if fmt is None:
+        return None
+    if hasattr(values, "dtype") and hasattr(values, "astype"):
+        # numpy.ndarray: convert only when the dtype differs
+        return memoryview(values.astype("<" + fmt, order="C", copy=False)).cast("B")
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    if view.itemsize != struct.calcsize(fmt) or not view.c_contiguous:
+        return None
+    if view.itemsize > 1 and view.format.lstrip("<=@") != fmt:
+        return None
+    return view.cast("B")
+
 def typeTobin_array(type, values, elm_size=None):
     if type in ("byte", "char"):
         type = "uint8"
+    binary = bufferTobin_array(type, values)
+    if binary is not None:
+        return binary
     count = len(values)
     if type == "int8":
         return struct.pack(f'<{count}b', *values)
@@ -266,8 +313,14 @@ def classify_pdu_metadata(binary_data):
     return PduMetaDataState.INVALID
 
 
+# how the generated readers return primitive arrays
+ARRAY_MODE_TUPLE = "tuple"
+ARRAY_MODE_NUMPY = "numpy"
+
 class PduMetaData:
     PDU_META_DATA_SIZE = 24
+    # magicno, version, base_off, heap_off, total_size (+ 4 reserved bytes)
+    PDU_META_DATA_STRUCT = struct.Struct('<IIIII4x')
     PDU_META_DATA_MAGICNO = 0x12345678
     PDU_META_DATA_VERSION = 1
     def __init__(self):
@@ -276,6 +329,8 @@ class PduMetaData:
         self.base_off = 0
         self.heap_off = 0
         self.total_size = 0
+        # decode option carried through the generated binary_read_recursive_* functions
+        self.array_mode = ARRAY_MODE_TUPLE
     def set_empty(self):
         self.magicno = PduMetaData.PDU_META_DATA_MAGICNO
         self.version = PduMetaData.PDU_META_DATA_VERSION
@@ -297,13 +352,12 @@ class PduMetaDataParser:
     def load_pdu_meta(self, binary_data):
         if len(binary_data) < PduMetaData.PDU_META_DATA_SIZE:
             return None
-        magicno = binTovalue("uint32", readBinary(binary_data, 0, 4))
-        version = binTovalue("uint32", readBinary(binary_data, 4, 4))
+        magicno, version, base_off, heap_off, total_size = PduMetaData.PDU_META_DATA_STRUCT.unpack_from(binary_data, 0)
         if magicno != PduMetaData.PDU_META_DATA_MAGICNO or version != PduMetaData.PDU_META_DATA_VERSION:
             return None
         self.meta.magicno    = magicno
         self.meta.version    = version
-        self.meta.base_off   = binTovalue("uint32", readBinary(binary_data, 8, 4))
-        self.meta.heap_off   = binTovalue("uint32", readBinary(binary_data, 12, 4))
-        self.meta.total_size = binTovalue("uint32", readBinary(binary_data, 16, 4))
+        self.meta.base_off   = base_off
+        self.meta.heap_off   = heap_off
+        self.meta.total_size = total_size
         return self.meta
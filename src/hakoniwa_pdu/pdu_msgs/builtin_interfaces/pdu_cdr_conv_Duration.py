@@ -1,22 +1,25 @@
 from .pdu_pytype_Duration import Duration
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iI")  # sec, nanosec
+
 
 def py_to_cdr_body_Duration(writer: CdrWriter, src: Duration):
-    writer.write_int32(src.sec)
-    writer.write_uint32(src.nanosec)
+    writer.write_run(_CDR_RUN_0, (src.sec, src.nanosec))
 
 
 def cdr_body_to_py_Duration(reader: CdrReader, dst: Duration):
-    dst.sec = reader.read_int32()
-    dst.nanosec = reader.read_uint32()
+    dst.sec, dst.nanosec = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Duration(src: Duration) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["builtin_interfaces/Duration"])
     writer.write_encapsulation()
     py_to_cdr_body_Duration(writer, src)
     return writer.bytes()
@@ -10,6 +10,8 @@ class Time:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("sec", "nanosec")
+
     sec: int
     nanosec: int
 
@@ -31,26 +33,8 @@ class Time:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'sec'
-        field_val = self.sec
-        if isinstance(field_val, bytearray):
-            d['sec'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['sec'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['sec'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['sec'] = field_val
-        # handle field 'nanosec'
-        field_val = self.nanosec
-        if isinstance(field_val, bytearray):
-            d['nanosec'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['nanosec'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['nanosec'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['nanosec'] = field_val
+        d['sec'] = self.sec
+        d['nanosec'] = self.nanosec
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class Time:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'sec'
-        if 'sec' in d:
-            field_type = cls.__annotations__.get('sec')
-            value = d['sec']
-            
-            if field_type is bytearray:
-                obj.sec = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.sec = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.sec = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.sec = field_type.from_dict(value)
-            else:
-                obj.sec = value
-        # handle field 'nanosec'
-        if 'nanosec' in d:
-            field_type = cls.__annotations__.get('nanosec')
-            value = d['nanosec']
-            
-            if field_type is bytearray:
-                obj.nanosec = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.nanosec = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.nanosec = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.nanosec = field_type.from_dict(value)
-            else:
-                obj.nanosec = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.sec = d.get('sec', 0)
+        obj.nanosec = d.get('nanosec', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -1,24 +1,29 @@
 from .pdu_pytype_HakoCan import HakoCan
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..can_msgs.pdu_cdr_conv_HakoCanBody import *
 from ..can_msgs.pdu_cdr_conv_HakoCanHead import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IIIII")  # head.channel, head.ide, head.rtr, head.dlc, head.canid
+
 
 def py_to_cdr_body_HakoCan(writer: CdrWriter, src: HakoCan):
-    py_to_cdr_body_HakoCanHead(writer, src.head)
+    writer.write_run(_CDR_RUN_0, (src.head.channel, src.head.ide, src.head.rtr, src.head.dlc, src.head.canid))
     py_to_cdr_body_HakoCanBody(writer, src.body)
 
 
 def cdr_body_to_py_HakoCan(reader: CdrReader, dst: HakoCan):
-    cdr_body_to_py_HakoCanHead(reader, dst.head)
+    dst.head.channel, dst.head.ide, dst.head.rtr, dst.head.dlc, dst.head.canid = reader.read_run(_CDR_RUN_0)
     cdr_body_to_py_HakoCanBody(reader, dst.body)
     return dst
 
 
 def py_to_cdr_HakoCan(src: HakoCan) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["can_msgs/HakoCan"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoCan(writer, src)
     return writer.bytes()
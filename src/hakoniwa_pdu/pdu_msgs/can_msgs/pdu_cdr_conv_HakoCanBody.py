@@ -1,22 +1,22 @@
 from .pdu_pytype_HakoCanBody import HakoCanBody
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
 
 def py_to_cdr_body_HakoCanBody(writer: CdrWriter, src: HakoCanBody):
-    values = src.data
-    for i in range(8):
-        writer.write_uint8(values[i] if i < len(values) else 0)
+    writer.write_sequence("B", src.data, 8)
 
 
 def cdr_body_to_py_HakoCanBody(reader: CdrReader, dst: HakoCanBody):
-    dst.data = [reader.read_uint8() for _ in range(8)]
+    dst.data = reader.read_sequence("B", 8)
     return dst
 
 
 def py_to_cdr_HakoCanBody(src: HakoCanBody) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["can_msgs/HakoCanBody"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoCanBody(writer, src)
     return writer.bytes()
@@ -1,28 +1,25 @@
 from .pdu_pytype_HakoCanHead import HakoCanHead
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IIIII")  # channel, ide, rtr, dlc, canid
+
 
 def py_to_cdr_body_HakoCanHead(writer: CdrWriter, src: HakoCanHead):
-    writer.write_uint32(src.channel)
-    writer.write_uint32(src.ide)
-    writer.write_uint32(src.rtr)
-    writer.write_uint32(src.dlc)
-    writer.write_uint32(src.canid)
+    writer.write_run(_CDR_RUN_0, (src.channel, src.ide, src.rtr, src.dlc, src.canid))
 
 
 def cdr_body_to_py_HakoCanHead(reader: CdrReader, dst: HakoCanHead):
-    dst.channel = reader.read_uint32()
-    dst.ide = reader.read_uint32()
-    dst.rtr = reader.read_uint32()
-    dst.dlc = reader.read_uint32()
-    dst.canid = reader.read_uint32()
+    dst.channel, dst.ide, dst.rtr, dst.dlc, dst.canid = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoCanHead(src: HakoCanHead) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["can_msgs/HakoCanHead"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoCanHead(writer, src)
     return writer.bytes()
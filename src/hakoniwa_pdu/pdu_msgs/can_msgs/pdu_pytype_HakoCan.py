@@ -12,6 +12,8 @@ class HakoCan:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("head", "body")
+
     head: HakoCanHead
     body: HakoCanBody
 
@@ -33,26 +35,8 @@ class HakoCan:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'head'
-        field_val = self.head
-        if isinstance(field_val, bytearray):
-            d['head'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['head'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['head'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['head'] = field_val
-        # handle field 'body'
-        field_val = self.body
-        if isinstance(field_val, bytearray):
-            d['body'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['body'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['body'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['body'] = field_val
+        d['head'] = self.head.to_dict()
+        d['body'] = self.body.to_dict()
         return d
 
     @classmethod
@@ -60,41 +44,10 @@ class HakoCan:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'head'
-        if 'head' in d:
-            field_type = cls.__annotations__.get('head')
-            value = d['head']
-            
-            if field_type is bytearray:
-                obj.head = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.head = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.head = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.head = field_type.from_dict(value)
-            else:
-                obj.head = value
-        # handle field 'body'
-        if 'body' in d:
-            field_type = cls.__annotations__.get('body')
-            value = d['body']
-            
-            if field_type is bytearray:
-                obj.body = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.body = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.body = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.body = field_type.from_dict(value)
-            else:
-                obj.body = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.head = HakoCanHead.from_dict(d['head']) if 'head' in d else HakoCanHead()
+        obj.body = HakoCanBody.from_dict(d['body']) if 'body' in d else HakoCanBody()
         return obj
 
     def to_json(self, indent=2):
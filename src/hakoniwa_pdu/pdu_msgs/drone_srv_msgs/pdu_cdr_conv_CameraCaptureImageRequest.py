@@ -1,5 +1,6 @@
 from .pdu_pytype_CameraCaptureImageRequest import CameraCaptureImageRequest
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -16,7 +17,8 @@ def cdr_body_to_py_CameraCaptureImageRequest(reader: CdrReader, dst: CameraCaptu
 
 
 def py_to_cdr_CameraCaptureImageRequest(src: CameraCaptureImageRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/CameraCaptureImageRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_CameraCaptureImageRequest(writer, src)
     return writer.bytes()
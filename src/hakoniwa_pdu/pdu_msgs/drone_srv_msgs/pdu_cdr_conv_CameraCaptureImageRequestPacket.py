@@ -1,5 +1,6 @@
 from .pdu_pytype_CameraCaptureImageRequestPacket import CameraCaptureImageRequestPacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..drone_srv_msgs.pdu_cdr_conv_CameraCaptureImageRequest import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
@@ -18,7 +19,8 @@ def cdr_body_to_py_CameraCaptureImageRequestPacket(reader: CdrReader, dst: Camer
 
 
 def py_to_cdr_CameraCaptureImageRequestPacket(src: CameraCaptureImageRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/CameraCaptureImageRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_CameraCaptureImageRequestPacket(writer, src)
     return writer.bytes()
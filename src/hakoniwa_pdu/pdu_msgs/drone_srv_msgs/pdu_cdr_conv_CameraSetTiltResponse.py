@@ -1,5 +1,6 @@
 from .pdu_pytype_CameraSetTiltResponse import CameraSetTiltResponse
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -16,7 +17,8 @@ def cdr_body_to_py_CameraSetTiltResponse(reader: CdrReader, dst: CameraSetTiltRe
 
 
 def py_to_cdr_CameraSetTiltResponse(src: CameraSetTiltResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/CameraSetTiltResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_CameraSetTiltResponse(writer, src)
     return writer.bytes()
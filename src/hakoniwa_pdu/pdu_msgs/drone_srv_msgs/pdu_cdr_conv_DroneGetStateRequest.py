@@ -1,5 +1,6 @@
 from .pdu_pytype_DroneGetStateRequest import DroneGetStateRequest
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_DroneGetStateRequest(reader: CdrReader, dst: DroneGetStateReq
 
 
 def py_to_cdr_DroneGetStateRequest(src: DroneGetStateRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneGetStateRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneGetStateRequest(writer, src)
     return writer.bytes()
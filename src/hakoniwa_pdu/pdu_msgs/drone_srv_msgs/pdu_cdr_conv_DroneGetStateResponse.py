@@ -1,5 +1,6 @@
 from .pdu_pytype_DroneGetStateResponse import DroneGetStateResponse
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_msgs.pdu_cdr_conv_HakoBatteryStatus import *
 from ..geometry_msgs.pdu_cdr_conv_Point import *
@@ -7,28 +8,26 @@ from ..geometry_msgs.pdu_cdr_conv_Pose import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("??ddddddddddII")  # ok, is_ready, current_pose.position.x, current_pose.position.y, current_pose.position.z, current_pose.orientation.x, current_pose.orientation.y, current_pose.orientation.z, current_pose.orientation.w, battery_status.full_voltage, battery_status.curr_voltage, battery_status.curr_temp, battery_status.status, battery_status.cycles
+
 
 def py_to_cdr_body_DroneGetStateResponse(writer: CdrWriter, src: DroneGetStateResponse):
-    writer.write_bool(src.ok)
-    writer.write_bool(src.is_ready)
-    py_to_cdr_body_Pose(writer, src.current_pose)
-    py_to_cdr_body_HakoBatteryStatus(writer, src.battery_status)
+    writer.write_run(_CDR_RUN_0, (src.ok, src.is_ready, src.current_pose.position.x, src.current_pose.position.y, src.current_pose.position.z, src.current_pose.orientation.x, src.current_pose.orientation.y, src.current_pose.orientation.z, src.current_pose.orientation.w, src.battery_status.full_voltage, src.battery_status.curr_voltage, src.battery_status.curr_temp, src.battery_status.status, src.battery_status.cycles))
     writer.write_string(src.mode)
     writer.write_string(src.message)
 
 
 def cdr_body_to_py_DroneGetStateResponse(reader: CdrReader, dst: DroneGetStateResponse):
-    dst.ok = reader.read_bool()
-    dst.is_ready = reader.read_bool()
-    cdr_body_to_py_Pose(reader, dst.current_pose)
-    cdr_body_to_py_HakoBatteryStatus(reader, dst.battery_status)
+    dst.ok, dst.is_ready, dst.current_pose.position.x, dst.current_pose.position.y, dst.current_pose.position.z, dst.current_pose.orientation.x, dst.current_pose.orientation.y, dst.current_pose.orientation.z, dst.current_pose.orientation.w, dst.battery_status.full_voltage, dst.battery_status.curr_voltage, dst.battery_status.curr_temp, dst.battery_status.status, dst.battery_status.cycles = reader.read_run(_CDR_RUN_0)
     dst.mode = reader.read_string()
     dst.message = reader.read_string()
     return dst
 
 
 def py_to_cdr_DroneGetStateResponse(src: DroneGetStateResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneGetStateResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneGetStateResponse(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_DroneGetStateResponsePacket import DroneGetStateResponsePacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..drone_srv_msgs.pdu_cdr_conv_DroneGetStateResponse import *
 from ..hako_msgs.pdu_cdr_conv_HakoBatteryStatus import *
@@ -22,7 +23,8 @@ def cdr_body_to_py_DroneGetStateResponsePacket(reader: CdrReader, dst: DroneGetS
 
 
 def py_to_cdr_DroneGetStateResponsePacket(src: DroneGetStateResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneGetStateResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneGetStateResponsePacket(writer, src)
     return writer.bytes()
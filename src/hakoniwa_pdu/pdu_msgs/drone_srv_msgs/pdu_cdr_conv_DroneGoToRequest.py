@@ -1,31 +1,28 @@
 from .pdu_pytype_DroneGoToRequest import DroneGoToRequest
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddffff")  # target_pose.x, target_pose.y, target_pose.z, speed_m_s, yaw_deg, tolerance_m, timeout_sec
+
 
 def py_to_cdr_body_DroneGoToRequest(writer: CdrWriter, src: DroneGoToRequest):
     writer.write_string(src.drone_name)
-    py_to_cdr_body_Vector3(writer, src.target_pose)
-    writer.write_float32(src.speed_m_s)
-    writer.write_float32(src.yaw_deg)
-    writer.write_float32(src.tolerance_m)
-    writer.write_float32(src.timeout_sec)
+    writer.write_run(_CDR_RUN_0, (src.target_pose.x, src.target_pose.y, src.target_pose.z, src.speed_m_s, src.yaw_deg, src.tolerance_m, src.timeout_sec))
 
 
 def cdr_body_to_py_DroneGoToRequest(reader: CdrReader, dst: DroneGoToRequest):
     dst.drone_name = reader.read_string()
-    cdr_body_to_py_Vector3(reader, dst.target_pose)
-    dst.speed_m_s = reader.read_float32()
-    dst.yaw_deg = reader.read_float32()
-    dst.tolerance_m = reader.read_float32()
-    dst.timeout_sec = reader.read_float32()
+    dst.target_pose.x, dst.target_pose.y, dst.target_pose.z, dst.speed_m_s, dst.yaw_deg, dst.tolerance_m, dst.timeout_sec = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_DroneGoToRequest(src: DroneGoToRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneGoToRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneGoToRequest(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_DroneGoToRequestPacket import DroneGoToRequestPacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..drone_srv_msgs.pdu_cdr_conv_DroneGoToRequest import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
@@ -19,7 +20,8 @@ def cdr_body_to_py_DroneGoToRequestPacket(reader: CdrReader, dst: DroneGoToReque
 
 
 def py_to_cdr_DroneGoToRequestPacket(src: DroneGoToRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneGoToRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneGoToRequestPacket(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_DroneGoToResponsePacket import DroneGoToResponsePacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..drone_srv_msgs.pdu_cdr_conv_DroneGoToResponse import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
@@ -18,7 +19,8 @@ def cdr_body_to_py_DroneGoToResponsePacket(reader: CdrReader, dst: DroneGoToResp
 
 
 def py_to_cdr_DroneGoToResponsePacket(src: DroneGoToResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneGoToResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneGoToResponsePacket(writer, src)
     return writer.bytes()
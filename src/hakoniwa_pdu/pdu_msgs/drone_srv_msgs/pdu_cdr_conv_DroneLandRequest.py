@@ -1,5 +1,6 @@
 from .pdu_pytype_DroneLandRequest import DroneLandRequest
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_DroneLandRequest(reader: CdrReader, dst: DroneLandRequest):
 
 
 def py_to_cdr_DroneLandRequest(src: DroneLandRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneLandRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneLandRequest(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_DroneSetReadyRequest import DroneSetReadyRequest
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_DroneSetReadyRequest(reader: CdrReader, dst: DroneSetReadyReq
 
 
 def py_to_cdr_DroneSetReadyRequest(src: DroneSetReadyRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneSetReadyRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneSetReadyRequest(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_DroneSetReadyResponse import DroneSetReadyResponse
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -16,7 +17,8 @@ def cdr_body_to_py_DroneSetReadyResponse(reader: CdrReader, dst: DroneSetReadyRe
 
 
 def py_to_cdr_DroneSetReadyResponse(src: DroneSetReadyResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneSetReadyResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneSetReadyResponse(writer, src)
     return writer.bytes()
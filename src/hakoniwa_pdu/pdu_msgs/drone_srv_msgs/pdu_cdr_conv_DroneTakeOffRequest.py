@@ -1,5 +1,6 @@
 from .pdu_pytype_DroneTakeOffRequest import DroneTakeOffRequest
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -16,7 +17,8 @@ def cdr_body_to_py_DroneTakeOffRequest(reader: CdrReader, dst: DroneTakeOffReque
 
 
 def py_to_cdr_DroneTakeOffRequest(src: DroneTakeOffRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/DroneTakeOffRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneTakeOffRequest(writer, src)
     return writer.bytes()
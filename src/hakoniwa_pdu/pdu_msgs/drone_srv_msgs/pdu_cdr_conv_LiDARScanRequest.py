@@ -1,5 +1,6 @@
 from .pdu_pytype_LiDARScanRequest import LiDARScanRequest
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_LiDARScanRequest(reader: CdrReader, dst: LiDARScanRequest):
 
 
 def py_to_cdr_LiDARScanRequest(src: LiDARScanRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/LiDARScanRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_LiDARScanRequest(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_LiDARScanResponse import LiDARScanResponse
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Point import *
@@ -10,24 +11,28 @@ from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddddddd")  # lidar_pose.position.x, lidar_pose.position.y, lidar_pose.position.z, lidar_pose.orientation.x, lidar_pose.orientation.y, lidar_pose.orientation.z, lidar_pose.orientation.w
+
 
 def py_to_cdr_body_LiDARScanResponse(writer: CdrWriter, src: LiDARScanResponse):
     writer.write_bool(src.ok)
     py_to_cdr_body_PointCloud2(writer, src.point_cloud)
-    py_to_cdr_body_Pose(writer, src.lidar_pose)
+    writer.write_run(_CDR_RUN_0, (src.lidar_pose.position.x, src.lidar_pose.position.y, src.lidar_pose.position.z, src.lidar_pose.orientation.x, src.lidar_pose.orientation.y, src.lidar_pose.orientation.z, src.lidar_pose.orientation.w))
     writer.write_string(src.message)
 
 
 def cdr_body_to_py_LiDARScanResponse(reader: CdrReader, dst: LiDARScanResponse):
     dst.ok = reader.read_bool()
     cdr_body_to_py_PointCloud2(reader, dst.point_cloud)
-    cdr_body_to_py_Pose(reader, dst.lidar_pose)
+    dst.lidar_pose.position.x, dst.lidar_pose.position.y, dst.lidar_pose.position.z, dst.lidar_pose.orientation.x, dst.lidar_pose.orientation.y, dst.lidar_pose.orientation.z, dst.lidar_pose.orientation.w = reader.read_run(_CDR_RUN_0)
     dst.message = reader.read_string()
     return dst
 
 
 def py_to_cdr_LiDARScanResponse(src: LiDARScanResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/LiDARScanResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_LiDARScanResponse(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_LiDARScanResponsePacket import LiDARScanResponsePacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..drone_srv_msgs.pdu_cdr_conv_LiDARScanResponse import *
@@ -25,7 +26,8 @@ def cdr_body_to_py_LiDARScanResponsePacket(reader: CdrReader, dst: LiDARScanResp
 
 
 def py_to_cdr_LiDARScanResponsePacket(src: LiDARScanResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/LiDARScanResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_LiDARScanResponsePacket(writer, src)
     return writer.bytes()
@@ -1,24 +1,27 @@
 from .pdu_pytype_MagnetGrabRequest import MagnetGrabRequest
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("?f")  # grab_on, timeout_sec
+
 
 def py_to_cdr_body_MagnetGrabRequest(writer: CdrWriter, src: MagnetGrabRequest):
     writer.write_string(src.drone_name)
-    writer.write_bool(src.grab_on)
-    writer.write_float32(src.timeout_sec)
+    writer.write_run(_CDR_RUN_0, (src.grab_on, src.timeout_sec))
 
 
 def cdr_body_to_py_MagnetGrabRequest(reader: CdrReader, dst: MagnetGrabRequest):
     dst.drone_name = reader.read_string()
-    dst.grab_on = reader.read_bool()
-    dst.timeout_sec = reader.read_float32()
+    dst.grab_on, dst.timeout_sec = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_MagnetGrabRequest(src: MagnetGrabRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/MagnetGrabRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_MagnetGrabRequest(writer, src)
     return writer.bytes()
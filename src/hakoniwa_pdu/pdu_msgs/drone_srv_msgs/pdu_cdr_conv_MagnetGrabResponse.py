@@ -1,26 +1,27 @@
 from .pdu_pytype_MagnetGrabResponse import MagnetGrabResponse
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("???")  # ok, magnet_on, contact_on
+
 
 def py_to_cdr_body_MagnetGrabResponse(writer: CdrWriter, src: MagnetGrabResponse):
-    writer.write_bool(src.ok)
-    writer.write_bool(src.magnet_on)
-    writer.write_bool(src.contact_on)
+    writer.write_run(_CDR_RUN_0, (src.ok, src.magnet_on, src.contact_on))
     writer.write_string(src.message)
 
 
 def cdr_body_to_py_MagnetGrabResponse(reader: CdrReader, dst: MagnetGrabResponse):
-    dst.ok = reader.read_bool()
-    dst.magnet_on = reader.read_bool()
-    dst.contact_on = reader.read_bool()
+    dst.ok, dst.magnet_on, dst.contact_on = reader.read_run(_CDR_RUN_0)
     dst.message = reader.read_string()
     return dst
 
 
 def py_to_cdr_MagnetGrabResponse(src: MagnetGrabResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["drone_srv_msgs/MagnetGrabResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_MagnetGrabResponse(writer, src)
     return writer.bytes()
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<i")  # ok
 
-def pdu_to_py_CameraCaptureImageResponse(binary_data: bytearray) -> CameraCaptureImageResponse:
-    py_obj = CameraCaptureImageResponse()
+
+def pdu_to_py_CameraCaptureImageResponse(binary_data: bytearray, out: CameraCaptureImageResponse = None, array_mode: str = None) -> CameraCaptureImageResponse:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = CameraCaptureImageResponse() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_CameraCaptureImageResponse(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -26,9 +32,8 @@ def binary_read_recursive_CameraCaptureImageResponse(meta: binary_io.PduMetaData
     # offset: 0 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.ok = binary_io.binTovalue("bool", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 0)
+    py_obj.ok = values[0] != 0
     
     # array_type: varray 
     # data_type: primitive 
@@ -40,9 +45,7 @@ def binary_read_recursive_CameraCaptureImageResponse(meta: binary_io.PduMetaData
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 4, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 4 + 4, 4))
     one_elm_size = 1 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.data = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.data = read_array_values(meta, "uint8", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: single 
@@ -59,33 +62,13 @@ def binary_read_recursive_CameraCaptureImageResponse(meta: binary_io.PduMetaData
     return py_obj
 
 
-def py_to_pdu_CameraCaptureImageResponse(py_obj: CameraCaptureImageResponse) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_CameraCaptureImageResponse(py_obj: CameraCaptureImageResponse, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_CameraCaptureImageResponse(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_CameraCaptureImageResponse(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: CameraCaptureImageResponse):
     # array_type: single 
@@ -94,13 +77,8 @@ def binary_write_recursive_CameraCaptureImageResponse(parent_off: int, bw_contai
     # type_name: bool 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 0
 
-    
-    bin = binary_io.typeTobin(type, py_obj.ok)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(1 if py_obj.ok else 0), expected_offset=parent_off + 0)
     
     # array_type: varray 
     # data_type: primitive 
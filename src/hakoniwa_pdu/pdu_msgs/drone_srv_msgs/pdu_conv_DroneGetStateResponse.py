@@ -9,13 +9,19 @@ from ..geometry_msgs.pdu_conv_Pose import *
 from ..hako_msgs.pdu_conv_HakoBatteryStatus import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ii")  # ok, is_ready
 
-def pdu_to_py_DroneGetStateResponse(binary_data: bytearray) -> DroneGetStateResponse:
-    py_obj = DroneGetStateResponse()
+
+def pdu_to_py_DroneGetStateResponse(binary_data: bytearray, out: DroneGetStateResponse = None, array_mode: str = None) -> DroneGetStateResponse:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = DroneGetStateResponse() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_DroneGetStateResponse(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,11 +33,6 @@ def binary_read_recursive_DroneGetStateResponse(meta: binary_io.PduMetaData, bin
     # type_name: bool 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.ok = binary_io.binTovalue("bool", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_ready 
@@ -39,9 +40,9 @@ def binary_read_recursive_DroneGetStateResponse(meta: binary_io.PduMetaData, bin
     # offset: 4 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.is_ready = binary_io.binTovalue("bool", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 0)
+    py_obj.ok = values[0] != 0
+    py_obj.is_ready = values[1] != 0
     
     # array_type: single 
     # data_type: struct 
@@ -50,7 +51,7 @@ def binary_read_recursive_DroneGetStateResponse(meta: binary_io.PduMetaData, bin
     # offset: 8 size: 56 
     # array_len: 1
 
-    tmp_py_obj = Pose()
+    tmp_py_obj = reuse_obj(py_obj.current_pose, Pose)
     binary_read_recursive_Pose(meta, binary_data, tmp_py_obj, base_off + 8)
     py_obj.current_pose = tmp_py_obj
     
@@ -61,7 +62,7 @@ def binary_read_recursive_DroneGetStateResponse(meta: binary_io.PduMetaData, bin
     # offset: 64 size: 32 
     # array_len: 1
 
-    tmp_py_obj = HakoBatteryStatus()
+    tmp_py_obj = reuse_obj(py_obj.battery_status, HakoBatteryStatus)
     binary_read_recursive_HakoBatteryStatus(meta, binary_data, tmp_py_obj, base_off + 64)
     py_obj.battery_status = tmp_py_obj
     
@@ -90,33 +91,13 @@ def binary_read_recursive_DroneGetStateResponse(meta: binary_io.PduMetaData, bin
     return py_obj
 
 
-def py_to_pdu_DroneGetStateResponse(py_obj: DroneGetStateResponse) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_DroneGetStateResponse(py_obj: DroneGetStateResponse, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_DroneGetStateResponse(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_DroneGetStateResponse(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: DroneGetStateResponse):
     # array_type: single 
@@ -125,27 +106,14 @@ def binary_write_recursive_DroneGetStateResponse(parent_off: int, bw_container:
     # type_name: bool 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.ok)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_ready 
     # type_name: bool 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 4
 
-    
-    bin = binary_io.typeTobin(type, py_obj.is_ready)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(1 if py_obj.ok else 0, 1 if py_obj.is_ready else 0), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: struct 
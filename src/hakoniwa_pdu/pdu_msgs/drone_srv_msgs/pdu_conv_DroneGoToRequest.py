@@ -8,13 +8,19 @@ from .. import binary_io
 from ..geometry_msgs.pdu_conv_Vector3 import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ffff")  # speed_m_s, yaw_deg, tolerance_m, timeout_sec
 
-def pdu_to_py_DroneGoToRequest(binary_data: bytearray) -> DroneGoToRequest:
-    py_obj = DroneGoToRequest()
+
+def pdu_to_py_DroneGoToRequest(binary_data: bytearray, out: DroneGoToRequest = None, array_mode: str = None) -> DroneGoToRequest:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = DroneGoToRequest() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_DroneGoToRequest(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -38,7 +44,7 @@ def binary_read_recursive_DroneGoToRequest(meta: binary_io.PduMetaData, binary_d
     # offset: 128 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.target_pose, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 128)
     py_obj.target_pose = tmp_py_obj
     
@@ -48,33 +54,18 @@ def binary_read_recursive_DroneGoToRequest(meta: binary_io.PduMetaData, binary_d
     # type_name: float32 
     # offset: 152 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 152, 4)
-    py_obj.speed_m_s = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw_deg 
     # type_name: float32 
     # offset: 156 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 156, 4)
-    py_obj.yaw_deg = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: tolerance_m 
     # type_name: float32 
     # offset: 160 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 160, 4)
-    py_obj.tolerance_m = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: timeout_sec 
@@ -82,40 +73,18 @@ def binary_read_recursive_DroneGoToRequest(meta: binary_io.PduMetaData, binary_d
     # offset: 164 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 164, 4)
-    py_obj.timeout_sec = binary_io.binTovalue("float32", bin)
+    py_obj.speed_m_s, py_obj.yaw_deg, py_obj.tolerance_m, py_obj.timeout_sec = _RUN_0.unpack_from(binary_data, base_off + 152)
     
     return py_obj
 
 
-def py_to_pdu_DroneGoToRequest(py_obj: DroneGoToRequest) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_DroneGoToRequest(py_obj: DroneGoToRequest, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_DroneGoToRequest(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_DroneGoToRequest(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: DroneGoToRequest):
     # array_type: single 
@@ -149,55 +118,26 @@ def binary_write_recursive_DroneGoToRequest(parent_off: int, bw_container: Binar
     # type_name: float32 
     # offset: 152 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 152
-
-    
-    bin = binary_io.typeTobin(type, py_obj.speed_m_s)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw_deg 
     # type_name: float32 
     # offset: 156 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 156
-
-    
-    bin = binary_io.typeTobin(type, py_obj.yaw_deg)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: tolerance_m 
     # type_name: float32 
     # offset: 160 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 160
-
-    
-    bin = binary_io.typeTobin(type, py_obj.tolerance_m)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: timeout_sec 
     # type_name: float32 
     # offset: 164 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 164
 
-    
-    bin = binary_io.typeTobin(type, py_obj.timeout_sec)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.speed_m_s, py_obj.yaw_deg, py_obj.tolerance_m, py_obj.timeout_sec), expected_offset=parent_off + 152)
     
 
 if __name__ == "__main__":
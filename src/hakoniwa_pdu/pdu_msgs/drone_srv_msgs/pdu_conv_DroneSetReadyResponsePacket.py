@@ -10,12 +10,15 @@ from ..drone_srv_msgs.pdu_conv_DroneSetReadyResponse import *
 
 
 
-def pdu_to_py_DroneSetReadyResponsePacket(binary_data: bytearray) -> DroneSetReadyResponsePacket:
-    py_obj = DroneSetReadyResponsePacket()
+def pdu_to_py_DroneSetReadyResponsePacket(binary_data: bytearray, out: DroneSetReadyResponsePacket = None, array_mode: str = None) -> DroneSetReadyResponsePacket:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = DroneSetReadyResponsePacket() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_DroneSetReadyResponsePacket(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,7 +31,7 @@ def binary_read_recursive_DroneSetReadyResponsePacket(meta: binary_io.PduMetaDat
     # offset: 0 size: 268 
     # array_len: 1
 
-    tmp_py_obj = ServiceResponseHeader()
+    tmp_py_obj = reuse_obj(py_obj.header, ServiceResponseHeader)
     binary_read_recursive_ServiceResponseHeader(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -39,40 +42,20 @@ def binary_read_recursive_DroneSetReadyResponsePacket(meta: binary_io.PduMetaDat
     # offset: 268 size: 132 
     # array_len: 1
 
-    tmp_py_obj = DroneSetReadyResponse()
+    tmp_py_obj = reuse_obj(py_obj.body, DroneSetReadyResponse)
     binary_read_recursive_DroneSetReadyResponse(meta, binary_data, tmp_py_obj, base_off + 268)
     py_obj.body = tmp_py_obj
     
     return py_obj
 
 
-def py_to_pdu_DroneSetReadyResponsePacket(py_obj: DroneSetReadyResponsePacket) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_DroneSetReadyResponsePacket(py_obj: DroneSetReadyResponsePacket, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_DroneSetReadyResponsePacket(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_DroneSetReadyResponsePacket(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: DroneSetReadyResponsePacket):
     # array_type: single 
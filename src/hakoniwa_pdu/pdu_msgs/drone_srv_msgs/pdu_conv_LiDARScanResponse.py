@@ -9,13 +9,19 @@ from ..sensor_msgs.pdu_conv_PointCloud2 import *
 from ..geometry_msgs.pdu_conv_Pose import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<i")  # ok
 
-def pdu_to_py_LiDARScanResponse(binary_data: bytearray) -> LiDARScanResponse:
-    py_obj = LiDARScanResponse()
+
+def pdu_to_py_LiDARScanResponse(binary_data: bytearray, out: LiDARScanResponse = None, array_mode: str = None) -> LiDARScanResponse:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = LiDARScanResponse() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_LiDARScanResponse(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,9 +34,8 @@ def binary_read_recursive_LiDARScanResponse(meta: binary_io.PduMetaData, binary_
     # offset: 0 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.ok = binary_io.binTovalue("bool", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 0)
+    py_obj.ok = values[0] != 0
     
     # array_type: single 
     # data_type: struct 
@@ -39,7 +44,7 @@ def binary_read_recursive_LiDARScanResponse(meta: binary_io.PduMetaData, binary_
     # offset: 4 size: 176 
     # array_len: 1
 
-    tmp_py_obj = PointCloud2()
+    tmp_py_obj = reuse_obj(py_obj.point_cloud, PointCloud2)
     binary_read_recursive_PointCloud2(meta, binary_data, tmp_py_obj, base_off + 4)
     py_obj.point_cloud = tmp_py_obj
     
@@ -50,7 +55,7 @@ def binary_read_recursive_LiDARScanResponse(meta: binary_io.PduMetaData, binary_
     # offset: 184 size: 56 
     # array_len: 1
 
-    tmp_py_obj = Pose()
+    tmp_py_obj = reuse_obj(py_obj.lidar_pose, Pose)
     binary_read_recursive_Pose(meta, binary_data, tmp_py_obj, base_off + 184)
     py_obj.lidar_pose = tmp_py_obj
     
@@ -68,33 +73,13 @@ def binary_read_recursive_LiDARScanResponse(meta: binary_io.PduMetaData, binary_
     return py_obj
 
 
-def py_to_pdu_LiDARScanResponse(py_obj: LiDARScanResponse) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_LiDARScanResponse(py_obj: LiDARScanResponse, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_LiDARScanResponse(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_LiDARScanResponse(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: LiDARScanResponse):
     # array_type: single 
@@ -103,13 +88,8 @@ def binary_write_recursive_LiDARScanResponse(parent_off: int, bw_container: Bina
     # type_name: bool 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 0
 
-    
-    bin = binary_io.typeTobin(type, py_obj.ok)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(1 if py_obj.ok else 0), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<if")  # grab_on, timeout_sec
 
-def pdu_to_py_MagnetGrabRequest(binary_data: bytearray) -> MagnetGrabRequest:
-    py_obj = MagnetGrabRequest()
+
+def pdu_to_py_MagnetGrabRequest(binary_data: bytearray, out: MagnetGrabRequest = None, array_mode: str = None) -> MagnetGrabRequest:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = MagnetGrabRequest() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_MagnetGrabRequest(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -36,11 +42,6 @@ def binary_read_recursive_MagnetGrabRequest(meta: binary_io.PduMetaData, binary_
     # type_name: bool 
     # offset: 128 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 128, 4)
-    py_obj.grab_on = binary_io.binTovalue("bool", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: timeout_sec 
@@ -48,40 +49,20 @@ def binary_read_recursive_MagnetGrabRequest(meta: binary_io.PduMetaData, binary_
     # offset: 132 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 132, 4)
-    py_obj.timeout_sec = binary_io.binTovalue("float32", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 128)
+    py_obj.grab_on = values[0] != 0
+    py_obj.timeout_sec = values[1]
     
     return py_obj
 
 
-def py_to_pdu_MagnetGrabRequest(py_obj: MagnetGrabRequest) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_MagnetGrabRequest(py_obj: MagnetGrabRequest, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_MagnetGrabRequest(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_MagnetGrabRequest(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: MagnetGrabRequest):
     # array_type: single 
@@ -104,27 +85,14 @@ def binary_write_recursive_MagnetGrabRequest(parent_off: int, bw_container: Bina
     # type_name: bool 
     # offset: 128 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 128
-
-    
-    bin = binary_io.typeTobin(type, py_obj.grab_on)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: timeout_sec 
     # type_name: float32 
     # offset: 132 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 132
 
-    
-    bin = binary_io.typeTobin(type, py_obj.timeout_sec)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(1 if py_obj.grab_on else 0, py_obj.timeout_sec), expected_offset=parent_off + 128)
     
 
 if __name__ == "__main__":
@@ -10,6 +10,8 @@ class CameraCaptureImageRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("drone_name", "image_type")
+
     drone_name: str
     image_type: str
 
@@ -31,26 +33,8 @@ class CameraCaptureImageRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'drone_name'
-        field_val = self.drone_name
-        if isinstance(field_val, bytearray):
-            d['drone_name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['drone_name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['drone_name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['drone_name'] = field_val
-        # handle field 'image_type'
-        field_val = self.image_type
-        if isinstance(field_val, bytearray):
-            d['image_type'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['image_type'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['image_type'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['image_type'] = field_val
+        d['drone_name'] = self.drone_name
+        d['image_type'] = self.image_type
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class CameraCaptureImageRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'drone_name'
-        if 'drone_name' in d:
-            field_type = cls.__annotations__.get('drone_name')
-            value = d['drone_name']
-            
-            if field_type is bytearray:
-                obj.drone_name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.drone_name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.drone_name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.drone_name = field_type.from_dict(value)
-            else:
-                obj.drone_name = value
-        # handle field 'image_type'
-        if 'image_type' in d:
-            field_type = cls.__annotations__.get('image_type')
-            value = d['image_type']
-            
-            if field_type is bytearray:
-                obj.image_type = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.image_type = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.image_type = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.image_type = field_type.from_dict(value)
-            else:
-                obj.image_type = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.drone_name = d.get('drone_name', "")
+        obj.image_type = d.get('image_type', "")
         return obj
 
     def to_json(self, indent=2):
@@ -12,6 +12,8 @@ class CameraCaptureImageRequestPacket:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "body")
+
     header: ServiceRequestHeader
     body: CameraCaptureImageRequest
 
@@ -33,26 +35,8 @@ class CameraCaptureImageRequestPacket:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'body'
-        field_val = self.body
-        if isinstance(field_val, bytearray):
-            d['body'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['body'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['body'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['body'] = field_val
+        d['header'] = self.header.to_dict()
+        d['body'] = self.body.to_dict()
         return d
 
     @classmethod
@@ -60,41 +44,10 @@ class CameraCaptureImageRequestPacket:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'body'
-        if 'body' in d:
-            field_type = cls.__annotations__.get('body')
-            value = d['body']
-            
-            if field_type is bytearray:
-                obj.body = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.body = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.body = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.body = field_type.from_dict(value)
-            else:
-                obj.body = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = ServiceRequestHeader.from_dict(d['header']) if 'header' in d else ServiceRequestHeader()
+        obj.body = CameraCaptureImageRequest.from_dict(d['body']) if 'body' in d else CameraCaptureImageRequest()
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class CameraSetTiltRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("drone_name", "tilt_angle_deg")
+
     drone_name: str
     tilt_angle_deg: float
 
@@ -31,26 +33,8 @@ class CameraSetTiltRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'drone_name'
-        field_val = self.drone_name
-        if isinstance(field_val, bytearray):
-            d['drone_name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['drone_name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['drone_name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['drone_name'] = field_val
-        # handle field 'tilt_angle_deg'
-        field_val = self.tilt_angle_deg
-        if isinstance(field_val, bytearray):
-            d['tilt_angle_deg'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['tilt_angle_deg'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['tilt_angle_deg'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['tilt_angle_deg'] = field_val
+        d['drone_name'] = self.drone_name
+        d['tilt_angle_deg'] = self.tilt_angle_deg
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class CameraSetTiltRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'drone_name'
-        if 'drone_name' in d:
-            field_type = cls.__annotations__.get('drone_name')
-            value = d['drone_name']
-            
-            if field_type is bytearray:
-                obj.drone_name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.drone_name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.drone_name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.drone_name = field_type.from_dict(value)
-            else:
-                obj.drone_name = value
-        # handle field 'tilt_angle_deg'
-        if 'tilt_angle_deg' in d:
-            field_type = cls.__annotations__.get('tilt_angle_deg')
-            value = d['tilt_angle_deg']
-            
-            if field_type is bytearray:
-                obj.tilt_angle_deg = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.tilt_angle_deg = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.tilt_angle_deg = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.tilt_angle_deg = field_type.from_dict(value)
-            else:
-                obj.tilt_angle_deg = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.drone_name = d.get('drone_name', "")
+        obj.tilt_angle_deg = d.get('tilt_angle_deg', 0.0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class CameraSetTiltResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("ok", "message")
+
     ok: bool
     message: str
 
@@ -31,26 +33,8 @@ class CameraSetTiltResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'ok'
-        field_val = self.ok
-        if isinstance(field_val, bytearray):
-            d['ok'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['ok'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['ok'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['ok'] = field_val
-        # handle field 'message'
-        field_val = self.message
-        if isinstance(field_val, bytearray):
-            d['message'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['message'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['message'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['message'] = field_val
+        d['ok'] = self.ok
+        d['message'] = self.message
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class CameraSetTiltResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'ok'
-        if 'ok' in d:
-            field_type = cls.__annotations__.get('ok')
-            value = d['ok']
-            
-            if field_type is bytearray:
-                obj.ok = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.ok = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.ok = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.ok = field_type.from_dict(value)
-            else:
-                obj.ok = value
-        # handle field 'message'
-        if 'message' in d:
-            field_type = cls.__annotations__.get('message')
-            value = d['message']
-            
-            if field_type is bytearray:
-                obj.message = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.message = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.message = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.message = field_type.from_dict(value)
-            else:
-                obj.message = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.ok = d.get('ok', False)
+        obj.message = d.get('message', "")
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class DroneTakeOffRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("alt_m", "drone_name")
+
     alt_m: float
     drone_name: str
 
@@ -31,26 +33,8 @@ class DroneTakeOffRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'alt_m'
-        field_val = self.alt_m
-        if isinstance(field_val, bytearray):
-            d['alt_m'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['alt_m'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['alt_m'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['alt_m'] = field_val
-        # handle field 'drone_name'
-        field_val = self.drone_name
-        if isinstance(field_val, bytearray):
-            d['drone_name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['drone_name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['drone_name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['drone_name'] = field_val
+        d['alt_m'] = self.alt_m
+        d['drone_name'] = self.drone_name
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class DroneTakeOffRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'alt_m'
-        if 'alt_m' in d:
-            field_type = cls.__annotations__.get('alt_m')
-            value = d['alt_m']
-            
-            if field_type is bytearray:
-                obj.alt_m = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.alt_m = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.alt_m = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.alt_m = field_type.from_dict(value)
-            else:
-                obj.alt_m = value
-        # handle field 'drone_name'
-        if 'drone_name' in d:
-            field_type = cls.__annotations__.get('drone_name')
-            value = d['drone_name']
-            
-            if field_type is bytearray:
-                obj.drone_name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.drone_name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.drone_name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.drone_name = field_type.from_dict(value)
-            else:
-                obj.drone_name = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.alt_m = d.get('alt_m', 0.0)
+        obj.drone_name = d.get('drone_name', "")
         return obj
 
     def to_json(self, indent=2):
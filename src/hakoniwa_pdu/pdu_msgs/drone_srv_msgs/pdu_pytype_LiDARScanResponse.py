@@ -17,6 +17,8 @@ class LiDARScanResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("ok", "point_cloud", "lidar_pose", "message")
+
     ok: bool
     point_cloud: PointCloud2
     lidar_pose: Pose
@@ -44,46 +46,10 @@ class LiDARScanResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'ok'
-        field_val = self.ok
-        if isinstance(field_val, bytearray):
-            d['ok'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['ok'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['ok'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['ok'] = field_val
-        # handle field 'point_cloud'
-        field_val = self.point_cloud
-        if isinstance(field_val, bytearray):
-            d['point_cloud'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['point_cloud'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['point_cloud'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['point_cloud'] = field_val
-        # handle field 'lidar_pose'
-        field_val = self.lidar_pose
-        if isinstance(field_val, bytearray):
-            d['lidar_pose'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['lidar_pose'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['lidar_pose'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['lidar_pose'] = field_val
-        # handle field 'message'
-        field_val = self.message
-        if isinstance(field_val, bytearray):
-            d['message'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['message'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['message'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['message'] = field_val
+        d['ok'] = self.ok
+        d['point_cloud'] = self.point_cloud.to_dict()
+        d['lidar_pose'] = self.lidar_pose.to_dict()
+        d['message'] = self.message
         return d
 
     @classmethod
@@ -91,75 +57,12 @@ class LiDARScanResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'ok'
-        if 'ok' in d:
-            field_type = cls.__annotations__.get('ok')
-            value = d['ok']
-            
-            if field_type is bytearray:
-                obj.ok = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.ok = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.ok = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.ok = field_type.from_dict(value)
-            else:
-                obj.ok = value
-        # handle field 'point_cloud'
-        if 'point_cloud' in d:
-            field_type = cls.__annotations__.get('point_cloud')
-            value = d['point_cloud']
-            
-            if field_type is bytearray:
-                obj.point_cloud = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.point_cloud = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.point_cloud = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.point_cloud = field_type.from_dict(value)
-            else:
-                obj.point_cloud = value
-        # handle field 'lidar_pose'
-        if 'lidar_pose' in d:
-            field_type = cls.__annotations__.get('lidar_pose')
-            value = d['lidar_pose']
-            
-            if field_type is bytearray:
-                obj.lidar_pose = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.lidar_pose = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.lidar_pose = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.lidar_pose = field_type.from_dict(value)
-            else:
-                obj.lidar_pose = value
-        # handle field 'message'
-        if 'message' in d:
-            field_type = cls.__annotations__.get('message')
-            value = d['message']
-            
-            if field_type is bytearray:
-                obj.message = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.message = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.message = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.message = field_type.from_dict(value)
-            else:
-                obj.message = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.ok = d.get('ok', False)
+        obj.point_cloud = PointCloud2.from_dict(d['point_cloud']) if 'point_cloud' in d else PointCloud2()
+        obj.lidar_pose = Pose.from_dict(d['lidar_pose']) if 'lidar_pose' in d else Pose()
+        obj.message = d.get('message', "")
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class MagnetGrabResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("ok", "magnet_on", "contact_on", "message")
+
     ok: bool
     magnet_on: bool
     contact_on: bool
@@ -37,46 +39,10 @@ class MagnetGrabResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'ok'
-        field_val = self.ok
-        if isinstance(field_val, bytearray):
-            d['ok'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['ok'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['ok'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['ok'] = field_val
-        # handle field 'magnet_on'
-        field_val = self.magnet_on
-        if isinstance(field_val, bytearray):
-            d['magnet_on'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['magnet_on'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['magnet_on'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['magnet_on'] = field_val
-        # handle field 'contact_on'
-        field_val = self.contact_on
-        if isinstance(field_val, bytearray):
-            d['contact_on'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['contact_on'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['contact_on'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['contact_on'] = field_val
-        # handle field 'message'
-        field_val = self.message
-        if isinstance(field_val, bytearray):
-            d['message'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['message'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['message'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['message'] = field_val
+        d['ok'] = self.ok
+        d['magnet_on'] = self.magnet_on
+        d['contact_on'] = self.contact_on
+        d['message'] = self.message
         return d
 
     @classmethod
@@ -84,75 +50,12 @@ class MagnetGrabResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'ok'
-        if 'ok' in d:
-            field_type = cls.__annotations__.get('ok')
-            value = d['ok']
-            
-            if field_type is bytearray:
-                obj.ok = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.ok = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.ok = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.ok = field_type.from_dict(value)
-            else:
-                obj.ok = value
-        # handle field 'magnet_on'
-        if 'magnet_on' in d:
-            field_type = cls.__annotations__.get('magnet_on')
-            value = d['magnet_on']
-            
-            if field_type is bytearray:
-                obj.magnet_on = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.magnet_on = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.magnet_on = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.magnet_on = field_type.from_dict(value)
-            else:
-                obj.magnet_on = value
-        # handle field 'contact_on'
-        if 'contact_on' in d:
-            field_type = cls.__annotations__.get('contact_on')
-            value = d['contact_on']
-            
-            if field_type is bytearray:
-                obj.contact_on = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.contact_on = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.contact_on = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.contact_on = field_type.from_dict(value)
-            else:
-                obj.contact_on = value
-        # handle field 'message'
-        if 'message' in d:
-            field_type = cls.__annotations__.get('message')
-            value = d['message']
-            
-            if field_type is bytearray:
-                obj.message = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.message = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.message = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.message = field_type.from_dict(value)
-            else:
-                obj.message = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.ok = d.get('ok', False)
+        obj.magnet_on = d.get('magnet_on', False)
+        obj.contact_on = d.get('contact_on', False)
+        obj.message = d.get('message', "")
         return obj
 
     def to_json(self, indent=2):
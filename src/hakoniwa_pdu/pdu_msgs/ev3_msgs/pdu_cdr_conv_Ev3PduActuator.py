@@ -1,5 +1,6 @@
 from .pdu_pytype_Ev3PduActuator import Ev3PduActuator
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..ev3_msgs.pdu_cdr_conv_Ev3PduActuatorHeader import *
 from ..ev3_msgs.pdu_cdr_conv_Ev3PduMotor import *
@@ -8,9 +9,7 @@ from ..ev3_msgs.pdu_cdr_conv_Ev3PduMotor import *
 
 def py_to_cdr_body_Ev3PduActuator(writer: CdrWriter, src: Ev3PduActuator):
     py_to_cdr_body_Ev3PduActuatorHeader(writer, src.head)
-    values = src.leds
-    for i in range(1):
-        writer.write_uint8(values[i] if i < len(values) else 0)
+    writer.write_sequence("B", src.leds, 1)
     values = src.motors
     for i in range(3):
         py_to_cdr_body_Ev3PduMotor(writer, values[i] if i < len(values) else Ev3PduMotor())
@@ -19,7 +18,7 @@ def py_to_cdr_body_Ev3PduActuator(writer: CdrWriter, src: Ev3PduActuator):
 
 def cdr_body_to_py_Ev3PduActuator(reader: CdrReader, dst: Ev3PduActuator):
     cdr_body_to_py_Ev3PduActuatorHeader(reader, dst.head)
-    dst.leds = [reader.read_uint8() for _ in range(1)]
+    dst.leds = reader.read_sequence("B", 1)
     dst.motors = []
     for _ in range(3):
         elem = Ev3PduMotor()
@@ -30,7 +29,8 @@ def cdr_body_to_py_Ev3PduActuator(reader: CdrReader, dst: Ev3PduActuator):
 
 
 def py_to_cdr_Ev3PduActuator(src: Ev3PduActuator) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["ev3_msgs/Ev3PduActuator"])
     writer.write_encapsulation()
     py_to_cdr_body_Ev3PduActuator(writer, src)
     return writer.bytes()
@@ -1,28 +1,27 @@
 from .pdu_pytype_Ev3PduActuatorHeader import Ev3PduActuatorHeader
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IqII")  # version, asset_time, ext_off, ext_size
+
 
 def py_to_cdr_body_Ev3PduActuatorHeader(writer: CdrWriter, src: Ev3PduActuatorHeader):
     writer.write_string(src.name)
-    writer.write_uint32(src.version)
-    writer.write_int64(src.asset_time)
-    writer.write_uint32(src.ext_off)
-    writer.write_uint32(src.ext_size)
+    writer.write_run(_CDR_RUN_0, (src.version, src.asset_time, src.ext_off, src.ext_size))
 
 
 def cdr_body_to_py_Ev3PduActuatorHeader(reader: CdrReader, dst: Ev3PduActuatorHeader):
     dst.name = reader.read_string()
-    dst.version = reader.read_uint32()
-    dst.asset_time = reader.read_int64()
-    dst.ext_off = reader.read_uint32()
-    dst.ext_size = reader.read_uint32()
+    dst.version, dst.asset_time, dst.ext_off, dst.ext_size = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Ev3PduActuatorHeader(src: Ev3PduActuatorHeader) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["ev3_msgs/Ev3PduActuatorHeader"])
     writer.write_encapsulation()
     py_to_cdr_body_Ev3PduActuatorHeader(writer, src)
     return writer.bytes()
@@ -1,28 +1,25 @@
 from .pdu_pytype_Ev3PduColorSensor import Ev3PduColorSensor
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IIIII")  # color, reflect, rgb_r, rgb_g, rgb_b
+
 
 def py_to_cdr_body_Ev3PduColorSensor(writer: CdrWriter, src: Ev3PduColorSensor):
-    writer.write_uint32(src.color)
-    writer.write_uint32(src.reflect)
-    writer.write_uint32(src.rgb_r)
-    writer.write_uint32(src.rgb_g)
-    writer.write_uint32(src.rgb_b)
+    writer.write_run(_CDR_RUN_0, (src.color, src.reflect, src.rgb_r, src.rgb_g, src.rgb_b))
 
 
 def cdr_body_to_py_Ev3PduColorSensor(reader: CdrReader, dst: Ev3PduColorSensor):
-    dst.color = reader.read_uint32()
-    dst.reflect = reader.read_uint32()
-    dst.rgb_r = reader.read_uint32()
-    dst.rgb_g = reader.read_uint32()
-    dst.rgb_b = reader.read_uint32()
+    dst.color, dst.reflect, dst.rgb_r, dst.rgb_g, dst.rgb_b = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Ev3PduColorSensor(src: Ev3PduColorSensor) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["ev3_msgs/Ev3PduColorSensor"])
     writer.write_encapsulation()
     py_to_cdr_body_Ev3PduColorSensor(writer, src)
     return writer.bytes()
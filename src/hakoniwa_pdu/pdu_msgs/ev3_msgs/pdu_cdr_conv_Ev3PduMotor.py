@@ -1,24 +1,25 @@
 from .pdu_pytype_Ev3PduMotor import Ev3PduMotor
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iII")  # power, stop, reset_angle
+
 
 def py_to_cdr_body_Ev3PduMotor(writer: CdrWriter, src: Ev3PduMotor):
-    writer.write_int32(src.power)
-    writer.write_uint32(src.stop)
-    writer.write_uint32(src.reset_angle)
+    writer.write_run(_CDR_RUN_0, (src.power, src.stop, src.reset_angle))
 
 
 def cdr_body_to_py_Ev3PduMotor(reader: CdrReader, dst: Ev3PduMotor):
-    dst.power = reader.read_int32()
-    dst.stop = reader.read_uint32()
-    dst.reset_angle = reader.read_uint32()
+    dst.power, dst.stop, dst.reset_angle = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Ev3PduMotor(src: Ev3PduMotor) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["ev3_msgs/Ev3PduMotor"])
     writer.write_encapsulation()
     py_to_cdr_body_Ev3PduMotor(writer, src)
     return writer.bytes()
@@ -1,36 +1,32 @@
 from .pdu_pytype_Ev3PduSensor import Ev3PduSensor
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..ev3_msgs.pdu_cdr_conv_Ev3PduColorSensor import *
 from ..ev3_msgs.pdu_cdr_conv_Ev3PduSensorHeader import *
 from ..ev3_msgs.pdu_cdr_conv_Ev3PduTouchSensor import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iiIdd")  # gyro_degree, gyro_degree_rate, sensor_ultrasonic, gps_lat, gps_lon
+
 
 def py_to_cdr_body_Ev3PduSensor(writer: CdrWriter, src: Ev3PduSensor):
     py_to_cdr_body_Ev3PduSensorHeader(writer, src.head)
-    values = src.buttons
-    for i in range(1):
-        writer.write_uint8(values[i] if i < len(values) else 0)
+    writer.write_sequence("B", src.buttons, 1)
     values = src.color_sensors
     for i in range(2):
         py_to_cdr_body_Ev3PduColorSensor(writer, values[i] if i < len(values) else Ev3PduColorSensor())
     values = src.touch_sensors
     for i in range(2):
         py_to_cdr_body_Ev3PduTouchSensor(writer, values[i] if i < len(values) else Ev3PduTouchSensor())
-    values = src.motor_angle
-    for i in range(3):
-        writer.write_uint32(values[i] if i < len(values) else 0)
-    writer.write_int32(src.gyro_degree)
-    writer.write_int32(src.gyro_degree_rate)
-    writer.write_uint32(src.sensor_ultrasonic)
-    writer.write_float64(src.gps_lat)
-    writer.write_float64(src.gps_lon)
+    writer.write_sequence("I", src.motor_angle, 3)
+    writer.write_run(_CDR_RUN_0, (src.gyro_degree, src.gyro_degree_rate, src.sensor_ultrasonic, src.gps_lat, src.gps_lon))
 
 
 def cdr_body_to_py_Ev3PduSensor(reader: CdrReader, dst: Ev3PduSensor):
     cdr_body_to_py_Ev3PduSensorHeader(reader, dst.head)
-    dst.buttons = [reader.read_uint8() for _ in range(1)]
+    dst.buttons = reader.read_sequence("B", 1)
     dst.color_sensors = []
     for _ in range(2):
         elem = Ev3PduColorSensor()
@@ -41,17 +37,14 @@ def cdr_body_to_py_Ev3PduSensor(reader: CdrReader, dst: Ev3PduSensor):
         elem = Ev3PduTouchSensor()
         cdr_body_to_py_Ev3PduTouchSensor(reader, elem)
         dst.touch_sensors.append(elem)
-    dst.motor_angle = [reader.read_uint32() for _ in range(3)]
-    dst.gyro_degree = reader.read_int32()
-    dst.gyro_degree_rate = reader.read_int32()
-    dst.sensor_ultrasonic = reader.read_uint32()
-    dst.gps_lat = reader.read_float64()
-    dst.gps_lon = reader.read_float64()
+    dst.motor_angle = reader.read_sequence("I", 3)
+    dst.gyro_degree, dst.gyro_degree_rate, dst.sensor_ultrasonic, dst.gps_lat, dst.gps_lon = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Ev3PduSensor(src: Ev3PduSensor) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["ev3_msgs/Ev3PduSensor"])
     writer.write_encapsulation()
     py_to_cdr_body_Ev3PduSensor(writer, src)
     return writer.bytes()
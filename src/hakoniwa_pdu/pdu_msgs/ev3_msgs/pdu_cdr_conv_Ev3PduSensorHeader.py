@@ -1,28 +1,27 @@
 from .pdu_pytype_Ev3PduSensorHeader import Ev3PduSensorHeader
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IqII")  # version, hakoniwa_time, ext_off, ext_size
+
 
 def py_to_cdr_body_Ev3PduSensorHeader(writer: CdrWriter, src: Ev3PduSensorHeader):
     writer.write_string(src.name)
-    writer.write_uint32(src.version)
-    writer.write_int64(src.hakoniwa_time)
-    writer.write_uint32(src.ext_off)
-    writer.write_uint32(src.ext_size)
+    writer.write_run(_CDR_RUN_0, (src.version, src.hakoniwa_time, src.ext_off, src.ext_size))
 
 
 def cdr_body_to_py_Ev3PduSensorHeader(reader: CdrReader, dst: Ev3PduSensorHeader):
     dst.name = reader.read_string()
-    dst.version = reader.read_uint32()
-    dst.hakoniwa_time = reader.read_int64()
-    dst.ext_off = reader.read_uint32()
-    dst.ext_size = reader.read_uint32()
+    dst.version, dst.hakoniwa_time, dst.ext_off, dst.ext_size = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Ev3PduSensorHeader(src: Ev3PduSensorHeader) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["ev3_msgs/Ev3PduSensorHeader"])
     writer.write_encapsulation()
     py_to_cdr_body_Ev3PduSensorHeader(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_Ev3PduTouchSensor import Ev3PduTouchSensor
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_Ev3PduTouchSensor(reader: CdrReader, dst: Ev3PduTouchSensor):
 
 
 def py_to_cdr_Ev3PduTouchSensor(src: Ev3PduTouchSensor) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["ev3_msgs/Ev3PduTouchSensor"])
     writer.write_encapsulation()
     py_to_cdr_body_Ev3PduTouchSensor(writer, src)
     return writer.bytes()
@@ -9,13 +9,19 @@ from ..ev3_msgs.pdu_conv_Ev3PduActuatorHeader import *
 from ..ev3_msgs.pdu_conv_Ev3PduMotor import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<I")  # gyro_reset
 
-def pdu_to_py_Ev3PduActuator(binary_data: bytearray) -> Ev3PduActuator:
-    py_obj = Ev3PduActuator()
+
+def pdu_to_py_Ev3PduActuator(binary_data: bytearray, out: Ev3PduActuator = None, array_mode: str = None) -> Ev3PduActuator:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Ev3PduActuator() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Ev3PduActuator(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,7 +34,7 @@ def binary_read_recursive_Ev3PduActuator(meta: binary_io.PduMetaData, binary_dat
     # offset: 0 size: 152 
     # array_len: 1
 
-    tmp_py_obj = Ev3PduActuatorHeader()
+    tmp_py_obj = reuse_obj(py_obj.head, Ev3PduActuatorHeader)
     binary_read_recursive_Ev3PduActuatorHeader(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.head = tmp_py_obj
     
@@ -40,9 +46,7 @@ def binary_read_recursive_Ev3PduActuator(meta: binary_io.PduMetaData, binary_dat
     # array_len: 1
 
     
-    array_value = binary_io.readBinary(binary_data, base_off + 152, 1)
-    
-    py_obj.leds = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.leds = read_array_values(meta, "uint8", binary_data, base_off + 152, 1)
     
     
     # array_type: array 
@@ -55,11 +59,10 @@ def binary_read_recursive_Ev3PduActuator(meta: binary_io.PduMetaData, binary_dat
     i = 0
     array_size = 3
     one_elm_size = int(36 / array_size)
-    array_value = []
+    array_value = reuse_list(py_obj.motors, array_size, Ev3PduMotor)
     while i < array_size:
-        tmp_py_obj = Ev3PduMotor()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_Ev3PduMotor(meta, binary_data, tmp_py_obj, base_off + 156 + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.motors = array_value    
     
@@ -70,40 +73,18 @@ def binary_read_recursive_Ev3PduActuator(meta: binary_io.PduMetaData, binary_dat
     # offset: 192 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 192, 4)
-    py_obj.gyro_reset = binary_io.binTovalue("uint32", bin)
+    py_obj.gyro_reset = _RUN_0.unpack_from(binary_data, base_off + 192)[0]
     
     return py_obj
 
 
-def py_to_pdu_Ev3PduActuator(py_obj: Ev3PduActuator) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Ev3PduActuator(py_obj: Ev3PduActuator, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Ev3PduActuator(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Ev3PduActuator(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Ev3PduActuator):
     # array_type: single 
@@ -150,13 +131,8 @@ def binary_write_recursive_Ev3PduActuator(parent_off: int, bw_container: BinaryW
     # type_name: uint32 
     # offset: 192 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 192
 
-    
-    bin = binary_io.typeTobin(type, py_obj.gyro_reset)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.gyro_reset), expected_offset=parent_off + 192)
     
 
 if __name__ == "__main__":
@@ -10,13 +10,19 @@ from ..ev3_msgs.pdu_conv_Ev3PduColorSensor import *
 from ..ev3_msgs.pdu_conv_Ev3PduTouchSensor import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<iiI4xdd")  # gyro_degree, gyro_degree_rate, sensor_ultrasonic, gps_lat, gps_lon
 
-def pdu_to_py_Ev3PduSensor(binary_data: bytearray) -> Ev3PduSensor:
-    py_obj = Ev3PduSensor()
+
+def pdu_to_py_Ev3PduSensor(binary_data: bytearray, out: Ev3PduSensor = None, array_mode: str = None) -> Ev3PduSensor:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Ev3PduSensor() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Ev3PduSensor(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -29,7 +35,7 @@ def binary_read_recursive_Ev3PduSensor(meta: binary_io.PduMetaData, binary_data:
     # offset: 0 size: 152 
     # array_len: 1
 
-    tmp_py_obj = Ev3PduSensorHeader()
+    tmp_py_obj = reuse_obj(py_obj.head, Ev3PduSensorHeader)
     binary_read_recursive_Ev3PduSensorHeader(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.head = tmp_py_obj
     
@@ -41,9 +47,7 @@ def binary_read_recursive_Ev3PduSensor(meta: binary_io.PduMetaData, binary_data:
     # array_len: 1
 
     
-    array_value = binary_io.readBinary(binary_data, base_off + 152, 1)
-    
-    py_obj.buttons = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.buttons = read_array_values(meta, "uint8", binary_data, base_off + 152, 1)
     
     
     # array_type: array 
@@ -56,11 +60,10 @@ def binary_read_recursive_Ev3PduSensor(meta: binary_io.PduMetaData, binary_data:
     i = 0
     array_size = 2
     one_elm_size = int(40 / array_size)
-    array_value = []
+    array_value = reuse_list(py_obj.color_sensors, array_size, Ev3PduColorSensor)
     while i < array_size:
-        tmp_py_obj = Ev3PduColorSensor()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_Ev3PduColorSensor(meta, binary_data, tmp_py_obj, base_off + 156 + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.color_sensors = array_value    
     
@@ -74,11 +77,10 @@ def binary_read_recursive_Ev3PduSensor(meta: binary_io.PduMetaData, binary_data:
     i = 0
     array_size = 2
     one_elm_size = int(8 / array_size)
-    array_value = []
+    array_value = reuse_list(py_obj.touch_sensors, array_size, Ev3PduTouchSensor)
     while i < array_size:
-        tmp_py_obj = Ev3PduTouchSensor()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_Ev3PduTouchSensor(meta, binary_data, tmp_py_obj, base_off + 196 + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.touch_sensors = array_value    
     
@@ -90,9 +92,7 @@ def binary_read_recursive_Ev3PduSensor(meta: binary_io.PduMetaData, binary_data:
     # array_len: 3
 
     
-    array_value = binary_io.readBinary(binary_data, base_off + 204, 12)
-    
-    py_obj.motor_angle = binary_io.binToArrayValues("uint32", array_value)
+    py_obj.motor_angle = read_array_values(meta, "uint32", binary_data, base_off + 204, 12)
     
     
     # array_type: single 
@@ -101,44 +101,24 @@ def binary_read_recursive_Ev3PduSensor(meta: binary_io.PduMetaData, binary_data:
     # type_name: int32 
     # offset: 216 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 216, 4)
-    py_obj.gyro_degree = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: gyro_degree_rate 
     # type_name: int32 
     # offset: 220 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 220, 4)
-    py_obj.gyro_degree_rate = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: sensor_ultrasonic 
     # type_name: uint32 
     # offset: 224 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 224, 4)
-    py_obj.sensor_ultrasonic = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: gps_lat 
     # type_name: float64 
     # offset: 232 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 232, 8)
-    py_obj.gps_lat = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: gps_lon 
@@ -146,40 +126,18 @@ def binary_read_recursive_Ev3PduSensor(meta: binary_io.PduMetaData, binary_data:
     # offset: 240 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 240, 8)
-    py_obj.gps_lon = binary_io.binTovalue("float64", bin)
+    py_obj.gyro_degree, py_obj.gyro_degree_rate, py_obj.sensor_ultrasonic, py_obj.gps_lat, py_obj.gps_lon = _RUN_0.unpack_from(binary_data, base_off + 216)
     
     return py_obj
 
 
-def py_to_pdu_Ev3PduSensor(py_obj: Ev3PduSensor) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Ev3PduSensor(py_obj: Ev3PduSensor, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Ev3PduSensor(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Ev3PduSensor(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Ev3PduSensor):
     # array_type: single 
@@ -253,69 +211,32 @@ def binary_write_recursive_Ev3PduSensor(parent_off: int, bw_container: BinaryWri
     # type_name: int32 
     # offset: 216 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 216
-
-    
-    bin = binary_io.typeTobin(type, py_obj.gyro_degree)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: gyro_degree_rate 
     # type_name: int32 
     # offset: 220 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 220
-
-    
-    bin = binary_io.typeTobin(type, py_obj.gyro_degree_rate)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: sensor_ultrasonic 
     # type_name: uint32 
     # offset: 224 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 224
-
-    
-    bin = binary_io.typeTobin(type, py_obj.sensor_ultrasonic)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: gps_lat 
     # type_name: float64 
     # offset: 232 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 232
-
-    
-    bin = binary_io.typeTobin(type, py_obj.gps_lat)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: gps_lon 
     # type_name: float64 
     # offset: 240 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 240
 
-    
-    bin = binary_io.typeTobin(type, py_obj.gps_lon)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.gyro_degree, py_obj.gyro_degree_rate, py_obj.sensor_ultrasonic, py_obj.gps_lat, py_obj.gps_lon), expected_offset=parent_off + 216)
     
 
 if __name__ == "__main__":
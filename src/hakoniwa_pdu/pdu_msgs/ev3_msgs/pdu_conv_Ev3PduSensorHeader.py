@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<I4xqII")  # version, hakoniwa_time, ext_off, ext_size
 
-def pdu_to_py_Ev3PduSensorHeader(binary_data: bytearray) -> Ev3PduSensorHeader:
-    py_obj = Ev3PduSensorHeader()
+
+def pdu_to_py_Ev3PduSensorHeader(binary_data: bytearray, out: Ev3PduSensorHeader = None, array_mode: str = None) -> Ev3PduSensorHeader:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Ev3PduSensorHeader() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Ev3PduSensorHeader(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -36,33 +42,18 @@ def binary_read_recursive_Ev3PduSensorHeader(meta: binary_io.PduMetaData, binary
     # type_name: uint32 
     # offset: 128 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 128, 4)
-    py_obj.version = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: hakoniwa_time 
     # type_name: int64 
     # offset: 136 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 8)
-    py_obj.hakoniwa_time = binary_io.binTovalue("int64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ext_off 
     # type_name: uint32 
     # offset: 144 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 144, 4)
-    py_obj.ext_off = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ext_size 
@@ -70,40 +61,18 @@ def binary_read_recursive_Ev3PduSensorHeader(meta: binary_io.PduMetaData, binary
     # offset: 148 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 148, 4)
-    py_obj.ext_size = binary_io.binTovalue("uint32", bin)
+    py_obj.version, py_obj.hakoniwa_time, py_obj.ext_off, py_obj.ext_size = _RUN_0.unpack_from(binary_data, base_off + 128)
     
     return py_obj
 
 
-def py_to_pdu_Ev3PduSensorHeader(py_obj: Ev3PduSensorHeader) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Ev3PduSensorHeader(py_obj: Ev3PduSensorHeader, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Ev3PduSensorHeader(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Ev3PduSensorHeader(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Ev3PduSensorHeader):
     # array_type: single 
@@ -126,55 +95,26 @@ def binary_write_recursive_Ev3PduSensorHeader(parent_off: int, bw_container: Bin
     # type_name: uint32 
     # offset: 128 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 128
-
-    
-    bin = binary_io.typeTobin(type, py_obj.version)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: hakoniwa_time 
     # type_name: int64 
     # offset: 136 size: 8 
     # array_len: 1
-    type = "int64"
-    off = 136
-
-    
-    bin = binary_io.typeTobin(type, py_obj.hakoniwa_time)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ext_off 
     # type_name: uint32 
     # offset: 144 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 144
-
-    
-    bin = binary_io.typeTobin(type, py_obj.ext_off)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ext_size 
     # type_name: uint32 
     # offset: 148 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 148
 
-    
-    bin = binary_io.typeTobin(type, py_obj.ext_size)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.version, py_obj.hakoniwa_time, py_obj.ext_off, py_obj.ext_size), expected_offset=parent_off + 128)
     
 
 if __name__ == "__main__":
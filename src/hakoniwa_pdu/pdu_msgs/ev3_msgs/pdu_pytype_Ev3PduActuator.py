@@ -12,6 +12,8 @@ class Ev3PduActuator:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("head", "leds", "motors", "gyro_reset")
+
     head: Ev3PduActuatorHeader
     leds: List[int]
     motors: List[Ev3PduMotor]
@@ -39,46 +41,11 @@ class Ev3PduActuator:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'head'
-        field_val = self.head
-        if isinstance(field_val, bytearray):
-            d['head'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['head'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['head'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['head'] = field_val
-        # handle field 'leds'
+        d['head'] = self.head.to_dict()
         field_val = self.leds
-        if isinstance(field_val, bytearray):
-            d['leds'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['leds'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['leds'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['leds'] = field_val
-        # handle field 'motors'
-        field_val = self.motors
-        if isinstance(field_val, bytearray):
-            d['motors'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['motors'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['motors'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['motors'] = field_val
-        # handle field 'gyro_reset'
-        field_val = self.gyro_reset
-        if isinstance(field_val, bytearray):
-            d['gyro_reset'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['gyro_reset'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['gyro_reset'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['gyro_reset'] = field_val
+        d['leds'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['motors'] = [item.to_dict() for item in self.motors]
+        d['gyro_reset'] = self.gyro_reset
         return d
 
     @classmethod
@@ -86,75 +53,12 @@ class Ev3PduActuator:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'head'
-        if 'head' in d:
-            field_type = cls.__annotations__.get('head')
-            value = d['head']
-            
-            if field_type is bytearray:
-                obj.head = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.head = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.head = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.head = field_type.from_dict(value)
-            else:
-                obj.head = value
-        # handle field 'leds'
-        if 'leds' in d:
-            field_type = cls.__annotations__.get('leds')
-            value = d['leds']
-            
-            if field_type is bytearray:
-                obj.leds = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.leds = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.leds = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.leds = field_type.from_dict(value)
-            else:
-                obj.leds = value
-        # handle field 'motors'
-        if 'motors' in d:
-            field_type = cls.__annotations__.get('motors')
-            value = d['motors']
-            
-            if field_type is bytearray:
-                obj.motors = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.motors = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.motors = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.motors = field_type.from_dict(value)
-            else:
-                obj.motors = value
-        # handle field 'gyro_reset'
-        if 'gyro_reset' in d:
-            field_type = cls.__annotations__.get('gyro_reset')
-            value = d['gyro_reset']
-            
-            if field_type is bytearray:
-                obj.gyro_reset = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.gyro_reset = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.gyro_reset = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.gyro_reset = field_type.from_dict(value)
-            else:
-                obj.gyro_reset = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.head = Ev3PduActuatorHeader.from_dict(d['head']) if 'head' in d else Ev3PduActuatorHeader()
+        obj.leds = d.get('leds', [])
+        obj.motors = [Ev3PduMotor.from_dict(item) for item in d['motors']] if 'motors' in d else []
+        obj.gyro_reset = d.get('gyro_reset', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class Ev3PduColorSensor:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("color", "reflect", "rgb_r", "rgb_g", "rgb_b")
+
     color: int
     reflect: int
     rgb_r: int
@@ -40,56 +42,11 @@ class Ev3PduColorSensor:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'color'
-        field_val = self.color
-        if isinstance(field_val, bytearray):
-            d['color'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['color'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['color'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['color'] = field_val
-        # handle field 'reflect'
-        field_val = self.reflect
-        if isinstance(field_val, bytearray):
-            d['reflect'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['reflect'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['reflect'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['reflect'] = field_val
-        # handle field 'rgb_r'
-        field_val = self.rgb_r
-        if isinstance(field_val, bytearray):
-            d['rgb_r'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['rgb_r'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['rgb_r'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['rgb_r'] = field_val
-        # handle field 'rgb_g'
-        field_val = self.rgb_g
-        if isinstance(field_val, bytearray):
-            d['rgb_g'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['rgb_g'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['rgb_g'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['rgb_g'] = field_val
-        # handle field 'rgb_b'
-        field_val = self.rgb_b
-        if isinstance(field_val, bytearray):
-            d['rgb_b'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['rgb_b'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['rgb_b'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['rgb_b'] = field_val
+        d['color'] = self.color
+        d['reflect'] = self.reflect
+        d['rgb_r'] = self.rgb_r
+        d['rgb_g'] = self.rgb_g
+        d['rgb_b'] = self.rgb_b
         return d
 
     @classmethod
@@ -97,92 +54,13 @@ class Ev3PduColorSensor:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'color'
-        if 'color' in d:
-            field_type = cls.__annotations__.get('color')
-            value = d['color']
-            
-            if field_type is bytearray:
-                obj.color = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.color = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.color = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.color = field_type.from_dict(value)
-            else:
-                obj.color = value
-        # handle field 'reflect'
-        if 'reflect' in d:
-            field_type = cls.__annotations__.get('reflect')
-            value = d['reflect']
-            
-            if field_type is bytearray:
-                obj.reflect = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.reflect = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.reflect = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.reflect = field_type.from_dict(value)
-            else:
-                obj.reflect = value
-        # handle field 'rgb_r'
-        if 'rgb_r' in d:
-            field_type = cls.__annotations__.get('rgb_r')
-            value = d['rgb_r']
-            
-            if field_type is bytearray:
-                obj.rgb_r = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.rgb_r = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.rgb_r = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.rgb_r = field_type.from_dict(value)
-            else:
-                obj.rgb_r = value
-        # handle field 'rgb_g'
-        if 'rgb_g' in d:
-            field_type = cls.__annotations__.get('rgb_g')
-            value = d['rgb_g']
-            
-            if field_type is bytearray:
-                obj.rgb_g = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.rgb_g = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.rgb_g = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.rgb_g = field_type.from_dict(value)
-            else:
-                obj.rgb_g = value
-        # handle field 'rgb_b'
-        if 'rgb_b' in d:
-            field_type = cls.__annotations__.get('rgb_b')
-            value = d['rgb_b']
-            
-            if field_type is bytearray:
-                obj.rgb_b = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.rgb_b = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.rgb_b = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.rgb_b = field_type.from_dict(value)
-            else:
-                obj.rgb_b = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.color = d.get('color', 0)
+        obj.reflect = d.get('reflect', 0)
+        obj.rgb_r = d.get('rgb_r', 0)
+        obj.rgb_g = d.get('rgb_g', 0)
+        obj.rgb_b = d.get('rgb_b', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class Ev3PduMotor:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("power", "stop", "reset_angle")
+
     power: int
     stop: int
     reset_angle: int
@@ -34,36 +36,9 @@ class Ev3PduMotor:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'power'
-        field_val = self.power
-        if isinstance(field_val, bytearray):
-            d['power'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['power'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['power'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['power'] = field_val
-        # handle field 'stop'
-        field_val = self.stop
-        if isinstance(field_val, bytearray):
-            d['stop'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['stop'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['stop'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['stop'] = field_val
-        # handle field 'reset_angle'
-        field_val = self.reset_angle
-        if isinstance(field_val, bytearray):
-            d['reset_angle'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['reset_angle'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['reset_angle'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['reset_angle'] = field_val
+        d['power'] = self.power
+        d['stop'] = self.stop
+        d['reset_angle'] = self.reset_angle
         return d
 
     @classmethod
@@ -71,58 +46,11 @@ class Ev3PduMotor:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'power'
-        if 'power' in d:
-            field_type = cls.__annotations__.get('power')
-            value = d['power']
-            
-            if field_type is bytearray:
-                obj.power = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.power = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.power = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.power = field_type.from_dict(value)
-            else:
-                obj.power = value
-        # handle field 'stop'
-        if 'stop' in d:
-            field_type = cls.__annotations__.get('stop')
-            value = d['stop']
-            
-            if field_type is bytearray:
-                obj.stop = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.stop = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.stop = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.stop = field_type.from_dict(value)
-            else:
-                obj.stop = value
-        # handle field 'reset_angle'
-        if 'reset_angle' in d:
-            field_type = cls.__annotations__.get('reset_angle')
-            value = d['reset_angle']
-            
-            if field_type is bytearray:
-                obj.reset_angle = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.reset_angle = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.reset_angle = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.reset_angle = field_type.from_dict(value)
-            else:
-                obj.reset_angle = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.power = d.get('power', 0)
+        obj.stop = d.get('stop', 0)
+        obj.reset_angle = d.get('reset_angle', 0)
         return obj
 
     def to_json(self, indent=2):
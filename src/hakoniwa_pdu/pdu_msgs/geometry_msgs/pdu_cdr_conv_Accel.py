@@ -1,23 +1,26 @@
 from .pdu_pytype_Accel import Accel
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddd")  # linear.x, linear.y, linear.z, angular.x, angular.y, angular.z
+
 
 def py_to_cdr_body_Accel(writer: CdrWriter, src: Accel):
-    py_to_cdr_body_Vector3(writer, src.linear)
-    py_to_cdr_body_Vector3(writer, src.angular)
+    writer.write_run(_CDR_RUN_0, (src.linear.x, src.linear.y, src.linear.z, src.angular.x, src.angular.y, src.angular.z))
 
 
 def cdr_body_to_py_Accel(reader: CdrReader, dst: Accel):
-    cdr_body_to_py_Vector3(reader, dst.linear)
-    cdr_body_to_py_Vector3(reader, dst.angular)
+    dst.linear.x, dst.linear.y, dst.linear.z, dst.angular.x, dst.angular.y, dst.angular.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Accel(src: Accel) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Accel"])
     writer.write_encapsulation()
     py_to_cdr_body_Accel(writer, src)
     return writer.bytes()
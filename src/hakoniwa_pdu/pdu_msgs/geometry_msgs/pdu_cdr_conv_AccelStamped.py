@@ -1,5 +1,6 @@
 from .pdu_pytype_AccelStamped import AccelStamped
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Accel import *
 from ..std_msgs.pdu_cdr_conv_Header import *
@@ -7,20 +8,24 @@ from ..builtin_interfaces.pdu_cdr_conv_Time import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddd")  # accel.linear.x, accel.linear.y, accel.linear.z, accel.angular.x, accel.angular.y, accel.angular.z
+
 
 def py_to_cdr_body_AccelStamped(writer: CdrWriter, src: AccelStamped):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Accel(writer, src.accel)
+    writer.write_run(_CDR_RUN_0, (src.accel.linear.x, src.accel.linear.y, src.accel.linear.z, src.accel.angular.x, src.accel.angular.y, src.accel.angular.z))
 
 
 def cdr_body_to_py_AccelStamped(reader: CdrReader, dst: AccelStamped):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Accel(reader, dst.accel)
+    dst.accel.linear.x, dst.accel.linear.y, dst.accel.linear.z, dst.accel.angular.x, dst.accel.angular.y, dst.accel.angular.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_AccelStamped(src: AccelStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/AccelStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_AccelStamped(writer, src)
     return writer.bytes()
@@ -1,26 +1,29 @@
 from .pdu_pytype_AccelWithCovariance import AccelWithCovariance
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Accel import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddd")  # accel.linear.x, accel.linear.y, accel.linear.z, accel.angular.x, accel.angular.y, accel.angular.z
+
 
 def py_to_cdr_body_AccelWithCovariance(writer: CdrWriter, src: AccelWithCovariance):
-    py_to_cdr_body_Accel(writer, src.accel)
-    values = src.covariance
-    for i in range(36):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
+    writer.write_run(_CDR_RUN_0, (src.accel.linear.x, src.accel.linear.y, src.accel.linear.z, src.accel.angular.x, src.accel.angular.y, src.accel.angular.z))
+    writer.write_sequence("d", src.covariance, 36)
 
 
 def cdr_body_to_py_AccelWithCovariance(reader: CdrReader, dst: AccelWithCovariance):
-    cdr_body_to_py_Accel(reader, dst.accel)
-    dst.covariance = [reader.read_float64() for _ in range(36)]
+    dst.accel.linear.x, dst.accel.linear.y, dst.accel.linear.z, dst.accel.angular.x, dst.accel.angular.y, dst.accel.angular.z = reader.read_run(_CDR_RUN_0)
+    dst.covariance = reader.read_sequence("d", 36)
     return dst
 
 
 def py_to_cdr_AccelWithCovariance(src: AccelWithCovariance) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/AccelWithCovariance"])
     writer.write_encapsulation()
     py_to_cdr_body_AccelWithCovariance(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_AccelWithCovarianceStamped import AccelWithCovarianceStamped
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Accel import *
 from ..geometry_msgs.pdu_cdr_conv_AccelWithCovariance import *
@@ -21,7 +22,8 @@ def cdr_body_to_py_AccelWithCovarianceStamped(reader: CdrReader, dst: AccelWithC
 
 
 def py_to_cdr_AccelWithCovarianceStamped(src: AccelWithCovarianceStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/AccelWithCovarianceStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_AccelWithCovarianceStamped(writer, src)
     return writer.bytes()
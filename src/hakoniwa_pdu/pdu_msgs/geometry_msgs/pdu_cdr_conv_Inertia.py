@@ -1,35 +1,26 @@
 from .pdu_pytype_Inertia import Inertia
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddddddd")  # m, com.x, com.y, com.z, ixx, ixy, ixz, iyy, iyz, izz
+
 
 def py_to_cdr_body_Inertia(writer: CdrWriter, src: Inertia):
-    writer.write_float64(src.m)
-    py_to_cdr_body_Vector3(writer, src.com)
-    writer.write_float64(src.ixx)
-    writer.write_float64(src.ixy)
-    writer.write_float64(src.ixz)
-    writer.write_float64(src.iyy)
-    writer.write_float64(src.iyz)
-    writer.write_float64(src.izz)
+    writer.write_run(_CDR_RUN_0, (src.m, src.com.x, src.com.y, src.com.z, src.ixx, src.ixy, src.ixz, src.iyy, src.iyz, src.izz))
 
 
 def cdr_body_to_py_Inertia(reader: CdrReader, dst: Inertia):
-    dst.m = reader.read_float64()
-    cdr_body_to_py_Vector3(reader, dst.com)
-    dst.ixx = reader.read_float64()
-    dst.ixy = reader.read_float64()
-    dst.ixz = reader.read_float64()
-    dst.iyy = reader.read_float64()
-    dst.iyz = reader.read_float64()
-    dst.izz = reader.read_float64()
+    dst.m, dst.com.x, dst.com.y, dst.com.z, dst.ixx, dst.ixy, dst.ixz, dst.iyy, dst.iyz, dst.izz = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Inertia(src: Inertia) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Inertia"])
     writer.write_encapsulation()
     py_to_cdr_body_Inertia(writer, src)
     return writer.bytes()
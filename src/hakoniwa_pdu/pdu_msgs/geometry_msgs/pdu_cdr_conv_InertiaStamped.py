@@ -1,5 +1,6 @@
 from .pdu_pytype_InertiaStamped import InertiaStamped
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Inertia import *
@@ -7,20 +8,24 @@ from ..builtin_interfaces.pdu_cdr_conv_Time import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddddddd")  # inertia.m, inertia.com.x, inertia.com.y, inertia.com.z, inertia.ixx, inertia.ixy, inertia.ixz, inertia.iyy, inertia.iyz, inertia.izz
+
 
 def py_to_cdr_body_InertiaStamped(writer: CdrWriter, src: InertiaStamped):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Inertia(writer, src.inertia)
+    writer.write_run(_CDR_RUN_0, (src.inertia.m, src.inertia.com.x, src.inertia.com.y, src.inertia.com.z, src.inertia.ixx, src.inertia.ixy, src.inertia.ixz, src.inertia.iyy, src.inertia.iyz, src.inertia.izz))
 
 
 def cdr_body_to_py_InertiaStamped(reader: CdrReader, dst: InertiaStamped):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Inertia(reader, dst.inertia)
+    dst.inertia.m, dst.inertia.com.x, dst.inertia.com.y, dst.inertia.com.z, dst.inertia.ixx, dst.inertia.ixy, dst.inertia.ixz, dst.inertia.iyy, dst.inertia.iyz, dst.inertia.izz = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_InertiaStamped(src: InertiaStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/InertiaStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_InertiaStamped(writer, src)
     return writer.bytes()
@@ -1,24 +1,25 @@
 from .pdu_pytype_Point import Point
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddd")  # x, y, z
+
 
 def py_to_cdr_body_Point(writer: CdrWriter, src: Point):
-    writer.write_float64(src.x)
-    writer.write_float64(src.y)
-    writer.write_float64(src.z)
+    writer.write_run(_CDR_RUN_0, (src.x, src.y, src.z))
 
 
 def cdr_body_to_py_Point(reader: CdrReader, dst: Point):
-    dst.x = reader.read_float64()
-    dst.y = reader.read_float64()
-    dst.z = reader.read_float64()
+    dst.x, dst.y, dst.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Point(src: Point) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Point"])
     writer.write_encapsulation()
     py_to_cdr_body_Point(writer, src)
     return writer.bytes()
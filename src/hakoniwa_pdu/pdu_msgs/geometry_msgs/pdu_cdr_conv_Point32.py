@@ -1,24 +1,25 @@
 from .pdu_pytype_Point32 import Point32
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("fff")  # x, y, z
+
 
 def py_to_cdr_body_Point32(writer: CdrWriter, src: Point32):
-    writer.write_float32(src.x)
-    writer.write_float32(src.y)
-    writer.write_float32(src.z)
+    writer.write_run(_CDR_RUN_0, (src.x, src.y, src.z))
 
 
 def cdr_body_to_py_Point32(reader: CdrReader, dst: Point32):
-    dst.x = reader.read_float32()
-    dst.y = reader.read_float32()
-    dst.z = reader.read_float32()
+    dst.x, dst.y, dst.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Point32(src: Point32) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Point32"])
     writer.write_encapsulation()
     py_to_cdr_body_Point32(writer, src)
     return writer.bytes()
@@ -1,25 +1,30 @@
 from .pdu_pytype_PointStamped import PointStamped
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Point import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddd")  # point.x, point.y, point.z
+
 
 def py_to_cdr_body_PointStamped(writer: CdrWriter, src: PointStamped):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Point(writer, src.point)
+    writer.write_run(_CDR_RUN_0, (src.point.x, src.point.y, src.point.z))
 
 
 def cdr_body_to_py_PointStamped(reader: CdrReader, dst: PointStamped):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Point(reader, dst.point)
+    dst.point.x, dst.point.y, dst.point.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_PointStamped(src: PointStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/PointStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_PointStamped(writer, src)
     return writer.bytes()
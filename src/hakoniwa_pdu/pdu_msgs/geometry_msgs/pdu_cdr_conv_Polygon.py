@@ -1,5 +1,6 @@
 from .pdu_pytype_Polygon import Polygon
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Point32 import *
 
@@ -21,7 +22,8 @@ def cdr_body_to_py_Polygon(reader: CdrReader, dst: Polygon):
 
 
 def py_to_cdr_Polygon(src: Polygon) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Polygon"])
     writer.write_encapsulation()
     py_to_cdr_body_Polygon(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_PolygonStamped import PolygonStamped
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Point32 import *
@@ -20,7 +21,8 @@ def cdr_body_to_py_PolygonStamped(reader: CdrReader, dst: PolygonStamped):
 
 
 def py_to_cdr_PolygonStamped(src: PolygonStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/PolygonStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_PolygonStamped(writer, src)
     return writer.bytes()
@@ -1,24 +1,27 @@
 from .pdu_pytype_Pose import Pose
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Point import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddddddd")  # position.x, position.y, position.z, orientation.x, orientation.y, orientation.z, orientation.w
+
 
 def py_to_cdr_body_Pose(writer: CdrWriter, src: Pose):
-    py_to_cdr_body_Point(writer, src.position)
-    py_to_cdr_body_Quaternion(writer, src.orientation)
+    writer.write_run(_CDR_RUN_0, (src.position.x, src.position.y, src.position.z, src.orientation.x, src.orientation.y, src.orientation.z, src.orientation.w))
 
 
 def cdr_body_to_py_Pose(reader: CdrReader, dst: Pose):
-    cdr_body_to_py_Point(reader, dst.position)
-    cdr_body_to_py_Quaternion(reader, dst.orientation)
+    dst.position.x, dst.position.y, dst.position.z, dst.orientation.x, dst.orientation.y, dst.orientation.z, dst.orientation.w = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Pose(src: Pose) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Pose"])
     writer.write_encapsulation()
     py_to_cdr_body_Pose(writer, src)
     return writer.bytes()
@@ -1,24 +1,25 @@
 from .pdu_pytype_Pose2D import Pose2D
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddd")  # x, y, theta
+
 
 def py_to_cdr_body_Pose2D(writer: CdrWriter, src: Pose2D):
-    writer.write_float64(src.x)
-    writer.write_float64(src.y)
-    writer.write_float64(src.theta)
+    writer.write_run(_CDR_RUN_0, (src.x, src.y, src.theta))
 
 
 def cdr_body_to_py_Pose2D(reader: CdrReader, dst: Pose2D):
-    dst.x = reader.read_float64()
-    dst.y = reader.read_float64()
-    dst.theta = reader.read_float64()
+    dst.x, dst.y, dst.theta = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Pose2D(src: Pose2D) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Pose2D"])
     writer.write_encapsulation()
     py_to_cdr_body_Pose2D(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_PoseArray import PoseArray
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Point import *
@@ -27,7 +28,8 @@ def cdr_body_to_py_PoseArray(reader: CdrReader, dst: PoseArray):
 
 
 def py_to_cdr_PoseArray(src: PoseArray) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/PoseArray"])
     writer.write_encapsulation()
     py_to_cdr_body_PoseArray(writer, src)
     return writer.bytes()
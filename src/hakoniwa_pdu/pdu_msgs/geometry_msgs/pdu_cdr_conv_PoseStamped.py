@@ -1,5 +1,6 @@
 from .pdu_pytype_PoseStamped import PoseStamped
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Point import *
@@ -8,20 +9,24 @@ from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddddddd")  # pose.position.x, pose.position.y, pose.position.z, pose.orientation.x, pose.orientation.y, pose.orientation.z, pose.orientation.w
+
 
 def py_to_cdr_body_PoseStamped(writer: CdrWriter, src: PoseStamped):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Pose(writer, src.pose)
+    writer.write_run(_CDR_RUN_0, (src.pose.position.x, src.pose.position.y, src.pose.position.z, src.pose.orientation.x, src.pose.orientation.y, src.pose.orientation.z, src.pose.orientation.w))
 
 
 def cdr_body_to_py_PoseStamped(reader: CdrReader, dst: PoseStamped):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Pose(reader, dst.pose)
+    dst.pose.position.x, dst.pose.position.y, dst.pose.position.z, dst.pose.orientation.x, dst.pose.orientation.y, dst.pose.orientation.z, dst.pose.orientation.w = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_PoseStamped(src: PoseStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/PoseStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_PoseStamped(writer, src)
     return writer.bytes()
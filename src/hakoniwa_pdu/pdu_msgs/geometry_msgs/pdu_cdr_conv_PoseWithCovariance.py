@@ -1,27 +1,30 @@
 from .pdu_pytype_PoseWithCovariance import PoseWithCovariance
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Point import *
 from ..geometry_msgs.pdu_cdr_conv_Pose import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddddddd")  # pose.position.x, pose.position.y, pose.position.z, pose.orientation.x, pose.orientation.y, pose.orientation.z, pose.orientation.w
+
 
 def py_to_cdr_body_PoseWithCovariance(writer: CdrWriter, src: PoseWithCovariance):
-    py_to_cdr_body_Pose(writer, src.pose)
-    values = src.covariance
-    for i in range(36):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
+    writer.write_run(_CDR_RUN_0, (src.pose.position.x, src.pose.position.y, src.pose.position.z, src.pose.orientation.x, src.pose.orientation.y, src.pose.orientation.z, src.pose.orientation.w))
+    writer.write_sequence("d", src.covariance, 36)
 
 
 def cdr_body_to_py_PoseWithCovariance(reader: CdrReader, dst: PoseWithCovariance):
-    cdr_body_to_py_Pose(reader, dst.pose)
-    dst.covariance = [reader.read_float64() for _ in range(36)]
+    dst.pose.position.x, dst.pose.position.y, dst.pose.position.z, dst.pose.orientation.x, dst.pose.orientation.y, dst.pose.orientation.z, dst.pose.orientation.w = reader.read_run(_CDR_RUN_0)
+    dst.covariance = reader.read_sequence("d", 36)
     return dst
 
 
 def py_to_cdr_PoseWithCovariance(src: PoseWithCovariance) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/PoseWithCovariance"])
     writer.write_encapsulation()
     py_to_cdr_body_PoseWithCovariance(writer, src)
     return writer.bytes()
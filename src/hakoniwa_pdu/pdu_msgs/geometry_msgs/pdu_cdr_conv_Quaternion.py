@@ -1,26 +1,25 @@
 from .pdu_pytype_Quaternion import Quaternion
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddd")  # x, y, z, w
+
 
 def py_to_cdr_body_Quaternion(writer: CdrWriter, src: Quaternion):
-    writer.write_float64(src.x)
-    writer.write_float64(src.y)
-    writer.write_float64(src.z)
-    writer.write_float64(src.w)
+    writer.write_run(_CDR_RUN_0, (src.x, src.y, src.z, src.w))
 
 
 def cdr_body_to_py_Quaternion(reader: CdrReader, dst: Quaternion):
-    dst.x = reader.read_float64()
-    dst.y = reader.read_float64()
-    dst.z = reader.read_float64()
-    dst.w = reader.read_float64()
+    dst.x, dst.y, dst.z, dst.w = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Quaternion(src: Quaternion) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Quaternion"])
     writer.write_encapsulation()
     py_to_cdr_body_Quaternion(writer, src)
     return writer.bytes()
@@ -1,25 +1,30 @@
 from .pdu_pytype_QuaternionStamped import QuaternionStamped
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddd")  # quaternion.x, quaternion.y, quaternion.z, quaternion.w
+
 
 def py_to_cdr_body_QuaternionStamped(writer: CdrWriter, src: QuaternionStamped):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Quaternion(writer, src.quaternion)
+    writer.write_run(_CDR_RUN_0, (src.quaternion.x, src.quaternion.y, src.quaternion.z, src.quaternion.w))
 
 
 def cdr_body_to_py_QuaternionStamped(reader: CdrReader, dst: QuaternionStamped):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Quaternion(reader, dst.quaternion)
+    dst.quaternion.x, dst.quaternion.y, dst.quaternion.z, dst.quaternion.w = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_QuaternionStamped(src: QuaternionStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/QuaternionStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_QuaternionStamped(writer, src)
     return writer.bytes()
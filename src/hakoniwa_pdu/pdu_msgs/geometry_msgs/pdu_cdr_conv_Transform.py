@@ -1,24 +1,27 @@
 from .pdu_pytype_Transform import Transform
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddddddd")  # translation.x, translation.y, translation.z, rotation.x, rotation.y, rotation.z, rotation.w
+
 
 def py_to_cdr_body_Transform(writer: CdrWriter, src: Transform):
-    py_to_cdr_body_Vector3(writer, src.translation)
-    py_to_cdr_body_Quaternion(writer, src.rotation)
+    writer.write_run(_CDR_RUN_0, (src.translation.x, src.translation.y, src.translation.z, src.rotation.x, src.rotation.y, src.rotation.z, src.rotation.w))
 
 
 def cdr_body_to_py_Transform(reader: CdrReader, dst: Transform):
-    cdr_body_to_py_Vector3(reader, dst.translation)
-    cdr_body_to_py_Quaternion(reader, dst.rotation)
+    dst.translation.x, dst.translation.y, dst.translation.z, dst.rotation.x, dst.rotation.y, dst.rotation.z, dst.rotation.w = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Transform(src: Transform) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Transform"])
     writer.write_encapsulation()
     py_to_cdr_body_Transform(writer, src)
     return writer.bytes()
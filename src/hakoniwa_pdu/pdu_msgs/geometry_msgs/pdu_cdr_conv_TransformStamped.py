@@ -1,5 +1,6 @@
 from .pdu_pytype_TransformStamped import TransformStamped
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
@@ -8,22 +9,26 @@ from ..geometry_msgs.pdu_cdr_conv_Transform import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddddddd")  # transform.translation.x, transform.translation.y, transform.translation.z, transform.rotation.x, transform.rotation.y, transform.rotation.z, transform.rotation.w
+
 
 def py_to_cdr_body_TransformStamped(writer: CdrWriter, src: TransformStamped):
     py_to_cdr_body_Header(writer, src.header)
     writer.write_string(src.child_frame_id)
-    py_to_cdr_body_Transform(writer, src.transform)
+    writer.write_run(_CDR_RUN_0, (src.transform.translation.x, src.transform.translation.y, src.transform.translation.z, src.transform.rotation.x, src.transform.rotation.y, src.transform.rotation.z, src.transform.rotation.w))
 
 
 def cdr_body_to_py_TransformStamped(reader: CdrReader, dst: TransformStamped):
     cdr_body_to_py_Header(reader, dst.header)
     dst.child_frame_id = reader.read_string()
-    cdr_body_to_py_Transform(reader, dst.transform)
+    dst.transform.translation.x, dst.transform.translation.y, dst.transform.translation.z, dst.transform.rotation.x, dst.transform.rotation.y, dst.transform.rotation.z, dst.transform.rotation.w = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_TransformStamped(src: TransformStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/TransformStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_TransformStamped(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_TwistStamped import TwistStamped
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
@@ -7,20 +8,24 @@ from ..geometry_msgs.pdu_cdr_conv_Twist import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddd")  # twist.linear.x, twist.linear.y, twist.linear.z, twist.angular.x, twist.angular.y, twist.angular.z
+
 
 def py_to_cdr_body_TwistStamped(writer: CdrWriter, src: TwistStamped):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Twist(writer, src.twist)
+    writer.write_run(_CDR_RUN_0, (src.twist.linear.x, src.twist.linear.y, src.twist.linear.z, src.twist.angular.x, src.twist.angular.y, src.twist.angular.z))
 
 
 def cdr_body_to_py_TwistStamped(reader: CdrReader, dst: TwistStamped):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Twist(reader, dst.twist)
+    dst.twist.linear.x, dst.twist.linear.y, dst.twist.linear.z, dst.twist.angular.x, dst.twist.angular.y, dst.twist.angular.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_TwistStamped(src: TwistStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/TwistStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_TwistStamped(writer, src)
     return writer.bytes()
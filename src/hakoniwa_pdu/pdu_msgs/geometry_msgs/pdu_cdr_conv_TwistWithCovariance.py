@@ -1,26 +1,29 @@
 from .pdu_pytype_TwistWithCovariance import TwistWithCovariance
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Twist import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddd")  # twist.linear.x, twist.linear.y, twist.linear.z, twist.angular.x, twist.angular.y, twist.angular.z
+
 
 def py_to_cdr_body_TwistWithCovariance(writer: CdrWriter, src: TwistWithCovariance):
-    py_to_cdr_body_Twist(writer, src.twist)
-    values = src.covariance
-    for i in range(36):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
+    writer.write_run(_CDR_RUN_0, (src.twist.linear.x, src.twist.linear.y, src.twist.linear.z, src.twist.angular.x, src.twist.angular.y, src.twist.angular.z))
+    writer.write_sequence("d", src.covariance, 36)
 
 
 def cdr_body_to_py_TwistWithCovariance(reader: CdrReader, dst: TwistWithCovariance):
-    cdr_body_to_py_Twist(reader, dst.twist)
-    dst.covariance = [reader.read_float64() for _ in range(36)]
+    dst.twist.linear.x, dst.twist.linear.y, dst.twist.linear.z, dst.twist.angular.x, dst.twist.angular.y, dst.twist.angular.z = reader.read_run(_CDR_RUN_0)
+    dst.covariance = reader.read_sequence("d", 36)
     return dst
 
 
 def py_to_cdr_TwistWithCovariance(src: TwistWithCovariance) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/TwistWithCovariance"])
     writer.write_encapsulation()
     py_to_cdr_body_TwistWithCovariance(writer, src)
     return writer.bytes()
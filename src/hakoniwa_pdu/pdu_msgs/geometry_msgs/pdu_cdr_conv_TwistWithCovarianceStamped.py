@@ -1,5 +1,6 @@
 from .pdu_pytype_TwistWithCovarianceStamped import TwistWithCovarianceStamped
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
@@ -21,7 +22,8 @@ def cdr_body_to_py_TwistWithCovarianceStamped(reader: CdrReader, dst: TwistWithC
 
 
 def py_to_cdr_TwistWithCovarianceStamped(src: TwistWithCovarianceStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/TwistWithCovarianceStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_TwistWithCovarianceStamped(writer, src)
     return writer.bytes()
@@ -1,24 +1,25 @@
 from .pdu_pytype_Vector3 import Vector3
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddd")  # x, y, z
+
 
 def py_to_cdr_body_Vector3(writer: CdrWriter, src: Vector3):
-    writer.write_float64(src.x)
-    writer.write_float64(src.y)
-    writer.write_float64(src.z)
+    writer.write_run(_CDR_RUN_0, (src.x, src.y, src.z))
 
 
 def cdr_body_to_py_Vector3(reader: CdrReader, dst: Vector3):
-    dst.x = reader.read_float64()
-    dst.y = reader.read_float64()
-    dst.z = reader.read_float64()
+    dst.x, dst.y, dst.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Vector3(src: Vector3) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Vector3"])
     writer.write_encapsulation()
     py_to_cdr_body_Vector3(writer, src)
     return writer.bytes()
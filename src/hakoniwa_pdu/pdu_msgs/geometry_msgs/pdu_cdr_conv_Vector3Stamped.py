@@ -1,25 +1,30 @@
 from .pdu_pytype_Vector3Stamped import Vector3Stamped
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddd")  # vector.x, vector.y, vector.z
+
 
 def py_to_cdr_body_Vector3Stamped(writer: CdrWriter, src: Vector3Stamped):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Vector3(writer, src.vector)
+    writer.write_run(_CDR_RUN_0, (src.vector.x, src.vector.y, src.vector.z))
 
 
 def cdr_body_to_py_Vector3Stamped(reader: CdrReader, dst: Vector3Stamped):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Vector3(reader, dst.vector)
+    dst.vector.x, dst.vector.y, dst.vector.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Vector3Stamped(src: Vector3Stamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Vector3Stamped"])
     writer.write_encapsulation()
     py_to_cdr_body_Vector3Stamped(writer, src)
     return writer.bytes()
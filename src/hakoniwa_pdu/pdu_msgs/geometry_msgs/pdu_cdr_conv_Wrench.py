@@ -1,23 +1,26 @@
 from .pdu_pytype_Wrench import Wrench
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddd")  # force.x, force.y, force.z, torque.x, torque.y, torque.z
+
 
 def py_to_cdr_body_Wrench(writer: CdrWriter, src: Wrench):
-    py_to_cdr_body_Vector3(writer, src.force)
-    py_to_cdr_body_Vector3(writer, src.torque)
+    writer.write_run(_CDR_RUN_0, (src.force.x, src.force.y, src.force.z, src.torque.x, src.torque.y, src.torque.z))
 
 
 def cdr_body_to_py_Wrench(reader: CdrReader, dst: Wrench):
-    cdr_body_to_py_Vector3(reader, dst.force)
-    cdr_body_to_py_Vector3(reader, dst.torque)
+    dst.force.x, dst.force.y, dst.force.z, dst.torque.x, dst.torque.y, dst.torque.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Wrench(src: Wrench) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/Wrench"])
     writer.write_encapsulation()
     py_to_cdr_body_Wrench(writer, src)
     return writer.bytes()
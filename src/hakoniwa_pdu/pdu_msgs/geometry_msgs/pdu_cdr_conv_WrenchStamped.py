@@ -1,5 +1,6 @@
 from .pdu_pytype_WrenchStamped import WrenchStamped
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
@@ -7,20 +8,24 @@ from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 from ..geometry_msgs.pdu_cdr_conv_Wrench import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddd")  # wrench.force.x, wrench.force.y, wrench.force.z, wrench.torque.x, wrench.torque.y, wrench.torque.z
+
 
 def py_to_cdr_body_WrenchStamped(writer: CdrWriter, src: WrenchStamped):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Wrench(writer, src.wrench)
+    writer.write_run(_CDR_RUN_0, (src.wrench.force.x, src.wrench.force.y, src.wrench.force.z, src.wrench.torque.x, src.wrench.torque.y, src.wrench.torque.z))
 
 
 def cdr_body_to_py_WrenchStamped(reader: CdrReader, dst: WrenchStamped):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Wrench(reader, dst.wrench)
+    dst.wrench.force.x, dst.wrench.force.y, dst.wrench.force.z, dst.wrench.torque.x, dst.wrench.torque.y, dst.wrench.torque.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_WrenchStamped(src: WrenchStamped) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["geometry_msgs/WrenchStamped"])
     writer.write_encapsulation()
     py_to_cdr_body_WrenchStamped(writer, src)
     return writer.bytes()
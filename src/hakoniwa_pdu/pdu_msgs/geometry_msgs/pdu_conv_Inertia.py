@@ -8,13 +8,20 @@ from .. import binary_io
 from ..geometry_msgs.pdu_conv_Vector3 import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<d")  # m
+_RUN_1 = struct.Struct("<dddddd")  # ixx, ixy, ixz, iyy, iyz, izz
 
-def pdu_to_py_Inertia(binary_data: bytearray) -> Inertia:
-    py_obj = Inertia()
+
+def pdu_to_py_Inertia(binary_data: bytearray, out: Inertia = None, array_mode: str = None) -> Inertia:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Inertia() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Inertia(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,9 +34,7 @@ def binary_read_recursive_Inertia(meta: binary_io.PduMetaData, binary_data: byte
     # offset: 0 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 8)
-    py_obj.m = binary_io.binTovalue("float64", bin)
+    py_obj.m = _RUN_0.unpack_from(binary_data, base_off + 0)[0]
     
     # array_type: single 
     # data_type: struct 
@@ -38,7 +43,7 @@ def binary_read_recursive_Inertia(meta: binary_io.PduMetaData, binary_data: byte
     # offset: 8 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.com, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 8)
     py_obj.com = tmp_py_obj
     
@@ -48,55 +53,30 @@ def binary_read_recursive_Inertia(meta: binary_io.PduMetaData, binary_data: byte
     # type_name: float64 
     # offset: 32 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 32, 8)
-    py_obj.ixx = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ixy 
     # type_name: float64 
     # offset: 40 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 40, 8)
-    py_obj.ixy = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ixz 
     # type_name: float64 
     # offset: 48 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 48, 8)
-    py_obj.ixz = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: iyy 
     # type_name: float64 
     # offset: 56 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 56, 8)
-    py_obj.iyy = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: iyz 
     # type_name: float64 
     # offset: 64 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 64, 8)
-    py_obj.iyz = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: izz 
@@ -104,40 +84,18 @@ def binary_read_recursive_Inertia(meta: binary_io.PduMetaData, binary_data: byte
     # offset: 72 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 72, 8)
-    py_obj.izz = binary_io.binTovalue("float64", bin)
+    py_obj.ixx, py_obj.ixy, py_obj.ixz, py_obj.iyy, py_obj.iyz, py_obj.izz = _RUN_1.unpack_from(binary_data, base_off + 32)
     
     return py_obj
 
 
-def py_to_pdu_Inertia(py_obj: Inertia) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Inertia(py_obj: Inertia, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Inertia(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Inertia(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Inertia):
     # array_type: single 
@@ -146,13 +104,8 @@ def binary_write_recursive_Inertia(parent_off: int, bw_container: BinaryWriterCo
     # type_name: float64 
     # offset: 0 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 0
 
-    
-    bin = binary_io.typeTobin(type, py_obj.m)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.m), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -171,83 +124,38 @@ def binary_write_recursive_Inertia(parent_off: int, bw_container: BinaryWriterCo
     # type_name: float64 
     # offset: 32 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 32
-
-    
-    bin = binary_io.typeTobin(type, py_obj.ixx)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ixy 
     # type_name: float64 
     # offset: 40 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 40
-
-    
-    bin = binary_io.typeTobin(type, py_obj.ixy)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ixz 
     # type_name: float64 
     # offset: 48 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 48
-
-    
-    bin = binary_io.typeTobin(type, py_obj.ixz)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: iyy 
     # type_name: float64 
     # offset: 56 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 56
-
-    
-    bin = binary_io.typeTobin(type, py_obj.iyy)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: iyz 
     # type_name: float64 
     # offset: 64 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 64
-
-    
-    bin = binary_io.typeTobin(type, py_obj.iyz)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: izz 
     # type_name: float64 
     # offset: 72 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 72
 
-    
-    bin = binary_io.typeTobin(type, py_obj.izz)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.ixx, py_obj.ixy, py_obj.ixz, py_obj.iyy, py_obj.iyz, py_obj.izz), expected_offset=parent_off + 32)
     
 
 if __name__ == "__main__":
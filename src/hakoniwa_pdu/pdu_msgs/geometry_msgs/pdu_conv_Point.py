@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ddd")  # x, y, z
 
-def pdu_to_py_Point(binary_data: bytearray) -> Point:
-    py_obj = Point()
+
+def pdu_to_py_Point(binary_data: bytearray, out: Point = None, array_mode: str = None) -> Point:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Point() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Point(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,22 +31,12 @@ def binary_read_recursive_Point(meta: binary_io.PduMetaData, binary_data: bytear
     # type_name: float64 
     # offset: 0 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 8)
-    py_obj.x = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: y 
     # type_name: float64 
     # offset: 8 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 8)
-    py_obj.y = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: z 
@@ -48,40 +44,18 @@ def binary_read_recursive_Point(meta: binary_io.PduMetaData, binary_data: bytear
     # offset: 16 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 8)
-    py_obj.z = binary_io.binTovalue("float64", bin)
+    py_obj.x, py_obj.y, py_obj.z = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     return py_obj
 
 
-def py_to_pdu_Point(py_obj: Point) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Point(py_obj: Point, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Point(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Point(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Point):
     # array_type: single 
@@ -90,41 +64,20 @@ def binary_write_recursive_Point(parent_off: int, bw_container: BinaryWriterCont
     # type_name: float64 
     # offset: 0 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.x)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: y 
     # type_name: float64 
     # offset: 8 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.y)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: z 
     # type_name: float64 
     # offset: 16 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 16
 
-    
-    bin = binary_io.typeTobin(type, py_obj.z)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.x, py_obj.y, py_obj.z), expected_offset=parent_off + 0)
     
 
 if __name__ == "__main__":
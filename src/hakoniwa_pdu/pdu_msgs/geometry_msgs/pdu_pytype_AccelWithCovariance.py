@@ -12,6 +12,8 @@ class AccelWithCovariance:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("accel", "covariance")
+
     accel: Accel
     covariance: List[float]
 
@@ -33,26 +35,9 @@ class AccelWithCovariance:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'accel'
-        field_val = self.accel
-        if isinstance(field_val, bytearray):
-            d['accel'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['accel'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['accel'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['accel'] = field_val
-        # handle field 'covariance'
+        d['accel'] = self.accel.to_dict()
         field_val = self.covariance
-        if isinstance(field_val, bytearray):
-            d['covariance'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['covariance'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['covariance'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['covariance'] = field_val
+        d['covariance'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -60,41 +45,10 @@ class AccelWithCovariance:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'accel'
-        if 'accel' in d:
-            field_type = cls.__annotations__.get('accel')
-            value = d['accel']
-            
-            if field_type is bytearray:
-                obj.accel = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.accel = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.accel = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.accel = field_type.from_dict(value)
-            else:
-                obj.accel = value
-        # handle field 'covariance'
-        if 'covariance' in d:
-            field_type = cls.__annotations__.get('covariance')
-            value = d['covariance']
-            
-            if field_type is bytearray:
-                obj.covariance = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.covariance = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.covariance = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.covariance = field_type.from_dict(value)
-            else:
-                obj.covariance = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.accel = Accel.from_dict(d['accel']) if 'accel' in d else Accel()
+        obj.covariance = d.get('covariance', [])
         return obj
 
     def to_json(self, indent=2):
@@ -11,6 +11,8 @@ class Inertia:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("m", "com", "ixx", "ixy", "ixz", "iyy", "iyz", "izz")
+
     m: float
     com: Vector3
     ixx: float
@@ -50,86 +52,14 @@ class Inertia:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'm'
-        field_val = self.m
-        if isinstance(field_val, bytearray):
-            d['m'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['m'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['m'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['m'] = field_val
-        # handle field 'com'
-        field_val = self.com
-        if isinstance(field_val, bytearray):
-            d['com'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['com'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['com'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['com'] = field_val
-        # handle field 'ixx'
-        field_val = self.ixx
-        if isinstance(field_val, bytearray):
-            d['ixx'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['ixx'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['ixx'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['ixx'] = field_val
-        # handle field 'ixy'
-        field_val = self.ixy
-        if isinstance(field_val, bytearray):
-            d['ixy'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['ixy'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['ixy'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['ixy'] = field_val
-        # handle field 'ixz'
-        field_val = self.ixz
-        if isinstance(field_val, bytearray):
-            d['ixz'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['ixz'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['ixz'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['ixz'] = field_val
-        # handle field 'iyy'
-        field_val = self.iyy
-        if isinstance(field_val, bytearray):
-            d['iyy'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['iyy'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['iyy'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['iyy'] = field_val
-        # handle field 'iyz'
-        field_val = self.iyz
-        if isinstance(field_val, bytearray):
-            d['iyz'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['iyz'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['iyz'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['iyz'] = field_val
-        # handle field 'izz'
-        field_val = self.izz
-        if isinstance(field_val, bytearray):
-            d['izz'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['izz'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['izz'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['izz'] = field_val
+        d['m'] = self.m
+        d['com'] = self.com.to_dict()
+        d['ixx'] = self.ixx
+        d['ixy'] = self.ixy
+        d['ixz'] = self.ixz
+        d['iyy'] = self.iyy
+        d['iyz'] = self.iyz
+        d['izz'] = self.izz
         return d
 
     @classmethod
@@ -137,143 +67,16 @@ class Inertia:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'm'
-        if 'm' in d:
-            field_type = cls.__annotations__.get('m')
-            value = d['m']
-            
-            if field_type is bytearray:
-                obj.m = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.m = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.m = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.m = field_type.from_dict(value)
-            else:
-                obj.m = value
-        # handle field 'com'
-        if 'com' in d:
-            field_type = cls.__annotations__.get('com')
-            value = d['com']
-            
-            if field_type is bytearray:
-                obj.com = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.com = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.com = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.com = field_type.from_dict(value)
-            else:
-                obj.com = value
-        # handle field 'ixx'
-        if 'ixx' in d:
-            field_type = cls.__annotations__.get('ixx')
-            value = d['ixx']
-            
-            if field_type is bytearray:
-                obj.ixx = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.ixx = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.ixx = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.ixx = field_type.from_dict(value)
-            else:
-                obj.ixx = value
-        # handle field 'ixy'
-        if 'ixy' in d:
-            field_type = cls.__annotations__.get('ixy')
-            value = d['ixy']
-            
-            if field_type is bytearray:
-                obj.ixy = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.ixy = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.ixy = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.ixy = field_type.from_dict(value)
-            else:
-                obj.ixy = value
-        # handle field 'ixz'
-        if 'ixz' in d:
-            field_type = cls.__annotations__.get('ixz')
-            value = d['ixz']
-            
-            if field_type is bytearray:
-                obj.ixz = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.ixz = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.ixz = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.ixz = field_type.from_dict(value)
-            else:
-                obj.ixz = value
-        # handle field 'iyy'
-        if 'iyy' in d:
-            field_type = cls.__annotations__.get('iyy')
-            value = d['iyy']
-            
-            if field_type is bytearray:
-                obj.iyy = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.iyy = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.iyy = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.iyy = field_type.from_dict(value)
-            else:
-                obj.iyy = value
-        # handle field 'iyz'
-        if 'iyz' in d:
-            field_type = cls.__annotations__.get('iyz')
-            value = d['iyz']
-            
-            if field_type is bytearray:
-                obj.iyz = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.iyz = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.iyz = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.iyz = field_type.from_dict(value)
-            else:
-                obj.iyz = value
-        # handle field 'izz'
-        if 'izz' in d:
-            field_type = cls.__annotations__.get('izz')
-            value = d['izz']
-            
-            if field_type is bytearray:
-                obj.izz = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.izz = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.izz = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.izz = field_type.from_dict(value)
-            else:
-                obj.izz = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.m = d.get('m', 0.0)
+        obj.com = Vector3.from_dict(d['com']) if 'com' in d else Vector3()
+        obj.ixx = d.get('ixx', 0.0)
+        obj.ixy = d.get('ixy', 0.0)
+        obj.ixz = d.get('ixz', 0.0)
+        obj.iyy = d.get('iyy', 0.0)
+        obj.iyz = d.get('iyz', 0.0)
+        obj.izz = d.get('izz', 0.0)
         return obj
 
     def to_json(self, indent=2):
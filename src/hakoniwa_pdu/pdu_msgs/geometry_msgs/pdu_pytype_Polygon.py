@@ -11,6 +11,8 @@ class Polygon:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("points",)
+
     points: List[Point32]
 
     def __init__(self):
@@ -29,16 +31,7 @@ class Polygon:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'points'
-        field_val = self.points
-        if isinstance(field_val, bytearray):
-            d['points'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['points'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['points'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['points'] = field_val
+        d['points'] = [item.to_dict() for item in self.points]
         return d
 
     @classmethod
@@ -46,24 +39,9 @@ class Polygon:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'points'
-        if 'points' in d:
-            field_type = cls.__annotations__.get('points')
-            value = d['points']
-            
-            if field_type is bytearray:
-                obj.points = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.points = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.points = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.points = field_type.from_dict(value)
-            else:
-                obj.points = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.points = [Point32.from_dict(item) for item in d['points']] if 'points' in d else []
         return obj
 
     def to_json(self, indent=2):
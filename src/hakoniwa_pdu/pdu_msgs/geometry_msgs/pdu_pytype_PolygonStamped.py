@@ -14,6 +14,8 @@ class PolygonStamped:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "polygon")
+
     header: Header
     polygon: Polygon
 
@@ -35,26 +37,8 @@ class PolygonStamped:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'polygon'
-        field_val = self.polygon
-        if isinstance(field_val, bytearray):
-            d['polygon'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['polygon'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['polygon'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['polygon'] = field_val
+        d['header'] = self.header.to_dict()
+        d['polygon'] = self.polygon.to_dict()
         return d
 
     @classmethod
@@ -62,41 +46,10 @@ class PolygonStamped:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'polygon'
-        if 'polygon' in d:
-            field_type = cls.__annotations__.get('polygon')
-            value = d['polygon']
-            
-            if field_type is bytearray:
-                obj.polygon = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.polygon = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.polygon = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.polygon = field_type.from_dict(value)
-            else:
-                obj.polygon = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.polygon = Polygon.from_dict(d['polygon']) if 'polygon' in d else Polygon()
         return obj
 
     def to_json(self, indent=2):
@@ -12,6 +12,8 @@ class Pose:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("position", "orientation")
+
     position: Point
     orientation: Quaternion
 
@@ -33,26 +35,8 @@ class Pose:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'position'
-        field_val = self.position
-        if isinstance(field_val, bytearray):
-            d['position'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['position'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['position'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['position'] = field_val
-        # handle field 'orientation'
-        field_val = self.orientation
-        if isinstance(field_val, bytearray):
-            d['orientation'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['orientation'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['orientation'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['orientation'] = field_val
+        d['position'] = self.position.to_dict()
+        d['orientation'] = self.orientation.to_dict()
         return d
 
     @classmethod
@@ -60,41 +44,10 @@ class Pose:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'position'
-        if 'position' in d:
-            field_type = cls.__annotations__.get('position')
-            value = d['position']
-            
-            if field_type is bytearray:
-                obj.position = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.position = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.position = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.position = field_type.from_dict(value)
-            else:
-                obj.position = value
-        # handle field 'orientation'
-        if 'orientation' in d:
-            field_type = cls.__annotations__.get('orientation')
-            value = d['orientation']
-            
-            if field_type is bytearray:
-                obj.orientation = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.orientation = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.orientation = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.orientation = field_type.from_dict(value)
-            else:
-                obj.orientation = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.position = Point.from_dict(d['position']) if 'position' in d else Point()
+        obj.orientation = Quaternion.from_dict(d['orientation']) if 'orientation' in d else Quaternion()
         return obj
 
     def to_json(self, indent=2):
@@ -15,6 +15,8 @@ class PoseArray:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "poses")
+
     header: Header
     poses: List[Pose]
 
@@ -36,26 +38,8 @@ class PoseArray:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'poses'
-        field_val = self.poses
-        if isinstance(field_val, bytearray):
-            d['poses'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['poses'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['poses'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['poses'] = field_val
+        d['header'] = self.header.to_dict()
+        d['poses'] = [item.to_dict() for item in self.poses]
         return d
 
     @classmethod
@@ -63,41 +47,10 @@ class PoseArray:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'poses'
-        if 'poses' in d:
-            field_type = cls.__annotations__.get('poses')
-            value = d['poses']
-            
-            if field_type is bytearray:
-                obj.poses = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.poses = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.poses = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.poses = field_type.from_dict(value)
-            else:
-                obj.poses = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.poses = [Pose.from_dict(item) for item in d['poses']] if 'poses' in d else []
         return obj
 
     def to_json(self, indent=2):
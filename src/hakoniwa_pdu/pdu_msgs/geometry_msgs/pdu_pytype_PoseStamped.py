@@ -15,6 +15,8 @@ class PoseStamped:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "pose")
+
     header: Header
     pose: Pose
 
@@ -36,26 +38,8 @@ class PoseStamped:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'pose'
-        field_val = self.pose
-        if isinstance(field_val, bytearray):
-            d['pose'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['pose'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['pose'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['pose'] = field_val
+        d['header'] = self.header.to_dict()
+        d['pose'] = self.pose.to_dict()
         return d
 
     @classmethod
@@ -63,41 +47,10 @@ class PoseStamped:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'pose'
-        if 'pose' in d:
-            field_type = cls.__annotations__.get('pose')
-            value = d['pose']
-            
-            if field_type is bytearray:
-                obj.pose = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.pose = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.pose = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.pose = field_type.from_dict(value)
-            else:
-                obj.pose = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.pose = Pose.from_dict(d['pose']) if 'pose' in d else Pose()
         return obj
 
     def to_json(self, indent=2):
@@ -13,6 +13,8 @@ class PoseWithCovariance:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("pose", "covariance")
+
     pose: Pose
     covariance: List[float]
 
@@ -34,26 +36,9 @@ class PoseWithCovariance:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'pose'
-        field_val = self.pose
-        if isinstance(field_val, bytearray):
-            d['pose'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['pose'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['pose'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['pose'] = field_val
-        # handle field 'covariance'
+        d['pose'] = self.pose.to_dict()
         field_val = self.covariance
-        if isinstance(field_val, bytearray):
-            d['covariance'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['covariance'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['covariance'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['covariance'] = field_val
+        d['covariance'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -61,41 +46,10 @@ class PoseWithCovariance:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'pose'
-        if 'pose' in d:
-            field_type = cls.__annotations__.get('pose')
-            value = d['pose']
-            
-            if field_type is bytearray:
-                obj.pose = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.pose = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.pose = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.pose = field_type.from_dict(value)
-            else:
-                obj.pose = value
-        # handle field 'covariance'
-        if 'covariance' in d:
-            field_type = cls.__annotations__.get('covariance')
-            value = d['covariance']
-            
-            if field_type is bytearray:
-                obj.covariance = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.covariance = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.covariance = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.covariance = field_type.from_dict(value)
-            else:
-                obj.covariance = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.pose = Pose.from_dict(d['pose']) if 'pose' in d else Pose()
+        obj.covariance = d.get('covariance', [])
         return obj
 
     def to_json(self, indent=2):
@@ -13,6 +13,8 @@ class QuaternionStamped:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "quaternion")
+
     header: Header
     quaternion: Quaternion
 
@@ -34,26 +36,8 @@ class QuaternionStamped:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'quaternion'
-        field_val = self.quaternion
-        if isinstance(field_val, bytearray):
-            d['quaternion'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['quaternion'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['quaternion'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['quaternion'] = field_val
+        d['header'] = self.header.to_dict()
+        d['quaternion'] = self.quaternion.to_dict()
         return d
 
     @classmethod
@@ -61,41 +45,10 @@ class QuaternionStamped:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'quaternion'
-        if 'quaternion' in d:
-            field_type = cls.__annotations__.get('quaternion')
-            value = d['quaternion']
-            
-            if field_type is bytearray:
-                obj.quaternion = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.quaternion = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.quaternion = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.quaternion = field_type.from_dict(value)
-            else:
-                obj.quaternion = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.quaternion = Quaternion.from_dict(d['quaternion']) if 'quaternion' in d else Quaternion()
         return obj
 
     def to_json(self, indent=2):
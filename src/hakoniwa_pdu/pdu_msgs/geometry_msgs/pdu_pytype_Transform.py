@@ -12,6 +12,8 @@ class Transform:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("translation", "rotation")
+
     translation: Vector3
     rotation: Quaternion
 
@@ -33,26 +35,8 @@ class Transform:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'translation'
-        field_val = self.translation
-        if isinstance(field_val, bytearray):
-            d['translation'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['translation'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['translation'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['translation'] = field_val
-        # handle field 'rotation'
-        field_val = self.rotation
-        if isinstance(field_val, bytearray):
-            d['rotation'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['rotation'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['rotation'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['rotation'] = field_val
+        d['translation'] = self.translation.to_dict()
+        d['rotation'] = self.rotation.to_dict()
         return d
 
     @classmethod
@@ -60,41 +44,10 @@ class Transform:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'translation'
-        if 'translation' in d:
-            field_type = cls.__annotations__.get('translation')
-            value = d['translation']
-            
-            if field_type is bytearray:
-                obj.translation = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.translation = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.translation = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.translation = field_type.from_dict(value)
-            else:
-                obj.translation = value
-        # handle field 'rotation'
-        if 'rotation' in d:
-            field_type = cls.__annotations__.get('rotation')
-            value = d['rotation']
-            
-            if field_type is bytearray:
-                obj.rotation = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.rotation = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.rotation = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.rotation = field_type.from_dict(value)
-            else:
-                obj.rotation = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.translation = Vector3.from_dict(d['translation']) if 'translation' in d else Vector3()
+        obj.rotation = Quaternion.from_dict(d['rotation']) if 'rotation' in d else Quaternion()
         return obj
 
     def to_json(self, indent=2):
@@ -15,6 +15,8 @@ class TransformStamped:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "child_frame_id", "transform")
+
     header: Header
     child_frame_id: str
     transform: Transform
@@ -39,36 +41,9 @@ class TransformStamped:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'child_frame_id'
-        field_val = self.child_frame_id
-        if isinstance(field_val, bytearray):
-            d['child_frame_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['child_frame_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['child_frame_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['child_frame_id'] = field_val
-        # handle field 'transform'
-        field_val = self.transform
-        if isinstance(field_val, bytearray):
-            d['transform'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['transform'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['transform'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['transform'] = field_val
+        d['header'] = self.header.to_dict()
+        d['child_frame_id'] = self.child_frame_id
+        d['transform'] = self.transform.to_dict()
         return d
 
     @classmethod
@@ -76,58 +51,11 @@ class TransformStamped:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'child_frame_id'
-        if 'child_frame_id' in d:
-            field_type = cls.__annotations__.get('child_frame_id')
-            value = d['child_frame_id']
-            
-            if field_type is bytearray:
-                obj.child_frame_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.child_frame_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.child_frame_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.child_frame_id = field_type.from_dict(value)
-            else:
-                obj.child_frame_id = value
-        # handle field 'transform'
-        if 'transform' in d:
-            field_type = cls.__annotations__.get('transform')
-            value = d['transform']
-            
-            if field_type is bytearray:
-                obj.transform = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.transform = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.transform = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.transform = field_type.from_dict(value)
-            else:
-                obj.transform = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.child_frame_id = d.get('child_frame_id', "")
+        obj.transform = Transform.from_dict(d['transform']) if 'transform' in d else Transform()
         return obj
 
     def to_json(self, indent=2):
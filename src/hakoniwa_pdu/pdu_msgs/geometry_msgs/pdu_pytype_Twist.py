@@ -11,6 +11,8 @@ class Twist:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("linear", "angular")
+
     linear: Vector3
     angular: Vector3
 
@@ -32,26 +34,8 @@ class Twist:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'linear'
-        field_val = self.linear
-        if isinstance(field_val, bytearray):
-            d['linear'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['linear'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['linear'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['linear'] = field_val
-        # handle field 'angular'
-        field_val = self.angular
-        if isinstance(field_val, bytearray):
-            d['angular'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['angular'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['angular'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['angular'] = field_val
+        d['linear'] = self.linear.to_dict()
+        d['angular'] = self.angular.to_dict()
         return d
 
     @classmethod
@@ -59,41 +43,10 @@ class Twist:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'linear'
-        if 'linear' in d:
-            field_type = cls.__annotations__.get('linear')
-            value = d['linear']
-            
-            if field_type is bytearray:
-                obj.linear = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.linear = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.linear = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.linear = field_type.from_dict(value)
-            else:
-                obj.linear = value
-        # handle field 'angular'
-        if 'angular' in d:
-            field_type = cls.__annotations__.get('angular')
-            value = d['angular']
-            
-            if field_type is bytearray:
-                obj.angular = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.angular = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.angular = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.angular = field_type.from_dict(value)
-            else:
-                obj.angular = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.linear = Vector3.from_dict(d['linear']) if 'linear' in d else Vector3()
+        obj.angular = Vector3.from_dict(d['angular']) if 'angular' in d else Vector3()
         return obj
 
     def to_json(self, indent=2):
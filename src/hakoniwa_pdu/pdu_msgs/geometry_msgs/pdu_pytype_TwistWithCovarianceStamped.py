@@ -15,6 +15,8 @@ class TwistWithCovarianceStamped:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "twist")
+
     header: Header
     twist: TwistWithCovariance
 
@@ -36,26 +38,8 @@ class TwistWithCovarianceStamped:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'twist'
-        field_val = self.twist
-        if isinstance(field_val, bytearray):
-            d['twist'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['twist'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['twist'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['twist'] = field_val
+        d['header'] = self.header.to_dict()
+        d['twist'] = self.twist.to_dict()
         return d
 
     @classmethod
@@ -63,41 +47,10 @@ class TwistWithCovarianceStamped:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'twist'
-        if 'twist' in d:
-            field_type = cls.__annotations__.get('twist')
-            value = d['twist']
-            
-            if field_type is bytearray:
-                obj.twist = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.twist = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.twist = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.twist = field_type.from_dict(value)
-            else:
-                obj.twist = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.twist = TwistWithCovariance.from_dict(d['twist']) if 'twist' in d else TwistWithCovariance()
         return obj
 
     def to_json(self, indent=2):
@@ -13,6 +13,8 @@ class Vector3Stamped:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "vector")
+
     header: Header
     vector: Vector3
 
@@ -34,26 +36,8 @@ class Vector3Stamped:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'vector'
-        field_val = self.vector
-        if isinstance(field_val, bytearray):
-            d['vector'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['vector'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['vector'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['vector'] = field_val
+        d['header'] = self.header.to_dict()
+        d['vector'] = self.vector.to_dict()
         return d
 
     @classmethod
@@ -61,41 +45,10 @@ class Vector3Stamped:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'vector'
-        if 'vector' in d:
-            field_type = cls.__annotations__.get('vector')
-            value = d['vector']
-            
-            if field_type is bytearray:
-                obj.vector = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.vector = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.vector = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.vector = field_type.from_dict(value)
-            else:
-                obj.vector = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.vector = Vector3.from_dict(d['vector']) if 'vector' in d else Vector3()
         return obj
 
     def to_json(self, indent=2):
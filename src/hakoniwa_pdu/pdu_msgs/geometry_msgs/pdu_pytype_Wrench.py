@@ -11,6 +11,8 @@ class Wrench:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("force", "torque")
+
     force: Vector3
     torque: Vector3
 
@@ -32,26 +34,8 @@ class Wrench:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'force'
-        field_val = self.force
-        if isinstance(field_val, bytearray):
-            d['force'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['force'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['force'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['force'] = field_val
-        # handle field 'torque'
-        field_val = self.torque
-        if isinstance(field_val, bytearray):
-            d['torque'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['torque'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['torque'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['torque'] = field_val
+        d['force'] = self.force.to_dict()
+        d['torque'] = self.torque.to_dict()
         return d
 
     @classmethod
@@ -59,41 +43,10 @@ class Wrench:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'force'
-        if 'force' in d:
-            field_type = cls.__annotations__.get('force')
-            value = d['force']
-            
-            if field_type is bytearray:
-                obj.force = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.force = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.force = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.force = field_type.from_dict(value)
-            else:
-                obj.force = value
-        # handle field 'torque'
-        if 'torque' in d:
-            field_type = cls.__annotations__.get('torque')
-            value = d['torque']
-            
-            if field_type is bytearray:
-                obj.torque = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.torque = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.torque = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.torque = field_type.from_dict(value)
-            else:
-                obj.torque = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.force = Vector3.from_dict(d['force']) if 'force' in d else Vector3()
+        obj.torque = Vector3.from_dict(d['torque']) if 'torque' in d else Vector3()
         return obj
 
     def to_json(self, indent=2):
@@ -1,30 +1,28 @@
 from .pdu_pytype_ActionFeedbackHeader import ActionFeedbackHeader
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
 
 def py_to_cdr_body_ActionFeedbackHeader(writer: CdrWriter, src: ActionFeedbackHeader):
     writer.write_uint8(src.version)
-    values = src.reserved
-    for i in range(3):
-        writer.write_uint8(values[i] if i < len(values) else 0)
-    values = src.goal_id
-    for i in range(16):
-        writer.write_uint8(values[i] if i < len(values) else 0)
+    writer.write_sequence("B", src.reserved, 3)
+    writer.write_sequence("B", src.goal_id, 16)
     writer.write_uint32(src.sequence_no)
 
 
 def cdr_body_to_py_ActionFeedbackHeader(reader: CdrReader, dst: ActionFeedbackHeader):
     dst.version = reader.read_uint8()
-    dst.reserved = [reader.read_uint8() for _ in range(3)]
-    dst.goal_id = [reader.read_uint8() for _ in range(16)]
+    dst.reserved = reader.read_sequence("B", 3)
+    dst.goal_id = reader.read_sequence("B", 16)
     dst.sequence_no = reader.read_uint32()
     return dst
 
 
 def py_to_cdr_ActionFeedbackHeader(src: ActionFeedbackHeader) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_action_msgs/ActionFeedbackHeader"])
     writer.write_encapsulation()
     py_to_cdr_body_ActionFeedbackHeader(writer, src)
     return writer.bytes()
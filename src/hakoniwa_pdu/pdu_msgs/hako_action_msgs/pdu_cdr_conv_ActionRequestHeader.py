@@ -1,30 +1,29 @@
 from .pdu_pytype_ActionRequestHeader import ActionRequestHeader
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("BB")  # version, request_kind
+
 
 def py_to_cdr_body_ActionRequestHeader(writer: CdrWriter, src: ActionRequestHeader):
-    writer.write_uint8(src.version)
-    writer.write_uint8(src.request_kind)
-    values = src.reserved
-    for i in range(2):
-        writer.write_uint8(values[i] if i < len(values) else 0)
-    values = src.goal_id
-    for i in range(16):
-        writer.write_uint8(values[i] if i < len(values) else 0)
+    writer.write_run(_CDR_RUN_0, (src.version, src.request_kind))
+    writer.write_sequence("B", src.reserved, 2)
+    writer.write_sequence("B", src.goal_id, 16)
 
 
 def cdr_body_to_py_ActionRequestHeader(reader: CdrReader, dst: ActionRequestHeader):
-    dst.version = reader.read_uint8()
-    dst.request_kind = reader.read_uint8()
-    dst.reserved = [reader.read_uint8() for _ in range(2)]
-    dst.goal_id = [reader.read_uint8() for _ in range(16)]
+    dst.version, dst.request_kind = reader.read_run(_CDR_RUN_0)
+    dst.reserved = reader.read_sequence("B", 2)
+    dst.goal_id = reader.read_sequence("B", 16)
     return dst
 
 
 def py_to_cdr_ActionRequestHeader(src: ActionRequestHeader) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_action_msgs/ActionRequestHeader"])
     writer.write_encapsulation()
     py_to_cdr_body_ActionRequestHeader(writer, src)
     return writer.bytes()
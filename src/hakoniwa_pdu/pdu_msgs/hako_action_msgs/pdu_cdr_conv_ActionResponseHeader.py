@@ -1,30 +1,27 @@
 from .pdu_pytype_ActionResponseHeader import ActionResponseHeader
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("BBBB")  # version, response_kind, status, reserved
+
 
 def py_to_cdr_body_ActionResponseHeader(writer: CdrWriter, src: ActionResponseHeader):
-    writer.write_uint8(src.version)
-    writer.write_uint8(src.response_kind)
-    writer.write_uint8(src.status)
-    writer.write_uint8(src.reserved)
-    values = src.goal_id
-    for i in range(16):
-        writer.write_uint8(values[i] if i < len(values) else 0)
+    writer.write_run(_CDR_RUN_0, (src.version, src.response_kind, src.status, src.reserved))
+    writer.write_sequence("B", src.goal_id, 16)
 
 
 def cdr_body_to_py_ActionResponseHeader(reader: CdrReader, dst: ActionResponseHeader):
-    dst.version = reader.read_uint8()
-    dst.response_kind = reader.read_uint8()
-    dst.status = reader.read_uint8()
-    dst.reserved = reader.read_uint8()
-    dst.goal_id = [reader.read_uint8() for _ in range(16)]
+    dst.version, dst.response_kind, dst.status, dst.reserved = reader.read_run(_CDR_RUN_0)
+    dst.goal_id = reader.read_sequence("B", 16)
     return dst
 
 
 def py_to_cdr_ActionResponseHeader(src: ActionResponseHeader) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_action_msgs/ActionResponseHeader"])
     writer.write_encapsulation()
     py_to_cdr_body_ActionResponseHeader(writer, src)
     return writer.bytes()
@@ -10,6 +10,8 @@ class ActionFeedbackHeader:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("version", "reserved", "goal_id", "sequence_no")
+
     version: int
     reserved: List[int]
     goal_id: List[int]
@@ -37,46 +39,12 @@ class ActionFeedbackHeader:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'version'
-        field_val = self.version
-        if isinstance(field_val, bytearray):
-            d['version'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['version'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['version'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['version'] = field_val
-        # handle field 'reserved'
+        d['version'] = self.version
         field_val = self.reserved
-        if isinstance(field_val, bytearray):
-            d['reserved'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['reserved'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['reserved'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['reserved'] = field_val
-        # handle field 'goal_id'
+        d['reserved'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.goal_id
-        if isinstance(field_val, bytearray):
-            d['goal_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['goal_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['goal_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['goal_id'] = field_val
-        # handle field 'sequence_no'
-        field_val = self.sequence_no
-        if isinstance(field_val, bytearray):
-            d['sequence_no'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['sequence_no'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['sequence_no'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['sequence_no'] = field_val
+        d['goal_id'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['sequence_no'] = self.sequence_no
         return d
 
     @classmethod
@@ -84,75 +52,12 @@ class ActionFeedbackHeader:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'version'
-        if 'version' in d:
-            field_type = cls.__annotations__.get('version')
-            value = d['version']
-            
-            if field_type is bytearray:
-                obj.version = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.version = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.version = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.version = field_type.from_dict(value)
-            else:
-                obj.version = value
-        # handle field 'reserved'
-        if 'reserved' in d:
-            field_type = cls.__annotations__.get('reserved')
-            value = d['reserved']
-            
-            if field_type is bytearray:
-                obj.reserved = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.reserved = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.reserved = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.reserved = field_type.from_dict(value)
-            else:
-                obj.reserved = value
-        # handle field 'goal_id'
-        if 'goal_id' in d:
-            field_type = cls.__annotations__.get('goal_id')
-            value = d['goal_id']
-            
-            if field_type is bytearray:
-                obj.goal_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.goal_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.goal_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.goal_id = field_type.from_dict(value)
-            else:
-                obj.goal_id = value
-        # handle field 'sequence_no'
-        if 'sequence_no' in d:
-            field_type = cls.__annotations__.get('sequence_no')
-            value = d['sequence_no']
-            
-            if field_type is bytearray:
-                obj.sequence_no = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.sequence_no = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.sequence_no = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.sequence_no = field_type.from_dict(value)
-            else:
-                obj.sequence_no = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.version = d.get('version', 0)
+        obj.reserved = d.get('reserved', [])
+        obj.goal_id = d.get('goal_id', [])
+        obj.sequence_no = d.get('sequence_no', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class ActionResponseHeader:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("version", "response_kind", "status", "reserved", "goal_id")
+
     version: int
     response_kind: int
     status: int
@@ -40,56 +42,12 @@ class ActionResponseHeader:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'version'
-        field_val = self.version
-        if isinstance(field_val, bytearray):
-            d['version'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['version'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['version'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['version'] = field_val
-        # handle field 'response_kind'
-        field_val = self.response_kind
-        if isinstance(field_val, bytearray):
-            d['response_kind'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['response_kind'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['response_kind'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['response_kind'] = field_val
-        # handle field 'status'
-        field_val = self.status
-        if isinstance(field_val, bytearray):
-            d['status'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['status'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['status'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['status'] = field_val
-        # handle field 'reserved'
-        field_val = self.reserved
-        if isinstance(field_val, bytearray):
-            d['reserved'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['reserved'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['reserved'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['reserved'] = field_val
-        # handle field 'goal_id'
+        d['version'] = self.version
+        d['response_kind'] = self.response_kind
+        d['status'] = self.status
+        d['reserved'] = self.reserved
         field_val = self.goal_id
-        if isinstance(field_val, bytearray):
-            d['goal_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['goal_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['goal_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['goal_id'] = field_val
+        d['goal_id'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -97,92 +55,13 @@ class ActionResponseHeader:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'version'
-        if 'version' in d:
-            field_type = cls.__annotations__.get('version')
-            value = d['version']
-            
-            if field_type is bytearray:
-                obj.version = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.version = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.version = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.version = field_type.from_dict(value)
-            else:
-                obj.version = value
-        # handle field 'response_kind'
-        if 'response_kind' in d:
-            field_type = cls.__annotations__.get('response_kind')
-            value = d['response_kind']
-            
-            if field_type is bytearray:
-                obj.response_kind = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.response_kind = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.response_kind = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.response_kind = field_type.from_dict(value)
-            else:
-                obj.response_kind = value
-        # handle field 'status'
-        if 'status' in d:
-            field_type = cls.__annotations__.get('status')
-            value = d['status']
-            
-            if field_type is bytearray:
-                obj.status = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.status = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.status = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.status = field_type.from_dict(value)
-            else:
-                obj.status = value
-        # handle field 'reserved'
-        if 'reserved' in d:
-            field_type = cls.__annotations__.get('reserved')
-            value = d['reserved']
-            
-            if field_type is bytearray:
-                obj.reserved = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.reserved = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.reserved = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.reserved = field_type.from_dict(value)
-            else:
-                obj.reserved = value
-        # handle field 'goal_id'
-        if 'goal_id' in d:
-            field_type = cls.__annotations__.get('goal_id')
-            value = d['goal_id']
-            
-            if field_type is bytearray:
-                obj.goal_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.goal_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.goal_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.goal_id = field_type.from_dict(value)
-            else:
-                obj.goal_id = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.version = d.get('version', 0)
+        obj.response_kind = d.get('response_kind', 0)
+        obj.status = d.get('status', 0)
+        obj.reserved = d.get('reserved', 0)
+        obj.goal_id = d.get('goal_id', [])
         return obj
 
     def to_json(self, indent=2):
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<IB1xHHHHHHHHHHHHHHHH")  # time_usec, port, servo1_raw, servo2_raw, servo3_raw, servo4_raw, servo5_raw, servo6_raw, servo7_raw, servo8_raw, servo9_raw, servo10_raw, servo11_raw, servo12_raw, servo13_raw, servo14_raw, servo15_raw, servo16_raw
 
-def pdu_to_py_HakoSERVO_OUTPUT_RAW(binary_data: bytearray) -> HakoSERVO_OUTPUT_RAW:
-    py_obj = HakoSERVO_OUTPUT_RAW()
+
+def pdu_to_py_HakoSERVO_OUTPUT_RAW(binary_data: bytearray, out: HakoSERVO_OUTPUT_RAW = None, array_mode: str = None) -> HakoSERVO_OUTPUT_RAW:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = HakoSERVO_OUTPUT_RAW() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_HakoSERVO_OUTPUT_RAW(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,187 +31,102 @@ def binary_read_recursive_HakoSERVO_OUTPUT_RAW(meta: binary_io.PduMetaData, bina
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.time_usec = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: port 
     # type_name: uint8 
     # offset: 4 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 1)
-    py_obj.port = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo1_raw 
     # type_name: uint16 
     # offset: 6 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 6, 2)
-    py_obj.servo1_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo2_raw 
     # type_name: uint16 
     # offset: 8 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 2)
-    py_obj.servo2_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo3_raw 
     # type_name: uint16 
     # offset: 10 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 10, 2)
-    py_obj.servo3_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo4_raw 
     # type_name: uint16 
     # offset: 12 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 2)
-    py_obj.servo4_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo5_raw 
     # type_name: uint16 
     # offset: 14 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 14, 2)
-    py_obj.servo5_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo6_raw 
     # type_name: uint16 
     # offset: 16 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 2)
-    py_obj.servo6_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo7_raw 
     # type_name: uint16 
     # offset: 18 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 18, 2)
-    py_obj.servo7_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo8_raw 
     # type_name: uint16 
     # offset: 20 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 20, 2)
-    py_obj.servo8_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo9_raw 
     # type_name: uint16 
     # offset: 22 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 22, 2)
-    py_obj.servo9_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo10_raw 
     # type_name: uint16 
     # offset: 24 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 24, 2)
-    py_obj.servo10_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo11_raw 
     # type_name: uint16 
     # offset: 26 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 26, 2)
-    py_obj.servo11_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo12_raw 
     # type_name: uint16 
     # offset: 28 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 28, 2)
-    py_obj.servo12_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo13_raw 
     # type_name: uint16 
     # offset: 30 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 30, 2)
-    py_obj.servo13_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo14_raw 
     # type_name: uint16 
     # offset: 32 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 32, 2)
-    py_obj.servo14_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo15_raw 
     # type_name: uint16 
     # offset: 34 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 34, 2)
-    py_obj.servo15_raw = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo16_raw 
@@ -213,40 +134,18 @@ def binary_read_recursive_HakoSERVO_OUTPUT_RAW(meta: binary_io.PduMetaData, bina
     # offset: 36 size: 2 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 36, 2)
-    py_obj.servo16_raw = binary_io.binTovalue("uint16", bin)
+    py_obj.time_usec, py_obj.port, py_obj.servo1_raw, py_obj.servo2_raw, py_obj.servo3_raw, py_obj.servo4_raw, py_obj.servo5_raw, py_obj.servo6_raw, py_obj.servo7_raw, py_obj.servo8_raw, py_obj.servo9_raw, py_obj.servo10_raw, py_obj.servo11_raw, py_obj.servo12_raw, py_obj.servo13_raw, py_obj.servo14_raw, py_obj.servo15_raw, py_obj.servo16_raw = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     return py_obj
 
 
-def py_to_pdu_HakoSERVO_OUTPUT_RAW(py_obj: HakoSERVO_OUTPUT_RAW) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_HakoSERVO_OUTPUT_RAW(py_obj: HakoSERVO_OUTPUT_RAW, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_HakoSERVO_OUTPUT_RAW(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_HakoSERVO_OUTPUT_RAW(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: HakoSERVO_OUTPUT_RAW):
     # array_type: single 
@@ -255,251 +154,110 @@ def binary_write_recursive_HakoSERVO_OUTPUT_RAW(parent_off: int, bw_container: B
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.time_usec)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: port 
     # type_name: uint8 
     # offset: 4 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 4
-
-    
-    bin = binary_io.typeTobin(type, py_obj.port)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo1_raw 
     # type_name: uint16 
     # offset: 6 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 6
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo1_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo2_raw 
     # type_name: uint16 
     # offset: 8 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo2_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo3_raw 
     # type_name: uint16 
     # offset: 10 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 10
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo3_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo4_raw 
     # type_name: uint16 
     # offset: 12 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo4_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo5_raw 
     # type_name: uint16 
     # offset: 14 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 14
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo5_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo6_raw 
     # type_name: uint16 
     # offset: 16 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo6_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo7_raw 
     # type_name: uint16 
     # offset: 18 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 18
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo7_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo8_raw 
     # type_name: uint16 
     # offset: 20 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 20
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo8_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo9_raw 
     # type_name: uint16 
     # offset: 22 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 22
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo9_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo10_raw 
     # type_name: uint16 
     # offset: 24 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 24
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo10_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo11_raw 
     # type_name: uint16 
     # offset: 26 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 26
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo11_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo12_raw 
     # type_name: uint16 
     # offset: 28 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 28
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo12_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo13_raw 
     # type_name: uint16 
     # offset: 30 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 30
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo13_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo14_raw 
     # type_name: uint16 
     # offset: 32 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 32
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo14_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo15_raw 
     # type_name: uint16 
     # offset: 34 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 34
-
-    
-    bin = binary_io.typeTobin(type, py_obj.servo15_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: servo16_raw 
     # type_name: uint16 
     # offset: 36 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 36
 
-    
-    bin = binary_io.typeTobin(type, py_obj.servo16_raw)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.time_usec, py_obj.port, py_obj.servo1_raw, py_obj.servo2_raw, py_obj.servo3_raw, py_obj.servo4_raw, py_obj.servo5_raw, py_obj.servo6_raw, py_obj.servo7_raw, py_obj.servo8_raw, py_obj.servo9_raw, py_obj.servo10_raw, py_obj.servo11_raw, py_obj.servo12_raw, py_obj.servo13_raw, py_obj.servo14_raw, py_obj.servo15_raw, py_obj.servo16_raw), expected_offset=parent_off + 0)
     
 
 if __name__ == "__main__":
@@ -10,6 +10,8 @@ class HakoSERVO_OUTPUT_RAW:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("time_usec", "port", "servo1_raw", "servo2_raw", "servo3_raw", "servo4_raw", "servo5_raw", "servo6_raw", "servo7_raw", "servo8_raw", "servo9_raw", "servo10_raw", "servo11_raw", "servo12_raw", "servo13_raw", "servo14_raw", "servo15_raw", "servo16_raw")
+
     time_usec: int
     port: int
     servo1_raw: int
@@ -79,186 +81,24 @@ class HakoSERVO_OUTPUT_RAW:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'time_usec'
-        field_val = self.time_usec
-        if isinstance(field_val, bytearray):
-            d['time_usec'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['time_usec'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['time_usec'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['time_usec'] = field_val
-        # handle field 'port'
-        field_val = self.port
-        if isinstance(field_val, bytearray):
-            d['port'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['port'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['port'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['port'] = field_val
-        # handle field 'servo1_raw'
-        field_val = self.servo1_raw
-        if isinstance(field_val, bytearray):
-            d['servo1_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo1_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo1_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo1_raw'] = field_val
-        # handle field 'servo2_raw'
-        field_val = self.servo2_raw
-        if isinstance(field_val, bytearray):
-            d['servo2_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo2_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo2_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo2_raw'] = field_val
-        # handle field 'servo3_raw'
-        field_val = self.servo3_raw
-        if isinstance(field_val, bytearray):
-            d['servo3_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo3_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo3_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo3_raw'] = field_val
-        # handle field 'servo4_raw'
-        field_val = self.servo4_raw
-        if isinstance(field_val, bytearray):
-            d['servo4_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo4_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo4_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo4_raw'] = field_val
-        # handle field 'servo5_raw'
-        field_val = self.servo5_raw
-        if isinstance(field_val, bytearray):
-            d['servo5_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo5_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo5_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo5_raw'] = field_val
-        # handle field 'servo6_raw'
-        field_val = self.servo6_raw
-        if isinstance(field_val, bytearray):
-            d['servo6_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo6_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo6_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo6_raw'] = field_val
-        # handle field 'servo7_raw'
-        field_val = self.servo7_raw
-        if isinstance(field_val, bytearray):
-            d['servo7_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo7_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo7_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo7_raw'] = field_val
-        # handle field 'servo8_raw'
-        field_val = self.servo8_raw
-        if isinstance(field_val, bytearray):
-            d['servo8_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo8_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo8_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo8_raw'] = field_val
-        # handle field 'servo9_raw'
-        field_val = self.servo9_raw
-        if isinstance(field_val, bytearray):
-            d['servo9_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo9_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo9_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo9_raw'] = field_val
-        # handle field 'servo10_raw'
-        field_val = self.servo10_raw
-        if isinstance(field_val, bytearray):
-            d['servo10_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo10_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo10_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo10_raw'] = field_val
-        # handle field 'servo11_raw'
-        field_val = self.servo11_raw
-        if isinstance(field_val, bytearray):
-            d['servo11_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo11_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo11_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo11_raw'] = field_val
-        # handle field 'servo12_raw'
-        field_val = self.servo12_raw
-        if isinstance(field_val, bytearray):
-            d['servo12_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo12_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo12_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo12_raw'] = field_val
-        # handle field 'servo13_raw'
-        field_val = self.servo13_raw
-        if isinstance(field_val, bytearray):
-            d['servo13_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo13_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo13_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo13_raw'] = field_val
-        # handle field 'servo14_raw'
-        field_val = self.servo14_raw
-        if isinstance(field_val, bytearray):
-            d['servo14_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo14_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo14_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo14_raw'] = field_val
-        # handle field 'servo15_raw'
-        field_val = self.servo15_raw
-        if isinstance(field_val, bytearray):
-            d['servo15_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo15_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo15_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo15_raw'] = field_val
-        # handle field 'servo16_raw'
-        field_val = self.servo16_raw
-        if isinstance(field_val, bytearray):
-            d['servo16_raw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['servo16_raw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['servo16_raw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['servo16_raw'] = field_val
+        d['time_usec'] = self.time_usec
+        d['port'] = self.port
+        d['servo1_raw'] = self.servo1_raw
+        d['servo2_raw'] = self.servo2_raw
+        d['servo3_raw'] = self.servo3_raw
+        d['servo4_raw'] = self.servo4_raw
+        d['servo5_raw'] = self.servo5_raw
+        d['servo6_raw'] = self.servo6_raw
+        d['servo7_raw'] = self.servo7_raw
+        d['servo8_raw'] = self.servo8_raw
+        d['servo9_raw'] = self.servo9_raw
+        d['servo10_raw'] = self.servo10_raw
+        d['servo11_raw'] = self.servo11_raw
+        d['servo12_raw'] = self.servo12_raw
+        d['servo13_raw'] = self.servo13_raw
+        d['servo14_raw'] = self.servo14_raw
+        d['servo15_raw'] = self.servo15_raw
+        d['servo16_raw'] = self.servo16_raw
         return d
 
     @classmethod
@@ -266,313 +106,26 @@ class HakoSERVO_OUTPUT_RAW:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'time_usec'
-        if 'time_usec' in d:
-            field_type = cls.__annotations__.get('time_usec')
-            value = d['time_usec']
-            
-            if field_type is bytearray:
-                obj.time_usec = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.time_usec = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.time_usec = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.time_usec = field_type.from_dict(value)
-            else:
-                obj.time_usec = value
-        # handle field 'port'
-        if 'port' in d:
-            field_type = cls.__annotations__.get('port')
-            value = d['port']
-            
-            if field_type is bytearray:
-                obj.port = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.port = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.port = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.port = field_type.from_dict(value)
-            else:
-                obj.port = value
-        # handle field 'servo1_raw'
-        if 'servo1_raw' in d:
-            field_type = cls.__annotations__.get('servo1_raw')
-            value = d['servo1_raw']
-            
-            if field_type is bytearray:
-                obj.servo1_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo1_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo1_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo1_raw = field_type.from_dict(value)
-            else:
-                obj.servo1_raw = value
-        # handle field 'servo2_raw'
-        if 'servo2_raw' in d:
-            field_type = cls.__annotations__.get('servo2_raw')
-            value = d['servo2_raw']
-            
-            if field_type is bytearray:
-                obj.servo2_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo2_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo2_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo2_raw = field_type.from_dict(value)
-            else:
-                obj.servo2_raw = value
-        # handle field 'servo3_raw'
-        if 'servo3_raw' in d:
-            field_type = cls.__annotations__.get('servo3_raw')
-            value = d['servo3_raw']
-            
-            if field_type is bytearray:
-                obj.servo3_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo3_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo3_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo3_raw = field_type.from_dict(value)
-            else:
-                obj.servo3_raw = value
-        # handle field 'servo4_raw'
-        if 'servo4_raw' in d:
-            field_type = cls.__annotations__.get('servo4_raw')
-            value = d['servo4_raw']
-            
-            if field_type is bytearray:
-                obj.servo4_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo4_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo4_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo4_raw = field_type.from_dict(value)
-            else:
-                obj.servo4_raw = value
-        # handle field 'servo5_raw'
-        if 'servo5_raw' in d:
-            field_type = cls.__annotations__.get('servo5_raw')
-            value = d['servo5_raw']
-            
-            if field_type is bytearray:
-                obj.servo5_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo5_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo5_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo5_raw = field_type.from_dict(value)
-            else:
-                obj.servo5_raw = value
-        # handle field 'servo6_raw'
-        if 'servo6_raw' in d:
-            field_type = cls.__annotations__.get('servo6_raw')
-            value = d['servo6_raw']
-            
-            if field_type is bytearray:
-                obj.servo6_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo6_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo6_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo6_raw = field_type.from_dict(value)
-            else:
-                obj.servo6_raw = value
-        # handle field 'servo7_raw'
-        if 'servo7_raw' in d:
-            field_type = cls.__annotations__.get('servo7_raw')
-            value = d['servo7_raw']
-            
-            if field_type is bytearray:
-                obj.servo7_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo7_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo7_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo7_raw = field_type.from_dict(value)
-            else:
-                obj.servo7_raw = value
-        # handle field 'servo8_raw'
-        if 'servo8_raw' in d:
-            field_type = cls.__annotations__.get('servo8_raw')
-            value = d['servo8_raw']
-            
-            if field_type is bytearray:
-                obj.servo8_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo8_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo8_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo8_raw = field_type.from_dict(value)
-            else:
-                obj.servo8_raw = value
-        # handle field 'servo9_raw'
-        if 'servo9_raw' in d:
-            field_type = cls.__annotations__.get('servo9_raw')
-            value = d['servo9_raw']
-            
-            if field_type is bytearray:
-                obj.servo9_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo9_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo9_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo9_raw = field_type.from_dict(value)
-            else:
-                obj.servo9_raw = value
-        # handle field 'servo10_raw'
-        if 'servo10_raw' in d:
-            field_type = cls.__annotations__.get('servo10_raw')
-            value = d['servo10_raw']
-            
-            if field_type is bytearray:
-                obj.servo10_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo10_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo10_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo10_raw = field_type.from_dict(value)
-            else:
-                obj.servo10_raw = value
-        # handle field 'servo11_raw'
-        if 'servo11_raw' in d:
-            field_type = cls.__annotations__.get('servo11_raw')
-            value = d['servo11_raw']
-            
-            if field_type is bytearray:
-                obj.servo11_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo11_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo11_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo11_raw = field_type.from_dict(value)
-            else:
-                obj.servo11_raw = value
-        # handle field 'servo12_raw'
-        if 'servo12_raw' in d:
-            field_type = cls.__annotations__.get('servo12_raw')
-            value = d['servo12_raw']
-            
-            if field_type is bytearray:
-                obj.servo12_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo12_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo12_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo12_raw = field_type.from_dict(value)
-            else:
-                obj.servo12_raw = value
-        # handle field 'servo13_raw'
-        if 'servo13_raw' in d:
-            field_type = cls.__annotations__.get('servo13_raw')
-            value = d['servo13_raw']
-            
-            if field_type is bytearray:
-                obj.servo13_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo13_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo13_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo13_raw = field_type.from_dict(value)
-            else:
-                obj.servo13_raw = value
-        # handle field 'servo14_raw'
-        if 'servo14_raw' in d:
-            field_type = cls.__annotations__.get('servo14_raw')
-            value = d['servo14_raw']
-            
-            if field_type is bytearray:
-                obj.servo14_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo14_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo14_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo14_raw = field_type.from_dict(value)
-            else:
-                obj.servo14_raw = value
-        # handle field 'servo15_raw'
-        if 'servo15_raw' in d:
-            field_type = cls.__annotations__.get('servo15_raw')
-            value = d['servo15_raw']
-            
-            if field_type is bytearray:
-                obj.servo15_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo15_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo15_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo15_raw = field_type.from_dict(value)
-            else:
-                obj.servo15_raw = value
-        # handle field 'servo16_raw'
-        if 'servo16_raw' in d:
-            field_type = cls.__annotations__.get('servo16_raw')
-            value = d['servo16_raw']
-            
-            if field_type is bytearray:
-                obj.servo16_raw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.servo16_raw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.servo16_raw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.servo16_raw = field_type.from_dict(value)
-            else:
-                obj.servo16_raw = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.time_usec = d.get('time_usec', 0)
+        obj.port = d.get('port', 0)
+        obj.servo1_raw = d.get('servo1_raw', 0)
+        obj.servo2_raw = d.get('servo2_raw', 0)
+        obj.servo3_raw = d.get('servo3_raw', 0)
+        obj.servo4_raw = d.get('servo4_raw', 0)
+        obj.servo5_raw = d.get('servo5_raw', 0)
+        obj.servo6_raw = d.get('servo6_raw', 0)
+        obj.servo7_raw = d.get('servo7_raw', 0)
+        obj.servo8_raw = d.get('servo8_raw', 0)
+        obj.servo9_raw = d.get('servo9_raw', 0)
+        obj.servo10_raw = d.get('servo10_raw', 0)
+        obj.servo11_raw = d.get('servo11_raw', 0)
+        obj.servo12_raw = d.get('servo12_raw', 0)
+        obj.servo13_raw = d.get('servo13_raw', 0)
+        obj.servo14_raw = d.get('servo14_raw', 0)
+        obj.servo15_raw = d.get('servo15_raw', 0)
+        obj.servo16_raw = d.get('servo16_raw', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -1,30 +1,25 @@
 from .pdu_pytype_HakoAHRS2 import HakoAHRS2
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ffffii")  # roll, pitch, yaw, altitude, lat, lng
+
 
 def py_to_cdr_body_HakoAHRS2(writer: CdrWriter, src: HakoAHRS2):
-    writer.write_float32(src.roll)
-    writer.write_float32(src.pitch)
-    writer.write_float32(src.yaw)
-    writer.write_float32(src.altitude)
-    writer.write_int32(src.lat)
-    writer.write_int32(src.lng)
+    writer.write_run(_CDR_RUN_0, (src.roll, src.pitch, src.yaw, src.altitude, src.lat, src.lng))
 
 
 def cdr_body_to_py_HakoAHRS2(reader: CdrReader, dst: HakoAHRS2):
-    dst.roll = reader.read_float32()
-    dst.pitch = reader.read_float32()
-    dst.yaw = reader.read_float32()
-    dst.altitude = reader.read_float32()
-    dst.lat = reader.read_int32()
-    dst.lng = reader.read_int32()
+    dst.roll, dst.pitch, dst.yaw, dst.altitude, dst.lat, dst.lng = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoAHRS2(src: HakoAHRS2) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoAHRS2"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoAHRS2(writer, src)
     return writer.bytes()
@@ -1,32 +1,25 @@
 from .pdu_pytype_HakoATTITUDE import HakoATTITUDE
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("Iffffff")  # time_boot_ms, roll, pitch, yaw, rollspeed, pitchspeed, yawspeed
+
 
 def py_to_cdr_body_HakoATTITUDE(writer: CdrWriter, src: HakoATTITUDE):
-    writer.write_uint32(src.time_boot_ms)
-    writer.write_float32(src.roll)
-    writer.write_float32(src.pitch)
-    writer.write_float32(src.yaw)
-    writer.write_float32(src.rollspeed)
-    writer.write_float32(src.pitchspeed)
-    writer.write_float32(src.yawspeed)
+    writer.write_run(_CDR_RUN_0, (src.time_boot_ms, src.roll, src.pitch, src.yaw, src.rollspeed, src.pitchspeed, src.yawspeed))
 
 
 def cdr_body_to_py_HakoATTITUDE(reader: CdrReader, dst: HakoATTITUDE):
-    dst.time_boot_ms = reader.read_uint32()
-    dst.roll = reader.read_float32()
-    dst.pitch = reader.read_float32()
-    dst.yaw = reader.read_float32()
-    dst.rollspeed = reader.read_float32()
-    dst.pitchspeed = reader.read_float32()
-    dst.yawspeed = reader.read_float32()
+    dst.time_boot_ms, dst.roll, dst.pitch, dst.yaw, dst.rollspeed, dst.pitchspeed, dst.yawspeed = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoATTITUDE(src: HakoATTITUDE) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoATTITUDE"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoATTITUDE(writer, src)
     return writer.bytes()
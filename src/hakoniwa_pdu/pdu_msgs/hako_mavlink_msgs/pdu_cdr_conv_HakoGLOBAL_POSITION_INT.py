@@ -1,36 +1,25 @@
 from .pdu_pytype_HakoGLOBAL_POSITION_INT import HakoGLOBAL_POSITION_INT
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IiiiihhhH")  # time_boot_ms, lat, lon, alt, relative_alt, vx, vy, vz, hdg
+
 
 def py_to_cdr_body_HakoGLOBAL_POSITION_INT(writer: CdrWriter, src: HakoGLOBAL_POSITION_INT):
-    writer.write_uint32(src.time_boot_ms)
-    writer.write_int32(src.lat)
-    writer.write_int32(src.lon)
-    writer.write_int32(src.alt)
-    writer.write_int32(src.relative_alt)
-    writer.write_int16(src.vx)
-    writer.write_int16(src.vy)
-    writer.write_int16(src.vz)
-    writer.write_uint16(src.hdg)
+    writer.write_run(_CDR_RUN_0, (src.time_boot_ms, src.lat, src.lon, src.alt, src.relative_alt, src.vx, src.vy, src.vz, src.hdg))
 
 
 def cdr_body_to_py_HakoGLOBAL_POSITION_INT(reader: CdrReader, dst: HakoGLOBAL_POSITION_INT):
-    dst.time_boot_ms = reader.read_uint32()
-    dst.lat = reader.read_int32()
-    dst.lon = reader.read_int32()
-    dst.alt = reader.read_int32()
-    dst.relative_alt = reader.read_int32()
-    dst.vx = reader.read_int16()
-    dst.vy = reader.read_int16()
-    dst.vz = reader.read_int16()
-    dst.hdg = reader.read_uint16()
+    dst.time_boot_ms, dst.lat, dst.lon, dst.alt, dst.relative_alt, dst.vx, dst.vy, dst.vz, dst.hdg = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoGLOBAL_POSITION_INT(src: HakoGLOBAL_POSITION_INT) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoGLOBAL_POSITION_INT"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoGLOBAL_POSITION_INT(writer, src)
     return writer.bytes()
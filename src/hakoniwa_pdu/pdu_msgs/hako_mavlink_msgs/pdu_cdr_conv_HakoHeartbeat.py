@@ -1,30 +1,25 @@
 from .pdu_pytype_HakoHeartbeat import HakoHeartbeat
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("BBBIBB")  # type, autopilot, base_mode, custom_mode, system_status, mavlink_version
+
 
 def py_to_cdr_body_HakoHeartbeat(writer: CdrWriter, src: HakoHeartbeat):
-    writer.write_uint8(src.type)
-    writer.write_uint8(src.autopilot)
-    writer.write_uint8(src.base_mode)
-    writer.write_uint32(src.custom_mode)
-    writer.write_uint8(src.system_status)
-    writer.write_uint8(src.mavlink_version)
+    writer.write_run(_CDR_RUN_0, (src.type, src.autopilot, src.base_mode, src.custom_mode, src.system_status, src.mavlink_version))
 
 
 def cdr_body_to_py_HakoHeartbeat(reader: CdrReader, dst: HakoHeartbeat):
-    dst.type = reader.read_uint8()
-    dst.autopilot = reader.read_uint8()
-    dst.base_mode = reader.read_uint8()
-    dst.custom_mode = reader.read_uint32()
-    dst.system_status = reader.read_uint8()
-    dst.mavlink_version = reader.read_uint8()
+    dst.type, dst.autopilot, dst.base_mode, dst.custom_mode, dst.system_status, dst.mavlink_version = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoHeartbeat(src: HakoHeartbeat) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoHeartbeat"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoHeartbeat(writer, src)
     return writer.bytes()
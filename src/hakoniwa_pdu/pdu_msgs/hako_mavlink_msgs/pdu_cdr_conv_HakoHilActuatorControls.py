@@ -1,28 +1,29 @@
 from .pdu_pytype_HakoHilActuatorControls import HakoHilActuatorControls
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("BQ")  # mode, flags
+
 
 def py_to_cdr_body_HakoHilActuatorControls(writer: CdrWriter, src: HakoHilActuatorControls):
     writer.write_uint64(src.time_usec)
-    values = src.controls
-    for i in range(16):
-        writer.write_float32(values[i] if i < len(values) else 0.0)
-    writer.write_uint8(src.mode)
-    writer.write_uint64(src.flags)
+    writer.write_sequence("f", src.controls, 16)
+    writer.write_run(_CDR_RUN_0, (src.mode, src.flags))
 
 
 def cdr_body_to_py_HakoHilActuatorControls(reader: CdrReader, dst: HakoHilActuatorControls):
     dst.time_usec = reader.read_uint64()
-    dst.controls = [reader.read_float32() for _ in range(16)]
-    dst.mode = reader.read_uint8()
-    dst.flags = reader.read_uint64()
+    dst.controls = reader.read_sequence("f", 16)
+    dst.mode, dst.flags = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoHilActuatorControls(src: HakoHilActuatorControls) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoHilActuatorControls"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoHilActuatorControls(writer, src)
     return writer.bytes()
@@ -1,48 +1,25 @@
 from .pdu_pytype_HakoHilGps import HakoHilGps
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("QiiiHHHhhhHBBBB")  # time_usec, lat, lon, alt, eph, epv, vel, vn, ve, vd, cog, satellites_visible, id, yaw, fix_type
+
 
 def py_to_cdr_body_HakoHilGps(writer: CdrWriter, src: HakoHilGps):
-    writer.write_uint64(src.time_usec)
-    writer.write_int32(src.lat)
-    writer.write_int32(src.lon)
-    writer.write_int32(src.alt)
-    writer.write_uint16(src.eph)
-    writer.write_uint16(src.epv)
-    writer.write_uint16(src.vel)
-    writer.write_int16(src.vn)
-    writer.write_int16(src.ve)
-    writer.write_int16(src.vd)
-    writer.write_uint16(src.cog)
-    writer.write_uint8(src.satellites_visible)
-    writer.write_uint8(src.id)
-    writer.write_uint8(src.yaw)
-    writer.write_uint8(src.fix_type)
+    writer.write_run(_CDR_RUN_0, (src.time_usec, src.lat, src.lon, src.alt, src.eph, src.epv, src.vel, src.vn, src.ve, src.vd, src.cog, src.satellites_visible, src.id, src.yaw, src.fix_type))
 
 
 def cdr_body_to_py_HakoHilGps(reader: CdrReader, dst: HakoHilGps):
-    dst.time_usec = reader.read_uint64()
-    dst.lat = reader.read_int32()
-    dst.lon = reader.read_int32()
-    dst.alt = reader.read_int32()
-    dst.eph = reader.read_uint16()
-    dst.epv = reader.read_uint16()
-    dst.vel = reader.read_uint16()
-    dst.vn = reader.read_int16()
-    dst.ve = reader.read_int16()
-    dst.vd = reader.read_int16()
-    dst.cog = reader.read_uint16()
-    dst.satellites_visible = reader.read_uint8()
-    dst.id = reader.read_uint8()
-    dst.yaw = reader.read_uint8()
-    dst.fix_type = reader.read_uint8()
+    dst.time_usec, dst.lat, dst.lon, dst.alt, dst.eph, dst.epv, dst.vel, dst.vn, dst.ve, dst.vd, dst.cog, dst.satellites_visible, dst.id, dst.yaw, dst.fix_type = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoHilGps(src: HakoHilGps) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoHilGps"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoHilGps(writer, src)
     return writer.bytes()
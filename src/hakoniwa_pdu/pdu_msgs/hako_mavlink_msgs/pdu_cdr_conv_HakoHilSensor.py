@@ -1,50 +1,25 @@
 from .pdu_pytype_HakoHilSensor import HakoHilSensor
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("QfffffffffffffIB")  # time_usec, xacc, yacc, zacc, xgyro, ygyro, zgyro, xmag, ymag, zmag, abs_pressure, diff_pressure, pressure_alt, temperature, fields_updated, id
+
 
 def py_to_cdr_body_HakoHilSensor(writer: CdrWriter, src: HakoHilSensor):
-    writer.write_uint64(src.time_usec)
-    writer.write_float32(src.xacc)
-    writer.write_float32(src.yacc)
-    writer.write_float32(src.zacc)
-    writer.write_float32(src.xgyro)
-    writer.write_float32(src.ygyro)
-    writer.write_float32(src.zgyro)
-    writer.write_float32(src.xmag)
-    writer.write_float32(src.ymag)
-    writer.write_float32(src.zmag)
-    writer.write_float32(src.abs_pressure)
-    writer.write_float32(src.diff_pressure)
-    writer.write_float32(src.pressure_alt)
-    writer.write_float32(src.temperature)
-    writer.write_uint32(src.fields_updated)
-    writer.write_uint8(src.id)
+    writer.write_run(_CDR_RUN_0, (src.time_usec, src.xacc, src.yacc, src.zacc, src.xgyro, src.ygyro, src.zgyro, src.xmag, src.ymag, src.zmag, src.abs_pressure, src.diff_pressure, src.pressure_alt, src.temperature, src.fields_updated, src.id))
 
 
 def cdr_body_to_py_HakoHilSensor(reader: CdrReader, dst: HakoHilSensor):
-    dst.time_usec = reader.read_uint64()
-    dst.xacc = reader.read_float32()
-    dst.yacc = reader.read_float32()
-    dst.zacc = reader.read_float32()
-    dst.xgyro = reader.read_float32()
-    dst.ygyro = reader.read_float32()
-    dst.zgyro = reader.read_float32()
-    dst.xmag = reader.read_float32()
-    dst.ymag = reader.read_float32()
-    dst.zmag = reader.read_float32()
-    dst.abs_pressure = reader.read_float32()
-    dst.diff_pressure = reader.read_float32()
-    dst.pressure_alt = reader.read_float32()
-    dst.temperature = reader.read_float32()
-    dst.fields_updated = reader.read_uint32()
-    dst.id = reader.read_uint8()
+    dst.time_usec, dst.xacc, dst.yacc, dst.zacc, dst.xgyro, dst.ygyro, dst.zgyro, dst.xmag, dst.ymag, dst.zmag, dst.abs_pressure, dst.diff_pressure, dst.pressure_alt, dst.temperature, dst.fields_updated, dst.id = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoHilSensor(src: HakoHilSensor) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoHilSensor"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoHilSensor(writer, src)
     return writer.bytes()
@@ -1,52 +1,29 @@
 from .pdu_pytype_HakoHilStateQuaternion import HakoHilStateQuaternion
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("fffiiihhhHHhhh")  # rollspeed, pitchspeed, yawspeed, lat, lon, alt, vx, vy, vz, ind_airspeed, true_airspeed, xacc, yacc, zacc
+
 
 def py_to_cdr_body_HakoHilStateQuaternion(writer: CdrWriter, src: HakoHilStateQuaternion):
     writer.write_uint64(src.time_usec)
-    values = src.attitude_quaternion
-    for i in range(4):
-        writer.write_float32(values[i] if i < len(values) else 0.0)
-    writer.write_float32(src.rollspeed)
-    writer.write_float32(src.pitchspeed)
-    writer.write_float32(src.yawspeed)
-    writer.write_int32(src.lat)
-    writer.write_int32(src.lon)
-    writer.write_int32(src.alt)
-    writer.write_int16(src.vx)
-    writer.write_int16(src.vy)
-    writer.write_int16(src.vz)
-    writer.write_uint16(src.ind_airspeed)
-    writer.write_uint16(src.true_airspeed)
-    writer.write_int16(src.xacc)
-    writer.write_int16(src.yacc)
-    writer.write_int16(src.zacc)
+    writer.write_sequence("f", src.attitude_quaternion, 4)
+    writer.write_run(_CDR_RUN_0, (src.rollspeed, src.pitchspeed, src.yawspeed, src.lat, src.lon, src.alt, src.vx, src.vy, src.vz, src.ind_airspeed, src.true_airspeed, src.xacc, src.yacc, src.zacc))
 
 
 def cdr_body_to_py_HakoHilStateQuaternion(reader: CdrReader, dst: HakoHilStateQuaternion):
     dst.time_usec = reader.read_uint64()
-    dst.attitude_quaternion = [reader.read_float32() for _ in range(4)]
-    dst.rollspeed = reader.read_float32()
-    dst.pitchspeed = reader.read_float32()
-    dst.yawspeed = reader.read_float32()
-    dst.lat = reader.read_int32()
-    dst.lon = reader.read_int32()
-    dst.alt = reader.read_int32()
-    dst.vx = reader.read_int16()
-    dst.vy = reader.read_int16()
-    dst.vz = reader.read_int16()
-    dst.ind_airspeed = reader.read_uint16()
-    dst.true_airspeed = reader.read_uint16()
-    dst.xacc = reader.read_int16()
-    dst.yacc = reader.read_int16()
-    dst.zacc = reader.read_int16()
+    dst.attitude_quaternion = reader.read_sequence("f", 4)
+    dst.rollspeed, dst.pitchspeed, dst.yawspeed, dst.lat, dst.lon, dst.alt, dst.vx, dst.vy, dst.vz, dst.ind_airspeed, dst.true_airspeed, dst.xacc, dst.yacc, dst.zacc = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoHilStateQuaternion(src: HakoHilStateQuaternion) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoHilStateQuaternion"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoHilStateQuaternion(writer, src)
     return writer.bytes()
@@ -1,38 +1,25 @@
 from .pdu_pytype_HakoSERVO_OUTPUT_RAW import HakoSERVO_OUTPUT_RAW
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IBHHHHHHHH")  # time_usec, port, servo1_raw, servo2_raw, servo3_raw, servo4_raw, servo5_raw, servo6_raw, servo7_raw, servo8_raw
+
 
 def py_to_cdr_body_HakoSERVO_OUTPUT_RAW(writer: CdrWriter, src: HakoSERVO_OUTPUT_RAW):
-    writer.write_uint32(src.time_usec)
-    writer.write_uint8(src.port)
-    writer.write_uint16(src.servo1_raw)
-    writer.write_uint16(src.servo2_raw)
-    writer.write_uint16(src.servo3_raw)
-    writer.write_uint16(src.servo4_raw)
-    writer.write_uint16(src.servo5_raw)
-    writer.write_uint16(src.servo6_raw)
-    writer.write_uint16(src.servo7_raw)
-    writer.write_uint16(src.servo8_raw)
+    writer.write_run(_CDR_RUN_0, (src.time_usec, src.port, src.servo1_raw, src.servo2_raw, src.servo3_raw, src.servo4_raw, src.servo5_raw, src.servo6_raw, src.servo7_raw, src.servo8_raw))
 
 
 def cdr_body_to_py_HakoSERVO_OUTPUT_RAW(reader: CdrReader, dst: HakoSERVO_OUTPUT_RAW):
-    dst.time_usec = reader.read_uint32()
-    dst.port = reader.read_uint8()
-    dst.servo1_raw = reader.read_uint16()
-    dst.servo2_raw = reader.read_uint16()
-    dst.servo3_raw = reader.read_uint16()
-    dst.servo4_raw = reader.read_uint16()
-    dst.servo5_raw = reader.read_uint16()
-    dst.servo6_raw = reader.read_uint16()
-    dst.servo7_raw = reader.read_uint16()
-    dst.servo8_raw = reader.read_uint16()
+    dst.time_usec, dst.port, dst.servo1_raw, dst.servo2_raw, dst.servo3_raw, dst.servo4_raw, dst.servo5_raw, dst.servo6_raw, dst.servo7_raw, dst.servo8_raw = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoSERVO_OUTPUT_RAW(src: HakoSERVO_OUTPUT_RAW) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoSERVO_OUTPUT_RAW"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoSERVO_OUTPUT_RAW(writer, src)
     return writer.bytes()
@@ -1,22 +1,25 @@
 from .pdu_pytype_HakoSystemTime import HakoSystemTime
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("QQ")  # time_unix_usec, time_boot_ms
+
 
 def py_to_cdr_body_HakoSystemTime(writer: CdrWriter, src: HakoSystemTime):
-    writer.write_uint64(src.time_unix_usec)
-    writer.write_uint64(src.time_boot_ms)
+    writer.write_run(_CDR_RUN_0, (src.time_unix_usec, src.time_boot_ms))
 
 
 def cdr_body_to_py_HakoSystemTime(reader: CdrReader, dst: HakoSystemTime):
-    dst.time_unix_usec = reader.read_uint64()
-    dst.time_boot_ms = reader.read_uint64()
+    dst.time_unix_usec, dst.time_boot_ms = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoSystemTime(src: HakoSystemTime) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_mavlink_msgs/HakoSystemTime"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoSystemTime(writer, src)
     return writer.bytes()
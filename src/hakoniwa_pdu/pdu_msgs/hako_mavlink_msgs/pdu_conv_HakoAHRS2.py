@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ffffii")  # roll, pitch, yaw, altitude, lat, lng
 
-def pdu_to_py_HakoAHRS2(binary_data: bytearray) -> HakoAHRS2:
-    py_obj = HakoAHRS2()
+
+def pdu_to_py_HakoAHRS2(binary_data: bytearray, out: HakoAHRS2 = None, array_mode: str = None) -> HakoAHRS2:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = HakoAHRS2() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_HakoAHRS2(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,55 +31,30 @@ def binary_read_recursive_HakoAHRS2(meta: binary_io.PduMetaData, binary_data: by
     # type_name: float32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.roll = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: pitch 
     # type_name: float32 
     # offset: 4 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.pitch = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw 
     # type_name: float32 
     # offset: 8 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 4)
-    py_obj.yaw = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: altitude 
     # type_name: float32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.altitude = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lat 
     # type_name: int32 
     # offset: 16 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.lat = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lng 
@@ -81,40 +62,18 @@ def binary_read_recursive_HakoAHRS2(meta: binary_io.PduMetaData, binary_data: by
     # offset: 20 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 20, 4)
-    py_obj.lng = binary_io.binTovalue("int32", bin)
+    py_obj.roll, py_obj.pitch, py_obj.yaw, py_obj.altitude, py_obj.lat, py_obj.lng = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     return py_obj
 
 
-def py_to_pdu_HakoAHRS2(py_obj: HakoAHRS2) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_HakoAHRS2(py_obj: HakoAHRS2, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_HakoAHRS2(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_HakoAHRS2(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: HakoAHRS2):
     # array_type: single 
@@ -123,83 +82,38 @@ def binary_write_recursive_HakoAHRS2(parent_off: int, bw_container: BinaryWriter
     # type_name: float32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.roll)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: pitch 
     # type_name: float32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 4
-
-    
-    bin = binary_io.typeTobin(type, py_obj.pitch)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw 
     # type_name: float32 
     # offset: 8 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.yaw)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: altitude 
     # type_name: float32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.altitude)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lat 
     # type_name: int32 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.lat)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lng 
     # type_name: int32 
     # offset: 20 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 20
 
-    
-    bin = binary_io.typeTobin(type, py_obj.lng)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.roll, py_obj.pitch, py_obj.yaw, py_obj.altitude, py_obj.lat, py_obj.lng), expected_offset=parent_off + 0)
     
 
 if __name__ == "__main__":
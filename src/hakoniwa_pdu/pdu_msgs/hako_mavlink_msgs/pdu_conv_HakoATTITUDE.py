@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<Iffffff")  # time_boot_ms, roll, pitch, yaw, rollspeed, pitchspeed, yawspeed
 
-def pdu_to_py_HakoATTITUDE(binary_data: bytearray) -> HakoATTITUDE:
-    py_obj = HakoATTITUDE()
+
+def pdu_to_py_HakoATTITUDE(binary_data: bytearray, out: HakoATTITUDE = None, array_mode: str = None) -> HakoATTITUDE:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = HakoATTITUDE() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_HakoATTITUDE(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,66 +31,36 @@ def binary_read_recursive_HakoATTITUDE(meta: binary_io.PduMetaData, binary_data:
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.time_boot_ms = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: roll 
     # type_name: float32 
     # offset: 4 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.roll = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: pitch 
     # type_name: float32 
     # offset: 8 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 4)
-    py_obj.pitch = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw 
     # type_name: float32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.yaw = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: rollspeed 
     # type_name: float32 
     # offset: 16 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.rollspeed = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: pitchspeed 
     # type_name: float32 
     # offset: 20 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 20, 4)
-    py_obj.pitchspeed = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yawspeed 
@@ -92,40 +68,18 @@ def binary_read_recursive_HakoATTITUDE(meta: binary_io.PduMetaData, binary_data:
     # offset: 24 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 24, 4)
-    py_obj.yawspeed = binary_io.binTovalue("float32", bin)
+    py_obj.time_boot_ms, py_obj.roll, py_obj.pitch, py_obj.yaw, py_obj.rollspeed, py_obj.pitchspeed, py_obj.yawspeed = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     return py_obj
 
 
-def py_to_pdu_HakoATTITUDE(py_obj: HakoATTITUDE) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_HakoATTITUDE(py_obj: HakoATTITUDE, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_HakoATTITUDE(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_HakoATTITUDE(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: HakoATTITUDE):
     # array_type: single 
@@ -134,97 +88,44 @@ def binary_write_recursive_HakoATTITUDE(parent_off: int, bw_container: BinaryWri
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.time_boot_ms)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: roll 
     # type_name: float32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 4
-
-    
-    bin = binary_io.typeTobin(type, py_obj.roll)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: pitch 
     # type_name: float32 
     # offset: 8 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.pitch)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw 
     # type_name: float32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.yaw)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: rollspeed 
     # type_name: float32 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.rollspeed)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: pitchspeed 
     # type_name: float32 
     # offset: 20 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 20
-
-    
-    bin = binary_io.typeTobin(type, py_obj.pitchspeed)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yawspeed 
     # type_name: float32 
     # offset: 24 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 24
 
-    
-    bin = binary_io.typeTobin(type, py_obj.yawspeed)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.time_boot_ms, py_obj.roll, py_obj.pitch, py_obj.yaw, py_obj.rollspeed, py_obj.pitchspeed, py_obj.yawspeed), expected_offset=parent_off + 0)
     
 
 if __name__ == "__main__":
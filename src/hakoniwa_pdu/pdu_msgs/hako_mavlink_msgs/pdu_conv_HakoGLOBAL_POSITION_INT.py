@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<IiiiihhhH")  # time_boot_ms, lat, lon, alt, relative_alt, vx, vy, vz, hdg
 
-def pdu_to_py_HakoGLOBAL_POSITION_INT(binary_data: bytearray) -> HakoGLOBAL_POSITION_INT:
-    py_obj = HakoGLOBAL_POSITION_INT()
+
+def pdu_to_py_HakoGLOBAL_POSITION_INT(binary_data: bytearray, out: HakoGLOBAL_POSITION_INT = None, array_mode: str = None) -> HakoGLOBAL_POSITION_INT:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = HakoGLOBAL_POSITION_INT() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_HakoGLOBAL_POSITION_INT(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,88 +31,48 @@ def binary_read_recursive_HakoGLOBAL_POSITION_INT(meta: binary_io.PduMetaData, b
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.time_boot_ms = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lat 
     # type_name: int32 
     # offset: 4 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.lat = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lon 
     # type_name: int32 
     # offset: 8 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 4)
-    py_obj.lon = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: alt 
     # type_name: int32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.alt = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: relative_alt 
     # type_name: int32 
     # offset: 16 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.relative_alt = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vx 
     # type_name: int16 
     # offset: 20 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 20, 2)
-    py_obj.vx = binary_io.binTovalue("int16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vy 
     # type_name: int16 
     # offset: 22 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 22, 2)
-    py_obj.vy = binary_io.binTovalue("int16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vz 
     # type_name: int16 
     # offset: 24 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 24, 2)
-    py_obj.vz = binary_io.binTovalue("int16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: hdg 
@@ -114,40 +80,18 @@ def binary_read_recursive_HakoGLOBAL_POSITION_INT(meta: binary_io.PduMetaData, b
     # offset: 26 size: 2 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 26, 2)
-    py_obj.hdg = binary_io.binTovalue("uint16", bin)
+    py_obj.time_boot_ms, py_obj.lat, py_obj.lon, py_obj.alt, py_obj.relative_alt, py_obj.vx, py_obj.vy, py_obj.vz, py_obj.hdg = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     return py_obj
 
 
-def py_to_pdu_HakoGLOBAL_POSITION_INT(py_obj: HakoGLOBAL_POSITION_INT) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_HakoGLOBAL_POSITION_INT(py_obj: HakoGLOBAL_POSITION_INT, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_HakoGLOBAL_POSITION_INT(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_HakoGLOBAL_POSITION_INT(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: HakoGLOBAL_POSITION_INT):
     # array_type: single 
@@ -156,125 +100,56 @@ def binary_write_recursive_HakoGLOBAL_POSITION_INT(parent_off: int, bw_container
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.time_boot_ms)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lat 
     # type_name: int32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 4
-
-    
-    bin = binary_io.typeTobin(type, py_obj.lat)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lon 
     # type_name: int32 
     # offset: 8 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.lon)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: alt 
     # type_name: int32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.alt)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: relative_alt 
     # type_name: int32 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.relative_alt)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vx 
     # type_name: int16 
     # offset: 20 size: 2 
     # array_len: 1
-    type = "int16"
-    off = 20
-
-    
-    bin = binary_io.typeTobin(type, py_obj.vx)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vy 
     # type_name: int16 
     # offset: 22 size: 2 
     # array_len: 1
-    type = "int16"
-    off = 22
-
-    
-    bin = binary_io.typeTobin(type, py_obj.vy)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vz 
     # type_name: int16 
     # offset: 24 size: 2 
     # array_len: 1
-    type = "int16"
-    off = 24
-
-    
-    bin = binary_io.typeTobin(type, py_obj.vz)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: hdg 
     # type_name: uint16 
     # offset: 26 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 26
 
-    
-    bin = binary_io.typeTobin(type, py_obj.hdg)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.time_boot_ms, py_obj.lat, py_obj.lon, py_obj.alt, py_obj.relative_alt, py_obj.vx, py_obj.vy, py_obj.vz, py_obj.hdg), expected_offset=parent_off + 0)
     
 
 if __name__ == "__main__":
@@ -7,13 +7,20 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<Q")  # time_usec
+_RUN_1 = struct.Struct("<B7xQ")  # mode, flags
 
-def pdu_to_py_HakoHilActuatorControls(binary_data: bytearray) -> HakoHilActuatorControls:
-    py_obj = HakoHilActuatorControls()
+
+def pdu_to_py_HakoHilActuatorControls(binary_data: bytearray, out: HakoHilActuatorControls = None, array_mode: str = None) -> HakoHilActuatorControls:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = HakoHilActuatorControls() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_HakoHilActuatorControls(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -26,9 +33,7 @@ def binary_read_recursive_HakoHilActuatorControls(meta: binary_io.PduMetaData, b
     # offset: 0 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 8)
-    py_obj.time_usec = binary_io.binTovalue("uint64", bin)
+    py_obj.time_usec = _RUN_0.unpack_from(binary_data, base_off + 0)[0]
     
     # array_type: array 
     # data_type: primitive 
@@ -38,9 +43,7 @@ def binary_read_recursive_HakoHilActuatorControls(meta: binary_io.PduMetaData, b
     # array_len: 16
 
     
-    array_value = binary_io.readBinary(binary_data, base_off + 8, 64)
-    
-    py_obj.controls = binary_io.binToArrayValues("float32", array_value)
+    py_obj.controls = read_array_values(meta, "float32", binary_data, base_off + 8, 64)
     
     
     # array_type: single 
@@ -49,11 +52,6 @@ def binary_read_recursive_HakoHilActuatorControls(meta: binary_io.PduMetaData, b
     # type_name: uint8 
     # offset: 72 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 72, 1)
-    py_obj.mode = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: flags 
@@ -61,40 +59,18 @@ def binary_read_recursive_HakoHilActuatorControls(meta: binary_io.PduMetaData, b
     # offset: 80 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 80, 8)
-    py_obj.flags = binary_io.binTovalue("uint64", bin)
+    py_obj.mode, py_obj.flags = _RUN_1.unpack_from(binary_data, base_off + 72)
     
     return py_obj
 
 
-def py_to_pdu_HakoHilActuatorControls(py_obj: HakoHilActuatorControls) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_HakoHilActuatorControls(py_obj: HakoHilActuatorControls, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_HakoHilActuatorControls(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_HakoHilActuatorControls(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: HakoHilActuatorControls):
     # array_type: single 
@@ -103,13 +79,8 @@ def binary_write_recursive_HakoHilActuatorControls(parent_off: int, bw_container
     # type_name: uint64 
     # offset: 0 size: 8 
     # array_len: 1
-    type = "uint64"
-    off = 0
 
-    
-    bin = binary_io.typeTobin(type, py_obj.time_usec)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.time_usec), expected_offset=parent_off + 0)
     
     # array_type: array 
     # data_type: primitive 
@@ -131,27 +102,14 @@ def binary_write_recursive_HakoHilActuatorControls(parent_off: int, bw_container
     # type_name: uint8 
     # offset: 72 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 72
-
-    
-    bin = binary_io.typeTobin(type, py_obj.mode)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: flags 
     # type_name: uint64 
     # offset: 80 size: 8 
     # array_len: 1
-    type = "uint64"
-    off = 80
 
-    
-    bin = binary_io.typeTobin(type, py_obj.flags)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.mode, py_obj.flags), expected_offset=parent_off + 72)
     
 
 if __name__ == "__main__":
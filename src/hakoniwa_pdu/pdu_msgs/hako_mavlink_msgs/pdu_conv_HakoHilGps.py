@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<QiiiHHHhhhHBBBB")  # time_usec, lat, lon, alt, eph, epv, vel, vn, ve, vd, cog, satellites_visible, id, yaw, fix_type
 
-def pdu_to_py_HakoHilGps(binary_data: bytearray) -> HakoHilGps:
-    py_obj = HakoHilGps()
+
+def pdu_to_py_HakoHilGps(binary_data: bytearray, out: HakoHilGps = None, array_mode: str = None) -> HakoHilGps:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = HakoHilGps() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_HakoHilGps(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,154 +31,84 @@ def binary_read_recursive_HakoHilGps(meta: binary_io.PduMetaData, binary_data: b
     # type_name: uint64 
     # offset: 0 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 8)
-    py_obj.time_usec = binary_io.binTovalue("uint64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lat 
     # type_name: int32 
     # offset: 8 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 4)
-    py_obj.lat = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lon 
     # type_name: int32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.lon = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: alt 
     # type_name: int32 
     # offset: 16 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.alt = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: eph 
     # type_name: uint16 
     # offset: 20 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 20, 2)
-    py_obj.eph = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: epv 
     # type_name: uint16 
     # offset: 22 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 22, 2)
-    py_obj.epv = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vel 
     # type_name: uint16 
     # offset: 24 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 24, 2)
-    py_obj.vel = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vn 
     # type_name: int16 
     # offset: 26 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 26, 2)
-    py_obj.vn = binary_io.binTovalue("int16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ve 
     # type_name: int16 
     # offset: 28 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 28, 2)
-    py_obj.ve = binary_io.binTovalue("int16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vd 
     # type_name: int16 
     # offset: 30 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 30, 2)
-    py_obj.vd = binary_io.binTovalue("int16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: cog 
     # type_name: uint16 
     # offset: 32 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 32, 2)
-    py_obj.cog = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: satellites_visible 
     # type_name: uint8 
     # offset: 34 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 34, 1)
-    py_obj.satellites_visible = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: id 
     # type_name: uint8 
     # offset: 35 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 35, 1)
-    py_obj.id = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw 
     # type_name: uint8 
     # offset: 36 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 36, 1)
-    py_obj.yaw = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: fix_type 
@@ -180,40 +116,18 @@ def binary_read_recursive_HakoHilGps(meta: binary_io.PduMetaData, binary_data: b
     # offset: 37 size: 1 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 37, 1)
-    py_obj.fix_type = binary_io.binTovalue("uint8", bin)
+    py_obj.time_usec, py_obj.lat, py_obj.lon, py_obj.alt, py_obj.eph, py_obj.epv, py_obj.vel, py_obj.vn, py_obj.ve, py_obj.vd, py_obj.cog, py_obj.satellites_visible, py_obj.id, py_obj.yaw, py_obj.fix_type = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     return py_obj
 
 
-def py_to_pdu_HakoHilGps(py_obj: HakoHilGps) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_HakoHilGps(py_obj: HakoHilGps, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_HakoHilGps(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_HakoHilGps(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: HakoHilGps):
     # array_type: single 
@@ -222,209 +136,92 @@ def binary_write_recursive_HakoHilGps(parent_off: int, bw_container: BinaryWrite
     # type_name: uint64 
     # offset: 0 size: 8 
     # array_len: 1
-    type = "uint64"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.time_usec)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lat 
     # type_name: int32 
     # offset: 8 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.lat)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: lon 
     # type_name: int32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.lon)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: alt 
     # type_name: int32 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.alt)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: eph 
     # type_name: uint16 
     # offset: 20 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 20
-
-    
-    bin = binary_io.typeTobin(type, py_obj.eph)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: epv 
     # type_name: uint16 
     # offset: 22 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 22
-
-    
-    bin = binary_io.typeTobin(type, py_obj.epv)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vel 
     # type_name: uint16 
     # offset: 24 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 24
-
-    
-    bin = binary_io.typeTobin(type, py_obj.vel)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vn 
     # type_name: int16 
     # offset: 26 size: 2 
     # array_len: 1
-    type = "int16"
-    off = 26
-
-    
-    bin = binary_io.typeTobin(type, py_obj.vn)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: ve 
     # type_name: int16 
     # offset: 28 size: 2 
     # array_len: 1
-    type = "int16"
-    off = 28
-
-    
-    bin = binary_io.typeTobin(type, py_obj.ve)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: vd 
     # type_name: int16 
     # offset: 30 size: 2 
     # array_len: 1
-    type = "int16"
-    off = 30
-
-    
-    bin = binary_io.typeTobin(type, py_obj.vd)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: cog 
     # type_name: uint16 
     # offset: 32 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 32
-
-    
-    bin = binary_io.typeTobin(type, py_obj.cog)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: satellites_visible 
     # type_name: uint8 
     # offset: 34 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 34
-
-    
-    bin = binary_io.typeTobin(type, py_obj.satellites_visible)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: id 
     # type_name: uint8 
     # offset: 35 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 35
-
-    
-    bin = binary_io.typeTobin(type, py_obj.id)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw 
     # type_name: uint8 
     # offset: 36 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 36
-
-    
-    bin = binary_io.typeTobin(type, py_obj.yaw)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: fix_type 
     # type_name: uint8 
     # offset: 37 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 37
 
-    
-    bin = binary_io.typeTobin(type, py_obj.fix_type)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.time_usec, py_obj.lat, py_obj.lon, py_obj.alt, py_obj.eph, py_obj.epv, py_obj.vel, py_obj.vn, py_obj.ve, py_obj.vd, py_obj.cog, py_obj.satellites_visible, py_obj.id, py_obj.yaw, py_obj.fix_type), expected_offset=parent_off + 0)
     
 
 if __name__ == "__main__":
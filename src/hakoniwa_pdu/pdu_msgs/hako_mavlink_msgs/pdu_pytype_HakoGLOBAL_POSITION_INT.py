@@ -10,6 +10,8 @@ class HakoGLOBAL_POSITION_INT:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("time_boot_ms", "lat", "lon", "alt", "relative_alt", "vx", "vy", "vz", "hdg")
+
     time_boot_ms: int
     lat: int
     lon: int
@@ -52,96 +54,15 @@ class HakoGLOBAL_POSITION_INT:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'time_boot_ms'
-        field_val = self.time_boot_ms
-        if isinstance(field_val, bytearray):
-            d['time_boot_ms'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['time_boot_ms'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['time_boot_ms'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['time_boot_ms'] = field_val
-        # handle field 'lat'
-        field_val = self.lat
-        if isinstance(field_val, bytearray):
-            d['lat'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['lat'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['lat'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['lat'] = field_val
-        # handle field 'lon'
-        field_val = self.lon
-        if isinstance(field_val, bytearray):
-            d['lon'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['lon'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['lon'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['lon'] = field_val
-        # handle field 'alt'
-        field_val = self.alt
-        if isinstance(field_val, bytearray):
-            d['alt'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['alt'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['alt'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['alt'] = field_val
-        # handle field 'relative_alt'
-        field_val = self.relative_alt
-        if isinstance(field_val, bytearray):
-            d['relative_alt'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['relative_alt'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['relative_alt'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['relative_alt'] = field_val
-        # handle field 'vx'
-        field_val = self.vx
-        if isinstance(field_val, bytearray):
-            d['vx'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['vx'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['vx'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['vx'] = field_val
-        # handle field 'vy'
-        field_val = self.vy
-        if isinstance(field_val, bytearray):
-            d['vy'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['vy'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['vy'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['vy'] = field_val
-        # handle field 'vz'
-        field_val = self.vz
-        if isinstance(field_val, bytearray):
-            d['vz'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['vz'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['vz'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['vz'] = field_val
-        # handle field 'hdg'
-        field_val = self.hdg
-        if isinstance(field_val, bytearray):
-            d['hdg'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['hdg'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['hdg'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['hdg'] = field_val
+        d['time_boot_ms'] = self.time_boot_ms
+        d['lat'] = self.lat
+        d['lon'] = self.lon
+        d['alt'] = self.alt
+        d['relative_alt'] = self.relative_alt
+        d['vx'] = self.vx
+        d['vy'] = self.vy
+        d['vz'] = self.vz
+        d['hdg'] = self.hdg
         return d
 
     @classmethod
@@ -149,160 +70,17 @@ class HakoGLOBAL_POSITION_INT:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'time_boot_ms'
-        if 'time_boot_ms' in d:
-            field_type = cls.__annotations__.get('time_boot_ms')
-            value = d['time_boot_ms']
-            
-            if field_type is bytearray:
-                obj.time_boot_ms = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.time_boot_ms = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.time_boot_ms = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.time_boot_ms = field_type.from_dict(value)
-            else:
-                obj.time_boot_ms = value
-        # handle field 'lat'
-        if 'lat' in d:
-            field_type = cls.__annotations__.get('lat')
-            value = d['lat']
-            
-            if field_type is bytearray:
-                obj.lat = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.lat = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.lat = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.lat = field_type.from_dict(value)
-            else:
-                obj.lat = value
-        # handle field 'lon'
-        if 'lon' in d:
-            field_type = cls.__annotations__.get('lon')
-            value = d['lon']
-            
-            if field_type is bytearray:
-                obj.lon = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.lon = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.lon = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.lon = field_type.from_dict(value)
-            else:
-                obj.lon = value
-        # handle field 'alt'
-        if 'alt' in d:
-            field_type = cls.__annotations__.get('alt')
-            value = d['alt']
-            
-            if field_type is bytearray:
-                obj.alt = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.alt = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.alt = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.alt = field_type.from_dict(value)
-            else:
-                obj.alt = value
-        # handle field 'relative_alt'
-        if 'relative_alt' in d:
-            field_type = cls.__annotations__.get('relative_alt')
-            value = d['relative_alt']
-            
-            if field_type is bytearray:
-                obj.relative_alt = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.relative_alt = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.relative_alt = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.relative_alt = field_type.from_dict(value)
-            else:
-                obj.relative_alt = value
-        # handle field 'vx'
-        if 'vx' in d:
-            field_type = cls.__annotations__.get('vx')
-            value = d['vx']
-            
-            if field_type is bytearray:
-                obj.vx = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.vx = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.vx = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.vx = field_type.from_dict(value)
-            else:
-                obj.vx = value
-        # handle field 'vy'
-        if 'vy' in d:
-            field_type = cls.__annotations__.get('vy')
-            value = d['vy']
-            
-            if field_type is bytearray:
-                obj.vy = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.vy = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.vy = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.vy = field_type.from_dict(value)
-            else:
-                obj.vy = value
-        # handle field 'vz'
-        if 'vz' in d:
-            field_type = cls.__annotations__.get('vz')
-            value = d['vz']
-            
-            if field_type is bytearray:
-                obj.vz = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.vz = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.vz = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.vz = field_type.from_dict(value)
-            else:
-                obj.vz = value
-        # handle field 'hdg'
-        if 'hdg' in d:
-            field_type = cls.__annotations__.get('hdg')
-            value = d['hdg']
-            
-            if field_type is bytearray:
-                obj.hdg = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.hdg = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.hdg = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.hdg = field_type.from_dict(value)
-            else:
-                obj.hdg = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.time_boot_ms = d.get('time_boot_ms', 0)
+        obj.lat = d.get('lat', 0)
+        obj.lon = d.get('lon', 0)
+        obj.alt = d.get('alt', 0)
+        obj.relative_alt = d.get('relative_alt', 0)
+        obj.vx = d.get('vx', 0)
+        obj.vy = d.get('vy', 0)
+        obj.vz = d.get('vz', 0)
+        obj.hdg = d.get('hdg', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class HakoHeartbeat:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("type", "autopilot", "base_mode", "custom_mode", "system_status", "mavlink_version")
+
     type: int
     autopilot: int
     base_mode: int
@@ -43,66 +45,12 @@ class HakoHeartbeat:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'type'
-        field_val = self.type
-        if isinstance(field_val, bytearray):
-            d['type'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['type'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['type'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['type'] = field_val
-        # handle field 'autopilot'
-        field_val = self.autopilot
-        if isinstance(field_val, bytearray):
-            d['autopilot'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['autopilot'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['autopilot'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['autopilot'] = field_val
-        # handle field 'base_mode'
-        field_val = self.base_mode
-        if isinstance(field_val, bytearray):
-            d['base_mode'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['base_mode'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['base_mode'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['base_mode'] = field_val
-        # handle field 'custom_mode'
-        field_val = self.custom_mode
-        if isinstance(field_val, bytearray):
-            d['custom_mode'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['custom_mode'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['custom_mode'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['custom_mode'] = field_val
-        # handle field 'system_status'
-        field_val = self.system_status
-        if isinstance(field_val, bytearray):
-            d['system_status'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['system_status'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['system_status'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['system_status'] = field_val
-        # handle field 'mavlink_version'
-        field_val = self.mavlink_version
-        if isinstance(field_val, bytearray):
-            d['mavlink_version'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['mavlink_version'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['mavlink_version'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['mavlink_version'] = field_val
+        d['type'] = self.type
+        d['autopilot'] = self.autopilot
+        d['base_mode'] = self.base_mode
+        d['custom_mode'] = self.custom_mode
+        d['system_status'] = self.system_status
+        d['mavlink_version'] = self.mavlink_version
         return d
 
     @classmethod
@@ -110,109 +58,14 @@ class HakoHeartbeat:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'type'
-        if 'type' in d:
-            field_type = cls.__annotations__.get('type')
-            value = d['type']
-            
-            if field_type is bytearray:
-                obj.type = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.type = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.type = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.type = field_type.from_dict(value)
-            else:
-                obj.type = value
-        # handle field 'autopilot'
-        if 'autopilot' in d:
-            field_type = cls.__annotations__.get('autopilot')
-            value = d['autopilot']
-            
-            if field_type is bytearray:
-                obj.autopilot = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.autopilot = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.autopilot = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.autopilot = field_type.from_dict(value)
-            else:
-                obj.autopilot = value
-        # handle field 'base_mode'
-        if 'base_mode' in d:
-            field_type = cls.__annotations__.get('base_mode')
-            value = d['base_mode']
-            
-            if field_type is bytearray:
-                obj.base_mode = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.base_mode = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.base_mode = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.base_mode = field_type.from_dict(value)
-            else:
-                obj.base_mode = value
-        # handle field 'custom_mode'
-        if 'custom_mode' in d:
-            field_type = cls.__annotations__.get('custom_mode')
-            value = d['custom_mode']
-            
-            if field_type is bytearray:
-                obj.custom_mode = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.custom_mode = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.custom_mode = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.custom_mode = field_type.from_dict(value)
-            else:
-                obj.custom_mode = value
-        # handle field 'system_status'
-        if 'system_status' in d:
-            field_type = cls.__annotations__.get('system_status')
-            value = d['system_status']
-            
-            if field_type is bytearray:
-                obj.system_status = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.system_status = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.system_status = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.system_status = field_type.from_dict(value)
-            else:
-                obj.system_status = value
-        # handle field 'mavlink_version'
-        if 'mavlink_version' in d:
-            field_type = cls.__annotations__.get('mavlink_version')
-            value = d['mavlink_version']
-            
-            if field_type is bytearray:
-                obj.mavlink_version = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.mavlink_version = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.mavlink_version = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.mavlink_version = field_type.from_dict(value)
-            else:
-                obj.mavlink_version = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.type = d.get('type', 0)
+        obj.autopilot = d.get('autopilot', 0)
+        obj.base_mode = d.get('base_mode', 0)
+        obj.custom_mode = d.get('custom_mode', 0)
+        obj.system_status = d.get('system_status', 0)
+        obj.mavlink_version = d.get('mavlink_version', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class HakoHilActuatorControls:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("time_usec", "controls", "mode", "flags")
+
     time_usec: int
     controls: List[float]
     mode: int
@@ -37,46 +39,11 @@ class HakoHilActuatorControls:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'time_usec'
-        field_val = self.time_usec
-        if isinstance(field_val, bytearray):
-            d['time_usec'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['time_usec'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['time_usec'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['time_usec'] = field_val
-        # handle field 'controls'
+        d['time_usec'] = self.time_usec
         field_val = self.controls
-        if isinstance(field_val, bytearray):
-            d['controls'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['controls'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['controls'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['controls'] = field_val
-        # handle field 'mode'
-        field_val = self.mode
-        if isinstance(field_val, bytearray):
-            d['mode'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['mode'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['mode'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['mode'] = field_val
-        # handle field 'flags'
-        field_val = self.flags
-        if isinstance(field_val, bytearray):
-            d['flags'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['flags'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['flags'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['flags'] = field_val
+        d['controls'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['mode'] = self.mode
+        d['flags'] = self.flags
         return d
 
     @classmethod
@@ -84,75 +51,12 @@ class HakoHilActuatorControls:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'time_usec'
-        if 'time_usec' in d:
-            field_type = cls.__annotations__.get('time_usec')
-            value = d['time_usec']
-            
-            if field_type is bytearray:
-                obj.time_usec = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.time_usec = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.time_usec = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.time_usec = field_type.from_dict(value)
-            else:
-                obj.time_usec = value
-        # handle field 'controls'
-        if 'controls' in d:
-            field_type = cls.__annotations__.get('controls')
-            value = d['controls']
-            
-            if field_type is bytearray:
-                obj.controls = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.controls = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.controls = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.controls = field_type.from_dict(value)
-            else:
-                obj.controls = value
-        # handle field 'mode'
-        if 'mode' in d:
-            field_type = cls.__annotations__.get('mode')
-            value = d['mode']
-            
-            if field_type is bytearray:
-                obj.mode = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.mode = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.mode = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.mode = field_type.from_dict(value)
-            else:
-                obj.mode = value
-        # handle field 'flags'
-        if 'flags' in d:
-            field_type = cls.__annotations__.get('flags')
-            value = d['flags']
-            
-            if field_type is bytearray:
-                obj.flags = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.flags = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.flags = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.flags = field_type.from_dict(value)
-            else:
-                obj.flags = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.time_usec = d.get('time_usec', 0)
+        obj.controls = d.get('controls', [])
+        obj.mode = d.get('mode', 0)
+        obj.flags = d.get('flags', 0)
         return obj
 
     def to_json(self, indent=2):
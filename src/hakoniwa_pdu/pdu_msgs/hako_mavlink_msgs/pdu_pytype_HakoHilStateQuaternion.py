@@ -10,6 +10,8 @@ class HakoHilStateQuaternion:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("time_usec", "attitude_quaternion", "rollspeed", "pitchspeed", "yawspeed", "lat", "lon", "alt", "vx", "vy", "vz", "ind_airspeed", "true_airspeed", "xacc", "yacc", "zacc")
+
     time_usec: int
     attitude_quaternion: List[float]
     rollspeed: float
@@ -73,166 +75,23 @@ class HakoHilStateQuaternion:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'time_usec'
-        field_val = self.time_usec
-        if isinstance(field_val, bytearray):
-            d['time_usec'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['time_usec'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['time_usec'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['time_usec'] = field_val
-        # handle field 'attitude_quaternion'
+        d['time_usec'] = self.time_usec
         field_val = self.attitude_quaternion
-        if isinstance(field_val, bytearray):
-            d['attitude_quaternion'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['attitude_quaternion'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['attitude_quaternion'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['attitude_quaternion'] = field_val
-        # handle field 'rollspeed'
-        field_val = self.rollspeed
-        if isinstance(field_val, bytearray):
-            d['rollspeed'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['rollspeed'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['rollspeed'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['rollspeed'] = field_val
-        # handle field 'pitchspeed'
-        field_val = self.pitchspeed
-        if isinstance(field_val, bytearray):
-            d['pitchspeed'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['pitchspeed'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['pitchspeed'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['pitchspeed'] = field_val
-        # handle field 'yawspeed'
-        field_val = self.yawspeed
-        if isinstance(field_val, bytearray):
-            d['yawspeed'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['yawspeed'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['yawspeed'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['yawspeed'] = field_val
-        # handle field 'lat'
-        field_val = self.lat
-        if isinstance(field_val, bytearray):
-            d['lat'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['lat'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['lat'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['lat'] = field_val
-        # handle field 'lon'
-        field_val = self.lon
-        if isinstance(field_val, bytearray):
-            d['lon'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['lon'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['lon'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['lon'] = field_val
-        # handle field 'alt'
-        field_val = self.alt
-        if isinstance(field_val, bytearray):
-            d['alt'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['alt'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['alt'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['alt'] = field_val
-        # handle field 'vx'
-        field_val = self.vx
-        if isinstance(field_val, bytearray):
-            d['vx'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['vx'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['vx'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['vx'] = field_val
-        # handle field 'vy'
-        field_val = self.vy
-        if isinstance(field_val, bytearray):
-            d['vy'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['vy'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['vy'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['vy'] = field_val
-        # handle field 'vz'
-        field_val = self.vz
-        if isinstance(field_val, bytearray):
-            d['vz'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['vz'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['vz'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['vz'] = field_val
-        # handle field 'ind_airspeed'
-        field_val = self.ind_airspeed
-        if isinstance(field_val, bytearray):
-            d['ind_airspeed'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['ind_airspeed'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['ind_airspeed'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['ind_airspeed'] = field_val
-        # handle field 'true_airspeed'
-        field_val = self.true_airspeed
-        if isinstance(field_val, bytearray):
-            d['true_airspeed'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['true_airspeed'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['true_airspeed'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['true_airspeed'] = field_val
-        # handle field 'xacc'
-        field_val = self.xacc
-        if isinstance(field_val, bytearray):
-            d['xacc'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['xacc'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['xacc'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['xacc'] = field_val
-        # handle field 'yacc'
-        field_val = self.yacc
-        if isinstance(field_val, bytearray):
-            d['yacc'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['yacc'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['yacc'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['yacc'] = field_val
-        # handle field 'zacc'
-        field_val = self.zacc
-        if isinstance(field_val, bytearray):
-            d['zacc'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['zacc'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['zacc'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['zacc'] = field_val
+        d['attitude_quaternion'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['rollspeed'] = self.rollspeed
+        d['pitchspeed'] = self.pitchspeed
+        d['yawspeed'] = self.yawspeed
+        d['lat'] = self.lat
+        d['lon'] = self.lon
+        d['alt'] = self.alt
+        d['vx'] = self.vx
+        d['vy'] = self.vy
+        d['vz'] = self.vz
+        d['ind_airspeed'] = self.ind_airspeed
+        d['true_airspeed'] = self.true_airspeed
+        d['xacc'] = self.xacc
+        d['yacc'] = self.yacc
+        d['zacc'] = self.zacc
         return d
 
     @classmethod
@@ -240,279 +99,24 @@ class HakoHilStateQuaternion:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'time_usec'
-        if 'time_usec' in d:
-            field_type = cls.__annotations__.get('time_usec')
-            value = d['time_usec']
-            
-            if field_type is bytearray:
-                obj.time_usec = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.time_usec = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.time_usec = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.time_usec = field_type.from_dict(value)
-            else:
-                obj.time_usec = value
-        # handle field 'attitude_quaternion'
-        if 'attitude_quaternion' in d:
-            field_type = cls.__annotations__.get('attitude_quaternion')
-            value = d['attitude_quaternion']
-            
-            if field_type is bytearray:
-                obj.attitude_quaternion = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.attitude_quaternion = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.attitude_quaternion = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.attitude_quaternion = field_type.from_dict(value)
-            else:
-                obj.attitude_quaternion = value
-        # handle field 'rollspeed'
-        if 'rollspeed' in d:
-            field_type = cls.__annotations__.get('rollspeed')
-            value = d['rollspeed']
-            
-            if field_type is bytearray:
-                obj.rollspeed = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.rollspeed = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.rollspeed = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.rollspeed = field_type.from_dict(value)
-            else:
-                obj.rollspeed = value
-        # handle field 'pitchspeed'
-        if 'pitchspeed' in d:
-            field_type = cls.__annotations__.get('pitchspeed')
-            value = d['pitchspeed']
-            
-            if field_type is bytearray:
-                obj.pitchspeed = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.pitchspeed = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.pitchspeed = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.pitchspeed = field_type.from_dict(value)
-            else:
-                obj.pitchspeed = value
-        # handle field 'yawspeed'
-        if 'yawspeed' in d:
-            field_type = cls.__annotations__.get('yawspeed')
-            value = d['yawspeed']
-            
-            if field_type is bytearray:
-                obj.yawspeed = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.yawspeed = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.yawspeed = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.yawspeed = field_type.from_dict(value)
-            else:
-                obj.yawspeed = value
-        # handle field 'lat'
-        if 'lat' in d:
-            field_type = cls.__annotations__.get('lat')
-            value = d['lat']
-            
-            if field_type is bytearray:
-                obj.lat = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.lat = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.lat = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.lat = field_type.from_dict(value)
-            else:
-                obj.lat = value
-        # handle field 'lon'
-        if 'lon' in d:
-            field_type = cls.__annotations__.get('lon')
-            value = d['lon']
-            
-            if field_type is bytearray:
-                obj.lon = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.lon = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.lon = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.lon = field_type.from_dict(value)
-            else:
-                obj.lon = value
-        # handle field 'alt'
-        if 'alt' in d:
-            field_type = cls.__annotations__.get('alt')
-            value = d['alt']
-            
-            if field_type is bytearray:
-                obj.alt = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.alt = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.alt = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.alt = field_type.from_dict(value)
-            else:
-                obj.alt = value
-        # handle field 'vx'
-        if 'vx' in d:
-            field_type = cls.__annotations__.get('vx')
-            value = d['vx']
-            
-            if field_type is bytearray:
-                obj.vx = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.vx = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.vx = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.vx = field_type.from_dict(value)
-            else:
-                obj.vx = value
-        # handle field 'vy'
-        if 'vy' in d:
-            field_type = cls.__annotations__.get('vy')
-            value = d['vy']
-            
-            if field_type is bytearray:
-                obj.vy = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.vy = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.vy = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.vy = field_type.from_dict(value)
-            else:
-                obj.vy = value
-        # handle field 'vz'
-        if 'vz' in d:
-            field_type = cls.__annotations__.get('vz')
-            value = d['vz']
-            
-            if field_type is bytearray:
-                obj.vz = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.vz = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.vz = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.vz = field_type.from_dict(value)
-            else:
-                obj.vz = value
-        # handle field 'ind_airspeed'
-        if 'ind_airspeed' in d:
-            field_type = cls.__annotations__.get('ind_airspeed')
-            value = d['ind_airspeed']
-            
-            if field_type is bytearray:
-                obj.ind_airspeed = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.ind_airspeed = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.ind_airspeed = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.ind_airspeed = field_type.from_dict(value)
-            else:
-                obj.ind_airspeed = value
-        # handle field 'true_airspeed'
-        if 'true_airspeed' in d:
-            field_type = cls.__annotations__.get('true_airspeed')
-            value = d['true_airspeed']
-            
-            if field_type is bytearray:
-                obj.true_airspeed = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.true_airspeed = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.true_airspeed = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.true_airspeed = field_type.from_dict(value)
-            else:
-                obj.true_airspeed = value
-        # handle field 'xacc'
-        if 'xacc' in d:
-            field_type = cls.__annotations__.get('xacc')
-            value = d['xacc']
-            
-            if field_type is bytearray:
-                obj.xacc = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.xacc = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.xacc = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.xacc = field_type.from_dict(value)
-            else:
-                obj.xacc = value
-        # handle field 'yacc'
-        if 'yacc' in d:
-            field_type = cls.__annotations__.get('yacc')
-            value = d['yacc']
-            
-            if field_type is bytearray:
-                obj.yacc = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.yacc = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.yacc = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.yacc = field_type.from_dict(value)
-            else:
-                obj.yacc = value
-        # handle field 'zacc'
-        if 'zacc' in d:
-            field_type = cls.__annotations__.get('zacc')
-            value = d['zacc']
-            
-            if field_type is bytearray:
-                obj.zacc = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.zacc = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.zacc = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.zacc = field_type.from_dict(value)
-            else:
-                obj.zacc = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.time_usec = d.get('time_usec', 0)
+        obj.attitude_quaternion = d.get('attitude_quaternion', [])
+        obj.rollspeed = d.get('rollspeed', 0.0)
+        obj.pitchspeed = d.get('pitchspeed', 0.0)
+        obj.yawspeed = d.get('yawspeed', 0.0)
+        obj.lat = d.get('lat', 0)
+        obj.lon = d.get('lon', 0)
+        obj.alt = d.get('alt', 0)
+        obj.vx = d.get('vx', 0)
+        obj.vy = d.get('vy', 0)
+        obj.vz = d.get('vz', 0)
+        obj.ind_airspeed = d.get('ind_airspeed', 0)
+        obj.true_airspeed = d.get('true_airspeed', 0)
+        obj.xacc = d.get('xacc', 0)
+        obj.yacc = d.get('yacc', 0)
+        obj.zacc = d.get('zacc', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class HakoSystemTime:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("time_unix_usec", "time_boot_ms")
+
     time_unix_usec: int
     time_boot_ms: int
 
@@ -31,26 +33,8 @@ class HakoSystemTime:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'time_unix_usec'
-        field_val = self.time_unix_usec
-        if isinstance(field_val, bytearray):
-            d['time_unix_usec'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['time_unix_usec'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['time_unix_usec'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['time_unix_usec'] = field_val
-        # handle field 'time_boot_ms'
-        field_val = self.time_boot_ms
-        if isinstance(field_val, bytearray):
-            d['time_boot_ms'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['time_boot_ms'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['time_boot_ms'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['time_boot_ms'] = field_val
+        d['time_unix_usec'] = self.time_unix_usec
+        d['time_boot_ms'] = self.time_boot_ms
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class HakoSystemTime:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'time_unix_usec'
-        if 'time_unix_usec' in d:
-            field_type = cls.__annotations__.get('time_unix_usec')
-            value = d['time_unix_usec']
-            
-            if field_type is bytearray:
-                obj.time_unix_usec = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.time_unix_usec = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.time_unix_usec = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.time_unix_usec = field_type.from_dict(value)
-            else:
-                obj.time_unix_usec = value
-        # handle field 'time_boot_ms'
-        if 'time_boot_ms' in d:
-            field_type = cls.__annotations__.get('time_boot_ms')
-            value = d['time_boot_ms']
-            
-            if field_type is bytearray:
-                obj.time_boot_ms = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.time_boot_ms = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.time_boot_ms = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.time_boot_ms = field_type.from_dict(value)
-            else:
-                obj.time_boot_ms = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.time_unix_usec = d.get('time_unix_usec', 0)
+        obj.time_boot_ms = d.get('time_boot_ms', 0)
         return obj
 
     def to_json(self, indent=2):
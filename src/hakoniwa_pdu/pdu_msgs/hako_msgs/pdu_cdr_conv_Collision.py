@@ -1,15 +1,17 @@
 from .pdu_pytype_Collision import Collision
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Point import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("?Iddd")  # collision, contact_num, relative_velocity.x, relative_velocity.y, relative_velocity.z
+
 
 def py_to_cdr_body_Collision(writer: CdrWriter, src: Collision):
-    writer.write_bool(src.collision)
-    writer.write_uint32(src.contact_num)
-    py_to_cdr_body_Vector3(writer, src.relative_velocity)
+    writer.write_run(_CDR_RUN_0, (src.collision, src.contact_num, src.relative_velocity.x, src.relative_velocity.y, src.relative_velocity.z))
     values = src.contact_position
     for i in range(10):
         py_to_cdr_body_Point(writer, values[i] if i < len(values) else Point())
@@ -17,9 +19,7 @@ def py_to_cdr_body_Collision(writer: CdrWriter, src: Collision):
 
 
 def cdr_body_to_py_Collision(reader: CdrReader, dst: Collision):
-    dst.collision = reader.read_bool()
-    dst.contact_num = reader.read_uint32()
-    cdr_body_to_py_Vector3(reader, dst.relative_velocity)
+    dst.collision, dst.contact_num, dst.relative_velocity.x, dst.relative_velocity.y, dst.relative_velocity.z = reader.read_run(_CDR_RUN_0)
     dst.contact_position = []
     for _ in range(10):
         elem = Point()
@@ -30,7 +30,8 @@ def cdr_body_to_py_Collision(reader: CdrReader, dst: Collision):
 
 
 def py_to_cdr_Collision(src: Collision) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/Collision"])
     writer.write_encapsulation()
     py_to_cdr_body_Collision(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_Disturbance import Disturbance
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_msgs.pdu_cdr_conv_DisturbanceAtm import *
 from ..hako_msgs.pdu_cdr_conv_DisturbanceBoundary import *
@@ -10,22 +11,19 @@ from ..geometry_msgs.pdu_cdr_conv_Point import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddddddddddd")  # d_temp.value, d_wind.value.x, d_wind.value.y, d_wind.value.z, d_atm.sea_level_atm, d_boundary.boundary_point.x, d_boundary.boundary_point.y, d_boundary.boundary_point.z, d_boundary.boundary_normal.x, d_boundary.boundary_normal.y, d_boundary.boundary_normal.z
+
 
 def py_to_cdr_body_Disturbance(writer: CdrWriter, src: Disturbance):
-    py_to_cdr_body_DisturbanceTemperature(writer, src.d_temp)
-    py_to_cdr_body_DisturbanceWind(writer, src.d_wind)
-    py_to_cdr_body_DisturbanceAtm(writer, src.d_atm)
-    py_to_cdr_body_DisturbanceBoundary(writer, src.d_boundary)
+    writer.write_run(_CDR_RUN_0, (src.d_temp.value, src.d_wind.value.x, src.d_wind.value.y, src.d_wind.value.z, src.d_atm.sea_level_atm, src.d_boundary.boundary_point.x, src.d_boundary.boundary_point.y, src.d_boundary.boundary_point.z, src.d_boundary.boundary_normal.x, src.d_boundary.boundary_normal.y, src.d_boundary.boundary_normal.z))
     writer.write_sequence_length(src.d_user_custom)
     for elem in src.d_user_custom:
         py_to_cdr_body_DisturbanceUserCustom(writer, elem)
 
 
 def cdr_body_to_py_Disturbance(reader: CdrReader, dst: Disturbance):
-    cdr_body_to_py_DisturbanceTemperature(reader, dst.d_temp)
-    cdr_body_to_py_DisturbanceWind(reader, dst.d_wind)
-    cdr_body_to_py_DisturbanceAtm(reader, dst.d_atm)
-    cdr_body_to_py_DisturbanceBoundary(reader, dst.d_boundary)
+    dst.d_temp.value, dst.d_wind.value.x, dst.d_wind.value.y, dst.d_wind.value.z, dst.d_atm.sea_level_atm, dst.d_boundary.boundary_point.x, dst.d_boundary.boundary_point.y, dst.d_boundary.boundary_point.z, dst.d_boundary.boundary_normal.x, dst.d_boundary.boundary_normal.y, dst.d_boundary.boundary_normal.z = reader.read_run(_CDR_RUN_0)
     dst.d_user_custom = []
     for _ in range(reader.read_uint32()):
         elem = DisturbanceUserCustom()
@@ -35,7 +33,8 @@ def cdr_body_to_py_Disturbance(reader: CdrReader, dst: Disturbance):
 
 
 def py_to_cdr_Disturbance(src: Disturbance) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/Disturbance"])
     writer.write_encapsulation()
     py_to_cdr_body_Disturbance(writer, src)
     return writer.bytes()
@@ -1,24 +1,27 @@
 from .pdu_pytype_DisturbanceBoundary import DisturbanceBoundary
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Point import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddddd")  # boundary_point.x, boundary_point.y, boundary_point.z, boundary_normal.x, boundary_normal.y, boundary_normal.z
+
 
 def py_to_cdr_body_DisturbanceBoundary(writer: CdrWriter, src: DisturbanceBoundary):
-    py_to_cdr_body_Point(writer, src.boundary_point)
-    py_to_cdr_body_Vector3(writer, src.boundary_normal)
+    writer.write_run(_CDR_RUN_0, (src.boundary_point.x, src.boundary_point.y, src.boundary_point.z, src.boundary_normal.x, src.boundary_normal.y, src.boundary_normal.z))
 
 
 def cdr_body_to_py_DisturbanceBoundary(reader: CdrReader, dst: DisturbanceBoundary):
-    cdr_body_to_py_Point(reader, dst.boundary_point)
-    cdr_body_to_py_Vector3(reader, dst.boundary_normal)
+    dst.boundary_point.x, dst.boundary_point.y, dst.boundary_point.z, dst.boundary_normal.x, dst.boundary_normal.y, dst.boundary_normal.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_DisturbanceBoundary(src: DisturbanceBoundary) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/DisturbanceBoundary"])
     writer.write_encapsulation()
     py_to_cdr_body_DisturbanceBoundary(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_DisturbanceTemperature import DisturbanceTemperature
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_DisturbanceTemperature(reader: CdrReader, dst: DisturbanceTem
 
 
 def py_to_cdr_DisturbanceTemperature(src: DisturbanceTemperature) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/DisturbanceTemperature"])
     writer.write_encapsulation()
     py_to_cdr_body_DisturbanceTemperature(writer, src)
     return writer.bytes()
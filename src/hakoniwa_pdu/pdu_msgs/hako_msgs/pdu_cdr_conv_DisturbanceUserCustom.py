@@ -1,22 +1,23 @@
 from .pdu_pytype_DisturbanceUserCustom import DisturbanceUserCustom
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
 
 def py_to_cdr_body_DisturbanceUserCustom(writer: CdrWriter, src: DisturbanceUserCustom):
     writer.write_sequence_length(src.data)
-    for elem in src.data:
-        writer.write_float64(elem)
+    writer.write_sequence("d", src.data)
 
 
 def cdr_body_to_py_DisturbanceUserCustom(reader: CdrReader, dst: DisturbanceUserCustom):
-    dst.data = [reader.read_float64() for _ in range(reader.read_uint32())]
+    dst.data = reader.read_sequence("d", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_DisturbanceUserCustom(src: DisturbanceUserCustom) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/DisturbanceUserCustom"])
     writer.write_encapsulation()
     py_to_cdr_body_DisturbanceUserCustom(writer, src)
     return writer.bytes()
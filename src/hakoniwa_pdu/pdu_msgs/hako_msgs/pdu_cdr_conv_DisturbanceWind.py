@@ -1,21 +1,26 @@
 from .pdu_pytype_DisturbanceWind import DisturbanceWind
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddd")  # value.x, value.y, value.z
+
 
 def py_to_cdr_body_DisturbanceWind(writer: CdrWriter, src: DisturbanceWind):
-    py_to_cdr_body_Vector3(writer, src.value)
+    writer.write_run(_CDR_RUN_0, (src.value.x, src.value.y, src.value.z))
 
 
 def cdr_body_to_py_DisturbanceWind(reader: CdrReader, dst: DisturbanceWind):
-    cdr_body_to_py_Vector3(reader, dst.value)
+    dst.value.x, dst.value.y, dst.value.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_DisturbanceWind(src: DisturbanceWind) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/DisturbanceWind"])
     writer.write_encapsulation()
     py_to_cdr_body_DisturbanceWind(writer, src)
     return writer.bytes()
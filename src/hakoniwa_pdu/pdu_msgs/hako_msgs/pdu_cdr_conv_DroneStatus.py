@@ -1,27 +1,26 @@
 from .pdu_pytype_DroneStatus import DroneStatus
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iidddi")  # flight_mode, internal_state, propeller_wind.x, propeller_wind.y, propeller_wind.z, collided_counts
+
 
 def py_to_cdr_body_DroneStatus(writer: CdrWriter, src: DroneStatus):
-    writer.write_int32(src.flight_mode)
-    writer.write_int32(src.internal_state)
-    py_to_cdr_body_Vector3(writer, src.propeller_wind)
-    writer.write_int32(src.collided_counts)
+    writer.write_run(_CDR_RUN_0, (src.flight_mode, src.internal_state, src.propeller_wind.x, src.propeller_wind.y, src.propeller_wind.z, src.collided_counts))
 
 
 def cdr_body_to_py_DroneStatus(reader: CdrReader, dst: DroneStatus):
-    dst.flight_mode = reader.read_int32()
-    dst.internal_state = reader.read_int32()
-    cdr_body_to_py_Vector3(reader, dst.propeller_wind)
-    dst.collided_counts = reader.read_int32()
+    dst.flight_mode, dst.internal_state, dst.propeller_wind.x, dst.propeller_wind.y, dst.propeller_wind.z, dst.collided_counts = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_DroneStatus(src: DroneStatus) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/DroneStatus"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneStatus(writer, src)
     return writer.bytes()
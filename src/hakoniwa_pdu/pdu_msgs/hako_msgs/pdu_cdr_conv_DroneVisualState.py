@@ -1,34 +1,28 @@
 from .pdu_pytype_DroneVisualState import DroneVisualState
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ffffff")  # x, y, z, roll, pitch, yaw
+
 
 def py_to_cdr_body_DroneVisualState(writer: CdrWriter, src: DroneVisualState):
-    writer.write_float32(src.x)
-    writer.write_float32(src.y)
-    writer.write_float32(src.z)
-    writer.write_float32(src.roll)
-    writer.write_float32(src.pitch)
-    writer.write_float32(src.yaw)
+    writer.write_run(_CDR_RUN_0, (src.x, src.y, src.z, src.roll, src.pitch, src.yaw))
     writer.write_sequence_length(src.pwm_duty)
-    for elem in src.pwm_duty:
-        writer.write_float32(elem)
+    writer.write_sequence("f", src.pwm_duty)
 
 
 def cdr_body_to_py_DroneVisualState(reader: CdrReader, dst: DroneVisualState):
-    dst.x = reader.read_float32()
-    dst.y = reader.read_float32()
-    dst.z = reader.read_float32()
-    dst.roll = reader.read_float32()
-    dst.pitch = reader.read_float32()
-    dst.yaw = reader.read_float32()
-    dst.pwm_duty = [reader.read_float32() for _ in range(reader.read_uint32())]
+    dst.x, dst.y, dst.z, dst.roll, dst.pitch, dst.yaw = reader.read_run(_CDR_RUN_0)
+    dst.pwm_duty = reader.read_sequence("f", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_DroneVisualState(src: DroneVisualState) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/DroneVisualState"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneVisualState(writer, src)
     return writer.bytes()
@@ -1,27 +1,23 @@
 from .pdu_pytype_DroneVisualStateArray import DroneVisualStateArray
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_msgs.pdu_cdr_conv_DroneVisualState import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IIIII")  # sequence_id, chunk_index, chunk_count, start_index, valid_count
+
 
 def py_to_cdr_body_DroneVisualStateArray(writer: CdrWriter, src: DroneVisualStateArray):
-    writer.write_uint32(src.sequence_id)
-    writer.write_uint32(src.chunk_index)
-    writer.write_uint32(src.chunk_count)
-    writer.write_uint32(src.start_index)
-    writer.write_uint32(src.valid_count)
+    writer.write_run(_CDR_RUN_0, (src.sequence_id, src.chunk_index, src.chunk_count, src.start_index, src.valid_count))
     writer.write_sequence_length(src.drones)
     for elem in src.drones:
         py_to_cdr_body_DroneVisualState(writer, elem)
 
 
 def cdr_body_to_py_DroneVisualStateArray(reader: CdrReader, dst: DroneVisualStateArray):
-    dst.sequence_id = reader.read_uint32()
-    dst.chunk_index = reader.read_uint32()
-    dst.chunk_count = reader.read_uint32()
-    dst.start_index = reader.read_uint32()
-    dst.valid_count = reader.read_uint32()
+    dst.sequence_id, dst.chunk_index, dst.chunk_count, dst.start_index, dst.valid_count = reader.read_run(_CDR_RUN_0)
     dst.drones = []
     for _ in range(reader.read_uint32()):
         elem = DroneVisualState()
@@ -31,7 +27,8 @@ def cdr_body_to_py_DroneVisualStateArray(reader: CdrReader, dst: DroneVisualStat
 
 
 def py_to_cdr_DroneVisualStateArray(src: DroneVisualStateArray) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/DroneVisualStateArray"])
     writer.write_encapsulation()
     py_to_cdr_body_DroneVisualStateArray(writer, src)
     return writer.bytes()
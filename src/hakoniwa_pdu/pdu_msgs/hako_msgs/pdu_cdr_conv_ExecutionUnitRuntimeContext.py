@@ -1,28 +1,28 @@
 from .pdu_pytype_ExecutionUnitRuntimeContext import ExecutionUnitRuntimeContext
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IBB")  # config_hash, epoch, owner_id
+
 
 def py_to_cdr_body_ExecutionUnitRuntimeContext(writer: CdrWriter, src: ExecutionUnitRuntimeContext):
-    writer.write_uint32(src.config_hash)
-    writer.write_uint8(src.epoch)
-    writer.write_uint8(src.owner_id)
+    writer.write_run(_CDR_RUN_0, (src.config_hash, src.epoch, src.owner_id))
     writer.write_sequence_length(src.context)
-    for elem in src.context:
-        writer.write_uint8(elem)
+    writer.write_sequence("B", src.context)
 
 
 def cdr_body_to_py_ExecutionUnitRuntimeContext(reader: CdrReader, dst: ExecutionUnitRuntimeContext):
-    dst.config_hash = reader.read_uint32()
-    dst.epoch = reader.read_uint8()
-    dst.owner_id = reader.read_uint8()
-    dst.context = [reader.read_uint8() for _ in range(reader.read_uint32())]
+    dst.config_hash, dst.epoch, dst.owner_id = reader.read_run(_CDR_RUN_0)
+    dst.context = reader.read_sequence("B", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_ExecutionUnitRuntimeContext(src: ExecutionUnitRuntimeContext) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/ExecutionUnitRuntimeContext"])
     writer.write_encapsulation()
     py_to_cdr_body_ExecutionUnitRuntimeContext(writer, src)
     return writer.bytes()
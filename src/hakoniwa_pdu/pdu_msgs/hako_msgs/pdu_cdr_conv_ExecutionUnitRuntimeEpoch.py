@@ -1,22 +1,23 @@
 from .pdu_pytype_ExecutionUnitRuntimeEpoch import ExecutionUnitRuntimeEpoch
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
 
 def py_to_cdr_body_ExecutionUnitRuntimeEpoch(writer: CdrWriter, src: ExecutionUnitRuntimeEpoch):
     writer.write_sequence_length(src.epoch)
-    for elem in src.epoch:
-        writer.write_uint8(elem)
+    writer.write_sequence("B", src.epoch)
 
 
 def cdr_body_to_py_ExecutionUnitRuntimeEpoch(reader: CdrReader, dst: ExecutionUnitRuntimeEpoch):
-    dst.epoch = [reader.read_uint8() for _ in range(reader.read_uint32())]
+    dst.epoch = reader.read_sequence("B", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_ExecutionUnitRuntimeEpoch(src: ExecutionUnitRuntimeEpoch) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/ExecutionUnitRuntimeEpoch"])
     writer.write_encapsulation()
     py_to_cdr_body_ExecutionUnitRuntimeEpoch(writer, src)
     return writer.bytes()
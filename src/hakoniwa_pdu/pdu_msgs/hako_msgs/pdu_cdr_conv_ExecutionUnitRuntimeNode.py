@@ -1,5 +1,6 @@
 from .pdu_pytype_ExecutionUnitRuntimeNode import ExecutionUnitRuntimeNode
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_ExecutionUnitRuntimeNode(reader: CdrReader, dst: ExecutionUni
 
 
 def py_to_cdr_ExecutionUnitRuntimeNode(src: ExecutionUnitRuntimeNode) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/ExecutionUnitRuntimeNode"])
     writer.write_encapsulation()
     py_to_cdr_body_ExecutionUnitRuntimeNode(writer, src)
     return writer.bytes()
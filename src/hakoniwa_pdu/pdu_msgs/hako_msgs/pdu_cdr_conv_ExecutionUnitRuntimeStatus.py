@@ -1,38 +1,37 @@
 from .pdu_pytype_ExecutionUnitRuntimeStatus import ExecutionUnitRuntimeStatus
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IH")  # config_hash, unit_count
+
 
 def py_to_cdr_body_ExecutionUnitRuntimeStatus(writer: CdrWriter, src: ExecutionUnitRuntimeStatus):
-    writer.write_uint32(src.config_hash)
-    writer.write_uint16(src.unit_count)
+    writer.write_run(_CDR_RUN_0, (src.config_hash, src.unit_count))
     writer.write_sequence_length(src.status)
-    for elem in src.status:
-        writer.write_uint8(elem)
+    writer.write_sequence("B", src.status)
     writer.write_sequence_length(src.epoch)
-    for elem in src.epoch:
-        writer.write_uint8(elem)
+    writer.write_sequence("B", src.epoch)
     writer.write_sequence_length(src.curr_owner_node_id)
-    for elem in src.curr_owner_node_id:
-        writer.write_uint8(elem)
+    writer.write_sequence("B", src.curr_owner_node_id)
     writer.write_sequence_length(src.next_owner_node_id)
-    for elem in src.next_owner_node_id:
-        writer.write_uint8(elem)
+    writer.write_sequence("B", src.next_owner_node_id)
 
 
 def cdr_body_to_py_ExecutionUnitRuntimeStatus(reader: CdrReader, dst: ExecutionUnitRuntimeStatus):
-    dst.config_hash = reader.read_uint32()
-    dst.unit_count = reader.read_uint16()
-    dst.status = [reader.read_uint8() for _ in range(reader.read_uint32())]
-    dst.epoch = [reader.read_uint8() for _ in range(reader.read_uint32())]
-    dst.curr_owner_node_id = [reader.read_uint8() for _ in range(reader.read_uint32())]
-    dst.next_owner_node_id = [reader.read_uint8() for _ in range(reader.read_uint32())]
+    dst.config_hash, dst.unit_count = reader.read_run(_CDR_RUN_0)
+    dst.status = reader.read_sequence("B", reader.read_uint32())
+    dst.epoch = reader.read_sequence("B", reader.read_uint32())
+    dst.curr_owner_node_id = reader.read_sequence("B", reader.read_uint32())
+    dst.next_owner_node_id = reader.read_sequence("B", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_ExecutionUnitRuntimeStatus(src: ExecutionUnitRuntimeStatus) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/ExecutionUnitRuntimeStatus"])
     writer.write_encapsulation()
     py_to_cdr_body_ExecutionUnitRuntimeStatus(writer, src)
     return writer.bytes()
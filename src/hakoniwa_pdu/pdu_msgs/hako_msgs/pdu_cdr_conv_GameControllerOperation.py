@@ -1,26 +1,24 @@
 from .pdu_pytype_GameControllerOperation import GameControllerOperation
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
 
 def py_to_cdr_body_GameControllerOperation(writer: CdrWriter, src: GameControllerOperation):
-    values = src.axis
-    for i in range(6):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
-    values = src.button
-    for i in range(15):
-        writer.write_bool(values[i] if i < len(values) else False)
+    writer.write_sequence("d", src.axis, 6)
+    writer.write_sequence("?", src.button, 15)
 
 
 def cdr_body_to_py_GameControllerOperation(reader: CdrReader, dst: GameControllerOperation):
-    dst.axis = [reader.read_float64() for _ in range(6)]
-    dst.button = [reader.read_bool() for _ in range(15)]
+    dst.axis = reader.read_sequence("d", 6)
+    dst.button = reader.read_sequence("?", 15)
     return dst
 
 
 def py_to_cdr_GameControllerOperation(src: GameControllerOperation) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/GameControllerOperation"])
     writer.write_encapsulation()
     py_to_cdr_body_GameControllerOperation(writer, src)
     return writer.bytes()
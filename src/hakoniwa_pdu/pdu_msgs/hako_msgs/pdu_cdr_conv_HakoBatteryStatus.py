@@ -1,28 +1,25 @@
 from .pdu_pytype_HakoBatteryStatus import HakoBatteryStatus
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddII")  # full_voltage, curr_voltage, curr_temp, status, cycles
+
 
 def py_to_cdr_body_HakoBatteryStatus(writer: CdrWriter, src: HakoBatteryStatus):
-    writer.write_float64(src.full_voltage)
-    writer.write_float64(src.curr_voltage)
-    writer.write_float64(src.curr_temp)
-    writer.write_uint32(src.status)
-    writer.write_uint32(src.cycles)
+    writer.write_run(_CDR_RUN_0, (src.full_voltage, src.curr_voltage, src.curr_temp, src.status, src.cycles))
 
 
 def cdr_body_to_py_HakoBatteryStatus(reader: CdrReader, dst: HakoBatteryStatus):
-    dst.full_voltage = reader.read_float64()
-    dst.curr_voltage = reader.read_float64()
-    dst.curr_temp = reader.read_float64()
-    dst.status = reader.read_uint32()
-    dst.cycles = reader.read_uint32()
+    dst.full_voltage, dst.curr_voltage, dst.curr_temp, dst.status, dst.cycles = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoBatteryStatus(src: HakoBatteryStatus) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/HakoBatteryStatus"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoBatteryStatus(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_HakoCameraData import HakoCameraData
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..sensor_msgs.pdu_cdr_conv_CompressedImage import *
 from ..std_msgs.pdu_cdr_conv_Header import *
@@ -19,7 +20,8 @@ def cdr_body_to_py_HakoCameraData(reader: CdrReader, dst: HakoCameraData):
 
 
 def py_to_cdr_HakoCameraData(src: HakoCameraData) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/HakoCameraData"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoCameraData(writer, src)
     return writer.bytes()
@@ -1,23 +1,26 @@
 from .pdu_pytype_HakoCameraInfo import HakoCameraInfo
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iddd")  # request_id, angle.x, angle.y, angle.z
+
 
 def py_to_cdr_body_HakoCameraInfo(writer: CdrWriter, src: HakoCameraInfo):
-    writer.write_int32(src.request_id)
-    py_to_cdr_body_Vector3(writer, src.angle)
+    writer.write_run(_CDR_RUN_0, (src.request_id, src.angle.x, src.angle.y, src.angle.z))
 
 
 def cdr_body_to_py_HakoCameraInfo(reader: CdrReader, dst: HakoCameraInfo):
-    dst.request_id = reader.read_int32()
-    cdr_body_to_py_Vector3(reader, dst.angle)
+    dst.request_id, dst.angle.x, dst.angle.y, dst.angle.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoCameraInfo(src: HakoCameraInfo) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/HakoCameraInfo"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoCameraInfo(writer, src)
     return writer.bytes()
@@ -1,24 +1,25 @@
 from .pdu_pytype_HakoCmdHeader import HakoCmdHeader
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("??i")  # request, result, result_code
+
 
 def py_to_cdr_body_HakoCmdHeader(writer: CdrWriter, src: HakoCmdHeader):
-    writer.write_bool(src.request)
-    writer.write_bool(src.result)
-    writer.write_int32(src.result_code)
+    writer.write_run(_CDR_RUN_0, (src.request, src.result, src.result_code))
 
 
 def cdr_body_to_py_HakoCmdHeader(reader: CdrReader, dst: HakoCmdHeader):
-    dst.request = reader.read_bool()
-    dst.result = reader.read_bool()
-    dst.result_code = reader.read_int32()
+    dst.request, dst.result, dst.result_code = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoCmdHeader(src: HakoCmdHeader) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/HakoCmdHeader"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoCmdHeader(writer, src)
     return writer.bytes()
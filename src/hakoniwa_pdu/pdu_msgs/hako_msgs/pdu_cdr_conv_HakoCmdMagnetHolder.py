@@ -1,23 +1,26 @@
 from .pdu_pytype_HakoCmdMagnetHolder import HakoCmdMagnetHolder
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_msgs.pdu_cdr_conv_HakoCmdHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("??i?")  # header.request, header.result, header.result_code, magnet_on
+
 
 def py_to_cdr_body_HakoCmdMagnetHolder(writer: CdrWriter, src: HakoCmdMagnetHolder):
-    py_to_cdr_body_HakoCmdHeader(writer, src.header)
-    writer.write_bool(src.magnet_on)
+    writer.write_run(_CDR_RUN_0, (src.header.request, src.header.result, src.header.result_code, src.magnet_on))
 
 
 def cdr_body_to_py_HakoCmdMagnetHolder(reader: CdrReader, dst: HakoCmdMagnetHolder):
-    cdr_body_to_py_HakoCmdHeader(reader, dst.header)
-    dst.magnet_on = reader.read_bool()
+    dst.header.request, dst.header.result, dst.header.result_code, dst.magnet_on = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoCmdMagnetHolder(src: HakoCmdMagnetHolder) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/HakoCmdMagnetHolder"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoCmdMagnetHolder(writer, src)
     return writer.bytes()
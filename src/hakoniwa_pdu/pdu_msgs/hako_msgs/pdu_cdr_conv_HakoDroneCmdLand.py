@@ -1,27 +1,26 @@
 from .pdu_pytype_HakoDroneCmdLand import HakoDroneCmdLand
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_msgs.pdu_cdr_conv_HakoDroneCmdHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("??iddd")  # header.request, header.result, header.result_code, height, speed, yaw_deg
+
 
 def py_to_cdr_body_HakoDroneCmdLand(writer: CdrWriter, src: HakoDroneCmdLand):
-    py_to_cdr_body_HakoDroneCmdHeader(writer, src.header)
-    writer.write_float64(src.height)
-    writer.write_float64(src.speed)
-    writer.write_float64(src.yaw_deg)
+    writer.write_run(_CDR_RUN_0, (src.header.request, src.header.result, src.header.result_code, src.height, src.speed, src.yaw_deg))
 
 
 def cdr_body_to_py_HakoDroneCmdLand(reader: CdrReader, dst: HakoDroneCmdLand):
-    cdr_body_to_py_HakoDroneCmdHeader(reader, dst.header)
-    dst.height = reader.read_float64()
-    dst.speed = reader.read_float64()
-    dst.yaw_deg = reader.read_float64()
+    dst.header.request, dst.header.result, dst.header.result_code, dst.height, dst.speed, dst.yaw_deg = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoDroneCmdLand(src: HakoDroneCmdLand) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/HakoDroneCmdLand"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoDroneCmdLand(writer, src)
     return writer.bytes()
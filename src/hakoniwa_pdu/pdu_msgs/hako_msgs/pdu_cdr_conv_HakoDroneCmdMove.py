@@ -1,31 +1,26 @@
 from .pdu_pytype_HakoDroneCmdMove import HakoDroneCmdMove
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_msgs.pdu_cdr_conv_HakoDroneCmdHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("??iddddd")  # header.request, header.result, header.result_code, x, y, z, speed, yaw_deg
+
 
 def py_to_cdr_body_HakoDroneCmdMove(writer: CdrWriter, src: HakoDroneCmdMove):
-    py_to_cdr_body_HakoDroneCmdHeader(writer, src.header)
-    writer.write_float64(src.x)
-    writer.write_float64(src.y)
-    writer.write_float64(src.z)
-    writer.write_float64(src.speed)
-    writer.write_float64(src.yaw_deg)
+    writer.write_run(_CDR_RUN_0, (src.header.request, src.header.result, src.header.result_code, src.x, src.y, src.z, src.speed, src.yaw_deg))
 
 
 def cdr_body_to_py_HakoDroneCmdMove(reader: CdrReader, dst: HakoDroneCmdMove):
-    cdr_body_to_py_HakoDroneCmdHeader(reader, dst.header)
-    dst.x = reader.read_float64()
-    dst.y = reader.read_float64()
-    dst.z = reader.read_float64()
-    dst.speed = reader.read_float64()
-    dst.yaw_deg = reader.read_float64()
+    dst.header.request, dst.header.result, dst.header.result_code, dst.x, dst.y, dst.z, dst.speed, dst.yaw_deg = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoDroneCmdMove(src: HakoDroneCmdMove) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/HakoDroneCmdMove"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoDroneCmdMove(writer, src)
     return writer.bytes()
@@ -1,22 +1,25 @@
 from .pdu_pytype_HakoStatusMagnetHolder import HakoStatusMagnetHolder
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("??")  # magnet_on, contact_on
+
 
 def py_to_cdr_body_HakoStatusMagnetHolder(writer: CdrWriter, src: HakoStatusMagnetHolder):
-    writer.write_bool(src.magnet_on)
-    writer.write_bool(src.contact_on)
+    writer.write_run(_CDR_RUN_0, (src.magnet_on, src.contact_on))
 
 
 def cdr_body_to_py_HakoStatusMagnetHolder(reader: CdrReader, dst: HakoStatusMagnetHolder):
-    dst.magnet_on = reader.read_bool()
-    dst.contact_on = reader.read_bool()
+    dst.magnet_on, dst.contact_on = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_HakoStatusMagnetHolder(src: HakoStatusMagnetHolder) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/HakoStatusMagnetHolder"])
     writer.write_encapsulation()
     py_to_cdr_body_HakoStatusMagnetHolder(writer, src)
     return writer.bytes()
@@ -1,42 +1,27 @@
 from .pdu_pytype_ImpulseCollision import ImpulseCollision
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Point import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("??ddddddddddddddddddddddd")  # collision, is_target_static, restitution_coefficient, self_contact_vector.x, self_contact_vector.y, self_contact_vector.z, normal.x, normal.y, normal.z, target_contact_vector.x, target_contact_vector.y, target_contact_vector.z, target_velocity.x, target_velocity.y, target_velocity.z, target_angular_velocity.x, target_angular_velocity.y, target_angular_velocity.z, target_euler.x, target_euler.y, target_euler.z, target_inertia.x, target_inertia.y, target_inertia.z, target_mass
+
 
 def py_to_cdr_body_ImpulseCollision(writer: CdrWriter, src: ImpulseCollision):
-    writer.write_bool(src.collision)
-    writer.write_bool(src.is_target_static)
-    writer.write_float64(src.restitution_coefficient)
-    py_to_cdr_body_Point(writer, src.self_contact_vector)
-    py_to_cdr_body_Vector3(writer, src.normal)
-    py_to_cdr_body_Point(writer, src.target_contact_vector)
-    py_to_cdr_body_Vector3(writer, src.target_velocity)
-    py_to_cdr_body_Vector3(writer, src.target_angular_velocity)
-    py_to_cdr_body_Vector3(writer, src.target_euler)
-    py_to_cdr_body_Vector3(writer, src.target_inertia)
-    writer.write_float64(src.target_mass)
+    writer.write_run(_CDR_RUN_0, (src.collision, src.is_target_static, src.restitution_coefficient, src.self_contact_vector.x, src.self_contact_vector.y, src.self_contact_vector.z, src.normal.x, src.normal.y, src.normal.z, src.target_contact_vector.x, src.target_contact_vector.y, src.target_contact_vector.z, src.target_velocity.x, src.target_velocity.y, src.target_velocity.z, src.target_angular_velocity.x, src.target_angular_velocity.y, src.target_angular_velocity.z, src.target_euler.x, src.target_euler.y, src.target_euler.z, src.target_inertia.x, src.target_inertia.y, src.target_inertia.z, src.target_mass))
 
 
 def cdr_body_to_py_ImpulseCollision(reader: CdrReader, dst: ImpulseCollision):
-    dst.collision = reader.read_bool()
-    dst.is_target_static = reader.read_bool()
-    dst.restitution_coefficient = reader.read_float64()
-    cdr_body_to_py_Point(reader, dst.self_contact_vector)
-    cdr_body_to_py_Vector3(reader, dst.normal)
-    cdr_body_to_py_Point(reader, dst.target_contact_vector)
-    cdr_body_to_py_Vector3(reader, dst.target_velocity)
-    cdr_body_to_py_Vector3(reader, dst.target_angular_velocity)
-    cdr_body_to_py_Vector3(reader, dst.target_euler)
-    cdr_body_to_py_Vector3(reader, dst.target_inertia)
-    dst.target_mass = reader.read_float64()
+    dst.collision, dst.is_target_static, dst.restitution_coefficient, dst.self_contact_vector.x, dst.self_contact_vector.y, dst.self_contact_vector.z, dst.normal.x, dst.normal.y, dst.normal.z, dst.target_contact_vector.x, dst.target_contact_vector.y, dst.target_contact_vector.z, dst.target_velocity.x, dst.target_velocity.y, dst.target_velocity.z, dst.target_angular_velocity.x, dst.target_angular_velocity.y, dst.target_angular_velocity.z, dst.target_euler.x, dst.target_euler.y, dst.target_euler.z, dst.target_inertia.x, dst.target_inertia.y, dst.target_inertia.z, dst.target_mass = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_ImpulseCollision(src: ImpulseCollision) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/ImpulseCollision"])
     writer.write_encapsulation()
     py_to_cdr_body_ImpulseCollision(writer, src)
     return writer.bytes()
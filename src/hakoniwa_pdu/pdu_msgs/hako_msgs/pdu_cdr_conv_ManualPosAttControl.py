@@ -1,24 +1,27 @@
 from .pdu_pytype_ManualPosAttControl import ManualPosAttControl
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Twist import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("?dddddd")  # do_operation, posatt.linear.x, posatt.linear.y, posatt.linear.z, posatt.angular.x, posatt.angular.y, posatt.angular.z
+
 
 def py_to_cdr_body_ManualPosAttControl(writer: CdrWriter, src: ManualPosAttControl):
-    writer.write_bool(src.do_operation)
-    py_to_cdr_body_Twist(writer, src.posatt)
+    writer.write_run(_CDR_RUN_0, (src.do_operation, src.posatt.linear.x, src.posatt.linear.y, src.posatt.linear.z, src.posatt.angular.x, src.posatt.angular.y, src.posatt.angular.z))
 
 
 def cdr_body_to_py_ManualPosAttControl(reader: CdrReader, dst: ManualPosAttControl):
-    dst.do_operation = reader.read_bool()
-    cdr_body_to_py_Twist(reader, dst.posatt)
+    dst.do_operation, dst.posatt.linear.x, dst.posatt.linear.y, dst.posatt.linear.z, dst.posatt.angular.x, dst.posatt.angular.y, dst.posatt.angular.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_ManualPosAttControl(src: ManualPosAttControl) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/ManualPosAttControl"])
     writer.write_encapsulation()
     py_to_cdr_body_ManualPosAttControl(writer, src)
     return writer.bytes()
@@ -1,40 +1,30 @@
 from .pdu_pytype_MetaPdu import MetaPdu
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IIHHIQQQ")  # total_len, magicno, version, flags, meta_request_type, hako_time_us, asset_time_us, real_time_us
+_CDR_RUN_1 = CdrRun("iI")  # channel_id, body_len
+
 
 def py_to_cdr_body_MetaPdu(writer: CdrWriter, src: MetaPdu):
-    writer.write_uint32(src.total_len)
-    writer.write_uint32(src.magicno)
-    writer.write_uint16(src.version)
-    writer.write_uint16(src.flags)
-    writer.write_uint32(src.meta_request_type)
-    writer.write_uint64(src.hako_time_us)
-    writer.write_uint64(src.asset_time_us)
-    writer.write_uint64(src.real_time_us)
+    writer.write_run(_CDR_RUN_0, (src.total_len, src.magicno, src.version, src.flags, src.meta_request_type, src.hako_time_us, src.asset_time_us, src.real_time_us))
     writer.write_string(src.robot_name)
-    writer.write_int32(src.channel_id)
-    writer.write_uint32(src.body_len)
+    writer.write_run(_CDR_RUN_1, (src.channel_id, src.body_len))
 
 
 def cdr_body_to_py_MetaPdu(reader: CdrReader, dst: MetaPdu):
-    dst.total_len = reader.read_uint32()
-    dst.magicno = reader.read_uint32()
-    dst.version = reader.read_uint16()
-    dst.flags = reader.read_uint16()
-    dst.meta_request_type = reader.read_uint32()
-    dst.hako_time_us = reader.read_uint64()
-    dst.asset_time_us = reader.read_uint64()
-    dst.real_time_us = reader.read_uint64()
+    dst.total_len, dst.magicno, dst.version, dst.flags, dst.meta_request_type, dst.hako_time_us, dst.asset_time_us, dst.real_time_us = reader.read_run(_CDR_RUN_0)
     dst.robot_name = reader.read_string()
-    dst.channel_id = reader.read_int32()
-    dst.body_len = reader.read_uint32()
+    dst.channel_id, dst.body_len = reader.read_run(_CDR_RUN_1)
     return dst
 
 
 def py_to_cdr_MetaPdu(src: MetaPdu) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/MetaPdu"])
     writer.write_encapsulation()
     py_to_cdr_body_MetaPdu(writer, src)
     return writer.bytes()
@@ -1,27 +1,26 @@
 from .pdu_pytype_MonitorCameraCmd import MonitorCameraCmd
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_msgs.pdu_cdr_conv_HakoCmdHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("??iiii")  # header.request, header.result, header.result_code, request_id, encode_type, request_type
+
 
 def py_to_cdr_body_MonitorCameraCmd(writer: CdrWriter, src: MonitorCameraCmd):
-    py_to_cdr_body_HakoCmdHeader(writer, src.header)
-    writer.write_int32(src.request_id)
-    writer.write_int32(src.encode_type)
-    writer.write_int32(src.request_type)
+    writer.write_run(_CDR_RUN_0, (src.header.request, src.header.result, src.header.result_code, src.request_id, src.encode_type, src.request_type))
 
 
 def cdr_body_to_py_MonitorCameraCmd(reader: CdrReader, dst: MonitorCameraCmd):
-    cdr_body_to_py_HakoCmdHeader(reader, dst.header)
-    dst.request_id = reader.read_int32()
-    dst.encode_type = reader.read_int32()
-    dst.request_type = reader.read_int32()
+    dst.header.request, dst.header.result, dst.header.result_code, dst.request_id, dst.encode_type, dst.request_type = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_MonitorCameraCmd(src: MonitorCameraCmd) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/MonitorCameraCmd"])
     writer.write_encapsulation()
     py_to_cdr_body_MonitorCameraCmd(writer, src)
     return writer.bytes()
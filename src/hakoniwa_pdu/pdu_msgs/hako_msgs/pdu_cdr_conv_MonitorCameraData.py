@@ -1,27 +1,30 @@
 from .pdu_pytype_MonitorCameraData import MonitorCameraData
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..sensor_msgs.pdu_cdr_conv_CompressedImage import *
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ii")  # request_id, image_data_length
+
 
 def py_to_cdr_body_MonitorCameraData(writer: CdrWriter, src: MonitorCameraData):
-    writer.write_int32(src.request_id)
-    writer.write_int32(src.image_data_length)
+    writer.write_run(_CDR_RUN_0, (src.request_id, src.image_data_length))
     py_to_cdr_body_CompressedImage(writer, src.image)
 
 
 def cdr_body_to_py_MonitorCameraData(reader: CdrReader, dst: MonitorCameraData):
-    dst.request_id = reader.read_int32()
-    dst.image_data_length = reader.read_int32()
+    dst.request_id, dst.image_data_length = reader.read_run(_CDR_RUN_0)
     cdr_body_to_py_CompressedImage(reader, dst.image)
     return dst
 
 
 def py_to_cdr_MonitorCameraData(src: MonitorCameraData) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/MonitorCameraData"])
     writer.write_encapsulation()
     py_to_cdr_body_MonitorCameraData(writer, src)
     return writer.bytes()
@@ -1,28 +1,29 @@
 from .pdu_pytype_ShareObjectOwner import ShareObjectOwner
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Twist import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IQdddddd")  # owner_id, last_update, pos.linear.x, pos.linear.y, pos.linear.z, pos.angular.x, pos.angular.y, pos.angular.z
+
 
 def py_to_cdr_body_ShareObjectOwner(writer: CdrWriter, src: ShareObjectOwner):
     writer.write_string(src.object_name)
-    writer.write_uint32(src.owner_id)
-    writer.write_uint64(src.last_update)
-    py_to_cdr_body_Twist(writer, src.pos)
+    writer.write_run(_CDR_RUN_0, (src.owner_id, src.last_update, src.pos.linear.x, src.pos.linear.y, src.pos.linear.z, src.pos.angular.x, src.pos.angular.y, src.pos.angular.z))
 
 
 def cdr_body_to_py_ShareObjectOwner(reader: CdrReader, dst: ShareObjectOwner):
     dst.object_name = reader.read_string()
-    dst.owner_id = reader.read_uint32()
-    dst.last_update = reader.read_uint64()
-    cdr_body_to_py_Twist(reader, dst.pos)
+    dst.owner_id, dst.last_update, dst.pos.linear.x, dst.pos.linear.y, dst.pos.linear.z, dst.pos.angular.x, dst.pos.angular.y, dst.pos.angular.z = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_ShareObjectOwner(src: ShareObjectOwner) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/ShareObjectOwner"])
     writer.write_encapsulation()
     py_to_cdr_body_ShareObjectOwner(writer, src)
     return writer.bytes()
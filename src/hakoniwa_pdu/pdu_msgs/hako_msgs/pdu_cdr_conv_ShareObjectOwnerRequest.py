@@ -1,26 +1,27 @@
 from .pdu_pytype_ShareObjectOwnerRequest import ShareObjectOwnerRequest
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IIQ")  # request_type, new_owner_id, request_time
+
 
 def py_to_cdr_body_ShareObjectOwnerRequest(writer: CdrWriter, src: ShareObjectOwnerRequest):
     writer.write_string(src.object_name)
-    writer.write_uint32(src.request_type)
-    writer.write_uint32(src.new_owner_id)
-    writer.write_uint64(src.request_time)
+    writer.write_run(_CDR_RUN_0, (src.request_type, src.new_owner_id, src.request_time))
 
 
 def cdr_body_to_py_ShareObjectOwnerRequest(reader: CdrReader, dst: ShareObjectOwnerRequest):
     dst.object_name = reader.read_string()
-    dst.request_type = reader.read_uint32()
-    dst.new_owner_id = reader.read_uint32()
-    dst.request_time = reader.read_uint64()
+    dst.request_type, dst.new_owner_id, dst.request_time = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_ShareObjectOwnerRequest(src: ShareObjectOwnerRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/ShareObjectOwnerRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_ShareObjectOwnerRequest(writer, src)
     return writer.bytes()
@@ -1,26 +1,27 @@
 from .pdu_pytype_ShareObjectOwnerResponse import ShareObjectOwnerResponse
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("II?")  # request_type, owner_id, accepted
+
 
 def py_to_cdr_body_ShareObjectOwnerResponse(writer: CdrWriter, src: ShareObjectOwnerResponse):
     writer.write_string(src.object_name)
-    writer.write_uint32(src.request_type)
-    writer.write_uint32(src.owner_id)
-    writer.write_bool(src.accepted)
+    writer.write_run(_CDR_RUN_0, (src.request_type, src.owner_id, src.accepted))
 
 
 def cdr_body_to_py_ShareObjectOwnerResponse(reader: CdrReader, dst: ShareObjectOwnerResponse):
     dst.object_name = reader.read_string()
-    dst.request_type = reader.read_uint32()
-    dst.owner_id = reader.read_uint32()
-    dst.accepted = reader.read_bool()
+    dst.request_type, dst.owner_id, dst.accepted = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_ShareObjectOwnerResponse(src: ShareObjectOwnerResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/ShareObjectOwnerResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_ShareObjectOwnerResponse(writer, src)
     return writer.bytes()
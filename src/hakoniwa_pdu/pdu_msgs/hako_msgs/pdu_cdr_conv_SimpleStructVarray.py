@@ -1,5 +1,6 @@
 from .pdu_pytype_SimpleStructVarray import SimpleStructVarray
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_msgs.pdu_cdr_conv_SimpleVarray import *
 
@@ -39,7 +40,8 @@ def cdr_body_to_py_SimpleStructVarray(reader: CdrReader, dst: SimpleStructVarray
 
 
 def py_to_cdr_SimpleStructVarray(src: SimpleStructVarray) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/SimpleStructVarray"])
     writer.write_encapsulation()
     py_to_cdr_body_SimpleStructVarray(writer, src)
     return writer.bytes()
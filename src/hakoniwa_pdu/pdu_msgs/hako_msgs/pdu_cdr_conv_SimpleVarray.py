@@ -1,28 +1,27 @@
 from .pdu_pytype_SimpleVarray import SimpleVarray
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
 
 def py_to_cdr_body_SimpleVarray(writer: CdrWriter, src: SimpleVarray):
     writer.write_sequence_length(src.data)
-    for elem in src.data:
-        writer.write_int8(elem)
-    values = src.fixed_array
-    for i in range(10):
-        writer.write_int8(values[i] if i < len(values) else 0)
+    writer.write_sequence("b", src.data)
+    writer.write_sequence("b", src.fixed_array, 10)
     writer.write_int32(src.p_mem1)
 
 
 def cdr_body_to_py_SimpleVarray(reader: CdrReader, dst: SimpleVarray):
-    dst.data = [reader.read_int8() for _ in range(reader.read_uint32())]
-    dst.fixed_array = [reader.read_int8() for _ in range(10)]
+    dst.data = reader.read_sequence("b", reader.read_uint32())
+    dst.fixed_array = reader.read_sequence("b", 10)
     dst.p_mem1 = reader.read_int32()
     return dst
 
 
 def py_to_cdr_SimpleVarray(src: SimpleVarray) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_msgs/SimpleVarray"])
     writer.write_encapsulation()
     py_to_cdr_body_SimpleVarray(writer, src)
     return writer.bytes()
@@ -9,13 +9,20 @@ from ..geometry_msgs.pdu_conv_Vector3 import *
 from ..geometry_msgs.pdu_conv_Point import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<iI")  # collision, contact_num
+_RUN_1 = struct.Struct("<d")  # restitution_coefficient
 
-def pdu_to_py_Collision(binary_data: bytearray) -> Collision:
-    py_obj = Collision()
+
+def pdu_to_py_Collision(binary_data: bytearray, out: Collision = None, array_mode: str = None) -> Collision:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Collision() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Collision(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,11 +34,6 @@ def binary_read_recursive_Collision(meta: binary_io.PduMetaData, binary_data: by
     # type_name: bool 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.collision = binary_io.binTovalue("bool", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: contact_num 
@@ -39,9 +41,9 @@ def binary_read_recursive_Collision(meta: binary_io.PduMetaData, binary_data: by
     # offset: 4 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.contact_num = binary_io.binTovalue("uint32", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 0)
+    py_obj.collision = values[0] != 0
+    py_obj.contact_num = values[1]
     
     # array_type: single 
     # data_type: struct 
@@ -50,7 +52,7 @@ def binary_read_recursive_Collision(meta: binary_io.PduMetaData, binary_data: by
     # offset: 8 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.relative_velocity, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 8)
     py_obj.relative_velocity = tmp_py_obj
     
@@ -64,11 +66,10 @@ def binary_read_recursive_Collision(meta: binary_io.PduMetaData, binary_data: by
     i = 0
     array_size = 10
     one_elm_size = int(240 / array_size)
-    array_value = []
+    array_value = reuse_list(py_obj.contact_position, array_size, Point)
     while i < array_size:
-        tmp_py_obj = Point()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_Point(meta, binary_data, tmp_py_obj, base_off + 32 + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.contact_position = array_value    
     
@@ -79,40 +80,18 @@ def binary_read_recursive_Collision(meta: binary_io.PduMetaData, binary_data: by
     # offset: 272 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 272, 8)
-    py_obj.restitution_coefficient = binary_io.binTovalue("float64", bin)
+    py_obj.restitution_coefficient = _RUN_1.unpack_from(binary_data, base_off + 272)[0]
     
     return py_obj
 
 
-def py_to_pdu_Collision(py_obj: Collision) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Collision(py_obj: Collision, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Collision(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Collision(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Collision):
     # array_type: single 
@@ -121,27 +100,14 @@ def binary_write_recursive_Collision(parent_off: int, bw_container: BinaryWriter
     # type_name: bool 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.collision)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: contact_num 
     # type_name: uint32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 4
 
-    
-    bin = binary_io.typeTobin(type, py_obj.contact_num)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(1 if py_obj.collision else 0, py_obj.contact_num), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -173,13 +139,8 @@ def binary_write_recursive_Collision(parent_off: int, bw_container: BinaryWriter
     # type_name: float64 
     # offset: 272 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 272
 
-    
-    bin = binary_io.typeTobin(type, py_obj.restitution_coefficient)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.restitution_coefficient), expected_offset=parent_off + 272)
     
 
 if __name__ == "__main__":
@@ -13,12 +13,15 @@ from ..hako_msgs.pdu_conv_DisturbanceUserCustom import *
 
 
 
-def pdu_to_py_Disturbance(binary_data: bytearray) -> Disturbance:
-    py_obj = Disturbance()
+def pdu_to_py_Disturbance(binary_data: bytearray, out: Disturbance = None, array_mode: str = None) -> Disturbance:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Disturbance() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Disturbance(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -31,7 +34,7 @@ def binary_read_recursive_Disturbance(meta: binary_io.PduMetaData, binary_data:
     # offset: 0 size: 8 
     # array_len: 1
 
-    tmp_py_obj = DisturbanceTemperature()
+    tmp_py_obj = reuse_obj(py_obj.d_temp, DisturbanceTemperature)
     binary_read_recursive_DisturbanceTemperature(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.d_temp = tmp_py_obj
     
@@ -42,7 +45,7 @@ def binary_read_recursive_Disturbance(meta: binary_io.PduMetaData, binary_data:
     # offset: 8 size: 24 
     # array_len: 1
 
-    tmp_py_obj = DisturbanceWind()
+    tmp_py_obj = reuse_obj(py_obj.d_wind, DisturbanceWind)
     binary_read_recursive_DisturbanceWind(meta, binary_data, tmp_py_obj, base_off + 8)
     py_obj.d_wind = tmp_py_obj
     
@@ -53,7 +56,7 @@ def binary_read_recursive_Disturbance(meta: binary_io.PduMetaData, binary_data:
     # offset: 32 size: 8 
     # array_len: 1
 
-    tmp_py_obj = DisturbanceAtm()
+    tmp_py_obj = reuse_obj(py_obj.d_atm, DisturbanceAtm)
     binary_read_recursive_DisturbanceAtm(meta, binary_data, tmp_py_obj, base_off + 32)
     py_obj.d_atm = tmp_py_obj
     
@@ -64,7 +67,7 @@ def binary_read_recursive_Disturbance(meta: binary_io.PduMetaData, binary_data:
     # offset: 40 size: 48 
     # array_len: 1
 
-    tmp_py_obj = DisturbanceBoundary()
+    tmp_py_obj = reuse_obj(py_obj.d_boundary, DisturbanceBoundary)
     binary_read_recursive_DisturbanceBoundary(meta, binary_data, tmp_py_obj, base_off + 40)
     py_obj.d_boundary = tmp_py_obj
     
@@ -79,44 +82,23 @@ def binary_read_recursive_Disturbance(meta: binary_io.PduMetaData, binary_data:
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 88 + 4, 4))
     one_elm_size = 8
     i = 0
-    array_value = []
+    array_value = reuse_list(py_obj.d_user_custom, array_size, DisturbanceUserCustom)
     while i < array_size:
-        tmp_py_obj = DisturbanceUserCustom()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_DisturbanceUserCustom(meta, binary_data, tmp_py_obj, meta.heap_off + offset_from_heap + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.d_user_custom = array_value    
     
     return py_obj
 
 
-def py_to_pdu_Disturbance(py_obj: Disturbance) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Disturbance(py_obj: Disturbance, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Disturbance(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Disturbance(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Disturbance):
     # array_type: single 
@@ -8,12 +8,15 @@ from .. import binary_io
 
 
 
-def pdu_to_py_DisturbanceUserCustom(binary_data: bytearray) -> DisturbanceUserCustom:
-    py_obj = DisturbanceUserCustom()
+def pdu_to_py_DisturbanceUserCustom(binary_data: bytearray, out: DisturbanceUserCustom = None, array_mode: str = None) -> DisturbanceUserCustom:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = DisturbanceUserCustom() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_DisturbanceUserCustom(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -29,41 +32,19 @@ def binary_read_recursive_DisturbanceUserCustom(meta: binary_io.PduMetaData, bin
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 0, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 0 + 4, 4))
     one_elm_size = 8 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.data = binary_io.binToArrayValues("float64", array_value)
+    py_obj.data = read_array_values(meta, "float64", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     return py_obj
 
 
-def py_to_pdu_DisturbanceUserCustom(py_obj: DisturbanceUserCustom) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_DisturbanceUserCustom(py_obj: DisturbanceUserCustom, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_DisturbanceUserCustom(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_DisturbanceUserCustom(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: DisturbanceUserCustom):
     # array_type: varray 
@@ -8,13 +8,20 @@ from .. import binary_io
 from ..geometry_msgs.pdu_conv_Vector3 import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ii")  # flight_mode, internal_state
+_RUN_1 = struct.Struct("<i")  # collided_counts
 
-def pdu_to_py_DroneStatus(binary_data: bytearray) -> DroneStatus:
-    py_obj = DroneStatus()
+
+def pdu_to_py_DroneStatus(binary_data: bytearray, out: DroneStatus = None, array_mode: str = None) -> DroneStatus:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = DroneStatus() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_DroneStatus(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -26,11 +33,6 @@ def binary_read_recursive_DroneStatus(meta: binary_io.PduMetaData, binary_data:
     # type_name: int32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.flight_mode = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: internal_state 
@@ -38,9 +40,7 @@ def binary_read_recursive_DroneStatus(meta: binary_io.PduMetaData, binary_data:
     # offset: 4 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.internal_state = binary_io.binTovalue("int32", bin)
+    py_obj.flight_mode, py_obj.internal_state = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -49,7 +49,7 @@ def binary_read_recursive_DroneStatus(meta: binary_io.PduMetaData, binary_data:
     # offset: 8 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.propeller_wind, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 8)
     py_obj.propeller_wind = tmp_py_obj
     
@@ -60,40 +60,18 @@ def binary_read_recursive_DroneStatus(meta: binary_io.PduMetaData, binary_data:
     # offset: 32 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 32, 4)
-    py_obj.collided_counts = binary_io.binTovalue("int32", bin)
+    py_obj.collided_counts = _RUN_1.unpack_from(binary_data, base_off + 32)[0]
     
     return py_obj
 
 
-def py_to_pdu_DroneStatus(py_obj: DroneStatus) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_DroneStatus(py_obj: DroneStatus, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_DroneStatus(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_DroneStatus(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: DroneStatus):
     # array_type: single 
@@ -102,27 +80,14 @@ def binary_write_recursive_DroneStatus(parent_off: int, bw_container: BinaryWrit
     # type_name: int32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.flight_mode)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: internal_state 
     # type_name: int32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 4
 
-    
-    bin = binary_io.typeTobin(type, py_obj.internal_state)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.flight_mode, py_obj.internal_state), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -141,13 +106,8 @@ def binary_write_recursive_DroneStatus(parent_off: int, bw_container: BinaryWrit
     # type_name: int32 
     # offset: 32 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 32
 
-    
-    bin = binary_io.typeTobin(type, py_obj.collided_counts)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.collided_counts), expected_offset=parent_off + 32)
     
 
 if __name__ == "__main__":
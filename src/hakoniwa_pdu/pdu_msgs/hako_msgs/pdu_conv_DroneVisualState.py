@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ffffff")  # x, y, z, roll, pitch, yaw
 
-def pdu_to_py_DroneVisualState(binary_data: bytearray) -> DroneVisualState:
-    py_obj = DroneVisualState()
+
+def pdu_to_py_DroneVisualState(binary_data: bytearray, out: DroneVisualState = None, array_mode: str = None) -> DroneVisualState:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = DroneVisualState() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_DroneVisualState(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,55 +31,30 @@ def binary_read_recursive_DroneVisualState(meta: binary_io.PduMetaData, binary_d
     # type_name: float32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.x = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: y 
     # type_name: float32 
     # offset: 4 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.y = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: z 
     # type_name: float32 
     # offset: 8 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 4)
-    py_obj.z = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: roll 
     # type_name: float32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.roll = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: pitch 
     # type_name: float32 
     # offset: 16 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.pitch = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw 
@@ -81,9 +62,7 @@ def binary_read_recursive_DroneVisualState(meta: binary_io.PduMetaData, binary_d
     # offset: 20 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 20, 4)
-    py_obj.yaw = binary_io.binTovalue("float32", bin)
+    py_obj.x, py_obj.y, py_obj.z, py_obj.roll, py_obj.pitch, py_obj.yaw = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     # array_type: varray 
     # data_type: primitive 
@@ -95,41 +74,19 @@ def binary_read_recursive_DroneVisualState(meta: binary_io.PduMetaData, binary_d
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 24, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 24 + 4, 4))
     one_elm_size = 4 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.pwm_duty = binary_io.binToArrayValues("float32", array_value)
+    py_obj.pwm_duty = read_array_values(meta, "float32", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     return py_obj
 
 
-def py_to_pdu_DroneVisualState(py_obj: DroneVisualState) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_DroneVisualState(py_obj: DroneVisualState, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_DroneVisualState(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_DroneVisualState(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: DroneVisualState):
     # array_type: single 
@@ -138,83 +95,38 @@ def binary_write_recursive_DroneVisualState(parent_off: int, bw_container: Binar
     # type_name: float32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.x)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: y 
     # type_name: float32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 4
-
-    
-    bin = binary_io.typeTobin(type, py_obj.y)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: z 
     # type_name: float32 
     # offset: 8 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.z)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: roll 
     # type_name: float32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.roll)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: pitch 
     # type_name: float32 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.pitch)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw 
     # type_name: float32 
     # offset: 20 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 20
 
-    
-    bin = binary_io.typeTobin(type, py_obj.yaw)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.x, py_obj.y, py_obj.z, py_obj.roll, py_obj.pitch, py_obj.yaw), expected_offset=parent_off + 0)
     
     # array_type: varray 
     # data_type: primitive 
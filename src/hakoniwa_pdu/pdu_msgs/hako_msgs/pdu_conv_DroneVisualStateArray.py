@@ -8,13 +8,19 @@ from .. import binary_io
 from ..hako_msgs.pdu_conv_DroneVisualState import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<IIIII")  # sequence_id, chunk_index, chunk_count, start_index, valid_count
 
-def pdu_to_py_DroneVisualStateArray(binary_data: bytearray) -> DroneVisualStateArray:
-    py_obj = DroneVisualStateArray()
+
+def pdu_to_py_DroneVisualStateArray(binary_data: bytearray, out: DroneVisualStateArray = None, array_mode: str = None) -> DroneVisualStateArray:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = DroneVisualStateArray() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_DroneVisualStateArray(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -26,44 +32,24 @@ def binary_read_recursive_DroneVisualStateArray(meta: binary_io.PduMetaData, bin
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.sequence_id = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: chunk_index 
     # type_name: uint32 
     # offset: 4 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.chunk_index = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: chunk_count 
     # type_name: uint32 
     # offset: 8 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 4)
-    py_obj.chunk_count = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: start_index 
     # type_name: uint32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.start_index = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: valid_count 
@@ -71,9 +57,7 @@ def binary_read_recursive_DroneVisualStateArray(meta: binary_io.PduMetaData, bin
     # offset: 16 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.valid_count = binary_io.binTovalue("uint32", bin)
+    py_obj.sequence_id, py_obj.chunk_index, py_obj.chunk_count, py_obj.start_index, py_obj.valid_count = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     # array_type: varray 
     # data_type: struct 
@@ -86,44 +70,23 @@ def binary_read_recursive_DroneVisualStateArray(meta: binary_io.PduMetaData, bin
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 20 + 4, 4))
     one_elm_size = 32
     i = 0
-    array_value = []
+    array_value = reuse_list(py_obj.drones, array_size, DroneVisualState)
     while i < array_size:
-        tmp_py_obj = DroneVisualState()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_DroneVisualState(meta, binary_data, tmp_py_obj, meta.heap_off + offset_from_heap + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.drones = array_value    
     
     return py_obj
 
 
-def py_to_pdu_DroneVisualStateArray(py_obj: DroneVisualStateArray) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_DroneVisualStateArray(py_obj: DroneVisualStateArray, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_DroneVisualStateArray(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_DroneVisualStateArray(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: DroneVisualStateArray):
     # array_type: single 
@@ -132,69 +95,32 @@ def binary_write_recursive_DroneVisualStateArray(parent_off: int, bw_container:
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.sequence_id)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: chunk_index 
     # type_name: uint32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 4
-
-    
-    bin = binary_io.typeTobin(type, py_obj.chunk_index)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: chunk_count 
     # type_name: uint32 
     # offset: 8 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.chunk_count)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: start_index 
     # type_name: uint32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.start_index)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: valid_count 
     # type_name: uint32 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 16
 
-    
-    bin = binary_io.typeTobin(type, py_obj.valid_count)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.sequence_id, py_obj.chunk_index, py_obj.chunk_count, py_obj.start_index, py_obj.valid_count), expected_offset=parent_off + 0)
     
     # array_type: varray 
     # data_type: struct 
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<IBB")  # config_hash, epoch, owner_id
 
-def pdu_to_py_ExecutionUnitRuntimeContext(binary_data: bytearray) -> ExecutionUnitRuntimeContext:
-    py_obj = ExecutionUnitRuntimeContext()
+
+def pdu_to_py_ExecutionUnitRuntimeContext(binary_data: bytearray, out: ExecutionUnitRuntimeContext = None, array_mode: str = None) -> ExecutionUnitRuntimeContext:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = ExecutionUnitRuntimeContext() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_ExecutionUnitRuntimeContext(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,22 +31,12 @@ def binary_read_recursive_ExecutionUnitRuntimeContext(meta: binary_io.PduMetaDat
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.config_hash = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: epoch 
     # type_name: uint8 
     # offset: 4 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 1)
-    py_obj.epoch = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: owner_id 
@@ -48,9 +44,7 @@ def binary_read_recursive_ExecutionUnitRuntimeContext(meta: binary_io.PduMetaDat
     # offset: 5 size: 1 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 5, 1)
-    py_obj.owner_id = binary_io.binTovalue("uint8", bin)
+    py_obj.config_hash, py_obj.epoch, py_obj.owner_id = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     # array_type: varray 
     # data_type: primitive 
@@ -62,41 +56,19 @@ def binary_read_recursive_ExecutionUnitRuntimeContext(meta: binary_io.PduMetaDat
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 8, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 8 + 4, 4))
     one_elm_size = 1 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.context = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.context = read_array_values(meta, "uint8", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     return py_obj
 
 
-def py_to_pdu_ExecutionUnitRuntimeContext(py_obj: ExecutionUnitRuntimeContext) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_ExecutionUnitRuntimeContext(py_obj: ExecutionUnitRuntimeContext, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_ExecutionUnitRuntimeContext(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_ExecutionUnitRuntimeContext(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: ExecutionUnitRuntimeContext):
     # array_type: single 
@@ -105,41 +77,20 @@ def binary_write_recursive_ExecutionUnitRuntimeContext(parent_off: int, bw_conta
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.config_hash)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: epoch 
     # type_name: uint8 
     # offset: 4 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 4
-
-    
-    bin = binary_io.typeTobin(type, py_obj.epoch)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: owner_id 
     # type_name: uint8 
     # offset: 5 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 5
 
-    
-    bin = binary_io.typeTobin(type, py_obj.owner_id)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.config_hash, py_obj.epoch, py_obj.owner_id), expected_offset=parent_off + 0)
     
     # array_type: varray 
     # data_type: primitive 
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<IH")  # config_hash, unit_count
 
-def pdu_to_py_ExecutionUnitRuntimeStatus(binary_data: bytearray) -> ExecutionUnitRuntimeStatus:
-    py_obj = ExecutionUnitRuntimeStatus()
+
+def pdu_to_py_ExecutionUnitRuntimeStatus(binary_data: bytearray, out: ExecutionUnitRuntimeStatus = None, array_mode: str = None) -> ExecutionUnitRuntimeStatus:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = ExecutionUnitRuntimeStatus() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_ExecutionUnitRuntimeStatus(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,11 +31,6 @@ def binary_read_recursive_ExecutionUnitRuntimeStatus(meta: binary_io.PduMetaData
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.config_hash = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: unit_count 
@@ -37,9 +38,7 @@ def binary_read_recursive_ExecutionUnitRuntimeStatus(meta: binary_io.PduMetaData
     # offset: 4 size: 2 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 2)
-    py_obj.unit_count = binary_io.binTovalue("uint16", bin)
+    py_obj.config_hash, py_obj.unit_count = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     # array_type: varray 
     # data_type: primitive 
@@ -51,9 +50,7 @@ def binary_read_recursive_ExecutionUnitRuntimeStatus(meta: binary_io.PduMetaData
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 8, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 8 + 4, 4))
     one_elm_size = 1 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.status = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.status = read_array_values(meta, "uint8", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: varray 
@@ -66,9 +63,7 @@ def binary_read_recursive_ExecutionUnitRuntimeStatus(meta: binary_io.PduMetaData
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 16, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 16 + 4, 4))
     one_elm_size = 1 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.epoch = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.epoch = read_array_values(meta, "uint8", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: varray 
@@ -81,9 +76,7 @@ def binary_read_recursive_ExecutionUnitRuntimeStatus(meta: binary_io.PduMetaData
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 24, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 24 + 4, 4))
     one_elm_size = 1 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.curr_owner_node_id = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.curr_owner_node_id = read_array_values(meta, "uint8", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: varray 
@@ -96,41 +89,19 @@ def binary_read_recursive_ExecutionUnitRuntimeStatus(meta: binary_io.PduMetaData
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 32, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 32 + 4, 4))
     one_elm_size = 1 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.next_owner_node_id = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.next_owner_node_id = read_array_values(meta, "uint8", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     return py_obj
 
 
-def py_to_pdu_ExecutionUnitRuntimeStatus(py_obj: ExecutionUnitRuntimeStatus) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_ExecutionUnitRuntimeStatus(py_obj: ExecutionUnitRuntimeStatus, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_ExecutionUnitRuntimeStatus(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_ExecutionUnitRuntimeStatus(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: ExecutionUnitRuntimeStatus):
     # array_type: single 
@@ -139,27 +110,14 @@ def binary_write_recursive_ExecutionUnitRuntimeStatus(parent_off: int, bw_contai
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.config_hash)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: unit_count 
     # type_name: uint16 
     # offset: 4 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 4
 
-    
-    bin = binary_io.typeTobin(type, py_obj.unit_count)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.config_hash, py_obj.unit_count), expected_offset=parent_off + 0)
     
     # array_type: varray 
     # data_type: primitive 
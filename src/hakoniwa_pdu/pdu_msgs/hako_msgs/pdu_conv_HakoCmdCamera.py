@@ -8,13 +8,19 @@ from .. import binary_io
 from ..hako_msgs.pdu_conv_HakoCmdHeader import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ii")  # request_id, encode_type
 
-def pdu_to_py_HakoCmdCamera(binary_data: bytearray) -> HakoCmdCamera:
-    py_obj = HakoCmdCamera()
+
+def pdu_to_py_HakoCmdCamera(binary_data: bytearray, out: HakoCmdCamera = None, array_mode: str = None) -> HakoCmdCamera:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = HakoCmdCamera() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_HakoCmdCamera(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,7 +33,7 @@ def binary_read_recursive_HakoCmdCamera(meta: binary_io.PduMetaData, binary_data
     # offset: 0 size: 12 
     # array_len: 1
 
-    tmp_py_obj = HakoCmdHeader()
+    tmp_py_obj = reuse_obj(py_obj.header, HakoCmdHeader)
     binary_read_recursive_HakoCmdHeader(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -37,11 +43,6 @@ def binary_read_recursive_HakoCmdCamera(meta: binary_io.PduMetaData, binary_data
     # type_name: int32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.request_id = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: encode_type 
@@ -49,40 +50,18 @@ def binary_read_recursive_HakoCmdCamera(meta: binary_io.PduMetaData, binary_data
     # offset: 16 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.encode_type = binary_io.binTovalue("int32", bin)
+    py_obj.request_id, py_obj.encode_type = _RUN_0.unpack_from(binary_data, base_off + 12)
     
     return py_obj
 
 
-def py_to_pdu_HakoCmdCamera(py_obj: HakoCmdCamera) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_HakoCmdCamera(py_obj: HakoCmdCamera, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_HakoCmdCamera(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_HakoCmdCamera(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: HakoCmdCamera):
     # array_type: single 
@@ -102,27 +81,14 @@ def binary_write_recursive_HakoCmdCamera(parent_off: int, bw_container: BinaryWr
     # type_name: int32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.request_id)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: encode_type 
     # type_name: int32 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 16
 
-    
-    bin = binary_io.typeTobin(type, py_obj.encode_type)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.request_id, py_obj.encode_type), expected_offset=parent_off + 12)
     
 
 if __name__ == "__main__":
@@ -8,13 +8,19 @@ from .. import binary_io
 from ..hako_msgs.pdu_conv_HakoCmdHeader import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<i")  # magnet_on
 
-def pdu_to_py_HakoCmdMagnetHolder(binary_data: bytearray) -> HakoCmdMagnetHolder:
-    py_obj = HakoCmdMagnetHolder()
+
+def pdu_to_py_HakoCmdMagnetHolder(binary_data: bytearray, out: HakoCmdMagnetHolder = None, array_mode: str = None) -> HakoCmdMagnetHolder:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = HakoCmdMagnetHolder() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_HakoCmdMagnetHolder(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,7 +33,7 @@ def binary_read_recursive_HakoCmdMagnetHolder(meta: binary_io.PduMetaData, binar
     # offset: 0 size: 12 
     # array_len: 1
 
-    tmp_py_obj = HakoCmdHeader()
+    tmp_py_obj = reuse_obj(py_obj.header, HakoCmdHeader)
     binary_read_recursive_HakoCmdHeader(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -38,40 +44,19 @@ def binary_read_recursive_HakoCmdMagnetHolder(meta: binary_io.PduMetaData, binar
     # offset: 12 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.magnet_on = binary_io.binTovalue("bool", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 12)
+    py_obj.magnet_on = values[0] != 0
     
     return py_obj
 
 
-def py_to_pdu_HakoCmdMagnetHolder(py_obj: HakoCmdMagnetHolder) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_HakoCmdMagnetHolder(py_obj: HakoCmdMagnetHolder, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_HakoCmdMagnetHolder(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_HakoCmdMagnetHolder(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: HakoCmdMagnetHolder):
     # array_type: single 
@@ -91,13 +76,8 @@ def binary_write_recursive_HakoCmdMagnetHolder(parent_off: int, bw_container: Bi
     # type_name: bool 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 12
 
-    
-    bin = binary_io.typeTobin(type, py_obj.magnet_on)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(1 if py_obj.magnet_on else 0), expected_offset=parent_off + 12)
     
 
 if __name__ == "__main__":
@@ -8,13 +8,19 @@ from .. import binary_io
 from ..hako_msgs.pdu_conv_HakoDroneCmdHeader import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ddddd")  # x, y, z, speed, yaw_deg
 
-def pdu_to_py_HakoDroneCmdMove(binary_data: bytearray) -> HakoDroneCmdMove:
-    py_obj = HakoDroneCmdMove()
+
+def pdu_to_py_HakoDroneCmdMove(binary_data: bytearray, out: HakoDroneCmdMove = None, array_mode: str = None) -> HakoDroneCmdMove:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = HakoDroneCmdMove() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_HakoDroneCmdMove(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,7 +33,7 @@ def binary_read_recursive_HakoDroneCmdMove(meta: binary_io.PduMetaData, binary_d
     # offset: 0 size: 12 
     # array_len: 1
 
-    tmp_py_obj = HakoDroneCmdHeader()
+    tmp_py_obj = reuse_obj(py_obj.header, HakoDroneCmdHeader)
     binary_read_recursive_HakoDroneCmdHeader(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -37,44 +43,24 @@ def binary_read_recursive_HakoDroneCmdMove(meta: binary_io.PduMetaData, binary_d
     # type_name: float64 
     # offset: 16 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 8)
-    py_obj.x = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: y 
     # type_name: float64 
     # offset: 24 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 24, 8)
-    py_obj.y = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: z 
     # type_name: float64 
     # offset: 32 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 32, 8)
-    py_obj.z = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: speed 
     # type_name: float64 
     # offset: 40 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 40, 8)
-    py_obj.speed = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw_deg 
@@ -82,40 +68,18 @@ def binary_read_recursive_HakoDroneCmdMove(meta: binary_io.PduMetaData, binary_d
     # offset: 48 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 48, 8)
-    py_obj.yaw_deg = binary_io.binTovalue("float64", bin)
+    py_obj.x, py_obj.y, py_obj.z, py_obj.speed, py_obj.yaw_deg = _RUN_0.unpack_from(binary_data, base_off + 16)
     
     return py_obj
 
 
-def py_to_pdu_HakoDroneCmdMove(py_obj: HakoDroneCmdMove) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_HakoDroneCmdMove(py_obj: HakoDroneCmdMove, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_HakoDroneCmdMove(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_HakoDroneCmdMove(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: HakoDroneCmdMove):
     # array_type: single 
@@ -135,69 +99,32 @@ def binary_write_recursive_HakoDroneCmdMove(parent_off: int, bw_container: Binar
     # type_name: float64 
     # offset: 16 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.x)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: y 
     # type_name: float64 
     # offset: 24 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 24
-
-    
-    bin = binary_io.typeTobin(type, py_obj.y)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: z 
     # type_name: float64 
     # offset: 32 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 32
-
-    
-    bin = binary_io.typeTobin(type, py_obj.z)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: speed 
     # type_name: float64 
     # offset: 40 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 40
-
-    
-    bin = binary_io.typeTobin(type, py_obj.speed)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw_deg 
     # type_name: float64 
     # offset: 48 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 48
 
-    
-    bin = binary_io.typeTobin(type, py_obj.yaw_deg)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.x, py_obj.y, py_obj.z, py_obj.speed, py_obj.yaw_deg), expected_offset=parent_off + 16)
     
 
 if __name__ == "__main__":
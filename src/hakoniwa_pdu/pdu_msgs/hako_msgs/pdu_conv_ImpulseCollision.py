@@ -14,13 +14,20 @@ from ..geometry_msgs.pdu_conv_Vector3 import *
 from ..geometry_msgs.pdu_conv_Vector3 import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<iid")  # collision, is_target_static, restitution_coefficient
+_RUN_1 = struct.Struct("<d")  # target_mass
 
-def pdu_to_py_ImpulseCollision(binary_data: bytearray) -> ImpulseCollision:
-    py_obj = ImpulseCollision()
+
+def pdu_to_py_ImpulseCollision(binary_data: bytearray, out: ImpulseCollision = None, array_mode: str = None) -> ImpulseCollision:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = ImpulseCollision() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_ImpulseCollision(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -32,22 +39,12 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # type_name: bool 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.collision = binary_io.binTovalue("bool", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_target_static 
     # type_name: bool 
     # offset: 4 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.is_target_static = binary_io.binTovalue("bool", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: restitution_coefficient 
@@ -55,9 +52,10 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # offset: 8 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 8)
-    py_obj.restitution_coefficient = binary_io.binTovalue("float64", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 0)
+    py_obj.collision = values[0] != 0
+    py_obj.is_target_static = values[1] != 0
+    py_obj.restitution_coefficient = values[2]
     
     # array_type: single 
     # data_type: struct 
@@ -66,7 +64,7 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # offset: 16 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Point()
+    tmp_py_obj = reuse_obj(py_obj.self_contact_vector, Point)
     binary_read_recursive_Point(meta, binary_data, tmp_py_obj, base_off + 16)
     py_obj.self_contact_vector = tmp_py_obj
     
@@ -77,7 +75,7 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # offset: 40 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.normal, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 40)
     py_obj.normal = tmp_py_obj
     
@@ -88,7 +86,7 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # offset: 64 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Point()
+    tmp_py_obj = reuse_obj(py_obj.target_contact_vector, Point)
     binary_read_recursive_Point(meta, binary_data, tmp_py_obj, base_off + 64)
     py_obj.target_contact_vector = tmp_py_obj
     
@@ -99,7 +97,7 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # offset: 88 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.target_velocity, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 88)
     py_obj.target_velocity = tmp_py_obj
     
@@ -110,7 +108,7 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # offset: 112 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.target_angular_velocity, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 112)
     py_obj.target_angular_velocity = tmp_py_obj
     
@@ -121,7 +119,7 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # offset: 136 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.target_euler, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 136)
     py_obj.target_euler = tmp_py_obj
     
@@ -132,7 +130,7 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # offset: 160 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.target_inertia, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 160)
     py_obj.target_inertia = tmp_py_obj
     
@@ -143,40 +141,18 @@ def binary_read_recursive_ImpulseCollision(meta: binary_io.PduMetaData, binary_d
     # offset: 184 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 184, 8)
-    py_obj.target_mass = binary_io.binTovalue("float64", bin)
+    py_obj.target_mass = _RUN_1.unpack_from(binary_data, base_off + 184)[0]
     
     return py_obj
 
 
-def py_to_pdu_ImpulseCollision(py_obj: ImpulseCollision) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_ImpulseCollision(py_obj: ImpulseCollision, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_ImpulseCollision(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_ImpulseCollision(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: ImpulseCollision):
     # array_type: single 
@@ -185,41 +161,20 @@ def binary_write_recursive_ImpulseCollision(parent_off: int, bw_container: Binar
     # type_name: bool 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.collision)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_target_static 
     # type_name: bool 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 4
-
-    
-    bin = binary_io.typeTobin(type, py_obj.is_target_static)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: restitution_coefficient 
     # type_name: float64 
     # offset: 8 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 8
 
-    
-    bin = binary_io.typeTobin(type, py_obj.restitution_coefficient)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(1 if py_obj.collision else 0, 1 if py_obj.is_target_static else 0, py_obj.restitution_coefficient), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -304,13 +259,8 @@ def binary_write_recursive_ImpulseCollision(parent_off: int, bw_container: Binar
     # type_name: float64 
     # offset: 184 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 184
 
-    
-    bin = binary_io.typeTobin(type, py_obj.target_mass)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.target_mass), expected_offset=parent_off + 184)
     
 
 if __name__ == "__main__":
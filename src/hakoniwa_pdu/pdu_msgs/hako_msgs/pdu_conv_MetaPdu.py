@@ -7,13 +7,20 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<IIHHIQQQ")  # total_len, magicno, version, flags, meta_request_type, hako_time_us, asset_time_us, real_time_us
+_RUN_1 = struct.Struct("<iI")  # channel_id, body_len
 
-def pdu_to_py_MetaPdu(binary_data: bytearray) -> MetaPdu:
-    py_obj = MetaPdu()
+
+def pdu_to_py_MetaPdu(binary_data: bytearray, out: MetaPdu = None, array_mode: str = None) -> MetaPdu:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = MetaPdu() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_MetaPdu(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,77 +32,42 @@ def binary_read_recursive_MetaPdu(meta: binary_io.PduMetaData, binary_data: byte
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.total_len = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: magicno 
     # type_name: uint32 
     # offset: 4 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.magicno = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: version 
     # type_name: uint16 
     # offset: 8 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 2)
-    py_obj.version = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: flags 
     # type_name: uint16 
     # offset: 10 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 10, 2)
-    py_obj.flags = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: meta_request_type 
     # type_name: uint32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.meta_request_type = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: hako_time_us 
     # type_name: uint64 
     # offset: 16 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 8)
-    py_obj.hako_time_us = binary_io.binTovalue("uint64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: asset_time_us 
     # type_name: uint64 
     # offset: 24 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 24, 8)
-    py_obj.asset_time_us = binary_io.binTovalue("uint64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: real_time_us 
@@ -103,9 +75,7 @@ def binary_read_recursive_MetaPdu(meta: binary_io.PduMetaData, binary_data: byte
     # offset: 32 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 32, 8)
-    py_obj.real_time_us = binary_io.binTovalue("uint64", bin)
+    py_obj.total_len, py_obj.magicno, py_obj.version, py_obj.flags, py_obj.meta_request_type, py_obj.hako_time_us, py_obj.asset_time_us, py_obj.real_time_us = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     # array_type: single 
     # data_type: primitive 
@@ -124,11 +94,6 @@ def binary_read_recursive_MetaPdu(meta: binary_io.PduMetaData, binary_data: byte
     # type_name: int32 
     # offset: 168 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 168, 4)
-    py_obj.channel_id = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: body_len 
@@ -136,40 +101,18 @@ def binary_read_recursive_MetaPdu(meta: binary_io.PduMetaData, binary_data: byte
     # offset: 172 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 172, 4)
-    py_obj.body_len = binary_io.binTovalue("uint32", bin)
+    py_obj.channel_id, py_obj.body_len = _RUN_1.unpack_from(binary_data, base_off + 168)
     
     return py_obj
 
 
-def py_to_pdu_MetaPdu(py_obj: MetaPdu) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_MetaPdu(py_obj: MetaPdu, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_MetaPdu(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_MetaPdu(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: MetaPdu):
     # array_type: single 
@@ -178,111 +121,50 @@ def binary_write_recursive_MetaPdu(parent_off: int, bw_container: BinaryWriterCo
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.total_len)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: magicno 
     # type_name: uint32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 4
-
-    
-    bin = binary_io.typeTobin(type, py_obj.magicno)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: version 
     # type_name: uint16 
     # offset: 8 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.version)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: flags 
     # type_name: uint16 
     # offset: 10 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 10
-
-    
-    bin = binary_io.typeTobin(type, py_obj.flags)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: meta_request_type 
     # type_name: uint32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.meta_request_type)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: hako_time_us 
     # type_name: uint64 
     # offset: 16 size: 8 
     # array_len: 1
-    type = "uint64"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.hako_time_us)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: asset_time_us 
     # type_name: uint64 
     # offset: 24 size: 8 
     # array_len: 1
-    type = "uint64"
-    off = 24
-
-    
-    bin = binary_io.typeTobin(type, py_obj.asset_time_us)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: real_time_us 
     # type_name: uint64 
     # offset: 32 size: 8 
     # array_len: 1
-    type = "uint64"
-    off = 32
 
-    
-    bin = binary_io.typeTobin(type, py_obj.real_time_us)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.total_len, py_obj.magicno, py_obj.version, py_obj.flags, py_obj.meta_request_type, py_obj.hako_time_us, py_obj.asset_time_us, py_obj.real_time_us), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: primitive 
@@ -304,27 +186,14 @@ def binary_write_recursive_MetaPdu(parent_off: int, bw_container: BinaryWriterCo
     # type_name: int32 
     # offset: 168 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 168
-
-    
-    bin = binary_io.typeTobin(type, py_obj.channel_id)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: body_len 
     # type_name: uint32 
     # offset: 172 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 172
 
-    
-    bin = binary_io.typeTobin(type, py_obj.body_len)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.channel_id, py_obj.body_len), expected_offset=parent_off + 168)
     
 
 if __name__ == "__main__":
@@ -8,13 +8,19 @@ from .. import binary_io
 from ..hako_msgs.pdu_conv_HakoCmdHeader import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<iii")  # request_id, encode_type, request_type
 
-def pdu_to_py_MonitorCameraCmd(binary_data: bytearray) -> MonitorCameraCmd:
-    py_obj = MonitorCameraCmd()
+
+def pdu_to_py_MonitorCameraCmd(binary_data: bytearray, out: MonitorCameraCmd = None, array_mode: str = None) -> MonitorCameraCmd:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = MonitorCameraCmd() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_MonitorCameraCmd(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,7 +33,7 @@ def binary_read_recursive_MonitorCameraCmd(meta: binary_io.PduMetaData, binary_d
     # offset: 0 size: 12 
     # array_len: 1
 
-    tmp_py_obj = HakoCmdHeader()
+    tmp_py_obj = reuse_obj(py_obj.header, HakoCmdHeader)
     binary_read_recursive_HakoCmdHeader(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -37,22 +43,12 @@ def binary_read_recursive_MonitorCameraCmd(meta: binary_io.PduMetaData, binary_d
     # type_name: int32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.request_id = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: encode_type 
     # type_name: int32 
     # offset: 16 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.encode_type = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: request_type 
@@ -60,40 +56,18 @@ def binary_read_recursive_MonitorCameraCmd(meta: binary_io.PduMetaData, binary_d
     # offset: 20 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 20, 4)
-    py_obj.request_type = binary_io.binTovalue("int32", bin)
+    py_obj.request_id, py_obj.encode_type, py_obj.request_type = _RUN_0.unpack_from(binary_data, base_off + 12)
     
     return py_obj
 
 
-def py_to_pdu_MonitorCameraCmd(py_obj: MonitorCameraCmd) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_MonitorCameraCmd(py_obj: MonitorCameraCmd, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_MonitorCameraCmd(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_MonitorCameraCmd(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: MonitorCameraCmd):
     # array_type: single 
@@ -113,41 +87,20 @@ def binary_write_recursive_MonitorCameraCmd(parent_off: int, bw_container: Binar
     # type_name: int32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.request_id)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: encode_type 
     # type_name: int32 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.encode_type)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: request_type 
     # type_name: int32 
     # offset: 20 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 20
 
-    
-    bin = binary_io.typeTobin(type, py_obj.request_type)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.request_id, py_obj.encode_type, py_obj.request_type), expected_offset=parent_off + 12)
     
 
 if __name__ == "__main__":
@@ -8,13 +8,19 @@ from .. import binary_io
 from ..sensor_msgs.pdu_conv_CompressedImage import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ii")  # request_id, image_data_length
 
-def pdu_to_py_MonitorCameraData(binary_data: bytearray) -> MonitorCameraData:
-    py_obj = MonitorCameraData()
+
+def pdu_to_py_MonitorCameraData(binary_data: bytearray, out: MonitorCameraData = None, array_mode: str = None) -> MonitorCameraData:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = MonitorCameraData() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_MonitorCameraData(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -26,11 +32,6 @@ def binary_read_recursive_MonitorCameraData(meta: binary_io.PduMetaData, binary_
     # type_name: int32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.request_id = binary_io.binTovalue("int32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: image_data_length 
@@ -38,9 +39,7 @@ def binary_read_recursive_MonitorCameraData(meta: binary_io.PduMetaData, binary_
     # offset: 4 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.image_data_length = binary_io.binTovalue("int32", bin)
+    py_obj.request_id, py_obj.image_data_length = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -49,40 +48,20 @@ def binary_read_recursive_MonitorCameraData(meta: binary_io.PduMetaData, binary_
     # offset: 8 size: 272 
     # array_len: 1
 
-    tmp_py_obj = CompressedImage()
+    tmp_py_obj = reuse_obj(py_obj.image, CompressedImage)
     binary_read_recursive_CompressedImage(meta, binary_data, tmp_py_obj, base_off + 8)
     py_obj.image = tmp_py_obj
     
     return py_obj
 
 
-def py_to_pdu_MonitorCameraData(py_obj: MonitorCameraData) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_MonitorCameraData(py_obj: MonitorCameraData, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_MonitorCameraData(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_MonitorCameraData(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: MonitorCameraData):
     # array_type: single 
@@ -91,27 +70,14 @@ def binary_write_recursive_MonitorCameraData(parent_off: int, bw_container: Bina
     # type_name: int32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.request_id)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: image_data_length 
     # type_name: int32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 4
 
-    
-    bin = binary_io.typeTobin(type, py_obj.image_data_length)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.request_id, py_obj.image_data_length), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: struct 
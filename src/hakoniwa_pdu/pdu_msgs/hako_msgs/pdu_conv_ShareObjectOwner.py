@@ -8,13 +8,19 @@ from .. import binary_io
 from ..geometry_msgs.pdu_conv_Twist import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<I4xQ")  # owner_id, last_update
 
-def pdu_to_py_ShareObjectOwner(binary_data: bytearray) -> ShareObjectOwner:
-    py_obj = ShareObjectOwner()
+
+def pdu_to_py_ShareObjectOwner(binary_data: bytearray, out: ShareObjectOwner = None, array_mode: str = None) -> ShareObjectOwner:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = ShareObjectOwner() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_ShareObjectOwner(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -37,11 +43,6 @@ def binary_read_recursive_ShareObjectOwner(meta: binary_io.PduMetaData, binary_d
     # type_name: uint32 
     # offset: 128 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 128, 4)
-    py_obj.owner_id = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: last_update 
@@ -49,9 +50,7 @@ def binary_read_recursive_ShareObjectOwner(meta: binary_io.PduMetaData, binary_d
     # offset: 136 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 8)
-    py_obj.last_update = binary_io.binTovalue("uint64", bin)
+    py_obj.owner_id, py_obj.last_update = _RUN_0.unpack_from(binary_data, base_off + 128)
     
     # array_type: single 
     # data_type: struct 
@@ -60,40 +59,20 @@ def binary_read_recursive_ShareObjectOwner(meta: binary_io.PduMetaData, binary_d
     # offset: 144 size: 48 
     # array_len: 1
 
-    tmp_py_obj = Twist()
+    tmp_py_obj = reuse_obj(py_obj.pos, Twist)
     binary_read_recursive_Twist(meta, binary_data, tmp_py_obj, base_off + 144)
     py_obj.pos = tmp_py_obj
     
     return py_obj
 
 
-def py_to_pdu_ShareObjectOwner(py_obj: ShareObjectOwner) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_ShareObjectOwner(py_obj: ShareObjectOwner, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_ShareObjectOwner(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_ShareObjectOwner(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: ShareObjectOwner):
     # array_type: single 
@@ -116,27 +95,14 @@ def binary_write_recursive_ShareObjectOwner(parent_off: int, bw_container: Binar
     # type_name: uint32 
     # offset: 128 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 128
-
-    
-    bin = binary_io.typeTobin(type, py_obj.owner_id)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: last_update 
     # type_name: uint64 
     # offset: 136 size: 8 
     # array_len: 1
-    type = "uint64"
-    off = 136
 
-    
-    bin = binary_io.typeTobin(type, py_obj.last_update)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.owner_id, py_obj.last_update), expected_offset=parent_off + 128)
     
     # array_type: single 
     # data_type: struct 
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<IIi")  # request_type, owner_id, accepted
 
-def pdu_to_py_ShareObjectOwnerResponse(binary_data: bytearray) -> ShareObjectOwnerResponse:
-    py_obj = ShareObjectOwnerResponse()
+
+def pdu_to_py_ShareObjectOwnerResponse(binary_data: bytearray, out: ShareObjectOwnerResponse = None, array_mode: str = None) -> ShareObjectOwnerResponse:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = ShareObjectOwnerResponse() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_ShareObjectOwnerResponse(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -36,22 +42,12 @@ def binary_read_recursive_ShareObjectOwnerResponse(meta: binary_io.PduMetaData,
     # type_name: uint32 
     # offset: 128 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 128, 4)
-    py_obj.request_type = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: owner_id 
     # type_name: uint32 
     # offset: 132 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 132, 4)
-    py_obj.owner_id = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: accepted 
@@ -59,40 +55,21 @@ def binary_read_recursive_ShareObjectOwnerResponse(meta: binary_io.PduMetaData,
     # offset: 136 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 4)
-    py_obj.accepted = binary_io.binTovalue("bool", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 128)
+    py_obj.request_type = values[0]
+    py_obj.owner_id = values[1]
+    py_obj.accepted = values[2] != 0
     
     return py_obj
 
 
-def py_to_pdu_ShareObjectOwnerResponse(py_obj: ShareObjectOwnerResponse) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_ShareObjectOwnerResponse(py_obj: ShareObjectOwnerResponse, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_ShareObjectOwnerResponse(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_ShareObjectOwnerResponse(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: ShareObjectOwnerResponse):
     # array_type: single 
@@ -115,41 +92,20 @@ def binary_write_recursive_ShareObjectOwnerResponse(parent_off: int, bw_containe
     # type_name: uint32 
     # offset: 128 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 128
-
-    
-    bin = binary_io.typeTobin(type, py_obj.request_type)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: owner_id 
     # type_name: uint32 
     # offset: 132 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 132
-
-    
-    bin = binary_io.typeTobin(type, py_obj.owner_id)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: accepted 
     # type_name: bool 
     # offset: 136 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 136
 
-    
-    bin = binary_io.typeTobin(type, py_obj.accepted)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.request_type, py_obj.owner_id, 1 if py_obj.accepted else 0), expected_offset=parent_off + 128)
     
 
 if __name__ == "__main__":
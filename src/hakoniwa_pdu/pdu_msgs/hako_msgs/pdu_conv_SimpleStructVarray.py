@@ -9,13 +9,19 @@ from ..hako_msgs.pdu_conv_SimpleVarray import *
 from ..hako_msgs.pdu_conv_SimpleVarray import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<i")  # aaa
 
-def pdu_to_py_SimpleStructVarray(binary_data: bytearray) -> SimpleStructVarray:
-    py_obj = SimpleStructVarray()
+
+def pdu_to_py_SimpleStructVarray(binary_data: bytearray, out: SimpleStructVarray = None, array_mode: str = None) -> SimpleStructVarray:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = SimpleStructVarray() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_SimpleStructVarray(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,9 +34,7 @@ def binary_read_recursive_SimpleStructVarray(meta: binary_io.PduMetaData, binary
     # offset: 0 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.aaa = binary_io.binTovalue("int32", bin)
+    py_obj.aaa = _RUN_0.unpack_from(binary_data, base_off + 0)[0]
     
     # array_type: array 
     # data_type: primitive 
@@ -70,11 +74,10 @@ def binary_read_recursive_SimpleStructVarray(meta: binary_io.PduMetaData, binary
     i = 0
     array_size = 5
     one_elm_size = int(120 / array_size)
-    array_value = []
+    array_value = reuse_list(py_obj.fixed_array, array_size, SimpleVarray)
     while i < array_size:
-        tmp_py_obj = SimpleVarray()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_SimpleVarray(meta, binary_data, tmp_py_obj, base_off + 268 + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.fixed_array = array_value    
     
@@ -89,44 +92,23 @@ def binary_read_recursive_SimpleStructVarray(meta: binary_io.PduMetaData, binary
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 388 + 4, 4))
     one_elm_size = 24
     i = 0
-    array_value = []
+    array_value = reuse_list(py_obj.data, array_size, SimpleVarray)
     while i < array_size:
-        tmp_py_obj = SimpleVarray()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_SimpleVarray(meta, binary_data, tmp_py_obj, meta.heap_off + offset_from_heap + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.data = array_value    
     
     return py_obj
 
 
-def py_to_pdu_SimpleStructVarray(py_obj: SimpleStructVarray) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_SimpleStructVarray(py_obj: SimpleStructVarray, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_SimpleStructVarray(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_SimpleStructVarray(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: SimpleStructVarray):
     # array_type: single 
@@ -135,13 +117,8 @@ def binary_write_recursive_SimpleStructVarray(parent_off: int, bw_container: Bin
     # type_name: int32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 0
 
-    
-    bin = binary_io.typeTobin(type, py_obj.aaa)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.aaa), expected_offset=parent_off + 0)
     
     # array_type: array 
     # data_type: primitive 
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<i")  # p_mem1
 
-def pdu_to_py_SimpleVarray(binary_data: bytearray) -> SimpleVarray:
-    py_obj = SimpleVarray()
+
+def pdu_to_py_SimpleVarray(binary_data: bytearray, out: SimpleVarray = None, array_mode: str = None) -> SimpleVarray:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = SimpleVarray() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_SimpleVarray(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -29,9 +35,7 @@ def binary_read_recursive_SimpleVarray(meta: binary_io.PduMetaData, binary_data:
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 0, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 0 + 4, 4))
     one_elm_size = 1 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.data = binary_io.binToArrayValues("int8", array_value)
+    py_obj.data = read_array_values(meta, "int8", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: array 
@@ -42,9 +46,7 @@ def binary_read_recursive_SimpleVarray(meta: binary_io.PduMetaData, binary_data:
     # array_len: 10
 
     
-    array_value = binary_io.readBinary(binary_data, base_off + 8, 10)
-    
-    py_obj.fixed_array = binary_io.binToArrayValues("int8", array_value)
+    py_obj.fixed_array = read_array_values(meta, "int8", binary_data, base_off + 8, 10)
     
     
     # array_type: single 
@@ -54,40 +56,18 @@ def binary_read_recursive_SimpleVarray(meta: binary_io.PduMetaData, binary_data:
     # offset: 20 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 20, 4)
-    py_obj.p_mem1 = binary_io.binTovalue("int32", bin)
+    py_obj.p_mem1 = _RUN_0.unpack_from(binary_data, base_off + 20)[0]
     
     return py_obj
 
 
-def py_to_pdu_SimpleVarray(py_obj: SimpleVarray) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_SimpleVarray(py_obj: SimpleVarray, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_SimpleVarray(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_SimpleVarray(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: SimpleVarray):
     # array_type: varray 
@@ -127,13 +107,8 @@ def binary_write_recursive_SimpleVarray(parent_off: int, bw_container: BinaryWri
     # type_name: int32 
     # offset: 20 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 20
 
-    
-    bin = binary_io.typeTobin(type, py_obj.p_mem1)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.p_mem1), expected_offset=parent_off + 20)
     
 
 if __name__ == "__main__":
@@ -12,6 +12,8 @@ class Collision:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("collision", "contact_num", "relative_velocity", "contact_position", "restitution_coefficient")
+
     collision: bool
     contact_num: int
     relative_velocity: Vector3
@@ -42,56 +44,11 @@ class Collision:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'collision'
-        field_val = self.collision
-        if isinstance(field_val, bytearray):
-            d['collision'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['collision'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['collision'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['collision'] = field_val
-        # handle field 'contact_num'
-        field_val = self.contact_num
-        if isinstance(field_val, bytearray):
-            d['contact_num'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['contact_num'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['contact_num'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['contact_num'] = field_val
-        # handle field 'relative_velocity'
-        field_val = self.relative_velocity
-        if isinstance(field_val, bytearray):
-            d['relative_velocity'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['relative_velocity'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['relative_velocity'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['relative_velocity'] = field_val
-        # handle field 'contact_position'
-        field_val = self.contact_position
-        if isinstance(field_val, bytearray):
-            d['contact_position'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['contact_position'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['contact_position'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['contact_position'] = field_val
-        # handle field 'restitution_coefficient'
-        field_val = self.restitution_coefficient
-        if isinstance(field_val, bytearray):
-            d['restitution_coefficient'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['restitution_coefficient'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['restitution_coefficient'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['restitution_coefficient'] = field_val
+        d['collision'] = self.collision
+        d['contact_num'] = self.contact_num
+        d['relative_velocity'] = self.relative_velocity.to_dict()
+        d['contact_position'] = [item.to_dict() for item in self.contact_position]
+        d['restitution_coefficient'] = self.restitution_coefficient
         return d
 
     @classmethod
@@ -99,92 +56,13 @@ class Collision:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'collision'
-        if 'collision' in d:
-            field_type = cls.__annotations__.get('collision')
-            value = d['collision']
-            
-            if field_type is bytearray:
-                obj.collision = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.collision = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.collision = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.collision = field_type.from_dict(value)
-            else:
-                obj.collision = value
-        # handle field 'contact_num'
-        if 'contact_num' in d:
-            field_type = cls.__annotations__.get('contact_num')
-            value = d['contact_num']
-            
-            if field_type is bytearray:
-                obj.contact_num = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.contact_num = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.contact_num = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.contact_num = field_type.from_dict(value)
-            else:
-                obj.contact_num = value
-        # handle field 'relative_velocity'
-        if 'relative_velocity' in d:
-            field_type = cls.__annotations__.get('relative_velocity')
-            value = d['relative_velocity']
-            
-            if field_type is bytearray:
-                obj.relative_velocity = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.relative_velocity = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.relative_velocity = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.relative_velocity = field_type.from_dict(value)
-            else:
-                obj.relative_velocity = value
-        # handle field 'contact_position'
-        if 'contact_position' in d:
-            field_type = cls.__annotations__.get('contact_position')
-            value = d['contact_position']
-            
-            if field_type is bytearray:
-                obj.contact_position = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.contact_position = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.contact_position = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.contact_position = field_type.from_dict(value)
-            else:
-                obj.contact_position = value
-        # handle field 'restitution_coefficient'
-        if 'restitution_coefficient' in d:
-            field_type = cls.__annotations__.get('restitution_coefficient')
-            value = d['restitution_coefficient']
-            
-            if field_type is bytearray:
-                obj.restitution_coefficient = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.restitution_coefficient = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.restitution_coefficient = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.restitution_coefficient = field_type.from_dict(value)
-            else:
-                obj.restitution_coefficient = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.collision = d.get('collision', False)
+        obj.contact_num = d.get('contact_num', 0)
+        obj.relative_velocity = Vector3.from_dict(d['relative_velocity']) if 'relative_velocity' in d else Vector3()
+        obj.contact_position = [Point.from_dict(item) for item in d['contact_position']] if 'contact_position' in d else []
+        obj.restitution_coefficient = d.get('restitution_coefficient', 0.0)
         return obj
 
     def to_json(self, indent=2):
@@ -17,6 +17,8 @@ class Disturbance:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("d_temp", "d_wind", "d_atm", "d_boundary", "d_user_custom")
+
     d_temp: DisturbanceTemperature
     d_wind: DisturbanceWind
     d_atm: DisturbanceAtm
@@ -47,56 +49,11 @@ class Disturbance:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'd_temp'
-        field_val = self.d_temp
-        if isinstance(field_val, bytearray):
-            d['d_temp'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['d_temp'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['d_temp'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['d_temp'] = field_val
-        # handle field 'd_wind'
-        field_val = self.d_wind
-        if isinstance(field_val, bytearray):
-            d['d_wind'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['d_wind'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['d_wind'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['d_wind'] = field_val
-        # handle field 'd_atm'
-        field_val = self.d_atm
-        if isinstance(field_val, bytearray):
-            d['d_atm'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['d_atm'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['d_atm'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['d_atm'] = field_val
-        # handle field 'd_boundary'
-        field_val = self.d_boundary
-        if isinstance(field_val, bytearray):
-            d['d_boundary'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['d_boundary'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['d_boundary'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['d_boundary'] = field_val
-        # handle field 'd_user_custom'
-        field_val = self.d_user_custom
-        if isinstance(field_val, bytearray):
-            d['d_user_custom'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['d_user_custom'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['d_user_custom'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['d_user_custom'] = field_val
+        d['d_temp'] = self.d_temp.to_dict()
+        d['d_wind'] = self.d_wind.to_dict()
+        d['d_atm'] = self.d_atm.to_dict()
+        d['d_boundary'] = self.d_boundary.to_dict()
+        d['d_user_custom'] = [item.to_dict() for item in self.d_user_custom]
         return d
 
     @classmethod
@@ -104,92 +61,13 @@ class Disturbance:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'd_temp'
-        if 'd_temp' in d:
-            field_type = cls.__annotations__.get('d_temp')
-            value = d['d_temp']
-            
-            if field_type is bytearray:
-                obj.d_temp = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.d_temp = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.d_temp = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.d_temp = field_type.from_dict(value)
-            else:
-                obj.d_temp = value
-        # handle field 'd_wind'
-        if 'd_wind' in d:
-            field_type = cls.__annotations__.get('d_wind')
-            value = d['d_wind']
-            
-            if field_type is bytearray:
-                obj.d_wind = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.d_wind = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.d_wind = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.d_wind = field_type.from_dict(value)
-            else:
-                obj.d_wind = value
-        # handle field 'd_atm'
-        if 'd_atm' in d:
-            field_type = cls.__annotations__.get('d_atm')
-            value = d['d_atm']
-            
-            if field_type is bytearray:
-                obj.d_atm = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.d_atm = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.d_atm = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.d_atm = field_type.from_dict(value)
-            else:
-                obj.d_atm = value
-        # handle field 'd_boundary'
-        if 'd_boundary' in d:
-            field_type = cls.__annotations__.get('d_boundary')
-            value = d['d_boundary']
-            
-            if field_type is bytearray:
-                obj.d_boundary = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.d_boundary = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.d_boundary = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.d_boundary = field_type.from_dict(value)
-            else:
-                obj.d_boundary = value
-        # handle field 'd_user_custom'
-        if 'd_user_custom' in d:
-            field_type = cls.__annotations__.get('d_user_custom')
-            value = d['d_user_custom']
-            
-            if field_type is bytearray:
-                obj.d_user_custom = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.d_user_custom = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.d_user_custom = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.d_user_custom = field_type.from_dict(value)
-            else:
-                obj.d_user_custom = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.d_temp = DisturbanceTemperature.from_dict(d['d_temp']) if 'd_temp' in d else DisturbanceTemperature()
+        obj.d_wind = DisturbanceWind.from_dict(d['d_wind']) if 'd_wind' in d else DisturbanceWind()
+        obj.d_atm = DisturbanceAtm.from_dict(d['d_atm']) if 'd_atm' in d else DisturbanceAtm()
+        obj.d_boundary = DisturbanceBoundary.from_dict(d['d_boundary']) if 'd_boundary' in d else DisturbanceBoundary()
+        obj.d_user_custom = [DisturbanceUserCustom.from_dict(item) for item in d['d_user_custom']] if 'd_user_custom' in d else []
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class DisturbanceAtm:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("sea_level_atm",)
+
     sea_level_atm: float
 
     def __init__(self):
@@ -28,16 +30,7 @@ class DisturbanceAtm:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'sea_level_atm'
-        field_val = self.sea_level_atm
-        if isinstance(field_val, bytearray):
-            d['sea_level_atm'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['sea_level_atm'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['sea_level_atm'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['sea_level_atm'] = field_val
+        d['sea_level_atm'] = self.sea_level_atm
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class DisturbanceAtm:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'sea_level_atm'
-        if 'sea_level_atm' in d:
-            field_type = cls.__annotations__.get('sea_level_atm')
-            value = d['sea_level_atm']
-            
-            if field_type is bytearray:
-                obj.sea_level_atm = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.sea_level_atm = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.sea_level_atm = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.sea_level_atm = field_type.from_dict(value)
-            else:
-                obj.sea_level_atm = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.sea_level_atm = d.get('sea_level_atm', 0.0)
         return obj
 
     def to_json(self, indent=2):
@@ -12,6 +12,8 @@ class DisturbanceBoundary:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("boundary_point", "boundary_normal")
+
     boundary_point: Point
     boundary_normal: Vector3
 
@@ -33,26 +35,8 @@ class DisturbanceBoundary:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'boundary_point'
-        field_val = self.boundary_point
-        if isinstance(field_val, bytearray):
-            d['boundary_point'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['boundary_point'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['boundary_point'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['boundary_point'] = field_val
-        # handle field 'boundary_normal'
-        field_val = self.boundary_normal
-        if isinstance(field_val, bytearray):
-            d['boundary_normal'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['boundary_normal'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['boundary_normal'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['boundary_normal'] = field_val
+        d['boundary_point'] = self.boundary_point.to_dict()
+        d['boundary_normal'] = self.boundary_normal.to_dict()
         return d
 
     @classmethod
@@ -60,41 +44,10 @@ class DisturbanceBoundary:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'boundary_point'
-        if 'boundary_point' in d:
-            field_type = cls.__annotations__.get('boundary_point')
-            value = d['boundary_point']
-            
-            if field_type is bytearray:
-                obj.boundary_point = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.boundary_point = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.boundary_point = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.boundary_point = field_type.from_dict(value)
-            else:
-                obj.boundary_point = value
-        # handle field 'boundary_normal'
-        if 'boundary_normal' in d:
-            field_type = cls.__annotations__.get('boundary_normal')
-            value = d['boundary_normal']
-            
-            if field_type is bytearray:
-                obj.boundary_normal = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.boundary_normal = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.boundary_normal = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.boundary_normal = field_type.from_dict(value)
-            else:
-                obj.boundary_normal = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.boundary_point = Point.from_dict(d['boundary_point']) if 'boundary_point' in d else Point()
+        obj.boundary_normal = Vector3.from_dict(d['boundary_normal']) if 'boundary_normal' in d else Vector3()
         return obj
 
     def to_json(self, indent=2):
@@ -11,6 +11,8 @@ class DisturbanceWind:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("value",)
+
     value: Vector3
 
     def __init__(self):
@@ -29,16 +31,7 @@ class DisturbanceWind:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'value'
-        field_val = self.value
-        if isinstance(field_val, bytearray):
-            d['value'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['value'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['value'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['value'] = field_val
+        d['value'] = self.value.to_dict()
         return d
 
     @classmethod
@@ -46,24 +39,9 @@ class DisturbanceWind:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'value'
-        if 'value' in d:
-            field_type = cls.__annotations__.get('value')
-            value = d['value']
-            
-            if field_type is bytearray:
-                obj.value = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.value = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.value = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.value = field_type.from_dict(value)
-            else:
-                obj.value = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.value = Vector3.from_dict(d['value']) if 'value' in d else Vector3()
         return obj
 
     def to_json(self, indent=2):
@@ -11,6 +11,8 @@ class DroneStatus:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("flight_mode", "internal_state", "propeller_wind", "collided_counts")
+
     flight_mode: int
     internal_state: int
     propeller_wind: Vector3
@@ -38,46 +40,10 @@ class DroneStatus:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'flight_mode'
-        field_val = self.flight_mode
-        if isinstance(field_val, bytearray):
-            d['flight_mode'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['flight_mode'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['flight_mode'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['flight_mode'] = field_val
-        # handle field 'internal_state'
-        field_val = self.internal_state
-        if isinstance(field_val, bytearray):
-            d['internal_state'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['internal_state'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['internal_state'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['internal_state'] = field_val
-        # handle field 'propeller_wind'
-        field_val = self.propeller_wind
-        if isinstance(field_val, bytearray):
-            d['propeller_wind'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['propeller_wind'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['propeller_wind'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['propeller_wind'] = field_val
-        # handle field 'collided_counts'
-        field_val = self.collided_counts
-        if isinstance(field_val, bytearray):
-            d['collided_counts'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['collided_counts'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['collided_counts'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['collided_counts'] = field_val
+        d['flight_mode'] = self.flight_mode
+        d['internal_state'] = self.internal_state
+        d['propeller_wind'] = self.propeller_wind.to_dict()
+        d['collided_counts'] = self.collided_counts
         return d
 
     @classmethod
@@ -85,75 +51,12 @@ class DroneStatus:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'flight_mode'
-        if 'flight_mode' in d:
-            field_type = cls.__annotations__.get('flight_mode')
-            value = d['flight_mode']
-            
-            if field_type is bytearray:
-                obj.flight_mode = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.flight_mode = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.flight_mode = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.flight_mode = field_type.from_dict(value)
-            else:
-                obj.flight_mode = value
-        # handle field 'internal_state'
-        if 'internal_state' in d:
-            field_type = cls.__annotations__.get('internal_state')
-            value = d['internal_state']
-            
-            if field_type is bytearray:
-                obj.internal_state = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.internal_state = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.internal_state = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.internal_state = field_type.from_dict(value)
-            else:
-                obj.internal_state = value
-        # handle field 'propeller_wind'
-        if 'propeller_wind' in d:
-            field_type = cls.__annotations__.get('propeller_wind')
-            value = d['propeller_wind']
-            
-            if field_type is bytearray:
-                obj.propeller_wind = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.propeller_wind = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.propeller_wind = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.propeller_wind = field_type.from_dict(value)
-            else:
-                obj.propeller_wind = value
-        # handle field 'collided_counts'
-        if 'collided_counts' in d:
-            field_type = cls.__annotations__.get('collided_counts')
-            value = d['collided_counts']
-            
-            if field_type is bytearray:
-                obj.collided_counts = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.collided_counts = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.collided_counts = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.collided_counts = field_type.from_dict(value)
-            else:
-                obj.collided_counts = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.flight_mode = d.get('flight_mode', 0)
+        obj.internal_state = d.get('internal_state', 0)
+        obj.propeller_wind = Vector3.from_dict(d['propeller_wind']) if 'propeller_wind' in d else Vector3()
+        obj.collided_counts = d.get('collided_counts', 0)
         return obj
 
     def to_json(self, indent=2):
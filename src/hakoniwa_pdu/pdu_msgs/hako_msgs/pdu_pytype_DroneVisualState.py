@@ -10,6 +10,8 @@ class DroneVisualState:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("x", "y", "z", "roll", "pitch", "yaw", "pwm_duty")
+
     x: float
     y: float
     z: float
@@ -46,76 +48,14 @@ class DroneVisualState:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'x'
-        field_val = self.x
-        if isinstance(field_val, bytearray):
-            d['x'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['x'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['x'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['x'] = field_val
-        # handle field 'y'
-        field_val = self.y
-        if isinstance(field_val, bytearray):
-            d['y'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['y'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['y'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['y'] = field_val
-        # handle field 'z'
-        field_val = self.z
-        if isinstance(field_val, bytearray):
-            d['z'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['z'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['z'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['z'] = field_val
-        # handle field 'roll'
-        field_val = self.roll
-        if isinstance(field_val, bytearray):
-            d['roll'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['roll'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['roll'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['roll'] = field_val
-        # handle field 'pitch'
-        field_val = self.pitch
-        if isinstance(field_val, bytearray):
-            d['pitch'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['pitch'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['pitch'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['pitch'] = field_val
-        # handle field 'yaw'
-        field_val = self.yaw
-        if isinstance(field_val, bytearray):
-            d['yaw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['yaw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['yaw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['yaw'] = field_val
-        # handle field 'pwm_duty'
+        d['x'] = self.x
+        d['y'] = self.y
+        d['z'] = self.z
+        d['roll'] = self.roll
+        d['pitch'] = self.pitch
+        d['yaw'] = self.yaw
         field_val = self.pwm_duty
-        if isinstance(field_val, bytearray):
-            d['pwm_duty'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['pwm_duty'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['pwm_duty'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['pwm_duty'] = field_val
+        d['pwm_duty'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -123,126 +63,15 @@ class DroneVisualState:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'x'
-        if 'x' in d:
-            field_type = cls.__annotations__.get('x')
-            value = d['x']
-            
-            if field_type is bytearray:
-                obj.x = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.x = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.x = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.x = field_type.from_dict(value)
-            else:
-                obj.x = value
-        # handle field 'y'
-        if 'y' in d:
-            field_type = cls.__annotations__.get('y')
-            value = d['y']
-            
-            if field_type is bytearray:
-                obj.y = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.y = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.y = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.y = field_type.from_dict(value)
-            else:
-                obj.y = value
-        # handle field 'z'
-        if 'z' in d:
-            field_type = cls.__annotations__.get('z')
-            value = d['z']
-            
-            if field_type is bytearray:
-                obj.z = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.z = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.z = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.z = field_type.from_dict(value)
-            else:
-                obj.z = value
-        # handle field 'roll'
-        if 'roll' in d:
-            field_type = cls.__annotations__.get('roll')
-            value = d['roll']
-            
-            if field_type is bytearray:
-                obj.roll = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.roll = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.roll = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.roll = field_type.from_dict(value)
-            else:
-                obj.roll = value
-        # handle field 'pitch'
-        if 'pitch' in d:
-            field_type = cls.__annotations__.get('pitch')
-            value = d['pitch']
-            
-            if field_type is bytearray:
-                obj.pitch = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.pitch = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.pitch = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.pitch = field_type.from_dict(value)
-            else:
-                obj.pitch = value
-        # handle field 'yaw'
-        if 'yaw' in d:
-            field_type = cls.__annotations__.get('yaw')
-            value = d['yaw']
-            
-            if field_type is bytearray:
-                obj.yaw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.yaw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.yaw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.yaw = field_type.from_dict(value)
-            else:
-                obj.yaw = value
-        # handle field 'pwm_duty'
-        if 'pwm_duty' in d:
-            field_type = cls.__annotations__.get('pwm_duty')
-            value = d['pwm_duty']
-            
-            if field_type is bytearray:
-                obj.pwm_duty = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.pwm_duty = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.pwm_duty = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.pwm_duty = field_type.from_dict(value)
-            else:
-                obj.pwm_duty = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.x = d.get('x', 0.0)
+        obj.y = d.get('y', 0.0)
+        obj.z = d.get('z', 0.0)
+        obj.roll = d.get('roll', 0.0)
+        obj.pitch = d.get('pitch', 0.0)
+        obj.yaw = d.get('yaw', 0.0)
+        obj.pwm_duty = d.get('pwm_duty', [])
         return obj
 
     def to_json(self, indent=2):
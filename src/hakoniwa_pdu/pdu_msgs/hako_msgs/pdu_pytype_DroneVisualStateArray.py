@@ -11,6 +11,8 @@ class DroneVisualStateArray:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("sequence_id", "chunk_index", "chunk_count", "start_index", "valid_count", "drones")
+
     sequence_id: int
     chunk_index: int
     chunk_count: int
@@ -44,66 +46,12 @@ class DroneVisualStateArray:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'sequence_id'
-        field_val = self.sequence_id
-        if isinstance(field_val, bytearray):
-            d['sequence_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['sequence_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['sequence_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['sequence_id'] = field_val
-        # handle field 'chunk_index'
-        field_val = self.chunk_index
-        if isinstance(field_val, bytearray):
-            d['chunk_index'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['chunk_index'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['chunk_index'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['chunk_index'] = field_val
-        # handle field 'chunk_count'
-        field_val = self.chunk_count
-        if isinstance(field_val, bytearray):
-            d['chunk_count'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['chunk_count'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['chunk_count'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['chunk_count'] = field_val
-        # handle field 'start_index'
-        field_val = self.start_index
-        if isinstance(field_val, bytearray):
-            d['start_index'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['start_index'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['start_index'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['start_index'] = field_val
-        # handle field 'valid_count'
-        field_val = self.valid_count
-        if isinstance(field_val, bytearray):
-            d['valid_count'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['valid_count'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['valid_count'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['valid_count'] = field_val
-        # handle field 'drones'
-        field_val = self.drones
-        if isinstance(field_val, bytearray):
-            d['drones'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['drones'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['drones'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['drones'] = field_val
+        d['sequence_id'] = self.sequence_id
+        d['chunk_index'] = self.chunk_index
+        d['chunk_count'] = self.chunk_count
+        d['start_index'] = self.start_index
+        d['valid_count'] = self.valid_count
+        d['drones'] = [item.to_dict() for item in self.drones]
         return d
 
     @classmethod
@@ -111,109 +59,14 @@ class DroneVisualStateArray:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'sequence_id'
-        if 'sequence_id' in d:
-            field_type = cls.__annotations__.get('sequence_id')
-            value = d['sequence_id']
-            
-            if field_type is bytearray:
-                obj.sequence_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.sequence_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.sequence_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.sequence_id = field_type.from_dict(value)
-            else:
-                obj.sequence_id = value
-        # handle field 'chunk_index'
-        if 'chunk_index' in d:
-            field_type = cls.__annotations__.get('chunk_index')
-            value = d['chunk_index']
-            
-            if field_type is bytearray:
-                obj.chunk_index = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.chunk_index = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.chunk_index = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.chunk_index = field_type.from_dict(value)
-            else:
-                obj.chunk_index = value
-        # handle field 'chunk_count'
-        if 'chunk_count' in d:
-            field_type = cls.__annotations__.get('chunk_count')
-            value = d['chunk_count']
-            
-            if field_type is bytearray:
-                obj.chunk_count = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.chunk_count = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.chunk_count = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.chunk_count = field_type.from_dict(value)
-            else:
-                obj.chunk_count = value
-        # handle field 'start_index'
-        if 'start_index' in d:
-            field_type = cls.__annotations__.get('start_index')
-            value = d['start_index']
-            
-            if field_type is bytearray:
-                obj.start_index = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.start_index = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.start_index = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.start_index = field_type.from_dict(value)
-            else:
-                obj.start_index = value
-        # handle field 'valid_count'
-        if 'valid_count' in d:
-            field_type = cls.__annotations__.get('valid_count')
-            value = d['valid_count']
-            
-            if field_type is bytearray:
-                obj.valid_count = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.valid_count = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.valid_count = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.valid_count = field_type.from_dict(value)
-            else:
-                obj.valid_count = value
-        # handle field 'drones'
-        if 'drones' in d:
-            field_type = cls.__annotations__.get('drones')
-            value = d['drones']
-            
-            if field_type is bytearray:
-                obj.drones = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.drones = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.drones = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.drones = field_type.from_dict(value)
-            else:
-                obj.drones = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.sequence_id = d.get('sequence_id', 0)
+        obj.chunk_index = d.get('chunk_index', 0)
+        obj.chunk_count = d.get('chunk_count', 0)
+        obj.start_index = d.get('start_index', 0)
+        obj.valid_count = d.get('valid_count', 0)
+        obj.drones = [DroneVisualState.from_dict(item) for item in d['drones']] if 'drones' in d else []
         return obj
 
     def to_json(self, indent=2):
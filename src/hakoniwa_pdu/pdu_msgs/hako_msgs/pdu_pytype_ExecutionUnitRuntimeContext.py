@@ -10,6 +10,8 @@ class ExecutionUnitRuntimeContext:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("config_hash", "epoch", "owner_id", "context")
+
     config_hash: int
     epoch: int
     owner_id: int
@@ -37,46 +39,11 @@ class ExecutionUnitRuntimeContext:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'config_hash'
-        field_val = self.config_hash
-        if isinstance(field_val, bytearray):
-            d['config_hash'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['config_hash'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['config_hash'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['config_hash'] = field_val
-        # handle field 'epoch'
-        field_val = self.epoch
-        if isinstance(field_val, bytearray):
-            d['epoch'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['epoch'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['epoch'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['epoch'] = field_val
-        # handle field 'owner_id'
-        field_val = self.owner_id
-        if isinstance(field_val, bytearray):
-            d['owner_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['owner_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['owner_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['owner_id'] = field_val
-        # handle field 'context'
+        d['config_hash'] = self.config_hash
+        d['epoch'] = self.epoch
+        d['owner_id'] = self.owner_id
         field_val = self.context
-        if isinstance(field_val, bytearray):
-            d['context'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['context'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['context'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['context'] = field_val
+        d['context'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -84,75 +51,12 @@ class ExecutionUnitRuntimeContext:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'config_hash'
-        if 'config_hash' in d:
-            field_type = cls.__annotations__.get('config_hash')
-            value = d['config_hash']
-            
-            if field_type is bytearray:
-                obj.config_hash = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.config_hash = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.config_hash = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.config_hash = field_type.from_dict(value)
-            else:
-                obj.config_hash = value
-        # handle field 'epoch'
-        if 'epoch' in d:
-            field_type = cls.__annotations__.get('epoch')
-            value = d['epoch']
-            
-            if field_type is bytearray:
-                obj.epoch = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.epoch = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.epoch = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.epoch = field_type.from_dict(value)
-            else:
-                obj.epoch = value
-        # handle field 'owner_id'
-        if 'owner_id' in d:
-            field_type = cls.__annotations__.get('owner_id')
-            value = d['owner_id']
-            
-            if field_type is bytearray:
-                obj.owner_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.owner_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.owner_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.owner_id = field_type.from_dict(value)
-            else:
-                obj.owner_id = value
-        # handle field 'context'
-        if 'context' in d:
-            field_type = cls.__annotations__.get('context')
-            value = d['context']
-            
-            if field_type is bytearray:
-                obj.context = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.context = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.context = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.context = field_type.from_dict(value)
-            else:
-                obj.context = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.config_hash = d.get('config_hash', 0)
+        obj.epoch = d.get('epoch', 0)
+        obj.owner_id = d.get('owner_id', 0)
+        obj.context = d.get('context', [])
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class ExecutionUnitRuntimeEpoch:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("epoch",)
+
     epoch: List[int]
 
     def __init__(self):
@@ -28,16 +30,8 @@ class ExecutionUnitRuntimeEpoch:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'epoch'
         field_val = self.epoch
-        if isinstance(field_val, bytearray):
-            d['epoch'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['epoch'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['epoch'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['epoch'] = field_val
+        d['epoch'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -45,24 +39,9 @@ class ExecutionUnitRuntimeEpoch:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'epoch'
-        if 'epoch' in d:
-            field_type = cls.__annotations__.get('epoch')
-            value = d['epoch']
-            
-            if field_type is bytearray:
-                obj.epoch = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.epoch = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.epoch = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.epoch = field_type.from_dict(value)
-            else:
-                obj.epoch = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.epoch = d.get('epoch', [])
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class ExecutionUnitRuntimeNode:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("node_id",)
+
     node_id: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class ExecutionUnitRuntimeNode:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'node_id'
-        field_val = self.node_id
-        if isinstance(field_val, bytearray):
-            d['node_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['node_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['node_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['node_id'] = field_val
+        d['node_id'] = self.node_id
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class ExecutionUnitRuntimeNode:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'node_id'
-        if 'node_id' in d:
-            field_type = cls.__annotations__.get('node_id')
-            value = d['node_id']
-            
-            if field_type is bytearray:
-                obj.node_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.node_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.node_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.node_id = field_type.from_dict(value)
-            else:
-                obj.node_id = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.node_id = d.get('node_id', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class GameControllerOperation:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("axis", "button")
+
     axis: List[float]
     button: List[bool]
 
@@ -31,26 +33,10 @@ class GameControllerOperation:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'axis'
         field_val = self.axis
-        if isinstance(field_val, bytearray):
-            d['axis'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['axis'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['axis'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['axis'] = field_val
-        # handle field 'button'
+        d['axis'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.button
-        if isinstance(field_val, bytearray):
-            d['button'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['button'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['button'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['button'] = field_val
+        d['button'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -58,41 +44,10 @@ class GameControllerOperation:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'axis'
-        if 'axis' in d:
-            field_type = cls.__annotations__.get('axis')
-            value = d['axis']
-            
-            if field_type is bytearray:
-                obj.axis = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.axis = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.axis = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.axis = field_type.from_dict(value)
-            else:
-                obj.axis = value
-        # handle field 'button'
-        if 'button' in d:
-            field_type = cls.__annotations__.get('button')
-            value = d['button']
-            
-            if field_type is bytearray:
-                obj.button = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.button = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.button = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.button = field_type.from_dict(value)
-            else:
-                obj.button = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.axis = d.get('axis', [])
+        obj.button = d.get('button', [])
         return obj
 
     def to_json(self, indent=2):
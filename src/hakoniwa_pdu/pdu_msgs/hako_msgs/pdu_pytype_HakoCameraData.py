@@ -13,6 +13,8 @@ class HakoCameraData:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("request_id", "image")
+
     request_id: int
     image: CompressedImage
 
@@ -34,26 +36,8 @@ class HakoCameraData:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'request_id'
-        field_val = self.request_id
-        if isinstance(field_val, bytearray):
-            d['request_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['request_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['request_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['request_id'] = field_val
-        # handle field 'image'
-        field_val = self.image
-        if isinstance(field_val, bytearray):
-            d['image'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['image'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['image'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['image'] = field_val
+        d['request_id'] = self.request_id
+        d['image'] = self.image.to_dict()
         return d
 
     @classmethod
@@ -61,41 +45,10 @@ class HakoCameraData:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'request_id'
-        if 'request_id' in d:
-            field_type = cls.__annotations__.get('request_id')
-            value = d['request_id']
-            
-            if field_type is bytearray:
-                obj.request_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.request_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.request_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.request_id = field_type.from_dict(value)
-            else:
-                obj.request_id = value
-        # handle field 'image'
-        if 'image' in d:
-            field_type = cls.__annotations__.get('image')
-            value = d['image']
-            
-            if field_type is bytearray:
-                obj.image = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.image = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.image = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.image = field_type.from_dict(value)
-            else:
-                obj.image = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.request_id = d.get('request_id', 0)
+        obj.image = CompressedImage.from_dict(d['image']) if 'image' in d else CompressedImage()
         return obj
 
     def to_json(self, indent=2):
@@ -12,6 +12,8 @@ class HakoCmdCameraMove:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "request_id", "angle")
+
     header: HakoCmdHeader
     request_id: int
     angle: Vector3
@@ -36,36 +38,9 @@ class HakoCmdCameraMove:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'request_id'
-        field_val = self.request_id
-        if isinstance(field_val, bytearray):
-            d['request_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['request_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['request_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['request_id'] = field_val
-        # handle field 'angle'
-        field_val = self.angle
-        if isinstance(field_val, bytearray):
-            d['angle'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['angle'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['angle'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['angle'] = field_val
+        d['header'] = self.header.to_dict()
+        d['request_id'] = self.request_id
+        d['angle'] = self.angle.to_dict()
         return d
 
     @classmethod
@@ -73,58 +48,11 @@ class HakoCmdCameraMove:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'request_id'
-        if 'request_id' in d:
-            field_type = cls.__annotations__.get('request_id')
-            value = d['request_id']
-            
-            if field_type is bytearray:
-                obj.request_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.request_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.request_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.request_id = field_type.from_dict(value)
-            else:
-                obj.request_id = value
-        # handle field 'angle'
-        if 'angle' in d:
-            field_type = cls.__annotations__.get('angle')
-            value = d['angle']
-            
-            if field_type is bytearray:
-                obj.angle = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.angle = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.angle = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.angle = field_type.from_dict(value)
-            else:
-                obj.angle = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = HakoCmdHeader.from_dict(d['header']) if 'header' in d else HakoCmdHeader()
+        obj.request_id = d.get('request_id', 0)
+        obj.angle = Vector3.from_dict(d['angle']) if 'angle' in d else Vector3()
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class HakoCmdHeader:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("request", "result", "result_code")
+
     request: bool
     result: bool
     result_code: int
@@ -34,36 +36,9 @@ class HakoCmdHeader:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'request'
-        field_val = self.request
-        if isinstance(field_val, bytearray):
-            d['request'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['request'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['request'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['request'] = field_val
-        # handle field 'result'
-        field_val = self.result
-        if isinstance(field_val, bytearray):
-            d['result'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['result'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['result'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['result'] = field_val
-        # handle field 'result_code'
-        field_val = self.result_code
-        if isinstance(field_val, bytearray):
-            d['result_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['result_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['result_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['result_code'] = field_val
+        d['request'] = self.request
+        d['result'] = self.result
+        d['result_code'] = self.result_code
         return d
 
     @classmethod
@@ -71,58 +46,11 @@ class HakoCmdHeader:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'request'
-        if 'request' in d:
-            field_type = cls.__annotations__.get('request')
-            value = d['request']
-            
-            if field_type is bytearray:
-                obj.request = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.request = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.request = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.request = field_type.from_dict(value)
-            else:
-                obj.request = value
-        # handle field 'result'
-        if 'result' in d:
-            field_type = cls.__annotations__.get('result')
-            value = d['result']
-            
-            if field_type is bytearray:
-                obj.result = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.result = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.result = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.result = field_type.from_dict(value)
-            else:
-                obj.result = value
-        # handle field 'result_code'
-        if 'result_code' in d:
-            field_type = cls.__annotations__.get('result_code')
-            value = d['result_code']
-            
-            if field_type is bytearray:
-                obj.result_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.result_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.result_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.result_code = field_type.from_dict(value)
-            else:
-                obj.result_code = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.request = d.get('request', False)
+        obj.result = d.get('result', False)
+        obj.result_code = d.get('result_code', 0)
         return obj
 
     def to_json(self, indent=2):
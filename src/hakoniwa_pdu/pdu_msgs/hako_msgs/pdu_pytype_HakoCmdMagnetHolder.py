@@ -11,6 +11,8 @@ class HakoCmdMagnetHolder:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "magnet_on")
+
     header: HakoCmdHeader
     magnet_on: bool
 
@@ -32,26 +34,8 @@ class HakoCmdMagnetHolder:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'magnet_on'
-        field_val = self.magnet_on
-        if isinstance(field_val, bytearray):
-            d['magnet_on'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['magnet_on'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['magnet_on'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['magnet_on'] = field_val
+        d['header'] = self.header.to_dict()
+        d['magnet_on'] = self.magnet_on
         return d
 
     @classmethod
@@ -59,41 +43,10 @@ class HakoCmdMagnetHolder:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'magnet_on'
-        if 'magnet_on' in d:
-            field_type = cls.__annotations__.get('magnet_on')
-            value = d['magnet_on']
-            
-            if field_type is bytearray:
-                obj.magnet_on = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.magnet_on = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.magnet_on = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.magnet_on = field_type.from_dict(value)
-            else:
-                obj.magnet_on = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = HakoCmdHeader.from_dict(d['header']) if 'header' in d else HakoCmdHeader()
+        obj.magnet_on = d.get('magnet_on', False)
         return obj
 
     def to_json(self, indent=2):
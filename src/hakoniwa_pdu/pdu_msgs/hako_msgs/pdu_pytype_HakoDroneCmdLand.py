@@ -11,6 +11,8 @@ class HakoDroneCmdLand:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "height", "speed", "yaw_deg")
+
     header: HakoDroneCmdHeader
     height: float
     speed: float
@@ -38,46 +40,10 @@ class HakoDroneCmdLand:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'height'
-        field_val = self.height
-        if isinstance(field_val, bytearray):
-            d['height'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['height'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['height'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['height'] = field_val
-        # handle field 'speed'
-        field_val = self.speed
-        if isinstance(field_val, bytearray):
-            d['speed'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['speed'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['speed'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['speed'] = field_val
-        # handle field 'yaw_deg'
-        field_val = self.yaw_deg
-        if isinstance(field_val, bytearray):
-            d['yaw_deg'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['yaw_deg'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['yaw_deg'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['yaw_deg'] = field_val
+        d['header'] = self.header.to_dict()
+        d['height'] = self.height
+        d['speed'] = self.speed
+        d['yaw_deg'] = self.yaw_deg
         return d
 
     @classmethod
@@ -85,75 +51,12 @@ class HakoDroneCmdLand:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'height'
-        if 'height' in d:
-            field_type = cls.__annotations__.get('height')
-            value = d['height']
-            
-            if field_type is bytearray:
-                obj.height = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.height = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.height = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.height = field_type.from_dict(value)
-            else:
-                obj.height = value
-        # handle field 'speed'
-        if 'speed' in d:
-            field_type = cls.__annotations__.get('speed')
-            value = d['speed']
-            
-            if field_type is bytearray:
-                obj.speed = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.speed = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.speed = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.speed = field_type.from_dict(value)
-            else:
-                obj.speed = value
-        # handle field 'yaw_deg'
-        if 'yaw_deg' in d:
-            field_type = cls.__annotations__.get('yaw_deg')
-            value = d['yaw_deg']
-            
-            if field_type is bytearray:
-                obj.yaw_deg = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.yaw_deg = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.yaw_deg = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.yaw_deg = field_type.from_dict(value)
-            else:
-                obj.yaw_deg = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = HakoDroneCmdHeader.from_dict(d['header']) if 'header' in d else HakoDroneCmdHeader()
+        obj.height = d.get('height', 0.0)
+        obj.speed = d.get('speed', 0.0)
+        obj.yaw_deg = d.get('yaw_deg', 0.0)
         return obj
 
     def to_json(self, indent=2):
@@ -11,6 +11,8 @@ class HakoDroneCmdMove:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "x", "y", "z", "speed", "yaw_deg")
+
     header: HakoDroneCmdHeader
     x: float
     y: float
@@ -44,66 +46,12 @@ class HakoDroneCmdMove:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'x'
-        field_val = self.x
-        if isinstance(field_val, bytearray):
-            d['x'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['x'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['x'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['x'] = field_val
-        # handle field 'y'
-        field_val = self.y
-        if isinstance(field_val, bytearray):
-            d['y'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['y'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['y'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['y'] = field_val
-        # handle field 'z'
-        field_val = self.z
-        if isinstance(field_val, bytearray):
-            d['z'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['z'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['z'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['z'] = field_val
-        # handle field 'speed'
-        field_val = self.speed
-        if isinstance(field_val, bytearray):
-            d['speed'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['speed'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['speed'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['speed'] = field_val
-        # handle field 'yaw_deg'
-        field_val = self.yaw_deg
-        if isinstance(field_val, bytearray):
-            d['yaw_deg'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['yaw_deg'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['yaw_deg'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['yaw_deg'] = field_val
+        d['header'] = self.header.to_dict()
+        d['x'] = self.x
+        d['y'] = self.y
+        d['z'] = self.z
+        d['speed'] = self.speed
+        d['yaw_deg'] = self.yaw_deg
         return d
 
     @classmethod
@@ -111,109 +59,14 @@ class HakoDroneCmdMove:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'x'
-        if 'x' in d:
-            field_type = cls.__annotations__.get('x')
-            value = d['x']
-            
-            if field_type is bytearray:
-                obj.x = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.x = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.x = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.x = field_type.from_dict(value)
-            else:
-                obj.x = value
-        # handle field 'y'
-        if 'y' in d:
-            field_type = cls.__annotations__.get('y')
-            value = d['y']
-            
-            if field_type is bytearray:
-                obj.y = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.y = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.y = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.y = field_type.from_dict(value)
-            else:
-                obj.y = value
-        # handle field 'z'
-        if 'z' in d:
-            field_type = cls.__annotations__.get('z')
-            value = d['z']
-            
-            if field_type is bytearray:
-                obj.z = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.z = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.z = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.z = field_type.from_dict(value)
-            else:
-                obj.z = value
-        # handle field 'speed'
-        if 'speed' in d:
-            field_type = cls.__annotations__.get('speed')
-            value = d['speed']
-            
-            if field_type is bytearray:
-                obj.speed = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.speed = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.speed = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.speed = field_type.from_dict(value)
-            else:
-                obj.speed = value
-        # handle field 'yaw_deg'
-        if 'yaw_deg' in d:
-            field_type = cls.__annotations__.get('yaw_deg')
-            value = d['yaw_deg']
-            
-            if field_type is bytearray:
-                obj.yaw_deg = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.yaw_deg = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.yaw_deg = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.yaw_deg = field_type.from_dict(value)
-            else:
-                obj.yaw_deg = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = HakoDroneCmdHeader.from_dict(d['header']) if 'header' in d else HakoDroneCmdHeader()
+        obj.x = d.get('x', 0.0)
+        obj.y = d.get('y', 0.0)
+        obj.z = d.get('z', 0.0)
+        obj.speed = d.get('speed', 0.0)
+        obj.yaw_deg = d.get('yaw_deg', 0.0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class HakoStatusMagnetHolder:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("magnet_on", "contact_on")
+
     magnet_on: bool
     contact_on: bool
 
@@ -31,26 +33,8 @@ class HakoStatusMagnetHolder:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'magnet_on'
-        field_val = self.magnet_on
-        if isinstance(field_val, bytearray):
-            d['magnet_on'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['magnet_on'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['magnet_on'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['magnet_on'] = field_val
-        # handle field 'contact_on'
-        field_val = self.contact_on
-        if isinstance(field_val, bytearray):
-            d['contact_on'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['contact_on'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['contact_on'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['contact_on'] = field_val
+        d['magnet_on'] = self.magnet_on
+        d['contact_on'] = self.contact_on
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class HakoStatusMagnetHolder:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'magnet_on'
-        if 'magnet_on' in d:
-            field_type = cls.__annotations__.get('magnet_on')
-            value = d['magnet_on']
-            
-            if field_type is bytearray:
-                obj.magnet_on = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.magnet_on = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.magnet_on = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.magnet_on = field_type.from_dict(value)
-            else:
-                obj.magnet_on = value
-        # handle field 'contact_on'
-        if 'contact_on' in d:
-            field_type = cls.__annotations__.get('contact_on')
-            value = d['contact_on']
-            
-            if field_type is bytearray:
-                obj.contact_on = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.contact_on = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.contact_on = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.contact_on = field_type.from_dict(value)
-            else:
-                obj.contact_on = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.magnet_on = d.get('magnet_on', False)
+        obj.contact_on = d.get('contact_on', False)
         return obj
 
     def to_json(self, indent=2):
@@ -12,6 +12,8 @@ class ManualPosAttControl:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("do_operation", "posatt")
+
     do_operation: bool
     posatt: Twist
 
@@ -33,26 +35,8 @@ class ManualPosAttControl:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'do_operation'
-        field_val = self.do_operation
-        if isinstance(field_val, bytearray):
-            d['do_operation'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['do_operation'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['do_operation'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['do_operation'] = field_val
-        # handle field 'posatt'
-        field_val = self.posatt
-        if isinstance(field_val, bytearray):
-            d['posatt'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['posatt'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['posatt'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['posatt'] = field_val
+        d['do_operation'] = self.do_operation
+        d['posatt'] = self.posatt.to_dict()
         return d
 
     @classmethod
@@ -60,41 +44,10 @@ class ManualPosAttControl:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'do_operation'
-        if 'do_operation' in d:
-            field_type = cls.__annotations__.get('do_operation')
-            value = d['do_operation']
-            
-            if field_type is bytearray:
-                obj.do_operation = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.do_operation = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.do_operation = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.do_operation = field_type.from_dict(value)
-            else:
-                obj.do_operation = value
-        # handle field 'posatt'
-        if 'posatt' in d:
-            field_type = cls.__annotations__.get('posatt')
-            value = d['posatt']
-            
-            if field_type is bytearray:
-                obj.posatt = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.posatt = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.posatt = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.posatt = field_type.from_dict(value)
-            else:
-                obj.posatt = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.do_operation = d.get('do_operation', False)
+        obj.posatt = Twist.from_dict(d['posatt']) if 'posatt' in d else Twist()
         return obj
 
     def to_json(self, indent=2):
@@ -13,6 +13,8 @@ class MonitorCameraData:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("request_id", "image_data_length", "image")
+
     request_id: int
     image_data_length: int
     image: CompressedImage
@@ -37,36 +39,9 @@ class MonitorCameraData:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'request_id'
-        field_val = self.request_id
-        if isinstance(field_val, bytearray):
-            d['request_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['request_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['request_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['request_id'] = field_val
-        # handle field 'image_data_length'
-        field_val = self.image_data_length
-        if isinstance(field_val, bytearray):
-            d['image_data_length'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['image_data_length'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['image_data_length'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['image_data_length'] = field_val
-        # handle field 'image'
-        field_val = self.image
-        if isinstance(field_val, bytearray):
-            d['image'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['image'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['image'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['image'] = field_val
+        d['request_id'] = self.request_id
+        d['image_data_length'] = self.image_data_length
+        d['image'] = self.image.to_dict()
         return d
 
     @classmethod
@@ -74,58 +49,11 @@ class MonitorCameraData:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'request_id'
-        if 'request_id' in d:
-            field_type = cls.__annotations__.get('request_id')
-            value = d['request_id']
-            
-            if field_type is bytearray:
-                obj.request_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.request_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.request_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.request_id = field_type.from_dict(value)
-            else:
-                obj.request_id = value
-        # handle field 'image_data_length'
-        if 'image_data_length' in d:
-            field_type = cls.__annotations__.get('image_data_length')
-            value = d['image_data_length']
-            
-            if field_type is bytearray:
-                obj.image_data_length = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.image_data_length = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.image_data_length = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.image_data_length = field_type.from_dict(value)
-            else:
-                obj.image_data_length = value
-        # handle field 'image'
-        if 'image' in d:
-            field_type = cls.__annotations__.get('image')
-            value = d['image']
-            
-            if field_type is bytearray:
-                obj.image = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.image = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.image = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.image = field_type.from_dict(value)
-            else:
-                obj.image = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.request_id = d.get('request_id', 0)
+        obj.image_data_length = d.get('image_data_length', 0)
+        obj.image = CompressedImage.from_dict(d['image']) if 'image' in d else CompressedImage()
         return obj
 
     def to_json(self, indent=2):
@@ -12,6 +12,8 @@ class ShareObjectOwner:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("object_name", "owner_id", "last_update", "pos")
+
     object_name: str
     owner_id: int
     last_update: int
@@ -39,46 +41,10 @@ class ShareObjectOwner:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'object_name'
-        field_val = self.object_name
-        if isinstance(field_val, bytearray):
-            d['object_name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['object_name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['object_name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['object_name'] = field_val
-        # handle field 'owner_id'
-        field_val = self.owner_id
-        if isinstance(field_val, bytearray):
-            d['owner_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['owner_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['owner_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['owner_id'] = field_val
-        # handle field 'last_update'
-        field_val = self.last_update
-        if isinstance(field_val, bytearray):
-            d['last_update'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['last_update'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['last_update'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['last_update'] = field_val
-        # handle field 'pos'
-        field_val = self.pos
-        if isinstance(field_val, bytearray):
-            d['pos'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['pos'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['pos'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['pos'] = field_val
+        d['object_name'] = self.object_name
+        d['owner_id'] = self.owner_id
+        d['last_update'] = self.last_update
+        d['pos'] = self.pos.to_dict()
         return d
 
     @classmethod
@@ -86,75 +52,12 @@ class ShareObjectOwner:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'object_name'
-        if 'object_name' in d:
-            field_type = cls.__annotations__.get('object_name')
-            value = d['object_name']
-            
-            if field_type is bytearray:
-                obj.object_name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.object_name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.object_name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.object_name = field_type.from_dict(value)
-            else:
-                obj.object_name = value
-        # handle field 'owner_id'
-        if 'owner_id' in d:
-            field_type = cls.__annotations__.get('owner_id')
-            value = d['owner_id']
-            
-            if field_type is bytearray:
-                obj.owner_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.owner_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.owner_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.owner_id = field_type.from_dict(value)
-            else:
-                obj.owner_id = value
-        # handle field 'last_update'
-        if 'last_update' in d:
-            field_type = cls.__annotations__.get('last_update')
-            value = d['last_update']
-            
-            if field_type is bytearray:
-                obj.last_update = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.last_update = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.last_update = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.last_update = field_type.from_dict(value)
-            else:
-                obj.last_update = value
-        # handle field 'pos'
-        if 'pos' in d:
-            field_type = cls.__annotations__.get('pos')
-            value = d['pos']
-            
-            if field_type is bytearray:
-                obj.pos = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.pos = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.pos = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.pos = field_type.from_dict(value)
-            else:
-                obj.pos = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.object_name = d.get('object_name', "")
+        obj.owner_id = d.get('owner_id', 0)
+        obj.last_update = d.get('last_update', 0)
+        obj.pos = Twist.from_dict(d['pos']) if 'pos' in d else Twist()
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class ShareObjectOwnerRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("object_name", "request_type", "new_owner_id", "request_time")
+
     object_name: str
     request_type: int
     new_owner_id: int
@@ -37,46 +39,10 @@ class ShareObjectOwnerRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'object_name'
-        field_val = self.object_name
-        if isinstance(field_val, bytearray):
-            d['object_name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['object_name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['object_name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['object_name'] = field_val
-        # handle field 'request_type'
-        field_val = self.request_type
-        if isinstance(field_val, bytearray):
-            d['request_type'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['request_type'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['request_type'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['request_type'] = field_val
-        # handle field 'new_owner_id'
-        field_val = self.new_owner_id
-        if isinstance(field_val, bytearray):
-            d['new_owner_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['new_owner_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['new_owner_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['new_owner_id'] = field_val
-        # handle field 'request_time'
-        field_val = self.request_time
-        if isinstance(field_val, bytearray):
-            d['request_time'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['request_time'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['request_time'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['request_time'] = field_val
+        d['object_name'] = self.object_name
+        d['request_type'] = self.request_type
+        d['new_owner_id'] = self.new_owner_id
+        d['request_time'] = self.request_time
         return d
 
     @classmethod
@@ -84,75 +50,12 @@ class ShareObjectOwnerRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'object_name'
-        if 'object_name' in d:
-            field_type = cls.__annotations__.get('object_name')
-            value = d['object_name']
-            
-            if field_type is bytearray:
-                obj.object_name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.object_name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.object_name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.object_name = field_type.from_dict(value)
-            else:
-                obj.object_name = value
-        # handle field 'request_type'
-        if 'request_type' in d:
-            field_type = cls.__annotations__.get('request_type')
-            value = d['request_type']
-            
-            if field_type is bytearray:
-                obj.request_type = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.request_type = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.request_type = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.request_type = field_type.from_dict(value)
-            else:
-                obj.request_type = value
-        # handle field 'new_owner_id'
-        if 'new_owner_id' in d:
-            field_type = cls.__annotations__.get('new_owner_id')
-            value = d['new_owner_id']
-            
-            if field_type is bytearray:
-                obj.new_owner_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.new_owner_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.new_owner_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.new_owner_id = field_type.from_dict(value)
-            else:
-                obj.new_owner_id = value
-        # handle field 'request_time'
-        if 'request_time' in d:
-            field_type = cls.__annotations__.get('request_time')
-            value = d['request_time']
-            
-            if field_type is bytearray:
-                obj.request_time = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.request_time = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.request_time = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.request_time = field_type.from_dict(value)
-            else:
-                obj.request_time = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.object_name = d.get('object_name', "")
+        obj.request_type = d.get('request_type', 0)
+        obj.new_owner_id = d.get('new_owner_id', 0)
+        obj.request_time = d.get('request_time', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class ShareObjectOwnerResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("object_name", "request_type", "owner_id", "accepted")
+
     object_name: str
     request_type: int
     owner_id: int
@@ -37,46 +39,10 @@ class ShareObjectOwnerResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'object_name'
-        field_val = self.object_name
-        if isinstance(field_val, bytearray):
-            d['object_name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['object_name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['object_name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['object_name'] = field_val
-        # handle field 'request_type'
-        field_val = self.request_type
-        if isinstance(field_val, bytearray):
-            d['request_type'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['request_type'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['request_type'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['request_type'] = field_val
-        # handle field 'owner_id'
-        field_val = self.owner_id
-        if isinstance(field_val, bytearray):
-            d['owner_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['owner_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['owner_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['owner_id'] = field_val
-        # handle field 'accepted'
-        field_val = self.accepted
-        if isinstance(field_val, bytearray):
-            d['accepted'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['accepted'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['accepted'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['accepted'] = field_val
+        d['object_name'] = self.object_name
+        d['request_type'] = self.request_type
+        d['owner_id'] = self.owner_id
+        d['accepted'] = self.accepted
         return d
 
     @classmethod
@@ -84,75 +50,12 @@ class ShareObjectOwnerResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'object_name'
-        if 'object_name' in d:
-            field_type = cls.__annotations__.get('object_name')
-            value = d['object_name']
-            
-            if field_type is bytearray:
-                obj.object_name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.object_name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.object_name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.object_name = field_type.from_dict(value)
-            else:
-                obj.object_name = value
-        # handle field 'request_type'
-        if 'request_type' in d:
-            field_type = cls.__annotations__.get('request_type')
-            value = d['request_type']
-            
-            if field_type is bytearray:
-                obj.request_type = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.request_type = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.request_type = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.request_type = field_type.from_dict(value)
-            else:
-                obj.request_type = value
-        # handle field 'owner_id'
-        if 'owner_id' in d:
-            field_type = cls.__annotations__.get('owner_id')
-            value = d['owner_id']
-            
-            if field_type is bytearray:
-                obj.owner_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.owner_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.owner_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.owner_id = field_type.from_dict(value)
-            else:
-                obj.owner_id = value
-        # handle field 'accepted'
-        if 'accepted' in d:
-            field_type = cls.__annotations__.get('accepted')
-            value = d['accepted']
-            
-            if field_type is bytearray:
-                obj.accepted = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.accepted = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.accepted = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.accepted = field_type.from_dict(value)
-            else:
-                obj.accepted = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.object_name = d.get('object_name', "")
+        obj.request_type = d.get('request_type', 0)
+        obj.owner_id = d.get('owner_id', 0)
+        obj.accepted = d.get('accepted', False)
         return obj
 
     def to_json(self, indent=2):
@@ -11,6 +11,8 @@ class SimpleStructVarray:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("aaa", "fixed_str", "varray_str", "fixed_array", "data")
+
     aaa: int
     fixed_str: List[str]
     varray_str: List[str]
@@ -41,56 +43,13 @@ class SimpleStructVarray:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'aaa'
-        field_val = self.aaa
-        if isinstance(field_val, bytearray):
-            d['aaa'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['aaa'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['aaa'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['aaa'] = field_val
-        # handle field 'fixed_str'
+        d['aaa'] = self.aaa
         field_val = self.fixed_str
-        if isinstance(field_val, bytearray):
-            d['fixed_str'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['fixed_str'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['fixed_str'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['fixed_str'] = field_val
-        # handle field 'varray_str'
+        d['fixed_str'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.varray_str
-        if isinstance(field_val, bytearray):
-            d['varray_str'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['varray_str'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['varray_str'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['varray_str'] = field_val
-        # handle field 'fixed_array'
-        field_val = self.fixed_array
-        if isinstance(field_val, bytearray):
-            d['fixed_array'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['fixed_array'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['fixed_array'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['fixed_array'] = field_val
-        # handle field 'data'
-        field_val = self.data
-        if isinstance(field_val, bytearray):
-            d['data'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['data'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['data'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['data'] = field_val
+        d['varray_str'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['fixed_array'] = [item.to_dict() for item in self.fixed_array]
+        d['data'] = [item.to_dict() for item in self.data]
         return d
 
     @classmethod
@@ -98,92 +57,13 @@ class SimpleStructVarray:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'aaa'
-        if 'aaa' in d:
-            field_type = cls.__annotations__.get('aaa')
-            value = d['aaa']
-            
-            if field_type is bytearray:
-                obj.aaa = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.aaa = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.aaa = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.aaa = field_type.from_dict(value)
-            else:
-                obj.aaa = value
-        # handle field 'fixed_str'
-        if 'fixed_str' in d:
-            field_type = cls.__annotations__.get('fixed_str')
-            value = d['fixed_str']
-            
-            if field_type is bytearray:
-                obj.fixed_str = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.fixed_str = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.fixed_str = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.fixed_str = field_type.from_dict(value)
-            else:
-                obj.fixed_str = value
-        # handle field 'varray_str'
-        if 'varray_str' in d:
-            field_type = cls.__annotations__.get('varray_str')
-            value = d['varray_str']
-            
-            if field_type is bytearray:
-                obj.varray_str = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.varray_str = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.varray_str = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.varray_str = field_type.from_dict(value)
-            else:
-                obj.varray_str = value
-        # handle field 'fixed_array'
-        if 'fixed_array' in d:
-            field_type = cls.__annotations__.get('fixed_array')
-            value = d['fixed_array']
-            
-            if field_type is bytearray:
-                obj.fixed_array = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.fixed_array = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.fixed_array = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.fixed_array = field_type.from_dict(value)
-            else:
-                obj.fixed_array = value
-        # handle field 'data'
-        if 'data' in d:
-            field_type = cls.__annotations__.get('data')
-            value = d['data']
-            
-            if field_type is bytearray:
-                obj.data = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.data = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.data = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.data = field_type.from_dict(value)
-            else:
-                obj.data = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.aaa = d.get('aaa', 0)
+        obj.fixed_str = d.get('fixed_str', [])
+        obj.varray_str = d.get('varray_str', [])
+        obj.fixed_array = [SimpleVarray.from_dict(item) for item in d['fixed_array']] if 'fixed_array' in d else []
+        obj.data = [SimpleVarray.from_dict(item) for item in d['data']] if 'data' in d else []
         return obj
 
     def to_json(self, indent=2):
@@ -1,24 +1,27 @@
 from .pdu_pytype_AckEventRequest import AckEventRequest
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("II")  # event_code, result_code
+
 
 def py_to_cdr_body_AckEventRequest(writer: CdrWriter, src: AckEventRequest):
     writer.write_string(src.name)
-    writer.write_uint32(src.event_code)
-    writer.write_uint32(src.result_code)
+    writer.write_run(_CDR_RUN_0, (src.event_code, src.result_code))
 
 
 def cdr_body_to_py_AckEventRequest(reader: CdrReader, dst: AckEventRequest):
     dst.name = reader.read_string()
-    dst.event_code = reader.read_uint32()
-    dst.result_code = reader.read_uint32()
+    dst.event_code, dst.result_code = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_AckEventRequest(src: AckEventRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AckEventRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_AckEventRequest(writer, src)
     return writer.bytes()
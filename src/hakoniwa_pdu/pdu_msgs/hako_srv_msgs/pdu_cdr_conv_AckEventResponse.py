@@ -1,5 +1,6 @@
 from .pdu_pytype_AckEventResponse import AckEventResponse
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_AckEventResponse(reader: CdrReader, dst: AckEventResponse):
 
 
 def py_to_cdr_AckEventResponse(src: AckEventResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AckEventResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_AckEventResponse(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_AckEventResponsePacket import AckEventResponsePacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_AckEventResponse import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
@@ -8,17 +9,18 @@ from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
 
 def py_to_cdr_body_AckEventResponsePacket(writer: CdrWriter, src: AckEventResponsePacket):
     py_to_cdr_body_ServiceResponseHeader(writer, src.header)
-    py_to_cdr_body_AckEventResponse(writer, src.body)
+    writer.write_uint32(src.body.ack_code)
 
 
 def cdr_body_to_py_AckEventResponsePacket(reader: CdrReader, dst: AckEventResponsePacket):
     cdr_body_to_py_ServiceResponseHeader(reader, dst.header)
-    cdr_body_to_py_AckEventResponse(reader, dst.body)
+    dst.body.ack_code = reader.read_uint32()
     return dst
 
 
 def py_to_cdr_AckEventResponsePacket(src: AckEventResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AckEventResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_AckEventResponsePacket(writer, src)
     return writer.bytes()
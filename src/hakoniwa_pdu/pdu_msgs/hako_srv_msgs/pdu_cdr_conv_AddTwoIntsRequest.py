@@ -1,22 +1,25 @@
 from .pdu_pytype_AddTwoIntsRequest import AddTwoIntsRequest
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("qq")  # a, b
+
 
 def py_to_cdr_body_AddTwoIntsRequest(writer: CdrWriter, src: AddTwoIntsRequest):
-    writer.write_int64(src.a)
-    writer.write_int64(src.b)
+    writer.write_run(_CDR_RUN_0, (src.a, src.b))
 
 
 def cdr_body_to_py_AddTwoIntsRequest(reader: CdrReader, dst: AddTwoIntsRequest):
-    dst.a = reader.read_int64()
-    dst.b = reader.read_int64()
+    dst.a, dst.b = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_AddTwoIntsRequest(src: AddTwoIntsRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AddTwoIntsRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_AddTwoIntsRequest(writer, src)
     return writer.bytes()
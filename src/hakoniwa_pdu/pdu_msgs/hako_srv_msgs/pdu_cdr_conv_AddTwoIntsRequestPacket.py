@@ -1,24 +1,29 @@
 from .pdu_pytype_AddTwoIntsRequestPacket import AddTwoIntsRequestPacket
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_AddTwoIntsRequest import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("qq")  # body.a, body.b
+
 
 def py_to_cdr_body_AddTwoIntsRequestPacket(writer: CdrWriter, src: AddTwoIntsRequestPacket):
     py_to_cdr_body_ServiceRequestHeader(writer, src.header)
-    py_to_cdr_body_AddTwoIntsRequest(writer, src.body)
+    writer.write_run(_CDR_RUN_0, (src.body.a, src.body.b))
 
 
 def cdr_body_to_py_AddTwoIntsRequestPacket(reader: CdrReader, dst: AddTwoIntsRequestPacket):
     cdr_body_to_py_ServiceRequestHeader(reader, dst.header)
-    cdr_body_to_py_AddTwoIntsRequest(reader, dst.body)
+    dst.body.a, dst.body.b = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_AddTwoIntsRequestPacket(src: AddTwoIntsRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AddTwoIntsRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_AddTwoIntsRequestPacket(writer, src)
     return writer.bytes()
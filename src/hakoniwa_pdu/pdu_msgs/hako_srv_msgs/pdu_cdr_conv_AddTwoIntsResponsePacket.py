@@ -1,5 +1,6 @@
 from .pdu_pytype_AddTwoIntsResponsePacket import AddTwoIntsResponsePacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_AddTwoIntsResponse import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
@@ -8,17 +9,18 @@ from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
 
 def py_to_cdr_body_AddTwoIntsResponsePacket(writer: CdrWriter, src: AddTwoIntsResponsePacket):
     py_to_cdr_body_ServiceResponseHeader(writer, src.header)
-    py_to_cdr_body_AddTwoIntsResponse(writer, src.body)
+    writer.write_int64(src.body.sum)
 
 
 def cdr_body_to_py_AddTwoIntsResponsePacket(reader: CdrReader, dst: AddTwoIntsResponsePacket):
     cdr_body_to_py_ServiceResponseHeader(reader, dst.header)
-    cdr_body_to_py_AddTwoIntsResponse(reader, dst.body)
+    dst.body.sum = reader.read_int64()
     return dst
 
 
 def py_to_cdr_AddTwoIntsResponsePacket(src: AddTwoIntsResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AddTwoIntsResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_AddTwoIntsResponsePacket(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_AttachRequest import AttachRequest
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -16,7 +17,8 @@ def cdr_body_to_py_AttachRequest(reader: CdrReader, dst: AttachRequest):
 
 
 def py_to_cdr_AttachRequest(src: AttachRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AttachRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_AttachRequest(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_AttachRequestPacket import AttachRequestPacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_AttachRequest import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
@@ -18,7 +19,8 @@ def cdr_body_to_py_AttachRequestPacket(reader: CdrReader, dst: AttachRequestPack
 
 
 def py_to_cdr_AttachRequestPacket(src: AttachRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AttachRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_AttachRequestPacket(writer, src)
     return writer.bytes()
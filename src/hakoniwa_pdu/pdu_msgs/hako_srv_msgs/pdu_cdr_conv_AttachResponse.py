@@ -1,27 +1,26 @@
 from .pdu_pytype_AttachResponse import AttachResponse
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_LogicalTime import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IQQQQ")  # result_code, session_id, world_time.generation, world_time.offset_tick, delta_asset_tick
+
 
 def py_to_cdr_body_AttachResponse(writer: CdrWriter, src: AttachResponse):
-    writer.write_uint32(src.result_code)
-    writer.write_uint64(src.session_id)
-    py_to_cdr_body_LogicalTime(writer, src.world_time)
-    writer.write_uint64(src.delta_asset_tick)
+    writer.write_run(_CDR_RUN_0, (src.result_code, src.session_id, src.world_time.generation, src.world_time.offset_tick, src.delta_asset_tick))
 
 
 def cdr_body_to_py_AttachResponse(reader: CdrReader, dst: AttachResponse):
-    dst.result_code = reader.read_uint32()
-    dst.session_id = reader.read_uint64()
-    cdr_body_to_py_LogicalTime(reader, dst.world_time)
-    dst.delta_asset_tick = reader.read_uint64()
+    dst.result_code, dst.session_id, dst.world_time.generation, dst.world_time.offset_tick, dst.delta_asset_tick = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_AttachResponse(src: AttachResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AttachResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_AttachResponse(writer, src)
     return writer.bytes()
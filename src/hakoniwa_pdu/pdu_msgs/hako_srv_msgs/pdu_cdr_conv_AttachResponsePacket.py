@@ -1,25 +1,30 @@
 from .pdu_pytype_AttachResponsePacket import AttachResponsePacket
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_AttachResponse import *
 from ..hako_srv_msgs.pdu_cdr_conv_LogicalTime import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IQQQQ")  # body.result_code, body.session_id, body.world_time.generation, body.world_time.offset_tick, body.delta_asset_tick
+
 
 def py_to_cdr_body_AttachResponsePacket(writer: CdrWriter, src: AttachResponsePacket):
     py_to_cdr_body_ServiceResponseHeader(writer, src.header)
-    py_to_cdr_body_AttachResponse(writer, src.body)
+    writer.write_run(_CDR_RUN_0, (src.body.result_code, src.body.session_id, src.body.world_time.generation, src.body.world_time.offset_tick, src.body.delta_asset_tick))
 
 
 def cdr_body_to_py_AttachResponsePacket(reader: CdrReader, dst: AttachResponsePacket):
     cdr_body_to_py_ServiceResponseHeader(reader, dst.header)
-    cdr_body_to_py_AttachResponse(reader, dst.body)
+    dst.body.result_code, dst.body.session_id, dst.body.world_time.generation, dst.body.world_time.offset_tick, dst.body.delta_asset_tick = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_AttachResponsePacket(src: AttachResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/AttachResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_AttachResponsePacket(writer, src)
     return writer.bytes()
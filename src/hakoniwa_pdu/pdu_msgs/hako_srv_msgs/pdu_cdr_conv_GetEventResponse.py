@@ -1,5 +1,6 @@
 from .pdu_pytype_GetEventResponse import GetEventResponse
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_GetEventResponse(reader: CdrReader, dst: GetEventResponse):
 
 
 def py_to_cdr_GetEventResponse(src: GetEventResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/GetEventResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_GetEventResponse(writer, src)
     return writer.bytes()
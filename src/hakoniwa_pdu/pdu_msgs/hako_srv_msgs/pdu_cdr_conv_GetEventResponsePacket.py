@@ -1,5 +1,6 @@
 from .pdu_pytype_GetEventResponsePacket import GetEventResponsePacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_GetEventResponse import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
@@ -8,17 +9,18 @@ from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
 
 def py_to_cdr_body_GetEventResponsePacket(writer: CdrWriter, src: GetEventResponsePacket):
     py_to_cdr_body_ServiceResponseHeader(writer, src.header)
-    py_to_cdr_body_GetEventResponse(writer, src.body)
+    writer.write_uint32(src.body.event_code)
 
 
 def cdr_body_to_py_GetEventResponsePacket(reader: CdrReader, dst: GetEventResponsePacket):
     cdr_body_to_py_ServiceResponseHeader(reader, dst.header)
-    cdr_body_to_py_GetEventResponse(reader, dst.body)
+    dst.body.event_code = reader.read_uint32()
     return dst
 
 
 def py_to_cdr_GetEventResponsePacket(src: GetEventResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/GetEventResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_GetEventResponsePacket(writer, src)
     return writer.bytes()
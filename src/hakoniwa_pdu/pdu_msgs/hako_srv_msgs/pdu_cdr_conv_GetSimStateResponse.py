@@ -1,28 +1,25 @@
 from .pdu_pytype_GetSimStateResponse import GetSimStateResponse
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("Iq???")  # sim_state, master_time, is_pdu_created, is_simulation_mode, is_pdu_sync_mode
+
 
 def py_to_cdr_body_GetSimStateResponse(writer: CdrWriter, src: GetSimStateResponse):
-    writer.write_uint32(src.sim_state)
-    writer.write_int64(src.master_time)
-    writer.write_bool(src.is_pdu_created)
-    writer.write_bool(src.is_simulation_mode)
-    writer.write_bool(src.is_pdu_sync_mode)
+    writer.write_run(_CDR_RUN_0, (src.sim_state, src.master_time, src.is_pdu_created, src.is_simulation_mode, src.is_pdu_sync_mode))
 
 
 def cdr_body_to_py_GetSimStateResponse(reader: CdrReader, dst: GetSimStateResponse):
-    dst.sim_state = reader.read_uint32()
-    dst.master_time = reader.read_int64()
-    dst.is_pdu_created = reader.read_bool()
-    dst.is_simulation_mode = reader.read_bool()
-    dst.is_pdu_sync_mode = reader.read_bool()
+    dst.sim_state, dst.master_time, dst.is_pdu_created, dst.is_simulation_mode, dst.is_pdu_sync_mode = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_GetSimStateResponse(src: GetSimStateResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/GetSimStateResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_GetSimStateResponse(writer, src)
     return writer.bytes()
@@ -1,24 +1,29 @@
 from .pdu_pytype_GetSimStateResponsePacket import GetSimStateResponsePacket
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_GetSimStateResponse import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("Iq???")  # body.sim_state, body.master_time, body.is_pdu_created, body.is_simulation_mode, body.is_pdu_sync_mode
+
 
 def py_to_cdr_body_GetSimStateResponsePacket(writer: CdrWriter, src: GetSimStateResponsePacket):
     py_to_cdr_body_ServiceResponseHeader(writer, src.header)
-    py_to_cdr_body_GetSimStateResponse(writer, src.body)
+    writer.write_run(_CDR_RUN_0, (src.body.sim_state, src.body.master_time, src.body.is_pdu_created, src.body.is_simulation_mode, src.body.is_pdu_sync_mode))
 
 
 def cdr_body_to_py_GetSimStateResponsePacket(reader: CdrReader, dst: GetSimStateResponsePacket):
     cdr_body_to_py_ServiceResponseHeader(reader, dst.header)
-    cdr_body_to_py_GetSimStateResponse(reader, dst.body)
+    dst.body.sim_state, dst.body.master_time, dst.body.is_pdu_created, dst.body.is_simulation_mode, dst.body.is_pdu_sync_mode = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_GetSimStateResponsePacket(src: GetSimStateResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/GetSimStateResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_GetSimStateResponsePacket(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_GetWorldTimeRequestPacket import GetWorldTimeRequestPacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_GetWorldTimeRequest import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
@@ -8,17 +9,18 @@ from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
 
 def py_to_cdr_body_GetWorldTimeRequestPacket(writer: CdrWriter, src: GetWorldTimeRequestPacket):
     py_to_cdr_body_ServiceRequestHeader(writer, src.header)
-    py_to_cdr_body_GetWorldTimeRequest(writer, src.body)
+    writer.write_uint64(src.body.session_id)
 
 
 def cdr_body_to_py_GetWorldTimeRequestPacket(reader: CdrReader, dst: GetWorldTimeRequestPacket):
     cdr_body_to_py_ServiceRequestHeader(reader, dst.header)
-    cdr_body_to_py_GetWorldTimeRequest(reader, dst.body)
+    dst.body.session_id = reader.read_uint64()
     return dst
 
 
 def py_to_cdr_GetWorldTimeRequestPacket(src: GetWorldTimeRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/GetWorldTimeRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_GetWorldTimeRequestPacket(writer, src)
     return writer.bytes()
@@ -1,23 +1,26 @@
 from .pdu_pytype_GetWorldTimeResponse import GetWorldTimeResponse
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_LogicalTime import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IQQ")  # result_code, world_time.generation, world_time.offset_tick
+
 
 def py_to_cdr_body_GetWorldTimeResponse(writer: CdrWriter, src: GetWorldTimeResponse):
-    writer.write_uint32(src.result_code)
-    py_to_cdr_body_LogicalTime(writer, src.world_time)
+    writer.write_run(_CDR_RUN_0, (src.result_code, src.world_time.generation, src.world_time.offset_tick))
 
 
 def cdr_body_to_py_GetWorldTimeResponse(reader: CdrReader, dst: GetWorldTimeResponse):
-    dst.result_code = reader.read_uint32()
-    cdr_body_to_py_LogicalTime(reader, dst.world_time)
+    dst.result_code, dst.world_time.generation, dst.world_time.offset_tick = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_GetWorldTimeResponse(src: GetWorldTimeResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/GetWorldTimeResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_GetWorldTimeResponse(writer, src)
     return writer.bytes()
@@ -1,25 +1,30 @@
 from .pdu_pytype_GetWorldTimeResponsePacket import GetWorldTimeResponsePacket
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_GetWorldTimeResponse import *
 from ..hako_srv_msgs.pdu_cdr_conv_LogicalTime import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IQQ")  # body.result_code, body.world_time.generation, body.world_time.offset_tick
+
 
 def py_to_cdr_body_GetWorldTimeResponsePacket(writer: CdrWriter, src: GetWorldTimeResponsePacket):
     py_to_cdr_body_ServiceResponseHeader(writer, src.header)
-    py_to_cdr_body_GetWorldTimeResponse(writer, src.body)
+    writer.write_run(_CDR_RUN_0, (src.body.result_code, src.body.world_time.generation, src.body.world_time.offset_tick))
 
 
 def cdr_body_to_py_GetWorldTimeResponsePacket(reader: CdrReader, dst: GetWorldTimeResponsePacket):
     cdr_body_to_py_ServiceResponseHeader(reader, dst.header)
-    cdr_body_to_py_GetWorldTimeResponse(reader, dst.body)
+    dst.body.result_code, dst.body.world_time.generation, dst.body.world_time.offset_tick = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_GetWorldTimeResponsePacket(src: GetWorldTimeResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/GetWorldTimeResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_GetWorldTimeResponsePacket(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_JoinRequestPacket import JoinRequestPacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_JoinRequest import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
@@ -18,7 +19,8 @@ def cdr_body_to_py_JoinRequestPacket(reader: CdrReader, dst: JoinRequestPacket):
 
 
 def py_to_cdr_JoinRequestPacket(src: JoinRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/JoinRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_JoinRequestPacket(writer, src)
     return writer.bytes()
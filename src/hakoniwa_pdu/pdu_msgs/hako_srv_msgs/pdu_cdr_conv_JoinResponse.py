@@ -1,5 +1,6 @@
 from .pdu_pytype_JoinResponse import JoinResponse
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -16,7 +17,8 @@ def cdr_body_to_py_JoinResponse(reader: CdrReader, dst: JoinResponse):
 
 
 def py_to_cdr_JoinResponse(src: JoinResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/JoinResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_JoinResponse(writer, src)
     return writer.bytes()
@@ -1,22 +1,25 @@
 from .pdu_pytype_LogicalTime import LogicalTime
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("QQ")  # generation, offset_tick
+
 
 def py_to_cdr_body_LogicalTime(writer: CdrWriter, src: LogicalTime):
-    writer.write_uint64(src.generation)
-    writer.write_uint64(src.offset_tick)
+    writer.write_run(_CDR_RUN_0, (src.generation, src.offset_tick))
 
 
 def cdr_body_to_py_LogicalTime(reader: CdrReader, dst: LogicalTime):
-    dst.generation = reader.read_uint64()
-    dst.offset_tick = reader.read_uint64()
+    dst.generation, dst.offset_tick = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_LogicalTime(src: LogicalTime) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/LogicalTime"])
     writer.write_encapsulation()
     py_to_cdr_body_LogicalTime(writer, src)
     return writer.bytes()
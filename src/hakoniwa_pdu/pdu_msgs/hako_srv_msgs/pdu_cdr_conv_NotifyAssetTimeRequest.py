@@ -1,23 +1,26 @@
 from .pdu_pytype_NotifyAssetTimeRequest import NotifyAssetTimeRequest
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_LogicalTime import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("QQQ")  # session_id, asset_time.generation, asset_time.offset_tick
+
 
 def py_to_cdr_body_NotifyAssetTimeRequest(writer: CdrWriter, src: NotifyAssetTimeRequest):
-    writer.write_uint64(src.session_id)
-    py_to_cdr_body_LogicalTime(writer, src.asset_time)
+    writer.write_run(_CDR_RUN_0, (src.session_id, src.asset_time.generation, src.asset_time.offset_tick))
 
 
 def cdr_body_to_py_NotifyAssetTimeRequest(reader: CdrReader, dst: NotifyAssetTimeRequest):
-    dst.session_id = reader.read_uint64()
-    cdr_body_to_py_LogicalTime(reader, dst.asset_time)
+    dst.session_id, dst.asset_time.generation, dst.asset_time.offset_tick = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_NotifyAssetTimeRequest(src: NotifyAssetTimeRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/NotifyAssetTimeRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_NotifyAssetTimeRequest(writer, src)
     return writer.bytes()
@@ -1,25 +1,30 @@
 from .pdu_pytype_NotifyAssetTimeRequestPacket import NotifyAssetTimeRequestPacket
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_LogicalTime import *
 from ..hako_srv_msgs.pdu_cdr_conv_NotifyAssetTimeRequest import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("QQQ")  # body.session_id, body.asset_time.generation, body.asset_time.offset_tick
+
 
 def py_to_cdr_body_NotifyAssetTimeRequestPacket(writer: CdrWriter, src: NotifyAssetTimeRequestPacket):
     py_to_cdr_body_ServiceRequestHeader(writer, src.header)
-    py_to_cdr_body_NotifyAssetTimeRequest(writer, src.body)
+    writer.write_run(_CDR_RUN_0, (src.body.session_id, src.body.asset_time.generation, src.body.asset_time.offset_tick))
 
 
 def cdr_body_to_py_NotifyAssetTimeRequestPacket(reader: CdrReader, dst: NotifyAssetTimeRequestPacket):
     cdr_body_to_py_ServiceRequestHeader(reader, dst.header)
-    cdr_body_to_py_NotifyAssetTimeRequest(reader, dst.body)
+    dst.body.session_id, dst.body.asset_time.generation, dst.body.asset_time.offset_tick = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_NotifyAssetTimeRequestPacket(src: NotifyAssetTimeRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/NotifyAssetTimeRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_NotifyAssetTimeRequestPacket(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_NotifyAssetTimeResponsePacket import NotifyAssetTimeResponsePacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_NotifyAssetTimeResponse import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
@@ -8,17 +9,18 @@ from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
 
 def py_to_cdr_body_NotifyAssetTimeResponsePacket(writer: CdrWriter, src: NotifyAssetTimeResponsePacket):
     py_to_cdr_body_ServiceResponseHeader(writer, src.header)
-    py_to_cdr_body_NotifyAssetTimeResponse(writer, src.body)
+    writer.write_uint32(src.body.result_code)
 
 
 def cdr_body_to_py_NotifyAssetTimeResponsePacket(reader: CdrReader, dst: NotifyAssetTimeResponsePacket):
     cdr_body_to_py_ServiceResponseHeader(reader, dst.header)
-    cdr_body_to_py_NotifyAssetTimeResponse(reader, dst.body)
+    dst.body.result_code = reader.read_uint32()
     return dst
 
 
 def py_to_cdr_NotifyAssetTimeResponsePacket(src: NotifyAssetTimeResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/NotifyAssetTimeResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_NotifyAssetTimeResponsePacket(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_RegisterClientRequestPacket import RegisterClientRequestPacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_RegisterClientRequest import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
@@ -8,17 +9,18 @@ from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
 
 def py_to_cdr_body_RegisterClientRequestPacket(writer: CdrWriter, src: RegisterClientRequestPacket):
     py_to_cdr_body_ServiceRequestHeader(writer, src.header)
-    py_to_cdr_body_RegisterClientRequest(writer, src.body)
+    writer.write_uint32(src.body.dummy)
 
 
 def cdr_body_to_py_RegisterClientRequestPacket(reader: CdrReader, dst: RegisterClientRequestPacket):
     cdr_body_to_py_ServiceRequestHeader(reader, dst.header)
-    cdr_body_to_py_RegisterClientRequest(reader, dst.body)
+    dst.body.dummy = reader.read_uint32()
     return dst
 
 
 def py_to_cdr_RegisterClientRequestPacket(src: RegisterClientRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/RegisterClientRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_RegisterClientRequestPacket(writer, src)
     return writer.bytes()
@@ -1,26 +1,25 @@
 from .pdu_pytype_RegisterClientResponse import RegisterClientResponse
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IIII")  # service_id, client_id, request_channel_id, response_channel_id
+
 
 def py_to_cdr_body_RegisterClientResponse(writer: CdrWriter, src: RegisterClientResponse):
-    writer.write_uint32(src.service_id)
-    writer.write_uint32(src.client_id)
-    writer.write_uint32(src.request_channel_id)
-    writer.write_uint32(src.response_channel_id)
+    writer.write_run(_CDR_RUN_0, (src.service_id, src.client_id, src.request_channel_id, src.response_channel_id))
 
 
 def cdr_body_to_py_RegisterClientResponse(reader: CdrReader, dst: RegisterClientResponse):
-    dst.service_id = reader.read_uint32()
-    dst.client_id = reader.read_uint32()
-    dst.request_channel_id = reader.read_uint32()
-    dst.response_channel_id = reader.read_uint32()
+    dst.service_id, dst.client_id, dst.request_channel_id, dst.response_channel_id = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_RegisterClientResponse(src: RegisterClientResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/RegisterClientResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_RegisterClientResponse(writer, src)
     return writer.bytes()
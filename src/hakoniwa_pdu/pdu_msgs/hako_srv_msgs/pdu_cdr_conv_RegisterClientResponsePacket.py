@@ -1,24 +1,29 @@
 from .pdu_pytype_RegisterClientResponsePacket import RegisterClientResponsePacket
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_RegisterClientResponse import *
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceResponseHeader import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IIII")  # body.service_id, body.client_id, body.request_channel_id, body.response_channel_id
+
 
 def py_to_cdr_body_RegisterClientResponsePacket(writer: CdrWriter, src: RegisterClientResponsePacket):
     py_to_cdr_body_ServiceResponseHeader(writer, src.header)
-    py_to_cdr_body_RegisterClientResponse(writer, src.body)
+    writer.write_run(_CDR_RUN_0, (src.body.service_id, src.body.client_id, src.body.request_channel_id, src.body.response_channel_id))
 
 
 def cdr_body_to_py_RegisterClientResponsePacket(reader: CdrReader, dst: RegisterClientResponsePacket):
     cdr_body_to_py_ServiceResponseHeader(reader, dst.header)
-    cdr_body_to_py_RegisterClientResponse(reader, dst.body)
+    dst.body.service_id, dst.body.client_id, dst.body.request_channel_id, dst.body.response_channel_id = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_RegisterClientResponsePacket(src: RegisterClientResponsePacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/RegisterClientResponsePacket"])
     writer.write_encapsulation()
     py_to_cdr_body_RegisterClientResponsePacket(writer, src)
     return writer.bytes()
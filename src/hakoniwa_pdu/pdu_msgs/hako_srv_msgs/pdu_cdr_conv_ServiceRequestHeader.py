@@ -1,28 +1,31 @@
 from .pdu_pytype_ServiceRequestHeader import ServiceRequestHeader
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("Bi")  # opcode, status_poll_interval_msec
+
 
 def py_to_cdr_body_ServiceRequestHeader(writer: CdrWriter, src: ServiceRequestHeader):
     writer.write_uint32(src.request_id)
     writer.write_string(src.service_name)
     writer.write_string(src.client_name)
-    writer.write_uint8(src.opcode)
-    writer.write_int32(src.status_poll_interval_msec)
+    writer.write_run(_CDR_RUN_0, (src.opcode, src.status_poll_interval_msec))
 
 
 def cdr_body_to_py_ServiceRequestHeader(reader: CdrReader, dst: ServiceRequestHeader):
     dst.request_id = reader.read_uint32()
     dst.service_name = reader.read_string()
     dst.client_name = reader.read_string()
-    dst.opcode = reader.read_uint8()
-    dst.status_poll_interval_msec = reader.read_int32()
+    dst.opcode, dst.status_poll_interval_msec = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_ServiceRequestHeader(src: ServiceRequestHeader) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/ServiceRequestHeader"])
     writer.write_encapsulation()
     py_to_cdr_body_ServiceRequestHeader(writer, src)
     return writer.bytes()
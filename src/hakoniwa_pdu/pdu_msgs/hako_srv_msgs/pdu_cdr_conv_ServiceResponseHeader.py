@@ -1,30 +1,31 @@
 from .pdu_pytype_ServiceResponseHeader import ServiceResponseHeader
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("BBi")  # status, processing_percentage, result_code
+
 
 def py_to_cdr_body_ServiceResponseHeader(writer: CdrWriter, src: ServiceResponseHeader):
     writer.write_uint32(src.request_id)
     writer.write_string(src.service_name)
     writer.write_string(src.client_name)
-    writer.write_uint8(src.status)
-    writer.write_uint8(src.processing_percentage)
-    writer.write_int32(src.result_code)
+    writer.write_run(_CDR_RUN_0, (src.status, src.processing_percentage, src.result_code))
 
 
 def cdr_body_to_py_ServiceResponseHeader(reader: CdrReader, dst: ServiceResponseHeader):
     dst.request_id = reader.read_uint32()
     dst.service_name = reader.read_string()
     dst.client_name = reader.read_string()
-    dst.status = reader.read_uint8()
-    dst.processing_percentage = reader.read_uint8()
-    dst.result_code = reader.read_int32()
+    dst.status, dst.processing_percentage, dst.result_code = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_ServiceResponseHeader(src: ServiceResponseHeader) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/ServiceResponseHeader"])
     writer.write_encapsulation()
     py_to_cdr_body_ServiceResponseHeader(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_SimControlRequest import SimControlRequest
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -16,7 +17,8 @@ def cdr_body_to_py_SimControlRequest(reader: CdrReader, dst: SimControlRequest):
 
 
 def py_to_cdr_SimControlRequest(src: SimControlRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/SimControlRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_SimControlRequest(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_SimControlRequestPacket import SimControlRequestPacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
 from ..hako_srv_msgs.pdu_cdr_conv_SimControlRequest import *
@@ -18,7 +19,8 @@ def cdr_body_to_py_SimControlRequestPacket(reader: CdrReader, dst: SimControlReq
 
 
 def py_to_cdr_SimControlRequestPacket(src: SimControlRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/SimControlRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_SimControlRequestPacket(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_SystemControlRequestPacket import SystemControlRequestPacket
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_srv_msgs.pdu_cdr_conv_ServiceRequestHeader import *
 from ..hako_srv_msgs.pdu_cdr_conv_SystemControlRequest import *
@@ -8,17 +9,18 @@ from ..hako_srv_msgs.pdu_cdr_conv_SystemControlRequest import *
 
 def py_to_cdr_body_SystemControlRequestPacket(writer: CdrWriter, src: SystemControlRequestPacket):
     py_to_cdr_body_ServiceRequestHeader(writer, src.header)
-    py_to_cdr_body_SystemControlRequest(writer, src.body)
+    writer.write_uint32(src.body.opcode)
 
 
 def cdr_body_to_py_SystemControlRequestPacket(reader: CdrReader, dst: SystemControlRequestPacket):
     cdr_body_to_py_ServiceRequestHeader(reader, dst.header)
-    cdr_body_to_py_SystemControlRequest(reader, dst.body)
+    dst.body.opcode = reader.read_uint32()
     return dst
 
 
 def py_to_cdr_SystemControlRequestPacket(src: SystemControlRequestPacket) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/SystemControlRequestPacket"])
     writer.write_encapsulation()
     py_to_cdr_body_SystemControlRequestPacket(writer, src)
     return writer.bytes()
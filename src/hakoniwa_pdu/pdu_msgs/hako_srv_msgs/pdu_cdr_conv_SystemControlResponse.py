@@ -1,5 +1,6 @@
 from .pdu_pytype_SystemControlResponse import SystemControlResponse
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -16,7 +17,8 @@ def cdr_body_to_py_SystemControlResponse(reader: CdrReader, dst: SystemControlRe
 
 
 def py_to_cdr_SystemControlResponse(src: SystemControlResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["hako_srv_msgs/SystemControlResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_SystemControlResponse(writer, src)
     return writer.bytes()
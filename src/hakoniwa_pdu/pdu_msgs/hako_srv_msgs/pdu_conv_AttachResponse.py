@@ -8,13 +8,20 @@ from .. import binary_io
 from ..hako_srv_msgs.pdu_conv_LogicalTime import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<I4xQ")  # result_code, session_id
+_RUN_1 = struct.Struct("<Q")  # delta_asset_tick
 
-def pdu_to_py_AttachResponse(binary_data: bytearray) -> AttachResponse:
-    py_obj = AttachResponse()
+
+def pdu_to_py_AttachResponse(binary_data: bytearray, out: AttachResponse = None, array_mode: str = None) -> AttachResponse:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = AttachResponse() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_AttachResponse(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -26,11 +33,6 @@ def binary_read_recursive_AttachResponse(meta: binary_io.PduMetaData, binary_dat
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.result_code = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: session_id 
@@ -38,9 +40,7 @@ def binary_read_recursive_AttachResponse(meta: binary_io.PduMetaData, binary_dat
     # offset: 8 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 8)
-    py_obj.session_id = binary_io.binTovalue("uint64", bin)
+    py_obj.result_code, py_obj.session_id = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -49,7 +49,7 @@ def binary_read_recursive_AttachResponse(meta: binary_io.PduMetaData, binary_dat
     # offset: 16 size: 16 
     # array_len: 1
 
-    tmp_py_obj = LogicalTime()
+    tmp_py_obj = reuse_obj(py_obj.world_time, LogicalTime)
     binary_read_recursive_LogicalTime(meta, binary_data, tmp_py_obj, base_off + 16)
     py_obj.world_time = tmp_py_obj
     
@@ -60,40 +60,18 @@ def binary_read_recursive_AttachResponse(meta: binary_io.PduMetaData, binary_dat
     # offset: 32 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 32, 8)
-    py_obj.delta_asset_tick = binary_io.binTovalue("uint64", bin)
+    py_obj.delta_asset_tick = _RUN_1.unpack_from(binary_data, base_off + 32)[0]
     
     return py_obj
 
 
-def py_to_pdu_AttachResponse(py_obj: AttachResponse) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_AttachResponse(py_obj: AttachResponse, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_AttachResponse(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_AttachResponse(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: AttachResponse):
     # array_type: single 
@@ -102,27 +80,14 @@ def binary_write_recursive_AttachResponse(parent_off: int, bw_container: BinaryW
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.result_code)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: session_id 
     # type_name: uint64 
     # offset: 8 size: 8 
     # array_len: 1
-    type = "uint64"
-    off = 8
 
-    
-    bin = binary_io.typeTobin(type, py_obj.session_id)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.result_code, py_obj.session_id), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -141,13 +106,8 @@ def binary_write_recursive_AttachResponse(parent_off: int, bw_container: BinaryW
     # type_name: uint64 
     # offset: 32 size: 8 
     # array_len: 1
-    type = "uint64"
-    off = 32
 
-    
-    bin = binary_io.typeTobin(type, py_obj.delta_asset_tick)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.delta_asset_tick), expected_offset=parent_off + 32)
     
 
 if __name__ == "__main__":
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<I4xqiii")  # sim_state, master_time, is_pdu_created, is_simulation_mode, is_pdu_sync_mode
 
-def pdu_to_py_GetSimStateResponse(binary_data: bytearray) -> GetSimStateResponse:
-    py_obj = GetSimStateResponse()
+
+def pdu_to_py_GetSimStateResponse(binary_data: bytearray, out: GetSimStateResponse = None, array_mode: str = None) -> GetSimStateResponse:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = GetSimStateResponse() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_GetSimStateResponse(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,44 +31,24 @@ def binary_read_recursive_GetSimStateResponse(meta: binary_io.PduMetaData, binar
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.sim_state = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: master_time 
     # type_name: int64 
     # offset: 8 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 8)
-    py_obj.master_time = binary_io.binTovalue("int64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_pdu_created 
     # type_name: bool 
     # offset: 16 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.is_pdu_created = binary_io.binTovalue("bool", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_simulation_mode 
     # type_name: bool 
     # offset: 20 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 20, 4)
-    py_obj.is_simulation_mode = binary_io.binTovalue("bool", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_pdu_sync_mode 
@@ -70,40 +56,23 @@ def binary_read_recursive_GetSimStateResponse(meta: binary_io.PduMetaData, binar
     # offset: 24 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 24, 4)
-    py_obj.is_pdu_sync_mode = binary_io.binTovalue("bool", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 0)
+    py_obj.sim_state = values[0]
+    py_obj.master_time = values[1]
+    py_obj.is_pdu_created = values[2] != 0
+    py_obj.is_simulation_mode = values[3] != 0
+    py_obj.is_pdu_sync_mode = values[4] != 0
     
     return py_obj
 
 
-def py_to_pdu_GetSimStateResponse(py_obj: GetSimStateResponse) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_GetSimStateResponse(py_obj: GetSimStateResponse, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_GetSimStateResponse(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_GetSimStateResponse(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: GetSimStateResponse):
     # array_type: single 
@@ -112,69 +81,32 @@ def binary_write_recursive_GetSimStateResponse(parent_off: int, bw_container: Bi
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.sim_state)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: master_time 
     # type_name: int64 
     # offset: 8 size: 8 
     # array_len: 1
-    type = "int64"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.master_time)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_pdu_created 
     # type_name: bool 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 16
-
-    
-    bin = binary_io.typeTobin(type, py_obj.is_pdu_created)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_simulation_mode 
     # type_name: bool 
     # offset: 20 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 20
-
-    
-    bin = binary_io.typeTobin(type, py_obj.is_simulation_mode)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: is_pdu_sync_mode 
     # type_name: bool 
     # offset: 24 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 24
 
-    
-    bin = binary_io.typeTobin(type, py_obj.is_pdu_sync_mode)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.sim_state, py_obj.master_time, 1 if py_obj.is_pdu_created else 0, 1 if py_obj.is_simulation_mode else 0, 1 if py_obj.is_pdu_sync_mode else 0), expected_offset=parent_off + 0)
     
 
 if __name__ == "__main__":
@@ -10,12 +10,15 @@ from ..hako_srv_msgs.pdu_conv_GetWorldTimeRequest import *
 
 
 
-def pdu_to_py_GetWorldTimeRequestPacket(binary_data: bytearray) -> GetWorldTimeRequestPacket:
-    py_obj = GetWorldTimeRequestPacket()
+def pdu_to_py_GetWorldTimeRequestPacket(binary_data: bytearray, out: GetWorldTimeRequestPacket = None, array_mode: str = None) -> GetWorldTimeRequestPacket:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = GetWorldTimeRequestPacket() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_GetWorldTimeRequestPacket(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,7 +31,7 @@ def binary_read_recursive_GetWorldTimeRequestPacket(meta: binary_io.PduMetaData,
     # offset: 0 size: 268 
     # array_len: 1
 
-    tmp_py_obj = ServiceRequestHeader()
+    tmp_py_obj = reuse_obj(py_obj.header, ServiceRequestHeader)
     binary_read_recursive_ServiceRequestHeader(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -39,40 +42,20 @@ def binary_read_recursive_GetWorldTimeRequestPacket(meta: binary_io.PduMetaData,
     # offset: 272 size: 8 
     # array_len: 1
 
-    tmp_py_obj = GetWorldTimeRequest()
+    tmp_py_obj = reuse_obj(py_obj.body, GetWorldTimeRequest)
     binary_read_recursive_GetWorldTimeRequest(meta, binary_data, tmp_py_obj, base_off + 272)
     py_obj.body = tmp_py_obj
     
     return py_obj
 
 
-def py_to_pdu_GetWorldTimeRequestPacket(py_obj: GetWorldTimeRequestPacket) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_GetWorldTimeRequestPacket(py_obj: GetWorldTimeRequestPacket, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_GetWorldTimeRequestPacket(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_GetWorldTimeRequestPacket(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: GetWorldTimeRequestPacket):
     # array_type: single 
@@ -8,13 +8,19 @@ from .. import binary_io
 from ..hako_srv_msgs.pdu_conv_LogicalTime import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<I")  # result_code
 
-def pdu_to_py_GetWorldTimeResponse(binary_data: bytearray) -> GetWorldTimeResponse:
-    py_obj = GetWorldTimeResponse()
+
+def pdu_to_py_GetWorldTimeResponse(binary_data: bytearray, out: GetWorldTimeResponse = None, array_mode: str = None) -> GetWorldTimeResponse:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = GetWorldTimeResponse() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_GetWorldTimeResponse(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,9 +33,7 @@ def binary_read_recursive_GetWorldTimeResponse(meta: binary_io.PduMetaData, bina
     # offset: 0 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.result_code = binary_io.binTovalue("uint32", bin)
+    py_obj.result_code = _RUN_0.unpack_from(binary_data, base_off + 0)[0]
     
     # array_type: single 
     # data_type: struct 
@@ -38,40 +42,20 @@ def binary_read_recursive_GetWorldTimeResponse(meta: binary_io.PduMetaData, bina
     # offset: 8 size: 16 
     # array_len: 1
 
-    tmp_py_obj = LogicalTime()
+    tmp_py_obj = reuse_obj(py_obj.world_time, LogicalTime)
     binary_read_recursive_LogicalTime(meta, binary_data, tmp_py_obj, base_off + 8)
     py_obj.world_time = tmp_py_obj
     
     return py_obj
 
 
-def py_to_pdu_GetWorldTimeResponse(py_obj: GetWorldTimeResponse) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_GetWorldTimeResponse(py_obj: GetWorldTimeResponse, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_GetWorldTimeResponse(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_GetWorldTimeResponse(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: GetWorldTimeResponse):
     # array_type: single 
@@ -80,13 +64,8 @@ def binary_write_recursive_GetWorldTimeResponse(parent_off: int, bw_container: B
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
 
-    
-    bin = binary_io.typeTobin(type, py_obj.result_code)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.result_code), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: struct 
@@ -7,13 +7,20 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<I")  # request_id
+_RUN_1 = struct.Struct("<B3xi")  # opcode, status_poll_interval_msec
 
-def pdu_to_py_ServiceRequestHeader(binary_data: bytearray) -> ServiceRequestHeader:
-    py_obj = ServiceRequestHeader()
+
+def pdu_to_py_ServiceRequestHeader(binary_data: bytearray, out: ServiceRequestHeader = None, array_mode: str = None) -> ServiceRequestHeader:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = ServiceRequestHeader() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_ServiceRequestHeader(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -26,9 +33,7 @@ def binary_read_recursive_ServiceRequestHeader(meta: binary_io.PduMetaData, bina
     # offset: 0 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 4)
-    py_obj.request_id = binary_io.binTovalue("uint32", bin)
+    py_obj.request_id = _RUN_0.unpack_from(binary_data, base_off + 0)[0]
     
     # array_type: single 
     # data_type: primitive 
@@ -58,11 +63,6 @@ def binary_read_recursive_ServiceRequestHeader(meta: binary_io.PduMetaData, bina
     # type_name: uint8 
     # offset: 260 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 260, 1)
-    py_obj.opcode = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: status_poll_interval_msec 
@@ -70,40 +70,18 @@ def binary_read_recursive_ServiceRequestHeader(meta: binary_io.PduMetaData, bina
     # offset: 264 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 264, 4)
-    py_obj.status_poll_interval_msec = binary_io.binTovalue("int32", bin)
+    py_obj.opcode, py_obj.status_poll_interval_msec = _RUN_1.unpack_from(binary_data, base_off + 260)
     
     return py_obj
 
 
-def py_to_pdu_ServiceRequestHeader(py_obj: ServiceRequestHeader) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_ServiceRequestHeader(py_obj: ServiceRequestHeader, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_ServiceRequestHeader(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_ServiceRequestHeader(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: ServiceRequestHeader):
     # array_type: single 
@@ -112,13 +90,8 @@ def binary_write_recursive_ServiceRequestHeader(parent_off: int, bw_container: B
     # type_name: uint32 
     # offset: 0 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 0
 
-    
-    bin = binary_io.typeTobin(type, py_obj.request_id)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.request_id), expected_offset=parent_off + 0)
     
     # array_type: single 
     # data_type: primitive 
@@ -154,27 +127,14 @@ def binary_write_recursive_ServiceRequestHeader(parent_off: int, bw_container: B
     # type_name: uint8 
     # offset: 260 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 260
-
-    
-    bin = binary_io.typeTobin(type, py_obj.opcode)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: status_poll_interval_msec 
     # type_name: int32 
     # offset: 264 size: 4 
     # array_len: 1
-    type = "int32"
-    off = 264
 
-    
-    bin = binary_io.typeTobin(type, py_obj.status_poll_interval_msec)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.opcode, py_obj.status_poll_interval_msec), expected_offset=parent_off + 260)
     
 
 if __name__ == "__main__":
@@ -10,6 +10,8 @@ class AckEventRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("name", "event_code", "result_code")
+
     name: str
     event_code: int
     result_code: int
@@ -34,36 +36,9 @@ class AckEventRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'name'
-        field_val = self.name
-        if isinstance(field_val, bytearray):
-            d['name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['name'] = field_val
-        # handle field 'event_code'
-        field_val = self.event_code
-        if isinstance(field_val, bytearray):
-            d['event_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['event_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['event_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['event_code'] = field_val
-        # handle field 'result_code'
-        field_val = self.result_code
-        if isinstance(field_val, bytearray):
-            d['result_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['result_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['result_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['result_code'] = field_val
+        d['name'] = self.name
+        d['event_code'] = self.event_code
+        d['result_code'] = self.result_code
         return d
 
     @classmethod
@@ -71,58 +46,11 @@ class AckEventRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'name'
-        if 'name' in d:
-            field_type = cls.__annotations__.get('name')
-            value = d['name']
-            
-            if field_type is bytearray:
-                obj.name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.name = field_type.from_dict(value)
-            else:
-                obj.name = value
-        # handle field 'event_code'
-        if 'event_code' in d:
-            field_type = cls.__annotations__.get('event_code')
-            value = d['event_code']
-            
-            if field_type is bytearray:
-                obj.event_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.event_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.event_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.event_code = field_type.from_dict(value)
-            else:
-                obj.event_code = value
-        # handle field 'result_code'
-        if 'result_code' in d:
-            field_type = cls.__annotations__.get('result_code')
-            value = d['result_code']
-            
-            if field_type is bytearray:
-                obj.result_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.result_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.result_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.result_code = field_type.from_dict(value)
-            else:
-                obj.result_code = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.name = d.get('name', "")
+        obj.event_code = d.get('event_code', 0)
+        obj.result_code = d.get('result_code', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class AckEventResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("ack_code",)
+
     ack_code: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class AckEventResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'ack_code'
-        field_val = self.ack_code
-        if isinstance(field_val, bytearray):
-            d['ack_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['ack_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['ack_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['ack_code'] = field_val
+        d['ack_code'] = self.ack_code
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class AckEventResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'ack_code'
-        if 'ack_code' in d:
-            field_type = cls.__annotations__.get('ack_code')
-            value = d['ack_code']
-            
-            if field_type is bytearray:
-                obj.ack_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.ack_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.ack_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.ack_code = field_type.from_dict(value)
-            else:
-                obj.ack_code = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.ack_code = d.get('ack_code', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class AddTwoIntsRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("a", "b")
+
     a: int
     b: int
 
@@ -31,26 +33,8 @@ class AddTwoIntsRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'a'
-        field_val = self.a
-        if isinstance(field_val, bytearray):
-            d['a'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['a'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['a'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['a'] = field_val
-        # handle field 'b'
-        field_val = self.b
-        if isinstance(field_val, bytearray):
-            d['b'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['b'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['b'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['b'] = field_val
+        d['a'] = self.a
+        d['b'] = self.b
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class AddTwoIntsRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'a'
-        if 'a' in d:
-            field_type = cls.__annotations__.get('a')
-            value = d['a']
-            
-            if field_type is bytearray:
-                obj.a = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.a = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.a = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.a = field_type.from_dict(value)
-            else:
-                obj.a = value
-        # handle field 'b'
-        if 'b' in d:
-            field_type = cls.__annotations__.get('b')
-            value = d['b']
-            
-            if field_type is bytearray:
-                obj.b = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.b = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.b = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.b = field_type.from_dict(value)
-            else:
-                obj.b = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.a = d.get('a', 0)
+        obj.b = d.get('b', 0)
         return obj
 
     def to_json(self, indent=2):
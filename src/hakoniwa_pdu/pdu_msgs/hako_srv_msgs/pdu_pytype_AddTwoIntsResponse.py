@@ -10,6 +10,8 @@ class AddTwoIntsResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("sum",)
+
     sum: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class AddTwoIntsResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'sum'
-        field_val = self.sum
-        if isinstance(field_val, bytearray):
-            d['sum'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['sum'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['sum'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['sum'] = field_val
+        d['sum'] = self.sum
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class AddTwoIntsResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'sum'
-        if 'sum' in d:
-            field_type = cls.__annotations__.get('sum')
-            value = d['sum']
-            
-            if field_type is bytearray:
-                obj.sum = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.sum = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.sum = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.sum = field_type.from_dict(value)
-            else:
-                obj.sum = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.sum = d.get('sum', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class AttachRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("asset_name", "delta_asset_tick")
+
     asset_name: str
     delta_asset_tick: int
 
@@ -31,26 +33,8 @@ class AttachRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'asset_name'
-        field_val = self.asset_name
-        if isinstance(field_val, bytearray):
-            d['asset_name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['asset_name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['asset_name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['asset_name'] = field_val
-        # handle field 'delta_asset_tick'
-        field_val = self.delta_asset_tick
-        if isinstance(field_val, bytearray):
-            d['delta_asset_tick'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['delta_asset_tick'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['delta_asset_tick'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['delta_asset_tick'] = field_val
+        d['asset_name'] = self.asset_name
+        d['delta_asset_tick'] = self.delta_asset_tick
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class AttachRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'asset_name'
-        if 'asset_name' in d:
-            field_type = cls.__annotations__.get('asset_name')
-            value = d['asset_name']
-            
-            if field_type is bytearray:
-                obj.asset_name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.asset_name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.asset_name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.asset_name = field_type.from_dict(value)
-            else:
-                obj.asset_name = value
-        # handle field 'delta_asset_tick'
-        if 'delta_asset_tick' in d:
-            field_type = cls.__annotations__.get('delta_asset_tick')
-            value = d['delta_asset_tick']
-            
-            if field_type is bytearray:
-                obj.delta_asset_tick = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.delta_asset_tick = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.delta_asset_tick = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.delta_asset_tick = field_type.from_dict(value)
-            else:
-                obj.delta_asset_tick = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.asset_name = d.get('asset_name', "")
+        obj.delta_asset_tick = d.get('delta_asset_tick', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -11,6 +11,8 @@ class AttachResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("result_code", "session_id", "world_time", "delta_asset_tick")
+
     result_code: int
     session_id: int
     world_time: LogicalTime
@@ -38,46 +40,10 @@ class AttachResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'result_code'
-        field_val = self.result_code
-        if isinstance(field_val, bytearray):
-            d['result_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['result_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['result_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['result_code'] = field_val
-        # handle field 'session_id'
-        field_val = self.session_id
-        if isinstance(field_val, bytearray):
-            d['session_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['session_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['session_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['session_id'] = field_val
-        # handle field 'world_time'
-        field_val = self.world_time
-        if isinstance(field_val, bytearray):
-            d['world_time'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['world_time'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['world_time'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['world_time'] = field_val
-        # handle field 'delta_asset_tick'
-        field_val = self.delta_asset_tick
-        if isinstance(field_val, bytearray):
-            d['delta_asset_tick'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['delta_asset_tick'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['delta_asset_tick'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['delta_asset_tick'] = field_val
+        d['result_code'] = self.result_code
+        d['session_id'] = self.session_id
+        d['world_time'] = self.world_time.to_dict()
+        d['delta_asset_tick'] = self.delta_asset_tick
         return d
 
     @classmethod
@@ -85,75 +51,12 @@ class AttachResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'result_code'
-        if 'result_code' in d:
-            field_type = cls.__annotations__.get('result_code')
-            value = d['result_code']
-            
-            if field_type is bytearray:
-                obj.result_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.result_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.result_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.result_code = field_type.from_dict(value)
-            else:
-                obj.result_code = value
-        # handle field 'session_id'
-        if 'session_id' in d:
-            field_type = cls.__annotations__.get('session_id')
-            value = d['session_id']
-            
-            if field_type is bytearray:
-                obj.session_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.session_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.session_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.session_id = field_type.from_dict(value)
-            else:
-                obj.session_id = value
-        # handle field 'world_time'
-        if 'world_time' in d:
-            field_type = cls.__annotations__.get('world_time')
-            value = d['world_time']
-            
-            if field_type is bytearray:
-                obj.world_time = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.world_time = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.world_time = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.world_time = field_type.from_dict(value)
-            else:
-                obj.world_time = value
-        # handle field 'delta_asset_tick'
-        if 'delta_asset_tick' in d:
-            field_type = cls.__annotations__.get('delta_asset_tick')
-            value = d['delta_asset_tick']
-            
-            if field_type is bytearray:
-                obj.delta_asset_tick = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.delta_asset_tick = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.delta_asset_tick = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.delta_asset_tick = field_type.from_dict(value)
-            else:
-                obj.delta_asset_tick = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.result_code = d.get('result_code', 0)
+        obj.session_id = d.get('session_id', 0)
+        obj.world_time = LogicalTime.from_dict(d['world_time']) if 'world_time' in d else LogicalTime()
+        obj.delta_asset_tick = d.get('delta_asset_tick', 0)
         return obj
 
     def to_json(self, indent=2):
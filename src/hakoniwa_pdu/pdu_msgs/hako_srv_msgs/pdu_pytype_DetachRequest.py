@@ -10,6 +10,8 @@ class DetachRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("session_id",)
+
     session_id: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class DetachRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'session_id'
-        field_val = self.session_id
-        if isinstance(field_val, bytearray):
-            d['session_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['session_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['session_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['session_id'] = field_val
+        d['session_id'] = self.session_id
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class DetachRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'session_id'
-        if 'session_id' in d:
-            field_type = cls.__annotations__.get('session_id')
-            value = d['session_id']
-            
-            if field_type is bytearray:
-                obj.session_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.session_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.session_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.session_id = field_type.from_dict(value)
-            else:
-                obj.session_id = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.session_id = d.get('session_id', 0)
         return obj
 
     def to_json(self, indent=2):
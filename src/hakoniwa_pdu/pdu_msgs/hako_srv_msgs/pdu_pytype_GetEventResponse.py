@@ -10,6 +10,8 @@ class GetEventResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("event_code",)
+
     event_code: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class GetEventResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'event_code'
-        field_val = self.event_code
-        if isinstance(field_val, bytearray):
-            d['event_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['event_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['event_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['event_code'] = field_val
+        d['event_code'] = self.event_code
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class GetEventResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'event_code'
-        if 'event_code' in d:
-            field_type = cls.__annotations__.get('event_code')
-            value = d['event_code']
-            
-            if field_type is bytearray:
-                obj.event_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.event_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.event_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.event_code = field_type.from_dict(value)
-            else:
-                obj.event_code = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.event_code = d.get('event_code', 0)
         return obj
 
     def to_json(self, indent=2):
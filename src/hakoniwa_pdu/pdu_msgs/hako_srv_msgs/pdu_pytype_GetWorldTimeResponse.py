@@ -11,6 +11,8 @@ class GetWorldTimeResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("result_code", "world_time")
+
     result_code: int
     world_time: LogicalTime
 
@@ -32,26 +34,8 @@ class GetWorldTimeResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'result_code'
-        field_val = self.result_code
-        if isinstance(field_val, bytearray):
-            d['result_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['result_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['result_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['result_code'] = field_val
-        # handle field 'world_time'
-        field_val = self.world_time
-        if isinstance(field_val, bytearray):
-            d['world_time'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['world_time'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['world_time'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['world_time'] = field_val
+        d['result_code'] = self.result_code
+        d['world_time'] = self.world_time.to_dict()
         return d
 
     @classmethod
@@ -59,41 +43,10 @@ class GetWorldTimeResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'result_code'
-        if 'result_code' in d:
-            field_type = cls.__annotations__.get('result_code')
-            value = d['result_code']
-            
-            if field_type is bytearray:
-                obj.result_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.result_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.result_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.result_code = field_type.from_dict(value)
-            else:
-                obj.result_code = value
-        # handle field 'world_time'
-        if 'world_time' in d:
-            field_type = cls.__annotations__.get('world_time')
-            value = d['world_time']
-            
-            if field_type is bytearray:
-                obj.world_time = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.world_time = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.world_time = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.world_time = field_type.from_dict(value)
-            else:
-                obj.world_time = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.result_code = d.get('result_code', 0)
+        obj.world_time = LogicalTime.from_dict(d['world_time']) if 'world_time' in d else LogicalTime()
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class JoinResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("status_code", "message")
+
     status_code: int
     message: str
 
@@ -31,26 +33,8 @@ class JoinResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'status_code'
-        field_val = self.status_code
-        if isinstance(field_val, bytearray):
-            d['status_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['status_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['status_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['status_code'] = field_val
-        # handle field 'message'
-        field_val = self.message
-        if isinstance(field_val, bytearray):
-            d['message'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['message'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['message'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['message'] = field_val
+        d['status_code'] = self.status_code
+        d['message'] = self.message
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class JoinResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'status_code'
-        if 'status_code' in d:
-            field_type = cls.__annotations__.get('status_code')
-            value = d['status_code']
-            
-            if field_type is bytearray:
-                obj.status_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.status_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.status_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.status_code = field_type.from_dict(value)
-            else:
-                obj.status_code = value
-        # handle field 'message'
-        if 'message' in d:
-            field_type = cls.__annotations__.get('message')
-            value = d['message']
-            
-            if field_type is bytearray:
-                obj.message = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.message = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.message = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.message = field_type.from_dict(value)
-            else:
-                obj.message = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.status_code = d.get('status_code', 0)
+        obj.message = d.get('message', "")
         return obj
 
     def to_json(self, indent=2):
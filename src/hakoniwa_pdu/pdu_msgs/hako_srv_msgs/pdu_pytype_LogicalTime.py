@@ -10,6 +10,8 @@ class LogicalTime:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("generation", "offset_tick")
+
     generation: int
     offset_tick: int
 
@@ -31,26 +33,8 @@ class LogicalTime:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'generation'
-        field_val = self.generation
-        if isinstance(field_val, bytearray):
-            d['generation'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['generation'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['generation'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['generation'] = field_val
-        # handle field 'offset_tick'
-        field_val = self.offset_tick
-        if isinstance(field_val, bytearray):
-            d['offset_tick'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['offset_tick'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['offset_tick'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['offset_tick'] = field_val
+        d['generation'] = self.generation
+        d['offset_tick'] = self.offset_tick
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class LogicalTime:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'generation'
-        if 'generation' in d:
-            field_type = cls.__annotations__.get('generation')
-            value = d['generation']
-            
-            if field_type is bytearray:
-                obj.generation = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.generation = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.generation = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.generation = field_type.from_dict(value)
-            else:
-                obj.generation = value
-        # handle field 'offset_tick'
-        if 'offset_tick' in d:
-            field_type = cls.__annotations__.get('offset_tick')
-            value = d['offset_tick']
-            
-            if field_type is bytearray:
-                obj.offset_tick = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.offset_tick = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.offset_tick = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.offset_tick = field_type.from_dict(value)
-            else:
-                obj.offset_tick = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.generation = d.get('generation', 0)
+        obj.offset_tick = d.get('offset_tick', 0)
         return obj
 
     def to_json(self, indent=2):
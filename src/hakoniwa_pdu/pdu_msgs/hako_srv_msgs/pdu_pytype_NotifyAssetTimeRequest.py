@@ -11,6 +11,8 @@ class NotifyAssetTimeRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("session_id", "asset_time")
+
     session_id: int
     asset_time: LogicalTime
 
@@ -32,26 +34,8 @@ class NotifyAssetTimeRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'session_id'
-        field_val = self.session_id
-        if isinstance(field_val, bytearray):
-            d['session_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['session_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['session_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['session_id'] = field_val
-        # handle field 'asset_time'
-        field_val = self.asset_time
-        if isinstance(field_val, bytearray):
-            d['asset_time'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['asset_time'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['asset_time'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['asset_time'] = field_val
+        d['session_id'] = self.session_id
+        d['asset_time'] = self.asset_time.to_dict()
         return d
 
     @classmethod
@@ -59,41 +43,10 @@ class NotifyAssetTimeRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'session_id'
-        if 'session_id' in d:
-            field_type = cls.__annotations__.get('session_id')
-            value = d['session_id']
-            
-            if field_type is bytearray:
-                obj.session_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.session_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.session_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.session_id = field_type.from_dict(value)
-            else:
-                obj.session_id = value
-        # handle field 'asset_time'
-        if 'asset_time' in d:
-            field_type = cls.__annotations__.get('asset_time')
-            value = d['asset_time']
-            
-            if field_type is bytearray:
-                obj.asset_time = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.asset_time = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.asset_time = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.asset_time = field_type.from_dict(value)
-            else:
-                obj.asset_time = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.session_id = d.get('session_id', 0)
+        obj.asset_time = LogicalTime.from_dict(d['asset_time']) if 'asset_time' in d else LogicalTime()
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class NotifyAssetTimeResponse:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("result_code",)
+
     result_code: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class NotifyAssetTimeResponse:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'result_code'
-        field_val = self.result_code
-        if isinstance(field_val, bytearray):
-            d['result_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['result_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['result_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['result_code'] = field_val
+        d['result_code'] = self.result_code
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class NotifyAssetTimeResponse:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'result_code'
-        if 'result_code' in d:
-            field_type = cls.__annotations__.get('result_code')
-            value = d['result_code']
-            
-            if field_type is bytearray:
-                obj.result_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.result_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.result_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.result_code = field_type.from_dict(value)
-            else:
-                obj.result_code = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.result_code = d.get('result_code', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class RegisterClientRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("dummy",)
+
     dummy: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class RegisterClientRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'dummy'
-        field_val = self.dummy
-        if isinstance(field_val, bytearray):
-            d['dummy'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['dummy'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['dummy'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['dummy'] = field_val
+        d['dummy'] = self.dummy
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class RegisterClientRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'dummy'
-        if 'dummy' in d:
-            field_type = cls.__annotations__.get('dummy')
-            value = d['dummy']
-            
-            if field_type is bytearray:
-                obj.dummy = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.dummy = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.dummy = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.dummy = field_type.from_dict(value)
-            else:
-                obj.dummy = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.dummy = d.get('dummy', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class ServiceResponseHeader:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("request_id", "service_name", "client_name", "status", "processing_percentage", "result_code")
+
     request_id: int
     service_name: str
     client_name: str
@@ -43,66 +45,12 @@ class ServiceResponseHeader:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'request_id'
-        field_val = self.request_id
-        if isinstance(field_val, bytearray):
-            d['request_id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['request_id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['request_id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['request_id'] = field_val
-        # handle field 'service_name'
-        field_val = self.service_name
-        if isinstance(field_val, bytearray):
-            d['service_name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['service_name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['service_name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['service_name'] = field_val
-        # handle field 'client_name'
-        field_val = self.client_name
-        if isinstance(field_val, bytearray):
-            d['client_name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['client_name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['client_name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['client_name'] = field_val
-        # handle field 'status'
-        field_val = self.status
-        if isinstance(field_val, bytearray):
-            d['status'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['status'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['status'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['status'] = field_val
-        # handle field 'processing_percentage'
-        field_val = self.processing_percentage
-        if isinstance(field_val, bytearray):
-            d['processing_percentage'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['processing_percentage'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['processing_percentage'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['processing_percentage'] = field_val
-        # handle field 'result_code'
-        field_val = self.result_code
-        if isinstance(field_val, bytearray):
-            d['result_code'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['result_code'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['result_code'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['result_code'] = field_val
+        d['request_id'] = self.request_id
+        d['service_name'] = self.service_name
+        d['client_name'] = self.client_name
+        d['status'] = self.status
+        d['processing_percentage'] = self.processing_percentage
+        d['result_code'] = self.result_code
         return d
 
     @classmethod
@@ -110,109 +58,14 @@ class ServiceResponseHeader:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'request_id'
-        if 'request_id' in d:
-            field_type = cls.__annotations__.get('request_id')
-            value = d['request_id']
-            
-            if field_type is bytearray:
-                obj.request_id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.request_id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.request_id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.request_id = field_type.from_dict(value)
-            else:
-                obj.request_id = value
-        # handle field 'service_name'
-        if 'service_name' in d:
-            field_type = cls.__annotations__.get('service_name')
-            value = d['service_name']
-            
-            if field_type is bytearray:
-                obj.service_name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.service_name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.service_name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.service_name = field_type.from_dict(value)
-            else:
-                obj.service_name = value
-        # handle field 'client_name'
-        if 'client_name' in d:
-            field_type = cls.__annotations__.get('client_name')
-            value = d['client_name']
-            
-            if field_type is bytearray:
-                obj.client_name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.client_name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.client_name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.client_name = field_type.from_dict(value)
-            else:
-                obj.client_name = value
-        # handle field 'status'
-        if 'status' in d:
-            field_type = cls.__annotations__.get('status')
-            value = d['status']
-            
-            if field_type is bytearray:
-                obj.status = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.status = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.status = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.status = field_type.from_dict(value)
-            else:
-                obj.status = value
-        # handle field 'processing_percentage'
-        if 'processing_percentage' in d:
-            field_type = cls.__annotations__.get('processing_percentage')
-            value = d['processing_percentage']
-            
-            if field_type is bytearray:
-                obj.processing_percentage = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.processing_percentage = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.processing_percentage = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.processing_percentage = field_type.from_dict(value)
-            else:
-                obj.processing_percentage = value
-        # handle field 'result_code'
-        if 'result_code' in d:
-            field_type = cls.__annotations__.get('result_code')
-            value = d['result_code']
-            
-            if field_type is bytearray:
-                obj.result_code = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.result_code = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.result_code = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.result_code = field_type.from_dict(value)
-            else:
-                obj.result_code = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.request_id = d.get('request_id', 0)
+        obj.service_name = d.get('service_name', "")
+        obj.client_name = d.get('client_name', "")
+        obj.status = d.get('status', 0)
+        obj.processing_percentage = d.get('processing_percentage', 0)
+        obj.result_code = d.get('result_code', 0)
         return obj
 
     def to_json(self, indent=2):
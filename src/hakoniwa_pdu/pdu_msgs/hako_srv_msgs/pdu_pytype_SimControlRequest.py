@@ -10,6 +10,8 @@ class SimControlRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("name", "op")
+
     name: str
     op: int
 
@@ -31,26 +33,8 @@ class SimControlRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'name'
-        field_val = self.name
-        if isinstance(field_val, bytearray):
-            d['name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['name'] = field_val
-        # handle field 'op'
-        field_val = self.op
-        if isinstance(field_val, bytearray):
-            d['op'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['op'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['op'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['op'] = field_val
+        d['name'] = self.name
+        d['op'] = self.op
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class SimControlRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'name'
-        if 'name' in d:
-            field_type = cls.__annotations__.get('name')
-            value = d['name']
-            
-            if field_type is bytearray:
-                obj.name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.name = field_type.from_dict(value)
-            else:
-                obj.name = value
-        # handle field 'op'
-        if 'op' in d:
-            field_type = cls.__annotations__.get('op')
-            value = d['op']
-            
-            if field_type is bytearray:
-                obj.op = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.op = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.op = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.op = field_type.from_dict(value)
-            else:
-                obj.op = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.name = d.get('name', "")
+        obj.op = d.get('op', 0)
         return obj
 
     def to_json(self, indent=2):
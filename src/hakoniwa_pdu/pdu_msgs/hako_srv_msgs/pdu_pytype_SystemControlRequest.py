@@ -10,6 +10,8 @@ class SystemControlRequest:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("opcode",)
+
     opcode: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class SystemControlRequest:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'opcode'
-        field_val = self.opcode
-        if isinstance(field_val, bytearray):
-            d['opcode'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['opcode'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['opcode'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['opcode'] = field_val
+        d['opcode'] = self.opcode
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class SystemControlRequest:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'opcode'
-        if 'opcode' in d:
-            field_type = cls.__annotations__.get('opcode')
-            value = d['opcode']
-            
-            if field_type is bytearray:
-                obj.opcode = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.opcode = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.opcode = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.opcode = field_type.from_dict(value)
-            else:
-                obj.opcode = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.opcode = d.get('opcode', 0)
         return obj
 
     def to_json(self, indent=2):
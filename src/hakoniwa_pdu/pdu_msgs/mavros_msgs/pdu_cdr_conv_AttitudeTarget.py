@@ -1,5 +1,6 @@
 from .pdu_pytype_AttitudeTarget import AttitudeTarget
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
@@ -7,26 +8,24 @@ from ..builtin_interfaces.pdu_cdr_conv_Time import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("Bdddddddf")  # type_mask, orientation.x, orientation.y, orientation.z, orientation.w, body_rate.x, body_rate.y, body_rate.z, thrust
+
 
 def py_to_cdr_body_AttitudeTarget(writer: CdrWriter, src: AttitudeTarget):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_uint8(src.type_mask)
-    py_to_cdr_body_Quaternion(writer, src.orientation)
-    py_to_cdr_body_Vector3(writer, src.body_rate)
-    writer.write_float32(src.thrust)
+    writer.write_run(_CDR_RUN_0, (src.type_mask, src.orientation.x, src.orientation.y, src.orientation.z, src.orientation.w, src.body_rate.x, src.body_rate.y, src.body_rate.z, src.thrust))
 
 
 def cdr_body_to_py_AttitudeTarget(reader: CdrReader, dst: AttitudeTarget):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.type_mask = reader.read_uint8()
-    cdr_body_to_py_Quaternion(reader, dst.orientation)
-    cdr_body_to_py_Vector3(reader, dst.body_rate)
-    dst.thrust = reader.read_float32()
+    dst.type_mask, dst.orientation.x, dst.orientation.y, dst.orientation.z, dst.orientation.w, dst.body_rate.x, dst.body_rate.y, dst.body_rate.z, dst.thrust = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_AttitudeTarget(src: AttitudeTarget) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["mavros_msgs/AttitudeTarget"])
     writer.write_encapsulation()
     py_to_cdr_body_AttitudeTarget(writer, src)
     return writer.bytes()
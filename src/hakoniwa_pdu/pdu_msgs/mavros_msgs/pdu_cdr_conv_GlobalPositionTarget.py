@@ -1,41 +1,30 @@
 from .pdu_pytype_GlobalPositionTarget import GlobalPositionTarget
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("BHddfddddddff")  # coordinate_frame, type_mask, latitude, longitude, altitude, velocity.x, velocity.y, velocity.z, acceleration_or_force.x, acceleration_or_force.y, acceleration_or_force.z, yaw, yaw_rate
+
 
 def py_to_cdr_body_GlobalPositionTarget(writer: CdrWriter, src: GlobalPositionTarget):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_uint8(src.coordinate_frame)
-    writer.write_uint16(src.type_mask)
-    writer.write_float64(src.latitude)
-    writer.write_float64(src.longitude)
-    writer.write_float32(src.altitude)
-    py_to_cdr_body_Vector3(writer, src.velocity)
-    py_to_cdr_body_Vector3(writer, src.acceleration_or_force)
-    writer.write_float32(src.yaw)
-    writer.write_float32(src.yaw_rate)
+    writer.write_run(_CDR_RUN_0, (src.coordinate_frame, src.type_mask, src.latitude, src.longitude, src.altitude, src.velocity.x, src.velocity.y, src.velocity.z, src.acceleration_or_force.x, src.acceleration_or_force.y, src.acceleration_or_force.z, src.yaw, src.yaw_rate))
 
 
 def cdr_body_to_py_GlobalPositionTarget(reader: CdrReader, dst: GlobalPositionTarget):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.coordinate_frame = reader.read_uint8()
-    dst.type_mask = reader.read_uint16()
-    dst.latitude = reader.read_float64()
-    dst.longitude = reader.read_float64()
-    dst.altitude = reader.read_float32()
-    cdr_body_to_py_Vector3(reader, dst.velocity)
-    cdr_body_to_py_Vector3(reader, dst.acceleration_or_force)
-    dst.yaw = reader.read_float32()
-    dst.yaw_rate = reader.read_float32()
+    dst.coordinate_frame, dst.type_mask, dst.latitude, dst.longitude, dst.altitude, dst.velocity.x, dst.velocity.y, dst.velocity.z, dst.acceleration_or_force.x, dst.acceleration_or_force.y, dst.acceleration_or_force.z, dst.yaw, dst.yaw_rate = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_GlobalPositionTarget(src: GlobalPositionTarget) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["mavros_msgs/GlobalPositionTarget"])
     writer.write_encapsulation()
     py_to_cdr_body_GlobalPositionTarget(writer, src)
     return writer.bytes()
@@ -10,13 +10,20 @@ from ..geometry_msgs.pdu_conv_Quaternion import *
 from ..geometry_msgs.pdu_conv_Vector3 import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<B")  # type_mask
+_RUN_1 = struct.Struct("<f")  # thrust
 
-def pdu_to_py_AttitudeTarget(binary_data: bytearray) -> AttitudeTarget:
-    py_obj = AttitudeTarget()
+
+def pdu_to_py_AttitudeTarget(binary_data: bytearray, out: AttitudeTarget = None, array_mode: str = None) -> AttitudeTarget:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = AttitudeTarget() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_AttitudeTarget(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -29,7 +36,7 @@ def binary_read_recursive_AttitudeTarget(meta: binary_io.PduMetaData, binary_dat
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -40,9 +47,7 @@ def binary_read_recursive_AttitudeTarget(meta: binary_io.PduMetaData, binary_dat
     # offset: 136 size: 1 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 1)
-    py_obj.type_mask = binary_io.binTovalue("uint8", bin)
+    py_obj.type_mask = _RUN_0.unpack_from(binary_data, base_off + 136)[0]
     
     # array_type: single 
     # data_type: struct 
@@ -51,7 +56,7 @@ def binary_read_recursive_AttitudeTarget(meta: binary_io.PduMetaData, binary_dat
     # offset: 144 size: 32 
     # array_len: 1
 
-    tmp_py_obj = Quaternion()
+    tmp_py_obj = reuse_obj(py_obj.orientation, Quaternion)
     binary_read_recursive_Quaternion(meta, binary_data, tmp_py_obj, base_off + 144)
     py_obj.orientation = tmp_py_obj
     
@@ -62,7 +67,7 @@ def binary_read_recursive_AttitudeTarget(meta: binary_io.PduMetaData, binary_dat
     # offset: 176 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.body_rate, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 176)
     py_obj.body_rate = tmp_py_obj
     
@@ -73,40 +78,18 @@ def binary_read_recursive_AttitudeTarget(meta: binary_io.PduMetaData, binary_dat
     # offset: 200 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 200, 4)
-    py_obj.thrust = binary_io.binTovalue("float32", bin)
+    py_obj.thrust = _RUN_1.unpack_from(binary_data, base_off + 200)[0]
     
     return py_obj
 
 
-def py_to_pdu_AttitudeTarget(py_obj: AttitudeTarget) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_AttitudeTarget(py_obj: AttitudeTarget, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_AttitudeTarget(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_AttitudeTarget(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: AttitudeTarget):
     # array_type: single 
@@ -126,13 +109,8 @@ def binary_write_recursive_AttitudeTarget(parent_off: int, bw_container: BinaryW
     # type_name: uint8 
     # offset: 136 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 136
 
-    
-    bin = binary_io.typeTobin(type, py_obj.type_mask)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.type_mask), expected_offset=parent_off + 136)
     
     # array_type: single 
     # data_type: struct 
@@ -162,13 +140,8 @@ def binary_write_recursive_AttitudeTarget(parent_off: int, bw_container: BinaryW
     # type_name: float32 
     # offset: 200 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 200
 
-    
-    bin = binary_io.typeTobin(type, py_obj.thrust)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.thrust), expected_offset=parent_off + 200)
     
 
 if __name__ == "__main__":
@@ -10,13 +10,20 @@ from ..geometry_msgs.pdu_conv_Vector3 import *
 from ..geometry_msgs.pdu_conv_Vector3 import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<B1xH4xddf")  # coordinate_frame, type_mask, latitude, longitude, altitude
+_RUN_1 = struct.Struct("<ff")  # yaw, yaw_rate
 
-def pdu_to_py_GlobalPositionTarget(binary_data: bytearray) -> GlobalPositionTarget:
-    py_obj = GlobalPositionTarget()
+
+def pdu_to_py_GlobalPositionTarget(binary_data: bytearray, out: GlobalPositionTarget = None, array_mode: str = None) -> GlobalPositionTarget:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = GlobalPositionTarget() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_GlobalPositionTarget(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -29,7 +36,7 @@ def binary_read_recursive_GlobalPositionTarget(meta: binary_io.PduMetaData, bina
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -39,44 +46,24 @@ def binary_read_recursive_GlobalPositionTarget(meta: binary_io.PduMetaData, bina
     # type_name: uint8 
     # offset: 136 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 1)
-    py_obj.coordinate_frame = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: type_mask 
     # type_name: uint16 
     # offset: 138 size: 2 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 138, 2)
-    py_obj.type_mask = binary_io.binTovalue("uint16", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: latitude 
     # type_name: float64 
     # offset: 144 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 144, 8)
-    py_obj.latitude = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: longitude 
     # type_name: float64 
     # offset: 152 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 152, 8)
-    py_obj.longitude = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: altitude 
@@ -84,9 +71,7 @@ def binary_read_recursive_GlobalPositionTarget(meta: binary_io.PduMetaData, bina
     # offset: 160 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 160, 4)
-    py_obj.altitude = binary_io.binTovalue("float32", bin)
+    py_obj.coordinate_frame, py_obj.type_mask, py_obj.latitude, py_obj.longitude, py_obj.altitude = _RUN_0.unpack_from(binary_data, base_off + 136)
     
     # array_type: single 
     # data_type: struct 
@@ -95,7 +80,7 @@ def binary_read_recursive_GlobalPositionTarget(meta: binary_io.PduMetaData, bina
     # offset: 168 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.velocity, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 168)
     py_obj.velocity = tmp_py_obj
     
@@ -106,7 +91,7 @@ def binary_read_recursive_GlobalPositionTarget(meta: binary_io.PduMetaData, bina
     # offset: 192 size: 24 
     # array_len: 1
 
-    tmp_py_obj = Vector3()
+    tmp_py_obj = reuse_obj(py_obj.acceleration_or_force, Vector3)
     binary_read_recursive_Vector3(meta, binary_data, tmp_py_obj, base_off + 192)
     py_obj.acceleration_or_force = tmp_py_obj
     
@@ -116,11 +101,6 @@ def binary_read_recursive_GlobalPositionTarget(meta: binary_io.PduMetaData, bina
     # type_name: float32 
     # offset: 216 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 216, 4)
-    py_obj.yaw = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw_rate 
@@ -128,40 +108,18 @@ def binary_read_recursive_GlobalPositionTarget(meta: binary_io.PduMetaData, bina
     # offset: 220 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 220, 4)
-    py_obj.yaw_rate = binary_io.binTovalue("float32", bin)
+    py_obj.yaw, py_obj.yaw_rate = _RUN_1.unpack_from(binary_data, base_off + 216)
     
     return py_obj
 
 
-def py_to_pdu_GlobalPositionTarget(py_obj: GlobalPositionTarget) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_GlobalPositionTarget(py_obj: GlobalPositionTarget, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_GlobalPositionTarget(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_GlobalPositionTarget(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: GlobalPositionTarget):
     # array_type: single 
@@ -181,69 +139,32 @@ def binary_write_recursive_GlobalPositionTarget(parent_off: int, bw_container: B
     # type_name: uint8 
     # offset: 136 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 136
-
-    
-    bin = binary_io.typeTobin(type, py_obj.coordinate_frame)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: type_mask 
     # type_name: uint16 
     # offset: 138 size: 2 
     # array_len: 1
-    type = "uint16"
-    off = 138
-
-    
-    bin = binary_io.typeTobin(type, py_obj.type_mask)
-    bin = get_binary(type, bin, 2)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: latitude 
     # type_name: float64 
     # offset: 144 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 144
-
-    
-    bin = binary_io.typeTobin(type, py_obj.latitude)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: longitude 
     # type_name: float64 
     # offset: 152 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 152
-
-    
-    bin = binary_io.typeTobin(type, py_obj.longitude)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: altitude 
     # type_name: float32 
     # offset: 160 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 160
 
-    
-    bin = binary_io.typeTobin(type, py_obj.altitude)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.coordinate_frame, py_obj.type_mask, py_obj.latitude, py_obj.longitude, py_obj.altitude), expected_offset=parent_off + 136)
     
     # array_type: single 
     # data_type: struct 
@@ -273,27 +194,14 @@ def binary_write_recursive_GlobalPositionTarget(parent_off: int, bw_container: B
     # type_name: float32 
     # offset: 216 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 216
-
-    
-    bin = binary_io.typeTobin(type, py_obj.yaw)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: yaw_rate 
     # type_name: float32 
     # offset: 220 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 220
 
-    
-    bin = binary_io.typeTobin(type, py_obj.yaw_rate)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.yaw, py_obj.yaw_rate), expected_offset=parent_off + 216)
     
 
 if __name__ == "__main__":
@@ -13,6 +13,8 @@ class GlobalPositionTarget:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "coordinate_frame", "type_mask", "latitude", "longitude", "altitude", "velocity", "acceleration_or_force", "yaw", "yaw_rate")
+
     header: Header
     coordinate_frame: int
     type_mask: int
@@ -58,106 +60,16 @@ class GlobalPositionTarget:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'coordinate_frame'
-        field_val = self.coordinate_frame
-        if isinstance(field_val, bytearray):
-            d['coordinate_frame'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['coordinate_frame'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['coordinate_frame'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['coordinate_frame'] = field_val
-        # handle field 'type_mask'
-        field_val = self.type_mask
-        if isinstance(field_val, bytearray):
-            d['type_mask'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['type_mask'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['type_mask'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['type_mask'] = field_val
-        # handle field 'latitude'
-        field_val = self.latitude
-        if isinstance(field_val, bytearray):
-            d['latitude'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['latitude'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['latitude'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['latitude'] = field_val
-        # handle field 'longitude'
-        field_val = self.longitude
-        if isinstance(field_val, bytearray):
-            d['longitude'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['longitude'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['longitude'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['longitude'] = field_val
-        # handle field 'altitude'
-        field_val = self.altitude
-        if isinstance(field_val, bytearray):
-            d['altitude'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['altitude'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['altitude'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['altitude'] = field_val
-        # handle field 'velocity'
-        field_val = self.velocity
-        if isinstance(field_val, bytearray):
-            d['velocity'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['velocity'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['velocity'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['velocity'] = field_val
-        # handle field 'acceleration_or_force'
-        field_val = self.acceleration_or_force
-        if isinstance(field_val, bytearray):
-            d['acceleration_or_force'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['acceleration_or_force'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['acceleration_or_force'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['acceleration_or_force'] = field_val
-        # handle field 'yaw'
-        field_val = self.yaw
-        if isinstance(field_val, bytearray):
-            d['yaw'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['yaw'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['yaw'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['yaw'] = field_val
-        # handle field 'yaw_rate'
-        field_val = self.yaw_rate
-        if isinstance(field_val, bytearray):
-            d['yaw_rate'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['yaw_rate'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['yaw_rate'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['yaw_rate'] = field_val
+        d['header'] = self.header.to_dict()
+        d['coordinate_frame'] = self.coordinate_frame
+        d['type_mask'] = self.type_mask
+        d['latitude'] = self.latitude
+        d['longitude'] = self.longitude
+        d['altitude'] = self.altitude
+        d['velocity'] = self.velocity.to_dict()
+        d['acceleration_or_force'] = self.acceleration_or_force.to_dict()
+        d['yaw'] = self.yaw
+        d['yaw_rate'] = self.yaw_rate
         return d
 
     @classmethod
@@ -165,177 +77,18 @@ class GlobalPositionTarget:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'coordinate_frame'
-        if 'coordinate_frame' in d:
-            field_type = cls.__annotations__.get('coordinate_frame')
-            value = d['coordinate_frame']
-            
-            if field_type is bytearray:
-                obj.coordinate_frame = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.coordinate_frame = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.coordinate_frame = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.coordinate_frame = field_type.from_dict(value)
-            else:
-                obj.coordinate_frame = value
-        # handle field 'type_mask'
-        if 'type_mask' in d:
-            field_type = cls.__annotations__.get('type_mask')
-            value = d['type_mask']
-            
-            if field_type is bytearray:
-                obj.type_mask = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.type_mask = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.type_mask = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.type_mask = field_type.from_dict(value)
-            else:
-                obj.type_mask = value
-        # handle field 'latitude'
-        if 'latitude' in d:
-            field_type = cls.__annotations__.get('latitude')
-            value = d['latitude']
-            
-            if field_type is bytearray:
-                obj.latitude = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.latitude = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.latitude = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.latitude = field_type.from_dict(value)
-            else:
-                obj.latitude = value
-        # handle field 'longitude'
-        if 'longitude' in d:
-            field_type = cls.__annotations__.get('longitude')
-            value = d['longitude']
-            
-            if field_type is bytearray:
-                obj.longitude = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.longitude = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.longitude = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.longitude = field_type.from_dict(value)
-            else:
-                obj.longitude = value
-        # handle field 'altitude'
-        if 'altitude' in d:
-            field_type = cls.__annotations__.get('altitude')
-            value = d['altitude']
-            
-            if field_type is bytearray:
-                obj.altitude = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.altitude = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.altitude = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.altitude = field_type.from_dict(value)
-            else:
-                obj.altitude = value
-        # handle field 'velocity'
-        if 'velocity' in d:
-            field_type = cls.__annotations__.get('velocity')
-            value = d['velocity']
-            
-            if field_type is bytearray:
-                obj.velocity = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.velocity = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.velocity = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.velocity = field_type.from_dict(value)
-            else:
-                obj.velocity = value
-        # handle field 'acceleration_or_force'
-        if 'acceleration_or_force' in d:
-            field_type = cls.__annotations__.get('acceleration_or_force')
-            value = d['acceleration_or_force']
-            
-            if field_type is bytearray:
-                obj.acceleration_or_force = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.acceleration_or_force = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.acceleration_or_force = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.acceleration_or_force = field_type.from_dict(value)
-            else:
-                obj.acceleration_or_force = value
-        # handle field 'yaw'
-        if 'yaw' in d:
-            field_type = cls.__annotations__.get('yaw')
-            value = d['yaw']
-            
-            if field_type is bytearray:
-                obj.yaw = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.yaw = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.yaw = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.yaw = field_type.from_dict(value)
-            else:
-                obj.yaw = value
-        # handle field 'yaw_rate'
-        if 'yaw_rate' in d:
-            field_type = cls.__annotations__.get('yaw_rate')
-            value = d['yaw_rate']
-            
-            if field_type is bytearray:
-                obj.yaw_rate = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.yaw_rate = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.yaw_rate = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.yaw_rate = field_type.from_dict(value)
-            else:
-                obj.yaw_rate = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.coordinate_frame = d.get('coordinate_frame', 0)
+        obj.type_mask = d.get('type_mask', 0)
+        obj.latitude = d.get('latitude', 0.0)
+        obj.longitude = d.get('longitude', 0.0)
+        obj.altitude = d.get('altitude', 0.0)
+        obj.velocity = Vector3.from_dict(d['velocity']) if 'velocity' in d else Vector3()
+        obj.acceleration_or_force = Vector3.from_dict(d['acceleration_or_force']) if 'acceleration_or_force' in d else Vector3()
+        obj.yaw = d.get('yaw', 0.0)
+        obj.yaw_rate = d.get('yaw_rate', 0.0)
         return obj
 
     def to_json(self, indent=2):
@@ -1,16 +1,19 @@
 from .pdu_pytype_GridCells import GridCells
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Point import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ff")  # cell_width, cell_height
+
 
 def py_to_cdr_body_GridCells(writer: CdrWriter, src: GridCells):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_float32(src.cell_width)
-    writer.write_float32(src.cell_height)
+    writer.write_run(_CDR_RUN_0, (src.cell_width, src.cell_height))
     writer.write_sequence_length(src.cells)
     for elem in src.cells:
         py_to_cdr_body_Point(writer, elem)
@@ -18,8 +21,7 @@ def py_to_cdr_body_GridCells(writer: CdrWriter, src: GridCells):
 
 def cdr_body_to_py_GridCells(reader: CdrReader, dst: GridCells):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.cell_width = reader.read_float32()
-    dst.cell_height = reader.read_float32()
+    dst.cell_width, dst.cell_height = reader.read_run(_CDR_RUN_0)
     dst.cells = []
     for _ in range(reader.read_uint32()):
         elem = Point()
@@ -29,7 +31,8 @@ def cdr_body_to_py_GridCells(reader: CdrReader, dst: GridCells):
 
 
 def py_to_cdr_GridCells(src: GridCells) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["nav_msgs/GridCells"])
     writer.write_encapsulation()
     py_to_cdr_body_GridCells(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_MapMetaData import MapMetaData
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..geometry_msgs.pdu_cdr_conv_Point import *
 from ..geometry_msgs.pdu_cdr_conv_Pose import *
@@ -7,26 +8,22 @@ from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iIfIIddddddd")  # map_load_time.sec, map_load_time.nanosec, resolution, width, height, origin.position.x, origin.position.y, origin.position.z, origin.orientation.x, origin.orientation.y, origin.orientation.z, origin.orientation.w
+
 
 def py_to_cdr_body_MapMetaData(writer: CdrWriter, src: MapMetaData):
-    py_to_cdr_body_Time(writer, src.map_load_time)
-    writer.write_float32(src.resolution)
-    writer.write_uint32(src.width)
-    writer.write_uint32(src.height)
-    py_to_cdr_body_Pose(writer, src.origin)
+    writer.write_run(_CDR_RUN_0, (src.map_load_time.sec, src.map_load_time.nanosec, src.resolution, src.width, src.height, src.origin.position.x, src.origin.position.y, src.origin.position.z, src.origin.orientation.x, src.origin.orientation.y, src.origin.orientation.z, src.origin.orientation.w))
 
 
 def cdr_body_to_py_MapMetaData(reader: CdrReader, dst: MapMetaData):
-    cdr_body_to_py_Time(reader, dst.map_load_time)
-    dst.resolution = reader.read_float32()
-    dst.width = reader.read_uint32()
-    dst.height = reader.read_uint32()
-    cdr_body_to_py_Pose(reader, dst.origin)
+    dst.map_load_time.sec, dst.map_load_time.nanosec, dst.resolution, dst.width, dst.height, dst.origin.position.x, dst.origin.position.y, dst.origin.position.z, dst.origin.orientation.x, dst.origin.orientation.y, dst.origin.orientation.z, dst.origin.orientation.w = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_MapMetaData(src: MapMetaData) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["nav_msgs/MapMetaData"])
     writer.write_encapsulation()
     py_to_cdr_body_MapMetaData(writer, src)
     return writer.bytes()
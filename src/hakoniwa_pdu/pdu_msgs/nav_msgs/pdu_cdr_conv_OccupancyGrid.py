@@ -1,5 +1,6 @@
 from .pdu_pytype_OccupancyGrid import OccupancyGrid
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..nav_msgs.pdu_cdr_conv_MapMetaData import *
@@ -9,24 +10,27 @@ from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iIfIIddddddd")  # info.map_load_time.sec, info.map_load_time.nanosec, info.resolution, info.width, info.height, info.origin.position.x, info.origin.position.y, info.origin.position.z, info.origin.orientation.x, info.origin.orientation.y, info.origin.orientation.z, info.origin.orientation.w
+
 
 def py_to_cdr_body_OccupancyGrid(writer: CdrWriter, src: OccupancyGrid):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_MapMetaData(writer, src.info)
+    writer.write_run(_CDR_RUN_0, (src.info.map_load_time.sec, src.info.map_load_time.nanosec, src.info.resolution, src.info.width, src.info.height, src.info.origin.position.x, src.info.origin.position.y, src.info.origin.position.z, src.info.origin.orientation.x, src.info.origin.orientation.y, src.info.origin.orientation.z, src.info.origin.orientation.w))
     writer.write_sequence_length(src.data)
-    for elem in src.data:
-        writer.write_int8(elem)
+    writer.write_sequence("b", src.data)
 
 
 def cdr_body_to_py_OccupancyGrid(reader: CdrReader, dst: OccupancyGrid):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_MapMetaData(reader, dst.info)
-    dst.data = [reader.read_int8() for _ in range(reader.read_uint32())]
+    dst.info.map_load_time.sec, dst.info.map_load_time.nanosec, dst.info.resolution, dst.info.width, dst.info.height, dst.info.origin.position.x, dst.info.origin.position.y, dst.info.origin.position.z, dst.info.origin.orientation.x, dst.info.origin.orientation.y, dst.info.origin.orientation.z, dst.info.origin.orientation.w = reader.read_run(_CDR_RUN_0)
+    dst.data = reader.read_sequence("b", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_OccupancyGrid(src: OccupancyGrid) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["nav_msgs/OccupancyGrid"])
     writer.write_encapsulation()
     py_to_cdr_body_OccupancyGrid(writer, src)
     return writer.bytes()
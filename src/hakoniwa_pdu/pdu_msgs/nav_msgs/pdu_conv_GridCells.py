@@ -9,13 +9,19 @@ from ..std_msgs.pdu_conv_Header import *
 from ..geometry_msgs.pdu_conv_Point import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ff")  # cell_width, cell_height
 
-def pdu_to_py_GridCells(binary_data: bytearray) -> GridCells:
-    py_obj = GridCells()
+
+def pdu_to_py_GridCells(binary_data: bytearray, out: GridCells = None, array_mode: str = None) -> GridCells:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = GridCells() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_GridCells(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,7 +34,7 @@ def binary_read_recursive_GridCells(meta: binary_io.PduMetaData, binary_data: by
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -38,11 +44,6 @@ def binary_read_recursive_GridCells(meta: binary_io.PduMetaData, binary_data: by
     # type_name: float32 
     # offset: 136 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 4)
-    py_obj.cell_width = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: cell_height 
@@ -50,9 +51,7 @@ def binary_read_recursive_GridCells(meta: binary_io.PduMetaData, binary_data: by
     # offset: 140 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 140, 4)
-    py_obj.cell_height = binary_io.binTovalue("float32", bin)
+    py_obj.cell_width, py_obj.cell_height = _RUN_0.unpack_from(binary_data, base_off + 136)
     
     # array_type: varray 
     # data_type: struct 
@@ -65,44 +64,23 @@ def binary_read_recursive_GridCells(meta: binary_io.PduMetaData, binary_data: by
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 144 + 4, 4))
     one_elm_size = 24
     i = 0
-    array_value = []
+    array_value = reuse_list(py_obj.cells, array_size, Point)
     while i < array_size:
-        tmp_py_obj = Point()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_Point(meta, binary_data, tmp_py_obj, meta.heap_off + offset_from_heap + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.cells = array_value    
     
     return py_obj
 
 
-def py_to_pdu_GridCells(py_obj: GridCells) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_GridCells(py_obj: GridCells, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_GridCells(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_GridCells(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: GridCells):
     # array_type: single 
@@ -122,27 +100,14 @@ def binary_write_recursive_GridCells(parent_off: int, bw_container: BinaryWriter
     # type_name: float32 
     # offset: 136 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 136
-
-    
-    bin = binary_io.typeTobin(type, py_obj.cell_width)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: cell_height 
     # type_name: float32 
     # offset: 140 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 140
 
-    
-    bin = binary_io.typeTobin(type, py_obj.cell_height)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.cell_width, py_obj.cell_height), expected_offset=parent_off + 136)
     
     # array_type: varray 
     # data_type: struct 
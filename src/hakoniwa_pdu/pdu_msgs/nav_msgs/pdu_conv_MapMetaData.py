@@ -9,13 +9,19 @@ from ..builtin_interfaces.pdu_conv_Time import *
 from ..geometry_msgs.pdu_conv_Pose import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<fII")  # resolution, width, height
 
-def pdu_to_py_MapMetaData(binary_data: bytearray) -> MapMetaData:
-    py_obj = MapMetaData()
+
+def pdu_to_py_MapMetaData(binary_data: bytearray, out: MapMetaData = None, array_mode: str = None) -> MapMetaData:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = MapMetaData() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_MapMetaData(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,7 +34,7 @@ def binary_read_recursive_MapMetaData(meta: binary_io.PduMetaData, binary_data:
     # offset: 0 size: 8 
     # array_len: 1
 
-    tmp_py_obj = Time()
+    tmp_py_obj = reuse_obj(py_obj.map_load_time, Time)
     binary_read_recursive_Time(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.map_load_time = tmp_py_obj
     
@@ -38,22 +44,12 @@ def binary_read_recursive_MapMetaData(meta: binary_io.PduMetaData, binary_data:
     # type_name: float32 
     # offset: 8 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 4)
-    py_obj.resolution = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: width 
     # type_name: uint32 
     # offset: 12 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 12, 4)
-    py_obj.width = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: height 
@@ -61,9 +57,7 @@ def binary_read_recursive_MapMetaData(meta: binary_io.PduMetaData, binary_data:
     # offset: 16 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 16, 4)
-    py_obj.height = binary_io.binTovalue("uint32", bin)
+    py_obj.resolution, py_obj.width, py_obj.height = _RUN_0.unpack_from(binary_data, base_off + 8)
     
     # array_type: single 
     # data_type: struct 
@@ -72,40 +66,20 @@ def binary_read_recursive_MapMetaData(meta: binary_io.PduMetaData, binary_data:
     # offset: 24 size: 56 
     # array_len: 1
 
-    tmp_py_obj = Pose()
+    tmp_py_obj = reuse_obj(py_obj.origin, Pose)
     binary_read_recursive_Pose(meta, binary_data, tmp_py_obj, base_off + 24)
     py_obj.origin = tmp_py_obj
     
     return py_obj
 
 
-def py_to_pdu_MapMetaData(py_obj: MapMetaData) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_MapMetaData(py_obj: MapMetaData, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_MapMetaData(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_MapMetaData(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: MapMetaData):
     # array_type: single 
@@ -125,41 +99,20 @@ def binary_write_recursive_MapMetaData(parent_off: int, bw_container: BinaryWrit
     # type_name: float32 
     # offset: 8 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 8
-
-    
-    bin = binary_io.typeTobin(type, py_obj.resolution)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: width 
     # type_name: uint32 
     # offset: 12 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 12
-
-    
-    bin = binary_io.typeTobin(type, py_obj.width)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: height 
     # type_name: uint32 
     # offset: 16 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 16
 
-    
-    bin = binary_io.typeTobin(type, py_obj.height)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.resolution, py_obj.width, py_obj.height), expected_offset=parent_off + 8)
     
     # array_type: single 
     # data_type: struct 
@@ -13,6 +13,8 @@ class GridCells:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "cell_width", "cell_height", "cells")
+
     header: Header
     cell_width: float
     cell_height: float
@@ -40,46 +42,10 @@ class GridCells:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'cell_width'
-        field_val = self.cell_width
-        if isinstance(field_val, bytearray):
-            d['cell_width'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['cell_width'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['cell_width'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['cell_width'] = field_val
-        # handle field 'cell_height'
-        field_val = self.cell_height
-        if isinstance(field_val, bytearray):
-            d['cell_height'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['cell_height'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['cell_height'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['cell_height'] = field_val
-        # handle field 'cells'
-        field_val = self.cells
-        if isinstance(field_val, bytearray):
-            d['cells'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['cells'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['cells'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['cells'] = field_val
+        d['header'] = self.header.to_dict()
+        d['cell_width'] = self.cell_width
+        d['cell_height'] = self.cell_height
+        d['cells'] = [item.to_dict() for item in self.cells]
         return d
 
     @classmethod
@@ -87,75 +53,12 @@ class GridCells:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'cell_width'
-        if 'cell_width' in d:
-            field_type = cls.__annotations__.get('cell_width')
-            value = d['cell_width']
-            
-            if field_type is bytearray:
-                obj.cell_width = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.cell_width = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.cell_width = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.cell_width = field_type.from_dict(value)
-            else:
-                obj.cell_width = value
-        # handle field 'cell_height'
-        if 'cell_height' in d:
-            field_type = cls.__annotations__.get('cell_height')
-            value = d['cell_height']
-            
-            if field_type is bytearray:
-                obj.cell_height = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.cell_height = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.cell_height = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.cell_height = field_type.from_dict(value)
-            else:
-                obj.cell_height = value
-        # handle field 'cells'
-        if 'cells' in d:
-            field_type = cls.__annotations__.get('cells')
-            value = d['cells']
-            
-            if field_type is bytearray:
-                obj.cells = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.cells = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.cells = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.cells = field_type.from_dict(value)
-            else:
-                obj.cells = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.cell_width = d.get('cell_width', 0.0)
+        obj.cell_height = d.get('cell_height', 0.0)
+        obj.cells = [Point.from_dict(item) for item in d['cells']] if 'cells' in d else []
         return obj
 
     def to_json(self, indent=2):
@@ -14,6 +14,8 @@ class MapMetaData:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("map_load_time", "resolution", "width", "height", "origin")
+
     map_load_time: Time
     resolution: float
     width: int
@@ -44,56 +46,11 @@ class MapMetaData:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'map_load_time'
-        field_val = self.map_load_time
-        if isinstance(field_val, bytearray):
-            d['map_load_time'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['map_load_time'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['map_load_time'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['map_load_time'] = field_val
-        # handle field 'resolution'
-        field_val = self.resolution
-        if isinstance(field_val, bytearray):
-            d['resolution'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['resolution'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['resolution'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['resolution'] = field_val
-        # handle field 'width'
-        field_val = self.width
-        if isinstance(field_val, bytearray):
-            d['width'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['width'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['width'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['width'] = field_val
-        # handle field 'height'
-        field_val = self.height
-        if isinstance(field_val, bytearray):
-            d['height'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['height'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['height'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['height'] = field_val
-        # handle field 'origin'
-        field_val = self.origin
-        if isinstance(field_val, bytearray):
-            d['origin'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['origin'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['origin'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['origin'] = field_val
+        d['map_load_time'] = self.map_load_time.to_dict()
+        d['resolution'] = self.resolution
+        d['width'] = self.width
+        d['height'] = self.height
+        d['origin'] = self.origin.to_dict()
         return d
 
     @classmethod
@@ -101,92 +58,13 @@ class MapMetaData:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'map_load_time'
-        if 'map_load_time' in d:
-            field_type = cls.__annotations__.get('map_load_time')
-            value = d['map_load_time']
-            
-            if field_type is bytearray:
-                obj.map_load_time = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.map_load_time = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.map_load_time = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.map_load_time = field_type.from_dict(value)
-            else:
-                obj.map_load_time = value
-        # handle field 'resolution'
-        if 'resolution' in d:
-            field_type = cls.__annotations__.get('resolution')
-            value = d['resolution']
-            
-            if field_type is bytearray:
-                obj.resolution = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.resolution = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.resolution = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.resolution = field_type.from_dict(value)
-            else:
-                obj.resolution = value
-        # handle field 'width'
-        if 'width' in d:
-            field_type = cls.__annotations__.get('width')
-            value = d['width']
-            
-            if field_type is bytearray:
-                obj.width = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.width = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.width = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.width = field_type.from_dict(value)
-            else:
-                obj.width = value
-        # handle field 'height'
-        if 'height' in d:
-            field_type = cls.__annotations__.get('height')
-            value = d['height']
-            
-            if field_type is bytearray:
-                obj.height = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.height = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.height = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.height = field_type.from_dict(value)
-            else:
-                obj.height = value
-        # handle field 'origin'
-        if 'origin' in d:
-            field_type = cls.__annotations__.get('origin')
-            value = d['origin']
-            
-            if field_type is bytearray:
-                obj.origin = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.origin = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.origin = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.origin = field_type.from_dict(value)
-            else:
-                obj.origin = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.map_load_time = Time.from_dict(d['map_load_time']) if 'map_load_time' in d else Time()
+        obj.resolution = d.get('resolution', 0.0)
+        obj.width = d.get('width', 0)
+        obj.height = d.get('height', 0)
+        obj.origin = Pose.from_dict(d['origin']) if 'origin' in d else Pose()
         return obj
 
     def to_json(self, indent=2):
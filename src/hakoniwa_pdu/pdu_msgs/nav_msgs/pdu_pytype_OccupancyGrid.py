@@ -16,6 +16,8 @@ class OccupancyGrid:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "info", "data")
+
     header: Header
     info: MapMetaData
     data: List[int]
@@ -40,36 +42,10 @@ class OccupancyGrid:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'info'
-        field_val = self.info
-        if isinstance(field_val, bytearray):
-            d['info'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['info'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['info'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['info'] = field_val
-        # handle field 'data'
+        d['header'] = self.header.to_dict()
+        d['info'] = self.info.to_dict()
         field_val = self.data
-        if isinstance(field_val, bytearray):
-            d['data'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['data'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['data'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['data'] = field_val
+        d['data'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -77,58 +53,11 @@ class OccupancyGrid:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'info'
-        if 'info' in d:
-            field_type = cls.__annotations__.get('info')
-            value = d['info']
-            
-            if field_type is bytearray:
-                obj.info = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.info = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.info = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.info = field_type.from_dict(value)
-            else:
-                obj.info = value
-        # handle field 'data'
-        if 'data' in d:
-            field_type = cls.__annotations__.get('data')
-            value = d['data']
-            
-            if field_type is bytearray:
-                obj.data = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.data = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.data = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.data = field_type.from_dict(value)
-            else:
-                obj.data = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.info = MapMetaData.from_dict(d['info']) if 'info' in d else MapMetaData()
+        obj.data = d.get('data', [])
         return obj
 
     def to_json(self, indent=2):
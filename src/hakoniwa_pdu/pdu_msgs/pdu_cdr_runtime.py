@@ -1,34 +1,131 @@
 import struct
+import sys
 
 
 CDR_LE_ENCAPSULATION = b"\x00\x01\x00\x00"
 
+# struct format characters of the CDR primitive types; CDR aligns each to its own size
+PRIMITIVE_FORMATS = "?bBhHiIqQfd"
+_STRUCTS = {fmt: struct.Struct("<" + fmt) for fmt in PRIMITIVE_FORMATS}
+# memoryview.cast uses the native byte order, so views are only handed out on little-endian hosts
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _coerce(fmt: str, value):
+    # same conversions as the scalar write_* methods
+    if fmt == "?":
+        return bool(value)
+    if fmt in "fd":
+        return float(value)
+    if fmt == "B" and isinstance(value, str):
+        return ord(value[0]) if value else 0
+    return int(value)
+
+
+def _buffer_bytes(fmt: str, values):
+    """
+    Returns numpy arrays and other buffer-protocol objects (bytes, array.array,
+    memoryview) whose items have the CDR layout of fmt as a flat byte view, or
+    None when values has to be packed element by element.
+    """
+    if isinstance(values, (list, tuple, str)):
+        return None
+    if hasattr(values, "dtype") and hasattr(values, "astype"):
+        # numpy.ndarray: converted only when the dtype differs
+        return memoryview(values.astype("<" + fmt, order="C", copy=False)).cast("B")
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    if view.itemsize != _STRUCTS[fmt].size or not view.c_contiguous:
+        return None
+    if view.itemsize > 1 and (view.format.lstrip("<=@") != fmt or not _NATIVE_LITTLE_ENDIAN):
+        return None
+    return view.cast("B")
+
 
 class CdrError(Exception):
     pass
 
 
+class CdrRun:
+    """
+    Precompiled layout of consecutive primitive fields of a generated CDR codec.
+
+    CDR aligns every primitive to its own size relative to the alignment base,
+    so the padding inside a run only depends on where the run starts modulo 8.
+    One Struct is compiled per start phase; writing or reading the run is then
+    a single pack_into / unpack_from.
+    """
+    __slots__ = ("formats", "structs")
+
+    def __init__(self, formats: str):
+        self.formats = formats
+        self.structs = tuple(self._compile(phase) for phase in range(8))
+
+    def _compile(self, phase: int) -> struct.Struct:
+        parts = ["<"]
+        pos = phase
+        for fmt in self.formats:
+            size = _STRUCTS[fmt].size
+            padding = (-pos) % size
+            if padding:
+                parts.append(f"{padding}x")
+            parts.append(fmt)
+            pos += padding + size
+        return struct.Struct("".join(parts))
+
+
 class CdrWriter:
-    def __init__(self):
-        self._data = bytearray()
+    def __init__(self, size_hint: int = 0):
+        # preallocated (zero-filled) buffer; padding is never written explicitly
+        self._data = bytearray(size_hint)
+        self._size = 0
         self._alignment_base = 0
 
     def write_encapsulation(self):
-        self._data.extend(CDR_LE_ENCAPSULATION)
-        self._alignment_base = len(self._data)
+        end = self._reserve(len(CDR_LE_ENCAPSULATION))
+        self._data[self._size:end] = CDR_LE_ENCAPSULATION
+        self._size = end
+        self._alignment_base = end
 
     def bytes(self) -> bytes:
-        return bytes(self._data)
+        return bytes(memoryview(self._data)[:self._size])
+
+    def _reserve(self, size: int) -> int:
+        end = self._size + size
+        if end > len(self._data):
+            self._data += bytes(max(end - len(self._data), len(self._data)))
+        return end
 
     def _align(self, alignment: int):
-        relative_offset = len(self._data) - self._alignment_base
+        relative_offset = self._size - self._alignment_base
         padding = (-relative_offset) % alignment
         if padding:
-            self._data.extend(b"\x00" * padding)
+            self._size = self._reserve(padding)
 
     def _write(self, fmt: str, value, alignment: int):
-        self._align(alignment)
-        self._data.extend(struct.pack("<" + fmt, value))
+        pos = self._size
+        pos += (self._alignment_base - pos) % alignment
+        item = _STRUCTS[fmt]
+        end = pos + item.size
+        if end > len(self._data):
+            self._reserve(end - self._size)
+        item.pack_into(self._data, pos, value)
+        self._size = end
+
+    def write_run(self, run: CdrRun, values):
+        """Writes the fields of a precompiled run with one pack_into."""
+        pos = self._size
+        item = run.structs[(pos - self._alignment_base) & 7]
+        end = pos + item.size
+        if end > len(self._data):
+            self._reserve(item.size)
+        try:
+            item.pack_into(self._data, pos, *values)
+        except struct.error:
+            item.pack_into(self._data, pos, *[_coerce(fmt, value) for fmt, value in zip(run.formats, values)])
+        self._size = end
 
     def write_bool(self, value):
         self._write("?", bool(value), 1)
@@ -66,9 +163,15 @@ class CdrWriter:
         self._write("d", float(value), 8)
 
     def write_string(self, value):
-        encoded = str(value).encode("utf-8") + b"\x00"
-        self.write_uint32(len(encoded))
-        self._data.extend(encoded)
+        self.write_string_bytes(str(value).encode("utf-8"))
+
+    def write_string_bytes(self, encoded):
+        """Writes an already UTF-8 encoded string; the terminating NUL is added here."""
+        self.write_uint32(len(encoded) + 1)
+        end = self._reserve(len(encoded) + 1)
+        self._data[self._size:end - 1] = encoded
+        self._data[end - 1] = 0
+        self._size = end
 
     def write_sequence_length(self, value):
         length = len(value)
@@ -76,10 +179,55 @@ class CdrWriter:
             raise CdrError("CDR sequence too large")
         self.write_uint32(length)
 
+    def write_sequence(self, fmt: str, values, count: int = None):
+        """
+        Writes the elements of a primitive sequence (or, with count, of a fixed-size
+        array) in one step. fmt is a struct format character from PRIMITIVE_FORMATS.
+
+        values may be a list or tuple, or a buffer such as bytes, array.array,
+        memoryview or a numpy array, which is copied without unpacking it.
+        With count the values are truncated or zero-padded to count elements.
+        """
+        if count is None:
+            count = len(values)
+        if count == 0:
+            return
+        item = _STRUCTS[fmt]
+        self._align(item.size)
+        start = self._size
+        end = self._reserve(count * item.size)
+        raw = _buffer_bytes(fmt, values)
+        if raw is not None:
+            raw = raw[:end - start]
+            # the rest of a short fixed-size array stays zero-filled
+            self._data[start:start + len(raw)] = raw
+        else:
+            if len(values) != count:
+                values = list(values[:count]) + [0] * (count - len(values))
+            try:
+                struct.pack_into(f"<{count}{fmt}", self._data, start, *values)
+            except struct.error:
+                struct.pack_into(f"<{count}{fmt}", self._data, start, *[_coerce(fmt, value) for value in values])
+        self._size = end
+
+
+    def write_sequence_bytes(self, fmt: str, raw):
+        """
+        Copies raw, elements of fmt already in little-endian layout (e.g. a slice of
+        a hako PDU), with the alignment of fmt. Nothing is written for an empty raw.
+        """
+        if not len(raw):
+            return
+        self._align(_STRUCTS[fmt].size)
+        end = self._reserve(len(raw))
+        self._data[self._size:end] = raw
+        self._size = end
+
 
 class CdrReader:
     def __init__(self, data):
-        self._data = memoryview(bytes(data))
+        # no copy: data must not be modified while it is being read
+        self._data = memoryview(data).cast("B")
         self._offset = 0
         self._alignment_base = 0
 
@@ -98,14 +246,57 @@ class CdrReader:
 
     def _read(self, fmt: str, alignment: int):
         self._align(alignment)
-        size = struct.calcsize("<" + fmt)
-        end = self._offset + size
+        item = _STRUCTS[fmt]
+        end = self._offset + item.size
         if end > len(self._data):
             raise CdrError("CDR payload ended unexpectedly")
-        value = struct.unpack_from("<" + fmt, self._data, self._offset)[0]
+        value = item.unpack_from(self._data, self._offset)[0]
         self._offset = end
         return value
 
+    def read_sequence_bytes(self, fmt: str, count: int) -> memoryview:
+        """Returns the count elements of fmt as a byte view over the payload (little endian, no copy)."""
+        if count == 0:
+            return self._data[self._offset:self._offset]
+        item = _STRUCTS[fmt]
+        self._align(item.size)
+        end = self._offset + count * item.size
+        if end > len(self._data):
+            raise CdrError("CDR sequence ended unexpectedly")
+        start = self._offset
+        self._offset = end
+        return self._data[start:end]
+
+    def read_sequence(self, fmt: str, count: int, view: bool = False):
+        """
+        Reads count elements of a primitive sequence or fixed-size array in one step.
+
+        Returns a list, or with view=True a memoryview over the payload cast to fmt
+        (no copy; falls back to a list on big-endian hosts).
+        """
+        if count == 0:
+            return []
+        item = _STRUCTS[fmt]
+        self._align(item.size)
+        end = self._offset + count * item.size
+        if end > len(self._data):
+            raise CdrError("CDR sequence ended unexpectedly")
+        start = self._offset
+        self._offset = end
+        if view and _NATIVE_LITTLE_ENDIAN:
+            return self._data[start:end].cast(fmt)
+        return list(struct.unpack_from(f"<{count}{fmt}", self._data, start))
+
+    def read_run(self, run: CdrRun):
+        """Reads the fields of a precompiled run with one unpack_from."""
+        pos = self._offset
+        item = run.structs[(pos - self._alignment_base) & 7]
+        end = pos + item.size
+        if end > len(self._data):
+            raise CdrError("CDR payload ended unexpectedly")
+        self._offset = end
+        return item.unpack_from(self._data, pos)
+
     def read_bool(self):
         return bool(self._read("?", 1))
 
@@ -140,12 +331,16 @@ class CdrReader:
         return self._read("d", 8)
 
     def read_string(self):
+        return bytes(self.read_string_bytes()).decode("utf-8")
+
+    def read_string_bytes(self) -> memoryview:
+        """Returns the UTF-8 bytes of a string without the terminating NUL (no copy)."""
         length = self.read_uint32()
         end = self._offset + length
         if end > len(self._data):
             raise CdrError("CDR string ended unexpectedly")
-        raw = bytes(self._data[self._offset:end])
+        raw = self._data[self._offset:end]
         self._offset = end
-        if raw.endswith(b"\x00"):
+        if length and raw[-1] == 0:
             raw = raw[:-1]
-        return raw.decode("utf-8")
+        return raw
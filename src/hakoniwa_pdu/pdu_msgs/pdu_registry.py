@@ -0,0 +1,103 @@
+# Lazy registry of the generated PDU message modules
+
+import os
+import pkgutil
+import re
+from importlib import import_module
+from importlib.util import find_spec
+
+PDU_MSGS_PACKAGE = __name__.rpartition(".")[0]
+
+_TYPE_NAME = re.compile(r"^([A-Za-z_][A-Za-z0-9_.]*)/([A-Za-z_][A-Za-z0-9_]*)$")
+
+# type name -> PduTypeEntry
+_entries = {}
+
+
+class PduTypeEntry:
+    """
+    Generated Python class and converters of one ROS message type.
+
+    Nothing is imported when the entry is created; each attribute imports its
+    generated module (pdu_pytype_*, pdu_conv_* or pdu_cdr_conv_*) on first
+    access and keeps the resolved object.
+    """
+    __slots__ = ("type_name", "module_prefix", "name", "_resolved")
+
+    def __init__(self, type_name: str, module_prefix: str, name: str):
+        self.type_name = type_name
+        self.module_prefix = module_prefix
+        self.name = name
+        self._resolved = {}
+
+    def _resolve(self, module_kind: str, attr: str):
+        value = self._resolved.get(attr)
+        if value is None:
+            module = import_module(f"{self.module_prefix}.{module_kind}_{self.name}")
+            value = self._resolved[attr] = getattr(module, attr)
+        return value
+
+    @property
+    def pytype(self) -> type:
+        return self._resolve("pdu_pytype", self.name)
+
+    @property
+    def pdu_to_py(self):
+        return self._resolve("pdu_conv", f"pdu_to_py_{self.name}")
+
+    @property
+    def py_to_pdu(self):
+        return self._resolve("pdu_conv", f"py_to_pdu_{self.name}")
+
+    @property
+    def cdr_to_py(self):
+        return self._resolve("pdu_cdr_conv", f"cdr_to_py_{self.name}")
+
+    @property
+    def py_to_cdr(self):
+        return self._resolve("pdu_cdr_conv", f"py_to_cdr_{self.name}")
+
+    def __repr__(self):
+        return f"PduTypeEntry(type_name={self.type_name})"
+
+
+def get_type(type_name: str) -> PduTypeEntry:
+    """
+    Returns the registry entry of a ROS type name such as "geometry_msgs/Twist".
+
+    The package part may also be a dotted module path ("my_pkg.msgs/MyType")
+    for generated modules outside hakoniwa_pdu.pdu_msgs.
+
+    Raises:
+        ValueError: If type_name is malformed or has no generated Python class.
+    """
+    entry = _entries.get(type_name)
+    if entry is not None:
+        return entry
+    match = _TYPE_NAME.match(type_name)
+    if match is None:
+        raise ValueError(f"Invalid PDU type name: {type_name}")
+    package, name = match.groups()
+    module_prefix = package if "." in package else f"{PDU_MSGS_PACKAGE}.{package}"
+    try:
+        # locates the module without executing it
+        spec = find_spec(f"{module_prefix}.pdu_pytype_{name}")
+    except ModuleNotFoundError:
+        spec = None
+    if spec is None:
+        raise ValueError(f"Unknown PDU type: {type_name}")
+    entry = _entries[type_name] = PduTypeEntry(type_name, module_prefix, name)
+    return entry
+
+
+def known_types() -> list:
+    """Lists the type names of all generated messages in hakoniwa_pdu.pdu_msgs (no module is executed)."""
+    package = import_module(PDU_MSGS_PACKAGE)
+    type_names = []
+    for pkg in pkgutil.iter_modules(package.__path__):
+        if not pkg.ispkg:
+            continue
+        for module in pkgutil.iter_modules([os.path.join(pkg.module_finder.path, pkg.name)]):
+            if module.name.startswith("pdu_pytype_"):
+                type_names.append(f"{pkg.name}/{module.name[len('pdu_pytype_'):]}")
+    return sorted(type_names)
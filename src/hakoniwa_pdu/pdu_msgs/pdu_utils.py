@@ -1,8 +1,10 @@
 # pdu/python/pdu_utils.py
 
 import struct
+from typing import Union
 
 from . import binary_io
+from .._optional_numpy import require_numpy as _require_numpy
 
 # PDU MetaData Constants and Layout
 _PDU_META_FORMAT = '<IIIII'  # Little-endian: magic, version, base_off, heap_off, total_size, reserved
@@ -58,6 +60,82 @@ class BinaryWriterContainer:
         self.meta = meta
         self.meta.set_empty()
 
+def finalize_pdu(bw_container: BinaryWriterContainer, base_allocator: DynamicAllocator, out=None) -> Union[bytearray, int]:
+    """
+    Lays out metadata, base data and heap data produced by a generated writer.
+
+    Returns a new bytearray, or, when out (a bytearray or writable memoryview) is given,
+    writes into it and returns the number of bytes written.
+    """
+    base_size = base_allocator.size()
+    heap_size = bw_container.heap_allocator.size()
+    total_size = _ALIGNED_PDU_META_SIZE + base_size + heap_size
+    meta = bw_container.meta
+    meta.total_size = total_size
+    meta.heap_off = _ALIGNED_PDU_META_SIZE + base_size
+
+    if out is None:
+        binary_data = bytearray(total_size)
+    else:
+        if len(out) < total_size:
+            raise ValueError(f"output buffer too small: {len(out)} < {total_size}")
+        binary_data = out
+
+    binary_io.PduMetaData.PDU_META_DATA_STRUCT.pack_into(
+        binary_data, 0, meta.magicno, meta.version, meta.base_off, meta.heap_off, meta.total_size)
+    binary_data[meta.base_off:meta.base_off + base_size] = base_allocator.to_array()
+    binary_data[meta.heap_off:meta.heap_off + heap_size] = bw_container.heap_allocator.to_array()
+
+    if out is None:
+        return binary_data
+    return total_size
+
+def reuse_obj(current, cls):
+    """
+    Returns current when it is already a cls instance, otherwise a new cls().
+    Used by the generated readers to decode into an existing object graph.
+    """
+    if isinstance(current, cls):
+        return current
+    return cls()
+
+def reuse_list(current, size: int, cls) -> list:
+    """
+    Resizes current in place to size cls instances, reusing the existing elements.
+    A new list is returned only when current is not a list.
+    """
+    if not isinstance(current, list):
+        current = []
+    del current[size:]
+    for i, item in enumerate(current):
+        if not isinstance(item, cls):
+            current[i] = cls()
+    while len(current) < size:
+        current.append(cls())
+    return current
+
+def set_array_mode(meta, array_mode) -> None:
+    """
+    Selects how the generated readers return primitive arrays:
+    "tuple" (default) or "numpy" for numpy.frombuffer views over the PDU buffer.
+    """
+    if array_mode is None:
+        return
+    if array_mode not in (binary_io.ARRAY_MODE_TUPLE, binary_io.ARRAY_MODE_NUMPY):
+        raise ValueError(f"Unknown array_mode: {array_mode}")
+    if array_mode == binary_io.ARRAY_MODE_NUMPY:
+        _require_numpy()
+    meta.array_mode = array_mode
+
+def read_array_values(meta, type, binary_data, off: int, size: int):
+    """
+    Reads a primitive array as a tuple, or as a zero-copy numpy view in "numpy" array mode.
+    """
+    if meta.array_mode == binary_io.ARRAY_MODE_NUMPY:
+        fmt = binary_io.PRIMITIVE_FORMATS[type]
+        return _require_numpy().frombuffer(binary_data, "<" + fmt, size // struct.calcsize(fmt), off)
+    return binary_io.binToArrayValues(type, binary_io.readBinary(binary_data, off, size))
+
 def get_binary(type, bin, elm_size):
     if type == "string":
         buffer = bytearray(elm_size)
@@ -1,5 +1,6 @@
 from .pdu_pytype_FibonacciActionFeedback import FibonacciActionFeedback
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_action_msgs.pdu_cdr_conv_ActionFeedbackHeader import *
 from ..sample_action_msgs.pdu_cdr_conv_FibonacciFeedback import *
@@ -18,7 +19,8 @@ def cdr_body_to_py_FibonacciActionFeedback(reader: CdrReader, dst: FibonacciActi
 
 
 def py_to_cdr_FibonacciActionFeedback(src: FibonacciActionFeedback) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sample_action_msgs/FibonacciActionFeedback"])
     writer.write_encapsulation()
     py_to_cdr_body_FibonacciActionFeedback(writer, src)
     return writer.bytes()
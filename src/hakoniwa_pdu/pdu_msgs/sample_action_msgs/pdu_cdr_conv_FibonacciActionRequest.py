@@ -1,5 +1,6 @@
 from .pdu_pytype_FibonacciActionRequest import FibonacciActionRequest
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_action_msgs.pdu_cdr_conv_ActionRequestHeader import *
 from ..sample_action_msgs.pdu_cdr_conv_FibonacciGoal import *
@@ -8,17 +9,18 @@ from ..sample_action_msgs.pdu_cdr_conv_FibonacciGoal import *
 
 def py_to_cdr_body_FibonacciActionRequest(writer: CdrWriter, src: FibonacciActionRequest):
     py_to_cdr_body_ActionRequestHeader(writer, src.header)
-    py_to_cdr_body_FibonacciGoal(writer, src.body)
+    writer.write_int32(src.body.order)
 
 
 def cdr_body_to_py_FibonacciActionRequest(reader: CdrReader, dst: FibonacciActionRequest):
     cdr_body_to_py_ActionRequestHeader(reader, dst.header)
-    cdr_body_to_py_FibonacciGoal(reader, dst.body)
+    dst.body.order = reader.read_int32()
     return dst
 
 
 def py_to_cdr_FibonacciActionRequest(src: FibonacciActionRequest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sample_action_msgs/FibonacciActionRequest"])
     writer.write_encapsulation()
     py_to_cdr_body_FibonacciActionRequest(writer, src)
     return writer.bytes()
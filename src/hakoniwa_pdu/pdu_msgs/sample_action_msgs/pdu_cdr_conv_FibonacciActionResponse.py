@@ -1,5 +1,6 @@
 from .pdu_pytype_FibonacciActionResponse import FibonacciActionResponse
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..hako_action_msgs.pdu_cdr_conv_ActionResponseHeader import *
 from ..sample_action_msgs.pdu_cdr_conv_FibonacciResult import *
@@ -18,7 +19,8 @@ def cdr_body_to_py_FibonacciActionResponse(reader: CdrReader, dst: FibonacciActi
 
 
 def py_to_cdr_FibonacciActionResponse(src: FibonacciActionResponse) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sample_action_msgs/FibonacciActionResponse"])
     writer.write_encapsulation()
     py_to_cdr_body_FibonacciActionResponse(writer, src)
     return writer.bytes()
@@ -1,22 +1,23 @@
 from .pdu_pytype_FibonacciFeedback import FibonacciFeedback
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
 
 def py_to_cdr_body_FibonacciFeedback(writer: CdrWriter, src: FibonacciFeedback):
     writer.write_sequence_length(src.partial_sequence)
-    for elem in src.partial_sequence:
-        writer.write_int32(elem)
+    writer.write_sequence("i", src.partial_sequence)
 
 
 def cdr_body_to_py_FibonacciFeedback(reader: CdrReader, dst: FibonacciFeedback):
-    dst.partial_sequence = [reader.read_int32() for _ in range(reader.read_uint32())]
+    dst.partial_sequence = reader.read_sequence("i", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_FibonacciFeedback(src: FibonacciFeedback) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sample_action_msgs/FibonacciFeedback"])
     writer.write_encapsulation()
     py_to_cdr_body_FibonacciFeedback(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_FibonacciGoal import FibonacciGoal
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_FibonacciGoal(reader: CdrReader, dst: FibonacciGoal):
 
 
 def py_to_cdr_FibonacciGoal(src: FibonacciGoal) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sample_action_msgs/FibonacciGoal"])
     writer.write_encapsulation()
     py_to_cdr_body_FibonacciGoal(writer, src)
     return writer.bytes()
@@ -1,22 +1,23 @@
 from .pdu_pytype_FibonacciResult import FibonacciResult
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
 
 def py_to_cdr_body_FibonacciResult(writer: CdrWriter, src: FibonacciResult):
     writer.write_sequence_length(src.sequence)
-    for elem in src.sequence:
-        writer.write_int32(elem)
+    writer.write_sequence("i", src.sequence)
 
 
 def cdr_body_to_py_FibonacciResult(reader: CdrReader, dst: FibonacciResult):
-    dst.sequence = [reader.read_int32() for _ in range(reader.read_uint32())]
+    dst.sequence = reader.read_sequence("i", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_FibonacciResult(src: FibonacciResult) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sample_action_msgs/FibonacciResult"])
     writer.write_encapsulation()
     py_to_cdr_body_FibonacciResult(writer, src)
     return writer.bytes()
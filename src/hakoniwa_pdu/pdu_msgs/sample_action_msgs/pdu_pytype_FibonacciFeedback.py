@@ -10,6 +10,8 @@ class FibonacciFeedback:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("partial_sequence",)
+
     partial_sequence: List[int]
 
     def __init__(self):
@@ -28,16 +30,8 @@ class FibonacciFeedback:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'partial_sequence'
         field_val = self.partial_sequence
-        if isinstance(field_val, bytearray):
-            d['partial_sequence'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['partial_sequence'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['partial_sequence'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['partial_sequence'] = field_val
+        d['partial_sequence'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -45,24 +39,9 @@ class FibonacciFeedback:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'partial_sequence'
-        if 'partial_sequence' in d:
-            field_type = cls.__annotations__.get('partial_sequence')
-            value = d['partial_sequence']
-            
-            if field_type is bytearray:
-                obj.partial_sequence = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.partial_sequence = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.partial_sequence = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.partial_sequence = field_type.from_dict(value)
-            else:
-                obj.partial_sequence = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.partial_sequence = d.get('partial_sequence', [])
         return obj
 
     def to_json(self, indent=2):
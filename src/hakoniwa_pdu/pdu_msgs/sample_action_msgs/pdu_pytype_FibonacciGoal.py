@@ -10,6 +10,8 @@ class FibonacciGoal:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("order",)
+
     order: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class FibonacciGoal:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'order'
-        field_val = self.order
-        if isinstance(field_val, bytearray):
-            d['order'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['order'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['order'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['order'] = field_val
+        d['order'] = self.order
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class FibonacciGoal:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'order'
-        if 'order' in d:
-            field_type = cls.__annotations__.get('order')
-            value = d['order']
-            
-            if field_type is bytearray:
-                obj.order = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.order = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.order = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.order = field_type.from_dict(value)
-            else:
-                obj.order = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.order = d.get('order', 0)
         return obj
 
     def to_json(self, indent=2):
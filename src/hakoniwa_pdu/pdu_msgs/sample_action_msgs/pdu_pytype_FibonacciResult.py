@@ -10,6 +10,8 @@ class FibonacciResult:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("sequence",)
+
     sequence: List[int]
 
     def __init__(self):
@@ -28,16 +30,8 @@ class FibonacciResult:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'sequence'
         field_val = self.sequence
-        if isinstance(field_val, bytearray):
-            d['sequence'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['sequence'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['sequence'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['sequence'] = field_val
+        d['sequence'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -45,24 +39,9 @@ class FibonacciResult:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'sequence'
-        if 'sequence' in d:
-            field_type = cls.__annotations__.get('sequence')
-            value = d['sequence']
-            
-            if field_type is bytearray:
-                obj.sequence = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.sequence = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.sequence = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.sequence = field_type.from_dict(value)
-            else:
-                obj.sequence = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.sequence = d.get('sequence', [])
         return obj
 
     def to_json(self, indent=2):
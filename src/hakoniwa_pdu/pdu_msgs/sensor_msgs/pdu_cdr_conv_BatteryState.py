@@ -1,56 +1,39 @@
 from .pdu_pytype_BatteryState import BatteryState
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("fffffffBBB?")  # voltage, temperature, current, charge, capacity, design_capacity, percentage, power_supply_status, power_supply_health, power_supply_technology, present
+
 
 def py_to_cdr_body_BatteryState(writer: CdrWriter, src: BatteryState):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_float32(src.voltage)
-    writer.write_float32(src.temperature)
-    writer.write_float32(src.current)
-    writer.write_float32(src.charge)
-    writer.write_float32(src.capacity)
-    writer.write_float32(src.design_capacity)
-    writer.write_float32(src.percentage)
-    writer.write_uint8(src.power_supply_status)
-    writer.write_uint8(src.power_supply_health)
-    writer.write_uint8(src.power_supply_technology)
-    writer.write_bool(src.present)
+    writer.write_run(_CDR_RUN_0, (src.voltage, src.temperature, src.current, src.charge, src.capacity, src.design_capacity, src.percentage, src.power_supply_status, src.power_supply_health, src.power_supply_technology, src.present))
     writer.write_sequence_length(src.cell_voltage)
-    for elem in src.cell_voltage:
-        writer.write_float32(elem)
+    writer.write_sequence("f", src.cell_voltage)
     writer.write_sequence_length(src.cell_temperature)
-    for elem in src.cell_temperature:
-        writer.write_float32(elem)
+    writer.write_sequence("f", src.cell_temperature)
     writer.write_string(src.location)
     writer.write_string(src.serial_number)
 
 
 def cdr_body_to_py_BatteryState(reader: CdrReader, dst: BatteryState):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.voltage = reader.read_float32()
-    dst.temperature = reader.read_float32()
-    dst.current = reader.read_float32()
-    dst.charge = reader.read_float32()
-    dst.capacity = reader.read_float32()
-    dst.design_capacity = reader.read_float32()
-    dst.percentage = reader.read_float32()
-    dst.power_supply_status = reader.read_uint8()
-    dst.power_supply_health = reader.read_uint8()
-    dst.power_supply_technology = reader.read_uint8()
-    dst.present = reader.read_bool()
-    dst.cell_voltage = [reader.read_float32() for _ in range(reader.read_uint32())]
-    dst.cell_temperature = [reader.read_float32() for _ in range(reader.read_uint32())]
+    dst.voltage, dst.temperature, dst.current, dst.charge, dst.capacity, dst.design_capacity, dst.percentage, dst.power_supply_status, dst.power_supply_health, dst.power_supply_technology, dst.present = reader.read_run(_CDR_RUN_0)
+    dst.cell_voltage = reader.read_sequence("f", reader.read_uint32())
+    dst.cell_temperature = reader.read_sequence("f", reader.read_uint32())
     dst.location = reader.read_string()
     dst.serial_number = reader.read_string()
     return dst
 
 
 def py_to_cdr_BatteryState(src: BatteryState) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/BatteryState"])
     writer.write_encapsulation()
     py_to_cdr_body_BatteryState(writer, src)
     return writer.bytes()
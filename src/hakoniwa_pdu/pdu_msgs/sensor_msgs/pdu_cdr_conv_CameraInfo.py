@@ -1,51 +1,44 @@
 from .pdu_pytype_CameraInfo import CameraInfo
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..sensor_msgs.pdu_cdr_conv_RegionOfInterest import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("II")  # height, width
+_CDR_RUN_1 = CdrRun("IIIIII?")  # binning_x, binning_y, roi.x_offset, roi.y_offset, roi.height, roi.width, roi.do_rectify
+
 
 def py_to_cdr_body_CameraInfo(writer: CdrWriter, src: CameraInfo):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_uint32(src.height)
-    writer.write_uint32(src.width)
+    writer.write_run(_CDR_RUN_0, (src.height, src.width))
     writer.write_string(src.distortion_model)
     writer.write_sequence_length(src.d)
-    for elem in src.d:
-        writer.write_float64(elem)
-    values = src.k
-    for i in range(9):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
-    values = src.r
-    for i in range(9):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
-    values = src.p
-    for i in range(12):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
-    writer.write_uint32(src.binning_x)
-    writer.write_uint32(src.binning_y)
-    py_to_cdr_body_RegionOfInterest(writer, src.roi)
+    writer.write_sequence("d", src.d)
+    writer.write_sequence("d", src.k, 9)
+    writer.write_sequence("d", src.r, 9)
+    writer.write_sequence("d", src.p, 12)
+    writer.write_run(_CDR_RUN_1, (src.binning_x, src.binning_y, src.roi.x_offset, src.roi.y_offset, src.roi.height, src.roi.width, src.roi.do_rectify))
 
 
 def cdr_body_to_py_CameraInfo(reader: CdrReader, dst: CameraInfo):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.height = reader.read_uint32()
-    dst.width = reader.read_uint32()
+    dst.height, dst.width = reader.read_run(_CDR_RUN_0)
     dst.distortion_model = reader.read_string()
-    dst.d = [reader.read_float64() for _ in range(reader.read_uint32())]
-    dst.k = [reader.read_float64() for _ in range(9)]
-    dst.r = [reader.read_float64() for _ in range(9)]
-    dst.p = [reader.read_float64() for _ in range(12)]
-    dst.binning_x = reader.read_uint32()
-    dst.binning_y = reader.read_uint32()
-    cdr_body_to_py_RegionOfInterest(reader, dst.roi)
+    dst.d = reader.read_sequence("d", reader.read_uint32())
+    dst.k = reader.read_sequence("d", 9)
+    dst.r = reader.read_sequence("d", 9)
+    dst.p = reader.read_sequence("d", 12)
+    dst.binning_x, dst.binning_y, dst.roi.x_offset, dst.roi.y_offset, dst.roi.height, dst.roi.width, dst.roi.do_rectify = reader.read_run(_CDR_RUN_1)
     return dst
 
 
 def py_to_cdr_CameraInfo(src: CameraInfo) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/CameraInfo"])
     writer.write_encapsulation()
     py_to_cdr_body_CameraInfo(writer, src)
     return writer.bytes()
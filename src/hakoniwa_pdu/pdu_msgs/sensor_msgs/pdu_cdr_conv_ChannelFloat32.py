@@ -1,5 +1,6 @@
 from .pdu_pytype_ChannelFloat32 import ChannelFloat32
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -7,18 +8,18 @@ from ..pdu_cdr_runtime import CdrReader, CdrWriter
 def py_to_cdr_body_ChannelFloat32(writer: CdrWriter, src: ChannelFloat32):
     writer.write_string(src.name)
     writer.write_sequence_length(src.values)
-    for elem in src.values:
-        writer.write_float32(elem)
+    writer.write_sequence("f", src.values)
 
 
 def cdr_body_to_py_ChannelFloat32(reader: CdrReader, dst: ChannelFloat32):
     dst.name = reader.read_string()
-    dst.values = [reader.read_float32() for _ in range(reader.read_uint32())]
+    dst.values = reader.read_sequence("f", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_ChannelFloat32(src: ChannelFloat32) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/ChannelFloat32"])
     writer.write_encapsulation()
     py_to_cdr_body_ChannelFloat32(writer, src)
     return writer.bytes()
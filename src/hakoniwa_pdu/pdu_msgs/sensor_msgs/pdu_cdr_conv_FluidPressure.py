@@ -1,26 +1,29 @@
 from .pdu_pytype_FluidPressure import FluidPressure
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dd")  # fluid_pressure, variance
+
 
 def py_to_cdr_body_FluidPressure(writer: CdrWriter, src: FluidPressure):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_float64(src.fluid_pressure)
-    writer.write_float64(src.variance)
+    writer.write_run(_CDR_RUN_0, (src.fluid_pressure, src.variance))
 
 
 def cdr_body_to_py_FluidPressure(reader: CdrReader, dst: FluidPressure):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.fluid_pressure = reader.read_float64()
-    dst.variance = reader.read_float64()
+    dst.fluid_pressure, dst.variance = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_FluidPressure(src: FluidPressure) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/FluidPressure"])
     writer.write_encapsulation()
     py_to_cdr_body_FluidPressure(writer, src)
     return writer.bytes()
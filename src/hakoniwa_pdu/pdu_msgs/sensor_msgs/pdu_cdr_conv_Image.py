@@ -1,36 +1,37 @@
 from .pdu_pytype_Image import Image
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("II")  # height, width
+_CDR_RUN_1 = CdrRun("BI")  # is_bigendian, step
+
 
 def py_to_cdr_body_Image(writer: CdrWriter, src: Image):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_uint32(src.height)
-    writer.write_uint32(src.width)
+    writer.write_run(_CDR_RUN_0, (src.height, src.width))
     writer.write_string(src.encoding)
-    writer.write_uint8(src.is_bigendian)
-    writer.write_uint32(src.step)
+    writer.write_run(_CDR_RUN_1, (src.is_bigendian, src.step))
     writer.write_sequence_length(src.data)
-    for elem in src.data:
-        writer.write_uint8(elem)
+    writer.write_sequence("B", src.data)
 
 
 def cdr_body_to_py_Image(reader: CdrReader, dst: Image):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.height = reader.read_uint32()
-    dst.width = reader.read_uint32()
+    dst.height, dst.width = reader.read_run(_CDR_RUN_0)
     dst.encoding = reader.read_string()
-    dst.is_bigendian = reader.read_uint8()
-    dst.step = reader.read_uint32()
-    dst.data = [reader.read_uint8() for _ in range(reader.read_uint32())]
+    dst.is_bigendian, dst.step = reader.read_run(_CDR_RUN_1)
+    dst.data = reader.read_sequence("B", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_Image(src: Image) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/Image"])
     writer.write_encapsulation()
     py_to_cdr_body_Image(writer, src)
     return writer.bytes()
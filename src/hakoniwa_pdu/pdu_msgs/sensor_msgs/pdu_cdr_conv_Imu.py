@@ -1,5 +1,6 @@
 from .pdu_pytype_Imu import Imu
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
@@ -7,36 +8,36 @@ from ..builtin_interfaces.pdu_cdr_conv_Time import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dddd")  # orientation.x, orientation.y, orientation.z, orientation.w
+_CDR_RUN_1 = CdrRun("ddd")  # angular_velocity.x, angular_velocity.y, angular_velocity.z
+_CDR_RUN_2 = CdrRun("ddd")  # linear_acceleration.x, linear_acceleration.y, linear_acceleration.z
+
 
 def py_to_cdr_body_Imu(writer: CdrWriter, src: Imu):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Quaternion(writer, src.orientation)
-    values = src.orientation_covariance
-    for i in range(9):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
-    py_to_cdr_body_Vector3(writer, src.angular_velocity)
-    values = src.angular_velocity_covariance
-    for i in range(9):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
-    py_to_cdr_body_Vector3(writer, src.linear_acceleration)
-    values = src.linear_acceleration_covariance
-    for i in range(9):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
+    writer.write_run(_CDR_RUN_0, (src.orientation.x, src.orientation.y, src.orientation.z, src.orientation.w))
+    writer.write_sequence("d", src.orientation_covariance, 9)
+    writer.write_run(_CDR_RUN_1, (src.angular_velocity.x, src.angular_velocity.y, src.angular_velocity.z))
+    writer.write_sequence("d", src.angular_velocity_covariance, 9)
+    writer.write_run(_CDR_RUN_2, (src.linear_acceleration.x, src.linear_acceleration.y, src.linear_acceleration.z))
+    writer.write_sequence("d", src.linear_acceleration_covariance, 9)
 
 
 def cdr_body_to_py_Imu(reader: CdrReader, dst: Imu):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Quaternion(reader, dst.orientation)
-    dst.orientation_covariance = [reader.read_float64() for _ in range(9)]
-    cdr_body_to_py_Vector3(reader, dst.angular_velocity)
-    dst.angular_velocity_covariance = [reader.read_float64() for _ in range(9)]
-    cdr_body_to_py_Vector3(reader, dst.linear_acceleration)
-    dst.linear_acceleration_covariance = [reader.read_float64() for _ in range(9)]
+    dst.orientation.x, dst.orientation.y, dst.orientation.z, dst.orientation.w = reader.read_run(_CDR_RUN_0)
+    dst.orientation_covariance = reader.read_sequence("d", 9)
+    dst.angular_velocity.x, dst.angular_velocity.y, dst.angular_velocity.z = reader.read_run(_CDR_RUN_1)
+    dst.angular_velocity_covariance = reader.read_sequence("d", 9)
+    dst.linear_acceleration.x, dst.linear_acceleration.y, dst.linear_acceleration.z = reader.read_run(_CDR_RUN_2)
+    dst.linear_acceleration_covariance = reader.read_sequence("d", 9)
     return dst
 
 
 def py_to_cdr_Imu(src: Imu) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/Imu"])
     writer.write_encapsulation()
     py_to_cdr_body_Imu(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_JointState import JointState
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
@@ -12,27 +13,25 @@ def py_to_cdr_body_JointState(writer: CdrWriter, src: JointState):
     for elem in src.name:
         writer.write_string(elem)
     writer.write_sequence_length(src.position)
-    for elem in src.position:
-        writer.write_float64(elem)
+    writer.write_sequence("d", src.position)
     writer.write_sequence_length(src.velocity)
-    for elem in src.velocity:
-        writer.write_float64(elem)
+    writer.write_sequence("d", src.velocity)
     writer.write_sequence_length(src.effort)
-    for elem in src.effort:
-        writer.write_float64(elem)
+    writer.write_sequence("d", src.effort)
 
 
 def cdr_body_to_py_JointState(reader: CdrReader, dst: JointState):
     cdr_body_to_py_Header(reader, dst.header)
     dst.name = [reader.read_string() for _ in range(reader.read_uint32())]
-    dst.position = [reader.read_float64() for _ in range(reader.read_uint32())]
-    dst.velocity = [reader.read_float64() for _ in range(reader.read_uint32())]
-    dst.effort = [reader.read_float64() for _ in range(reader.read_uint32())]
+    dst.position = reader.read_sequence("d", reader.read_uint32())
+    dst.velocity = reader.read_sequence("d", reader.read_uint32())
+    dst.effort = reader.read_sequence("d", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_JointState(src: JointState) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/JointState"])
     writer.write_encapsulation()
     py_to_cdr_body_JointState(writer, src)
     return writer.bytes()
@@ -1,24 +1,25 @@
 from .pdu_pytype_JoyFeedback import JoyFeedback
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("BBf")  # type, id, intensity
+
 
 def py_to_cdr_body_JoyFeedback(writer: CdrWriter, src: JoyFeedback):
-    writer.write_uint8(src.type)
-    writer.write_uint8(src.id)
-    writer.write_float32(src.intensity)
+    writer.write_run(_CDR_RUN_0, (src.type, src.id, src.intensity))
 
 
 def cdr_body_to_py_JoyFeedback(reader: CdrReader, dst: JoyFeedback):
-    dst.type = reader.read_uint8()
-    dst.id = reader.read_uint8()
-    dst.intensity = reader.read_float32()
+    dst.type, dst.id, dst.intensity = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_JoyFeedback(src: JoyFeedback) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/JoyFeedback"])
     writer.write_encapsulation()
     py_to_cdr_body_JoyFeedback(writer, src)
     return writer.bytes()
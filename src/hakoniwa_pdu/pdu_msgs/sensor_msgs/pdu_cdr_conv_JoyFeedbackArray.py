@@ -1,5 +1,6 @@
 from .pdu_pytype_JoyFeedbackArray import JoyFeedbackArray
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..sensor_msgs.pdu_cdr_conv_JoyFeedback import *
 
@@ -21,7 +22,8 @@ def cdr_body_to_py_JoyFeedbackArray(reader: CdrReader, dst: JoyFeedbackArray):
 
 
 def py_to_cdr_JoyFeedbackArray(src: JoyFeedbackArray) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/JoyFeedbackArray"])
     writer.write_encapsulation()
     py_to_cdr_body_JoyFeedbackArray(writer, src)
     return writer.bytes()
@@ -1,22 +1,23 @@
 from .pdu_pytype_LaserEcho import LaserEcho
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
 
 def py_to_cdr_body_LaserEcho(writer: CdrWriter, src: LaserEcho):
     writer.write_sequence_length(src.echoes)
-    for elem in src.echoes:
-        writer.write_float32(elem)
+    writer.write_sequence("f", src.echoes)
 
 
 def cdr_body_to_py_LaserEcho(reader: CdrReader, dst: LaserEcho):
-    dst.echoes = [reader.read_float32() for _ in range(reader.read_uint32())]
+    dst.echoes = reader.read_sequence("f", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_LaserEcho(src: LaserEcho) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/LaserEcho"])
     writer.write_encapsulation()
     py_to_cdr_body_LaserEcho(writer, src)
     return writer.bytes()
@@ -1,29 +1,32 @@
 from .pdu_pytype_MagneticField import MagneticField
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ddd")  # magnetic_field.x, magnetic_field.y, magnetic_field.z
+
 
 def py_to_cdr_body_MagneticField(writer: CdrWriter, src: MagneticField):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Vector3(writer, src.magnetic_field)
-    values = src.magnetic_field_covariance
-    for i in range(9):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
+    writer.write_run(_CDR_RUN_0, (src.magnetic_field.x, src.magnetic_field.y, src.magnetic_field.z))
+    writer.write_sequence("d", src.magnetic_field_covariance, 9)
 
 
 def cdr_body_to_py_MagneticField(reader: CdrReader, dst: MagneticField):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Vector3(reader, dst.magnetic_field)
-    dst.magnetic_field_covariance = [reader.read_float64() for _ in range(9)]
+    dst.magnetic_field.x, dst.magnetic_field.y, dst.magnetic_field.z = reader.read_run(_CDR_RUN_0)
+    dst.magnetic_field_covariance = reader.read_sequence("d", 9)
     return dst
 
 
 def py_to_cdr_MagneticField(src: MagneticField) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/MagneticField"])
     writer.write_encapsulation()
     py_to_cdr_body_MagneticField(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_MultiDOFJointState import MultiDOFJointState
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
@@ -49,7 +50,8 @@ def cdr_body_to_py_MultiDOFJointState(reader: CdrReader, dst: MultiDOFJointState
 
 
 def py_to_cdr_MultiDOFJointState(src: MultiDOFJointState) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/MultiDOFJointState"])
     writer.write_encapsulation()
     py_to_cdr_body_MultiDOFJointState(writer, src)
     return writer.bytes()
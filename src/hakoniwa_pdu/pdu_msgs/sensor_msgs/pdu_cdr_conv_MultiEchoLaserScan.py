@@ -1,21 +1,19 @@
 from .pdu_pytype_MultiEchoLaserScan import MultiEchoLaserScan
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..sensor_msgs.pdu_cdr_conv_LaserEcho import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("fffffff")  # angle_min, angle_max, angle_increment, time_increment, scan_time, range_min, range_max
+
 
 def py_to_cdr_body_MultiEchoLaserScan(writer: CdrWriter, src: MultiEchoLaserScan):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_float32(src.angle_min)
-    writer.write_float32(src.angle_max)
-    writer.write_float32(src.angle_increment)
-    writer.write_float32(src.time_increment)
-    writer.write_float32(src.scan_time)
-    writer.write_float32(src.range_min)
-    writer.write_float32(src.range_max)
+    writer.write_run(_CDR_RUN_0, (src.angle_min, src.angle_max, src.angle_increment, src.time_increment, src.scan_time, src.range_min, src.range_max))
     writer.write_sequence_length(src.ranges)
     for elem in src.ranges:
         py_to_cdr_body_LaserEcho(writer, elem)
@@ -26,13 +24,7 @@ def py_to_cdr_body_MultiEchoLaserScan(writer: CdrWriter, src: MultiEchoLaserScan
 
 def cdr_body_to_py_MultiEchoLaserScan(reader: CdrReader, dst: MultiEchoLaserScan):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.angle_min = reader.read_float32()
-    dst.angle_max = reader.read_float32()
-    dst.angle_increment = reader.read_float32()
-    dst.time_increment = reader.read_float32()
-    dst.scan_time = reader.read_float32()
-    dst.range_min = reader.read_float32()
-    dst.range_max = reader.read_float32()
+    dst.angle_min, dst.angle_max, dst.angle_increment, dst.time_increment, dst.scan_time, dst.range_min, dst.range_max = reader.read_run(_CDR_RUN_0)
     dst.ranges = []
     for _ in range(reader.read_uint32()):
         elem = LaserEcho()
@@ -47,7 +39,8 @@ def cdr_body_to_py_MultiEchoLaserScan(reader: CdrReader, dst: MultiEchoLaserScan
 
 
 def py_to_cdr_MultiEchoLaserScan(src: MultiEchoLaserScan) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/MultiEchoLaserScan"])
     writer.write_encapsulation()
     py_to_cdr_body_MultiEchoLaserScan(writer, src)
     return writer.bytes()
@@ -1,37 +1,34 @@
 from .pdu_pytype_NavSatFix import NavSatFix
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..sensor_msgs.pdu_cdr_conv_NavSatStatus import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("bHddd")  # status.status, status.service, latitude, longitude, altitude
+
 
 def py_to_cdr_body_NavSatFix(writer: CdrWriter, src: NavSatFix):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_NavSatStatus(writer, src.status)
-    writer.write_float64(src.latitude)
-    writer.write_float64(src.longitude)
-    writer.write_float64(src.altitude)
-    values = src.position_covariance
-    for i in range(9):
-        writer.write_float64(values[i] if i < len(values) else 0.0)
+    writer.write_run(_CDR_RUN_0, (src.status.status, src.status.service, src.latitude, src.longitude, src.altitude))
+    writer.write_sequence("d", src.position_covariance, 9)
     writer.write_uint8(src.position_covariance_type)
 
 
 def cdr_body_to_py_NavSatFix(reader: CdrReader, dst: NavSatFix):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_NavSatStatus(reader, dst.status)
-    dst.latitude = reader.read_float64()
-    dst.longitude = reader.read_float64()
-    dst.altitude = reader.read_float64()
-    dst.position_covariance = [reader.read_float64() for _ in range(9)]
+    dst.status.status, dst.status.service, dst.latitude, dst.longitude, dst.altitude = reader.read_run(_CDR_RUN_0)
+    dst.position_covariance = reader.read_sequence("d", 9)
     dst.position_covariance_type = reader.read_uint8()
     return dst
 
 
 def py_to_cdr_NavSatFix(src: NavSatFix) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/NavSatFix"])
     writer.write_encapsulation()
     py_to_cdr_body_NavSatFix(writer, src)
     return writer.bytes()
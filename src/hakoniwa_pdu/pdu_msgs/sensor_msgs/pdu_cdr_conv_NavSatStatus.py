@@ -1,22 +1,25 @@
 from .pdu_pytype_NavSatStatus import NavSatStatus
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("bH")  # status, service
+
 
 def py_to_cdr_body_NavSatStatus(writer: CdrWriter, src: NavSatStatus):
-    writer.write_int8(src.status)
-    writer.write_uint16(src.service)
+    writer.write_run(_CDR_RUN_0, (src.status, src.service))
 
 
 def cdr_body_to_py_NavSatStatus(reader: CdrReader, dst: NavSatStatus):
-    dst.status = reader.read_int8()
-    dst.service = reader.read_uint16()
+    dst.status, dst.service = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_NavSatStatus(src: NavSatStatus) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/NavSatStatus"])
     writer.write_encapsulation()
     py_to_cdr_body_NavSatStatus(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_PointCloud import PointCloud
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..sensor_msgs.pdu_cdr_conv_ChannelFloat32 import *
 from ..std_msgs.pdu_cdr_conv_Header import *
@@ -34,7 +35,8 @@ def cdr_body_to_py_PointCloud(reader: CdrReader, dst: PointCloud):
 
 
 def py_to_cdr_PointCloud(src: PointCloud) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/PointCloud"])
     writer.write_encapsulation()
     py_to_cdr_body_PointCloud(writer, src)
     return writer.bytes()
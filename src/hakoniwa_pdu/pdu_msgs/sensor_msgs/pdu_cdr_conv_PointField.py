@@ -1,26 +1,27 @@
 from .pdu_pytype_PointField import PointField
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IBI")  # offset, datatype, count
+
 
 def py_to_cdr_body_PointField(writer: CdrWriter, src: PointField):
     writer.write_string(src.name)
-    writer.write_uint32(src.offset)
-    writer.write_uint8(src.datatype)
-    writer.write_uint32(src.count)
+    writer.write_run(_CDR_RUN_0, (src.offset, src.datatype, src.count))
 
 
 def cdr_body_to_py_PointField(reader: CdrReader, dst: PointField):
     dst.name = reader.read_string()
-    dst.offset = reader.read_uint32()
-    dst.datatype = reader.read_uint8()
-    dst.count = reader.read_uint32()
+    dst.offset, dst.datatype, dst.count = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_PointField(src: PointField) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/PointField"])
     writer.write_encapsulation()
     py_to_cdr_body_PointField(writer, src)
     return writer.bytes()
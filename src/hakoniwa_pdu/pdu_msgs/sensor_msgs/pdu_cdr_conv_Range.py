@@ -1,34 +1,29 @@
 from .pdu_pytype_Range import Range
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("Bfffff")  # radiation_type, field_of_view, min_range, max_range, range, variance
+
 
 def py_to_cdr_body_Range(writer: CdrWriter, src: Range):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_uint8(src.radiation_type)
-    writer.write_float32(src.field_of_view)
-    writer.write_float32(src.min_range)
-    writer.write_float32(src.max_range)
-    writer.write_float32(src.range)
-    writer.write_float32(src.variance)
+    writer.write_run(_CDR_RUN_0, (src.radiation_type, src.field_of_view, src.min_range, src.max_range, src.range, src.variance))
 
 
 def cdr_body_to_py_Range(reader: CdrReader, dst: Range):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.radiation_type = reader.read_uint8()
-    dst.field_of_view = reader.read_float32()
-    dst.min_range = reader.read_float32()
-    dst.max_range = reader.read_float32()
-    dst.range = reader.read_float32()
-    dst.variance = reader.read_float32()
+    dst.radiation_type, dst.field_of_view, dst.min_range, dst.max_range, dst.range, dst.variance = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_Range(src: Range) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/Range"])
     writer.write_encapsulation()
     py_to_cdr_body_Range(writer, src)
     return writer.bytes()
@@ -1,28 +1,25 @@
 from .pdu_pytype_RegionOfInterest import RegionOfInterest
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("IIII?")  # x_offset, y_offset, height, width, do_rectify
+
 
 def py_to_cdr_body_RegionOfInterest(writer: CdrWriter, src: RegionOfInterest):
-    writer.write_uint32(src.x_offset)
-    writer.write_uint32(src.y_offset)
-    writer.write_uint32(src.height)
-    writer.write_uint32(src.width)
-    writer.write_bool(src.do_rectify)
+    writer.write_run(_CDR_RUN_0, (src.x_offset, src.y_offset, src.height, src.width, src.do_rectify))
 
 
 def cdr_body_to_py_RegionOfInterest(reader: CdrReader, dst: RegionOfInterest):
-    dst.x_offset = reader.read_uint32()
-    dst.y_offset = reader.read_uint32()
-    dst.height = reader.read_uint32()
-    dst.width = reader.read_uint32()
-    dst.do_rectify = reader.read_bool()
+    dst.x_offset, dst.y_offset, dst.height, dst.width, dst.do_rectify = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_RegionOfInterest(src: RegionOfInterest) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/RegionOfInterest"])
     writer.write_encapsulation()
     py_to_cdr_body_RegionOfInterest(writer, src)
     return writer.bytes()
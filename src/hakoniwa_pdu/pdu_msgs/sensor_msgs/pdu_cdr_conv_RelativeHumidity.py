@@ -1,26 +1,29 @@
 from .pdu_pytype_RelativeHumidity import RelativeHumidity
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("dd")  # relative_humidity, variance
+
 
 def py_to_cdr_body_RelativeHumidity(writer: CdrWriter, src: RelativeHumidity):
     py_to_cdr_body_Header(writer, src.header)
-    writer.write_float64(src.relative_humidity)
-    writer.write_float64(src.variance)
+    writer.write_run(_CDR_RUN_0, (src.relative_humidity, src.variance))
 
 
 def cdr_body_to_py_RelativeHumidity(reader: CdrReader, dst: RelativeHumidity):
     cdr_body_to_py_Header(reader, dst.header)
-    dst.relative_humidity = reader.read_float64()
-    dst.variance = reader.read_float64()
+    dst.relative_humidity, dst.variance = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_RelativeHumidity(src: RelativeHumidity) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/RelativeHumidity"])
     writer.write_encapsulation()
     py_to_cdr_body_RelativeHumidity(writer, src)
     return writer.bytes()
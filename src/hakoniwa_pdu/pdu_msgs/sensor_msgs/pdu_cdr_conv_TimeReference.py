@@ -1,26 +1,31 @@
 from .pdu_pytype_TimeReference import TimeReference
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iI")  # time_ref.sec, time_ref.nanosec
+
 
 def py_to_cdr_body_TimeReference(writer: CdrWriter, src: TimeReference):
     py_to_cdr_body_Header(writer, src.header)
-    py_to_cdr_body_Time(writer, src.time_ref)
+    writer.write_run(_CDR_RUN_0, (src.time_ref.sec, src.time_ref.nanosec))
     writer.write_string(src.source)
 
 
 def cdr_body_to_py_TimeReference(reader: CdrReader, dst: TimeReference):
     cdr_body_to_py_Header(reader, dst.header)
-    cdr_body_to_py_Time(reader, dst.time_ref)
+    dst.time_ref.sec, dst.time_ref.nanosec = reader.read_run(_CDR_RUN_0)
     dst.source = reader.read_string()
     return dst
 
 
 def py_to_cdr_TimeReference(src: TimeReference) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["sensor_msgs/TimeReference"])
     writer.write_encapsulation()
     py_to_cdr_body_TimeReference(writer, src)
     return writer.bytes()
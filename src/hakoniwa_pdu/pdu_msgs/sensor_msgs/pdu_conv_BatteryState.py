@@ -8,13 +8,19 @@ from .. import binary_io
 from ..std_msgs.pdu_conv_Header import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<fffffffBBB1xi")  # voltage, temperature, current, charge, capacity, design_capacity, percentage, power_supply_status, power_supply_health, power_supply_technology, present
 
-def pdu_to_py_BatteryState(binary_data: bytearray) -> BatteryState:
-    py_obj = BatteryState()
+
+def pdu_to_py_BatteryState(binary_data: bytearray, out: BatteryState = None, array_mode: str = None) -> BatteryState:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = BatteryState() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_BatteryState(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,7 +33,7 @@ def binary_read_recursive_BatteryState(meta: binary_io.PduMetaData, binary_data:
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -37,110 +43,60 @@ def binary_read_recursive_BatteryState(meta: binary_io.PduMetaData, binary_data:
     # type_name: float32 
     # offset: 136 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 4)
-    py_obj.voltage = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: temperature 
     # type_name: float32 
     # offset: 140 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 140, 4)
-    py_obj.temperature = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: current 
     # type_name: float32 
     # offset: 144 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 144, 4)
-    py_obj.current = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: charge 
     # type_name: float32 
     # offset: 148 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 148, 4)
-    py_obj.charge = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: capacity 
     # type_name: float32 
     # offset: 152 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 152, 4)
-    py_obj.capacity = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: design_capacity 
     # type_name: float32 
     # offset: 156 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 156, 4)
-    py_obj.design_capacity = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: percentage 
     # type_name: float32 
     # offset: 160 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 160, 4)
-    py_obj.percentage = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: power_supply_status 
     # type_name: uint8 
     # offset: 164 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 164, 1)
-    py_obj.power_supply_status = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: power_supply_health 
     # type_name: uint8 
     # offset: 165 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 165, 1)
-    py_obj.power_supply_health = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: power_supply_technology 
     # type_name: uint8 
     # offset: 166 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 166, 1)
-    py_obj.power_supply_technology = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: present 
@@ -148,9 +104,18 @@ def binary_read_recursive_BatteryState(meta: binary_io.PduMetaData, binary_data:
     # offset: 168 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 168, 4)
-    py_obj.present = binary_io.binTovalue("bool", bin)
+    values = _RUN_0.unpack_from(binary_data, base_off + 136)
+    py_obj.voltage = values[0]
+    py_obj.temperature = values[1]
+    py_obj.current = values[2]
+    py_obj.charge = values[3]
+    py_obj.capacity = values[4]
+    py_obj.design_capacity = values[5]
+    py_obj.percentage = values[6]
+    py_obj.power_supply_status = values[7]
+    py_obj.power_supply_health = values[8]
+    py_obj.power_supply_technology = values[9]
+    py_obj.present = values[10] != 0
     
     # array_type: varray 
     # data_type: primitive 
@@ -162,9 +127,7 @@ def binary_read_recursive_BatteryState(meta: binary_io.PduMetaData, binary_data:
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 172, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 172 + 4, 4))
     one_elm_size = 4 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.cell_voltage = binary_io.binToArrayValues("float32", array_value)
+    py_obj.cell_voltage = read_array_values(meta, "float32", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: varray 
@@ -177,9 +140,7 @@ def binary_read_recursive_BatteryState(meta: binary_io.PduMetaData, binary_data:
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 180, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 180 + 4, 4))
     one_elm_size = 4 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.cell_temperature = binary_io.binToArrayValues("float32", array_value)
+    py_obj.cell_temperature = read_array_values(meta, "float32", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: single 
@@ -207,33 +168,13 @@ def binary_read_recursive_BatteryState(meta: binary_io.PduMetaData, binary_data:
     return py_obj
 
 
-def py_to_pdu_BatteryState(py_obj: BatteryState) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_BatteryState(py_obj: BatteryState, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_BatteryState(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_BatteryState(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: BatteryState):
     # array_type: single 
@@ -253,153 +194,68 @@ def binary_write_recursive_BatteryState(parent_off: int, bw_container: BinaryWri
     # type_name: float32 
     # offset: 136 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 136
-
-    
-    bin = binary_io.typeTobin(type, py_obj.voltage)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: temperature 
     # type_name: float32 
     # offset: 140 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 140
-
-    
-    bin = binary_io.typeTobin(type, py_obj.temperature)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: current 
     # type_name: float32 
     # offset: 144 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 144
-
-    
-    bin = binary_io.typeTobin(type, py_obj.current)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: charge 
     # type_name: float32 
     # offset: 148 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 148
-
-    
-    bin = binary_io.typeTobin(type, py_obj.charge)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: capacity 
     # type_name: float32 
     # offset: 152 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 152
-
-    
-    bin = binary_io.typeTobin(type, py_obj.capacity)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: design_capacity 
     # type_name: float32 
     # offset: 156 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 156
-
-    
-    bin = binary_io.typeTobin(type, py_obj.design_capacity)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: percentage 
     # type_name: float32 
     # offset: 160 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 160
-
-    
-    bin = binary_io.typeTobin(type, py_obj.percentage)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: power_supply_status 
     # type_name: uint8 
     # offset: 164 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 164
-
-    
-    bin = binary_io.typeTobin(type, py_obj.power_supply_status)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: power_supply_health 
     # type_name: uint8 
     # offset: 165 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 165
-
-    
-    bin = binary_io.typeTobin(type, py_obj.power_supply_health)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: power_supply_technology 
     # type_name: uint8 
     # offset: 166 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 166
-
-    
-    bin = binary_io.typeTobin(type, py_obj.power_supply_technology)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: present 
     # type_name: bool 
     # offset: 168 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 168
 
-    
-    bin = binary_io.typeTobin(type, py_obj.present)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.voltage, py_obj.temperature, py_obj.current, py_obj.charge, py_obj.capacity, py_obj.design_capacity, py_obj.percentage, py_obj.power_supply_status, py_obj.power_supply_health, py_obj.power_supply_technology, 1 if py_obj.present else 0), expected_offset=parent_off + 136)
     
     # array_type: varray 
     # data_type: primitive 
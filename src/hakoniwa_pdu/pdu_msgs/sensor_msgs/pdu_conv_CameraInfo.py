@@ -9,13 +9,20 @@ from ..std_msgs.pdu_conv_Header import *
 from ..sensor_msgs.pdu_conv_RegionOfInterest import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<II")  # height, width
+_RUN_1 = struct.Struct("<II")  # binning_x, binning_y
 
-def pdu_to_py_CameraInfo(binary_data: bytearray) -> CameraInfo:
-    py_obj = CameraInfo()
+
+def pdu_to_py_CameraInfo(binary_data: bytearray, out: CameraInfo = None, array_mode: str = None) -> CameraInfo:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = CameraInfo() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_CameraInfo(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,7 +35,7 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -38,11 +45,6 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     # type_name: uint32 
     # offset: 136 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 4)
-    py_obj.height = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: width 
@@ -50,9 +52,7 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     # offset: 140 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 140, 4)
-    py_obj.width = binary_io.binTovalue("uint32", bin)
+    py_obj.height, py_obj.width = _RUN_0.unpack_from(binary_data, base_off + 136)
     
     # array_type: single 
     # data_type: primitive 
@@ -75,9 +75,7 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 272, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 272 + 4, 4))
     one_elm_size = 8 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.d = binary_io.binToArrayValues("float64", array_value)
+    py_obj.d = read_array_values(meta, "float64", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: array 
@@ -88,9 +86,7 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     # array_len: 9
 
     
-    array_value = binary_io.readBinary(binary_data, base_off + 280, 72)
-    
-    py_obj.k = binary_io.binToArrayValues("float64", array_value)
+    py_obj.k = read_array_values(meta, "float64", binary_data, base_off + 280, 72)
     
     
     # array_type: array 
@@ -101,9 +97,7 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     # array_len: 9
 
     
-    array_value = binary_io.readBinary(binary_data, base_off + 352, 72)
-    
-    py_obj.r = binary_io.binToArrayValues("float64", array_value)
+    py_obj.r = read_array_values(meta, "float64", binary_data, base_off + 352, 72)
     
     
     # array_type: array 
@@ -114,9 +108,7 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     # array_len: 12
 
     
-    array_value = binary_io.readBinary(binary_data, base_off + 424, 96)
-    
-    py_obj.p = binary_io.binToArrayValues("float64", array_value)
+    py_obj.p = read_array_values(meta, "float64", binary_data, base_off + 424, 96)
     
     
     # array_type: single 
@@ -125,11 +117,6 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     # type_name: uint32 
     # offset: 520 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 520, 4)
-    py_obj.binning_x = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: binning_y 
@@ -137,9 +124,7 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     # offset: 524 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 524, 4)
-    py_obj.binning_y = binary_io.binTovalue("uint32", bin)
+    py_obj.binning_x, py_obj.binning_y = _RUN_1.unpack_from(binary_data, base_off + 520)
     
     # array_type: single 
     # data_type: struct 
@@ -148,40 +133,20 @@ def binary_read_recursive_CameraInfo(meta: binary_io.PduMetaData, binary_data: b
     # offset: 528 size: 20 
     # array_len: 1
 
-    tmp_py_obj = RegionOfInterest()
+    tmp_py_obj = reuse_obj(py_obj.roi, RegionOfInterest)
     binary_read_recursive_RegionOfInterest(meta, binary_data, tmp_py_obj, base_off + 528)
     py_obj.roi = tmp_py_obj
     
     return py_obj
 
 
-def py_to_pdu_CameraInfo(py_obj: CameraInfo) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_CameraInfo(py_obj: CameraInfo, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_CameraInfo(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_CameraInfo(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: CameraInfo):
     # array_type: single 
@@ -201,27 +166,14 @@ def binary_write_recursive_CameraInfo(parent_off: int, bw_container: BinaryWrite
     # type_name: uint32 
     # offset: 136 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 136
-
-    
-    bin = binary_io.typeTobin(type, py_obj.height)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: width 
     # type_name: uint32 
     # offset: 140 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 140
 
-    
-    bin = binary_io.typeTobin(type, py_obj.width)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.height, py_obj.width), expected_offset=parent_off + 136)
     
     # array_type: single 
     # data_type: primitive 
@@ -302,27 +254,14 @@ def binary_write_recursive_CameraInfo(parent_off: int, bw_container: BinaryWrite
     # type_name: uint32 
     # offset: 520 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 520
-
-    
-    bin = binary_io.typeTobin(type, py_obj.binning_x)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: binning_y 
     # type_name: uint32 
     # offset: 524 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 524
 
-    
-    bin = binary_io.typeTobin(type, py_obj.binning_y)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.binning_x, py_obj.binning_y), expected_offset=parent_off + 520)
     
     # array_type: single 
     # data_type: struct 
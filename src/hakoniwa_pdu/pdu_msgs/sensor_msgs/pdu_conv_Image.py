@@ -8,13 +8,20 @@ from .. import binary_io
 from ..std_msgs.pdu_conv_Header import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<II")  # height, width
+_RUN_1 = struct.Struct("<B3xI")  # is_bigendian, step
 
-def pdu_to_py_Image(binary_data: bytearray) -> Image:
-    py_obj = Image()
+
+def pdu_to_py_Image(binary_data: bytearray, out: Image = None, array_mode: str = None) -> Image:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Image() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Image(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,7 +34,7 @@ def binary_read_recursive_Image(meta: binary_io.PduMetaData, binary_data: bytear
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -37,11 +44,6 @@ def binary_read_recursive_Image(meta: binary_io.PduMetaData, binary_data: bytear
     # type_name: uint32 
     # offset: 136 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 4)
-    py_obj.height = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: width 
@@ -49,9 +51,7 @@ def binary_read_recursive_Image(meta: binary_io.PduMetaData, binary_data: bytear
     # offset: 140 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 140, 4)
-    py_obj.width = binary_io.binTovalue("uint32", bin)
+    py_obj.height, py_obj.width = _RUN_0.unpack_from(binary_data, base_off + 136)
     
     # array_type: single 
     # data_type: primitive 
@@ -70,11 +70,6 @@ def binary_read_recursive_Image(meta: binary_io.PduMetaData, binary_data: bytear
     # type_name: uint8 
     # offset: 272 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 272, 1)
-    py_obj.is_bigendian = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: step 
@@ -82,9 +77,7 @@ def binary_read_recursive_Image(meta: binary_io.PduMetaData, binary_data: bytear
     # offset: 276 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 276, 4)
-    py_obj.step = binary_io.binTovalue("uint32", bin)
+    py_obj.is_bigendian, py_obj.step = _RUN_1.unpack_from(binary_data, base_off + 272)
     
     # array_type: varray 
     # data_type: primitive 
@@ -96,41 +89,19 @@ def binary_read_recursive_Image(meta: binary_io.PduMetaData, binary_data: bytear
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 280, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 280 + 4, 4))
     one_elm_size = 1 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.data = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.data = read_array_values(meta, "uint8", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     return py_obj
 
 
-def py_to_pdu_Image(py_obj: Image) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Image(py_obj: Image, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Image(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Image(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Image):
     # array_type: single 
@@ -150,27 +121,14 @@ def binary_write_recursive_Image(parent_off: int, bw_container: BinaryWriterCont
     # type_name: uint32 
     # offset: 136 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 136
-
-    
-    bin = binary_io.typeTobin(type, py_obj.height)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: width 
     # type_name: uint32 
     # offset: 140 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 140
 
-    
-    bin = binary_io.typeTobin(type, py_obj.width)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.height, py_obj.width), expected_offset=parent_off + 136)
     
     # array_type: single 
     # data_type: primitive 
@@ -192,27 +150,14 @@ def binary_write_recursive_Image(parent_off: int, bw_container: BinaryWriterCont
     # type_name: uint8 
     # offset: 272 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 272
-
-    
-    bin = binary_io.typeTobin(type, py_obj.is_bigendian)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: step 
     # type_name: uint32 
     # offset: 276 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 276
 
-    
-    bin = binary_io.typeTobin(type, py_obj.step)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.is_bigendian, py_obj.step), expected_offset=parent_off + 272)
     
     # array_type: varray 
     # data_type: primitive 
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<BB2xf")  # type, id, intensity
 
-def pdu_to_py_JoyFeedback(binary_data: bytearray) -> JoyFeedback:
-    py_obj = JoyFeedback()
+
+def pdu_to_py_JoyFeedback(binary_data: bytearray, out: JoyFeedback = None, array_mode: str = None) -> JoyFeedback:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = JoyFeedback() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_JoyFeedback(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -25,22 +31,12 @@ def binary_read_recursive_JoyFeedback(meta: binary_io.PduMetaData, binary_data:
     # type_name: uint8 
     # offset: 0 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 1)
-    py_obj.type = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: id 
     # type_name: uint8 
     # offset: 1 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 1, 1)
-    py_obj.id = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: intensity 
@@ -48,40 +44,18 @@ def binary_read_recursive_JoyFeedback(meta: binary_io.PduMetaData, binary_data:
     # offset: 4 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 4, 4)
-    py_obj.intensity = binary_io.binTovalue("float32", bin)
+    py_obj.type, py_obj.id, py_obj.intensity = _RUN_0.unpack_from(binary_data, base_off + 0)
     
     return py_obj
 
 
-def py_to_pdu_JoyFeedback(py_obj: JoyFeedback) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_JoyFeedback(py_obj: JoyFeedback, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_JoyFeedback(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_JoyFeedback(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: JoyFeedback):
     # array_type: single 
@@ -90,41 +64,20 @@ def binary_write_recursive_JoyFeedback(parent_off: int, bw_container: BinaryWrit
     # type_name: uint8 
     # offset: 0 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 0
-
-    
-    bin = binary_io.typeTobin(type, py_obj.type)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: id 
     # type_name: uint8 
     # offset: 1 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 1
-
-    
-    bin = binary_io.typeTobin(type, py_obj.id)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: intensity 
     # type_name: float32 
     # offset: 4 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 4
 
-    
-    bin = binary_io.typeTobin(type, py_obj.intensity)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.type, py_obj.id, py_obj.intensity), expected_offset=parent_off + 0)
     
 
 if __name__ == "__main__":
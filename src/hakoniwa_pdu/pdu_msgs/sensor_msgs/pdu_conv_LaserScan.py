@@ -8,13 +8,19 @@ from .. import binary_io
 from ..std_msgs.pdu_conv_Header import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<fffffff")  # angle_min, angle_max, angle_increment, time_increment, scan_time, range_min, range_max
 
-def pdu_to_py_LaserScan(binary_data: bytearray) -> LaserScan:
-    py_obj = LaserScan()
+
+def pdu_to_py_LaserScan(binary_data: bytearray, out: LaserScan = None, array_mode: str = None) -> LaserScan:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = LaserScan() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_LaserScan(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,7 +33,7 @@ def binary_read_recursive_LaserScan(meta: binary_io.PduMetaData, binary_data: by
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -37,66 +43,36 @@ def binary_read_recursive_LaserScan(meta: binary_io.PduMetaData, binary_data: by
     # type_name: float32 
     # offset: 136 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 4)
-    py_obj.angle_min = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: angle_max 
     # type_name: float32 
     # offset: 140 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 140, 4)
-    py_obj.angle_max = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: angle_increment 
     # type_name: float32 
     # offset: 144 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 144, 4)
-    py_obj.angle_increment = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: time_increment 
     # type_name: float32 
     # offset: 148 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 148, 4)
-    py_obj.time_increment = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: scan_time 
     # type_name: float32 
     # offset: 152 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 152, 4)
-    py_obj.scan_time = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: range_min 
     # type_name: float32 
     # offset: 156 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 156, 4)
-    py_obj.range_min = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: range_max 
@@ -104,9 +80,7 @@ def binary_read_recursive_LaserScan(meta: binary_io.PduMetaData, binary_data: by
     # offset: 160 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 160, 4)
-    py_obj.range_max = binary_io.binTovalue("float32", bin)
+    py_obj.angle_min, py_obj.angle_max, py_obj.angle_increment, py_obj.time_increment, py_obj.scan_time, py_obj.range_min, py_obj.range_max = _RUN_0.unpack_from(binary_data, base_off + 136)
     
     # array_type: varray 
     # data_type: primitive 
@@ -118,9 +92,7 @@ def binary_read_recursive_LaserScan(meta: binary_io.PduMetaData, binary_data: by
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 164, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 164 + 4, 4))
     one_elm_size = 4 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.ranges = binary_io.binToArrayValues("float32", array_value)
+    py_obj.ranges = read_array_values(meta, "float32", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: varray 
@@ -133,41 +105,19 @@ def binary_read_recursive_LaserScan(meta: binary_io.PduMetaData, binary_data: by
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 172, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 172 + 4, 4))
     one_elm_size = 4 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.intensities = binary_io.binToArrayValues("float32", array_value)
+    py_obj.intensities = read_array_values(meta, "float32", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     return py_obj
 
 
-def py_to_pdu_LaserScan(py_obj: LaserScan) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_LaserScan(py_obj: LaserScan, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_LaserScan(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_LaserScan(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: LaserScan):
     # array_type: single 
@@ -187,97 +137,44 @@ def binary_write_recursive_LaserScan(parent_off: int, bw_container: BinaryWriter
     # type_name: float32 
     # offset: 136 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 136
-
-    
-    bin = binary_io.typeTobin(type, py_obj.angle_min)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: angle_max 
     # type_name: float32 
     # offset: 140 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 140
-
-    
-    bin = binary_io.typeTobin(type, py_obj.angle_max)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: angle_increment 
     # type_name: float32 
     # offset: 144 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 144
-
-    
-    bin = binary_io.typeTobin(type, py_obj.angle_increment)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: time_increment 
     # type_name: float32 
     # offset: 148 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 148
-
-    
-    bin = binary_io.typeTobin(type, py_obj.time_increment)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: scan_time 
     # type_name: float32 
     # offset: 152 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 152
-
-    
-    bin = binary_io.typeTobin(type, py_obj.scan_time)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: range_min 
     # type_name: float32 
     # offset: 156 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 156
-
-    
-    bin = binary_io.typeTobin(type, py_obj.range_min)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: range_max 
     # type_name: float32 
     # offset: 160 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 160
 
-    
-    bin = binary_io.typeTobin(type, py_obj.range_max)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.angle_min, py_obj.angle_max, py_obj.angle_increment, py_obj.time_increment, py_obj.scan_time, py_obj.range_min, py_obj.range_max), expected_offset=parent_off + 136)
     
     # array_type: varray 
     # data_type: primitive 
@@ -9,13 +9,20 @@ from ..std_msgs.pdu_conv_Header import *
 from ..sensor_msgs.pdu_conv_NavSatStatus import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<ddd")  # latitude, longitude, altitude
+_RUN_1 = struct.Struct("<B")  # position_covariance_type
 
-def pdu_to_py_NavSatFix(binary_data: bytearray) -> NavSatFix:
-    py_obj = NavSatFix()
+
+def pdu_to_py_NavSatFix(binary_data: bytearray, out: NavSatFix = None, array_mode: str = None) -> NavSatFix:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = NavSatFix() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_NavSatFix(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,7 +35,7 @@ def binary_read_recursive_NavSatFix(meta: binary_io.PduMetaData, binary_data: by
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -39,7 +46,7 @@ def binary_read_recursive_NavSatFix(meta: binary_io.PduMetaData, binary_data: by
     # offset: 136 size: 4 
     # array_len: 1
 
-    tmp_py_obj = NavSatStatus()
+    tmp_py_obj = reuse_obj(py_obj.status, NavSatStatus)
     binary_read_recursive_NavSatStatus(meta, binary_data, tmp_py_obj, base_off + 136)
     py_obj.status = tmp_py_obj
     
@@ -49,22 +56,12 @@ def binary_read_recursive_NavSatFix(meta: binary_io.PduMetaData, binary_data: by
     # type_name: float64 
     # offset: 144 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 144, 8)
-    py_obj.latitude = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: longitude 
     # type_name: float64 
     # offset: 152 size: 8 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 152, 8)
-    py_obj.longitude = binary_io.binTovalue("float64", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: altitude 
@@ -72,9 +69,7 @@ def binary_read_recursive_NavSatFix(meta: binary_io.PduMetaData, binary_data: by
     # offset: 160 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 160, 8)
-    py_obj.altitude = binary_io.binTovalue("float64", bin)
+    py_obj.latitude, py_obj.longitude, py_obj.altitude = _RUN_0.unpack_from(binary_data, base_off + 144)
     
     # array_type: array 
     # data_type: primitive 
@@ -84,9 +79,7 @@ def binary_read_recursive_NavSatFix(meta: binary_io.PduMetaData, binary_data: by
     # array_len: 9
 
     
-    array_value = binary_io.readBinary(binary_data, base_off + 168, 72)
-    
-    py_obj.position_covariance = binary_io.binToArrayValues("float64", array_value)
+    py_obj.position_covariance = read_array_values(meta, "float64", binary_data, base_off + 168, 72)
     
     
     # array_type: single 
@@ -96,40 +89,18 @@ def binary_read_recursive_NavSatFix(meta: binary_io.PduMetaData, binary_data: by
     # offset: 240 size: 1 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 240, 1)
-    py_obj.position_covariance_type = binary_io.binTovalue("uint8", bin)
+    py_obj.position_covariance_type = _RUN_1.unpack_from(binary_data, base_off + 240)[0]
     
     return py_obj
 
 
-def py_to_pdu_NavSatFix(py_obj: NavSatFix) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_NavSatFix(py_obj: NavSatFix, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_NavSatFix(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_NavSatFix(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: NavSatFix):
     # array_type: single 
@@ -160,41 +131,20 @@ def binary_write_recursive_NavSatFix(parent_off: int, bw_container: BinaryWriter
     # type_name: float64 
     # offset: 144 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 144
-
-    
-    bin = binary_io.typeTobin(type, py_obj.latitude)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: longitude 
     # type_name: float64 
     # offset: 152 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 152
-
-    
-    bin = binary_io.typeTobin(type, py_obj.longitude)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: altitude 
     # type_name: float64 
     # offset: 160 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 160
 
-    
-    bin = binary_io.typeTobin(type, py_obj.altitude)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.latitude, py_obj.longitude, py_obj.altitude), expected_offset=parent_off + 144)
     
     # array_type: array 
     # data_type: primitive 
@@ -216,13 +166,8 @@ def binary_write_recursive_NavSatFix(parent_off: int, bw_container: BinaryWriter
     # type_name: uint8 
     # offset: 240 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 240
 
-    
-    bin = binary_io.typeTobin(type, py_obj.position_covariance_type)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(py_obj.position_covariance_type), expected_offset=parent_off + 240)
     
 
 if __name__ == "__main__":
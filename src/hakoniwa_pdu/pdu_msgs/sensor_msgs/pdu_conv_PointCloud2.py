@@ -9,13 +9,21 @@ from ..std_msgs.pdu_conv_Header import *
 from ..sensor_msgs.pdu_conv_PointField import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<II")  # height, width
+_RUN_1 = struct.Struct("<iII")  # is_bigendian, point_step, row_step
+_RUN_2 = struct.Struct("<i")  # is_dense
 
-def pdu_to_py_PointCloud2(binary_data: bytearray) -> PointCloud2:
-    py_obj = PointCloud2()
+
+def pdu_to_py_PointCloud2(binary_data: bytearray, out: PointCloud2 = None, array_mode: str = None) -> PointCloud2:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = PointCloud2() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_PointCloud2(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -28,7 +36,7 @@ def binary_read_recursive_PointCloud2(meta: binary_io.PduMetaData, binary_data:
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -38,11 +46,6 @@ def binary_read_recursive_PointCloud2(meta: binary_io.PduMetaData, binary_data:
     # type_name: uint32 
     # offset: 136 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 4)
-    py_obj.height = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: width 
@@ -50,9 +53,7 @@ def binary_read_recursive_PointCloud2(meta: binary_io.PduMetaData, binary_data:
     # offset: 140 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 140, 4)
-    py_obj.width = binary_io.binTovalue("uint32", bin)
+    py_obj.height, py_obj.width = _RUN_0.unpack_from(binary_data, base_off + 136)
     
     # array_type: varray 
     # data_type: struct 
@@ -65,11 +66,10 @@ def binary_read_recursive_PointCloud2(meta: binary_io.PduMetaData, binary_data:
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 144 + 4, 4))
     one_elm_size = 140
     i = 0
-    array_value = []
+    array_value = reuse_list(py_obj.fields, array_size, PointField)
     while i < array_size:
-        tmp_py_obj = PointField()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_PointField(meta, binary_data, tmp_py_obj, meta.heap_off + offset_from_heap + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.fields = array_value    
     
@@ -79,22 +79,12 @@ def binary_read_recursive_PointCloud2(meta: binary_io.PduMetaData, binary_data:
     # type_name: bool 
     # offset: 152 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 152, 4)
-    py_obj.is_bigendian = binary_io.binTovalue("bool", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: point_step 
     # type_name: uint32 
     # offset: 156 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 156, 4)
-    py_obj.point_step = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: row_step 
@@ -102,9 +92,10 @@ def binary_read_recursive_PointCloud2(meta: binary_io.PduMetaData, binary_data:
     # offset: 160 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 160, 4)
-    py_obj.row_step = binary_io.binTovalue("uint32", bin)
+    values = _RUN_1.unpack_from(binary_data, base_off + 152)
+    py_obj.is_bigendian = values[0] != 0
+    py_obj.point_step = values[1]
+    py_obj.row_step = values[2]
     
     # array_type: varray 
     # data_type: primitive 
@@ -116,9 +107,7 @@ def binary_read_recursive_PointCloud2(meta: binary_io.PduMetaData, binary_data:
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 164, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 164 + 4, 4))
     one_elm_size = 1 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.data = binary_io.binToArrayValues("uint8", array_value)
+    py_obj.data = read_array_values(meta, "uint8", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     # array_type: single 
@@ -128,40 +117,19 @@ def binary_read_recursive_PointCloud2(meta: binary_io.PduMetaData, binary_data:
     # offset: 172 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 172, 4)
-    py_obj.is_dense = binary_io.binTovalue("bool", bin)
+    values = _RUN_2.unpack_from(binary_data, base_off + 172)
+    py_obj.is_dense = values[0] != 0
     
     return py_obj
 
 
-def py_to_pdu_PointCloud2(py_obj: PointCloud2) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_PointCloud2(py_obj: PointCloud2, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_PointCloud2(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_PointCloud2(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: PointCloud2):
     # array_type: single 
@@ -181,27 +149,14 @@ def binary_write_recursive_PointCloud2(parent_off: int, bw_container: BinaryWrit
     # type_name: uint32 
     # offset: 136 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 136
-
-    
-    bin = binary_io.typeTobin(type, py_obj.height)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: width 
     # type_name: uint32 
     # offset: 140 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 140
 
-    
-    bin = binary_io.typeTobin(type, py_obj.width)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.height, py_obj.width), expected_offset=parent_off + 136)
     
     # array_type: varray 
     # data_type: struct 
@@ -228,41 +183,20 @@ def binary_write_recursive_PointCloud2(parent_off: int, bw_container: BinaryWrit
     # type_name: bool 
     # offset: 152 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 152
-
-    
-    bin = binary_io.typeTobin(type, py_obj.is_bigendian)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: point_step 
     # type_name: uint32 
     # offset: 156 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 156
-
-    
-    bin = binary_io.typeTobin(type, py_obj.point_step)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: row_step 
     # type_name: uint32 
     # offset: 160 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 160
 
-    
-    bin = binary_io.typeTobin(type, py_obj.row_step)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_1.pack(1 if py_obj.is_bigendian else 0, py_obj.point_step, py_obj.row_step), expected_offset=parent_off + 152)
     
     # array_type: varray 
     # data_type: primitive 
@@ -287,13 +221,8 @@ def binary_write_recursive_PointCloud2(parent_off: int, bw_container: BinaryWrit
     # type_name: bool 
     # offset: 172 size: 4 
     # array_len: 1
-    type = "bool"
-    off = 172
 
-    
-    bin = binary_io.typeTobin(type, py_obj.is_dense)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_2.pack(1 if py_obj.is_dense else 0), expected_offset=parent_off + 172)
     
 
 if __name__ == "__main__":
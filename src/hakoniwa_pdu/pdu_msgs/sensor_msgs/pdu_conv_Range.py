@@ -8,13 +8,19 @@ from .. import binary_io
 from ..std_msgs.pdu_conv_Header import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<B3xfffff")  # radiation_type, field_of_view, min_range, max_range, range, variance
 
-def pdu_to_py_Range(binary_data: bytearray) -> Range:
-    py_obj = Range()
+
+def pdu_to_py_Range(binary_data: bytearray, out: Range = None, array_mode: str = None) -> Range:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Range() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Range(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,7 +33,7 @@ def binary_read_recursive_Range(meta: binary_io.PduMetaData, binary_data: bytear
     # offset: 0 size: 136 
     # array_len: 1
 
-    tmp_py_obj = Header()
+    tmp_py_obj = reuse_obj(py_obj.header, Header)
     binary_read_recursive_Header(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.header = tmp_py_obj
     
@@ -37,55 +43,30 @@ def binary_read_recursive_Range(meta: binary_io.PduMetaData, binary_data: bytear
     # type_name: uint8 
     # offset: 136 size: 1 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 136, 1)
-    py_obj.radiation_type = binary_io.binTovalue("uint8", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: field_of_view 
     # type_name: float32 
     # offset: 140 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 140, 4)
-    py_obj.field_of_view = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: min_range 
     # type_name: float32 
     # offset: 144 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 144, 4)
-    py_obj.min_range = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: max_range 
     # type_name: float32 
     # offset: 148 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 148, 4)
-    py_obj.max_range = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: range 
     # type_name: float32 
     # offset: 152 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 152, 4)
-    py_obj.range = binary_io.binTovalue("float32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: variance 
@@ -93,40 +74,18 @@ def binary_read_recursive_Range(meta: binary_io.PduMetaData, binary_data: bytear
     # offset: 156 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 156, 4)
-    py_obj.variance = binary_io.binTovalue("float32", bin)
+    py_obj.radiation_type, py_obj.field_of_view, py_obj.min_range, py_obj.max_range, py_obj.range, py_obj.variance = _RUN_0.unpack_from(binary_data, base_off + 136)
     
     return py_obj
 
 
-def py_to_pdu_Range(py_obj: Range) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Range(py_obj: Range, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Range(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Range(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Range):
     # array_type: single 
@@ -146,83 +105,38 @@ def binary_write_recursive_Range(parent_off: int, bw_container: BinaryWriterCont
     # type_name: uint8 
     # offset: 136 size: 1 
     # array_len: 1
-    type = "uint8"
-    off = 136
-
-    
-    bin = binary_io.typeTobin(type, py_obj.radiation_type)
-    bin = get_binary(type, bin, 1)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: field_of_view 
     # type_name: float32 
     # offset: 140 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 140
-
-    
-    bin = binary_io.typeTobin(type, py_obj.field_of_view)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: min_range 
     # type_name: float32 
     # offset: 144 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 144
-
-    
-    bin = binary_io.typeTobin(type, py_obj.min_range)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: max_range 
     # type_name: float32 
     # offset: 148 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 148
-
-    
-    bin = binary_io.typeTobin(type, py_obj.max_range)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: range 
     # type_name: float32 
     # offset: 152 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 152
-
-    
-    bin = binary_io.typeTobin(type, py_obj.range)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: variance 
     # type_name: float32 
     # offset: 156 size: 4 
     # array_len: 1
-    type = "float32"
-    off = 156
 
-    
-    bin = binary_io.typeTobin(type, py_obj.variance)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.radiation_type, py_obj.field_of_view, py_obj.min_range, py_obj.max_range, py_obj.range, py_obj.variance), expected_offset=parent_off + 136)
     
 
 if __name__ == "__main__":
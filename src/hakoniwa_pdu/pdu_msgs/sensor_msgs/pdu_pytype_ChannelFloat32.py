@@ -10,6 +10,8 @@ class ChannelFloat32:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("name", "values")
+
     name: str
     values: List[float]
 
@@ -31,26 +33,9 @@ class ChannelFloat32:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'name'
-        field_val = self.name
-        if isinstance(field_val, bytearray):
-            d['name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['name'] = field_val
-        # handle field 'values'
+        d['name'] = self.name
         field_val = self.values
-        if isinstance(field_val, bytearray):
-            d['values'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['values'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['values'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['values'] = field_val
+        d['values'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -58,41 +43,10 @@ class ChannelFloat32:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'name'
-        if 'name' in d:
-            field_type = cls.__annotations__.get('name')
-            value = d['name']
-            
-            if field_type is bytearray:
-                obj.name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.name = field_type.from_dict(value)
-            else:
-                obj.name = value
-        # handle field 'values'
-        if 'values' in d:
-            field_type = cls.__annotations__.get('values')
-            value = d['values']
-            
-            if field_type is bytearray:
-                obj.values = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.values = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.values = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.values = field_type.from_dict(value)
-            else:
-                obj.values = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.name = d.get('name', "")
+        obj.values = d.get('values', [])
         return obj
 
     def to_json(self, indent=2):
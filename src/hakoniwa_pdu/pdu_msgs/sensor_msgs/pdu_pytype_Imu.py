@@ -14,6 +14,8 @@ class Imu:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "orientation", "orientation_covariance", "angular_velocity", "angular_velocity_covariance", "linear_acceleration", "linear_acceleration_covariance")
+
     header: Header
     orientation: Quaternion
     orientation_covariance: List[float]
@@ -50,76 +52,16 @@ class Imu:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'orientation'
-        field_val = self.orientation
-        if isinstance(field_val, bytearray):
-            d['orientation'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['orientation'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['orientation'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['orientation'] = field_val
-        # handle field 'orientation_covariance'
+        d['header'] = self.header.to_dict()
+        d['orientation'] = self.orientation.to_dict()
         field_val = self.orientation_covariance
-        if isinstance(field_val, bytearray):
-            d['orientation_covariance'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['orientation_covariance'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['orientation_covariance'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['orientation_covariance'] = field_val
-        # handle field 'angular_velocity'
-        field_val = self.angular_velocity
-        if isinstance(field_val, bytearray):
-            d['angular_velocity'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['angular_velocity'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['angular_velocity'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['angular_velocity'] = field_val
-        # handle field 'angular_velocity_covariance'
+        d['orientation_covariance'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['angular_velocity'] = self.angular_velocity.to_dict()
         field_val = self.angular_velocity_covariance
-        if isinstance(field_val, bytearray):
-            d['angular_velocity_covariance'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['angular_velocity_covariance'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['angular_velocity_covariance'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['angular_velocity_covariance'] = field_val
-        # handle field 'linear_acceleration'
-        field_val = self.linear_acceleration
-        if isinstance(field_val, bytearray):
-            d['linear_acceleration'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['linear_acceleration'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['linear_acceleration'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['linear_acceleration'] = field_val
-        # handle field 'linear_acceleration_covariance'
+        d['angular_velocity_covariance'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['linear_acceleration'] = self.linear_acceleration.to_dict()
         field_val = self.linear_acceleration_covariance
-        if isinstance(field_val, bytearray):
-            d['linear_acceleration_covariance'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['linear_acceleration_covariance'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['linear_acceleration_covariance'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['linear_acceleration_covariance'] = field_val
+        d['linear_acceleration_covariance'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -127,126 +69,15 @@ class Imu:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'orientation'
-        if 'orientation' in d:
-            field_type = cls.__annotations__.get('orientation')
-            value = d['orientation']
-            
-            if field_type is bytearray:
-                obj.orientation = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.orientation = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.orientation = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.orientation = field_type.from_dict(value)
-            else:
-                obj.orientation = value
-        # handle field 'orientation_covariance'
-        if 'orientation_covariance' in d:
-            field_type = cls.__annotations__.get('orientation_covariance')
-            value = d['orientation_covariance']
-            
-            if field_type is bytearray:
-                obj.orientation_covariance = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.orientation_covariance = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.orientation_covariance = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.orientation_covariance = field_type.from_dict(value)
-            else:
-                obj.orientation_covariance = value
-        # handle field 'angular_velocity'
-        if 'angular_velocity' in d:
-            field_type = cls.__annotations__.get('angular_velocity')
-            value = d['angular_velocity']
-            
-            if field_type is bytearray:
-                obj.angular_velocity = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.angular_velocity = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.angular_velocity = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.angular_velocity = field_type.from_dict(value)
-            else:
-                obj.angular_velocity = value
-        # handle field 'angular_velocity_covariance'
-        if 'angular_velocity_covariance' in d:
-            field_type = cls.__annotations__.get('angular_velocity_covariance')
-            value = d['angular_velocity_covariance']
-            
-            if field_type is bytearray:
-                obj.angular_velocity_covariance = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.angular_velocity_covariance = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.angular_velocity_covariance = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.angular_velocity_covariance = field_type.from_dict(value)
-            else:
-                obj.angular_velocity_covariance = value
-        # handle field 'linear_acceleration'
-        if 'linear_acceleration' in d:
-            field_type = cls.__annotations__.get('linear_acceleration')
-            value = d['linear_acceleration']
-            
-            if field_type is bytearray:
-                obj.linear_acceleration = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.linear_acceleration = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.linear_acceleration = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.linear_acceleration = field_type.from_dict(value)
-            else:
-                obj.linear_acceleration = value
-        # handle field 'linear_acceleration_covariance'
-        if 'linear_acceleration_covariance' in d:
-            field_type = cls.__annotations__.get('linear_acceleration_covariance')
-            value = d['linear_acceleration_covariance']
-            
-            if field_type is bytearray:
-                obj.linear_acceleration_covariance = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.linear_acceleration_covariance = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.linear_acceleration_covariance = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.linear_acceleration_covariance = field_type.from_dict(value)
-            else:
-                obj.linear_acceleration_covariance = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.orientation = Quaternion.from_dict(d['orientation']) if 'orientation' in d else Quaternion()
+        obj.orientation_covariance = d.get('orientation_covariance', [])
+        obj.angular_velocity = Vector3.from_dict(d['angular_velocity']) if 'angular_velocity' in d else Vector3()
+        obj.angular_velocity_covariance = d.get('angular_velocity_covariance', [])
+        obj.linear_acceleration = Vector3.from_dict(d['linear_acceleration']) if 'linear_acceleration' in d else Vector3()
+        obj.linear_acceleration_covariance = d.get('linear_acceleration_covariance', [])
         return obj
 
     def to_json(self, indent=2):
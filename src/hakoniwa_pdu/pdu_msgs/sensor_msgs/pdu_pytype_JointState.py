@@ -12,6 +12,8 @@ class JointState:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "name", "position", "velocity", "effort")
+
     header: Header
     name: List[str]
     position: List[float]
@@ -42,56 +44,15 @@ class JointState:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'name'
+        d['header'] = self.header.to_dict()
         field_val = self.name
-        if isinstance(field_val, bytearray):
-            d['name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['name'] = field_val
-        # handle field 'position'
+        d['name'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.position
-        if isinstance(field_val, bytearray):
-            d['position'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['position'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['position'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['position'] = field_val
-        # handle field 'velocity'
+        d['position'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.velocity
-        if isinstance(field_val, bytearray):
-            d['velocity'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['velocity'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['velocity'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['velocity'] = field_val
-        # handle field 'effort'
+        d['velocity'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.effort
-        if isinstance(field_val, bytearray):
-            d['effort'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['effort'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['effort'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['effort'] = field_val
+        d['effort'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -99,92 +60,13 @@ class JointState:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'name'
-        if 'name' in d:
-            field_type = cls.__annotations__.get('name')
-            value = d['name']
-            
-            if field_type is bytearray:
-                obj.name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.name = field_type.from_dict(value)
-            else:
-                obj.name = value
-        # handle field 'position'
-        if 'position' in d:
-            field_type = cls.__annotations__.get('position')
-            value = d['position']
-            
-            if field_type is bytearray:
-                obj.position = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.position = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.position = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.position = field_type.from_dict(value)
-            else:
-                obj.position = value
-        # handle field 'velocity'
-        if 'velocity' in d:
-            field_type = cls.__annotations__.get('velocity')
-            value = d['velocity']
-            
-            if field_type is bytearray:
-                obj.velocity = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.velocity = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.velocity = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.velocity = field_type.from_dict(value)
-            else:
-                obj.velocity = value
-        # handle field 'effort'
-        if 'effort' in d:
-            field_type = cls.__annotations__.get('effort')
-            value = d['effort']
-            
-            if field_type is bytearray:
-                obj.effort = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.effort = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.effort = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.effort = field_type.from_dict(value)
-            else:
-                obj.effort = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.name = d.get('name', [])
+        obj.position = d.get('position', [])
+        obj.velocity = d.get('velocity', [])
+        obj.effort = d.get('effort', [])
         return obj
 
     def to_json(self, indent=2):
@@ -12,6 +12,8 @@ class Joy:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "axes", "buttons")
+
     header: Header
     axes: List[float]
     buttons: List[int]
@@ -36,36 +38,11 @@ class Joy:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'axes'
+        d['header'] = self.header.to_dict()
         field_val = self.axes
-        if isinstance(field_val, bytearray):
-            d['axes'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['axes'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['axes'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['axes'] = field_val
-        # handle field 'buttons'
+        d['axes'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.buttons
-        if isinstance(field_val, bytearray):
-            d['buttons'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['buttons'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['buttons'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['buttons'] = field_val
+        d['buttons'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -73,58 +50,11 @@ class Joy:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'axes'
-        if 'axes' in d:
-            field_type = cls.__annotations__.get('axes')
-            value = d['axes']
-            
-            if field_type is bytearray:
-                obj.axes = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.axes = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.axes = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.axes = field_type.from_dict(value)
-            else:
-                obj.axes = value
-        # handle field 'buttons'
-        if 'buttons' in d:
-            field_type = cls.__annotations__.get('buttons')
-            value = d['buttons']
-            
-            if field_type is bytearray:
-                obj.buttons = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.buttons = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.buttons = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.buttons = field_type.from_dict(value)
-            else:
-                obj.buttons = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.axes = d.get('axes', [])
+        obj.buttons = d.get('buttons', [])
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class JoyFeedback:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("type", "id", "intensity")
+
     type: int
     id: int
     intensity: float
@@ -34,36 +36,9 @@ class JoyFeedback:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'type'
-        field_val = self.type
-        if isinstance(field_val, bytearray):
-            d['type'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['type'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['type'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['type'] = field_val
-        # handle field 'id'
-        field_val = self.id
-        if isinstance(field_val, bytearray):
-            d['id'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['id'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['id'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['id'] = field_val
-        # handle field 'intensity'
-        field_val = self.intensity
-        if isinstance(field_val, bytearray):
-            d['intensity'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['intensity'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['intensity'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['intensity'] = field_val
+        d['type'] = self.type
+        d['id'] = self.id
+        d['intensity'] = self.intensity
         return d
 
     @classmethod
@@ -71,58 +46,11 @@ class JoyFeedback:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'type'
-        if 'type' in d:
-            field_type = cls.__annotations__.get('type')
-            value = d['type']
-            
-            if field_type is bytearray:
-                obj.type = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.type = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.type = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.type = field_type.from_dict(value)
-            else:
-                obj.type = value
-        # handle field 'id'
-        if 'id' in d:
-            field_type = cls.__annotations__.get('id')
-            value = d['id']
-            
-            if field_type is bytearray:
-                obj.id = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.id = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.id = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.id = field_type.from_dict(value)
-            else:
-                obj.id = value
-        # handle field 'intensity'
-        if 'intensity' in d:
-            field_type = cls.__annotations__.get('intensity')
-            value = d['intensity']
-            
-            if field_type is bytearray:
-                obj.intensity = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.intensity = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.intensity = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.intensity = field_type.from_dict(value)
-            else:
-                obj.intensity = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.type = d.get('type', 0)
+        obj.id = d.get('id', 0)
+        obj.intensity = d.get('intensity', 0.0)
         return obj
 
     def to_json(self, indent=2):
@@ -11,6 +11,8 @@ class JoyFeedbackArray:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("array",)
+
     array: List[JoyFeedback]
 
     def __init__(self):
@@ -29,16 +31,7 @@ class JoyFeedbackArray:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'array'
-        field_val = self.array
-        if isinstance(field_val, bytearray):
-            d['array'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['array'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['array'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['array'] = field_val
+        d['array'] = [item.to_dict() for item in self.array]
         return d
 
     @classmethod
@@ -46,24 +39,9 @@ class JoyFeedbackArray:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'array'
-        if 'array' in d:
-            field_type = cls.__annotations__.get('array')
-            value = d['array']
-            
-            if field_type is bytearray:
-                obj.array = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.array = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.array = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.array = field_type.from_dict(value)
-            else:
-                obj.array = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.array = [JoyFeedback.from_dict(item) for item in d['array']] if 'array' in d else []
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class LaserEcho:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("echoes",)
+
     echoes: List[float]
 
     def __init__(self):
@@ -28,16 +30,8 @@ class LaserEcho:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'echoes'
         field_val = self.echoes
-        if isinstance(field_val, bytearray):
-            d['echoes'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['echoes'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['echoes'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['echoes'] = field_val
+        d['echoes'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -45,24 +39,9 @@ class LaserEcho:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'echoes'
-        if 'echoes' in d:
-            field_type = cls.__annotations__.get('echoes')
-            value = d['echoes']
-            
-            if field_type is bytearray:
-                obj.echoes = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.echoes = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.echoes = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.echoes = field_type.from_dict(value)
-            else:
-                obj.echoes = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.echoes = d.get('echoes', [])
         return obj
 
     def to_json(self, indent=2):
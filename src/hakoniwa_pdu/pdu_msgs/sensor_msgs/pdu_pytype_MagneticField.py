@@ -13,6 +13,8 @@ class MagneticField:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "magnetic_field", "magnetic_field_covariance")
+
     header: Header
     magnetic_field: Vector3
     magnetic_field_covariance: List[float]
@@ -37,36 +39,10 @@ class MagneticField:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'magnetic_field'
-        field_val = self.magnetic_field
-        if isinstance(field_val, bytearray):
-            d['magnetic_field'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['magnetic_field'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['magnetic_field'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['magnetic_field'] = field_val
-        # handle field 'magnetic_field_covariance'
+        d['header'] = self.header.to_dict()
+        d['magnetic_field'] = self.magnetic_field.to_dict()
         field_val = self.magnetic_field_covariance
-        if isinstance(field_val, bytearray):
-            d['magnetic_field_covariance'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['magnetic_field_covariance'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['magnetic_field_covariance'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['magnetic_field_covariance'] = field_val
+        d['magnetic_field_covariance'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -74,58 +50,11 @@ class MagneticField:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'magnetic_field'
-        if 'magnetic_field' in d:
-            field_type = cls.__annotations__.get('magnetic_field')
-            value = d['magnetic_field']
-            
-            if field_type is bytearray:
-                obj.magnetic_field = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.magnetic_field = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.magnetic_field = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.magnetic_field = field_type.from_dict(value)
-            else:
-                obj.magnetic_field = value
-        # handle field 'magnetic_field_covariance'
-        if 'magnetic_field_covariance' in d:
-            field_type = cls.__annotations__.get('magnetic_field_covariance')
-            value = d['magnetic_field_covariance']
-            
-            if field_type is bytearray:
-                obj.magnetic_field_covariance = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.magnetic_field_covariance = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.magnetic_field_covariance = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.magnetic_field_covariance = field_type.from_dict(value)
-            else:
-                obj.magnetic_field_covariance = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.magnetic_field = Vector3.from_dict(d['magnetic_field']) if 'magnetic_field' in d else Vector3()
+        obj.magnetic_field_covariance = d.get('magnetic_field_covariance', [])
         return obj
 
     def to_json(self, indent=2):
@@ -17,6 +17,8 @@ class MultiDOFJointState:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "joint_names", "transforms", "twist", "wrench")
+
     header: Header
     joint_names: List[str]
     transforms: List[Transform]
@@ -47,56 +49,12 @@ class MultiDOFJointState:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'joint_names'
+        d['header'] = self.header.to_dict()
         field_val = self.joint_names
-        if isinstance(field_val, bytearray):
-            d['joint_names'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['joint_names'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['joint_names'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['joint_names'] = field_val
-        # handle field 'transforms'
-        field_val = self.transforms
-        if isinstance(field_val, bytearray):
-            d['transforms'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['transforms'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['transforms'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['transforms'] = field_val
-        # handle field 'twist'
-        field_val = self.twist
-        if isinstance(field_val, bytearray):
-            d['twist'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['twist'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['twist'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['twist'] = field_val
-        # handle field 'wrench'
-        field_val = self.wrench
-        if isinstance(field_val, bytearray):
-            d['wrench'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['wrench'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['wrench'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['wrench'] = field_val
+        d['joint_names'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['transforms'] = [item.to_dict() for item in self.transforms]
+        d['twist'] = [item.to_dict() for item in self.twist]
+        d['wrench'] = [item.to_dict() for item in self.wrench]
         return d
 
     @classmethod
@@ -104,92 +62,13 @@ class MultiDOFJointState:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'joint_names'
-        if 'joint_names' in d:
-            field_type = cls.__annotations__.get('joint_names')
-            value = d['joint_names']
-            
-            if field_type is bytearray:
-                obj.joint_names = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.joint_names = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.joint_names = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.joint_names = field_type.from_dict(value)
-            else:
-                obj.joint_names = value
-        # handle field 'transforms'
-        if 'transforms' in d:
-            field_type = cls.__annotations__.get('transforms')
-            value = d['transforms']
-            
-            if field_type is bytearray:
-                obj.transforms = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.transforms = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.transforms = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.transforms = field_type.from_dict(value)
-            else:
-                obj.transforms = value
-        # handle field 'twist'
-        if 'twist' in d:
-            field_type = cls.__annotations__.get('twist')
-            value = d['twist']
-            
-            if field_type is bytearray:
-                obj.twist = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.twist = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.twist = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.twist = field_type.from_dict(value)
-            else:
-                obj.twist = value
-        # handle field 'wrench'
-        if 'wrench' in d:
-            field_type = cls.__annotations__.get('wrench')
-            value = d['wrench']
-            
-            if field_type is bytearray:
-                obj.wrench = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.wrench = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.wrench = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.wrench = field_type.from_dict(value)
-            else:
-                obj.wrench = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.joint_names = d.get('joint_names', [])
+        obj.transforms = [Transform.from_dict(item) for item in d['transforms']] if 'transforms' in d else []
+        obj.twist = [Twist.from_dict(item) for item in d['twist']] if 'twist' in d else []
+        obj.wrench = [Wrench.from_dict(item) for item in d['wrench']] if 'wrench' in d else []
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class NavSatStatus:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("status", "service")
+
     status: int
     service: int
 
@@ -31,26 +33,8 @@ class NavSatStatus:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'status'
-        field_val = self.status
-        if isinstance(field_val, bytearray):
-            d['status'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['status'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['status'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['status'] = field_val
-        # handle field 'service'
-        field_val = self.service
-        if isinstance(field_val, bytearray):
-            d['service'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['service'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['service'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['service'] = field_val
+        d['status'] = self.status
+        d['service'] = self.service
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class NavSatStatus:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'status'
-        if 'status' in d:
-            field_type = cls.__annotations__.get('status')
-            value = d['status']
-            
-            if field_type is bytearray:
-                obj.status = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.status = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.status = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.status = field_type.from_dict(value)
-            else:
-                obj.status = value
-        # handle field 'service'
-        if 'service' in d:
-            field_type = cls.__annotations__.get('service')
-            value = d['service']
-            
-            if field_type is bytearray:
-                obj.service = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.service = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.service = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.service = field_type.from_dict(value)
-            else:
-                obj.service = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.status = d.get('status', 0)
+        obj.service = d.get('service', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -14,6 +14,8 @@ class PointCloud:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "points", "channels")
+
     header: Header
     points: List[Point32]
     channels: List[ChannelFloat32]
@@ -38,36 +40,9 @@ class PointCloud:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'points'
-        field_val = self.points
-        if isinstance(field_val, bytearray):
-            d['points'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['points'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['points'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['points'] = field_val
-        # handle field 'channels'
-        field_val = self.channels
-        if isinstance(field_val, bytearray):
-            d['channels'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['channels'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['channels'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['channels'] = field_val
+        d['header'] = self.header.to_dict()
+        d['points'] = [item.to_dict() for item in self.points]
+        d['channels'] = [item.to_dict() for item in self.channels]
         return d
 
     @classmethod
@@ -75,58 +50,11 @@ class PointCloud:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'points'
-        if 'points' in d:
-            field_type = cls.__annotations__.get('points')
-            value = d['points']
-            
-            if field_type is bytearray:
-                obj.points = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.points = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.points = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.points = field_type.from_dict(value)
-            else:
-                obj.points = value
-        # handle field 'channels'
-        if 'channels' in d:
-            field_type = cls.__annotations__.get('channels')
-            value = d['channels']
-            
-            if field_type is bytearray:
-                obj.channels = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.channels = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.channels = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.channels = field_type.from_dict(value)
-            else:
-                obj.channels = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.points = [Point32.from_dict(item) for item in d['points']] if 'points' in d else []
+        obj.channels = [ChannelFloat32.from_dict(item) for item in d['channels']] if 'channels' in d else []
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class PointField:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("name", "offset", "datatype", "count")
+
     name: str
     offset: int
     datatype: int
@@ -37,46 +39,10 @@ class PointField:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'name'
-        field_val = self.name
-        if isinstance(field_val, bytearray):
-            d['name'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['name'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['name'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['name'] = field_val
-        # handle field 'offset'
-        field_val = self.offset
-        if isinstance(field_val, bytearray):
-            d['offset'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['offset'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['offset'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['offset'] = field_val
-        # handle field 'datatype'
-        field_val = self.datatype
-        if isinstance(field_val, bytearray):
-            d['datatype'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['datatype'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['datatype'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['datatype'] = field_val
-        # handle field 'count'
-        field_val = self.count
-        if isinstance(field_val, bytearray):
-            d['count'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['count'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['count'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['count'] = field_val
+        d['name'] = self.name
+        d['offset'] = self.offset
+        d['datatype'] = self.datatype
+        d['count'] = self.count
         return d
 
     @classmethod
@@ -84,75 +50,12 @@ class PointField:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'name'
-        if 'name' in d:
-            field_type = cls.__annotations__.get('name')
-            value = d['name']
-            
-            if field_type is bytearray:
-                obj.name = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.name = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.name = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.name = field_type.from_dict(value)
-            else:
-                obj.name = value
-        # handle field 'offset'
-        if 'offset' in d:
-            field_type = cls.__annotations__.get('offset')
-            value = d['offset']
-            
-            if field_type is bytearray:
-                obj.offset = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.offset = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.offset = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.offset = field_type.from_dict(value)
-            else:
-                obj.offset = value
-        # handle field 'datatype'
-        if 'datatype' in d:
-            field_type = cls.__annotations__.get('datatype')
-            value = d['datatype']
-            
-            if field_type is bytearray:
-                obj.datatype = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.datatype = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.datatype = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.datatype = field_type.from_dict(value)
-            else:
-                obj.datatype = value
-        # handle field 'count'
-        if 'count' in d:
-            field_type = cls.__annotations__.get('count')
-            value = d['count']
-            
-            if field_type is bytearray:
-                obj.count = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.count = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.count = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.count = field_type.from_dict(value)
-            else:
-                obj.count = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.name = d.get('name', "")
+        obj.offset = d.get('offset', 0)
+        obj.datatype = d.get('datatype', 0)
+        obj.count = d.get('count', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -12,6 +12,8 @@ class Range:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "radiation_type", "field_of_view", "min_range", "max_range", "range", "variance")
+
     header: Header
     radiation_type: int
     field_of_view: float
@@ -48,76 +50,13 @@ class Range:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'radiation_type'
-        field_val = self.radiation_type
-        if isinstance(field_val, bytearray):
-            d['radiation_type'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['radiation_type'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['radiation_type'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['radiation_type'] = field_val
-        # handle field 'field_of_view'
-        field_val = self.field_of_view
-        if isinstance(field_val, bytearray):
-            d['field_of_view'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['field_of_view'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['field_of_view'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['field_of_view'] = field_val
-        # handle field 'min_range'
-        field_val = self.min_range
-        if isinstance(field_val, bytearray):
-            d['min_range'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['min_range'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['min_range'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['min_range'] = field_val
-        # handle field 'max_range'
-        field_val = self.max_range
-        if isinstance(field_val, bytearray):
-            d['max_range'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['max_range'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['max_range'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['max_range'] = field_val
-        # handle field 'range'
-        field_val = self.range
-        if isinstance(field_val, bytearray):
-            d['range'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['range'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['range'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['range'] = field_val
-        # handle field 'variance'
-        field_val = self.variance
-        if isinstance(field_val, bytearray):
-            d['variance'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['variance'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['variance'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['variance'] = field_val
+        d['header'] = self.header.to_dict()
+        d['radiation_type'] = self.radiation_type
+        d['field_of_view'] = self.field_of_view
+        d['min_range'] = self.min_range
+        d['max_range'] = self.max_range
+        d['range'] = self.range
+        d['variance'] = self.variance
         return d
 
     @classmethod
@@ -125,126 +64,15 @@ class Range:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'radiation_type'
-        if 'radiation_type' in d:
-            field_type = cls.__annotations__.get('radiation_type')
-            value = d['radiation_type']
-            
-            if field_type is bytearray:
-                obj.radiation_type = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.radiation_type = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.radiation_type = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.radiation_type = field_type.from_dict(value)
-            else:
-                obj.radiation_type = value
-        # handle field 'field_of_view'
-        if 'field_of_view' in d:
-            field_type = cls.__annotations__.get('field_of_view')
-            value = d['field_of_view']
-            
-            if field_type is bytearray:
-                obj.field_of_view = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.field_of_view = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.field_of_view = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.field_of_view = field_type.from_dict(value)
-            else:
-                obj.field_of_view = value
-        # handle field 'min_range'
-        if 'min_range' in d:
-            field_type = cls.__annotations__.get('min_range')
-            value = d['min_range']
-            
-            if field_type is bytearray:
-                obj.min_range = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.min_range = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.min_range = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.min_range = field_type.from_dict(value)
-            else:
-                obj.min_range = value
-        # handle field 'max_range'
-        if 'max_range' in d:
-            field_type = cls.__annotations__.get('max_range')
-            value = d['max_range']
-            
-            if field_type is bytearray:
-                obj.max_range = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.max_range = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.max_range = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.max_range = field_type.from_dict(value)
-            else:
-                obj.max_range = value
-        # handle field 'range'
-        if 'range' in d:
-            field_type = cls.__annotations__.get('range')
-            value = d['range']
-            
-            if field_type is bytearray:
-                obj.range = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.range = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.range = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.range = field_type.from_dict(value)
-            else:
-                obj.range = value
-        # handle field 'variance'
-        if 'variance' in d:
-            field_type = cls.__annotations__.get('variance')
-            value = d['variance']
-            
-            if field_type is bytearray:
-                obj.variance = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.variance = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.variance = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.variance = field_type.from_dict(value)
-            else:
-                obj.variance = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.radiation_type = d.get('radiation_type', 0)
+        obj.field_of_view = d.get('field_of_view', 0.0)
+        obj.min_range = d.get('min_range', 0.0)
+        obj.max_range = d.get('max_range', 0.0)
+        obj.range = d.get('range', 0.0)
+        obj.variance = d.get('variance', 0.0)
         return obj
 
     def to_json(self, indent=2):
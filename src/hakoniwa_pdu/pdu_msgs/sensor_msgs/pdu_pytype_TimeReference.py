@@ -12,6 +12,8 @@ class TimeReference:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "time_ref", "source")
+
     header: Header
     time_ref: Time
     source: str
@@ -36,36 +38,9 @@ class TimeReference:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'time_ref'
-        field_val = self.time_ref
-        if isinstance(field_val, bytearray):
-            d['time_ref'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['time_ref'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['time_ref'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['time_ref'] = field_val
-        # handle field 'source'
-        field_val = self.source
-        if isinstance(field_val, bytearray):
-            d['source'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['source'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['source'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['source'] = field_val
+        d['header'] = self.header.to_dict()
+        d['time_ref'] = self.time_ref.to_dict()
+        d['source'] = self.source
         return d
 
     @classmethod
@@ -73,58 +48,11 @@ class TimeReference:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'time_ref'
-        if 'time_ref' in d:
-            field_type = cls.__annotations__.get('time_ref')
-            value = d['time_ref']
-            
-            if field_type is bytearray:
-                obj.time_ref = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.time_ref = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.time_ref = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.time_ref = field_type.from_dict(value)
-            else:
-                obj.time_ref = value
-        # handle field 'source'
-        if 'source' in d:
-            field_type = cls.__annotations__.get('source')
-            value = d['source']
-            
-            if field_type is bytearray:
-                obj.source = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.source = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.source = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.source = field_type.from_dict(value)
-            else:
-                obj.source = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.time_ref = Time.from_dict(d['time_ref']) if 'time_ref' in d else Time()
+        obj.source = d.get('source', "")
         return obj
 
     def to_json(self, indent=2):
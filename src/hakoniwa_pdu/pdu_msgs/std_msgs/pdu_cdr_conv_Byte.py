@@ -1,5 +1,6 @@
 from .pdu_pytype_Byte import Byte
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_Byte(reader: CdrReader, dst: Byte):
 
 
 def py_to_cdr_Byte(src: Byte) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/Byte"])
     writer.write_encapsulation()
     py_to_cdr_body_Byte(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_ByteMultiArray import ByteMultiArray
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_MultiArrayDimension import *
 from ..std_msgs.pdu_cdr_conv_MultiArrayLayout import *
@@ -9,18 +10,18 @@ from ..std_msgs.pdu_cdr_conv_MultiArrayLayout import *
 def py_to_cdr_body_ByteMultiArray(writer: CdrWriter, src: ByteMultiArray):
     py_to_cdr_body_MultiArrayLayout(writer, src.layout)
     writer.write_sequence_length(src.data)
-    for elem in src.data:
-        writer.write_uint8(elem)
+    writer.write_sequence("B", src.data)
 
 
 def cdr_body_to_py_ByteMultiArray(reader: CdrReader, dst: ByteMultiArray):
     cdr_body_to_py_MultiArrayLayout(reader, dst.layout)
-    dst.data = [reader.read_uint8() for _ in range(reader.read_uint32())]
+    dst.data = reader.read_sequence("B", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_ByteMultiArray(src: ByteMultiArray) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/ByteMultiArray"])
     writer.write_encapsulation()
     py_to_cdr_body_ByteMultiArray(writer, src)
     return writer.bytes()
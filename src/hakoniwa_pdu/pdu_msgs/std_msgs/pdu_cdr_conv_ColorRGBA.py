@@ -1,26 +1,25 @@
 from .pdu_pytype_ColorRGBA import ColorRGBA
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("ffff")  # r, g, b, a
+
 
 def py_to_cdr_body_ColorRGBA(writer: CdrWriter, src: ColorRGBA):
-    writer.write_float32(src.r)
-    writer.write_float32(src.g)
-    writer.write_float32(src.b)
-    writer.write_float32(src.a)
+    writer.write_run(_CDR_RUN_0, (src.r, src.g, src.b, src.a))
 
 
 def cdr_body_to_py_ColorRGBA(reader: CdrReader, dst: ColorRGBA):
-    dst.r = reader.read_float32()
-    dst.g = reader.read_float32()
-    dst.b = reader.read_float32()
-    dst.a = reader.read_float32()
+    dst.r, dst.g, dst.b, dst.a = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_ColorRGBA(src: ColorRGBA) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/ColorRGBA"])
     writer.write_encapsulation()
     py_to_cdr_body_ColorRGBA(writer, src)
     return writer.bytes()
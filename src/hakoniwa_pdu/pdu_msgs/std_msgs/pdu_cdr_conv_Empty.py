@@ -1,5 +1,6 @@
 from .pdu_pytype_Empty import Empty
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_Empty(reader: CdrReader, dst: Empty):
 
 
 def py_to_cdr_Empty(src: Empty) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/Empty"])
     writer.write_encapsulation()
     py_to_cdr_body_Empty(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_Float64 import Float64
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_Float64(reader: CdrReader, dst: Float64):
 
 
 def py_to_cdr_Float64(src: Float64) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/Float64"])
     writer.write_encapsulation()
     py_to_cdr_body_Float64(writer, src)
     return writer.bytes()
@@ -1,23 +1,28 @@
 from .pdu_pytype_Header import Header
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..builtin_interfaces.pdu_cdr_conv_Time import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iI")  # stamp.sec, stamp.nanosec
+
 
 def py_to_cdr_body_Header(writer: CdrWriter, src: Header):
-    py_to_cdr_body_Time(writer, src.stamp)
+    writer.write_run(_CDR_RUN_0, (src.stamp.sec, src.stamp.nanosec))
     writer.write_string(src.frame_id)
 
 
 def cdr_body_to_py_Header(reader: CdrReader, dst: Header):
-    cdr_body_to_py_Time(reader, dst.stamp)
+    dst.stamp.sec, dst.stamp.nanosec = reader.read_run(_CDR_RUN_0)
     dst.frame_id = reader.read_string()
     return dst
 
 
 def py_to_cdr_Header(src: Header) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/Header"])
     writer.write_encapsulation()
     py_to_cdr_body_Header(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_Int32 import Int32
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_Int32(reader: CdrReader, dst: Int32):
 
 
 def py_to_cdr_Int32(src: Int32) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/Int32"])
     writer.write_encapsulation()
     py_to_cdr_body_Int32(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_Int64 import Int64
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_Int64(reader: CdrReader, dst: Int64):
 
 
 def py_to_cdr_Int64(src: Int64) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/Int64"])
     writer.write_encapsulation()
     py_to_cdr_body_Int64(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_Int8MultiArray import Int8MultiArray
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_MultiArrayDimension import *
 from ..std_msgs.pdu_cdr_conv_MultiArrayLayout import *
@@ -9,18 +10,18 @@ from ..std_msgs.pdu_cdr_conv_MultiArrayLayout import *
 def py_to_cdr_body_Int8MultiArray(writer: CdrWriter, src: Int8MultiArray):
     py_to_cdr_body_MultiArrayLayout(writer, src.layout)
     writer.write_sequence_length(src.data)
-    for elem in src.data:
-        writer.write_int8(elem)
+    writer.write_sequence("b", src.data)
 
 
 def cdr_body_to_py_Int8MultiArray(reader: CdrReader, dst: Int8MultiArray):
     cdr_body_to_py_MultiArrayLayout(reader, dst.layout)
-    dst.data = [reader.read_int8() for _ in range(reader.read_uint32())]
+    dst.data = reader.read_sequence("b", reader.read_uint32())
     return dst
 
 
 def py_to_cdr_Int8MultiArray(src: Int8MultiArray) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/Int8MultiArray"])
     writer.write_encapsulation()
     py_to_cdr_body_Int8MultiArray(writer, src)
     return writer.bytes()
@@ -1,24 +1,27 @@
 from .pdu_pytype_MultiArrayDimension import MultiArrayDimension
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("II")  # size, stride
+
 
 def py_to_cdr_body_MultiArrayDimension(writer: CdrWriter, src: MultiArrayDimension):
     writer.write_string(src.label)
-    writer.write_uint32(src.size)
-    writer.write_uint32(src.stride)
+    writer.write_run(_CDR_RUN_0, (src.size, src.stride))
 
 
 def cdr_body_to_py_MultiArrayDimension(reader: CdrReader, dst: MultiArrayDimension):
     dst.label = reader.read_string()
-    dst.size = reader.read_uint32()
-    dst.stride = reader.read_uint32()
+    dst.size, dst.stride = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_MultiArrayDimension(src: MultiArrayDimension) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/MultiArrayDimension"])
     writer.write_encapsulation()
     py_to_cdr_body_MultiArrayDimension(writer, src)
     return writer.bytes()
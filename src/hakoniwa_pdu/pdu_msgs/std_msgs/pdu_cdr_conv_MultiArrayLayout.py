@@ -1,5 +1,6 @@
 from .pdu_pytype_MultiArrayLayout import MultiArrayLayout
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_MultiArrayDimension import *
 
@@ -23,7 +24,8 @@ def cdr_body_to_py_MultiArrayLayout(reader: CdrReader, dst: MultiArrayLayout):
 
 
 def py_to_cdr_MultiArrayLayout(src: MultiArrayLayout) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/MultiArrayLayout"])
     writer.write_encapsulation()
     py_to_cdr_body_MultiArrayLayout(writer, src)
     return writer.bytes()
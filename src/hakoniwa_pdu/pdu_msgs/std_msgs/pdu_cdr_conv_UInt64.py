@@ -1,5 +1,6 @@
 from .pdu_pytype_UInt64 import UInt64
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_UInt64(reader: CdrReader, dst: UInt64):
 
 
 def py_to_cdr_UInt64(src: UInt64) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/UInt64"])
     writer.write_encapsulation()
     py_to_cdr_body_UInt64(writer, src)
     return writer.bytes()
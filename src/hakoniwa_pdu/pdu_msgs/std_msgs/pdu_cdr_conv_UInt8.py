@@ -1,5 +1,6 @@
 from .pdu_pytype_UInt8 import UInt8
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -14,7 +15,8 @@ def cdr_body_to_py_UInt8(reader: CdrReader, dst: UInt8):
 
 
 def py_to_cdr_UInt8(src: UInt8) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["std_msgs/UInt8"])
     writer.write_encapsulation()
     py_to_cdr_body_UInt8(writer, src)
     return writer.bytes()
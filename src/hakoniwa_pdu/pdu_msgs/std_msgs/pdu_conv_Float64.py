@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<d")  # data
 
-def pdu_to_py_Float64(binary_data: bytearray) -> Float64:
-    py_obj = Float64()
+
+def pdu_to_py_Float64(binary_data: bytearray, out: Float64 = None, array_mode: str = None) -> Float64:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Float64() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Float64(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -26,40 +32,18 @@ def binary_read_recursive_Float64(meta: binary_io.PduMetaData, binary_data: byte
     # offset: 0 size: 8 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 0, 8)
-    py_obj.data = binary_io.binTovalue("float64", bin)
+    py_obj.data = _RUN_0.unpack_from(binary_data, base_off + 0)[0]
     
     return py_obj
 
 
-def py_to_pdu_Float64(py_obj: Float64) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Float64(py_obj: Float64, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Float64(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Float64(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Float64):
     # array_type: single 
@@ -68,13 +52,8 @@ def binary_write_recursive_Float64(parent_off: int, bw_container: BinaryWriterCo
     # type_name: float64 
     # offset: 0 size: 8 
     # array_len: 1
-    type = "float64"
-    off = 0
 
-    
-    bin = binary_io.typeTobin(type, py_obj.data)
-    bin = get_binary(type, bin, 8)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.data), expected_offset=parent_off + 0)
     
 
 if __name__ == "__main__":
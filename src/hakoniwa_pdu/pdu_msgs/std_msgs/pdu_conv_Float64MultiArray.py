@@ -9,12 +9,15 @@ from ..std_msgs.pdu_conv_MultiArrayLayout import *
 
 
 
-def pdu_to_py_Float64MultiArray(binary_data: bytearray) -> Float64MultiArray:
-    py_obj = Float64MultiArray()
+def pdu_to_py_Float64MultiArray(binary_data: bytearray, out: Float64MultiArray = None, array_mode: str = None) -> Float64MultiArray:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = Float64MultiArray() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_Float64MultiArray(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -27,7 +30,7 @@ def binary_read_recursive_Float64MultiArray(meta: binary_io.PduMetaData, binary_
     # offset: 0 size: 12 
     # array_len: 1
 
-    tmp_py_obj = MultiArrayLayout()
+    tmp_py_obj = reuse_obj(py_obj.layout, MultiArrayLayout)
     binary_read_recursive_MultiArrayLayout(meta, binary_data, tmp_py_obj, base_off + 0)
     py_obj.layout = tmp_py_obj
     
@@ -41,41 +44,19 @@ def binary_read_recursive_Float64MultiArray(meta: binary_io.PduMetaData, binary_
     array_size = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 12, 4))
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 12 + 4, 4))
     one_elm_size = 8 
-    array_value = binary_io.readBinary(binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
-    
-    py_obj.data = binary_io.binToArrayValues("float64", array_value)
+    py_obj.data = read_array_values(meta, "float64", binary_data, meta.heap_off + offset_from_heap, one_elm_size * array_size)
     
     
     return py_obj
 
 
-def py_to_pdu_Float64MultiArray(py_obj: Float64MultiArray) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_Float64MultiArray(py_obj: Float64MultiArray, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_Float64MultiArray(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_Float64MultiArray(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: Float64MultiArray):
     # array_type: single 
@@ -7,13 +7,19 @@ from .. import binary_io
 # dependencies for the generated Python class
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<II")  # size, stride
 
-def pdu_to_py_MultiArrayDimension(binary_data: bytearray) -> MultiArrayDimension:
-    py_obj = MultiArrayDimension()
+
+def pdu_to_py_MultiArrayDimension(binary_data: bytearray, out: MultiArrayDimension = None, array_mode: str = None) -> MultiArrayDimension:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = MultiArrayDimension() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_MultiArrayDimension(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -36,11 +42,6 @@ def binary_read_recursive_MultiArrayDimension(meta: binary_io.PduMetaData, binar
     # type_name: uint32 
     # offset: 128 size: 4 
     # array_len: 1
-
-    
-    bin = binary_io.readBinary(binary_data, base_off + 128, 4)
-    py_obj.size = binary_io.binTovalue("uint32", bin)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: stride 
@@ -48,40 +49,18 @@ def binary_read_recursive_MultiArrayDimension(meta: binary_io.PduMetaData, binar
     # offset: 132 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 132, 4)
-    py_obj.stride = binary_io.binTovalue("uint32", bin)
+    py_obj.size, py_obj.stride = _RUN_0.unpack_from(binary_data, base_off + 128)
     
     return py_obj
 
 
-def py_to_pdu_MultiArrayDimension(py_obj: MultiArrayDimension) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_MultiArrayDimension(py_obj: MultiArrayDimension, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_MultiArrayDimension(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_MultiArrayDimension(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: MultiArrayDimension):
     # array_type: single 
@@ -104,27 +83,14 @@ def binary_write_recursive_MultiArrayDimension(parent_off: int, bw_container: Bi
     # type_name: uint32 
     # offset: 128 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 128
-
-    
-    bin = binary_io.typeTobin(type, py_obj.size)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
-    
     # array_type: single 
     # data_type: primitive 
     # member_name: stride 
     # type_name: uint32 
     # offset: 132 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 132
 
-    
-    bin = binary_io.typeTobin(type, py_obj.stride)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.size, py_obj.stride), expected_offset=parent_off + 128)
     
 
 if __name__ == "__main__":
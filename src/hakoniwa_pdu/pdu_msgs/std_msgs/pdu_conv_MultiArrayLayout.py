@@ -8,13 +8,19 @@ from .. import binary_io
 from ..std_msgs.pdu_conv_MultiArrayDimension import *
 
 
+# 隣接するプリミティブメンバは連続区間ごとに事前コンパイルした struct でまとめて読み書きする
+_RUN_0 = struct.Struct("<I")  # data_offset
 
-def pdu_to_py_MultiArrayLayout(binary_data: bytearray) -> MultiArrayLayout:
-    py_obj = MultiArrayLayout()
+
+def pdu_to_py_MultiArrayLayout(binary_data: bytearray, out: MultiArrayLayout = None, array_mode: str = None) -> MultiArrayLayout:
+    # out が指定された場合はそのオブジェクト(ネストしたオブジェクト/リストも含む)に上書きデコードする
+    py_obj = MultiArrayLayout() if out is None else out
     meta_parser = binary_io.PduMetaDataParser()
     meta = meta_parser.load_pdu_meta(binary_data)
     if meta is None:
         raise ValueError("Invalid PDU binary data: MetaData not found or corrupted")
+    # array_mode="numpy" の場合、プリミティブ配列は binary_data 上の numpy ビューとして返す
+    set_array_mode(meta, array_mode)
     binary_read_recursive_MultiArrayLayout(meta, binary_data, py_obj, binary_io.PduMetaData.PDU_META_DATA_SIZE)
     return py_obj
 
@@ -31,11 +37,10 @@ def binary_read_recursive_MultiArrayLayout(meta: binary_io.PduMetaData, binary_d
     offset_from_heap = binary_io.binTovalue("int32", binary_io.readBinary(binary_data, base_off + 0 + 4, 4))
     one_elm_size = 136
     i = 0
-    array_value = []
+    array_value = reuse_list(py_obj.dim, array_size, MultiArrayDimension)
     while i < array_size:
-        tmp_py_obj = MultiArrayDimension()
+        tmp_py_obj = array_value[i]
         binary_read_recursive_MultiArrayDimension(meta, binary_data, tmp_py_obj, meta.heap_off + offset_from_heap + (i * one_elm_size))
-        array_value.append(tmp_py_obj)
         i = i + 1
     py_obj.dim = array_value    
     
@@ -46,40 +51,18 @@ def binary_read_recursive_MultiArrayLayout(meta: binary_io.PduMetaData, binary_d
     # offset: 8 size: 4 
     # array_len: 1
 
-    
-    bin = binary_io.readBinary(binary_data, base_off + 8, 4)
-    py_obj.data_offset = binary_io.binTovalue("uint32", bin)
+    py_obj.data_offset = _RUN_0.unpack_from(binary_data, base_off + 8)[0]
     
     return py_obj
 
 
-def py_to_pdu_MultiArrayLayout(py_obj: MultiArrayLayout) -> bytearray:
-    binary_data = bytearray()
+def py_to_pdu_MultiArrayLayout(py_obj: MultiArrayLayout, out=None) -> Union[bytearray, int]:
     base_allocator = DynamicAllocator(False)
     bw_container = BinaryWriterContainer(binary_io.PduMetaData())
     binary_write_recursive_MultiArrayLayout(0, bw_container, base_allocator, py_obj)
 
-    # メタデータの設定
-    total_size = base_allocator.size() + bw_container.heap_allocator.size() + binary_io.PduMetaData.PDU_META_DATA_SIZE
-    bw_container.meta.total_size = total_size
-    bw_container.meta.heap_off = binary_io.PduMetaData.PDU_META_DATA_SIZE + base_allocator.size()
-
-    # binary_data のサイズを total_size に調整
-    if len(binary_data) < total_size:
-        binary_data.extend(bytearray(total_size - len(binary_data)))
-    elif len(binary_data) > total_size:
-        del binary_data[total_size:]
-
-    # メタデータをバッファにコピー
-    binary_io.writeBinary(binary_data, 0, bw_container.meta.to_bytes())
-
-    # 基本データをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.base_off, base_allocator.to_array())
-
-    # ヒープデータをバッファにコピー
-    binary_io.writeBinary(binary_data, bw_container.meta.heap_off, bw_container.heap_allocator.to_array())
-
-    return binary_data
+    # out が指定された場合はそのバッファに書き込み、書き込んだバイト数を返す
+    return finalize_pdu(bw_container, base_allocator, out)
 
 def binary_write_recursive_MultiArrayLayout(parent_off: int, bw_container: BinaryWriterContainer, allocator, py_obj: MultiArrayLayout):
     # array_type: varray 
@@ -107,13 +90,8 @@ def binary_write_recursive_MultiArrayLayout(parent_off: int, bw_container: Binar
     # type_name: uint32 
     # offset: 8 size: 4 
     # array_len: 1
-    type = "uint32"
-    off = 8
 
-    
-    bin = binary_io.typeTobin(type, py_obj.data_offset)
-    bin = get_binary(type, bin, 4)
-    allocator.add(bin, expected_offset=parent_off + off)
+    allocator.add(_RUN_0.pack(py_obj.data_offset), expected_offset=parent_off + 8)
     
 
 if __name__ == "__main__":
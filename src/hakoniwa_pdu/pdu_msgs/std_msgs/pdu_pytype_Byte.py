@@ -10,6 +10,8 @@ class Byte:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("data",)
+
     data: int
 
     def __init__(self):
@@ -28,16 +30,7 @@ class Byte:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'data'
-        field_val = self.data
-        if isinstance(field_val, bytearray):
-            d['data'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['data'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['data'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['data'] = field_val
+        d['data'] = self.data
         return d
 
     @classmethod
@@ -45,24 +38,9 @@ class Byte:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'data'
-        if 'data' in d:
-            field_type = cls.__annotations__.get('data')
-            value = d['data']
-            
-            if field_type is bytearray:
-                obj.data = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.data = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.data = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.data = field_type.from_dict(value)
-            else:
-                obj.data = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.data = d.get('data', 0)
         return obj
 
     def to_json(self, indent=2):
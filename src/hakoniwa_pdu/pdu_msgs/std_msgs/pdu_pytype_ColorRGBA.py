@@ -10,6 +10,8 @@ class ColorRGBA:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("r", "g", "b", "a")
+
     r: float
     g: float
     b: float
@@ -37,46 +39,10 @@ class ColorRGBA:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'r'
-        field_val = self.r
-        if isinstance(field_val, bytearray):
-            d['r'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['r'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['r'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['r'] = field_val
-        # handle field 'g'
-        field_val = self.g
-        if isinstance(field_val, bytearray):
-            d['g'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['g'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['g'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['g'] = field_val
-        # handle field 'b'
-        field_val = self.b
-        if isinstance(field_val, bytearray):
-            d['b'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['b'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['b'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['b'] = field_val
-        # handle field 'a'
-        field_val = self.a
-        if isinstance(field_val, bytearray):
-            d['a'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['a'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['a'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['a'] = field_val
+        d['r'] = self.r
+        d['g'] = self.g
+        d['b'] = self.b
+        d['a'] = self.a
         return d
 
     @classmethod
@@ -84,75 +50,12 @@ class ColorRGBA:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'r'
-        if 'r' in d:
-            field_type = cls.__annotations__.get('r')
-            value = d['r']
-            
-            if field_type is bytearray:
-                obj.r = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.r = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.r = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.r = field_type.from_dict(value)
-            else:
-                obj.r = value
-        # handle field 'g'
-        if 'g' in d:
-            field_type = cls.__annotations__.get('g')
-            value = d['g']
-            
-            if field_type is bytearray:
-                obj.g = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.g = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.g = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.g = field_type.from_dict(value)
-            else:
-                obj.g = value
-        # handle field 'b'
-        if 'b' in d:
-            field_type = cls.__annotations__.get('b')
-            value = d['b']
-            
-            if field_type is bytearray:
-                obj.b = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.b = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.b = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.b = field_type.from_dict(value)
-            else:
-                obj.b = value
-        # handle field 'a'
-        if 'a' in d:
-            field_type = cls.__annotations__.get('a')
-            value = d['a']
-            
-            if field_type is bytearray:
-                obj.a = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.a = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.a = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.a = field_type.from_dict(value)
-            else:
-                obj.a = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.r = d.get('r', 0.0)
+        obj.g = d.get('g', 0.0)
+        obj.b = d.get('b', 0.0)
+        obj.a = d.get('a', 0.0)
         return obj
 
     def to_json(self, indent=2):
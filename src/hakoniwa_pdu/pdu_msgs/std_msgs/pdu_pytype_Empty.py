@@ -10,8 +10,11 @@ class Empty:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ()
+
 
     def __init__(self):
+        pass
 
     def __str__(self):
         return f"Empty(" + ", ".join([
@@ -32,7 +35,8 @@ class Empty:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
         return obj
 
     def to_json(self, indent=2):
@@ -12,6 +12,8 @@ class Int16MultiArray:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("layout", "data")
+
     layout: MultiArrayLayout
     data: List[int]
 
@@ -33,26 +35,9 @@ class Int16MultiArray:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'layout'
-        field_val = self.layout
-        if isinstance(field_val, bytearray):
-            d['layout'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['layout'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['layout'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['layout'] = field_val
-        # handle field 'data'
+        d['layout'] = self.layout.to_dict()
         field_val = self.data
-        if isinstance(field_val, bytearray):
-            d['data'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['data'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['data'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['data'] = field_val
+        d['data'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         return d
 
     @classmethod
@@ -60,41 +45,10 @@ class Int16MultiArray:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'layout'
-        if 'layout' in d:
-            field_type = cls.__annotations__.get('layout')
-            value = d['layout']
-            
-            if field_type is bytearray:
-                obj.layout = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.layout = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.layout = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.layout = field_type.from_dict(value)
-            else:
-                obj.layout = value
-        # handle field 'data'
-        if 'data' in d:
-            field_type = cls.__annotations__.get('data')
-            value = d['data']
-            
-            if field_type is bytearray:
-                obj.data = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.data = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.data = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.data = field_type.from_dict(value)
-            else:
-                obj.data = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.layout = MultiArrayLayout.from_dict(d['layout']) if 'layout' in d else MultiArrayLayout()
+        obj.data = d.get('data', [])
         return obj
 
     def to_json(self, indent=2):
@@ -10,6 +10,8 @@ class MultiArrayDimension:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("label", "size", "stride")
+
     label: str
     size: int
     stride: int
@@ -34,36 +36,9 @@ class MultiArrayDimension:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'label'
-        field_val = self.label
-        if isinstance(field_val, bytearray):
-            d['label'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['label'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['label'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['label'] = field_val
-        # handle field 'size'
-        field_val = self.size
-        if isinstance(field_val, bytearray):
-            d['size'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['size'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['size'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['size'] = field_val
-        # handle field 'stride'
-        field_val = self.stride
-        if isinstance(field_val, bytearray):
-            d['stride'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['stride'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['stride'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['stride'] = field_val
+        d['label'] = self.label
+        d['size'] = self.size
+        d['stride'] = self.stride
         return d
 
     @classmethod
@@ -71,58 +46,11 @@ class MultiArrayDimension:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'label'
-        if 'label' in d:
-            field_type = cls.__annotations__.get('label')
-            value = d['label']
-            
-            if field_type is bytearray:
-                obj.label = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.label = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.label = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.label = field_type.from_dict(value)
-            else:
-                obj.label = value
-        # handle field 'size'
-        if 'size' in d:
-            field_type = cls.__annotations__.get('size')
-            value = d['size']
-            
-            if field_type is bytearray:
-                obj.size = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.size = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.size = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.size = field_type.from_dict(value)
-            else:
-                obj.size = value
-        # handle field 'stride'
-        if 'stride' in d:
-            field_type = cls.__annotations__.get('stride')
-            value = d['stride']
-            
-            if field_type is bytearray:
-                obj.stride = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.stride = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.stride = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.stride = field_type.from_dict(value)
-            else:
-                obj.stride = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.label = d.get('label', "")
+        obj.size = d.get('size', 0)
+        obj.stride = d.get('stride', 0)
         return obj
 
     def to_json(self, indent=2):
@@ -1,5 +1,6 @@
 from .pdu_pytype_TF2Error import TF2Error
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 
 
@@ -16,7 +17,8 @@ def cdr_body_to_py_TF2Error(reader: CdrReader, dst: TF2Error):
 
 
 def py_to_cdr_TF2Error(src: TF2Error) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["tf2_msgs/TF2Error"])
     writer.write_encapsulation()
     py_to_cdr_body_TF2Error(writer, src)
     return writer.bytes()
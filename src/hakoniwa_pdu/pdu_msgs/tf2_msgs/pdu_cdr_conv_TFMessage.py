@@ -1,5 +1,6 @@
 from .pdu_pytype_TFMessage import TFMessage
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..std_msgs.pdu_cdr_conv_Header import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
@@ -26,7 +27,8 @@ def cdr_body_to_py_TFMessage(reader: CdrReader, dst: TFMessage):
 
 
 def py_to_cdr_TFMessage(src: TFMessage) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["tf2_msgs/TFMessage"])
     writer.write_encapsulation()
     py_to_cdr_body_TFMessage(writer, src)
     return writer.bytes()
@@ -10,6 +10,8 @@ class TF2Error:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("error", "error_string")
+
     error: int
     error_string: str
 
@@ -31,26 +33,8 @@ class TF2Error:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'error'
-        field_val = self.error
-        if isinstance(field_val, bytearray):
-            d['error'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['error'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['error'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['error'] = field_val
-        # handle field 'error_string'
-        field_val = self.error_string
-        if isinstance(field_val, bytearray):
-            d['error_string'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['error_string'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['error_string'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['error_string'] = field_val
+        d['error'] = self.error
+        d['error_string'] = self.error_string
         return d
 
     @classmethod
@@ -58,41 +42,10 @@ class TF2Error:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'error'
-        if 'error' in d:
-            field_type = cls.__annotations__.get('error')
-            value = d['error']
-            
-            if field_type is bytearray:
-                obj.error = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.error = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.error = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.error = field_type.from_dict(value)
-            else:
-                obj.error = value
-        # handle field 'error_string'
-        if 'error_string' in d:
-            field_type = cls.__annotations__.get('error_string')
-            value = d['error_string']
-            
-            if field_type is bytearray:
-                obj.error_string = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.error_string = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.error_string = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.error_string = field_type.from_dict(value)
-            else:
-                obj.error_string = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.error = d.get('error', 0)
+        obj.error_string = d.get('error_string', "")
         return obj
 
     def to_json(self, indent=2):
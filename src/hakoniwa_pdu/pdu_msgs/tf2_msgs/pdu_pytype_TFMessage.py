@@ -16,6 +16,8 @@ class TFMessage:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("transforms",)
+
     transforms: List[TransformStamped]
 
     def __init__(self):
@@ -34,16 +36,7 @@ class TFMessage:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'transforms'
-        field_val = self.transforms
-        if isinstance(field_val, bytearray):
-            d['transforms'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['transforms'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['transforms'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['transforms'] = field_val
+        d['transforms'] = [item.to_dict() for item in self.transforms]
         return d
 
     @classmethod
@@ -51,24 +44,9 @@ class TFMessage:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'transforms'
-        if 'transforms' in d:
-            field_type = cls.__annotations__.get('transforms')
-            value = d['transforms']
-            
-            if field_type is bytearray:
-                obj.transforms = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.transforms = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.transforms = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.transforms = field_type.from_dict(value)
-            else:
-                obj.transforms = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.transforms = [TransformStamped.from_dict(item) for item in d['transforms']] if 'transforms' in d else []
         return obj
 
     def to_json(self, indent=2):
@@ -1,5 +1,6 @@
 from .pdu_pytype_JointTrajectory import JointTrajectory
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..builtin_interfaces.pdu_cdr_conv_Duration import *
 from ..std_msgs.pdu_cdr_conv_Header import *
@@ -30,7 +31,8 @@ def cdr_body_to_py_JointTrajectory(reader: CdrReader, dst: JointTrajectory):
 
 
 def py_to_cdr_JointTrajectory(src: JointTrajectory) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["trajectory_msgs/JointTrajectory"])
     writer.write_encapsulation()
     py_to_cdr_body_JointTrajectory(writer, src)
     return writer.bytes()
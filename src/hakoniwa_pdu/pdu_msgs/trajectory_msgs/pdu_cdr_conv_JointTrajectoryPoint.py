@@ -1,37 +1,38 @@
 from .pdu_pytype_JointTrajectoryPoint import JointTrajectoryPoint
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..builtin_interfaces.pdu_cdr_conv_Duration import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iI")  # time_from_start.sec, time_from_start.nanosec
+
 
 def py_to_cdr_body_JointTrajectoryPoint(writer: CdrWriter, src: JointTrajectoryPoint):
     writer.write_sequence_length(src.positions)
-    for elem in src.positions:
-        writer.write_float64(elem)
+    writer.write_sequence("d", src.positions)
     writer.write_sequence_length(src.velocities)
-    for elem in src.velocities:
-        writer.write_float64(elem)
+    writer.write_sequence("d", src.velocities)
     writer.write_sequence_length(src.accelerations)
-    for elem in src.accelerations:
-        writer.write_float64(elem)
+    writer.write_sequence("d", src.accelerations)
     writer.write_sequence_length(src.effort)
-    for elem in src.effort:
-        writer.write_float64(elem)
-    py_to_cdr_body_Duration(writer, src.time_from_start)
+    writer.write_sequence("d", src.effort)
+    writer.write_run(_CDR_RUN_0, (src.time_from_start.sec, src.time_from_start.nanosec))
 
 
 def cdr_body_to_py_JointTrajectoryPoint(reader: CdrReader, dst: JointTrajectoryPoint):
-    dst.positions = [reader.read_float64() for _ in range(reader.read_uint32())]
-    dst.velocities = [reader.read_float64() for _ in range(reader.read_uint32())]
-    dst.accelerations = [reader.read_float64() for _ in range(reader.read_uint32())]
-    dst.effort = [reader.read_float64() for _ in range(reader.read_uint32())]
-    cdr_body_to_py_Duration(reader, dst.time_from_start)
+    dst.positions = reader.read_sequence("d", reader.read_uint32())
+    dst.velocities = reader.read_sequence("d", reader.read_uint32())
+    dst.accelerations = reader.read_sequence("d", reader.read_uint32())
+    dst.effort = reader.read_sequence("d", reader.read_uint32())
+    dst.time_from_start.sec, dst.time_from_start.nanosec = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_JointTrajectoryPoint(src: JointTrajectoryPoint) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["trajectory_msgs/JointTrajectoryPoint"])
     writer.write_encapsulation()
     py_to_cdr_body_JointTrajectoryPoint(writer, src)
     return writer.bytes()
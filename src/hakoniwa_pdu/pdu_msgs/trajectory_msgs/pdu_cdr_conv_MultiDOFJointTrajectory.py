@@ -1,5 +1,6 @@
 from .pdu_pytype_MultiDOFJointTrajectory import MultiDOFJointTrajectory
 from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..builtin_interfaces.pdu_cdr_conv_Duration import *
 from ..std_msgs.pdu_cdr_conv_Header import *
@@ -34,7 +35,8 @@ def cdr_body_to_py_MultiDOFJointTrajectory(reader: CdrReader, dst: MultiDOFJoint
 
 
 def py_to_cdr_MultiDOFJointTrajectory(src: MultiDOFJointTrajectory) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["trajectory_msgs/MultiDOFJointTrajectory"])
     writer.write_encapsulation()
     py_to_cdr_body_MultiDOFJointTrajectory(writer, src)
     return writer.bytes()
@@ -1,5 +1,6 @@
 from .pdu_pytype_MultiDOFJointTrajectoryPoint import MultiDOFJointTrajectoryPoint
-from ..pdu_cdr_runtime import CdrReader, CdrWriter
+from ..pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from ..pdu_cdr_size import PDU_CDR_SIZE
 
 from ..builtin_interfaces.pdu_cdr_conv_Duration import *
 from ..geometry_msgs.pdu_cdr_conv_Quaternion import *
@@ -8,6 +9,9 @@ from ..geometry_msgs.pdu_cdr_conv_Twist import *
 from ..geometry_msgs.pdu_cdr_conv_Vector3 import *
 
 
+# 連続するプリミティブフィールド(固定長のネスト型は展開済み)はアラインメント解決済みの struct でまとめて読み書きする
+_CDR_RUN_0 = CdrRun("iI")  # time_from_start.sec, time_from_start.nanosec
+
 
 def py_to_cdr_body_MultiDOFJointTrajectoryPoint(writer: CdrWriter, src: MultiDOFJointTrajectoryPoint):
     writer.write_sequence_length(src.transforms)
@@ -19,7 +23,7 @@ def py_to_cdr_body_MultiDOFJointTrajectoryPoint(writer: CdrWriter, src: MultiDOF
     writer.write_sequence_length(src.accelerations)
     for elem in src.accelerations:
         py_to_cdr_body_Twist(writer, elem)
-    py_to_cdr_body_Duration(writer, src.time_from_start)
+    writer.write_run(_CDR_RUN_0, (src.time_from_start.sec, src.time_from_start.nanosec))
 
 
 def cdr_body_to_py_MultiDOFJointTrajectoryPoint(reader: CdrReader, dst: MultiDOFJointTrajectoryPoint):
@@ -38,12 +42,13 @@ def cdr_body_to_py_MultiDOFJointTrajectoryPoint(reader: CdrReader, dst: MultiDOF
         elem = Twist()
         cdr_body_to_py_Twist(reader, elem)
         dst.accelerations.append(elem)
-    cdr_body_to_py_Duration(reader, dst.time_from_start)
+    dst.time_from_start.sec, dst.time_from_start.nanosec = reader.read_run(_CDR_RUN_0)
     return dst
 
 
 def py_to_cdr_MultiDOFJointTrajectoryPoint(src: MultiDOFJointTrajectoryPoint) -> bytes:
-    writer = CdrWriter()
+    # 最小ペイロードサイズで事前確保する(可変長部分は必要に応じて拡張)
+    writer = CdrWriter(PDU_CDR_SIZE["trajectory_msgs/MultiDOFJointTrajectoryPoint"])
     writer.write_encapsulation()
     py_to_cdr_body_MultiDOFJointTrajectoryPoint(writer, src)
     return writer.bytes()
@@ -11,6 +11,8 @@ class JointTrajectoryPoint:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("positions", "velocities", "accelerations", "effort", "time_from_start")
+
     positions: List[float]
     velocities: List[float]
     accelerations: List[float]
@@ -41,56 +43,15 @@ class JointTrajectoryPoint:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'positions'
         field_val = self.positions
-        if isinstance(field_val, bytearray):
-            d['positions'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['positions'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['positions'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['positions'] = field_val
-        # handle field 'velocities'
+        d['positions'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.velocities
-        if isinstance(field_val, bytearray):
-            d['velocities'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['velocities'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['velocities'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['velocities'] = field_val
-        # handle field 'accelerations'
+        d['velocities'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.accelerations
-        if isinstance(field_val, bytearray):
-            d['accelerations'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['accelerations'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['accelerations'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['accelerations'] = field_val
-        # handle field 'effort'
+        d['accelerations'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
         field_val = self.effort
-        if isinstance(field_val, bytearray):
-            d['effort'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['effort'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['effort'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['effort'] = field_val
-        # handle field 'time_from_start'
-        field_val = self.time_from_start
-        if isinstance(field_val, bytearray):
-            d['time_from_start'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['time_from_start'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['time_from_start'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['time_from_start'] = field_val
+        d['effort'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['time_from_start'] = self.time_from_start.to_dict()
         return d
 
     @classmethod
@@ -98,92 +59,13 @@ class JointTrajectoryPoint:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'positions'
-        if 'positions' in d:
-            field_type = cls.__annotations__.get('positions')
-            value = d['positions']
-            
-            if field_type is bytearray:
-                obj.positions = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.positions = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.positions = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.positions = field_type.from_dict(value)
-            else:
-                obj.positions = value
-        # handle field 'velocities'
-        if 'velocities' in d:
-            field_type = cls.__annotations__.get('velocities')
-            value = d['velocities']
-            
-            if field_type is bytearray:
-                obj.velocities = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.velocities = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.velocities = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.velocities = field_type.from_dict(value)
-            else:
-                obj.velocities = value
-        # handle field 'accelerations'
-        if 'accelerations' in d:
-            field_type = cls.__annotations__.get('accelerations')
-            value = d['accelerations']
-            
-            if field_type is bytearray:
-                obj.accelerations = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.accelerations = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.accelerations = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.accelerations = field_type.from_dict(value)
-            else:
-                obj.accelerations = value
-        # handle field 'effort'
-        if 'effort' in d:
-            field_type = cls.__annotations__.get('effort')
-            value = d['effort']
-            
-            if field_type is bytearray:
-                obj.effort = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.effort = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.effort = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.effort = field_type.from_dict(value)
-            else:
-                obj.effort = value
-        # handle field 'time_from_start'
-        if 'time_from_start' in d:
-            field_type = cls.__annotations__.get('time_from_start')
-            value = d['time_from_start']
-            
-            if field_type is bytearray:
-                obj.time_from_start = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.time_from_start = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.time_from_start = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.time_from_start = field_type.from_dict(value)
-            else:
-                obj.time_from_start = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.positions = d.get('positions', [])
+        obj.velocities = d.get('velocities', [])
+        obj.accelerations = d.get('accelerations', [])
+        obj.effort = d.get('effort', [])
+        obj.time_from_start = Duration.from_dict(d['time_from_start']) if 'time_from_start' in d else Duration()
         return obj
 
     def to_json(self, indent=2):
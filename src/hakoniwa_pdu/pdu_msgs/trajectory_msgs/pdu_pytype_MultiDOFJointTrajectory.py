@@ -18,6 +18,8 @@ class MultiDOFJointTrajectory:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("header", "joint_names", "points")
+
     header: Header
     joint_names: List[str]
     points: List[MultiDOFJointTrajectoryPoint]
@@ -42,36 +44,10 @@ class MultiDOFJointTrajectory:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'header'
-        field_val = self.header
-        if isinstance(field_val, bytearray):
-            d['header'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['header'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['header'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['header'] = field_val
-        # handle field 'joint_names'
+        d['header'] = self.header.to_dict()
         field_val = self.joint_names
-        if isinstance(field_val, bytearray):
-            d['joint_names'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['joint_names'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['joint_names'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['joint_names'] = field_val
-        # handle field 'points'
-        field_val = self.points
-        if isinstance(field_val, bytearray):
-            d['points'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['points'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['points'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['points'] = field_val
+        d['joint_names'] = list(field_val) if isinstance(field_val, (bytearray, list)) else field_val
+        d['points'] = [item.to_dict() for item in self.points]
         return d
 
     @classmethod
@@ -79,58 +55,11 @@ class MultiDOFJointTrajectory:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'header'
-        if 'header' in d:
-            field_type = cls.__annotations__.get('header')
-            value = d['header']
-            
-            if field_type is bytearray:
-                obj.header = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.header = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.header = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.header = field_type.from_dict(value)
-            else:
-                obj.header = value
-        # handle field 'joint_names'
-        if 'joint_names' in d:
-            field_type = cls.__annotations__.get('joint_names')
-            value = d['joint_names']
-            
-            if field_type is bytearray:
-                obj.joint_names = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.joint_names = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.joint_names = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.joint_names = field_type.from_dict(value)
-            else:
-                obj.joint_names = value
-        # handle field 'points'
-        if 'points' in d:
-            field_type = cls.__annotations__.get('points')
-            value = d['points']
-            
-            if field_type is bytearray:
-                obj.points = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.points = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.points = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.points = field_type.from_dict(value)
-            else:
-                obj.points = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.header = Header.from_dict(d['header']) if 'header' in d else Header()
+        obj.joint_names = d.get('joint_names', [])
+        obj.points = [MultiDOFJointTrajectoryPoint.from_dict(item) for item in d['points']] if 'points' in d else []
         return obj
 
     def to_json(self, indent=2):
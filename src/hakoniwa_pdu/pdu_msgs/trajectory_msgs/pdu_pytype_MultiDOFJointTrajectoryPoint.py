@@ -15,6 +15,8 @@ class MultiDOFJointTrajectoryPoint:
     Generated by hakoniwa-ros2pdu.
     """
 
+    __slots__ = ("transforms", "velocities", "accelerations", "time_from_start")
+
     transforms: List[Transform]
     velocities: List[Twist]
     accelerations: List[Twist]
@@ -42,46 +44,10 @@ class MultiDOFJointTrajectoryPoint:
         Convert the object to a dictionary.
         """
         d = {}
-        # handle field 'transforms'
-        field_val = self.transforms
-        if isinstance(field_val, bytearray):
-            d['transforms'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['transforms'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['transforms'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['transforms'] = field_val
-        # handle field 'velocities'
-        field_val = self.velocities
-        if isinstance(field_val, bytearray):
-            d['velocities'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['velocities'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['velocities'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['velocities'] = field_val
-        # handle field 'accelerations'
-        field_val = self.accelerations
-        if isinstance(field_val, bytearray):
-            d['accelerations'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['accelerations'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['accelerations'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['accelerations'] = field_val
-        # handle field 'time_from_start'
-        field_val = self.time_from_start
-        if isinstance(field_val, bytearray):
-            d['time_from_start'] = list(field_val)
-        elif hasattr(field_val, 'to_dict'):
-            d['time_from_start'] = field_val.to_dict()
-        elif isinstance(field_val, list):
-            d['time_from_start'] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in field_val]
-        else:
-            d['time_from_start'] = field_val
+        d['transforms'] = [item.to_dict() for item in self.transforms]
+        d['velocities'] = [item.to_dict() for item in self.velocities]
+        d['accelerations'] = [item.to_dict() for item in self.accelerations]
+        d['time_from_start'] = self.time_from_start.to_dict()
         return d
 
     @classmethod
@@ -89,75 +55,12 @@ class MultiDOFJointTrajectoryPoint:
         """
         Create an object from a dictionary.
         """
-        obj = cls()
-        # handle field 'transforms'
-        if 'transforms' in d:
-            field_type = cls.__annotations__.get('transforms')
-            value = d['transforms']
-            
-            if field_type is bytearray:
-                obj.transforms = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.transforms = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.transforms = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.transforms = field_type.from_dict(value)
-            else:
-                obj.transforms = value
-        # handle field 'velocities'
-        if 'velocities' in d:
-            field_type = cls.__annotations__.get('velocities')
-            value = d['velocities']
-            
-            if field_type is bytearray:
-                obj.velocities = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.velocities = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.velocities = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.velocities = field_type.from_dict(value)
-            else:
-                obj.velocities = value
-        # handle field 'accelerations'
-        if 'accelerations' in d:
-            field_type = cls.__annotations__.get('accelerations')
-            value = d['accelerations']
-            
-            if field_type is bytearray:
-                obj.accelerations = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.accelerations = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.accelerations = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.accelerations = field_type.from_dict(value)
-            else:
-                obj.accelerations = value
-        # handle field 'time_from_start'
-        if 'time_from_start' in d:
-            field_type = cls.__annotations__.get('time_from_start')
-            value = d['time_from_start']
-            
-            if field_type is bytearray:
-                obj.time_from_start = bytearray(value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                list_item_type = field_type.__args__[0]
-                if hasattr(list_item_type, 'from_dict'):
-                    obj.time_from_start = [list_item_type.from_dict(item) for item in value]
-                else:
-                    obj.time_from_start = value
-            elif hasattr(field_type, 'from_dict'):
-                obj.time_from_start = field_type.from_dict(value)
-            else:
-                obj.time_from_start = value
+        # every field is assigned here, so __init__ is not run
+        obj = cls.__new__(cls)
+        obj.transforms = [Transform.from_dict(item) for item in d['transforms']] if 'transforms' in d else []
+        obj.velocities = [Twist.from_dict(item) for item in d['velocities']] if 'velocities' in d else []
+        obj.accelerations = [Twist.from_dict(item) for item in d['accelerations']] if 'accelerations' in d else []
+        obj.time_from_start = Duration.from_dict(d['time_from_start']) if 'time_from_start' in d else Duration()
         return obj
 
     def to_json(self, indent=2):
@@ -1,8 +1,9 @@
 """Utility helpers to construct ProtocolClient/Server with minimal imports."""
-from importlib import import_module
 from typing import Any, Tuple, Type, Callable, Optional, Sequence, Dict
 import asyncio
 
+from hakoniwa_pdu.pdu_msgs import pdu_registry
+
 
 def _load_protocol_components(srv: str, pkg: str) -> Tuple[type, type, Callable, Callable, Callable, Callable]:
     """Dynamically load packet classes and converters for a service.
@@ -19,25 +20,21 @@ def _load_protocol_components(srv: str, pkg: str) -> Tuple[type, type, Callable,
     tuple
         ``(ReqPacket, ResPacket, req_encoder, req_decoder, res_encoder, res_decoder)``
     """
-    req_packet_mod = f"{pkg}.pdu_pytype_{srv}RequestPacket"
-    res_packet_mod = f"{pkg}.pdu_pytype_{srv}ResponsePacket"
-    req_conv_mod = f"{pkg}.pdu_conv_{srv}RequestPacket"
-    res_conv_mod = f"{pkg}.pdu_conv_{srv}ResponsePacket"
-
     try:
-        ReqPacket = getattr(import_module(req_packet_mod), f"{srv}RequestPacket")
-        ResPacket = getattr(import_module(res_packet_mod), f"{srv}ResponsePacket")
-        req_conv = import_module(req_conv_mod)
-        res_conv = import_module(res_conv_mod)
-    except (ImportError, AttributeError) as e:
+        # the registry caches entries and imports the generated modules on first use
+        req = pdu_registry.get_type(f"{pkg}/{srv}RequestPacket")
+        res = pdu_registry.get_type(f"{pkg}/{srv}ResponsePacket")
+        ReqPacket = req.pytype
+        ResPacket = res.pytype
+    except (ValueError, ImportError, AttributeError) as e:
         raise RuntimeError(f"Failed to load protocol components for service '{srv}'") from e
 
     try:
-        req_encoder = getattr(req_conv, f"py_to_pdu_{srv}RequestPacket")
-        req_decoder = getattr(req_conv, f"pdu_to_py_{srv}RequestPacket")
-        res_encoder = getattr(res_conv, f"py_to_pdu_{srv}ResponsePacket")
-        res_decoder = getattr(res_conv, f"pdu_to_py_{srv}ResponsePacket")
-    except AttributeError as e:
+        req_encoder = req.py_to_pdu
+        req_decoder = req.pdu_to_py
+        res_encoder = res.py_to_pdu
+        res_decoder = res.pdu_to_py
+    except (ImportError, AttributeError) as e:
         raise RuntimeError(f"Missing converter functions for service '{srv}'") from e
 
     return ReqPacket, ResPacket, req_encoder, req_decoder, res_encoder, res_decoder
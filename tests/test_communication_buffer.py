@@ -7,7 +7,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 
 from hakoniwa_pdu.impl.pdu_channel_config import PduChannelConfig
 from hakoniwa_pdu.impl.communication_buffer import CommunicationBuffer
-from hakoniwa_pdu.impl.data_packet import DataPacket
+from hakoniwa_pdu.impl.data_packet import DataPacket, PacketView, PDU_DATA, encode_v2
 
 SAMPLE_CONFIG = {
     "robots": [
@@ -43,3 +43,15 @@ def test_put_and_get_packet():
     finally:
         os.unlink(path)
 
+
+
+def test_put_packet_view_keeps_the_frame_body():
+    path = create_config_file()
+    try:
+        buffer = CommunicationBuffer(PduChannelConfig(path))
+        frame = bytes(encode_v2("RobotA", 1, b"abc", PDU_DATA))
+        buffer.put_packet(PacketView.parse(frame))
+        data = buffer.get_buffer("RobotA", "pos")
+        assert data == b"abc" and data.obj is frame
+    finally:
+        os.unlink(path)
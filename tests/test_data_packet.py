@@ -2,10 +2,14 @@ import os
 import sys
 import struct
 
+import pytest
+
 # Add src directory to sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-from hakoniwa_pdu.impl.data_packet import DataPacket, HAKO_META_MAGIC, HAKO_META_VER
+from hakoniwa_pdu.impl.data_packet import (
+    DataPacket, HAKO_META_MAGIC, HAKO_META_VER, PDU_DATA, PacketView, encode_v2, encode_v2_into, encode_v2_parts
+)
 
 
 def test_encode_decode_roundtrip():
@@ -57,3 +61,53 @@ def test_encode_decode_v2_roundtrip():
     assert decoded.get_robot_name() == "Drone2"
     assert decoded.get_channel_id() == 9
     assert decoded.get_pdu_data() == bytearray(b"xyz")
+
+
+def test_v2_encoders_write_the_same_frame():
+    body = bytearray(b"\x01\x02\x03\x04")
+    packet = DataPacket("Drone1", 3, body)
+    packet.set_hako_time_usec(10)
+    packet.set_real_time_usec(30)
+    expected = packet.encode(version="v2", meta_request_type=PDU_DATA)
+
+    assert expected[:6] == b"Drone1" and expected[6:128] == bytes(122)
+    assert struct.unpack_from("<IHHIIII", expected, 128) == (HAKO_META_MAGIC, HAKO_META_VER, 0, 0, PDU_DATA, 172 + 4, 4)
+    assert struct.unpack_from("<QQQi", expected, 152) == (10, 0, 30, 3)
+    assert expected[180:304] == bytes(124) and expected[304:] == body
+    assert encode_v2("Drone1", 3, body, PDU_DATA, hako_time_us=10, real_time_us=30) == expected
+
+    # a reused, dirty buffer: only the frame is written
+    out = bytearray(b"\xff" * 320)
+    assert encode_v2_into(out, "Drone1", 3, body, PDU_DATA, hako_time_us=10, real_time_us=30) == 308
+    assert out[:308] == expected and out[308:] == b"\xff" * 12
+    with pytest.raises(ValueError):
+        encode_v2_into(bytearray(307), "Drone1", 3, body)
+
+    header, payload = encode_v2_parts("Drone1", 3, body, PDU_DATA, hako_time_us=10, real_time_us=30)
+    assert header + payload == expected and payload is body
+
+
+def test_v2_robot_name_keeps_terminating_nul():
+    encoded = encode_v2("r" * 200, 1, b"")
+
+    assert encoded[:127] == b"r" * 127 and encoded[127] == 0
+    assert DataPacket.decode(encoded, version="v2").get_robot_name() == "r" * 127
+
+
+def test_packet_view_parses_v2_frames_without_copying():
+    body = bytes(range(200)) * 10
+    frame = bytes(encode_v2("Drone", 4, body, PDU_DATA, hako_time_us=1, asset_time_us=2, real_time_us=3))
+
+    view = PacketView.parse(frame)
+
+    assert view.get_robot_name() == "Drone" and view.get_channel_id() == 4
+    assert view.meta_request_type == PDU_DATA
+    assert (view.hako_time_us, view.asset_time_us, view.real_time_us) == (1, 2, 3)
+    assert view.get_pdu_data() == body and view.get_pdu_data().obj is frame
+    assert view.meta_pdu.body_len == len(body) and view.meta_pdu.total_len == 172 + len(body)
+    packet = view.to_packet()
+    assert isinstance(packet.get_pdu_data(), bytearray) and packet.get_pdu_data() == body
+
+    assert PacketView.parse(frame[:-1]) is None
+    assert PacketView.parse(frame[:100]) is None
+    assert PacketView.parse(b"\x00" * 304) is None
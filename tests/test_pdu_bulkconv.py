@@ -0,0 +1,165 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from hakoniwa_pdu.apps.bulkconv import hako_pdu_bulkconv
+from hakoniwa_pdu.impl.hako_binary import offset_map
+from hakoniwa_pdu.impl.pdu_channel_config import PduChannelConfig
+from hakoniwa_pdu.impl.pdu_convertor import PduConvertor
+
+OFFSET_PATH = os.path.join(os.path.dirname(__file__), 'config', 'offset')
+
+SAMPLE_CONFIG = {
+    "robots": [
+        {
+            "name": "Drone",
+            "shm_pdu_readers": [
+                {"org_name": "cmd_vel", "channel_id": 0, "pdu_size": 72, "type": "geometry_msgs/Twist"},
+                {"org_name": "points", "channel_id": 1, "pdu_size": 200, "type": "sensor_msgs/PointCloud2"},
+            ],
+            "shm_pdu_writers": []
+        }
+    ]
+}
+
+
+def point_cloud(i):
+    return {
+        "header": {"stamp": {"sec": i, "nanosec": 0}, "frame_id": "map"},
+        "height": 1,
+        "width": i,
+        "fields": [{"name": "x", "offset": 0, "datatype": 7, "count": 1}],
+        "is_bigendian": 0,
+        "point_step": 4,
+        "row_step": 4 * i,
+        "data": list(range(4 * i)),
+        "is_dense": 1,
+    }
+
+
+@pytest.fixture
+def dumps(tmp_path):
+    config_path = tmp_path / "pdu_config.json"
+    config_path.write_text(json.dumps(SAMPLE_CONFIG))
+    convertor = PduConvertor(OFFSET_PATH, PduChannelConfig(str(config_path)))
+    clouds = [point_cloud(i) for i in range(1, 6)]
+    twists = [{"linear": {"x": float(i), "y": 0.0, "z": 0.0}, "angular": {"x": 0.0, "y": 0.0, "z": float(-i)}}
+              for i in range(3)]
+    dump_dir = tmp_path / "dumps"
+    dump_dir.mkdir()
+    # a concatenated dump of variable-sized PDUs and a directory of single PDUs
+    (dump_dir / "points.bin").write_bytes(b"".join(
+        convertor.convert_json_to_binary("Drone", "points", cloud) for cloud in clouds))
+    (dump_dir / "twist").mkdir()
+    for i, twist in enumerate(twists):
+        (dump_dir / "twist" / f"{i}.bin").write_bytes(convertor.convert_json_to_binary("Drone", "cmd_vel", twist))
+    map_path = tmp_path / "map.json"
+    map_path.write_text(json.dumps({"points.bin": "Drone/points", "twist/*": "geometry_msgs/Twist"}))
+    return tmp_path, convertor, clouds, twists
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_bulkconv_writes_json_lines_in_input_order(dumps, jobs):
+    tmp_path, convertor, clouds, twists = dumps
+    out = tmp_path / "out.jsonl"
+
+    assert hako_pdu_bulkconv.main([
+        str(tmp_path / "dumps"), "-o", str(out), "--offset-path", OFFSET_PATH,
+        "--map", str(tmp_path / "map.json"), "--pdu-config", str(tmp_path / "pdu_config.json"),
+        "--jobs", jobs, "--batch-bytes", "256",
+    ]) == 0
+
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [(line["source"], line["index"]) for line in lines] == \
+        [("points.bin", i) for i in range(5)] + [(f"twist/{i}.bin", 0) for i in range(3)]
+    assert [line["pdu"]["data"] for line in lines[:5]] == [cloud["data"] for cloud in clouds]
+    assert lines[5]["type"] == "geometry_msgs/Twist"
+    assert [line["pdu"]["angular"]["z"] for line in lines[5:]] == [0.0, -1.0, -2.0]
+
+
+def test_bulkconv_writes_npz_with_flattened_varrays(dumps):
+    numpy = pytest.importorskip("numpy")
+    tmp_path, convertor, clouds, twists = dumps
+    out = tmp_path / "points.npz"
+
+    assert hako_pdu_bulkconv.main([
+        str(tmp_path / "dumps" / "points.bin"), "-o", str(out), "--offset-path", OFFSET_PATH,
+        "--type", "sensor_msgs/PointCloud2", "--jobs", "1", "--batch-bytes", "1",
+    ]) == 0
+
+    with numpy.load(out) as npz:
+        records = npz["sensor_msgs/PointCloud2"]
+        assert list(records["width"]) == [1, 2, 3, 4, 5]
+        assert list(npz["sensor_msgs/PointCloud2.data.count"]) == [4, 8, 12, 16, 20]
+        assert npz["sensor_msgs/PointCloud2.data"].tolist() == sum((cloud["data"] for cloud in clouds), [])
+
+
+def test_bulkconv_fixed_record_size_skips_unwritten_records(tmp_path):
+    offmap = offset_map.create_offmap(OFFSET_PATH)
+    config_path = tmp_path / "pdu_config.json"
+    config_path.write_text(json.dumps(SAMPLE_CONFIG))
+    convertor = PduConvertor(OFFSET_PATH, PduChannelConfig(str(config_path)))
+    twist = convertor.convert_json_to_binary("Drone", "cmd_vel", convertor.create_empty_pdu_json("Drone", "cmd_vel"))
+    record_size = len(twist) + 8
+    dump = bytes(twist) + bytes(8) + bytes(record_size) + bytes(twist) + bytes(8)
+
+    records = list(hako_pdu_bulkconv.iter_records(dump, 0, len(dump), record_size))
+
+    assert records == [(0, record_size), (2 * record_size, record_size)]
+    with pytest.raises(hako_pdu_bulkconv.BulkConvertError):
+        list(hako_pdu_bulkconv.iter_records(dump, 0, len(dump)))
+    with pytest.raises(hako_pdu_bulkconv.BulkConvertError):
+        hako_pdu_bulkconv.TypeResolver(offmap).type_of("x.bin")
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_bulkconv_rejects_dumps_of_another_type(dumps, jobs, capsys):
+    tmp_path, convertor, clouds, twists = dumps
+    twist = tmp_path / "dumps" / "twist" / "0.bin"
+
+    assert hako_pdu_bulkconv.main([
+        str(twist), "-o", str(tmp_path / "out.jsonl"), "--offset-path", OFFSET_PATH,
+        "--type", "sensor_msgs/PointCloud2", "--jobs", jobs,
+    ]) == 1
+    assert "expected at least 176 bytes" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_bulkconv_rejects_varrays_outside_the_record(dumps, jobs, capsys):
+    tmp_path, convertor, clouds, twists = dumps
+    first = convertor.convert_json_to_binary("Drone", "points", clouds[0])
+    # the data of the first cloud points into the heap of the second one
+    data = convertor.offmap.get_layout("sensor_msgs/PointCloud2").by_name["data"]
+    first[24 + data.offset:24 + data.offset + 4] = (len(first) + 4).to_bytes(4, "little")
+    dump = tmp_path / "corrupt.bin"
+    dump.write_bytes(bytes(first) + convertor.convert_json_to_binary("Drone", "points", clouds[1]))
+
+    assert hako_pdu_bulkconv.main([
+        str(dump), "-o", str(tmp_path / "out.jsonl"), "--offset-path", OFFSET_PATH,
+        "--type", "sensor_msgs/PointCloud2", "--jobs", jobs,
+    ]) == 1
+    assert "PDU 0 at offset 0: varray data" in capsys.readouterr().err
+
+
+def test_bulkconv_accepts_padded_base_areas(dumps):
+    tmp_path, convertor, clouds, twists = dumps
+    binary = convertor.convert_json_to_binary("Drone", "points", clouds[2])
+    magicno, version, base_off, heap_off, total_size = hako_pdu_bulkconv._META.unpack_from(binary)
+    # a writer that rounds the base area up by 8 bytes; varray offsets are relative to heap_off
+    padded = bytearray(binary[:heap_off]) + bytes(8) + binary[heap_off:]
+    hako_pdu_bulkconv._META.pack_into(padded, 0, magicno, version, base_off, heap_off + 8, total_size + 8)
+    dump = tmp_path / "padded.bin"
+    dump.write_bytes(bytes(padded) + bytes(binary))
+    out = tmp_path / "out.jsonl"
+
+    assert hako_pdu_bulkconv.main([
+        str(dump), "-o", str(out), "--offset-path", OFFSET_PATH,
+        "--type", "sensor_msgs/PointCloud2", "--jobs", "1",
+    ]) == 0
+
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [line["pdu"]["data"] for line in lines] == [clouds[2]["data"]] * 2
@@ -0,0 +1,556 @@
+import base64
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from hakoniwa_pdu.impl.hako_binary import binary_io, binary_reader, offset_map
+from hakoniwa_pdu.impl.pdu_channel_config import PduChannelConfig
+from hakoniwa_pdu.impl.data_packet import PacketView, encode_v2
+from hakoniwa_pdu.impl.pdu_convertor import PduConvertor
+
+OFFSET_PATH = os.path.join(os.path.dirname(__file__), 'config', 'offset')
+
+SAMPLE_CONFIG = {
+    "robots": [
+        {
+            "name": "Drone",
+            "shm_pdu_readers": [
+                {"org_name": "cmd_vel", "channel_id": 0, "pdu_size": 72, "type": "geometry_msgs/Twist"},
+                {"org_name": "imu", "channel_id": 1, "pdu_size": 456, "type": "sensor_msgs/Imu"},
+                {"org_name": "points", "channel_id": 2, "pdu_size": 200, "type": "sensor_msgs/PointCloud2"},
+                {"org_name": "varray", "channel_id": 3, "pdu_size": 48, "type": "hako_msgs/SimpleVarray"},
+                {"org_name": "collision", "channel_id": 4, "pdu_size": 304, "type": "hako_msgs/Collision"},
+                {"org_name": "visual_state", "channel_id": 5, "pdu_size": 4096, "type": "hako_msgs/DroneVisualStateArray"},
+                {"org_name": "trajectory", "channel_id": 6, "pdu_size": 4096, "type": "trajectory_msgs/MultiDOFJointTrajectory"},
+            ],
+            "shm_pdu_writers": []
+        }
+    ]
+}
+
+
+@pytest.fixture
+def convertor():
+    tmp = tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json")
+    json.dump(SAMPLE_CONFIG, tmp)
+    tmp.close()
+    try:
+        yield PduConvertor(OFFSET_PATH, PduChannelConfig(tmp.name))
+    finally:
+        os.unlink(tmp.name)
+
+
+def sample_point_cloud():
+    return {
+        "header": {"stamp": {"sec": 10, "nanosec": 20}, "frame_id": "map"},
+        "height": 1,
+        "width": 2,
+        "fields": [
+            {"name": "x", "offset": 0, "datatype": 7, "count": 1},
+            {"name": "y", "offset": 4, "datatype": 7, "count": 1},
+        ],
+        "is_bigendian": 0,
+        "point_step": 8,
+        "row_step": 16,
+        "data": list(range(16)),
+        "is_dense": 1,
+    }
+
+
+def test_offset_layout_is_parsed_once_with_name_index():
+    offmap = offset_map.create_offmap(OFFSET_PATH)
+    layout = offmap.get_layout("sensor_msgs/PointCloud2")
+
+    assert offmap.get_layout("sensor_msgs/PointCloud2") is layout
+    fields = layout.by_name["fields"]
+    assert fields.is_varray and not fields.is_primitive
+    assert (fields.offset, fields.elm_size, fields.type_name) == (144, 140, "PointField")
+    assert layout.base_size == 176
+
+    imu = offmap.get_layout("sensor_msgs/Imu").by_name["orientation_covariance"]
+    assert (imu.array_len, imu.elm_size) == (9, 8)
+
+
+def test_twist_roundtrip(convertor):
+    twist = {"linear": {"x": 1.0, "y": 2.0, "z": 3.0}, "angular": {"x": -1.0, "y": -2.0, "z": -3.0}}
+
+    binary = convertor.convert_json_to_binary("Drone", "cmd_vel", twist)
+
+    assert len(binary) == 72
+    assert convertor.convert_binary_to_json("Drone", "cmd_vel", binary) == twist
+
+
+def test_unwritten_pdu_decodes_from_read_only_packet_view(convertor):
+    body = PacketView.parse(bytes(encode_v2("Drone", 0, bytes(72)))).get_pdu_data()
+    zero = {"linear": {"x": 0.0, "y": 0.0, "z": 0.0}, "angular": {"x": 0.0, "y": 0.0, "z": 0.0}}
+
+    assert body.readonly
+    assert convertor.convert_binary_to_json("Drone", "cmd_vel", body) == zero
+    assert json.loads(convertor.convert_binary_to_json_bytes("Drone", "cmd_vel", body)) == zero
+    assert bytes(body) == bytes(72)
+
+
+def test_varray_roundtrip(convertor):
+    cloud = sample_point_cloud()
+
+    decoded = convertor.convert_binary_to_json("Drone", "points", convertor.convert_json_to_binary("Drone", "points", cloud))
+
+    assert decoded["header"] == cloud["header"]
+    assert decoded["fields"] == cloud["fields"]
+    assert decoded["data"] == tuple(cloud["data"])
+    assert decoded["data__raw"] == bytes(cloud["data"])
+
+
+def test_compiled_plan_matches_recursive_reader(convertor):
+    imu = convertor.create_empty_pdu_json("Drone", "imu")
+    imu["header"]["frame_id"] = "base_link"
+    imu["orientation"]["w"] = 1.0
+    imu["orientation_covariance"] = [float(i) for i in range(9)]
+    binary = convertor.convert_json_to_binary("Drone", "imu", imu)
+
+    plan = convertor.offmap.get_plan("sensor_msgs/Imu")
+    meta = binary_io.PduMetaDataParser().load_pdu_meta(binary)
+    expected = {}
+    binary_reader.binary_read_recursive(meta, convertor.offmap, binary, expected, binary_io.PduMetaData.PDU_META_DATA_SIZE, "sensor_msgs/Imu")
+
+    assert convertor.offmap.get_plan("sensor_msgs/Imu") is plan
+    assert convertor.convert_binary_to_json("Drone", "imu", binary) == expected
+    assert convertor.offmap.get_plan("geometry_msgs/Twist").struct.format == "<dddddd"
+
+
+def test_encode_sizes_output_once_and_rewrites_dirty_buffer(convertor):
+    cloud = sample_point_cloud()
+    plan = convertor.offmap.get_plan("sensor_msgs/PointCloud2")
+
+    binary = convertor.convert_json_to_binary("Drone", "points", cloud)
+    reused = bytearray(b"\xff" * len(binary))
+    total_size = plan.write(cloud, reused)
+
+    assert total_size == len(binary) == plan.encoded_size(cloud)
+    assert reused == binary
+    meta = binary_io.PduMetaDataParser().load_pdu_meta(binary)
+    assert (meta.base_off, meta.heap_off, meta.total_size) == (24, 24 + 176, len(binary))
+
+
+def test_encode_into_reusable_buffer_and_memoryview(convertor):
+    cloud = sample_point_cloud()
+    expected = convertor.convert_json_to_binary("Drone", "points", cloud)
+    send_buffer = bytearray(len(expected) + 16)
+
+    written = convertor.encode_into("Drone", "points", cloud, send_buffer)
+    assert written == len(expected)
+    assert send_buffer[:written] == expected
+
+    segment = bytearray(len(expected))
+    assert convertor.encode_into("Drone", "points", cloud, memoryview(segment)) == len(expected)
+    assert segment == expected
+
+    with pytest.raises(ValueError):
+        convertor.encode_into("Drone", "points", cloud, bytearray(len(expected) - 1))
+
+
+def make_numpy_convertor():
+    tmp = tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json")
+    json.dump(SAMPLE_CONFIG, tmp)
+    tmp.close()
+    try:
+        return PduConvertor(OFFSET_PATH, PduChannelConfig(tmp.name), array_mode="numpy")
+    finally:
+        os.unlink(tmp.name)
+
+
+def test_numpy_array_mode_returns_views_over_the_buffer(convertor):
+    np = pytest.importorskip("numpy")
+    numpy_convertor = make_numpy_convertor()
+    imu = convertor.create_empty_pdu_json("Drone", "imu")
+    imu["orientation_covariance"] = [float(i) for i in range(9)]
+    cloud = sample_point_cloud()
+    binary = bytearray(convertor.convert_json_to_binary("Drone", "points", cloud))
+
+    decoded = numpy_convertor.convert_binary_to_json("Drone", "points", binary)
+    covariance = numpy_convertor.convert_binary_to_json(
+        "Drone", "imu", convertor.convert_json_to_binary("Drone", "imu", imu))["orientation_covariance"]
+
+    assert isinstance(decoded["data"], np.ndarray) and decoded["data"].dtype == np.uint8
+    assert np.shares_memory(decoded["data"], np.frombuffer(binary, dtype=np.uint8))
+    assert decoded["data"].tolist() == cloud["data"]
+    assert decoded["fields"][1]["name"] == "y"
+    assert covariance.dtype == np.float64 and covariance.tolist() == imu["orientation_covariance"]
+
+
+def test_encode_accepts_numpy_arrays_and_buffers(convertor):
+    np = pytest.importorskip("numpy")
+    cloud = sample_point_cloud()
+    expected = convertor.convert_json_to_binary("Drone", "points", cloud)
+
+    assert convertor.convert_json_to_binary(
+        "Drone", "points", dict(cloud, data=np.arange(16, dtype=np.uint8))) == expected
+    assert convertor.convert_json_to_binary(
+        "Drone", "points", dict(cloud, data=bytes(range(16)))) == expected
+
+
+def test_unknown_array_mode_is_rejected():
+    with pytest.raises(ValueError):
+        PduConvertor(OFFSET_PATH, None, array_mode="list")
+
+
+def test_as_record_reads_fields_without_decoding(convertor):
+    np = pytest.importorskip("numpy")
+    twist = {"linear": {"x": 1.0, "y": 2.0, "z": 3.0}, "angular": {"x": -1.0, "y": -2.0, "z": -3.0}}
+    binary = convertor.convert_json_to_binary("Drone", "cmd_vel", twist)
+
+    record = convertor.as_record("Drone", "cmd_vel", binary)
+
+    assert record["linear"]["x"] == 1.0 and record["angular"]["z"] == -3.0
+    record["linear"]["y"] = 5.0
+    assert convertor.convert_binary_to_json("Drone", "cmd_vel", binary)["linear"]["y"] == 5.0
+
+    collision = convertor.create_empty_pdu_json("Drone", "collision")
+    collision["contact_position"][3] = {"x": 1.0, "y": 2.0, "z": 3.0}
+    positions = convertor.as_record(
+        "Drone", "collision", convertor.convert_json_to_binary("Drone", "collision", collision))["contact_position"]
+    assert positions.shape == (10,) and positions.dtype.names == ("x", "y", "z")
+    assert positions[3]["z"] == 3.0
+
+
+def test_as_record_returns_struct_varrays_as_structured_arrays(convertor):
+    np = pytest.importorskip("numpy")
+    binary = bytes(convertor.convert_json_to_binary("Drone", "points", sample_point_cloud()))
+
+    record = convertor.as_record("Drone", "points", binary)
+    fields = record["fields"]
+
+    assert record["header"]["frame_id"] == b"map"
+    assert record["header"]["stamp"]["nanosec"] == 20
+    assert fields.dtype.itemsize == 140
+    assert fields["name"].tolist() == [b"x", b"y"] and fields["offset"].tolist() == [0, 4]
+    assert record["data"].tolist() == list(range(16))
+    assert convertor.offmap.get_dtype("sensor_msgs/PointCloud2").itemsize == 176
+
+
+def test_columns_encode_struct_varrays_like_element_dicts(convertor):
+    np = pytest.importorskip("numpy")
+    count = 4
+    columns = {name: np.arange(count, dtype=np.float32) + offset
+               for offset, name in enumerate(["x", "y", "z", "roll", "pitch", "yaw"])}
+    columns["pwm_duty"] = np.arange(count * 4, dtype=np.float32).reshape(count, 4)
+    drones = [{name: float(columns[name][i]) for name in ["x", "y", "z", "roll", "pitch", "yaw"]}
+              for i in range(count)]
+    for i, drone in enumerate(drones):
+        drone["pwm_duty"] = columns["pwm_duty"][i].tolist()
+    header = {"sequence_id": 3, "valid_count": count}
+
+    binary = convertor.convert_columns_to_binary("Drone", "visual_state", header, {"drones": columns})
+
+    assert binary == convertor.convert_json_to_binary("Drone", "visual_state", dict(header, drones=drones))
+    decoded = convertor.convert_binary_to_columns("Drone", "visual_state", binary, "drones")
+    assert decoded["y"].tolist() == columns["y"].tolist()
+    assert decoded["pwm_duty"].shape == (count, 4) and (decoded["pwm_duty"] == columns["pwm_duty"]).all()
+    assert np.shares_memory(decoded["x"], np.frombuffer(binary, dtype=np.uint8))
+
+    # varrays of different lengths per element
+    duties = [np.full(i, i, dtype=np.float32) for i in range(count)]
+    binary = convertor.convert_columns_to_binary("Drone", "visual_state", header, {"drones": dict(columns, pwm_duty=duties)})
+    for i, drone in enumerate(drones):
+        drone["pwm_duty"] = duties[i].tolist()
+    assert binary == convertor.convert_json_to_binary("Drone", "visual_state", dict(header, drones=drones))
+    decoded = convertor.convert_binary_to_columns("Drone", "visual_state", binary, "drones")
+    assert [row.tolist() for row in decoded["pwm_duty"]] == [row.tolist() for row in duties]
+
+    with pytest.raises(ValueError):
+        convertor.convert_columns_to_binary("Drone", "visual_state", header, {"drones": {"x": [1.0], "w": [1.0]}})
+    with pytest.raises(ValueError):
+        convertor.convert_columns_to_binary("Drone", "visual_state", header, {"drones": {"x": [1.0], "y": [1.0, 2.0]}})
+
+
+def test_columns_encode_struct_varrays_of_elements(convertor):
+    np = pytest.importorskip("numpy")
+    translation_x = np.arange(6, dtype=np.float64).reshape(3, 2)
+    columns = {
+        "transforms.translation.x": translation_x,
+        "transforms.rotation.w": np.ones((3, 2)),
+        "time_from_start.sec": [1, 2, 3],
+    }
+    header = {"header": {"stamp": {"sec": 1, "nanosec": 0}, "frame_id": "map"}, "joint_names": ["base", "arm"]}
+    points = [{
+        "transforms": [{"translation": {"x": translation_x[i, j], "y": 0.0, "z": 0.0},
+                        "rotation": {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0}} for j in range(2)],
+        "velocities": [],
+        "accelerations": [],
+        "time_from_start": {"sec": i + 1, "nanosec": 0},
+    } for i in range(3)]
+
+    binary = convertor.convert_columns_to_binary("Drone", "trajectory", header, {"points": columns})
+
+    assert binary == convertor.convert_json_to_binary("Drone", "trajectory", dict(header, points=points))
+    decoded = convertor.convert_binary_to_columns("Drone", "trajectory", binary, "points")
+    assert (decoded["transforms.translation.x"] == translation_x).all()
+    assert decoded["velocities.linear.x"].shape == (3, 0)
+    assert decoded["time_from_start.sec"].tolist() == [1, 2, 3]
+
+
+def test_get_field_reads_single_members_and_varray_elements(convertor):
+    cloud = sample_point_cloud()
+    binary = convertor.convert_json_to_binary("Drone", "points", cloud)
+
+    assert convertor.get_field("Drone", "points", binary, "header.stamp.nanosec") == 20
+    assert convertor.get_field("Drone", "points", binary, "header.frame_id") == "map"
+    assert convertor.get_field("Drone", "points", binary, "fields[1].name") == "y"
+    assert convertor.get_field("Drone", "points", binary, "data[5]") == 5
+    assert convertor.get_field("Drone", "points", binary, "header") == \
+        convertor.convert_binary_to_json("Drone", "points", binary)["header"]
+    assert convertor.offmap.get_accessor("sensor_msgs/PointCloud2", "fields[1].name") is \
+        convertor.offmap.get_accessor("sensor_msgs/PointCloud2", "fields[1].name")
+
+    with pytest.raises(IndexError):
+        convertor.get_field("Drone", "points", binary, "fields[2].name")
+    with pytest.raises(ValueError):
+        convertor.get_field("Drone", "points", binary, "header.seq")
+
+
+def test_get_proxy_decodes_members_on_access(convertor):
+    imu = convertor.create_empty_pdu_json("Drone", "imu")
+    imu["header"]["stamp"]["sec"] = 7
+    imu["linear_acceleration"]["z"] = 9.8
+    binary = convertor.convert_json_to_binary("Drone", "imu", imu)
+    cloud = convertor.get_proxy("Drone", "points", convertor.convert_json_to_binary("Drone", "points", sample_point_cloud()))
+
+    proxy = convertor.get_proxy("Drone", "imu", binary)
+
+    assert proxy.header.stamp.sec == 7
+    assert proxy.linear_acceleration.z == 9.8
+    assert proxy.get("orientation_covariance[8]") == 0.0
+    assert [field.name for field in cloud.fields] == ["x", "y"]
+    assert cloud.fields[1].to_json()["offset"] == 4
+
+
+def test_iter_varray_yields_heap_chunks_without_copying(convertor):
+    cloud = sample_point_cloud()
+    cloud["data"] = list(range(250))
+    binary = convertor.convert_json_to_binary("Drone", "points", cloud)
+
+    chunks = list(convertor.iter_varray("Drone", "points", binary, "data", chunk_bytes=64))
+
+    assert [len(chunk) for chunk in chunks] == [64, 64, 64, 58]
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert b"".join(chunks) == bytes(range(250))
+    chunks[0][0] = 99
+    assert convertor.get_field("Drone", "points", binary, "data[0]") == 99
+    assert all(chunk.readonly for chunk in convertor.iter_varray("Drone", "points", bytes(binary), "data"))
+
+    imu = convertor.convert_json_to_binary("Drone", "imu", convertor.create_empty_pdu_json("Drone", "imu"))
+    # 9 float64 values, chunk size rounded down to whole elements
+    assert [len(chunk) for chunk in convertor.iter_varray("Drone", "imu", imu, "orientation_covariance", chunk_bytes=20)] == [16] * 4 + [8]
+
+    with pytest.raises(ValueError):
+        convertor.iter_varray("Drone", "points", binary, "height")
+    with pytest.raises(ValueError):
+        convertor.iter_varray("Drone", "points", binary, "data", chunk_bytes=0)
+
+
+def test_cdr_transcoding_matches_generated_converters(convertor):
+    from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_cdr_conv_Collision import py_to_cdr_Collision
+    from hakoniwa_pdu.pdu_msgs.hako_msgs.pdu_conv_Collision import pdu_to_py_Collision
+    from hakoniwa_pdu.pdu_msgs.sensor_msgs.pdu_cdr_conv_PointCloud2 import py_to_cdr_PointCloud2
+    from hakoniwa_pdu.pdu_msgs.sensor_msgs.pdu_conv_PointCloud2 import pdu_to_py_PointCloud2
+
+    collision = convertor.create_empty_pdu_json("Drone", "collision")
+    collision["collision"] = True
+    collision["contact_num"] = 2
+    collision["contact_position"][1]["z"] = -1.5
+    for pdu_name, json_data, pdu_to_py, py_to_cdr in [
+        ("points", sample_point_cloud(), pdu_to_py_PointCloud2, py_to_cdr_PointCloud2),
+        ("collision", collision, pdu_to_py_Collision, py_to_cdr_Collision),
+    ]:
+        binary = convertor.convert_json_to_binary("Drone", pdu_name, json_data)
+
+        cdr = convertor.convert_binary_to_cdr("Drone", pdu_name, binary)
+
+        assert cdr == py_to_cdr(pdu_to_py(binary))
+        assert convertor.convert_cdr_to_binary("Drone", pdu_name, cdr) == binary
+        # a reused, dirty buffer is fully rewritten
+        out = bytearray(b"\xff" * (len(binary) + 8))
+        assert convertor.convert_cdr_to_binary("Drone", pdu_name, cdr, out) == len(binary)
+        assert out[:len(binary)] == binary
+
+    binary = convertor.convert_json_to_binary("Drone", "points", sample_point_cloud())
+    with pytest.raises(ValueError):
+        # the heap does not fit
+        convertor.convert_cdr_to_binary("Drone", "points", convertor.convert_binary_to_cdr("Drone", "points", binary),
+                                        bytearray(len(binary) - 1))
+
+
+def test_create_empty_pdu_json_hands_out_independent_copies(convertor):
+    first = convertor.create_empty_pdu_json("Drone", "imu")
+    first["header"]["frame_id"] = "base_link"
+    first["orientation_covariance__raw"][0] = 1
+
+    second = convertor.create_empty_pdu_json("Drone", "imu")
+
+    assert second["header"]["frame_id"] == ""
+    assert second["orientation_covariance__raw"] == bytearray(72)
+    assert second["orientation_covariance"] == (0.0,) * 9
+    assert second == binary_reader.binary_read(convertor.offmap, "sensor_msgs/Imu", bytearray(456))
+
+
+def test_columns_of_a_middle_varray_go_after_the_other_heap_data(convertor):
+    np = pytest.importorskip("numpy")
+    cloud = sample_point_cloud()
+    columns = {"name": np.array(["x", "y"]), "offset": [0, 4], "datatype": [7, 7], "count": [1, 1]}
+
+    binary = convertor.convert_columns_to_binary("Drone", "points", dict(cloud, fields=[]), {"fields": columns})
+
+    # fields comes before data in the type, but the batch is written after data
+    assert binary != convertor.convert_json_to_binary("Drone", "points", cloud)
+    decoded = convertor.convert_binary_to_json("Drone", "points", binary)
+    assert decoded["fields"] == cloud["fields"]
+    assert decoded["data"] == tuple(cloud["data"])
+
+
+def test_delta_encoder_repacks_changed_fields_only(convertor):
+    encoder = convertor.create_delta_encoder("Drone", "imu")
+    imu = convertor.create_empty_pdu_json("Drone", "imu")
+
+    binary, ranges = encoder.encode(imu)
+    assert ranges == [(0, len(binary))]
+
+    imu["header"]["stamp"]["sec"] = 3
+    imu["linear_acceleration"]["z"] = 9.8
+    binary, ranges = encoder.encode(imu)
+
+    assert ranges == [(24, 4), (376, 8)]
+    assert binary == convertor.convert_json_to_binary("Drone", "imu", imu)
+    assert encoder.encode(imu)[1] == []
+
+
+def test_delta_encoder_tracks_heap_and_varray_length(convertor):
+    encoder = convertor.create_delta_encoder("Drone", "points")
+    cloud = sample_point_cloud()
+    first, _ = encoder.encode(cloud)
+    heap_off = binary_io.PduMetaDataParser().load_pdu_meta(first).heap_off
+
+    cloud["data"] = list(range(1, 17))
+    binary, ranges = encoder.encode(cloud)
+    assert binary is first
+    # only the data varray is rewritten, not the fields block before it
+    assert heap_off < len(binary) - 16
+    assert ranges == [(len(binary) - 16, 16)]
+    assert binary == convertor.convert_json_to_binary("Drone", "points", cloud)
+
+    cloud["data"] = list(range(20))
+    binary, ranges = encoder.encode(cloud)
+    assert ranges == [(0, len(binary))]
+    assert binary == convertor.convert_json_to_binary("Drone", "points", cloud)
+
+
+def test_delta_encoder_compares_nested_varrays_per_chunk(convertor):
+    encoder = convertor.create_delta_encoder("Drone", "trajectory")
+    twist = {"linear": {"x": 1.0, "y": 2.0, "z": 3.0}, "angular": {"x": 0.0, "y": 0.0, "z": 0.0}}
+    trajectory = {
+        "header": {"stamp": {"sec": 1, "nanosec": 0}, "frame_id": "map"},
+        "joint_names": ["base"],
+        "points": [{"transforms": [], "velocities": [dict(twist)], "accelerations": [],
+                    "time_from_start": {"sec": i, "nanosec": 0}} for i in range(3)],
+    }
+    binary, _ = encoder.encode(trajectory)
+    unchanged = bytes(binary)
+
+    trajectory["points"][1]["velocities"] = [dict(twist, linear={"x": 1.0, "y": 7.0, "z": 3.0})]
+    binary, ranges = encoder.encode(trajectory)
+
+    # the velocities of point 1 are a heap chunk of their own (one Twist)
+    differ = [off for off in range(len(binary)) if binary[off] != unchanged[off]]
+    assert len(ranges) == 1 and ranges[0][1] == 48
+    assert ranges[0][0] <= differ[0] and differ[-1] < ranges[0][0] + 48
+    assert binary == convertor.convert_json_to_binary("Drone", "trajectory", trajectory)
+    assert encoder.encode(trajectory)[1] == []
+
+
+def test_offset_map_indexes_directory_and_reports_missing_types():
+    offmap = offset_map.create_offmap(OFFSET_PATH)
+
+    assert offmap.find_offset_file("geometry_msgs/Twist").endswith(os.path.join("geometry_msgs", "Twist.offset"))
+    assert offmap.find_offset_file("Twist") == offmap.find_offset_file("geometry_msgs/Twist")
+    with pytest.raises(FileNotFoundError):
+        offmap.get_layout("geometry_msgs/Unknown")
+
+
+def test_offset_map_persistent_cache_is_invalidated_by_changes(tmp_path):
+    offset_dir = tmp_path / "offset"
+    shutil.copytree(os.path.join(OFFSET_PATH, "geometry_msgs"), offset_dir / "geometry_msgs")
+    cache_path = str(tmp_path / "offset.cache")
+
+    offmap = offset_map.create_offmap(str(offset_dir), cache_path)
+    assert offmap.get_pdu_size("geometry_msgs/Vector3") == 32
+    assert os.path.exists(cache_path)
+
+    cached = offset_map.create_offmap(str(offset_dir), cache_path)
+    cached.load_index()
+    assert cached.cached_lines[cached.find_offset_file("Vector3")][0].startswith("single:primitive:x")
+
+    vector3 = offset_dir / "geometry_msgs" / "Vector3.offset"
+    vector3.write_text("single:primitive:x:float64:0:8\n")
+    os.utime(vector3, ns=(0, 0))
+    assert offset_map.create_offmap(str(offset_dir), cache_path).get_pdu_size("geometry_msgs/Vector3") == 16
+
+
+def test_convert_many_roundtrip_and_packed_buffer(convertor):
+    twist = {"linear": {"x": 1.0, "y": 2.0, "z": 3.0}, "angular": {"x": -1.0, "y": -2.0, "z": -3.0}}
+    items = [("Drone", "cmd_vel", twist), ("Drone", "points", sample_point_cloud()), ("Drone", "cmd_vel", twist)]
+
+    binaries = convertor.convert_many_to_binary(items)
+    buffer, offsets = convertor.convert_many_to_binary(items, pack=True)
+
+    assert binaries == [convertor.convert_json_to_binary(robot, pdu, data) for robot, pdu, data in items]
+    assert [size for _, size in offsets] == [len(binary) for binary in binaries]
+    assert all(off % 8 == 0 for off, _ in offsets)
+    assert [buffer[off:off + size] for off, size in offsets] == binaries
+
+    decoded = convertor.convert_many_to_json([(robot, pdu, binary) for (robot, pdu, _), binary in zip(items, binaries)])
+    assert decoded == [convertor.convert_binary_to_json(robot, pdu, binary)
+                       for (robot, pdu, _), binary in zip(items, binaries)]
+
+    with pytest.raises(ValueError):
+        convertor.convert_many_to_binary([("Drone", "unknown", twist)])
+
+
+def test_convert_binary_to_json_bytes_matches_dict_conversion(convertor):
+    imu = convertor.create_empty_pdu_json("Drone", "imu")
+    imu["header"]["frame_id"] = "imu_link"
+    imu["orientation"]["w"] = float("nan")
+    imu["linear_acceleration_covariance"] = [float(i) for i in range(9)]
+    imu_binary = convertor.convert_json_to_binary("Drone", "imu", imu)
+    cloud_binary = convertor.convert_json_to_binary("Drone", "points", sample_point_cloud())
+
+    text = convertor.convert_binary_to_json_bytes("Drone", "imu", imu_binary)
+    decoded = json.loads(text)
+
+    assert b" " not in text and b'"w":NaN' in text
+    assert decoded["header"]["frame_id"] == "imu_link"
+    assert decoded["linear_acceleration_covariance"] == imu["linear_acceleration_covariance"]
+    assert "linear_acceleration_covariance__raw" not in decoded
+    expected = convertor.convert_binary_to_json("Drone", "points", cloud_binary)
+    cloud = json.loads(convertor.convert_binary_to_json_bytes("Drone", "points", cloud_binary))
+    assert cloud == json.loads(json.dumps({k: v for k, v in expected.items() if not k.endswith("__raw")}))
+
+
+def test_convert_binary_to_json_bytes_options(convertor):
+    binary = convertor.convert_json_to_binary("Drone", "points", sample_point_cloud())
+    out = bytearray(b"[")
+
+    written = convertor.convert_binary_to_json_bytes(
+        "Drone", "points", binary, include_raw=True, array_encoding="base64", max_array_len=1, out=out)
+    decoded = json.loads(bytes(out[1:]))
+
+    assert written == len(out) - 1
+    assert decoded["data"] == base64.b64encode(bytes([0])).decode("ascii")
+    assert decoded["data__raw"] == base64.b64encode(bytes(range(16))).decode("ascii")
+    assert [field["name"] for field in decoded["fields"]] == ["x"]
+    with pytest.raises(ValueError):
+        convertor.convert_binary_to_json_bytes("Drone", "points", binary, array_encoding="hex")
@@ -0,0 +1,173 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from hakoniwa_pdu.pdu_msgs.geometry_msgs.pdu_conv_Twist import pdu_to_py_Twist, py_to_pdu_Twist
+from hakoniwa_pdu.pdu_msgs.geometry_msgs.pdu_pytype_Twist import Twist
+from hakoniwa_pdu.pdu_msgs.pdu_cdr_runtime import CdrReader, CdrRun, CdrWriter
+from hakoniwa_pdu.pdu_msgs.sensor_msgs.pdu_cdr_conv_PointCloud2 import cdr_to_py_PointCloud2, py_to_cdr_PointCloud2
+from hakoniwa_pdu.pdu_msgs.sensor_msgs.pdu_conv_PointCloud2 import pdu_to_py_PointCloud2, py_to_pdu_PointCloud2
+from hakoniwa_pdu.pdu_msgs.sensor_msgs.pdu_pytype_PointCloud2 import PointCloud2
+from hakoniwa_pdu.pdu_msgs.sensor_msgs.pdu_pytype_PointField import PointField
+from hakoniwa_pdu.pdu_msgs.std_msgs.pdu_conv_UInt8MultiArray import (
+    pdu_to_py_UInt8MultiArray,
+    py_to_pdu_UInt8MultiArray,
+)
+from hakoniwa_pdu.pdu_msgs.std_msgs.pdu_pytype_UInt8MultiArray import UInt8MultiArray
+
+
+def make_twist():
+    twist = Twist()
+    twist.linear.x = 1.5
+    twist.angular.z = -0.25
+    return twist
+
+
+def test_py_to_pdu_writes_into_supplied_buffer():
+    twist = make_twist()
+    expected = py_to_pdu_Twist(twist)
+    out = bytearray(b"\xff" * 128)
+
+    written = py_to_pdu_Twist(twist, out=out)
+
+    assert written == len(expected)
+    assert out[:written] == expected
+    assert out[written:] == b"\xff" * (128 - written)
+    assert pdu_to_py_Twist(out).to_dict() == twist.to_dict()
+
+
+def test_py_to_pdu_writes_varray_into_memoryview():
+    value = UInt8MultiArray()
+    value.data = bytearray(range(10))
+    expected = py_to_pdu_UInt8MultiArray(value)
+    segment = bytearray(len(expected))
+
+    assert py_to_pdu_UInt8MultiArray(value, out=memoryview(segment)) == len(expected)
+    assert segment == expected
+    assert list(pdu_to_py_UInt8MultiArray(segment).data) == list(range(10))
+
+    with pytest.raises(ValueError):
+        py_to_pdu_UInt8MultiArray(value, out=bytearray(len(expected) - 1))
+
+
+def test_pdu_to_py_decodes_into_existing_object_graph():
+    cloud = PointCloud2()
+    cloud.header.frame_id = "lidar"
+    cloud.fields = [PointField(), PointField()]
+    cloud.fields[0].name = "x"
+    cloud.fields[1].name = "y"
+    cloud.data = [1, 2, 3]
+    target = PointCloud2()
+    target.fields = [PointField(), PointField(), PointField()]
+    header, first_field = target.header, target.fields[0]
+
+    decoded = pdu_to_py_PointCloud2(py_to_pdu_PointCloud2(cloud), out=target)
+
+    assert decoded is target
+    assert target.header is header
+    assert target.fields[0] is first_field
+    assert [field.name for field in target.fields] == ["x", "y"]
+    assert target.to_dict() == pdu_to_py_PointCloud2(py_to_pdu_PointCloud2(cloud)).to_dict()
+
+
+def test_pdu_to_py_numpy_array_mode_returns_views():
+    np = pytest.importorskip("numpy")
+    value = UInt8MultiArray()
+    value.data = np.arange(10, dtype=np.uint8)
+    binary = py_to_pdu_UInt8MultiArray(value)
+
+    decoded = pdu_to_py_UInt8MultiArray(binary, array_mode="numpy")
+
+    assert isinstance(decoded.data, np.ndarray)
+    assert np.shares_memory(decoded.data, np.frombuffer(binary, dtype=np.uint8))
+    assert decoded.data.tolist() == list(range(10))
+    assert isinstance(pdu_to_py_UInt8MultiArray(binary).data, tuple)
+
+
+def test_pytypes_are_slotted():
+    twist = pdu_to_py_Twist(py_to_pdu_Twist(make_twist()))
+
+    assert not hasattr(twist, "__dict__")
+    assert not hasattr(twist.linear, "__dict__")
+    assert Twist.from_dict(twist.to_dict()).to_dict() == twist.to_dict()
+    with pytest.raises(AttributeError):
+        twist.linear.w = 1.0
+
+
+def test_pytype_dict_conversion_keeps_defaults_and_copies_lists():
+    cloud = PointCloud2.from_dict({"width": 3, "fields": [{"name": "x", "offset": 0, "datatype": 7, "count": 1}]})
+    other = PointCloud2.from_dict({})
+
+    assert cloud.width == 3 and cloud.height == 0
+    assert cloud.header.frame_id == "" and cloud.data == []
+    assert isinstance(cloud.fields[0], PointField) and cloud.fields[0].name == "x"
+    assert other.data is not cloud.data
+
+    cloud.data = bytearray(b"\x01\x02")
+    assert cloud.to_dict()["data"] == [1, 2]
+    cloud.data = (1, 2)
+    assert cloud.to_dict()["data"] == (1, 2)
+
+
+def test_struct_runs_normalize_bool_members():
+    cloud = PointCloud2()
+    cloud.is_bigendian = 5
+    cloud.point_step = 4
+    cloud.row_step = 8
+
+    decoded = pdu_to_py_PointCloud2(py_to_pdu_PointCloud2(cloud))
+
+    assert decoded.is_bigendian is True
+    assert decoded.is_dense is False
+    assert (decoded.point_step, decoded.row_step) == (4, 8)
+
+
+def test_cdr_primitive_sequences_are_packed_in_bulk():
+    cloud = PointCloud2()
+    cloud.data = bytes(range(5))
+    payload = py_to_cdr_PointCloud2(cloud)
+
+    cloud.data = list(range(5))
+    assert py_to_cdr_PointCloud2(cloud) == payload
+    assert cdr_to_py_PointCloud2(bytearray(payload)).data == list(range(5))
+
+    writer = CdrWriter()
+    writer.write_encapsulation()
+    writer.write_uint8(1)
+    writer.write_sequence("d", [])          # empty: no alignment padding
+    writer.write_sequence("f", [1.5], 2)    # fixed-size: zero-padded
+    reader = CdrReader(writer.bytes())
+    reader.read_encapsulation()
+
+    assert len(writer.bytes()) == 4 + 4 + 8
+    assert reader.read_uint8() == 1
+    assert reader.read_sequence("d", 0) == []
+    assert reader.read_sequence("f", 2, view=True).tolist() == [1.5, 0.0]
+
+
+@pytest.mark.parametrize("phase", range(8))
+def test_cdr_runs_match_field_by_field_alignment(phase):
+    run = CdrRun("?Idh")
+    values = (True, 7, 2.5, -3)
+    expected = CdrWriter()
+    expected.write_encapsulation()
+    writer = CdrWriter(8)
+    writer.write_encapsulation()
+    for target in (expected, writer):
+        for _ in range(phase):
+            target.write_uint8(0xAA)
+    expected.write_bool(values[0])
+    expected.write_uint32(values[1])
+    expected.write_float64(values[2])
+    expected.write_int16(values[3])
+
+    writer.write_run(run, values)
+    reader = CdrReader(writer.bytes())
+    reader.read_encapsulation()
+    reader.read_sequence("B", phase)
+
+    assert writer.bytes() == expected.bytes()
+    assert reader.read_run(run) == values
@@ -0,0 +1,87 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_PATH)
+
+from hakoniwa_pdu.pdu_msgs import pdu_registry
+
+# entry points of the CLI tools and servers; they must not pay for modules they do not use
+STARTUP_MODULES = [
+    "hakoniwa_pdu.pdu_manager",
+    "hakoniwa_pdu.apps.drone.hakosim",
+    "hakoniwa_pdu.rpc.auto_wire",
+    "hakoniwa_pdu.apps.bulkconv.hako_pdu_bulkconv",
+]
+
+IMPORT_PROBE = """
+import json, sys
+import {module}
+print(json.dumps({{
+    "numpy": "numpy" in sys.modules,
+    "converters": sorted(name for name in sys.modules
+                         if ".pdu_conv_" in name or ".pdu_cdr_conv_" in name),
+}}))
+"""
+
+
+@pytest.mark.parametrize("module", STARTUP_MODULES)
+def test_startup_imports_no_generated_converters_or_numpy(module):
+    result = subprocess.run([sys.executable, "-c", IMPORT_PROBE.format(module=module)],
+                            capture_output=True, text=True, check=True, cwd=SRC_PATH)
+    probe = json.loads(result.stdout)
+
+    assert probe["numpy"] is False
+    assert probe["converters"] == []
+
+
+def test_registry_resolves_converters_lazily():
+    result = subprocess.run([sys.executable, "-c", """
+import sys
+from hakoniwa_pdu.pdu_msgs import pdu_registry
+entry = pdu_registry.get_type("geometry_msgs/Twist")
+before = [name for name in sys.modules if name.endswith("_Twist")]
+raw = entry.py_to_pdu(entry.pytype())
+after = sorted(name.rpartition(".")[2] for name in sys.modules if name.endswith("_Twist"))
+print(before, after)
+"""], capture_output=True, text=True, check=True, cwd=SRC_PATH)
+
+    assert result.stdout.split() == ["[]", "['pdu_conv_Twist',", "'pdu_pytype_Twist']"]
+
+
+def test_registry_entries_are_cached_and_resolve_all_converters():
+    entry = pdu_registry.get_type("geometry_msgs/Twist")
+    twist = entry.pytype()
+    twist.linear.x = 1.5
+
+    assert pdu_registry.get_type("geometry_msgs/Twist") is entry
+    assert pdu_registry.get_type("hakoniwa_pdu.pdu_msgs.geometry_msgs/Twist").pytype is entry.pytype
+    assert entry.pdu_to_py(entry.py_to_pdu(twist)).linear.x == 1.5
+    assert entry.cdr_to_py(entry.py_to_cdr(twist)).linear.x == 1.5
+    assert "geometry_msgs/Twist" in pdu_registry.known_types()
+    assert len(pdu_registry.known_types()) > 200
+
+
+@pytest.mark.parametrize("type_name", ["Twist", "geometry_msgs/NoSuchType", "no_such_msgs/Twist"])
+def test_registry_rejects_unknown_types(type_name):
+    with pytest.raises(ValueError):
+        pdu_registry.get_type(type_name)
+
+
+def test_hakosim_keeps_message_names_as_lazy_attributes():
+    from hakoniwa_pdu.apps.drone import hakosim
+    from hakoniwa_pdu.apps.drone.hakosim import Twist, pdu_to_py_Twist, HakoDroneCmdTakeoff, py_to_pdu_PointCloud2
+    from hakoniwa_pdu.pdu_msgs.geometry_msgs.pdu_conv_Twist import pdu_to_py_Twist as generated_pdu_to_py_Twist
+    from hakoniwa_pdu.pdu_msgs.geometry_msgs.pdu_pytype_Twist import Twist as GeneratedTwist
+
+    assert Twist is GeneratedTwist
+    assert pdu_to_py_Twist is generated_pdu_to_py_Twist
+    assert HakoDroneCmdTakeoff is pdu_registry.get_type("hako_msgs/HakoDroneCmdTakeoff").pytype
+    assert py_to_pdu_PointCloud2 is pdu_registry.get_type("sensor_msgs/PointCloud2").py_to_pdu
+    assert "pdu_to_py_HakoCmdMagnetHolder" in dir(hakosim)
+    with pytest.raises(AttributeError):
+        hakosim.NoSuchMessage